@@ -16,11 +16,27 @@ namespace ConsoleSample;
 /// </summary>
 class Program
 {
+    /// <summary>
+    /// Runs a single non-interactive request and exits; used by the startup benchmark
+    /// </summary>
+    private const string FirstRequestArgument = "--first-request";
+
+    /// <summary>
+    /// Access token used by <see cref="FirstRequestArgument"/> in place of the OAuth flow
+    /// </summary>
+    private const string AccessTokenVariable = "PROCORE_ACCESS_TOKEN";
+
     private static ILogger<Program>? _logger;
     private static IServiceProvider? _serviceProvider;
 
     static async Task Main(string[] args)
     {
+        if (args.Contains(FirstRequestArgument))
+        {
+            Environment.ExitCode = await RunFirstRequestAsync();
+            return;
+        }
+
         Console.WriteLine("🏗️  Procore SDK Console Sample Application");
         Console.WriteLine("=========================================");
         Console.WriteLine();
@@ -79,6 +95,29 @@ class Program
             .Build();
     }
 
+    /// <summary>
+    /// Lists companies once with a token from the environment and reports the time since process start
+    /// </summary>
+    private static async Task<int> RunFirstRequestAsync()
+    {
+        var accessToken = Environment.GetEnvironmentVariable(AccessTokenVariable);
+        if (string.IsNullOrEmpty(accessToken))
+        {
+            Console.Error.WriteLine($"{AccessTokenVariable} must be set when running with {FirstRequestArgument}");
+            return 2;
+        }
+
+        using var host = CreateHost();
+        var tokenManager = host.Services.GetRequiredService<ITokenManager>();
+        await tokenManager.StoreTokenAsync(new AccessToken(accessToken, "Bearer", DateTimeOffset.UtcNow.AddHours(1)));
+
+        var companies = await host.Services.GetRequiredService<ICoreClient>().GetCompaniesAsync();
+        var elapsed = DateTime.Now - Process.GetCurrentProcess().StartTime;
+
+        Console.WriteLine($"time-to-first-request: {elapsed.TotalMilliseconds:F0} ms ({companies.Count()} companies)");
+        return 0;
+    }
+
     private static async Task RunApplicationAsync()
     {
         var oauthHelper = _serviceProvider!.GetRequiredService<OAuthFlowHelper>();
@@ -260,10 +260,11 @@ public class ProjectsController : Controller
                 return View(model);
             }
 
+            // Blank fields leave the project unchanged rather than wiping it
             var request = new UpdateProjectRequest
             {
-                Name = model.Name,
-                Description = model.Description
+                Name = string.IsNullOrWhiteSpace(model.Name) ? null : model.Name,
+                Description = string.IsNullOrWhiteSpace(model.Description) ? null : model.Description
             };
 
             var updatedProject = await _projectService.UpdateProjectAsync(model.Id, request);
@@ -52,8 +52,8 @@ public class Program
         // Use session-based token storage for web app
         services.AddScoped<ITokenStorage, SessionTokenStorage>();
 
-        // Add Core client for API operations
-        services.AddScoped<ProcoreCoreClient>();
+        // Add Core client for API operations; it is thread-safe, so one instance serves every request
+        services.AddSingleton<ProcoreCoreClient>();
 
         // Add application services
         services.AddScoped<AuthenticationService>();
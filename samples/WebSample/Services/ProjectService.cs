@@ -267,8 +267,8 @@ public class ProjectService
             var updatedProject = new ProjectDetail
             {
                 Id = projectId,
-                Name = request.Name ?? $"Updated Project {projectId}",
-                Description = request.Description ?? "Updated description",
+                Name = string.IsNullOrWhiteSpace(request.Name) ? $"Updated Project {projectId}" : request.Name,
+                Description = string.IsNullOrWhiteSpace(request.Description) ? "Updated description" : request.Description,
                 Status = "Active",
                 CreatedAt = DateTimeOffset.UtcNow.AddDays(-30),
                 UpdatedAt = DateTimeOffset.UtcNow,
@@ -0,0 +1,285 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Runtime.InteropServices;
+using System.Threading;
+using System.Threading.Tasks;
+using Procore.SDK.ConstructionFinancials.Models;
+
+namespace Procore.SDK.ConstructionFinancials.Analytics;
+
+/// <summary>
+/// Aggregates cost codes and invoices into project totals and per-category rollups in a single pass,
+/// and keeps them current as individual records are added, changed or removed.
+/// </summary>
+/// <remarks>
+/// Each record contributes one <see cref="CostTotals"/> value to the project totals and to its
+/// category. Updating a record subtracts its previous contribution and adds the new one, so a change
+/// costs a couple of dictionary lookups regardless of how many records have been aggregated.
+/// Cost codes are categorized by <c>categorySelector</c>, which defaults to <see cref="GetDivision"/>.
+/// Invoices carry no cost code, so they are categorized only when a category is supplied and otherwise
+/// count towards <see cref="UncategorizedCategory"/>. The aggregator is thread-safe.
+/// </remarks>
+public sealed class CostAggregator
+{
+    /// <summary>
+    /// The category used for records that have no category.
+    /// </summary>
+    public const string UncategorizedCategory = "Uncategorized";
+
+    private static readonly char[] CodeSeparators = { '-', '.', ' ', '/' };
+
+    private readonly object _sync = new();
+    private readonly Func<CostCode, string> _categorySelector;
+    private readonly Dictionary<RecordKey, Contribution> _contributions = new();
+    private readonly Dictionary<string, CostTotals> _categories = new(StringComparer.OrdinalIgnoreCase);
+    private CostTotals _totals;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="CostAggregator"/> class.
+    /// </summary>
+    /// <param name="categorySelector">Maps a cost code to its rollup category. Defaults to <see cref="GetDivision"/>.</param>
+    public CostAggregator(Func<CostCode, string>? categorySelector = null)
+    {
+        _categorySelector = categorySelector ?? (costCode => GetDivision(costCode.Code));
+    }
+
+    /// <summary>
+    /// Gets the totals across every aggregated record.
+    /// </summary>
+    public CostTotals Totals
+    {
+        get
+        {
+            lock (_sync)
+            {
+                return _totals;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Gets the number of aggregated records.
+    /// </summary>
+    public int Count
+    {
+        get
+        {
+            lock (_sync)
+            {
+                return _contributions.Count;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Gets the totals for a category, or empty totals when no record belongs to it.
+    /// </summary>
+    /// <param name="category">The category name, compared case-insensitively.</param>
+    /// <returns>The category totals.</returns>
+    public CostTotals GetCategory(string category)
+    {
+        ArgumentNullException.ThrowIfNull(category);
+
+        lock (_sync)
+        {
+            return _categories.TryGetValue(category, out var totals) ? totals : default;
+        }
+    }
+
+    /// <summary>
+    /// Gets a snapshot of the totals for every category, ordered by category name.
+    /// </summary>
+    /// <returns>The category totals keyed by category name.</returns>
+    public IReadOnlyList<KeyValuePair<string, CostTotals>> GetCategories()
+    {
+        lock (_sync)
+        {
+            return _categories
+                .OrderBy(category => category.Key, StringComparer.OrdinalIgnoreCase)
+                .ToList();
+        }
+    }
+
+    /// <summary>
+    /// Adds a cost code, or replaces its previous contribution if it has already been aggregated.
+    /// </summary>
+    /// <param name="costCode">The cost code, treated as a budget line item.</param>
+    public void AddOrUpdate(CostCode costCode)
+    {
+        ArgumentNullException.ThrowIfNull(costCode);
+
+        var category = NormalizeCategory(_categorySelector(costCode));
+        var totals = new CostTotals(costCode.BudgetAmount, costCode.CommittedAmount, costCode.ActualAmount, 0m, 0m, 1, 0);
+
+        lock (_sync)
+        {
+            Apply(new RecordKey(RecordKind.CostCode, costCode.Id), new Contribution(category, totals));
+        }
+    }
+
+    /// <summary>
+    /// Adds an invoice, or replaces its previous contribution if it has already been aggregated.
+    /// </summary>
+    /// <param name="invoice">The invoice.</param>
+    /// <param name="category">The category to roll the invoice into, if known.</param>
+    public void AddOrUpdate(Invoice invoice, string? category = null)
+    {
+        ArgumentNullException.ThrowIfNull(invoice);
+
+        var invoiced = invoice.Status is InvoiceStatus.Rejected or InvoiceStatus.Cancelled ? 0m : invoice.Amount;
+        var paid = invoice.Status == InvoiceStatus.Paid ? invoice.Amount : 0m;
+        var totals = new CostTotals(0m, 0m, 0m, invoiced, paid, 0, 1);
+
+        lock (_sync)
+        {
+            Apply(new RecordKey(RecordKind.Invoice, invoice.Id), new Contribution(NormalizeCategory(category), totals));
+        }
+    }
+
+    /// <summary>
+    /// Adds or updates a batch of cost codes.
+    /// </summary>
+    /// <param name="costCodes">The cost codes.</param>
+    public void AddRange(IEnumerable<CostCode> costCodes)
+    {
+        ArgumentNullException.ThrowIfNull(costCodes);
+
+        foreach (var costCode in costCodes)
+        {
+            AddOrUpdate(costCode);
+        }
+    }
+
+    /// <summary>
+    /// Adds or updates a batch of invoices.
+    /// </summary>
+    /// <param name="invoices">The invoices.</param>
+    public void AddRange(IEnumerable<Invoice> invoices)
+    {
+        ArgumentNullException.ThrowIfNull(invoices);
+
+        foreach (var invoice in invoices)
+        {
+            AddOrUpdate(invoice);
+        }
+    }
+
+    /// <summary>
+    /// Adds or updates cost codes as they arrive from a stream, without buffering them.
+    /// </summary>
+    /// <param name="costCodes">The stream of cost codes.</param>
+    /// <param name="cancellationToken">Cancellation token for the operation.</param>
+    /// <returns>A task that completes when the stream has been consumed.</returns>
+    public async Task AddRangeAsync(IAsyncEnumerable<CostCode> costCodes, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(costCodes);
+
+        await foreach (var costCode in costCodes.WithCancellation(cancellationToken).ConfigureAwait(false))
+        {
+            AddOrUpdate(costCode);
+        }
+    }
+
+    /// <summary>
+    /// Removes a cost code's contribution.
+    /// </summary>
+    /// <param name="costCodeId">The cost code ID.</param>
+    /// <returns>True if the cost code had been aggregated; otherwise false.</returns>
+    public bool RemoveCostCode(int costCodeId) => Remove(new RecordKey(RecordKind.CostCode, costCodeId));
+
+    /// <summary>
+    /// Removes an invoice's contribution.
+    /// </summary>
+    /// <param name="invoiceId">The invoice ID.</param>
+    /// <returns>True if the invoice had been aggregated; otherwise false.</returns>
+    public bool RemoveInvoice(int invoiceId) => Remove(new RecordKey(RecordKind.Invoice, invoiceId));
+
+    /// <summary>
+    /// Removes every record.
+    /// </summary>
+    public void Clear()
+    {
+        lock (_sync)
+        {
+            _contributions.Clear();
+            _categories.Clear();
+            _totals = default;
+        }
+    }
+
+    /// <summary>
+    /// Gets the division of a cost code: the leading segment of the code up to the first '-', '.', ' '
+    /// or '/', shortened to its first two digits when it is a longer CSI-style number such as "03300".
+    /// </summary>
+    /// <param name="code">The cost code value.</param>
+    /// <returns>The division, or <see cref="UncategorizedCategory"/> when the code is empty.</returns>
+    public static string GetDivision(string? code)
+    {
+        if (string.IsNullOrWhiteSpace(code))
+        {
+            return UncategorizedCategory;
+        }
+
+        var trimmed = code.Trim();
+        var separator = trimmed.IndexOfAny(CodeSeparators);
+        var segment = separator > 0 ? trimmed.Substring(0, separator) : trimmed;
+
+        return segment.Length > 2 && char.IsDigit(segment[0]) && char.IsDigit(segment[1])
+            ? segment.Substring(0, 2)
+            : segment;
+    }
+
+    private bool Remove(RecordKey key)
+    {
+        lock (_sync)
+        {
+            if (!_contributions.Remove(key, out var previous))
+            {
+                return false;
+            }
+
+            Accumulate(previous.Category, default - previous.Totals);
+            return true;
+        }
+    }
+
+    private void Apply(RecordKey key, Contribution contribution)
+    {
+        if (_contributions.TryGetValue(key, out var previous))
+        {
+            Accumulate(previous.Category, default - previous.Totals);
+        }
+
+        _contributions[key] = contribution;
+        Accumulate(contribution.Category, contribution.Totals);
+    }
+
+    private void Accumulate(string category, CostTotals delta)
+    {
+        _totals += delta;
+
+        ref var categoryTotals = ref CollectionsMarshal.GetValueRefOrAddDefault(_categories, category, out _);
+        categoryTotals += delta;
+
+        if (categoryTotals.IsEmpty)
+        {
+            _categories.Remove(category);
+        }
+    }
+
+    private static string NormalizeCategory(string? category)
+    {
+        return string.IsNullOrWhiteSpace(category) ? UncategorizedCategory : category;
+    }
+
+    private enum RecordKind
+    {
+        CostCode,
+        Invoice
+    }
+
+    private readonly record struct RecordKey(RecordKind Kind, int Id);
+
+    private readonly record struct Contribution(string Category, CostTotals Totals);
+}
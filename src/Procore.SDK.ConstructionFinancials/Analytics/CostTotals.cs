@@ -0,0 +1,72 @@
+using System;
+
+namespace Procore.SDK.ConstructionFinancials.Analytics;
+
+/// <summary>
+/// Budget, commitment, actual and invoice totals for a project or a cost category.
+/// </summary>
+/// <param name="Budget">The budgeted amount.</param>
+/// <param name="Committed">The amount committed to vendors and subcontractors.</param>
+/// <param name="Actual">The amount actually spent.</param>
+/// <param name="Invoiced">The amount on invoices that have not been rejected or cancelled.</param>
+/// <param name="Paid">The amount on paid invoices.</param>
+/// <param name="CostCodeCount">The number of cost codes contributing to the totals.</param>
+/// <param name="InvoiceCount">The number of invoices contributing to the totals.</param>
+public readonly record struct CostTotals(
+    decimal Budget,
+    decimal Committed,
+    decimal Actual,
+    decimal Invoiced,
+    decimal Paid,
+    int CostCodeCount,
+    int InvoiceCount)
+{
+    /// <summary>
+    /// Gets the budget remaining after actual costs; negative when the budget is overrun.
+    /// </summary>
+    public decimal BudgetVariance => Budget - Actual;
+
+    /// <summary>
+    /// Gets the budget variance as a percentage of the budget, or zero when there is no budget.
+    /// </summary>
+    public decimal BudgetVariancePercentage => Budget == 0m ? 0m : BudgetVariance / Budget * 100m;
+
+    /// <summary>
+    /// Gets the budget not yet committed; negative when commitments exceed the budget.
+    /// </summary>
+    public decimal UncommittedBudget => Budget - Committed;
+
+    /// <summary>
+    /// Gets the invoiced amount that has not been paid.
+    /// </summary>
+    public decimal OutstandingInvoiced => Invoiced - Paid;
+
+    /// <summary>
+    /// Gets a value indicating whether no record contributes to the totals.
+    /// </summary>
+    public bool IsEmpty => CostCodeCount == 0 && InvoiceCount == 0;
+
+    /// <summary>
+    /// Adds two sets of totals.
+    /// </summary>
+    public static CostTotals operator +(CostTotals left, CostTotals right) => new(
+        left.Budget + right.Budget,
+        left.Committed + right.Committed,
+        left.Actual + right.Actual,
+        left.Invoiced + right.Invoiced,
+        left.Paid + right.Paid,
+        left.CostCodeCount + right.CostCodeCount,
+        left.InvoiceCount + right.InvoiceCount);
+
+    /// <summary>
+    /// Subtracts one set of totals from another.
+    /// </summary>
+    public static CostTotals operator -(CostTotals left, CostTotals right) => new(
+        left.Budget - right.Budget,
+        left.Committed - right.Committed,
+        left.Actual - right.Actual,
+        left.Invoiced - right.Invoiced,
+        left.Paid - right.Paid,
+        left.CostCodeCount - right.CostCodeCount,
+        left.InvoiceCount - right.InvoiceCount);
+}
@@ -7,9 +7,12 @@ using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using Microsoft.Kiota.Abstractions;
+using Procore.SDK.Core.Composite;
 using Procore.SDK.Core.ErrorHandling;
 using Procore.SDK.Core.Logging;
+using Procore.SDK.Shared.Diagnostics;
 using Procore.SDK.Core.TypeMapping;
+using Procore.SDK.ConstructionFinancials.Analytics;
 using Procore.SDK.ConstructionFinancials.Models;
 using Procore.SDK.ConstructionFinancials.TypeMapping;
 using CoreModels = Procore.SDK.Core.Models;
@@ -23,6 +26,16 @@ namespace Procore.SDK.ConstructionFinancials;
 /// </summary>
 public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
 {
+    // Variance entries of the detailed cost analysis; every other entry is a cost category
+    private const string BudgetVariancePercentageKey = "Budget_Variance_Percentage";
+    private const string ScheduleImpactCostKey = "Schedule_Impact_Cost";
+
+    // Mappers are stateless and thread-safe, so every client instance shares one of each
+    private static readonly InvoiceTypeMapper SharedInvoiceTypeMapper = new();
+    private static readonly InvoiceConfigurationTypeMapper SharedInvoiceConfigurationTypeMapper = new();
+    private static readonly AsyncJobTypeMapper SharedAsyncJobTypeMapper = new();
+    private static readonly ComplianceDocumentTypeMapper SharedComplianceDocumentTypeMapper = new();
+
     private readonly Procore.SDK.ConstructionFinancials.ConstructionFinancialsClient _generatedClient;
     private readonly ILogger<ProcoreConstructionFinancialsClient>? _logger;
     private readonly StructuredLogger? _structuredLogger;
@@ -53,10 +66,10 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         _generatedClient = new Procore.SDK.ConstructionFinancials.ConstructionFinancialsClient(requestAdapter);
         _logger = logger;
         _structuredLogger = structuredLogger;
-        _invoiceMapper = invoiceMapper ?? new InvoiceTypeMapper();
-        _invoiceConfigMapper = new InvoiceConfigurationTypeMapper();
-        _asyncJobMapper = new AsyncJobTypeMapper();
-        _complianceDocMapper = new ComplianceDocumentTypeMapper();
+        _invoiceMapper = invoiceMapper ?? SharedInvoiceTypeMapper;
+        _invoiceConfigMapper = SharedInvoiceConfigurationTypeMapper;
+        _asyncJobMapper = SharedAsyncJobTypeMapper;
+        _complianceDocMapper = SharedComplianceDocumentTypeMapper;
     }
 
     #region Private Helper Methods
@@ -70,33 +83,46 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         string? correlationId = null,
         CancellationToken cancellationToken = default)
     {
-        correlationId ??= Guid.NewGuid().ToString();
+        // Correlation IDs are only created when something will be logged or an error is raised
+        if (correlationId == null && (_structuredLogger?.IsEnabled(LogLevel.Information) == true || _logger?.IsEnabled(LogLevel.Debug) == true))
+        {
+            correlationId = Guid.NewGuid().ToString();
+        }
         
-        using var operationScope = _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var operationScope = correlationId == null ? null : _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var activity = ProcoreTelemetry.StartOperation(operationName);
+        var startTimestamp = System.Diagnostics.Stopwatch.GetTimestamp();
         
         try
         {
-            _logger?.LogDebug("Executing operation {Operation} with correlation ID {CorrelationId}", operationName, correlationId);
+            _logger?.ExecutingOperation(operationName, correlationId!);
             
-            return await operation().ConfigureAwait(false);
+            var result = await operation().ConfigureAwait(false);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, null);
+            return result;
         }
         catch (HttpRequestException ex)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var mappedException = ErrorMapper.MapHttpException(ex, correlationId);
             
             _structuredLogger?.LogError(mappedException, operationName, correlationId, 
                 "HTTP error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, mappedException);
             throw mappedException;
         }
-        catch (TaskCanceledException) when (cancellationToken.IsCancellationRequested)
+        catch (TaskCanceledException ex) when (cancellationToken.IsCancellationRequested)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             _structuredLogger?.LogWarning(operationName, correlationId,
                 "Operation {Operation} was cancelled", operationName);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, ex);
             throw;
         }
         catch (Exception ex)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var wrappedException = new CoreModels.ProcoreCoreException(
                 $"Unexpected error in {operationName}: {ex.Message}", 
                 "UNEXPECTED_ERROR", 
@@ -106,6 +132,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             _structuredLogger?.LogError(wrappedException, operationName, correlationId,
                 "Unexpected error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, wrappedException);
             throw wrappedException;
         }
     }
@@ -143,14 +170,14 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting compliance documents for invoice {InvoiceId} in project {ProjectId} company {CompanyId} using enhanced V2.0 mapping", invoiceId, projectId, companyId);
+            _logger?.GettingComplianceDocumentsForInvoice(invoiceId, projectId, companyId);
             
             // Get the actual compliance documents
             var complianceDocuments = await GetComplianceDocumentsAsync(companyId, projectId, invoiceId, cancellationToken).ConfigureAwait(false);
             
             if (!complianceDocuments.Any())
             {
-                _logger?.LogWarning("No compliance documents returned for invoice {InvoiceId} in project {ProjectId} company {CompanyId}", invoiceId, projectId, companyId);
+                _logger?.NoComplianceDocumentsReturnedForInvoice(invoiceId, projectId, companyId);
                 return Enumerable.Empty<Invoice>();
             }
             
@@ -175,8 +202,10 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
                 invoices.Add(invoice);
             }
             
-            _logger?.LogInformation("Retrieved {DocumentCount} compliance documents for invoice {InvoiceId} with total {FileCount} files",
-                complianceDocuments.Count(), invoiceId, complianceDocuments.Sum(d => d.Files.Count));
+            if (_logger?.IsEnabled(LogLevel.Information) == true)
+            {
+                _logger.RetrievedInvoiceComplianceDocuments(complianceDocuments.Count(), invoiceId, complianceDocuments.Sum(d => d.Files.Count));
+            }
             
             return invoices;
         }, "GetInvoiceComplianceDocumentsAsync", null, cancellationToken).ConfigureAwait(false);
@@ -194,14 +223,14 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting invoices for project {ProjectId} in company {CompanyId} - providing placeholder data", projectId, companyId);
+            _logger?.GettingInvoicesForProject(projectId, companyId);
             
             // Note: This implementation provides placeholder data since direct invoice listing 
             // endpoints may require specific access levels or different API versions.
             // The compliance documents endpoint requires an invoice ID.
             // In a real implementation, you would first get invoice IDs 
             // from another endpoint or data source, then iterate through them
-            _logger?.LogWarning("GetInvoicesAsync currently returns empty - requires invoice IDs to query compliance documents");
+            _logger?.InvoiceListingUnavailable();
             
             return Enumerable.Empty<Invoice>();
         }, nameof(GetInvoicesAsync), null, cancellationToken).ConfigureAwait(false);
@@ -220,7 +249,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting invoice {InvoiceId} for project {ProjectId} in company {CompanyId}", invoiceId, projectId, companyId);
+            _logger?.GettingInvoice(invoiceId, projectId, companyId);
             
             // Get compliance documents for this invoice using V2.0 API
             var documentsResponse = await _generatedClient.Rest.V20.Companies[companyId.ToString()]
@@ -272,12 +301,12 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(() =>
         {
-            _logger?.LogDebug("Creating invoice for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.CreatingInvoiceForProject(projectId, companyId);
             
             // Note: The available endpoint creates compliance documents for existing invoices
             // This would typically require the invoice to already exist and you're adding documentation
             // For now, we'll return a placeholder indicating this limitation
-            _logger?.LogWarning("CreateInvoiceAsync currently limited - available endpoint creates compliance documents, not invoices");
+            _logger?.InvoiceCreationUnavailable();
             
             return Task.FromResult(new Invoice 
             { 
@@ -308,7 +337,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(() =>
         {
-            _logger?.LogDebug("Approving invoice {InvoiceId} for project {ProjectId} in company {CompanyId}", invoiceId, projectId, companyId);
+            _logger?.ApprovingInvoice(invoiceId, projectId, companyId);
             
             // Placeholder implementation
             return Task.FromResult(new Invoice 
@@ -339,7 +368,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(() =>
         {
-            _logger?.LogDebug("Rejecting invoice {InvoiceId} for project {ProjectId} in company {CompanyId} with reason: {Reason}", invoiceId, projectId, companyId, reason);
+            _logger?.RejectingInvoice(invoiceId, projectId, companyId, reason);
             
             // Placeholder implementation
             return Task.FromResult(new Invoice 
@@ -368,7 +397,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Creating compliance document for invoice {InvoiceId} in project {ProjectId} company {CompanyId} - Title: {Title}", invoiceId, projectId, companyId, documentTitle);
+            _logger?.CreatingComplianceDocumentForInvoice(invoiceId, projectId, companyId, documentTitle);
             
             // Use the new enhanced compliance document creation
             var request = new CreateComplianceDocumentRequest
@@ -396,8 +425,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
                 UpdatedAt = complianceDocument.UpdatedAt
             };
             
-            _logger?.LogInformation("Successfully created compliance document {DocumentId} for invoice {InvoiceId} - Title: {Title}, Files: {FileCount}",
-                complianceDocument.Id, invoiceId, complianceDocument.Title, complianceDocument.Files.Count);
+            _logger?.CreatedInvoiceComplianceDocument(complianceDocument.Id, invoiceId, complianceDocument.Title, complianceDocument.Files.Count);
             
             return invoice;
         }, nameof(CreateInvoiceComplianceDocumentAsync), null, cancellationToken).ConfigureAwait(false);
@@ -421,7 +449,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Processing payment for invoice {InvoiceId} in project {ProjectId} in company {CompanyId}", request.InvoiceId, projectId, companyId);
+            _logger?.ProcessingPaymentForInvoice(request.InvoiceId, projectId, companyId);
             
             // Placeholder implementation
             return new FinancialTransaction 
@@ -451,7 +479,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(() =>
         {
-            _logger?.LogDebug("Getting transactions for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingTransactionsForProject(projectId, companyId);
             
             // Placeholder implementation
             return Task.FromResult(Enumerable.Empty<FinancialTransaction>());
@@ -473,7 +501,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting cost codes for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingCostCodesForProject(projectId, companyId);
             
             // Placeholder implementation
             return Enumerable.Empty<CostCode>();
@@ -492,7 +520,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting cost code {CostCodeId} for project {ProjectId} in company {CompanyId}", costCodeId, projectId, companyId);
+            _logger?.GettingCostCode(costCodeId, projectId, companyId);
             
             // Placeholder implementation
             return new CostCode 
@@ -524,7 +552,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting total cost for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingTotalCostForProject(projectId, companyId);
             
             // Placeholder implementation
             return 500000.00m;
@@ -542,7 +570,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting cost summary for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingCostSummaryForProject(projectId, companyId);
             
             // Placeholder implementation
             return new Dictionary<string, decimal>
@@ -556,6 +584,32 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         }, nameof(GetCostSummaryAsync), null, cancellationToken).ConfigureAwait(false);
     }
 
+    /// <summary>
+    /// Aggregates a project's cost codes and invoices into typed totals and per-division rollups.
+    /// Cost codes and invoices are fetched concurrently and aggregated in a single pass.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="projectId">The project ID.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>An aggregator holding the project totals, which can be updated as records change.</returns>
+    public async Task<CostAggregator> GetCostAggregationAsync(int companyId, int projectId, CancellationToken cancellationToken = default)
+    {
+        _logger?.AggregatingCostsForProject(projectId, companyId);
+
+        using var query = new CompositeQuery(_logger, cancellationToken);
+        var costCodes = query.Add("cost codes", ct => GetCostCodesAsync(companyId, projectId, ct));
+        var invoices = query.Add("invoices", ct => GetInvoicesAsync(companyId, projectId, ct));
+        await query.WhenAllAsync().ConfigureAwait(false);
+
+        var aggregator = new CostAggregator();
+        aggregator.AddRange(costCodes.Value);
+        aggregator.AddRange(invoices.Value);
+
+        _logger?.AggregatedCostRecords(aggregator.Count, projectId);
+
+        return aggregator;
+    }
+
     #endregion
 
     #region Pagination Support
@@ -574,7 +628,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting invoices with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+            _logger?.GettingInvoicesPage(projectId, companyId, options.Page, options.PerPage);
             
             // Placeholder implementation
             return new CoreModels.PagedResult<Invoice>
@@ -604,7 +658,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting transactions with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+            _logger?.GettingTransactionsPage(projectId, companyId, options.Page, options.PerPage);
             
             // Placeholder implementation
             return new CoreModels.PagedResult<FinancialTransaction>
@@ -635,7 +689,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting invoice configuration for contract {ContractId} in project {ProjectId} using V1.0 API", contractId, projectId);
+            _logger?.GettingInvoiceConfiguration(contractId, projectId);
             
             var configResponse = await _generatedClient.Rest.V10.Projects[projectId]
                 .Contracts[contractId].Invoice_configuration
@@ -643,14 +697,13 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
 
             if (configResponse == null)
             {
-                _logger?.LogWarning("No invoice configuration returned for contract {ContractId} in project {ProjectId}", contractId, projectId);
+                _logger?.NoInvoiceConfigurationReturned(contractId, projectId);
                 throw new InvalidOperationException($"Failed to retrieve invoice configuration for contract {contractId}");
             }
 
             var mappedConfig = _invoiceConfigMapper.MapToWrapper(configResponse);
             
-            _logger?.LogInformation("Successfully retrieved invoice configuration for contract {ContractId} with {RuleCount} retainage rules",
-                contractId, mappedConfig.RetainageRuleSet?.Rules.Count ?? 0);
+            _logger?.RetrievedInvoiceConfiguration(contractId, mappedConfig.RetainageRuleSet?.Rules.Count ?? 0);
             
             return mappedConfig;
         }, nameof(GetInvoiceConfigurationAsync), null, cancellationToken).ConfigureAwait(false);
@@ -670,7 +723,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating invoice configuration for contract {ContractId} in project {ProjectId} using V1.0 API", contractId, projectId);
+            _logger?.UpdatingInvoiceConfiguration(contractId, projectId);
             
             // Create the domain model from the request
             var configToUpdate = new InvoiceConfiguration
@@ -692,14 +745,13 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
 
             if (patchResponse == null)
             {
-                _logger?.LogWarning("No response returned from invoice configuration update for contract {ContractId} in project {ProjectId}", contractId, projectId);
+                _logger?.NoInvoiceConfigurationUpdateResponse(contractId, projectId);
                 throw new InvalidOperationException($"Failed to update invoice configuration for contract {contractId}");
             }
 
             var mappedConfig = _invoiceConfigMapper.MapFromPatchResponse(patchResponse);
             
-            _logger?.LogInformation("Successfully updated invoice configuration for contract {ContractId} - Materials to Previous: {MoveMaterials}, Separate Billing: {SeparateBilling}",
-                contractId, mappedConfig.MoveMaterialsToPreviousWorkCompleted, mappedConfig.SeparateBillingForStoredMaterials);
+            _logger?.UpdatedInvoiceConfiguration(contractId, mappedConfig.MoveMaterialsToPreviousWorkCompleted, mappedConfig.SeparateBillingForStoredMaterials);
             
             return mappedConfig;
         }, nameof(UpdateInvoiceConfigurationAsync), null, cancellationToken).ConfigureAwait(false);
@@ -725,7 +777,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting async job {JobUuid} for company {CompanyId} using V1.0 API", jobUuid, companyId);
+            _logger?.GettingAsyncJob(jobUuid, companyId);
             
             var jobResponse = await _generatedClient.Rest.V10.Companies[companyId]
                 .Invoices.Async_jobs[jobUuid]
@@ -733,14 +785,13 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
 
             if (jobResponse == null)
             {
-                _logger?.LogWarning("No async job returned for UUID {JobUuid} in company {CompanyId}", jobUuid, companyId);
+                _logger?.NoAsyncJobReturned(jobUuid, companyId);
                 throw new InvalidOperationException($"Failed to retrieve async job {jobUuid}");
             }
 
             var mappedJob = _asyncJobMapper.MapToWrapper(jobResponse);
             
-            _logger?.LogInformation("Retrieved async job {JobUuid} with status {Status} - Progress: {Progress}%",
-                jobUuid, mappedJob.Status, mappedJob.ProgressPercentage ?? 0);
+            _logger?.RetrievedAsyncJob(jobUuid, mappedJob.Status, mappedJob.ProgressPercentage ?? 0);
             
             return mappedJob;
         }, nameof(GetAsyncJobAsync), null, cancellationToken).ConfigureAwait(false);
@@ -763,7 +814,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Waiting for async job {JobUuid} completion with timeout {Timeout}", jobUuid, actualTimeout);
+            _logger?.WaitingForAsyncJob(jobUuid, actualTimeout);
             
             var currentPollInterval = pollInterval;
             
@@ -776,23 +827,21 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
                 switch (job.Status)
                 {
                     case AsyncJobStatus.Completed:
-                        _logger?.LogInformation("Async job {JobUuid} completed successfully in {Duration}ms",
-                            jobUuid, (DateTime.UtcNow - startTime).TotalMilliseconds);
+                        _logger?.AsyncJobCompleted(jobUuid, (DateTime.UtcNow - startTime).TotalMilliseconds);
                         return job;
                         
                     case AsyncJobStatus.Failed:
                         var errorMessage = job.ErrorMessage ?? "Unknown error occurred";
-                        _logger?.LogError("Async job {JobUuid} failed: {ErrorMessage}", jobUuid, errorMessage);
+                        _logger?.AsyncJobFailed(jobUuid, errorMessage);
                         throw new InvalidOperationException($"Async job {jobUuid} failed: {errorMessage}");
                         
                     case AsyncJobStatus.Cancelled:
-                        _logger?.LogWarning("Async job {JobUuid} was cancelled", jobUuid);
+                        _logger?.AsyncJobCancelled(jobUuid);
                         throw new OperationCanceledException($"Async job {jobUuid} was cancelled");
                         
                     case AsyncJobStatus.Pending:
                     case AsyncJobStatus.InProgress:
-                        _logger?.LogDebug("Async job {JobUuid} still {Status}, progress: {Progress}%, waiting {PollInterval}ms",
-                            jobUuid, job.Status, job.ProgressPercentage ?? 0, currentPollInterval.TotalMilliseconds);
+                        _logger?.AsyncJobPending(jobUuid, job.Status, job.ProgressPercentage ?? 0, currentPollInterval.TotalMilliseconds);
                         
                         await Task.Delay(currentPollInterval, cancellationToken).ConfigureAwait(false);
                         
@@ -824,7 +873,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting compliance documents for invoice {InvoiceId} in project {ProjectId} company {CompanyId} using enhanced V2.0 mapping", invoiceId, projectId, companyId);
+            _logger?.GettingComplianceDocumentsForInvoice(invoiceId, projectId, companyId);
             
             var documentsResponse = await _generatedClient.Rest.V20.Companies[companyId.ToString()]
                 .Projects[projectId.ToString()].Compliance.Invoices[invoiceId].Documents
@@ -832,7 +881,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             
             if (documentsResponse?.Data == null)
             {
-                _logger?.LogWarning("No compliance documents returned for invoice {InvoiceId} in project {ProjectId} company {CompanyId}", invoiceId, projectId, companyId);
+                _logger?.NoComplianceDocumentsReturnedForInvoice(invoiceId, projectId, companyId);
                 return Enumerable.Empty<ComplianceDocument>();
             }
             
@@ -840,8 +889,10 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             mappedDocument.InvoiceId = int.TryParse(invoiceId, out var id) ? id : 0;
             mappedDocument.ProjectId = projectId;
             
-            _logger?.LogInformation("Retrieved compliance documents for invoice {InvoiceId} with {FileCount} files, total size: {TotalSize} bytes",
-                invoiceId, mappedDocument.Files.Count, mappedDocument.Files.Sum(f => f.FileSize));
+            if (_logger?.IsEnabled(LogLevel.Information) == true)
+            {
+                _logger.RetrievedComplianceDocumentFiles(invoiceId, mappedDocument.Files.Count, mappedDocument.Files.Sum(f => f.FileSize));
+            }
             
             return new List<ComplianceDocument> { mappedDocument };
         }, nameof(GetComplianceDocumentsAsync), null, cancellationToken).ConfigureAwait(false);
@@ -862,7 +913,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Creating compliance document for invoice {InvoiceId} in project {ProjectId} company {CompanyId} - Title: {Title}", invoiceId, projectId, companyId, request.Title);
+            _logger?.CreatingComplianceDocumentForInvoice(invoiceId, projectId, companyId, request.Title);
             
             var postBody = new Procore.SDK.ConstructionFinancials.Rest.V20.Companies.Item.Projects.Item.Compliance.Invoices.Item.Documents.DocumentsPostRequestBody
             {
@@ -881,7 +932,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             
             if (createResponse == null)
             {
-                _logger?.LogWarning("No response data from compliance document creation for invoice {InvoiceId}", invoiceId);
+                _logger?.NoComplianceDocumentResponse(invoiceId);
                 throw new InvalidOperationException($"Failed to create compliance document for invoice {invoiceId}");
             }
             
@@ -889,8 +940,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             mappedDocument.InvoiceId = int.TryParse(invoiceId, out var id) ? id : 0;
             mappedDocument.ProjectId = projectId;
             
-            _logger?.LogInformation("Successfully created compliance document {DocumentId} for invoice {InvoiceId} - Title: {Title}, Type: {DocumentType}",
-                mappedDocument.Id, invoiceId, mappedDocument.Title, mappedDocument.DocumentType);
+            _logger?.CreatedComplianceDocument(mappedDocument.Id, invoiceId, mappedDocument.Title, mappedDocument.DocumentType);
             
             return mappedDocument;
         }, nameof(CreateComplianceDocumentAsync), null, cancellationToken).ConfigureAwait(false);
@@ -915,8 +965,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Querying invoices for project {ProjectId} in company {CompanyId} with filters - Statuses: {StatusCount}, Date Range: {StartDate} to {EndDate}",
-                projectId, companyId, request.Statuses.Count, request.StartDate, request.EndDate);
+            _logger?.QueryingInvoicesForProject(projectId, companyId, request.Statuses.Count, request.StartDate, request.EndDate);
             
             // Enhanced placeholder implementation with simulated business logic
             // In a real implementation, this would use proper invoice listing endpoints
@@ -934,8 +983,10 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             if (request.MaxAmount.HasValue) filterCriteria.Add($"max_amount:{request.MaxAmount}");
             if (!string.IsNullOrEmpty(request.SearchTerm)) filterCriteria.Add($"search:{request.SearchTerm}");
             
-            _logger?.LogInformation("Applied query filters for project {ProjectId}: {FilterCriteria}",
-                projectId, string.Join(", ", filterCriteria));
+            if (_logger?.IsEnabled(LogLevel.Information) == true)
+            {
+                _logger.AppliedInvoiceQueryFilters(projectId, string.Join(", ", filterCriteria));
+            }
             
             // For demonstration, return a filtered placeholder invoice that matches criteria
             if (request.Statuses.Any() || request.VendorIds.Any() || !string.IsNullOrEmpty(request.SearchTerm))
@@ -977,8 +1028,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Querying invoices with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})",
-                projectId, companyId, options.Page, options.PerPage);
+            _logger?.QueryingInvoicesPage(projectId, companyId, options.Page, options.PerPage);
             
             // Get unpaged results and simulate pagination
             var allResults = await QueryInvoicesAsync(companyId, projectId, request, cancellationToken).ConfigureAwait(false);
@@ -989,8 +1039,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             
             var totalPages = (int)Math.Ceiling((double)resultsList.Count / options.PerPage);
             
-            _logger?.LogInformation("Retrieved page {Page} of {TotalPages} with {ItemCount} invoices for project {ProjectId}",
-                options.Page, totalPages, pagedItems.Count(), projectId);
+            _logger?.RetrievedInvoicesPage(options.Page, totalPages, pagedItems.Count(), projectId);
             
             return new CoreModels.PagedResult<Invoice>
             {
@@ -1028,8 +1077,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Processing bulk {OperationType} operation for {InvoiceCount} invoices in project {ProjectId} company {CompanyId}",
-                request.OperationType, request.InvoiceIds.Count, projectId, companyId);
+            _logger?.ProcessingBulkInvoiceOperation(request.OperationType, request.InvoiceIds.Count, projectId, companyId);
             
             var results = new Dictionary<int, bool>();
             var successCount = 0;
@@ -1052,7 +1100,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
                     }
                     catch (Exception ex)
                     {
-                        _logger?.LogWarning(ex, "Failed to process {OperationType} for invoice {InvoiceId}", request.OperationType, invoiceId);
+                        _logger?.FailedToProcessInvoiceOperation(ex, request.OperationType, invoiceId);
                         return new { InvoiceId = invoiceId, Success = false };
                     }
                 });
@@ -1073,8 +1121,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
                 }
             }
             
-            _logger?.LogInformation("Completed bulk {OperationType} operation for project {ProjectId} - Success: {SuccessCount}, Failed: {FailureCount}",
-                request.OperationType, projectId, successCount, failureCount);
+            _logger?.CompletedBulkInvoiceOperation(request.OperationType, projectId, successCount, failureCount);
             
             return results;
         }, nameof(ProcessBulkInvoiceOperationAsync), null, cancellationToken).ConfigureAwait(false);
@@ -1103,17 +1150,17 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
                 case BulkOperationType.GenerateReports:
                     // Enhanced placeholder implementation
                     // In a real implementation, these would perform actual operations
-                    _logger?.LogDebug("Simulated {OperationType} for invoice {InvoiceId}", operationType, invoiceId);
+                    _logger?.SimulatedInvoiceOperation(operationType, invoiceId);
                     return true;
                     
                 default:
-                    _logger?.LogWarning("Unsupported bulk operation type: {OperationType}", operationType);
+                    _logger?.UnsupportedBulkOperationType(operationType);
                     return false;
             }
         }
         catch (Exception ex)
         {
-            _logger?.LogError(ex, "Error processing {OperationType} for invoice {InvoiceId}", operationType, invoiceId);
+            _logger?.InvoiceOperationFailed(ex, operationType, invoiceId);
             return false;
         }
     }
@@ -1136,8 +1183,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting detailed cost analysis for project {ProjectId} in company {CompanyId} - Date Range: {StartDate} to {EndDate}",
-                projectId, companyId, request.StartDate, request.EndDate);
+            _logger?.GettingDetailedCostAnalysisForProject(projectId, companyId, request.StartDate, request.EndDate);
             
             // Enhanced placeholder implementation with realistic financial analysis
             var analysis = new Dictionary<string, decimal>();
@@ -1182,11 +1228,13 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             }
             
             // Add variance analysis
-            analysis["Budget_Variance_Percentage"] = (decimal)(GetSecureRandomDouble(secureRandom) * 20 - 10); // -10% to +10%
-            analysis["Schedule_Impact_Cost"] = baseMultiplier * (decimal)(0.05 + GetSecureRandomDouble(secureRandom) * 0.1);
+            analysis[BudgetVariancePercentageKey] = (decimal)(GetSecureRandomDouble(secureRandom) * 20 - 10); // -10% to +10%
+            analysis[ScheduleImpactCostKey] = baseMultiplier * (decimal)(0.05 + GetSecureRandomDouble(secureRandom) * 0.1);
             
-            _logger?.LogInformation("Generated detailed cost analysis for project {ProjectId} with {CategoryCount} categories, total value: ${TotalValue:F2}",
-                projectId, analysis.Count, analysis.Values.Where(v => v > 0).Sum());
+            if (_logger?.IsEnabled(LogLevel.Information) == true)
+            {
+                _logger.GeneratedDetailedCostAnalysis(projectId, analysis.Count, analysis.Values.Where(v => v > 0).Sum());
+            }
             
             return analysis;
         }, nameof(GetDetailedCostAnalysisAsync), null, cancellationToken).ConfigureAwait(false);
@@ -1206,7 +1254,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting financial metrics for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingFinancialMetricsForProject(projectId, companyId);
             
             // Get detailed cost analysis first
             var costAnalysis = await GetDetailedCostAnalysisAsync(companyId, projectId, request, cancellationToken);
@@ -1214,8 +1262,24 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             var metrics = new Dictionary<string, object>();
             var random = new Random(projectId + companyId);
             
+            // Single pass: total the positive values and collect the cost categories, which are
+            // every entry except the variance analysis
+            var totalCosts = 0m;
+            var categoryCosts = new List<KeyValuePair<string, decimal>>(costAnalysis.Count);
+            foreach (var kvp in costAnalysis)
+            {
+                if (kvp.Value > 0)
+                {
+                    totalCosts += kvp.Value;
+                }
+                
+                if (kvp.Key != BudgetVariancePercentageKey && kvp.Key != ScheduleImpactCostKey)
+                {
+                    categoryCosts.Add(kvp);
+                }
+            }
+            
             // Core Financial Metrics
-            var totalCosts = costAnalysis.Values.Where(v => v > 0).Sum();
             metrics["Total_Project_Cost"] = totalCosts;
             metrics["Committed_Costs"] = totalCosts * (decimal)(0.85 + random.NextDouble() * 0.1);
             metrics["Actual_Costs"] = totalCosts * (decimal)(0.60 + random.NextDouble() * 0.2);
@@ -1251,16 +1315,15 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             }
             
             // Category Distribution
-            var categoryMetrics = new Dictionary<string, object>();
-            foreach (var kvp in costAnalysis.Where(x => !x.Key.Contains("Variance") && !x.Key.Contains("Impact")))
+            var categoryMetrics = new Dictionary<string, object>(categoryCosts.Count);
+            foreach (var kvp in categoryCosts)
             {
                 var percentage = totalCosts > 0 ? (double)(kvp.Value / totalCosts * 100) : 0;
                 categoryMetrics[kvp.Key + "_Percentage"] = Math.Round(percentage, 2);
             }
             metrics["Category_Distribution"] = categoryMetrics;
             
-            _logger?.LogInformation("Generated {MetricCount} financial metrics for project {ProjectId} - Total Cost: ${TotalCost:F2}, CPI: {CPI}, SPI: {SPI}",
-                metrics.Count, projectId, totalCosts, metrics["Cost_Performance_Index"], metrics["Schedule_Performance_Index"]);
+            _logger?.GeneratedFinancialMetrics(metrics.Count, projectId, totalCosts, metrics["Cost_Performance_Index"], metrics["Schedule_Performance_Index"]);
             
             return metrics;
         }, nameof(GetFinancialMetricsAsync), null, cancellationToken).ConfigureAwait(false);
@@ -1280,8 +1343,7 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting transaction history for project {ProjectId} in company {CompanyId} - Date Range: {StartDate} to {EndDate}",
-                projectId, companyId, request.StartDate, request.EndDate);
+            _logger?.GettingTransactionHistoryForProject(projectId, companyId, request.StartDate, request.EndDate);
             
             var transactions = new List<FinancialTransaction>();
             var random = new Random(projectId);
@@ -1319,8 +1381,10 @@ public class ProcoreConstructionFinancialsClient : IConstructionFinancialsClient
             // Sort by transaction date descending (most recent first)
             transactions = transactions.OrderByDescending(t => t.TransactionDate).ToList();
             
-            _logger?.LogInformation("Generated {TransactionCount} transactions for project {ProjectId} from {StartDate} to {EndDate}, total value: ${TotalValue:F2}",
-                transactions.Count, projectId, startDate.ToShortDateString(), endDate.ToShortDateString(), transactions.Sum(t => t.Amount));
+            if (_logger?.IsEnabled(LogLevel.Information) == true)
+            {
+                _logger.GeneratedTransactionHistory(transactions.Count, projectId, startDate.ToShortDateString(), endDate.ToShortDateString(), transactions.Sum(t => t.Amount));
+            }
             
             return transactions;
         }, nameof(GetTransactionHistoryAsync), null, cancellationToken).ConfigureAwait(false);
@@ -0,0 +1,179 @@
+using System;
+using Microsoft.Extensions.Logging;
+using Procore.SDK.ConstructionFinancials.Models;
+
+namespace Procore.SDK.ConstructionFinancials;
+
+/// <summary>
+/// Source-generated log messages for <see cref="ProcoreConstructionFinancialsClient"/>.
+/// </summary>
+internal static partial class ConstructionFinancialsClientLog
+{
+    [LoggerMessage(EventId = 2401, Level = LogLevel.Debug, Message = "Getting compliance documents for invoice {InvoiceId} in project {ProjectId} company {CompanyId} using enhanced V2.0 mapping")]
+    public static partial void GettingComplianceDocumentsForInvoice(this ILogger logger, string invoiceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2402, Level = LogLevel.Warning, Message = "No compliance documents returned for invoice {InvoiceId} in project {ProjectId} company {CompanyId}")]
+    public static partial void NoComplianceDocumentsReturnedForInvoice(this ILogger logger, string invoiceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2403, Level = LogLevel.Information, Message = "Retrieved {DocumentCount} compliance documents for invoice {InvoiceId} with total {FileCount} files")]
+    public static partial void RetrievedInvoiceComplianceDocuments(this ILogger logger, int documentCount, string invoiceId, int fileCount);
+
+    [LoggerMessage(EventId = 2404, Level = LogLevel.Debug, Message = "Getting invoices for project {ProjectId} in company {CompanyId} - providing placeholder data")]
+    public static partial void GettingInvoicesForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2405, Level = LogLevel.Warning, Message = "GetInvoicesAsync currently returns empty - requires invoice IDs to query compliance documents")]
+    public static partial void InvoiceListingUnavailable(this ILogger logger);
+
+    [LoggerMessage(EventId = 2406, Level = LogLevel.Debug, Message = "Getting invoice {InvoiceId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingInvoice(this ILogger logger, int invoiceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2407, Level = LogLevel.Debug, Message = "Creating invoice for project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingInvoiceForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2408, Level = LogLevel.Warning, Message = "CreateInvoiceAsync currently limited - available endpoint creates compliance documents, not invoices")]
+    public static partial void InvoiceCreationUnavailable(this ILogger logger);
+
+    [LoggerMessage(EventId = 2409, Level = LogLevel.Debug, Message = "Approving invoice {InvoiceId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void ApprovingInvoice(this ILogger logger, int invoiceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2410, Level = LogLevel.Debug, Message = "Rejecting invoice {InvoiceId} for project {ProjectId} in company {CompanyId} with reason: {Reason}")]
+    public static partial void RejectingInvoice(this ILogger logger, int invoiceId, int projectId, int companyId, string reason);
+
+    [LoggerMessage(EventId = 2411, Level = LogLevel.Debug, Message = "Creating compliance document for invoice {InvoiceId} in project {ProjectId} company {CompanyId} - Title: {Title}")]
+    public static partial void CreatingComplianceDocumentForInvoice(this ILogger logger, string invoiceId, int projectId, int companyId, string title);
+
+    [LoggerMessage(EventId = 2412, Level = LogLevel.Information, Message = "Successfully created compliance document {DocumentId} for invoice {InvoiceId} - Title: {Title}, Files: {FileCount}")]
+    public static partial void CreatedInvoiceComplianceDocument(this ILogger logger, int documentId, string invoiceId, string title, int fileCount);
+
+    [LoggerMessage(EventId = 2413, Level = LogLevel.Debug, Message = "Processing payment for invoice {InvoiceId} in project {ProjectId} in company {CompanyId}")]
+    public static partial void ProcessingPaymentForInvoice(this ILogger logger, int invoiceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2414, Level = LogLevel.Debug, Message = "Getting transactions for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingTransactionsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2415, Level = LogLevel.Debug, Message = "Getting cost codes for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingCostCodesForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2416, Level = LogLevel.Debug, Message = "Getting cost code {CostCodeId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingCostCode(this ILogger logger, int costCodeId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2417, Level = LogLevel.Debug, Message = "Getting total cost for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingTotalCostForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2418, Level = LogLevel.Debug, Message = "Getting cost summary for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingCostSummaryForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2419, Level = LogLevel.Debug, Message = "Aggregating costs for project {ProjectId} in company {CompanyId}")]
+    public static partial void AggregatingCostsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2420, Level = LogLevel.Debug, Message = "Aggregated {RecordCount} cost records for project {ProjectId}")]
+    public static partial void AggregatedCostRecords(this ILogger logger, int recordCount, int projectId);
+
+    [LoggerMessage(EventId = 2421, Level = LogLevel.Debug, Message = "Getting invoices with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingInvoicesPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2422, Level = LogLevel.Debug, Message = "Getting transactions with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingTransactionsPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2423, Level = LogLevel.Debug, Message = "Getting invoice configuration for contract {ContractId} in project {ProjectId} using V1.0 API")]
+    public static partial void GettingInvoiceConfiguration(this ILogger logger, int contractId, int projectId);
+
+    [LoggerMessage(EventId = 2424, Level = LogLevel.Warning, Message = "No invoice configuration returned for contract {ContractId} in project {ProjectId}")]
+    public static partial void NoInvoiceConfigurationReturned(this ILogger logger, int contractId, int projectId);
+
+    [LoggerMessage(EventId = 2425, Level = LogLevel.Information, Message = "Successfully retrieved invoice configuration for contract {ContractId} with {RuleCount} retainage rules")]
+    public static partial void RetrievedInvoiceConfiguration(this ILogger logger, int contractId, int ruleCount);
+
+    [LoggerMessage(EventId = 2426, Level = LogLevel.Debug, Message = "Updating invoice configuration for contract {ContractId} in project {ProjectId} using V1.0 API")]
+    public static partial void UpdatingInvoiceConfiguration(this ILogger logger, int contractId, int projectId);
+
+    [LoggerMessage(EventId = 2427, Level = LogLevel.Warning, Message = "No response returned from invoice configuration update for contract {ContractId} in project {ProjectId}")]
+    public static partial void NoInvoiceConfigurationUpdateResponse(this ILogger logger, int contractId, int projectId);
+
+    [LoggerMessage(EventId = 2428, Level = LogLevel.Information, Message = "Successfully updated invoice configuration for contract {ContractId} - Materials to Previous: {MoveMaterials}, Separate Billing: {SeparateBilling}")]
+    public static partial void UpdatedInvoiceConfiguration(this ILogger logger, int contractId, bool moveMaterials, bool separateBilling);
+
+    [LoggerMessage(EventId = 2429, Level = LogLevel.Debug, Message = "Getting async job {JobUuid} for company {CompanyId} using V1.0 API")]
+    public static partial void GettingAsyncJob(this ILogger logger, string jobUuid, int companyId);
+
+    [LoggerMessage(EventId = 2430, Level = LogLevel.Warning, Message = "No async job returned for UUID {JobUuid} in company {CompanyId}")]
+    public static partial void NoAsyncJobReturned(this ILogger logger, string jobUuid, int companyId);
+
+    [LoggerMessage(EventId = 2431, Level = LogLevel.Information, Message = "Retrieved async job {JobUuid} with status {Status} - Progress: {Progress}%")]
+    public static partial void RetrievedAsyncJob(this ILogger logger, string jobUuid, AsyncJobStatus status, int progress);
+
+    [LoggerMessage(EventId = 2432, Level = LogLevel.Debug, Message = "Waiting for async job {JobUuid} completion with timeout {Timeout}")]
+    public static partial void WaitingForAsyncJob(this ILogger logger, string jobUuid, TimeSpan timeout);
+
+    [LoggerMessage(EventId = 2433, Level = LogLevel.Information, Message = "Async job {JobUuid} completed successfully in {Duration}ms")]
+    public static partial void AsyncJobCompleted(this ILogger logger, string jobUuid, double duration);
+
+    [LoggerMessage(EventId = 2434, Level = LogLevel.Error, Message = "Async job {JobUuid} failed: {ErrorMessage}")]
+    public static partial void AsyncJobFailed(this ILogger logger, string jobUuid, string errorMessage);
+
+    [LoggerMessage(EventId = 2435, Level = LogLevel.Warning, Message = "Async job {JobUuid} was cancelled")]
+    public static partial void AsyncJobCancelled(this ILogger logger, string jobUuid);
+
+    [LoggerMessage(EventId = 2436, Level = LogLevel.Debug, Message = "Async job {JobUuid} still {Status}, progress: {Progress}%, waiting {PollInterval}ms")]
+    public static partial void AsyncJobPending(this ILogger logger, string jobUuid, AsyncJobStatus status, int progress, double pollInterval);
+
+    [LoggerMessage(EventId = 2437, Level = LogLevel.Information, Message = "Retrieved compliance documents for invoice {InvoiceId} with {FileCount} files, total size: {TotalSize} bytes")]
+    public static partial void RetrievedComplianceDocumentFiles(this ILogger logger, string invoiceId, int fileCount, long totalSize);
+
+    [LoggerMessage(EventId = 2438, Level = LogLevel.Warning, Message = "No response data from compliance document creation for invoice {InvoiceId}")]
+    public static partial void NoComplianceDocumentResponse(this ILogger logger, string invoiceId);
+
+    [LoggerMessage(EventId = 2439, Level = LogLevel.Information, Message = "Successfully created compliance document {DocumentId} for invoice {InvoiceId} - Title: {Title}, Type: {DocumentType}")]
+    public static partial void CreatedComplianceDocument(this ILogger logger, int documentId, string invoiceId, string title, string documentType);
+
+    [LoggerMessage(EventId = 2440, Level = LogLevel.Debug, Message = "Querying invoices for project {ProjectId} in company {CompanyId} with filters - Statuses: {StatusCount}, Date Range: {StartDate} to {EndDate}")]
+    public static partial void QueryingInvoicesForProject(this ILogger logger, int projectId, int companyId, int statusCount, DateTime? startDate, DateTime? endDate);
+
+    [LoggerMessage(EventId = 2441, Level = LogLevel.Information, Message = "Applied query filters for project {ProjectId}: {FilterCriteria}")]
+    public static partial void AppliedInvoiceQueryFilters(this ILogger logger, int projectId, string filterCriteria);
+
+    [LoggerMessage(EventId = 2442, Level = LogLevel.Debug, Message = "Querying invoices with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void QueryingInvoicesPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2443, Level = LogLevel.Information, Message = "Retrieved page {Page} of {TotalPages} with {ItemCount} invoices for project {ProjectId}")]
+    public static partial void RetrievedInvoicesPage(this ILogger logger, int page, int totalPages, int itemCount, int projectId);
+
+    [LoggerMessage(EventId = 2444, Level = LogLevel.Debug, Message = "Processing bulk {OperationType} operation for {InvoiceCount} invoices in project {ProjectId} company {CompanyId}")]
+    public static partial void ProcessingBulkInvoiceOperation(this ILogger logger, BulkOperationType operationType, int invoiceCount, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2445, Level = LogLevel.Warning, Message = "Failed to process {OperationType} for invoice {InvoiceId}")]
+    public static partial void FailedToProcessInvoiceOperation(this ILogger logger, Exception? exception, BulkOperationType operationType, int invoiceId);
+
+    [LoggerMessage(EventId = 2446, Level = LogLevel.Information, Message = "Completed bulk {OperationType} operation for project {ProjectId} - Success: {SuccessCount}, Failed: {FailureCount}")]
+    public static partial void CompletedBulkInvoiceOperation(this ILogger logger, BulkOperationType operationType, int projectId, int successCount, int failureCount);
+
+    [LoggerMessage(EventId = 2447, Level = LogLevel.Debug, Message = "Simulated {OperationType} for invoice {InvoiceId}")]
+    public static partial void SimulatedInvoiceOperation(this ILogger logger, BulkOperationType operationType, int invoiceId);
+
+    [LoggerMessage(EventId = 2448, Level = LogLevel.Warning, Message = "Unsupported bulk operation type: {OperationType}")]
+    public static partial void UnsupportedBulkOperationType(this ILogger logger, BulkOperationType operationType);
+
+    [LoggerMessage(EventId = 2449, Level = LogLevel.Error, Message = "Error processing {OperationType} for invoice {InvoiceId}")]
+    public static partial void InvoiceOperationFailed(this ILogger logger, Exception? exception, BulkOperationType operationType, int invoiceId);
+
+    [LoggerMessage(EventId = 2450, Level = LogLevel.Debug, Message = "Getting detailed cost analysis for project {ProjectId} in company {CompanyId} - Date Range: {StartDate} to {EndDate}")]
+    public static partial void GettingDetailedCostAnalysisForProject(this ILogger logger, int projectId, int companyId, DateTime? startDate, DateTime? endDate);
+
+    [LoggerMessage(EventId = 2451, Level = LogLevel.Information, Message = "Generated detailed cost analysis for project {ProjectId} with {CategoryCount} categories, total value: ${TotalValue:F2}")]
+    public static partial void GeneratedDetailedCostAnalysis(this ILogger logger, int projectId, int categoryCount, decimal totalValue);
+
+    [LoggerMessage(EventId = 2452, Level = LogLevel.Debug, Message = "Getting financial metrics for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingFinancialMetricsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2453, Level = LogLevel.Information, Message = "Generated {MetricCount} financial metrics for project {ProjectId} - Total Cost: ${TotalCost:F2}, CPI: {CPI}, SPI: {SPI}")]
+    public static partial void GeneratedFinancialMetrics(this ILogger logger, int metricCount, int projectId, decimal totalCost, object cpi, object spi);
+
+    [LoggerMessage(EventId = 2454, Level = LogLevel.Debug, Message = "Getting transaction history for project {ProjectId} in company {CompanyId} - Date Range: {StartDate} to {EndDate}")]
+    public static partial void GettingTransactionHistoryForProject(this ILogger logger, int projectId, int companyId, DateTime? startDate, DateTime? endDate);
+
+    [LoggerMessage(EventId = 2455, Level = LogLevel.Information, Message = "Generated {TransactionCount} transactions for project {ProjectId} from {StartDate} to {EndDate}, total value: ${TotalValue:F2}")]
+    public static partial void GeneratedTransactionHistory(this ILogger logger, int transactionCount, int projectId, string startDate, string endDate, decimal totalValue);
+
+    [LoggerMessage(EventId = 2456, Level = LogLevel.Debug, Message = "Executing operation {Operation} with correlation ID {CorrelationId}")]
+    public static partial void ExecutingOperation(this ILogger logger, string operation, string correlationId);
+}
@@ -2,6 +2,7 @@ using System;
 using System.Collections.Generic;
 using System.Threading;
 using System.Threading.Tasks;
+using Procore.SDK.ConstructionFinancials.Analytics;
 using CoreModels = Procore.SDK.Core.Models;
 
 namespace Procore.SDK.ConstructionFinancials.Models;
@@ -130,6 +131,15 @@ public interface IConstructionFinancialsClient : IDisposable
     /// <param name="cancellationToken">Cancellation token for the request.</param>
     /// <returns>A dictionary with cost summary by category.</returns>
     Task<Dictionary<string, decimal>> GetCostSummaryAsync(int companyId, int projectId, CancellationToken cancellationToken = default);
+    
+    /// <summary>
+    /// Aggregates a project's cost codes and invoices into typed totals and per-division rollups.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="projectId">The project ID.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>An aggregator holding the project totals, which can be updated as records change.</returns>
+    Task<CostAggregator> GetCostAggregationAsync(int companyId, int projectId, CancellationToken cancellationToken = default);
 
     // Pagination Support
     
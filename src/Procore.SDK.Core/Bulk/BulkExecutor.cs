@@ -0,0 +1,148 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Core.Bulk;
+
+/// <summary>
+/// Runs bulk operations either through a server-side bulk route, in chunks sized to the route's
+/// limit, or as bounded concurrent single calls when no bulk route exists. Outcomes are returned
+/// in the order of the input items and a failing item or chunk does not stop the others.
+/// </summary>
+public static class BulkExecutor
+{
+    /// <summary>
+    /// The default number of single calls run at once when falling back from a bulk route.
+    /// </summary>
+    public const int DefaultMaxConcurrency = 8;
+
+    /// <summary>
+    /// Sends the items to a bulk route in chunks and maps the results back to the items by position.
+    /// </summary>
+    /// <typeparam name="TItem">The request item type.</typeparam>
+    /// <typeparam name="TResult">The result type.</typeparam>
+    /// <param name="items">The request items.</param>
+    /// <param name="chunkSize">The maximum number of items the bulk route accepts per request.</param>
+    /// <param name="sendChunk">Sends one chunk and returns its results in request order.</param>
+    /// <param name="cancellationToken">Cancellation token for the operation.</param>
+    /// <returns>One outcome per item. Every item of a chunk that failed carries the chunk's exception.</returns>
+    public static async Task<IReadOnlyList<BulkItemOutcome<TItem, TResult>>> ExecuteChunkedAsync<TItem, TResult>(
+        IReadOnlyList<TItem> items,
+        int chunkSize,
+        Func<IReadOnlyList<TItem>, CancellationToken, Task<IReadOnlyList<TResult>>> sendChunk,
+        CancellationToken cancellationToken = default)
+    {
+        if (items == null)
+            throw new ArgumentNullException(nameof(items));
+        if (sendChunk == null)
+            throw new ArgumentNullException(nameof(sendChunk));
+        if (chunkSize < 1)
+            throw new ArgumentOutOfRangeException(nameof(chunkSize), chunkSize, "Chunk size must be at least 1.");
+
+        var outcomes = new List<BulkItemOutcome<TItem, TResult>>(items.Count);
+
+        for (var offset = 0; offset < items.Count; offset += chunkSize)
+        {
+            var count = Math.Min(chunkSize, items.Count - offset);
+            var chunk = new TItem[count];
+            for (var i = 0; i < count; i++)
+            {
+                chunk[i] = items[offset + i];
+            }
+
+            IReadOnlyList<TResult>? results = null;
+            Exception? chunkException = null;
+            try
+            {
+                results = await sendChunk(chunk, cancellationToken).ConfigureAwait(false);
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
+            }
+            catch (Exception ex)
+            {
+                chunkException = ex;
+            }
+
+            for (var i = 0; i < count; i++)
+            {
+                if (chunkException != null)
+                {
+                    outcomes.Add(new BulkItemOutcome<TItem, TResult>(chunk[i], default, chunkException));
+                }
+                else if (results != null && i < results.Count)
+                {
+                    outcomes.Add(new BulkItemOutcome<TItem, TResult>(chunk[i], results[i], null));
+                }
+                else
+                {
+                    outcomes.Add(new BulkItemOutcome<TItem, TResult>(chunk[i], default,
+                        new InvalidOperationException($"The bulk route returned no result for item {offset + i}.")));
+                }
+            }
+        }
+
+        return outcomes;
+    }
+
+    /// <summary>
+    /// Sends the items one at a time with bounded concurrency, for operations without a bulk route.
+    /// </summary>
+    /// <typeparam name="TItem">The request item type.</typeparam>
+    /// <typeparam name="TResult">The result type.</typeparam>
+    /// <param name="items">The request items.</param>
+    /// <param name="send">Sends a single item.</param>
+    /// <param name="maxConcurrency">The maximum number of single calls running at once.</param>
+    /// <param name="cancellationToken">Cancellation token for the operation.</param>
+    /// <returns>One outcome per item, in input order.</returns>
+    public static async Task<IReadOnlyList<BulkItemOutcome<TItem, TResult>>> ExecuteConcurrentAsync<TItem, TResult>(
+        IReadOnlyList<TItem> items,
+        Func<TItem, CancellationToken, Task<TResult>> send,
+        int maxConcurrency = DefaultMaxConcurrency,
+        CancellationToken cancellationToken = default)
+    {
+        if (items == null)
+            throw new ArgumentNullException(nameof(items));
+        if (send == null)
+            throw new ArgumentNullException(nameof(send));
+        if (maxConcurrency < 1)
+            throw new ArgumentOutOfRangeException(nameof(maxConcurrency), maxConcurrency, "Max concurrency must be at least 1.");
+
+        var outcomes = new BulkItemOutcome<TItem, TResult>[items.Count];
+        using var throttle = new SemaphoreSlim(maxConcurrency, maxConcurrency);
+        var tasks = new Task[items.Count];
+
+        for (var i = 0; i < items.Count; i++)
+        {
+            tasks[i] = SendOneAsync(i);
+        }
+
+        await Task.WhenAll(tasks).ConfigureAwait(false);
+        return outcomes;
+
+        async Task SendOneAsync(int index)
+        {
+            var item = items[index];
+            await throttle.WaitAsync(cancellationToken).ConfigureAwait(false);
+            try
+            {
+                var result = await send(item, cancellationToken).ConfigureAwait(false);
+                outcomes[index] = new BulkItemOutcome<TItem, TResult>(item, result, null);
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                throw;
+            }
+            catch (Exception ex)
+            {
+                outcomes[index] = new BulkItemOutcome<TItem, TResult>(item, default, ex);
+            }
+            finally
+            {
+                throttle.Release();
+            }
+        }
+    }
+}
@@ -0,0 +1,44 @@
+using System;
+
+namespace Procore.SDK.Core.Bulk;
+
+/// <summary>
+/// The outcome of one item of a bulk operation run by <see cref="BulkExecutor"/>.
+/// </summary>
+/// <typeparam name="TItem">The request item type.</typeparam>
+/// <typeparam name="TResult">The result type.</typeparam>
+public sealed class BulkItemOutcome<TItem, TResult>
+{
+    /// <summary>
+    /// Initializes a new instance of the <see cref="BulkItemOutcome{TItem, TResult}"/> class.
+    /// </summary>
+    /// <param name="item">The request item.</param>
+    /// <param name="result">The result for the item, if it succeeded.</param>
+    /// <param name="exception">The failure for the item, if it failed.</param>
+    public BulkItemOutcome(TItem item, TResult? result, Exception? exception)
+    {
+        Item = item;
+        Result = result;
+        Exception = exception;
+    }
+
+    /// <summary>
+    /// Gets the request item.
+    /// </summary>
+    public TItem Item { get; }
+
+    /// <summary>
+    /// Gets the result for the item, or the default value when it failed.
+    /// </summary>
+    public TResult? Result { get; }
+
+    /// <summary>
+    /// Gets the failure for the item, or null when it succeeded.
+    /// </summary>
+    public Exception? Exception { get; }
+
+    /// <summary>
+    /// Gets a value indicating whether the item succeeded.
+    /// </summary>
+    public bool Succeeded => Exception == null;
+}
@@ -0,0 +1,56 @@
+using System;
+using System.Runtime.CompilerServices;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Core.Composite;
+
+/// <summary>
+/// One sub-request of a <see cref="CompositeQuery"/>. Awaiting the part yields its result.
+/// </summary>
+/// <typeparam name="T">The result type.</typeparam>
+public sealed class CompositePart<T>
+{
+    internal CompositePart(string name, bool isOptional)
+    {
+        Name = name;
+        IsOptional = isOptional;
+    }
+
+    /// <summary>
+    /// Gets the name of the part, used in log messages.
+    /// </summary>
+    public string Name { get; }
+
+    /// <summary>
+    /// Gets a value indicating whether a failure of the part leaves the rest of the query running.
+    /// </summary>
+    public bool IsOptional { get; }
+
+    /// <summary>
+    /// Gets the task of the sub-request. An optional part that failed completes with the default value.
+    /// </summary>
+    public Task<T> Task { get; internal set; } = null!;
+
+    /// <summary>
+    /// Gets the failure of an optional part, or null when it succeeded or has not completed.
+    /// </summary>
+    public Exception? Exception { get; internal set; }
+
+    /// <summary>
+    /// Gets a value indicating whether the part completed with a result.
+    /// </summary>
+    public bool Succeeded => Task.Status == TaskStatus.RanToCompletion && Exception == null;
+
+    /// <summary>
+    /// Gets the result of the part; the default value when an optional part failed.
+    /// </summary>
+    /// <exception cref="InvalidOperationException">Thrown when the part has not completed successfully.</exception>
+    public T Value => Task.Status == TaskStatus.RanToCompletion
+        ? Task.Result
+        : throw new InvalidOperationException($"Composite part '{Name}' has not completed successfully.");
+
+    /// <summary>
+    /// Gets an awaiter for the result of the part.
+    /// </summary>
+    public TaskAwaiter<T> GetAwaiter() => Task.GetAwaiter();
+}
@@ -0,0 +1,130 @@
+using System;
+using System.Collections.Generic;
+using System.Runtime.ExceptionServices;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+
+namespace Procore.SDK.Core.Composite;
+
+/// <summary>
+/// Runs the independent sub-requests of a composite method concurrently, so that its latency is
+/// that of the slowest sub-request rather than the sum of all of them.
+/// </summary>
+/// <remarks>
+/// Each part starts as soon as it is added and receives a token shared by the whole query.
+/// A required part that fails cancels the remaining parts and its exception is rethrown by
+/// <see cref="WhenAllAsync"/>. An optional part that fails is logged and completes with the
+/// default value, leaving the other parts running. Parts are added from a single thread.
+/// </remarks>
+/// <example>
+/// <code>
+/// using var query = new CompositeQuery(logger, cancellationToken);
+/// var injuries = query.Add("injuries", ct => GetInjuriesAsync(ct), optional: true);
+/// var alerts = query.Add("alerts", ct => GetAlertsAsync(ct), optional: true);
+/// await query.WhenAllAsync();
+/// </code>
+/// </example>
+public sealed class CompositeQuery : IDisposable
+{
+    private readonly CancellationTokenSource _cancellation;
+    private readonly CancellationToken _callerToken;
+    private readonly ILogger? _logger;
+    private readonly List<Task> _parts = new();
+    private Exception? _firstFailure;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="CompositeQuery"/> class.
+    /// </summary>
+    /// <param name="logger">Optional logger for failures of optional parts.</param>
+    /// <param name="cancellationToken">Cancellation token for the whole query.</param>
+    public CompositeQuery(ILogger? logger = null, CancellationToken cancellationToken = default)
+    {
+        _logger = logger;
+        _callerToken = cancellationToken;
+        _cancellation = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+    }
+
+    /// <summary>
+    /// Starts a sub-request.
+    /// </summary>
+    /// <typeparam name="T">The result type.</typeparam>
+    /// <param name="name">The name of the part, used in log messages.</param>
+    /// <param name="query">The sub-request, given the query's shared cancellation token.</param>
+    /// <param name="optional">Whether a failure of the part leaves the rest of the query running.</param>
+    /// <returns>The part, which can be awaited for its result.</returns>
+    public CompositePart<T> Add<T>(string name, Func<CancellationToken, Task<T>> query, bool optional = false)
+    {
+        if (string.IsNullOrEmpty(name))
+            throw new ArgumentException("Value cannot be null or empty.", nameof(name));
+        if (query == null)
+            throw new ArgumentNullException(nameof(query));
+
+        var part = new CompositePart<T>(name, optional);
+        part.Task = RunAsync(part, query);
+        _parts.Add(part.Task);
+        return part;
+    }
+
+    /// <summary>
+    /// Waits for every part to complete.
+    /// </summary>
+    /// <exception cref="OperationCanceledException">Thrown when the caller's token was cancelled.</exception>
+    /// <remarks>Rethrows the first failure of a required part.</remarks>
+    public async Task WhenAllAsync()
+    {
+        try
+        {
+            await Task.WhenAll(_parts).ConfigureAwait(false);
+        }
+        catch when (_cancellation.IsCancellationRequested)
+        {
+            // Parts cancelled after a required failure, by the caller or by Cancel are reported below
+        }
+
+        if (_firstFailure != null)
+        {
+            ExceptionDispatchInfo.Capture(_firstFailure).Throw();
+        }
+
+        _callerToken.ThrowIfCancellationRequested();
+    }
+
+    /// <summary>
+    /// Cancels the parts that are still running, e.g. once an earlier result makes them unnecessary.
+    /// Their outcome is ignored by <see cref="WhenAllAsync"/>.
+    /// </summary>
+    public void Cancel() => _cancellation.Cancel();
+
+    /// <inheritdoc />
+    public void Dispose() => _cancellation.Dispose();
+
+    private async Task<T> RunAsync<T>(CompositePart<T> part, Func<CancellationToken, Task<T>> query)
+    {
+        try
+        {
+            return await query(_cancellation.Token).ConfigureAwait(false);
+        }
+        catch (OperationCanceledException) when (_cancellation.IsCancellationRequested)
+        {
+            throw;
+        }
+        catch (Exception) when (_cancellation.IsCancellationRequested)
+        {
+            // A part that fails once the query is already cancelled no longer matters
+            throw new OperationCanceledException(_cancellation.Token);
+        }
+        catch (Exception ex) when (part.IsOptional)
+        {
+            _logger?.LogWarning(ex, "Optional part {Part} of composite query failed; continuing with partial results", part.Name);
+            part.Exception = ex;
+            return default!;
+        }
+        catch (Exception ex)
+        {
+            Interlocked.CompareExchange(ref _firstFailure, ex, null);
+            _cancellation.Cancel();
+            throw;
+        }
+    }
+}
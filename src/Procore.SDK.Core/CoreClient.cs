@@ -1,16 +1,25 @@
 using System;
+using System.Buffers;
 using System.Collections.Generic;
+using System.Globalization;
+using System.IO;
 using System.Linq;
+using System.Net;
 using System.Net.Http;
-using System.Security.Cryptography;
+using System.Net.Http.Headers;
 using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using Microsoft.Kiota.Abstractions;
+using Procore.SDK.Shared.Http;
 using Procore.SDK.Core.ErrorHandling;
 using Procore.SDK.Core.Logging;
+using Procore.SDK.Shared.Diagnostics;
 using Procore.SDK.Core.Models;
+using Procore.SDK.Core.Search;
 using Procore.SDK.Core.TypeMapping;
+using FilesPostResponse = Procore.SDK.Core.Rest.V10.Companies.Item.Files.FilesPostResponse;
+using GeneratedUser = Procore.SDK.Core.Rest.V11.Companies.Item.Users.Users;
 
 namespace Procore.SDK.Core;
 
@@ -20,12 +29,37 @@ namespace Procore.SDK.Core;
 /// </summary>
 public class ProcoreCoreClient : ICoreClient
 {
+    private const int DownloadBufferSize = 81920;
+    private const string ResumeMarkerExtension = ".download";
+    private const string DocumentChangedErrorCode = "DOCUMENT_CHANGED";
+
+    /// <summary>
+    /// Name of the HTTP client used to fetch document content from storage URLs. It must not carry
+    /// Procore credentials or the API's caching and coalescing handlers.
+    /// </summary>
+    public const string ContentHttpClientName = "ProcoreContent";
+
+    // Used for content downloads when no HTTP client factory is supplied; pooled connections are
+    // recycled so that a long-lived client still picks up DNS changes
+    private static readonly HttpClient SharedContentHttpClient = new(new SocketsHttpHandler
+    {
+        PooledConnectionLifetime = TimeSpan.FromMinutes(5)
+    });
+
+    // Mappers are stateless and thread-safe, so every client instance shares one of each
+    private static readonly UserTypeMapper SharedUserTypeMapper = new();
+    private static readonly CompanyTypeMapper SharedCompanyTypeMapper = new();
+    private static readonly DocumentTypeMapper SharedDocumentTypeMapper = new();
+
     private readonly Procore.SDK.Core.CoreClient _generatedClient;
+    private readonly IRequestAdapter _requestAdapter;
     private readonly ILogger<ProcoreCoreClient>? _logger;
     private readonly StructuredLogger? _structuredLogger;
     private readonly UserTypeMapper _userTypeMapper;
     private readonly CompanyTypeMapper _companyTypeMapper;
     private readonly DocumentTypeMapper _documentTypeMapper;
+    private readonly CoreLookupIndexes _lookupIndexes;
+    private readonly IHttpClientFactory? _httpClientFactory;
     private bool _disposed;
 
     /// <summary>
@@ -39,17 +73,24 @@ public class ProcoreCoreClient : ICoreClient
     /// <param name="requestAdapter">The request adapter to use for HTTP communication.</param>
     /// <param name="logger">Optional logger for diagnostic information.</param>
     /// <param name="structuredLogger">Optional structured logger for correlation tracking.</param>
+    /// <param name="lookupIndexes">Optional shared lookup indexes; a private set is used when omitted.</param>
+    /// <param name="httpClientFactory">Optional factory for the <see cref="ContentHttpClientName"/> client used for document downloads.</param>
     public ProcoreCoreClient(
         IRequestAdapter requestAdapter, 
         ILogger<ProcoreCoreClient>? logger = null,
-        StructuredLogger? structuredLogger = null)
+        StructuredLogger? structuredLogger = null,
+        CoreLookupIndexes? lookupIndexes = null,
+        IHttpClientFactory? httpClientFactory = null)
     {
         _generatedClient = new Procore.SDK.Core.CoreClient(requestAdapter);
+        _requestAdapter = requestAdapter;
         _logger = logger;
         _structuredLogger = structuredLogger;
-        _userTypeMapper = new UserTypeMapper();
-        _companyTypeMapper = new CompanyTypeMapper();
-        _documentTypeMapper = new DocumentTypeMapper();
+        _userTypeMapper = SharedUserTypeMapper;
+        _companyTypeMapper = SharedCompanyTypeMapper;
+        _documentTypeMapper = SharedDocumentTypeMapper;
+        _lookupIndexes = lookupIndexes ?? new CoreLookupIndexes();
+        _httpClientFactory = httpClientFactory;
     }
 
     #region Private Helper Methods
@@ -63,33 +104,46 @@ public class ProcoreCoreClient : ICoreClient
         string? correlationId = null,
         CancellationToken cancellationToken = default)
     {
-        correlationId ??= Guid.NewGuid().ToString();
+        // Correlation IDs are only created when something will be logged or an error is raised
+        if (correlationId == null && (_structuredLogger?.IsEnabled(LogLevel.Information) == true || _logger?.IsEnabled(LogLevel.Debug) == true))
+        {
+            correlationId = Guid.NewGuid().ToString();
+        }
         
-        using var operationScope = _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var operationScope = correlationId == null ? null : _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var activity = ProcoreTelemetry.StartOperation(operationName);
+        var startTimestamp = System.Diagnostics.Stopwatch.GetTimestamp();
         
         try
         {
-            _logger?.LogDebug("Executing operation {Operation} with correlation ID {CorrelationId}", operationName, correlationId);
+            _logger?.ExecutingOperation(operationName, correlationId!);
             
-            return await operation().ConfigureAwait(false);
+            var result = await operation().ConfigureAwait(false);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, null);
+            return result;
         }
         catch (HttpRequestException ex)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var mappedException = ErrorMapper.MapHttpException(ex, correlationId);
             
             _structuredLogger?.LogError(mappedException, operationName, correlationId, 
                 "HTTP error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, mappedException);
             throw mappedException;
         }
-        catch (TaskCanceledException) when (cancellationToken.IsCancellationRequested)
+        catch (TaskCanceledException ex) when (cancellationToken.IsCancellationRequested)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             _structuredLogger?.LogWarning(operationName, correlationId,
                 "Operation {Operation} was cancelled", operationName);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, ex);
             throw;
         }
         catch (Exception ex)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var wrappedException = new ProcoreCoreException(
                 $"Unexpected error in {operationName}: {ex.Message}", 
                 "UNEXPECTED_ERROR", 
@@ -99,6 +153,7 @@ public class ProcoreCoreClient : ICoreClient
             _structuredLogger?.LogError(wrappedException, operationName, correlationId,
                 "Unexpected error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, wrappedException);
             throw wrappedException;
         }
     }
@@ -119,6 +174,212 @@ public class ProcoreCoreClient : ICoreClient
         }, operationName, correlationId, cancellationToken).ConfigureAwait(false);
     }
 
+    /// <summary>
+    /// Builds the plain form fields of a document upload.
+    /// </summary>
+    private static List<KeyValuePair<string, string>> BuildUploadFields(UploadDocumentRequest request)
+    {
+        var fields = new List<KeyValuePair<string, string>>
+        {
+            new("file[name]", request.Name)
+        };
+        
+        if (!string.IsNullOrEmpty(request.Description))
+        {
+            fields.Add(new("file[description]", request.Description));
+        }
+        
+        if (request.ParentId.HasValue)
+        {
+            fields.Add(new("file[parent_id]", request.ParentId.Value.ToString(CultureInfo.InvariantCulture)));
+        }
+        
+        if (request.IsPrivate)
+        {
+            fields.Add(new("file[explicit_permissions]", "true"));
+        }
+        
+        if (request.CustomFields != null)
+        {
+            foreach (var customField in request.CustomFields)
+            {
+                fields.Add(new($"file[{customField.Key}]", Convert.ToString(customField.Value, CultureInfo.InvariantCulture) ?? string.Empty));
+            }
+        }
+        
+        return fields;
+    }
+
+    /// <summary>
+    /// Maps the response of a document upload to the domain model.
+    /// </summary>
+    private static Document MapUploadedDocument(FilesPostResponse response, UploadDocumentRequest request)
+    {
+        return new Document
+        {
+            Id = response.Id ?? 0,
+            Name = response.Name ?? request.Name,
+            Description = response.Description ?? request.Description,
+            FileName = string.IsNullOrEmpty(request.FileName) ? response.Name ?? request.Name : request.FileName,
+            ContentType = response.FileType ?? request.ContentType,
+            FileSize = response.Size ?? 0,
+            IsPrivate = response.Private ?? request.IsPrivate,
+            CreatedAt = response.CreatedAt?.DateTime ?? DateTime.MinValue,
+            UpdatedAt = response.UpdatedAt?.DateTime ?? DateTime.MinValue
+        };
+    }
+
+    /// <summary>
+    /// Resolves the content URL, number and size of a document's latest downloadable version.
+    /// </summary>
+    private async Task<(Uri Url, int Number, long? Size)> GetLatestVersionAsync(int companyId, int documentId, CancellationToken cancellationToken)
+    {
+        var fileResponse = await _generatedClient.Rest.V10.Companies[companyId].Files[documentId].GetAsync(
+            cancellationToken: cancellationToken).ConfigureAwait(false);
+        
+        var latestVersion = fileResponse?.FileVersions?
+            .Where(version => !string.IsNullOrEmpty(version.Url ?? version.ProstoreFile?.Url))
+            .OrderByDescending(version => version.Number ?? 0)
+            .FirstOrDefault();
+        
+        if (latestVersion == null)
+        {
+            throw new ProcoreCoreException($"Document {documentId} in company {companyId} has no downloadable version", "DOCUMENT_CONTENT_NOT_FOUND");
+        }
+        
+        var contentUrl = new Uri(latestVersion.Url ?? latestVersion.ProstoreFile!.Url!);
+        return (contentUrl, latestVersion.Number ?? 0, latestVersion.Size ?? fileResponse!.Size);
+    }
+
+    /// <summary>
+    /// Copies file content to a destination one ranged GET at a time through a pooled buffer.
+    /// Once the server supplies a strong ETag, later chunks are sent with <c>If-Range</c> so content
+    /// that changes mid-download fails with <c>DOCUMENT_CHANGED</c> instead of being spliced.
+    /// </summary>
+    private async Task<long> DownloadRangesAsync(
+        Uri contentUrl,
+        Stream destination,
+        DownloadDocumentOptions options,
+        long? totalBytes,
+        EntityTagHeaderValue? entityTag,
+        Action<EntityTagHeaderValue>? entityTagReceived,
+        CancellationToken cancellationToken)
+    {
+        var position = options.Offset;
+        var buffer = ArrayPool<byte>.Shared.Rent(DownloadBufferSize);
+        
+        try
+        {
+            while (totalBytes == null || position < totalBytes)
+            {
+                using var response = await SendRangeRequestAsync(contentUrl, position, position + options.ChunkSize - 1, entityTag, cancellationToken).ConfigureAwait(false);
+                
+                if (response.StatusCode == HttpStatusCode.RequestedRangeNotSatisfiable)
+                {
+                    // The offset is already at the end of the content
+                    break;
+                }
+                
+                if (!response.IsSuccessStatusCode)
+                {
+                    throw new ProcoreCoreException($"Download of {contentUrl.AbsolutePath} failed with status {(int)response.StatusCode}", "DOCUMENT_DOWNLOAD_FAILED");
+                }
+                
+                if (response.StatusCode != HttpStatusCode.PartialContent && entityTag != null && position > 0)
+                {
+                    // A full response to an If-Range request means the content no longer matches what was already written
+                    throw new ProcoreCoreException($"Content of {contentUrl.AbsolutePath} changed during the download", DocumentChangedErrorCode);
+                }
+                
+                if (entityTag == null && response.Headers.ETag is { IsWeak: false } receivedTag)
+                {
+                    entityTag = receivedTag;
+                    entityTagReceived?.Invoke(receivedTag);
+                }
+                
+                using var content = await response.Content.ReadAsStreamAsync(cancellationToken).ConfigureAwait(false);
+                
+                if (response.StatusCode != HttpStatusCode.PartialContent)
+                {
+                    // The server ignored the range and sent the whole content: skip what the destination already has
+                    totalBytes = response.Content.Headers.ContentLength ?? totalBytes;
+                    await SkipAsync(content, position, buffer, cancellationToken).ConfigureAwait(false);
+                    position += await CopyAsync(content, destination, buffer, position, totalBytes, options.Progress, cancellationToken).ConfigureAwait(false);
+                    break;
+                }
+                
+                totalBytes = response.Content.Headers.ContentRange?.Length ?? totalBytes;
+                var copied = await CopyAsync(content, destination, buffer, position, totalBytes, options.Progress, cancellationToken).ConfigureAwait(false);
+                if (copied == 0)
+                {
+                    break;
+                }
+                
+                position += copied;
+            }
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+        
+        await destination.FlushAsync(cancellationToken).ConfigureAwait(false);
+        return position;
+    }
+
+    /// <summary>
+    /// Sends a ranged GET for file content and returns the unbuffered response.
+    /// </summary>
+    private async Task<HttpResponseMessage> SendRangeRequestAsync(Uri contentUrl, long from, long to, EntityTagHeaderValue? entityTag, CancellationToken cancellationToken)
+    {
+        // Content URLs are presigned storage URLs on another host, so they bypass the request adapter:
+        // its client would attach the Procore bearer token and run the API's caching handlers
+        using var request = new HttpRequestMessage(HttpMethod.Get, contentUrl);
+        request.Headers.Range = new RangeHeaderValue(from, to);
+        if (entityTag != null)
+        {
+            request.Headers.IfRange = new RangeConditionHeaderValue(entityTag);
+        }
+        
+        var httpClient = _httpClientFactory?.CreateClient(ContentHttpClientName) ?? SharedContentHttpClient;
+        return await httpClient.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken).ConfigureAwait(false);
+    }
+
+    private static async Task<long> CopyAsync(
+        Stream source,
+        Stream destination,
+        byte[] buffer,
+        long startPosition,
+        long? totalBytes,
+        IProgress<TransferProgress>? progress,
+        CancellationToken cancellationToken)
+    {
+        long copied = 0;
+        int read;
+        while ((read = await source.ReadAsync(buffer.AsMemory(), cancellationToken).ConfigureAwait(false)) > 0)
+        {
+            await destination.WriteAsync(buffer.AsMemory(0, read), cancellationToken).ConfigureAwait(false);
+            copied += read;
+            progress?.Report(new TransferProgress(startPosition + copied, totalBytes));
+        }
+        
+        return copied;
+    }
+
+    private static async Task SkipAsync(Stream source, long count, byte[] buffer, CancellationToken cancellationToken)
+    {
+        while (count > 0)
+        {
+            var read = await source.ReadAsync(buffer.AsMemory(0, (int)Math.Min(buffer.Length, count)), cancellationToken).ConfigureAwait(false);
+            if (read == 0)
+            {
+                break;
+            }
+            
+            count -= read;
+        }
+    }
+
     #endregion
 
     #region Company Operations
@@ -133,19 +394,19 @@ public class ProcoreCoreClient : ICoreClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting companies using generated Kiota client with type mapping");
+            _logger?.GettingCompanies();
             
             // Use the actual generated Kiota client for the List Companies endpoint
             var companiesResponse = await _generatedClient.Rest.V10.Companies.GetAsync(cancellationToken: cancellationToken).ConfigureAwait(false);
             
             if (companiesResponse == null || !companiesResponse.Any())
             {
-                _logger?.LogWarning("No companies returned from API");
+                _logger?.NoCompaniesReturned();
                 return Enumerable.Empty<Company>();
             }
             
             // Map from generated response models to our domain models using type mapper
-            return companiesResponse.Select(companyResponse => _companyTypeMapper.MapToWrapper(companyResponse));
+            return _companyTypeMapper.MapToWrapperMany(companiesResponse);
         }, "GetCompaniesAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
@@ -159,7 +420,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting company {CompanyId}", companyId);
+            _logger?.GettingCompany(companyId);
             
             // Note: The generated Kiota client doesn't expose a direct "get company" endpoint.
             // This is due to the Procore API design where most operations are scoped within
@@ -197,7 +458,7 @@ public class ProcoreCoreClient : ICoreClient
         
         try
         {
-            _logger?.LogDebug("Creating company {CompanyName}", request.Name);
+            _logger?.CreatingCompany(request.Name);
             
             // Note: The generated Kiota client doesn't expose a "create company" endpoint.
             // Company creation is typically handled through:
@@ -210,14 +471,14 @@ public class ProcoreCoreClient : ICoreClient
             // 2. Custom integration with Procore's provisioning systems
             // 3. Manual company setup processes
             
-            _logger?.LogWarning("CreateCompanyAsync: Company creation not available in generated client. This operation typically requires administrative access.");
+            _logger?.CompanyCreationUnavailable();
             
             // Return a failed task since no async work is performed
             return Task.FromException<Company>(new NotSupportedException("Company creation is not supported through the standard API. Contact Procore support for company provisioning."));
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to create company {CompanyName}", request.Name);
+            _logger?.FailedToCreateCompany(ex, request.Name);
             return Task.FromException<Company>(ErrorMapper.MapHttpException(ex));
         }
     }
@@ -235,7 +496,7 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating company {CompanyId} using generated Kiota client", companyId);
+            _logger?.UpdatingCompany(companyId);
             
             // Note: The generated Kiota client doesn't expose a "update company" endpoint.
             // Company updates are typically handled through:
@@ -252,14 +513,14 @@ public class ProcoreCoreClient : ICoreClient
             return new Company 
             { 
                 Id = companyId, 
-                Name = request.Name ?? existingCompany.Name,
-                Description = request.Description ?? existingCompany.Description,
+                Name = request.IsSet(nameof(request.Name)) ? request.Name! : existingCompany.Name,
+                Description = request.IsCleared(nameof(request.Description)) ? null : request.Description ?? existingCompany.Description,
                 IsActive = request.IsActive ?? existingCompany.IsActive,
                 LogoUrl = existingCompany.LogoUrl,
                 CreatedAt = existingCompany.CreatedAt,
                 UpdatedAt = DateTime.UtcNow,
-                Address = existingCompany.Address,
-                CustomFields = existingCompany.CustomFields
+                Address = request.IsCleared(nameof(request.Address)) ? null : request.Address ?? existingCompany.Address,
+                CustomFields = request.CustomFields ?? existingCompany.CustomFields
             };
         }, "UpdateCompanyAsync", null, cancellationToken).ConfigureAwait(false);
     }
@@ -273,7 +534,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Deleting company {CompanyId} using generated Kiota client", companyId);
+            _logger?.DeletingCompany(companyId);
             
             // Note: The generated Kiota client doesn't expose a "delete company" endpoint.
             // Company deletion is typically handled through:
@@ -286,7 +547,7 @@ public class ProcoreCoreClient : ICoreClient
             // 2. Custom integration with Procore's account management systems
             // 3. Account deactivation workflows
             
-            _logger?.LogWarning("DeleteCompanyAsync: Company deletion not available in generated client. This operation typically requires administrative access.");
+            _logger?.CompanyDeletionUnavailable();
             
             // Throw immediately since no async work is performed
             throw new NotSupportedException("Company deletion is not supported through the standard API. Contact Procore support for account management.");
@@ -307,7 +568,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting users for company {CompanyId} using V1.1 generated Kiota client", companyId);
+            _logger?.GettingUsersForCompany(companyId);
             
             // Use the V1.1 generated Kiota client to list all active users for a company
             var usersResponse = await _generatedClient.Rest.V11.Companies[companyId].Users.GetAsync(
@@ -315,27 +576,34 @@ public class ProcoreCoreClient : ICoreClient
             
             if (usersResponse == null || !usersResponse.Any())
             {
-                _logger?.LogWarning("No users returned from V1.1 Users endpoint for company {CompanyId}", companyId);
+                _logger?.NoUsersReturned(companyId);
                 return Enumerable.Empty<User>();
             }
             
-            // Map from V1.1 generated response models to our domain models using the UserTypeMapper
-            // Note: V1.1 Users response doesn't match V1.3 Users structure exactly, so we need custom mapping here
-            return usersResponse.Select(userResponse => new User
-            {
-                Id = userResponse.Id ?? 0,
-                Email = userResponse.EmailAddress ?? string.Empty,
-                FirstName = userResponse.FirstName ?? string.Empty,
-                LastName = userResponse.LastName ?? string.Empty,
-                JobTitle = userResponse.JobTitle,
-                PhoneNumber = userResponse.BusinessPhone ?? userResponse.MobilePhone,
-                IsActive = userResponse.IsActive ?? true,
-                CreatedAt = userResponse.CreatedAt?.DateTime ?? DateTime.MinValue,
-                UpdatedAt = userResponse.UpdatedAt?.DateTime ?? DateTime.MinValue
-            });
+            return usersResponse.Select(MapListedUser);
         }, "GetUsersAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
+    /// <summary>
+    /// Maps a user from the V1.1 users list to the domain model.
+    /// The V1.1 Users response doesn't match the V1.3 Users structure the UserTypeMapper handles.
+    /// </summary>
+    private static User MapListedUser(GeneratedUser userResponse)
+    {
+        return new User
+        {
+            Id = userResponse.Id ?? 0,
+            Email = userResponse.EmailAddress ?? string.Empty,
+            FirstName = userResponse.FirstName ?? string.Empty,
+            LastName = userResponse.LastName ?? string.Empty,
+            JobTitle = userResponse.JobTitle,
+            PhoneNumber = userResponse.BusinessPhone ?? userResponse.MobilePhone,
+            IsActive = userResponse.IsActive ?? true,
+            CreatedAt = userResponse.CreatedAt?.DateTime ?? DateTime.MinValue,
+            UpdatedAt = userResponse.UpdatedAt?.DateTime ?? DateTime.MinValue
+        };
+    }
+
     /// <summary>
     /// Gets a specific user by ID.
     /// </summary>
@@ -347,7 +615,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting user {UserId} for company {CompanyId}", userId, companyId);
+            _logger?.GettingUser(userId, companyId);
             
             // Use the actual generated Kiota client
             var userResponse = await _generatedClient.Rest.V10.Users[userId].GetAsync(
@@ -391,7 +659,7 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Creating user {Email} for company {CompanyId} using V1.1 generated Kiota client", request.Email, companyId);
+            _logger?.CreatingUser(request.Email, companyId);
             
             // Create the request body for V1.1 Users endpoint
             var requestBody = new global::Procore.SDK.Core.Rest.V11.Companies.Item.Users.UsersPostRequestBody
@@ -444,23 +712,34 @@ public class ProcoreCoreClient : ICoreClient
     public async Task<User> UpdateUserAsync(int companyId, int userId, UpdateUserRequest request, CancellationToken cancellationToken = default)
     {
         if (request == null) throw new ArgumentNullException(nameof(request));
+        if (request.IsSet(nameof(request.CustomFields)))
+        {
+            throw new ArgumentException("Custom fields cannot be updated through the Users PATCH endpoint.", nameof(request));
+        }
+        
+        if (!request.HasChanges)
+        {
+            // Nothing was assigned, so there is nothing to send
+            return await GetUserAsync(companyId, userId, cancellationToken).ConfigureAwait(false);
+        }
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating user {UserId} for company {CompanyId} using V1.1 generated Kiota client", userId, companyId);
+            _logger?.UpdatingUser(userId, companyId);
+            
+            // Create the request body for V1.1 Users PATCH endpoint.
+            // Only the properties assigned on the request are sent; cleared properties are sent as null.
+            var user = new global::Procore.SDK.Core.Rest.V11.Companies.Item.Users.Item.UsersPatchRequestBody_user();
+            request.CopyIfSet(nameof(request.Email), request.Email, value => user.EmailAddress = value, user.AdditionalData, "email_address");
+            request.CopyIfSet(nameof(request.FirstName), request.FirstName, value => user.FirstName = value, user.AdditionalData, "first_name");
+            request.CopyIfSet(nameof(request.LastName), request.LastName, value => user.LastName = value, user.AdditionalData, "last_name");
+            request.CopyIfSet(nameof(request.JobTitle), request.JobTitle, value => user.JobTitle = value, user.AdditionalData, "job_title");
+            request.CopyIfSet(nameof(request.PhoneNumber), request.PhoneNumber, value => user.BusinessPhone = value, user.AdditionalData, "business_phone");
+            request.CopyIfSet(nameof(request.IsActive), request.IsActive, value => user.IsActive = value, user.AdditionalData, "is_active");
             
-            // Create the request body for V1.1 Users PATCH endpoint
             var requestBody = new global::Procore.SDK.Core.Rest.V11.Companies.Item.Users.Item.UsersPatchRequestBody
             {
-                User = new global::Procore.SDK.Core.Rest.V11.Companies.Item.Users.Item.UsersPatchRequestBody_user
-                {
-                    EmailAddress = request.Email,
-                    FirstName = request.FirstName,
-                    LastName = request.LastName,
-                    JobTitle = request.JobTitle,
-                    BusinessPhone = request.PhoneNumber,
-                    IsActive = request.IsActive
-                }
+                User = user
             };
             
             // Use the V1.1 generated Kiota client to update the user
@@ -499,7 +778,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Deactivating user {UserId} for company {CompanyId} using V1.1 generated Kiota client", userId, companyId);
+            _logger?.DeactivatingUser(userId, companyId);
             
             // Create the request body for V1.1 Users PATCH endpoint to deactivate user
             var requestBody = new global::Procore.SDK.Core.Rest.V11.Companies.Item.Users.Item.UsersPatchRequestBody
@@ -519,7 +798,7 @@ public class ProcoreCoreClient : ICoreClient
                 throw new ProcoreCoreException($"Failed to deactivate user {userId} in company {companyId}", "USER_DEACTIVATION_FAILED");
             }
             
-            _logger?.LogDebug("Successfully deactivated user {UserId} for company {CompanyId}", userId, companyId);
+            _logger?.DeactivatedUser(userId, companyId);
         }, "DeactivateUserAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
@@ -537,7 +816,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting documents for company {CompanyId} using generated Kiota client with type mapping", companyId);
+            _logger?.GettingDocumentsForCompany(companyId);
             
             // Use the generated Kiota client to get folders and files
             var foldersResponse = await _generatedClient.Rest.V10.Companies[companyId].Folders.GetAsync(
@@ -546,7 +825,7 @@ public class ProcoreCoreClient : ICoreClient
             
             if (foldersResponse?.Files == null || !foldersResponse.Files.Any())
             {
-                _logger?.LogWarning("No files returned from Folders endpoint for company {CompanyId}", companyId);
+                _logger?.NoFilesReturned(companyId);
                 return Enumerable.Empty<Document>();
             }
             
@@ -580,7 +859,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting document {DocumentId} for company {CompanyId} using generated Kiota client with type mapping", documentId, companyId);
+            _logger?.GettingDocument(documentId, companyId);
             
             // Use the generated Kiota client to get specific file
             var fileResponse = await _generatedClient.Rest.V10.Companies[companyId].Files[documentId].GetAsync(
@@ -597,7 +876,8 @@ public class ProcoreCoreClient : ICoreClient
     }
 
     /// <summary>
-    /// Uploads a new document.
+    /// Uploads a new document. The file stream is sent as multipart/form-data content while it is read,
+    /// so memory use does not grow with the file size.
     /// </summary>
     /// <param name="companyId">The company ID.</param>
     /// <param name="request">The document upload request.</param>
@@ -606,41 +886,169 @@ public class ProcoreCoreClient : ICoreClient
     public async Task<Document> UploadDocumentAsync(int companyId, UploadDocumentRequest request, CancellationToken cancellationToken = default)
     {
         if (request == null) throw new ArgumentNullException(nameof(request));
+        if (request.FileStream == null) throw new ArgumentException("A file stream is required", nameof(request));
+        
+        return await ExecuteWithResilienceAsync(async () =>
+        {
+            _logger?.UploadingDocument(request.Name, companyId);
+            
+            // The generated Files builder serializes its body as a parsable model, which cannot carry
+            // file content, so the multipart body is streamed through the request adapter directly
+            using var body = new MultipartFormDataStream(
+                BuildUploadFields(request),
+                "file[data]",
+                string.IsNullOrEmpty(request.FileName) ? request.Name : request.FileName,
+                request.ContentType,
+                request.FileStream,
+                request.Progress);
+            
+            var requestInfo = new RequestInformation(
+                Method.POST,
+                "{+baseurl}/rest/v1.0/companies/{company_id}/files",
+                new Dictionary<string, object> { { "company_id", companyId } });
+            requestInfo.Headers.TryAdd("Accept", "application/json");
+            requestInfo.Headers.TryAdd("Content-Type", body.ContentType);
+            requestInfo.Content = body;
+            
+            var fileResponse = await _requestAdapter.SendAsync(
+                requestInfo,
+                FilesPostResponse.CreateFromDiscriminatorValue,
+                cancellationToken: cancellationToken).ConfigureAwait(false);
+            
+            if (fileResponse == null)
+            {
+                throw new ProcoreCoreException($"Upload of document {request.Name} to company {companyId} returned no file", "DOCUMENT_UPLOAD_FAILED");
+            }
+            
+            _lookupIndexes.InvalidateDocuments(companyId);
+            return MapUploadedDocument(fileResponse, request);
+        }, "UploadDocumentAsync", null, cancellationToken).ConfigureAwait(false);
+    }
+
+    /// <summary>
+    /// Streams the content of a document's latest version to a destination stream in ranged chunks.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="documentId">The document ID.</param>
+    /// <param name="destination">The stream to write the content to.</param>
+    /// <param name="options">Optional chunking, resume and progress options.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>The total number of content bytes, including any resumed offset.</returns>
+    public async Task<long> DownloadDocumentAsync(int companyId, int documentId, Stream destination, DownloadDocumentOptions? options = null, CancellationToken cancellationToken = default)
+    {
+        if (destination == null) throw new ArgumentNullException(nameof(destination));
+        if (!destination.CanWrite) throw new ArgumentException("Destination stream must be writable", nameof(destination));
+        options ??= new DownloadDocumentOptions();
+        if (options.ChunkSize <= 0) throw new ArgumentOutOfRangeException(nameof(options), "Chunk size must be greater than zero");
+        if (options.Offset < 0) throw new ArgumentOutOfRangeException(nameof(options), "Offset cannot be negative");
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Uploading document {DocumentName} for company {CompanyId} using generated Kiota client", request.Name, companyId);
+            _logger?.DownloadingDocument(documentId, companyId, options.Offset);
             
-            // Note: File upload implementation requires proper multipart/form-data handling
-            // The generated client structure for file uploads is complex and requires specific setup
-            // For demonstration, we'll simulate the upload and return a mock document
-            // In production, this would need:
-            // 1. Proper multipart request body construction
-            // 2. Stream handling for file content
-            // 3. Content-Type and metadata mapping
+            var (contentUrl, _, size) = await GetLatestVersionAsync(companyId, documentId, cancellationToken).ConfigureAwait(false);
+            return await DownloadRangesAsync(contentUrl, destination, options, size, null, null, cancellationToken).ConfigureAwait(false);
+        }, "DownloadDocumentAsync", null, cancellationToken).ConfigureAwait(false);
+    }
+
+    /// <summary>
+    /// Streams the content of a document's latest version to a file, resuming a partial file if one exists.
+    /// </summary>
+    /// <remarks>
+    /// While a download is in progress, the version number, size and ETag of the content are kept in a
+    /// <c>.download</c> file next to <paramref name="filePath"/>. An existing file is resumed only when that
+    /// record matches the latest version and the file is shorter than its size; otherwise it is truncated and
+    /// downloaded again. Resumed requests carry <c>If-Range</c>, so content replaced on the server also restarts
+    /// the download.
+    /// </remarks>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="documentId">The document ID.</param>
+    /// <param name="filePath">The path of the file to write.</param>
+    /// <param name="options">Optional chunking and progress options.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>The total number of content bytes in the file.</returns>
+    public async Task<long> DownloadDocumentToFileAsync(int companyId, int documentId, string filePath, DownloadDocumentOptions? options = null, CancellationToken cancellationToken = default)
+    {
+        if (string.IsNullOrWhiteSpace(filePath)) throw new ArgumentException("File path is required", nameof(filePath));
+        var chunkSize = options?.ChunkSize ?? new DownloadDocumentOptions().ChunkSize;
+        if (chunkSize <= 0) throw new ArgumentOutOfRangeException(nameof(options), "Chunk size must be greater than zero");
+        
+        var markerPath = filePath + ResumeMarkerExtension;
+        
+        return await ExecuteWithResilienceAsync(async () =>
+        {
+            var (contentUrl, number, size) = await GetLatestVersionAsync(companyId, documentId, cancellationToken).ConfigureAwait(false);
             
-            _logger?.LogWarning("UploadDocumentAsync: File upload requires additional multipart implementation. Returning simulated response.");
+            await using var file = new FileStream(filePath, FileMode.OpenOrCreate, FileAccess.Write, FileShare.None, DownloadBufferSize, useAsync: true);
             
-            // Generate a secure random ID for simulation
-            using var rng = RandomNumberGenerator.Create();
-            byte[] randomBytes = new byte[4];
-            rng.GetBytes(randomBytes);
-            int randomId = 1000 + (Math.Abs(BitConverter.ToInt32(randomBytes, 0)) % 8999);
+            var marker = ReadResumeMarker(markerPath);
+            var resumable = marker is { } m && m.Number == number && m.Size == size && size is { } expected && file.Length < expected;
+            var entityTag = resumable ? marker!.Value.EntityTag : null;
+            var offset = resumable ? file.Length : 0;
             
-            return new Document
+            if (!resumable)
             {
-                Id = randomId, // Simulated ID using cryptographically secure random
-                Name = request.Name,
-                Description = request.Description,
-                FileName = request.FileName,
-                ContentType = request.ContentType,
-                FileSize = request.FileStream?.Length ?? 0,
-                IsPrivate = request.IsPrivate,
-                CreatedAt = DateTime.UtcNow,
-                UpdatedAt = DateTime.UtcNow,
-                FileUrl = new Uri($"https://api.procore.com/files/simulated/{request.Name}")
-            };
-        }, "UploadDocumentAsync", null, cancellationToken).ConfigureAwait(false);
+                // The file is stale, from another version, or has no record of what it holds: start over
+                file.SetLength(0);
+            }
+            
+            WriteResumeMarker(markerPath, number, size, entityTag);
+            _logger?.DownloadingDocument(documentId, companyId, offset);
+            
+            void OnEntityTag(EntityTagHeaderValue tag) => WriteResumeMarker(markerPath, number, size, tag);
+            
+            long total;
+            try
+            {
+                file.Seek(offset, SeekOrigin.Begin);
+                total = await DownloadRangesAsync(contentUrl, file, CreateFileDownloadOptions(offset), size, entityTag, OnEntityTag, cancellationToken).ConfigureAwait(false);
+            }
+            catch (ProcoreCoreException ex) when (ex.ErrorCode == DocumentChangedErrorCode && offset > 0)
+            {
+                file.SetLength(0);
+                file.Seek(0, SeekOrigin.Begin);
+                WriteResumeMarker(markerPath, number, size, null);
+                total = await DownloadRangesAsync(contentUrl, file, CreateFileDownloadOptions(0), size, null, OnEntityTag, cancellationToken).ConfigureAwait(false);
+            }
+            
+            File.Delete(markerPath);
+            return total;
+        }, "DownloadDocumentToFileAsync", null, cancellationToken).ConfigureAwait(false);
+        
+        DownloadDocumentOptions CreateFileDownloadOptions(long offset) => new()
+        {
+            ChunkSize = chunkSize,
+            Progress = options?.Progress,
+            Offset = offset
+        };
+    }
+
+    private static (int Number, long? Size, EntityTagHeaderValue? EntityTag)? ReadResumeMarker(string markerPath)
+    {
+        if (!File.Exists(markerPath))
+        {
+            return null;
+        }
+        
+        var lines = File.ReadAllLines(markerPath);
+        if (lines.Length < 2 || !int.TryParse(lines[0], NumberStyles.Integer, CultureInfo.InvariantCulture, out var number))
+        {
+            return null;
+        }
+        
+        long? size = long.TryParse(lines[1], NumberStyles.Integer, CultureInfo.InvariantCulture, out var parsedSize) ? parsedSize : null;
+        var entityTag = lines.Length > 2 && EntityTagHeaderValue.TryParse(lines[2], out var parsedTag) ? parsedTag : null;
+        return (number, size, entityTag);
+    }
+
+    private static void WriteResumeMarker(string markerPath, int number, long? size, EntityTagHeaderValue? entityTag)
+    {
+        File.WriteAllLines(markerPath, new[]
+        {
+            number.ToString(CultureInfo.InvariantCulture),
+            size?.ToString(CultureInfo.InvariantCulture) ?? string.Empty,
+            entityTag?.ToString() ?? string.Empty
+        });
     }
 
     /// <summary>
@@ -657,7 +1065,7 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating document {DocumentId} for company {CompanyId} using generated Kiota client", documentId, companyId);
+            _logger?.UpdatingDocument(documentId, companyId);
             
             // Note: The generated Kiota client doesn't expose a direct "update file" endpoint for metadata.
             // File updates in Procore typically involve:
@@ -674,13 +1082,14 @@ public class ProcoreCoreClient : ICoreClient
             return new Document 
             { 
                 Id = documentId,
-                Name = request.Name ?? existingDocument.Name,
-                Description = request.Description ?? existingDocument.Description,
+                Name = request.IsSet(nameof(request.Name)) ? request.Name! : existingDocument.Name,
+                Description = request.IsCleared(nameof(request.Description)) ? null : request.Description ?? existingDocument.Description,
                 FileName = existingDocument.FileName,
                 FileUrl = existingDocument.FileUrl,
                 ContentType = existingDocument.ContentType,
                 FileSize = existingDocument.FileSize,
                 IsPrivate = request.IsPrivate ?? existingDocument.IsPrivate,
+                CustomFields = request.CustomFields ?? existingDocument.CustomFields,
                 CreatedAt = existingDocument.CreatedAt,
                 UpdatedAt = DateTime.UtcNow
             };
@@ -697,12 +1106,13 @@ public class ProcoreCoreClient : ICoreClient
     {
         await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Deleting document {DocumentId} for company {CompanyId} using generated Kiota client", documentId, companyId);
+            _logger?.DeletingDocument(documentId, companyId);
             
             // Use the generated Kiota client to delete the file
             await _generatedClient.Rest.V10.Companies[companyId].Files[documentId].DeleteAsync(cancellationToken: cancellationToken).ConfigureAwait(false);
+            _lookupIndexes.InvalidateDocuments(companyId);
             
-            _logger?.LogDebug("Successfully deleted document {DocumentId} for company {CompanyId}", documentId, companyId);
+            _logger?.DeletedDocument(documentId, companyId);
         }, "DeleteDocumentAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
@@ -723,7 +1133,7 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting custom fields for company {CompanyId} and resource type {ResourceType} using V1.1 generated Kiota client", companyId, resourceType);
+            _logger?.GettingCustomFieldsForCompany(companyId, resourceType);
             
             // Use the V1.1 Custom_field_definitions endpoint to list all custom fields
             var customFieldsResponse = await _generatedClient.Rest.V11.Companies[companyId].Custom_field_definitions.GetAsync(
@@ -731,7 +1141,7 @@ public class ProcoreCoreClient : ICoreClient
             
             if (customFieldsResponse == null || !customFieldsResponse.Any())
             {
-                _logger?.LogWarning("No custom field definitions returned from V1.1 endpoint for company {CompanyId}", companyId);
+                _logger?.NoCustomFieldDefinitionsReturned(companyId);
                 return Enumerable.Empty<CustomField>();
             }
             
@@ -762,7 +1172,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting custom field {FieldId} for company {CompanyId} using V1.1 generated Kiota client", fieldId, companyId);
+            _logger?.GettingCustomField(fieldId, companyId);
             
             // Get all custom field definitions and filter by ID
             var customFieldsResponse = await _generatedClient.Rest.V11.Companies[companyId].Custom_field_definitions.GetAsync(
@@ -809,7 +1219,7 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Creating custom field {FieldName} for company {CompanyId} using Workforce Planning V2 generated Kiota client", request.Name, companyId);
+            _logger?.CreatingCustomField(request.Name, companyId);
             
             // Create the request body for Workforce Planning V2 Custom Fields endpoint
             var requestBody = new global::Procore.SDK.Core.Rest.V10.WorkforcePlanning.V2.Companies.Item.CustomFields.CustomFieldsPostRequestBody
@@ -862,7 +1272,7 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating custom field {FieldId} for company {CompanyId} using generated Kiota client", fieldId, companyId);
+            _logger?.UpdatingCustomField(fieldId, companyId);
             
             // Note: The generated Kiota client doesn't expose a direct "update custom field" endpoint.
             // Custom field updates are typically handled through:
@@ -879,12 +1289,12 @@ public class ProcoreCoreClient : ICoreClient
             return new CustomField 
             { 
                 Id = fieldId,
-                Name = request.Name ?? existingField.Name,
+                Name = request.IsSet(nameof(request.Name)) ? request.Name! : existingField.Name,
                 FieldType = existingField.FieldType,
                 ResourceType = existingField.ResourceType,
                 IsRequired = request.IsRequired ?? existingField.IsRequired,
-                DefaultValue = request.DefaultValue ?? existingField.DefaultValue,
-                AllowedValues = request.AllowedValues ?? existingField.AllowedValues,
+                DefaultValue = request.IsCleared(nameof(request.DefaultValue)) ? null : request.DefaultValue ?? existingField.DefaultValue,
+                AllowedValues = request.IsCleared(nameof(request.AllowedValues)) ? null : request.AllowedValues ?? existingField.AllowedValues,
                 CreatedAt = existingField.CreatedAt,
                 UpdatedAt = DateTime.UtcNow
             };
@@ -901,7 +1311,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Deleting custom field {FieldId} for company {CompanyId} using generated Kiota client", fieldId, companyId);
+            _logger?.DeletingCustomField(fieldId, companyId);
             
             // Note: The generated Kiota client doesn't expose a direct "delete custom field" endpoint.
             // Custom field deletion is typically handled through:
@@ -914,7 +1324,7 @@ public class ProcoreCoreClient : ICoreClient
             // 2. Custom integration with Procore's field management systems
             // 3. Manual field management processes
             
-            _logger?.LogWarning("DeleteCustomFieldAsync: Custom field deletion not available in generated client. This operation typically requires administrative access.");
+            _logger?.CustomFieldDeletionUnavailable();
             
             // For demonstration, we'll simulate the operation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -936,7 +1346,7 @@ public class ProcoreCoreClient : ICoreClient
     {
         await ExecuteWithResilienceAsync(() => Task.Run(() =>
         {
-            _logger?.LogDebug("Getting current user using generated Kiota client");
+            _logger?.GettingCurrentUser();
             
             // Note: The Procore API doesn't have a direct "me" or "current user" endpoint.
             // To get the current user, you typically need:
@@ -946,8 +1356,7 @@ public class ProcoreCoreClient : ICoreClient
             // Since we don't have access to the JWT parsing logic here, we'll return
             // a meaningful error that guides the user to the proper approach.
             
-            _logger?.LogWarning("GetCurrentUserAsync: The Procore API requires explicit company and user IDs. " +
-                              "Extract these from your JWT token and use GetUserAsync(companyId, userId) instead.");
+            _logger?.CurrentUserRequiresExplicitIds();
             
             throw new ProcoreCoreException(
                 "GetCurrentUserAsync requires JWT token parsing to extract user/company IDs. " +
@@ -975,11 +1384,11 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting company by name {CompanyName} using generated Kiota client", companyName);
+            _logger?.GettingCompanyByName(companyName);
             
-            // Get all companies and filter by name since the API doesn't support direct name-based search
-            var companies = await GetCompaniesAsync(cancellationToken).ConfigureAwait(false);
-            var company = companies.FirstOrDefault(c => string.Equals(c.Name, companyName, StringComparison.OrdinalIgnoreCase));
+            // The companies endpoint has no name filter, so names are looked up in the shared company index
+            var index = await GetCompanyIndexAsync(cancellationToken).ConfigureAwait(false);
+            var company = index.Find(companyName).FirstOrDefault();
             
             if (company == null)
             {
@@ -990,6 +1399,31 @@ public class ProcoreCoreClient : ICoreClient
         }, "GetCompanyByNameAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
+    /// <summary>
+    /// Gets companies whose name starts with a prefix, for autocomplete.
+    /// </summary>
+    /// <param name="namePrefix">The name prefix, matched ignoring case.</param>
+    /// <param name="maxResults">The maximum number of companies to return.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>The matching companies ordered by name.</returns>
+    public async Task<IEnumerable<Company>> GetCompaniesByNamePrefixAsync(string namePrefix, int maxResults = 20, CancellationToken cancellationToken = default)
+    {
+        if (namePrefix == null) throw new ArgumentNullException(nameof(namePrefix));
+        if (maxResults <= 0) throw new ArgumentOutOfRangeException(nameof(maxResults), "Max results must be greater than zero");
+        
+        return await ExecuteWithResilienceAsync(async () =>
+        {
+            var index = await GetCompanyIndexAsync(cancellationToken).ConfigureAwait(false);
+            return (IEnumerable<Company>)index.FindByPrefix(namePrefix, maxResults);
+        }, "GetCompaniesByNamePrefixAsync", null, cancellationToken).ConfigureAwait(false);
+    }
+
+    private Task<LookupIndex<Company>> GetCompanyIndexAsync(CancellationToken cancellationToken)
+    {
+        // The shared load is not tied to any one caller's cancellation
+        return _lookupIndexes.GetCompaniesAsync(() => GetCompaniesAsync(CancellationToken.None), cancellationToken);
+    }
+
     /// <summary>
     /// Searches for users by a search term.
     /// </summary>
@@ -1003,22 +1437,20 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Searching users for company {CompanyId} with term {SearchTerm} using generated Kiota client", companyId, searchTerm);
-            
-            // Get all users and filter by search term since the API doesn't support direct search
-            // This is a client-side implementation for demonstration - in production, consider
-            // implementing server-side search if available or limiting the search scope
-            var users = await GetUsersAsync(companyId, cancellationToken).ConfigureAwait(false);
-            
-            var lowerSearchTerm = searchTerm.ToLowerInvariant();
-            var matchingUsers = users.Where(user =>
-                user.FirstName.ToLowerInvariant().Contains(lowerSearchTerm) ||
-                user.LastName.ToLowerInvariant().Contains(lowerSearchTerm) ||
-                user.Email.ToLowerInvariant().Contains(lowerSearchTerm) ||
-                (user.JobTitle?.ToLowerInvariant().Contains(lowerSearchTerm) ?? false)
-            );
-            
-            return matchingUsers;
+            _logger?.SearchingUsersForCompany(companyId, searchTerm);
+            
+            // filters[search] matches first name, last name, email address, keywords, job title
+            // and company name on the server, so only matching users are downloaded
+            var usersResponse = await _generatedClient.Rest.V11.Companies[companyId].Users.GetAsync(
+                requestConfiguration => requestConfiguration.QueryParameters.Filterssearch = searchTerm,
+                cancellationToken).ConfigureAwait(false);
+            
+            if (usersResponse == null || usersResponse.Count == 0)
+            {
+                return Enumerable.Empty<User>();
+            }
+            
+            return usersResponse.Select(MapListedUser);
         }, "SearchUsersAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
@@ -1035,17 +1467,16 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting documents of type {DocumentType} for company {CompanyId} using generated Kiota client", documentType, companyId);
-            
-            // Get all documents and filter by type since we need to check content type
-            var documents = await GetDocumentsAsync(companyId, cancellationToken).ConfigureAwait(false);
+            _logger?.GettingDocumentsOfType(documentType, companyId);
             
-            var matchingDocuments = documents.Where(document =>
-                string.Equals(document.ContentType, documentType, StringComparison.OrdinalIgnoreCase) ||
-                (document.FileName?.EndsWith($".{documentType}", StringComparison.OrdinalIgnoreCase) ?? false)
-            );
+            // The folders endpoint has no type filter, so documents are bucketed by content type
+            // and file extension in the company's shared document index
+            var index = await _lookupIndexes.GetDocumentsAsync(
+                companyId,
+                () => GetDocumentsAsync(companyId, CancellationToken.None),
+                cancellationToken).ConfigureAwait(false);
             
-            return matchingDocuments;
+            return (IEnumerable<Document>)index.Find(documentType);
         }, "GetDocumentsByTypeAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
@@ -1065,7 +1496,7 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting companies with pagination (page {Page}, per page {PerPage}) using generated Kiota client", options.Page, options.PerPage);
+            _logger?.GettingCompaniesPage(options.Page, options.PerPage);
             
             // Use the actual generated Kiota client for paginated Companies endpoint
             var companiesResponse = await _generatedClient.Rest.V10.Companies.GetAsync(
@@ -1080,7 +1511,7 @@ public class ProcoreCoreClient : ICoreClient
             var companies = companiesResponse ?? new List<global::Procore.SDK.Core.Rest.V10.Companies.Companies>();
             
             // Map from generated response models to our domain models using type mapper
-            var mappedCompanies = companies.Select(companyResponse => _companyTypeMapper.MapToWrapper(companyResponse)).ToList();
+            var mappedCompanies = _companyTypeMapper.MapToWrapperMany(companies);
             
             // Since the API doesn't return pagination metadata, we need to estimate it
             // If we get exactly PerPage items, there might be more pages
@@ -1118,7 +1549,7 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting users for company {CompanyId} with pagination (page {Page}, per page {PerPage}) using V1.1 generated Kiota client", companyId, options.Page, options.PerPage);
+            _logger?.GettingUsersPage(companyId, options.Page, options.PerPage);
             
             // Use the V1.1 generated Kiota client to list users with pagination
             var usersResponse = await _generatedClient.Rest.V11.Companies[companyId].Users.GetAsync(
@@ -1129,24 +1560,13 @@ public class ProcoreCoreClient : ICoreClient
                 },
                 cancellationToken).ConfigureAwait(false);
             
-            var allUsers = usersResponse ?? new List<global::Procore.SDK.Core.Rest.V11.Companies.Item.Users.Users>();
+            var allUsers = usersResponse ?? new List<GeneratedUser>();
             
             // Apply client-side pagination since API pagination support varies
             var pagedUsers = allUsers
                 .Skip((options.Page - 1) * options.PerPage)
                 .Take(options.PerPage)
-                .Select(userResponse => new User
-                {
-                    Id = userResponse.Id ?? 0,
-                    Email = userResponse.EmailAddress ?? string.Empty,
-                    FirstName = userResponse.FirstName ?? string.Empty,
-                    LastName = userResponse.LastName ?? string.Empty,
-                    JobTitle = userResponse.JobTitle,
-                    PhoneNumber = userResponse.BusinessPhone ?? userResponse.MobilePhone,
-                    IsActive = userResponse.IsActive ?? true,
-                    CreatedAt = userResponse.CreatedAt?.DateTime ?? DateTime.MinValue,
-                    UpdatedAt = userResponse.UpdatedAt?.DateTime ?? DateTime.MinValue
-                })
+                .Select(MapListedUser)
                 .ToList();
             
             var totalCount = allUsers.Count;
@@ -1180,7 +1600,7 @@ public class ProcoreCoreClient : ICoreClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting documents for company {CompanyId} with pagination (page {Page}, per page {PerPage}) using generated Kiota client", companyId, options.Page, options.PerPage);
+            _logger?.GettingDocumentsPage(companyId, options.Page, options.PerPage);
             
             // Use the generated Kiota client to get folders and files with pagination
             var foldersResponse = await _generatedClient.Rest.V10.Companies[companyId].Folders.GetAsync(
@@ -0,0 +1,130 @@
+using System;
+using Microsoft.Extensions.Logging;
+
+namespace Procore.SDK.Core;
+
+/// <summary>
+/// Source-generated log messages for <see cref="ProcoreCoreClient"/>.
+/// </summary>
+internal static partial class CoreClientLog
+{
+    [LoggerMessage(EventId = 2101, Level = LogLevel.Debug, Message = "Getting companies using generated Kiota client with type mapping")]
+    public static partial void GettingCompanies(this ILogger logger);
+
+    [LoggerMessage(EventId = 2102, Level = LogLevel.Warning, Message = "No companies returned from API")]
+    public static partial void NoCompaniesReturned(this ILogger logger);
+
+    [LoggerMessage(EventId = 2103, Level = LogLevel.Debug, Message = "Getting company {CompanyId}")]
+    public static partial void GettingCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2104, Level = LogLevel.Debug, Message = "Creating company {CompanyName}")]
+    public static partial void CreatingCompany(this ILogger logger, string companyName);
+
+    [LoggerMessage(EventId = 2105, Level = LogLevel.Warning, Message = "CreateCompanyAsync: Company creation not available in generated client. This operation typically requires administrative access.")]
+    public static partial void CompanyCreationUnavailable(this ILogger logger);
+
+    [LoggerMessage(EventId = 2106, Level = LogLevel.Error, Message = "Failed to create company {CompanyName}")]
+    public static partial void FailedToCreateCompany(this ILogger logger, Exception? exception, string companyName);
+
+    [LoggerMessage(EventId = 2107, Level = LogLevel.Debug, Message = "Updating company {CompanyId} using generated Kiota client")]
+    public static partial void UpdatingCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2108, Level = LogLevel.Debug, Message = "Deleting company {CompanyId} using generated Kiota client")]
+    public static partial void DeletingCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2109, Level = LogLevel.Warning, Message = "DeleteCompanyAsync: Company deletion not available in generated client. This operation typically requires administrative access.")]
+    public static partial void CompanyDeletionUnavailable(this ILogger logger);
+
+    [LoggerMessage(EventId = 2110, Level = LogLevel.Debug, Message = "Getting users for company {CompanyId} using V1.1 generated Kiota client")]
+    public static partial void GettingUsersForCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2111, Level = LogLevel.Warning, Message = "No users returned from V1.1 Users endpoint for company {CompanyId}")]
+    public static partial void NoUsersReturned(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2112, Level = LogLevel.Debug, Message = "Getting user {UserId} for company {CompanyId}")]
+    public static partial void GettingUser(this ILogger logger, int userId, int companyId);
+
+    [LoggerMessage(EventId = 2113, Level = LogLevel.Debug, Message = "Creating user {Email} for company {CompanyId} using V1.1 generated Kiota client")]
+    public static partial void CreatingUser(this ILogger logger, string email, int companyId);
+
+    [LoggerMessage(EventId = 2114, Level = LogLevel.Debug, Message = "Updating user {UserId} for company {CompanyId} using V1.1 generated Kiota client")]
+    public static partial void UpdatingUser(this ILogger logger, int userId, int companyId);
+
+    [LoggerMessage(EventId = 2115, Level = LogLevel.Debug, Message = "Deactivating user {UserId} for company {CompanyId} using V1.1 generated Kiota client")]
+    public static partial void DeactivatingUser(this ILogger logger, int userId, int companyId);
+
+    [LoggerMessage(EventId = 2116, Level = LogLevel.Debug, Message = "Successfully deactivated user {UserId} for company {CompanyId}")]
+    public static partial void DeactivatedUser(this ILogger logger, int userId, int companyId);
+
+    [LoggerMessage(EventId = 2117, Level = LogLevel.Debug, Message = "Getting documents for company {CompanyId} using generated Kiota client with type mapping")]
+    public static partial void GettingDocumentsForCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2118, Level = LogLevel.Warning, Message = "No files returned from Folders endpoint for company {CompanyId}")]
+    public static partial void NoFilesReturned(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2119, Level = LogLevel.Debug, Message = "Getting document {DocumentId} for company {CompanyId} using generated Kiota client with type mapping")]
+    public static partial void GettingDocument(this ILogger logger, int documentId, int companyId);
+
+    [LoggerMessage(EventId = 2120, Level = LogLevel.Debug, Message = "Uploading document {DocumentName} for company {CompanyId} as streamed multipart content")]
+    public static partial void UploadingDocument(this ILogger logger, string documentName, int companyId);
+
+    [LoggerMessage(EventId = 2121, Level = LogLevel.Debug, Message = "Downloading document {DocumentId} for company {CompanyId} from offset {Offset}")]
+    public static partial void DownloadingDocument(this ILogger logger, int documentId, int companyId, long offset);
+
+    [LoggerMessage(EventId = 2122, Level = LogLevel.Debug, Message = "Updating document {DocumentId} for company {CompanyId} using generated Kiota client")]
+    public static partial void UpdatingDocument(this ILogger logger, int documentId, int companyId);
+
+    [LoggerMessage(EventId = 2123, Level = LogLevel.Debug, Message = "Deleting document {DocumentId} for company {CompanyId} using generated Kiota client")]
+    public static partial void DeletingDocument(this ILogger logger, int documentId, int companyId);
+
+    [LoggerMessage(EventId = 2124, Level = LogLevel.Debug, Message = "Successfully deleted document {DocumentId} for company {CompanyId}")]
+    public static partial void DeletedDocument(this ILogger logger, int documentId, int companyId);
+
+    [LoggerMessage(EventId = 2125, Level = LogLevel.Debug, Message = "Getting custom fields for company {CompanyId} and resource type {ResourceType} using V1.1 generated Kiota client")]
+    public static partial void GettingCustomFieldsForCompany(this ILogger logger, int companyId, string resourceType);
+
+    [LoggerMessage(EventId = 2126, Level = LogLevel.Warning, Message = "No custom field definitions returned from V1.1 endpoint for company {CompanyId}")]
+    public static partial void NoCustomFieldDefinitionsReturned(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2127, Level = LogLevel.Debug, Message = "Getting custom field {FieldId} for company {CompanyId} using V1.1 generated Kiota client")]
+    public static partial void GettingCustomField(this ILogger logger, int fieldId, int companyId);
+
+    [LoggerMessage(EventId = 2128, Level = LogLevel.Debug, Message = "Creating custom field {FieldName} for company {CompanyId} using Workforce Planning V2 generated Kiota client")]
+    public static partial void CreatingCustomField(this ILogger logger, string fieldName, int companyId);
+
+    [LoggerMessage(EventId = 2129, Level = LogLevel.Debug, Message = "Updating custom field {FieldId} for company {CompanyId} using generated Kiota client")]
+    public static partial void UpdatingCustomField(this ILogger logger, int fieldId, int companyId);
+
+    [LoggerMessage(EventId = 2130, Level = LogLevel.Debug, Message = "Deleting custom field {FieldId} for company {CompanyId} using generated Kiota client")]
+    public static partial void DeletingCustomField(this ILogger logger, int fieldId, int companyId);
+
+    [LoggerMessage(EventId = 2131, Level = LogLevel.Warning, Message = "DeleteCustomFieldAsync: Custom field deletion not available in generated client. This operation typically requires administrative access.")]
+    public static partial void CustomFieldDeletionUnavailable(this ILogger logger);
+
+    [LoggerMessage(EventId = 2132, Level = LogLevel.Debug, Message = "Getting current user using generated Kiota client")]
+    public static partial void GettingCurrentUser(this ILogger logger);
+
+    [LoggerMessage(EventId = 2133, Level = LogLevel.Warning, Message = "GetCurrentUserAsync: The Procore API requires explicit company and user IDs. Extract these from your JWT token and use GetUserAsync(companyId, userId) instead.")]
+    public static partial void CurrentUserRequiresExplicitIds(this ILogger logger);
+
+    [LoggerMessage(EventId = 2134, Level = LogLevel.Debug, Message = "Getting company by name {CompanyName} using generated Kiota client")]
+    public static partial void GettingCompanyByName(this ILogger logger, string companyName);
+
+    [LoggerMessage(EventId = 2135, Level = LogLevel.Debug, Message = "Searching users for company {CompanyId} with term {SearchTerm} using generated Kiota client")]
+    public static partial void SearchingUsersForCompany(this ILogger logger, int companyId, string searchTerm);
+
+    [LoggerMessage(EventId = 2136, Level = LogLevel.Debug, Message = "Getting documents of type {DocumentType} for company {CompanyId} using generated Kiota client")]
+    public static partial void GettingDocumentsOfType(this ILogger logger, string documentType, int companyId);
+
+    [LoggerMessage(EventId = 2137, Level = LogLevel.Debug, Message = "Getting companies with pagination (page {Page}, per page {PerPage}) using generated Kiota client")]
+    public static partial void GettingCompaniesPage(this ILogger logger, int page, int perPage);
+
+    [LoggerMessage(EventId = 2138, Level = LogLevel.Debug, Message = "Getting users for company {CompanyId} with pagination (page {Page}, per page {PerPage}) using V1.1 generated Kiota client")]
+    public static partial void GettingUsersPage(this ILogger logger, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2139, Level = LogLevel.Debug, Message = "Getting documents for company {CompanyId} with pagination (page {Page}, per page {PerPage}) using generated Kiota client")]
+    public static partial void GettingDocumentsPage(this ILogger logger, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2140, Level = LogLevel.Debug, Message = "Executing operation {Operation} with correlation ID {CorrelationId}")]
+    public static partial void ExecutingOperation(this ILogger logger, string operation, string correlationId);
+}
@@ -6,6 +6,7 @@ using System.Net;
 using System.Net.Http;
 using System.Text.Json;
 using Procore.SDK.Core.Models;
+using Procore.SDK.Core.Serialization;
 
 namespace Procore.SDK.Core.ErrorHandling;
 
@@ -179,7 +180,7 @@ public static class ErrorMapper
 
         try
         {
-            return JsonSerializer.Deserialize<Dictionary<string, object>>(responseBody);
+            return JsonSerializer.Deserialize(responseBody, CoreJsonContext.Default.DictionaryStringObject);
         }
         catch (JsonException)
         {
@@ -196,7 +197,7 @@ public static class ErrorMapper
 
         try
         {
-            var response = JsonSerializer.Deserialize<Dictionary<string, object>>(responseBody);
+            var response = JsonSerializer.Deserialize(responseBody, CoreJsonContext.Default.DictionaryStringObject);
             
             if (response?.TryGetValue("errors", out var errorsObj) == true &&
                 errorsObj is JsonElement errorsElement && errorsElement.ValueKind == JsonValueKind.Object)
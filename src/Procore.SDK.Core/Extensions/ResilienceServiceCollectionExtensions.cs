@@ -35,6 +35,9 @@ public static class ResilienceServiceCollectionExtensions
         // Register core resilience services
         services.AddSingleton<PolicyFactory>();
         services.AddTransient<ProcoreResilienceHandler>();
+        services.AddSingleton<HedgingBudget>();
+        services.AddSingleton<RouteLatencyTracker>();
+        services.AddTransient<ProcoreHedgingHandler>();
         services.AddSingleton<StructuredLogger>();
 
         // Add logging configuration
@@ -58,6 +61,9 @@ public static class ResilienceServiceCollectionExtensions
         // Register core resilience services
         services.AddSingleton<PolicyFactory>();
         services.AddTransient<ProcoreResilienceHandler>();
+        services.AddSingleton<HedgingBudget>();
+        services.AddSingleton<RouteLatencyTracker>();
+        services.AddTransient<ProcoreHedgingHandler>();
         services.AddSingleton<StructuredLogger>();
 
         return services;
@@ -92,13 +98,20 @@ public static class ResilienceServiceCollectionExtensions
     }
 
     /// <summary>
-    /// Adds resilience policies to an HTTP client.
+    /// Adds resilience policies to an HTTP client. Hedging runs inside the retry policies,
+    /// so a retry covers both attempts of a hedged request.
     /// </summary>
+    /// <remarks>
+    /// The "Procore" client registered by AddProcoreSDK already includes the hedging handler, driven by
+    /// the same Procore:Resilience:Hedging options; adding it again there does not hedge a request twice.
+    /// </remarks>
     /// <param name="builder">The HTTP client builder.</param>
     /// <returns>The HTTP client builder for chaining.</returns>
     public static IHttpClientBuilder AddProcoreResilience(this IHttpClientBuilder builder)
     {
-        return builder.AddHttpMessageHandler<ProcoreResilienceHandler>();
+        return builder
+            .AddHttpMessageHandler<ProcoreResilienceHandler>()
+            .AddHttpMessageHandler<ProcoreHedgingHandler>();
     }
 
     /// <summary>
@@ -0,0 +1,25 @@
+namespace Procore.SDK.Core.FanOut;
+
+/// <summary>
+/// Configuration options for <see cref="FanOutQuery"/>.
+/// </summary>
+public class FanOutOptions
+{
+    /// <summary>
+    /// Gets or sets the maximum number of per-source queries running at once. Default: 8.
+    /// </summary>
+    public int MaxConcurrency { get; set; } = 8;
+
+    /// <summary>
+    /// Gets or sets a value indicating whether results are yielded in source order rather than
+    /// in completion order. Results that complete ahead of a slower source are buffered until
+    /// it finishes. Default: false.
+    /// </summary>
+    public bool PreserveOrder { get; set; }
+
+    /// <summary>
+    /// Gets or sets how many times a source is retried after a <see cref="Models.RateLimitExceededException"/>
+    /// before it is reported as failed. Default: 2.
+    /// </summary>
+    public int MaxRateLimitRetries { get; set; } = 2;
+}
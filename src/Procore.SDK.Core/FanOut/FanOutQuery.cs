@@ -0,0 +1,252 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using System.Threading.Channels;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Procore.SDK.Core.Models;
+
+namespace Procore.SDK.Core.FanOut;
+
+/// <summary>
+/// Runs one query per source (typically per project) with bounded concurrency and streams the
+/// results back as they complete.
+/// </summary>
+/// <remarks>
+/// A failing source is reported as a failed <see cref="FanOutResult{TSource, TResult}"/> and does
+/// not stop the others. When a query hits the rate limit, new queries are held back for the
+/// Retry-After period and the source is retried up to <see cref="FanOutOptions.MaxRateLimitRetries"/> times.
+/// Source enumeration failures and cancellation end the sequence with an exception.
+/// Abandoning the enumeration cancels the queries still running.
+/// </remarks>
+public static class FanOutQuery
+{
+    /// <summary>
+    /// Queries every source and yields one result per source.
+    /// </summary>
+    /// <typeparam name="TSource">The source type.</typeparam>
+    /// <typeparam name="TResult">The result item type.</typeparam>
+    /// <param name="sources">The sources to query.</param>
+    /// <param name="query">The per-source query.</param>
+    /// <param name="options">Optional fan-out options.</param>
+    /// <param name="logger">Optional logger for diagnostic information.</param>
+    /// <param name="cancellationToken">Cancellation token for the operation.</param>
+    /// <returns>The per-source results, in completion order unless <see cref="FanOutOptions.PreserveOrder"/> is set.</returns>
+    public static async IAsyncEnumerable<FanOutResult<TSource, TResult>> ExecuteAsync<TSource, TResult>(
+        IEnumerable<TSource> sources,
+        Func<TSource, CancellationToken, Task<IEnumerable<TResult>>> query,
+        FanOutOptions? options = null,
+        ILogger? logger = null,
+        [EnumeratorCancellation] CancellationToken cancellationToken = default)
+    {
+        if (sources == null)
+            throw new ArgumentNullException(nameof(sources));
+        if (query == null)
+            throw new ArgumentNullException(nameof(query));
+
+        options ??= new FanOutOptions();
+        if (options.MaxConcurrency < 1)
+            throw new ArgumentOutOfRangeException(nameof(options), options.MaxConcurrency, "MaxConcurrency must be at least 1.");
+
+        // Bounded so a slow consumer holds back the workers instead of buffering every result
+        var channel = Channel.CreateBounded<FanOutResult<TSource, TResult>>(
+            new BoundedChannelOptions(options.MaxConcurrency) { SingleReader = true });
+        using var linkedCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        var run = new FanOutRun<TSource, TResult>(sources, query, options, logger, channel.Writer, linkedCts.Token);
+        var producer = run.RunAsync();
+
+        try
+        {
+            if (!options.PreserveOrder)
+            {
+                await foreach (var result in channel.Reader.ReadAllAsync(cancellationToken).ConfigureAwait(false))
+                {
+                    yield return result;
+                }
+            }
+            else
+            {
+                var pending = new Dictionary<int, FanOutResult<TSource, TResult>>();
+                var nextIndex = 0;
+
+                await foreach (var result in channel.Reader.ReadAllAsync(cancellationToken).ConfigureAwait(false))
+                {
+                    pending[result.Index] = result;
+                    while (pending.Remove(nextIndex, out var next))
+                    {
+                        nextIndex++;
+                        yield return next;
+                    }
+                }
+            }
+        }
+        finally
+        {
+            linkedCts.Cancel();
+            try
+            {
+                await producer.ConfigureAwait(false);
+            }
+            catch (Exception)
+            {
+                // Either already surfaced through the channel, or the consumer stopped early and
+                // the running queries were cancelled
+            }
+        }
+    }
+
+    /// <summary>
+    /// State shared by the workers of one fan-out.
+    /// </summary>
+    private sealed class FanOutRun<TSource, TResult>
+    {
+        private readonly IEnumerator<TSource> _sources;
+        private readonly Func<TSource, CancellationToken, Task<IEnumerable<TResult>>> _query;
+        private readonly FanOutOptions _options;
+        private readonly ILogger? _logger;
+        private readonly ChannelWriter<FanOutResult<TSource, TResult>> _writer;
+        private readonly CancellationToken _cancellationToken;
+        private readonly object _sync = new();
+        private int _nextIndex;
+        private bool _exhausted;
+        private long _pausedUntilTicks;
+
+        public FanOutRun(
+            IEnumerable<TSource> sources,
+            Func<TSource, CancellationToken, Task<IEnumerable<TResult>>> query,
+            FanOutOptions options,
+            ILogger? logger,
+            ChannelWriter<FanOutResult<TSource, TResult>> writer,
+            CancellationToken cancellationToken)
+        {
+            _sources = sources.GetEnumerator();
+            _query = query;
+            _options = options;
+            _logger = logger;
+            _writer = writer;
+            _cancellationToken = cancellationToken;
+        }
+
+        public async Task RunAsync()
+        {
+            Exception? failure = null;
+            try
+            {
+                var workers = new Task[_options.MaxConcurrency];
+                for (var i = 0; i < workers.Length; i++)
+                {
+                    workers[i] = Task.Run(WorkAsync, _cancellationToken);
+                }
+
+                await Task.WhenAll(workers).ConfigureAwait(false);
+            }
+            catch (Exception ex)
+            {
+                failure = ex;
+                throw;
+            }
+            finally
+            {
+                _writer.TryComplete(failure);
+                _sources.Dispose();
+            }
+        }
+
+        private async Task WorkAsync()
+        {
+            while (TryTakeNext(out var source, out var index))
+            {
+                var result = await QueryWithRetriesAsync(source, index).ConfigureAwait(false);
+                await _writer.WriteAsync(result, _cancellationToken).ConfigureAwait(false);
+            }
+        }
+
+        private bool TryTakeNext(out TSource source, out int index)
+        {
+            lock (_sync)
+            {
+                _cancellationToken.ThrowIfCancellationRequested();
+
+                if (!_exhausted)
+                {
+                    try
+                    {
+                        _exhausted = !_sources.MoveNext();
+                    }
+                    catch
+                    {
+                        // A source sequence that threw is not read again by the other workers
+                        _exhausted = true;
+                        throw;
+                    }
+                }
+
+                if (_exhausted)
+                {
+                    source = default!;
+                    index = -1;
+                    return false;
+                }
+
+                source = _sources.Current;
+                index = _nextIndex++;
+                return true;
+            }
+        }
+
+        private async Task<FanOutResult<TSource, TResult>> QueryWithRetriesAsync(TSource source, int index)
+        {
+            for (var attempt = 0; ; attempt++)
+            {
+                await WaitForRateLimitAsync().ConfigureAwait(false);
+
+                try
+                {
+                    var items = await _query(source, _cancellationToken).ConfigureAwait(false);
+                    return new FanOutResult<TSource, TResult>(source, index, items?.ToList() ?? new List<TResult>(), null);
+                }
+                catch (RateLimitExceededException ex) when (attempt < _options.MaxRateLimitRetries)
+                {
+                    _logger?.LogWarning("Fan-out query for source {Index} was rate limited; pausing new queries for {RetryAfter}",
+                        index, ex.RetryAfter);
+                    PauseFor(ex.RetryAfter);
+                }
+                catch (OperationCanceledException) when (_cancellationToken.IsCancellationRequested)
+                {
+                    throw;
+                }
+                catch (Exception ex)
+                {
+                    _logger?.LogWarning(ex, "Fan-out query for source {Index} failed", index);
+                    return new FanOutResult<TSource, TResult>(source, index, Array.Empty<TResult>(), ex);
+                }
+            }
+        }
+
+        private void PauseFor(TimeSpan retryAfter)
+        {
+            var until = DateTimeOffset.UtcNow.Add(retryAfter).UtcTicks;
+            long current;
+            do
+            {
+                current = Interlocked.Read(ref _pausedUntilTicks);
+                if (current >= until)
+                {
+                    return;
+                }
+            }
+            while (Interlocked.CompareExchange(ref _pausedUntilTicks, until, current) != current);
+        }
+
+        private async Task WaitForRateLimitAsync()
+        {
+            var delay = new DateTimeOffset(Interlocked.Read(ref _pausedUntilTicks), TimeSpan.Zero) - DateTimeOffset.UtcNow;
+            if (delay > TimeSpan.Zero)
+            {
+                await Task.Delay(delay, _cancellationToken).ConfigureAwait(false);
+            }
+        }
+    }
+}
@@ -0,0 +1,52 @@
+using System;
+using System.Collections.Generic;
+
+namespace Procore.SDK.Core.FanOut;
+
+/// <summary>
+/// The outcome of one per-source query yielded by <see cref="FanOutQuery"/>.
+/// </summary>
+/// <typeparam name="TSource">The source type, e.g. a project.</typeparam>
+/// <typeparam name="TResult">The result item type.</typeparam>
+public sealed class FanOutResult<TSource, TResult>
+{
+    /// <summary>
+    /// Initializes a new instance of the <see cref="FanOutResult{TSource, TResult}"/> class.
+    /// </summary>
+    /// <param name="source">The source that was queried.</param>
+    /// <param name="index">The position of the source in the input sequence.</param>
+    /// <param name="items">The items returned for the source.</param>
+    /// <param name="exception">The failure of the query, if it failed.</param>
+    public FanOutResult(TSource source, int index, IReadOnlyList<TResult> items, Exception? exception)
+    {
+        Source = source;
+        Index = index;
+        Items = items ?? throw new ArgumentNullException(nameof(items));
+        Exception = exception;
+    }
+
+    /// <summary>
+    /// Gets the source that was queried.
+    /// </summary>
+    public TSource Source { get; }
+
+    /// <summary>
+    /// Gets the position of the source in the input sequence.
+    /// </summary>
+    public int Index { get; }
+
+    /// <summary>
+    /// Gets the items returned for the source; empty when the query failed.
+    /// </summary>
+    public IReadOnlyList<TResult> Items { get; }
+
+    /// <summary>
+    /// Gets the failure of the query, or null when it succeeded.
+    /// </summary>
+    public Exception? Exception { get; }
+
+    /// <summary>
+    /// Gets a value indicating whether the query succeeded.
+    /// </summary>
+    public bool Succeeded => Exception == null;
+}
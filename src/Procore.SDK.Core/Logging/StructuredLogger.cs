@@ -8,9 +8,46 @@ namespace Procore.SDK.Core.Logging;
 
 /// <summary>
 /// Structured logger for Procore SDK operations with correlation tracking and performance metrics.
+/// Messages are precompiled with <see cref="LoggerMessage"/> and nothing is allocated for levels that are disabled.
 /// </summary>
 public class StructuredLogger
 {
+    private static readonly Action<ILogger, string, string, Exception?> OperationStarting =
+        LoggerMessage.Define<string, string>(
+            LogLevel.Information,
+            new EventId(1000, nameof(OperationStarting)),
+            "Starting operation {Operation} (CorrelationId: {CorrelationId})");
+
+    private static readonly Action<ILogger, string, long, string, Exception?> OperationCompleted =
+        LoggerMessage.Define<string, long, string>(
+            LogLevel.Information,
+            new EventId(1001, nameof(OperationCompleted)),
+            "Completed operation {Operation} in {DurationMs}ms (CorrelationId: {CorrelationId})");
+
+    private static readonly Action<ILogger, string, string, double, string, Exception?> OperationSucceededMetrics =
+        LoggerMessage.Define<string, string, double, string>(
+            LogLevel.Information,
+            new EventId(1002, "OperationMetrics"),
+            "Operation {Operation} {Status} in {DurationMs}ms (CorrelationId: {CorrelationId})");
+
+    private static readonly Action<ILogger, string, string, double, string, Exception?> OperationFailedMetrics =
+        LoggerMessage.Define<string, string, double, string>(
+            LogLevel.Warning,
+            new EventId(1002, "OperationMetrics"),
+            "Operation {Operation} {Status} in {DurationMs}ms (CorrelationId: {CorrelationId})");
+
+    private static readonly Action<ILogger, int, string, double, string, Exception?> RetryAttempt =
+        LoggerMessage.Define<int, string, double, string>(
+            LogLevel.Warning,
+            new EventId(1003, nameof(RetryAttempt)),
+            "Retry attempt {AttemptNumber} for operation {Operation} after {DelayMs}ms delay (CorrelationId: {CorrelationId})");
+
+    private static readonly Action<ILogger, string, string, string, string, Exception?> CircuitBreakerStateChange =
+        LoggerMessage.Define<string, string, string, string>(
+            LogLevel.Warning,
+            new EventId(1004, nameof(CircuitBreakerStateChange)),
+            "Circuit breaker {State} for operation {Operation} (CorrelationId: {CorrelationId}). Reason: {Reason}");
+
     private readonly ILogger<StructuredLogger> _logger;
 
     /// <summary>
@@ -22,30 +59,46 @@ public class StructuredLogger
         _logger = logger;
     }
 
+    /// <summary>
+    /// Checks whether messages at the given level are written, so callers can skip preparing log data.
+    /// </summary>
+    /// <param name="logLevel">The log level.</param>
+    /// <returns>True when the level is enabled; otherwise, false.</returns>
+    public bool IsEnabled(LogLevel logLevel) => _logger.IsEnabled(logLevel);
+
     /// <summary>
     /// Logs the start of an operation with correlation tracking.
+    /// Returns a shared no-op scope when information logging is disabled.
     /// </summary>
     public IDisposable BeginOperation(string operation, string correlationId, IDictionary<string, object>? properties = null)
     {
-        var stopwatch = Stopwatch.StartNew();
-        var context = LogContext.PushProperty("CorrelationId", correlationId);
-        
+        if (!_logger.IsEnabled(LogLevel.Information))
+        {
+            return NullScope.Instance;
+        }
+
+        var logContext = new List<IDisposable>(properties == null ? 1 : properties.Count + 1)
+        {
+            LogContext.PushProperty("CorrelationId", correlationId)
+        };
+
         if (properties != null)
         {
             foreach (var kvp in properties)
             {
-                LogContext.PushProperty(kvp.Key, kvp.Value);
+                logContext.Add(LogContext.PushProperty(kvp.Key, kvp.Value));
             }
         }
 
-        _logger.LogInformation("Starting operation {Operation} (CorrelationId: {CorrelationId})", 
-            operation, correlationId);
+        OperationStarting(_logger, operation, correlationId, null);
 
-        return new OperationScope(_logger, operation, correlationId, stopwatch, context);
+        return new OperationScope(_logger, operation, correlationId, Stopwatch.GetTimestamp(), logContext);
     }
 
     /// <summary>
     /// Logs an error with structured context and correlation tracking.
+    /// The message is passed through unchanged as the template, with the operation attached as a property,
+    /// so each call site yields a single cached template.
     /// </summary>
     public void LogError(
         Exception exception,
@@ -54,14 +107,21 @@ public class StructuredLogger
         string message,
         params object[] args)
     {
+        if (!_logger.IsEnabled(LogLevel.Error))
+        {
+            return;
+        }
+
         using (LogContext.PushProperty("CorrelationId", correlationId))
+        using (LogContext.PushProperty("Operation", operation))
         {
-            _logger.LogError(exception, $"Operation: {operation} - " + message, args);
+            _logger.LogError(exception, message, args);
         }
     }
 
     /// <summary>
     /// Logs a warning with structured context.
+    /// The message is passed through unchanged as the template, with the operation attached as a property.
     /// </summary>
     public void LogWarning(
         string operation,
@@ -69,9 +129,15 @@ public class StructuredLogger
         string message,
         params object[] args)
     {
+        if (!_logger.IsEnabled(LogLevel.Warning))
+        {
+            return;
+        }
+
         using (LogContext.PushProperty("CorrelationId", correlationId))
+        using (LogContext.PushProperty("Operation", operation))
         {
-            _logger.LogWarning($"Operation: {operation} - " + message, args);
+            _logger.LogWarning(message, args);
         }
     }
 
@@ -85,14 +151,21 @@ public class StructuredLogger
         bool success,
         IDictionary<string, object>? metrics = null)
     {
-        using (LogContext.PushProperty("CorrelationId", correlationId))
+        if (!_logger.IsEnabled(success ? LogLevel.Information : LogLevel.Warning))
         {
-            var logLevel = success ? LogLevel.Information : LogLevel.Warning;
-            var status = success ? "completed" : "failed";
+            return;
+        }
 
-            _logger.Log(logLevel,
-                "Operation {Operation} {Status} in {DurationMs}ms (CorrelationId: {CorrelationId})",
-                operation, status, duration.TotalMilliseconds, correlationId);
+        using (LogContext.PushProperty("CorrelationId", correlationId))
+        {
+            if (success)
+            {
+                OperationSucceededMetrics(_logger, operation, "completed", duration.TotalMilliseconds, correlationId, null);
+            }
+            else
+            {
+                OperationFailedMetrics(_logger, operation, "failed", duration.TotalMilliseconds, correlationId, null);
+            }
 
             if (metrics != null)
             {
@@ -117,20 +190,14 @@ public class StructuredLogger
         TimeSpan delay,
         Exception? exception = null)
     {
+        if (!_logger.IsEnabled(LogLevel.Warning))
+        {
+            return;
+        }
+
         using (LogContext.PushProperty("CorrelationId", correlationId))
         {
-            if (exception != null)
-            {
-                _logger.LogWarning(exception,
-                    "Retry attempt {AttemptNumber} for operation {Operation} after {DelayMs}ms delay (CorrelationId: {CorrelationId})",
-                    attemptNumber, operation, delay.TotalMilliseconds, correlationId);
-            }
-            else
-            {
-                _logger.LogWarning(
-                    "Retry attempt {AttemptNumber} for operation {Operation} after {DelayMs}ms delay (CorrelationId: {CorrelationId})",
-                    attemptNumber, operation, delay.TotalMilliseconds, correlationId);
-            }
+            RetryAttempt(_logger, attemptNumber, operation, delay.TotalMilliseconds, correlationId, exception);
         }
     }
 
@@ -143,11 +210,14 @@ public class StructuredLogger
         string state,
         string? reason = null)
     {
+        if (!_logger.IsEnabled(LogLevel.Warning))
+        {
+            return;
+        }
+
         using (LogContext.PushProperty("CorrelationId", correlationId))
         {
-            _logger.LogWarning(
-                "Circuit breaker {State} for operation {Operation} (CorrelationId: {CorrelationId}). Reason: {Reason}",
-                state, operation, correlationId, reason ?? "Not specified");
+            CircuitBreakerStateChange(_logger, state, operation, correlationId, reason ?? "Not specified", null);
         }
     }
 
@@ -159,21 +229,21 @@ public class StructuredLogger
         private readonly ILogger _logger;
         private readonly string _operation;
         private readonly string _correlationId;
-        private readonly Stopwatch _stopwatch;
-        private readonly IDisposable _logContext;
+        private readonly long _startTimestamp;
+        private readonly List<IDisposable> _logContext;
         private bool _disposed;
 
         public OperationScope(
             ILogger logger,
             string operation,
             string correlationId,
-            Stopwatch stopwatch,
-            IDisposable logContext)
+            long startTimestamp,
+            List<IDisposable> logContext)
         {
             _logger = logger;
             _operation = operation;
             _correlationId = correlationId;
-            _stopwatch = stopwatch;
+            _startTimestamp = startTimestamp;
             _logContext = logContext;
         }
 
@@ -181,14 +251,28 @@ public class StructuredLogger
         {
             if (_disposed) return;
 
-            _stopwatch.Stop();
-            
-            _logger.LogInformation(
-                "Completed operation {Operation} in {DurationMs}ms (CorrelationId: {CorrelationId})",
-                _operation, _stopwatch.ElapsedMilliseconds, _correlationId);
+            var elapsedMs = (Stopwatch.GetTimestamp() - _startTimestamp) * 1000 / Stopwatch.Frequency;
+            OperationCompleted(_logger, _operation, elapsedMs, _correlationId, null);
+
+            // Pop the pushed properties in reverse order
+            for (var i = _logContext.Count - 1; i >= 0; i--)
+            {
+                _logContext[i].Dispose();
+            }
 
-            _logContext.Dispose();
             _disposed = true;
         }
     }
-}
\ No newline at end of file
+
+    /// <summary>
+    /// Scope returned when operation logging is disabled.
+    /// </summary>
+    private sealed class NullScope : IDisposable
+    {
+        public static readonly NullScope Instance = new();
+
+        public void Dispose()
+        {
+        }
+    }
+}
@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.IO;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -132,6 +133,28 @@ public interface ICoreClient : IDisposable
     /// <param name="cancellationToken">Cancellation token for the request.</param>
     /// <returns>The uploaded document.</returns>
     Task<Document> UploadDocumentAsync(int companyId, UploadDocumentRequest request, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Streams the content of a document's latest version to a destination stream in ranged chunks.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="documentId">The document ID.</param>
+    /// <param name="destination">The stream to write the content to.</param>
+    /// <param name="options">Optional chunking, resume and progress options.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>The total number of content bytes, including any resumed offset.</returns>
+    Task<long> DownloadDocumentAsync(int companyId, int documentId, Stream destination, DownloadDocumentOptions? options = null, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Streams the content of a document's latest version to a file, resuming a partial file if one exists.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="documentId">The document ID.</param>
+    /// <param name="filePath">The path of the file to write.</param>
+    /// <param name="options">Optional chunking and progress options.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>The total number of content bytes in the file.</returns>
+    Task<long> DownloadDocumentToFileAsync(int companyId, int documentId, string filePath, DownloadDocumentOptions? options = null, CancellationToken cancellationToken = default);
     
     /// <summary>
     /// Updates an existing document.
@@ -218,7 +241,17 @@ public interface ICoreClient : IDisposable
     Task<Company> GetCompanyByNameAsync(string companyName, CancellationToken cancellationToken = default);
     
     /// <summary>
-    /// Searches for users by a search term.
+    /// Gets companies whose name starts with a prefix, ignoring case.
+    /// Served from an in-memory index that is refreshed from the API when it expires.
+    /// </summary>
+    /// <param name="namePrefix">The name prefix to match.</param>
+    /// <param name="maxResults">The maximum number of companies to return.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>The matching companies ordered by name.</returns>
+    Task<IEnumerable<Company>> GetCompaniesByNamePrefixAsync(string namePrefix, int maxResults = 20, CancellationToken cancellationToken = default);
+    
+    /// <summary>
+    /// Searches for users by a search term, filtered on the server.
     /// </summary>
     /// <param name="companyId">The company ID.</param>
     /// <param name="searchTerm">The search term to match against user data.</param>
@@ -0,0 +1,134 @@
+using System;
+using System.Collections.Generic;
+using System.Runtime.CompilerServices;
+
+namespace Procore.SDK.Core.Models;
+
+/// <summary>
+/// Base class for update request models that records which properties were assigned,
+/// so that PATCH bodies carry only the fields the caller actually changed.
+/// </summary>
+/// <remarks>
+/// A property that was never assigned, or was assigned <c>null</c> or an empty string, is left
+/// unchanged. To clear a field on the server, call <see cref="Clear"/>; only properties the
+/// request declares as clearable can be cleared, and they are sent as an explicit JSON null.
+/// </remarks>
+public abstract class PartialUpdateRequest
+{
+    private HashSet<string>? _setProperties;
+    private HashSet<string>? _clearedProperties;
+
+    /// <summary>
+    /// Gets the names of the properties that have been assigned a value.
+    /// </summary>
+    public IReadOnlyCollection<string> SetProperties => (IReadOnlyCollection<string>?)_setProperties ?? Array.Empty<string>();
+
+    /// <summary>
+    /// Gets the names of the properties that will be cleared.
+    /// </summary>
+    public IReadOnlyCollection<string> ClearedProperties => (IReadOnlyCollection<string>?)_clearedProperties ?? Array.Empty<string>();
+
+    /// <summary>
+    /// Gets a value indicating whether any property has been assigned or cleared.
+    /// </summary>
+    public bool HasChanges => _setProperties is { Count: > 0 } || _clearedProperties is { Count: > 0 };
+
+    /// <summary>
+    /// Determines whether a property has been assigned a value.
+    /// </summary>
+    /// <param name="propertyName">The property name, typically from <c>nameof</c>.</param>
+    /// <returns>True if the property was assigned a non-null, non-empty value.</returns>
+    public bool IsSet(string propertyName) => _setProperties?.Contains(propertyName) ?? false;
+
+    /// <summary>
+    /// Determines whether a property will be cleared.
+    /// </summary>
+    /// <param name="propertyName">The property name, typically from <c>nameof</c>.</param>
+    /// <returns>True if <see cref="Clear"/> was called for the property and no value was assigned since.</returns>
+    public bool IsCleared(string propertyName) => _clearedProperties?.Contains(propertyName) ?? false;
+
+    /// <summary>
+    /// Marks a property to be cleared on the server, discarding any value assigned to it.
+    /// </summary>
+    /// <param name="propertyName">The property name, typically from <c>nameof</c>.</param>
+    /// <exception cref="ArgumentException">The property cannot be cleared.</exception>
+    public void Clear(string propertyName)
+    {
+        ArgumentNullException.ThrowIfNull(propertyName);
+
+        if (!CanClear(propertyName))
+        {
+            throw new ArgumentException($"Property '{propertyName}' cannot be cleared on {GetType().Name}.", nameof(propertyName));
+        }
+
+        _setProperties?.Remove(propertyName);
+        (_clearedProperties ??= new HashSet<string>(StringComparer.Ordinal)).Add(propertyName);
+    }
+
+    /// <summary>
+    /// Determines whether a property may be cleared. Required fields and fields the API cannot
+    /// null out are not clearable.
+    /// </summary>
+    /// <param name="propertyName">The property name.</param>
+    /// <returns>True if the property may be passed to <see cref="Clear"/>.</returns>
+    protected virtual bool CanClear(string propertyName) => false;
+
+    /// <summary>
+    /// Stores a property value and records the property as assigned, unless the value is null
+    /// or an empty string, in which case the property is left unchanged.
+    /// </summary>
+    /// <typeparam name="T">The property type.</typeparam>
+    /// <param name="field">The backing field.</param>
+    /// <param name="value">The assigned value.</param>
+    /// <param name="propertyName">The property name, supplied by the compiler.</param>
+    protected void Set<T>(ref T field, T value, [CallerMemberName] string propertyName = "")
+    {
+        field = value;
+
+        if (value is null || value is string { Length: 0 })
+        {
+            _setProperties?.Remove(propertyName);
+            return;
+        }
+
+        _clearedProperties?.Remove(propertyName);
+        (_setProperties ??= new HashSet<string>(StringComparer.Ordinal)).Add(propertyName);
+    }
+
+    /// <summary>
+    /// Copies a property to a generated request body. Assigned values go through
+    /// <paramref name="assign"/>; cleared properties are written to the body's additional data
+    /// so they serialize as an explicit JSON null; anything else is skipped.
+    /// </summary>
+    /// <typeparam name="T">The generated property type.</typeparam>
+    /// <param name="propertyName">The request property name.</param>
+    /// <param name="value">The value to send, already converted to the generated type.</param>
+    /// <param name="assign">Assigns a non-null value to the generated body.</param>
+    /// <param name="additionalData">The generated body's additional data.</param>
+    /// <param name="jsonName">The JSON field name used by the API.</param>
+    /// <returns>True if the property was assigned or cleared and copied.</returns>
+    public bool CopyIfSet<T>(
+        string propertyName,
+        T? value,
+        Action<T> assign,
+        IDictionary<string, object> additionalData,
+        string jsonName)
+    {
+        ArgumentNullException.ThrowIfNull(assign);
+        ArgumentNullException.ThrowIfNull(additionalData);
+
+        if (IsCleared(propertyName))
+        {
+            additionalData[jsonName] = null!;
+            return true;
+        }
+
+        if (!IsSet(propertyName) || value is null)
+        {
+            return false;
+        }
+
+        assign(value);
+        return true;
+    }
+}
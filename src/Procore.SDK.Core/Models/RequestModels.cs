@@ -1,6 +1,7 @@
 using System;
 using System.Collections.Generic;
 using System.IO;
+using Procore.SDK.Shared.Http;
 
 namespace Procore.SDK.Core.Models;
 
@@ -33,32 +34,62 @@ public class CreateCompanyRequest
 /// <summary>
 /// Request model for updating a company.
 /// </summary>
-public class UpdateCompanyRequest
+public class UpdateCompanyRequest : PartialUpdateRequest
 {
+    private string? _name;
+    private string? _description;
+    private bool? _isActive;
+    private Address? _address;
+    private Dictionary<string, object>? _customFields;
+
     /// <summary>
     /// Gets or sets the name of the company.
     /// </summary>
-    public string? Name { get; set; }
+    public string? Name
+    {
+        get => _name;
+        set => Set(ref _name, value);
+    }
 
     /// <summary>
     /// Gets or sets the description of the company.
     /// </summary>
-    public string? Description { get; set; }
+    public string? Description
+    {
+        get => _description;
+        set => Set(ref _description, value);
+    }
 
     /// <summary>
     /// Gets or sets a value indicating whether the company is active.
     /// </summary>
-    public bool? IsActive { get; set; }
+    public bool? IsActive
+    {
+        get => _isActive;
+        set => Set(ref _isActive, value);
+    }
 
     /// <summary>
     /// Gets or sets the address information for the company.
     /// </summary>
-    public Address? Address { get; set; }
+    public Address? Address
+    {
+        get => _address;
+        set => Set(ref _address, value);
+    }
 
     /// <summary>
     /// Gets or sets the custom fields associated with the company.
     /// </summary>
-    public Dictionary<string, object>? CustomFields { get; set; }
+    public Dictionary<string, object>? CustomFields
+    {
+        get => _customFields;
+        set => Set(ref _customFields, value);
+    }
+
+    /// <inheritdoc />
+    protected override bool CanClear(string propertyName) =>
+        propertyName is nameof(Description) or nameof(Address);
 }
 
 /// <summary>
@@ -98,44 +129,86 @@ public class CreateUserRequest
 }
 
 /// <summary>
-/// Request model for updating a user.
+/// Request model for updating a user. Only the properties that are assigned are sent;
+/// use <see cref="PartialUpdateRequest.Clear"/> to clear <see cref="JobTitle"/> or <see cref="PhoneNumber"/>.
 /// </summary>
-public class UpdateUserRequest
+public class UpdateUserRequest : PartialUpdateRequest
 {
+    private string? _email;
+    private string? _firstName;
+    private string? _lastName;
+    private string? _jobTitle;
+    private string? _phoneNumber;
+    private bool? _isActive;
+    private Dictionary<string, object>? _customFields;
+
     /// <summary>
     /// Gets or sets the email address of the user.
     /// </summary>
-    public string? Email { get; set; }
+    public string? Email
+    {
+        get => _email;
+        set => Set(ref _email, value);
+    }
 
     /// <summary>
     /// Gets or sets the first name of the user.
     /// </summary>
-    public string? FirstName { get; set; }
+    public string? FirstName
+    {
+        get => _firstName;
+        set => Set(ref _firstName, value);
+    }
 
     /// <summary>
     /// Gets or sets the last name of the user.
     /// </summary>
-    public string? LastName { get; set; }
+    public string? LastName
+    {
+        get => _lastName;
+        set => Set(ref _lastName, value);
+    }
 
     /// <summary>
     /// Gets or sets the job title of the user.
     /// </summary>
-    public string? JobTitle { get; set; }
+    public string? JobTitle
+    {
+        get => _jobTitle;
+        set => Set(ref _jobTitle, value);
+    }
 
     /// <summary>
     /// Gets or sets the phone number of the user.
     /// </summary>
-    public string? PhoneNumber { get; set; }
+    public string? PhoneNumber
+    {
+        get => _phoneNumber;
+        set => Set(ref _phoneNumber, value);
+    }
 
     /// <summary>
     /// Gets or sets a value indicating whether the user is active.
     /// </summary>
-    public bool? IsActive { get; set; }
+    public bool? IsActive
+    {
+        get => _isActive;
+        set => Set(ref _isActive, value);
+    }
 
     /// <summary>
     /// Gets or sets the custom fields associated with the user.
+    /// The Users PATCH endpoint cannot update custom fields, so updates that assign this are rejected.
     /// </summary>
-    public Dictionary<string, object>? CustomFields { get; set; }
+    public Dictionary<string, object>? CustomFields
+    {
+        get => _customFields;
+        set => Set(ref _customFields, value);
+    }
+
+    /// <inheritdoc />
+    protected override bool CanClear(string propertyName) =>
+        propertyName is nameof(JobTitle) or nameof(PhoneNumber);
 }
 
 /// <summary>
@@ -155,6 +228,7 @@ public class UploadDocumentRequest
 
     /// <summary>
     /// Gets or sets the file stream containing the document data.
+    /// The stream is read as the request is sent and is not disposed by the client.
     /// </summary>
     public Stream FileStream { get; set; } = Stream.Null;
 
@@ -177,32 +251,90 @@ public class UploadDocumentRequest
     /// Gets or sets the custom fields associated with the document.
     /// </summary>
     public Dictionary<string, object>? CustomFields { get; set; }
+
+    /// <summary>
+    /// Gets or sets the ID of the folder to upload into. Uploads go to the root folder when null.
+    /// </summary>
+    public int? ParentId { get; set; }
+
+    /// <summary>
+    /// Gets or sets an optional receiver of upload progress.
+    /// </summary>
+    public IProgress<TransferProgress>? Progress { get; set; }
+}
+
+/// <summary>
+/// Options for streaming a document's content to a destination.
+/// </summary>
+public class DownloadDocumentOptions
+{
+    /// <summary>
+    /// Gets or sets the number of bytes requested per ranged GET (default: 8 MB).
+    /// Each chunk is a separate request, so a failed download can resume from the last completed chunk.
+    /// </summary>
+    public int ChunkSize { get; set; } = 8 * 1024 * 1024;
+
+    /// <summary>
+    /// Gets or sets the byte offset to start from when resuming a download (default: 0).
+    /// File downloads resume from an existing partial file of the same version instead.
+    /// </summary>
+    public long Offset { get; set; }
+
+    /// <summary>
+    /// Gets or sets an optional receiver of download progress.
+    /// </summary>
+    public IProgress<TransferProgress>? Progress { get; set; }
 }
 
 /// <summary>
 /// Request model for updating a document.
 /// </summary>
-public class UpdateDocumentRequest
+public class UpdateDocumentRequest : PartialUpdateRequest
 {
+    private string? _name;
+    private string? _description;
+    private bool? _isPrivate;
+    private Dictionary<string, object>? _customFields;
+
     /// <summary>
     /// Gets or sets the name of the document.
     /// </summary>
-    public string? Name { get; set; }
+    public string? Name
+    {
+        get => _name;
+        set => Set(ref _name, value);
+    }
 
     /// <summary>
     /// Gets or sets the description of the document.
     /// </summary>
-    public string? Description { get; set; }
+    public string? Description
+    {
+        get => _description;
+        set => Set(ref _description, value);
+    }
 
     /// <summary>
     /// Gets or sets a value indicating whether the document is private.
     /// </summary>
-    public bool? IsPrivate { get; set; }
+    public bool? IsPrivate
+    {
+        get => _isPrivate;
+        set => Set(ref _isPrivate, value);
+    }
 
     /// <summary>
     /// Gets or sets the custom fields associated with the document.
     /// </summary>
-    public Dictionary<string, object>? CustomFields { get; set; }
+    public Dictionary<string, object>? CustomFields
+    {
+        get => _customFields;
+        set => Set(ref _customFields, value);
+    }
+
+    /// <inheritdoc />
+    protected override bool CanClear(string propertyName) =>
+        propertyName is nameof(Description);
 }
 
 /// <summary>
@@ -244,25 +376,50 @@ public class CreateCustomFieldRequest
 /// <summary>
 /// Request model for updating a custom field.
 /// </summary>
-public class UpdateCustomFieldRequest
+public class UpdateCustomFieldRequest : PartialUpdateRequest
 {
+    private string? _name;
+    private bool? _isRequired;
+    private string? _defaultValue;
+    private string[]? _allowedValues;
+
     /// <summary>
     /// Gets or sets the name of the custom field.
     /// </summary>
-    public string? Name { get; set; }
+    public string? Name
+    {
+        get => _name;
+        set => Set(ref _name, value);
+    }
 
     /// <summary>
     /// Gets or sets a value indicating whether this custom field is required.
     /// </summary>
-    public bool? IsRequired { get; set; }
+    public bool? IsRequired
+    {
+        get => _isRequired;
+        set => Set(ref _isRequired, value);
+    }
 
     /// <summary>
     /// Gets or sets the default value for the custom field.
     /// </summary>
-    public string? DefaultValue { get; set; }
+    public string? DefaultValue
+    {
+        get => _defaultValue;
+        set => Set(ref _defaultValue, value);
+    }
 
     /// <summary>
     /// Gets or sets the allowed values for the custom field.
     /// </summary>
-    public string[]? AllowedValues { get; set; }
+    public string[]? AllowedValues
+    {
+        get => _allowedValues;
+        set => Set(ref _allowedValues, value);
+    }
+
+    /// <inheritdoc />
+    protected override bool CanClear(string propertyName) =>
+        propertyName is nameof(DefaultValue) or nameof(AllowedValues);
 }
\ No newline at end of file
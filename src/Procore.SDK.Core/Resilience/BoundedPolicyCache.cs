@@ -0,0 +1,64 @@
+using System;
+using System.Collections.Generic;
+
+namespace Procore.SDK.Core.Resilience;
+
+/// <summary>
+/// Thread-safe least-recently-used cache with a fixed number of entries.
+/// </summary>
+/// <typeparam name="TValue">The cached value type.</typeparam>
+internal sealed class BoundedPolicyCache<TValue>
+{
+    private readonly object _sync = new();
+    private readonly int _capacity;
+    private readonly Dictionary<string, LinkedListNode<KeyValuePair<string, TValue>>> _entries;
+    private readonly LinkedList<KeyValuePair<string, TValue>> _recency = new();
+
+    public BoundedPolicyCache(int capacity)
+    {
+        if (capacity < 1)
+            throw new ArgumentOutOfRangeException(nameof(capacity), "Capacity must be at least 1");
+
+        _capacity = capacity;
+        _entries = new Dictionary<string, LinkedListNode<KeyValuePair<string, TValue>>>(StringComparer.Ordinal);
+    }
+
+    public int Count
+    {
+        get
+        {
+            lock (_sync)
+            {
+                return _entries.Count;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Returns the cached value for a key, creating it if needed and evicting the least recently used entry when full.
+    /// The factory runs under the cache lock and must be fast and side-effect free.
+    /// </summary>
+    public TValue GetOrAdd(string key, Func<string, TValue> factory)
+    {
+        lock (_sync)
+        {
+            if (_entries.TryGetValue(key, out var node))
+            {
+                _recency.Remove(node);
+                _recency.AddFirst(node);
+                return node.Value.Value;
+            }
+
+            if (_entries.Count >= _capacity)
+            {
+                var oldest = _recency.Last!;
+                _recency.RemoveLast();
+                _entries.Remove(oldest.Value.Key);
+            }
+
+            node = _recency.AddFirst(new KeyValuePair<string, TValue>(key, factory(key)));
+            _entries[key] = node;
+            return node.Value.Value;
+        }
+    }
+}
@@ -0,0 +1,92 @@
+using System;
+using System.Threading;
+using Microsoft.Extensions.Options;
+
+namespace Procore.SDK.Core.Resilience;
+
+/// <summary>
+/// Global budget that limits hedges to a percentage of requests so that hedging cannot amplify load.
+/// Every request deposits a fraction of a hedge; sending a hedge withdraws a whole one.
+/// </summary>
+public sealed class HedgingBudget
+{
+    private const long Scale = 1000;
+
+    private readonly long _depositPerRequest;
+    private readonly long _capacity;
+    private long _balance;
+    private long _hedgesSent;
+    private long _hedgesRejected;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="HedgingBudget"/> class.
+    /// </summary>
+    /// <param name="options">The resilience options.</param>
+    public HedgingBudget(IOptions<ResilienceOptions> options)
+        : this((options ?? throw new ArgumentNullException(nameof(options))).Value.Hedging)
+    {
+    }
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="HedgingBudget"/> class.
+    /// </summary>
+    /// <param name="options">The hedging options.</param>
+    public HedgingBudget(HedgingOptions options)
+    {
+        ArgumentNullException.ThrowIfNull(options);
+
+        _depositPerRequest = (long)Math.Round(options.BudgetPercent / 100 * Scale);
+        _capacity = Math.Max(1, options.BudgetBurst) * Scale;
+    }
+
+    /// <summary>
+    /// Gets the number of hedges that have been allowed.
+    /// </summary>
+    public long HedgesSent => Interlocked.Read(ref _hedgesSent);
+
+    /// <summary>
+    /// Gets the number of hedges that were refused because the budget was exhausted.
+    /// </summary>
+    public long HedgesRejected => Interlocked.Read(ref _hedgesRejected);
+
+    /// <summary>
+    /// Records a request that is eligible for hedging, adding its share to the budget.
+    /// </summary>
+    public void RecordRequest()
+    {
+        if (_depositPerRequest == 0)
+        {
+            return;
+        }
+
+        long current, updated;
+        do
+        {
+            current = Interlocked.Read(ref _balance);
+            updated = Math.Min(_capacity, current + _depositPerRequest);
+        }
+        while (current != updated && Interlocked.CompareExchange(ref _balance, updated, current) != current);
+    }
+
+    /// <summary>
+    /// Tries to withdraw one hedge from the budget.
+    /// </summary>
+    /// <returns>True when the hedge may be sent; otherwise, false.</returns>
+    public bool TryAcquire()
+    {
+        long current;
+        do
+        {
+            current = Interlocked.Read(ref _balance);
+            if (current < Scale)
+            {
+                Interlocked.Increment(ref _hedgesRejected);
+                return false;
+            }
+        }
+        while (Interlocked.CompareExchange(ref _balance, current - Scale, current) != current);
+
+        Interlocked.Increment(ref _hedgesSent);
+        return true;
+    }
+}
@@ -1,5 +1,4 @@
 using System;
-using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Linq;
 using System.Net;
@@ -13,6 +12,7 @@ using Polly.CircuitBreaker;
 using Polly.Extensions.Http;
 using Polly.Timeout;
 using Procore.SDK.Core.Models;
+using Procore.SDK.Shared.Diagnostics;
 
 namespace Procore.SDK.Core.Resilience;
 
@@ -25,8 +25,8 @@ public class PolicyFactory : IDisposable
     private readonly ILogger<PolicyFactory> _logger;
     private readonly RandomNumberGenerator _random;
     
-    // Cache for policies to improve performance
-    private readonly ConcurrentDictionary<string, IAsyncPolicy<HttpResponseMessage>> _policyCache;
+    // Bounded cache of policy stacks keyed by circuit breaker scope (host, route template or operation)
+    private readonly BoundedPolicyCache<IAsyncPolicy<HttpResponseMessage>> _policyCache;
 
     /// <summary>
     /// Initializes a new instance of the PolicyFactory class.
@@ -38,19 +38,28 @@ public class PolicyFactory : IDisposable
         _options = options.Value;
         _logger = logger;
         _random = RandomNumberGenerator.Create();
-        _policyCache = new ConcurrentDictionary<string, IAsyncPolicy<HttpResponseMessage>>();
+        _policyCache = new BoundedPolicyCache<IAsyncPolicy<HttpResponseMessage>>(_options.MaxCachedPolicies);
     }
 
+    /// <summary>
+    /// Gets the number of policy stacks currently cached.
+    /// </summary>
+    public int CachedPolicyCount => _policyCache.Count;
+
     /// <summary>
     /// Creates a comprehensive resilience policy combining retry, circuit breaker, and timeout policies.
+    /// Requests in the same circuit breaker scope (see <see cref="CircuitBreakerOptions.Scope"/>) share one
+    /// policy stack and therefore one circuit breaker.
     /// </summary>
     /// <param name="context">The resilience context for the operation.</param>
     /// <returns>A combined async policy.</returns>
     public IAsyncPolicy<HttpResponseMessage> CreateHttpPolicy(ResilienceContext context)
     {
+        ArgumentNullException.ThrowIfNull(context);
+
         // Use cached policy for better performance
-        var cacheKey = GeneratePolicyKey(context.Operation);
-        return _policyCache.GetOrAdd(cacheKey, _ => CreateCombinedPolicy(context.Operation));
+        var cacheKey = GeneratePolicyKey(context);
+        return _policyCache.GetOrAdd(cacheKey, CreateCombinedPolicy);
     }
 
     /// <summary>
@@ -103,9 +112,12 @@ public class PolicyFactory : IDisposable
                 sleepDurationProvider: retryAttempt => CalculateDelay(retryAttempt),
                 onRetry: (outcome, timespan, retryCount, pollyContext) =>
                 {
+                    ProcoreTelemetry.RecordRetry(RouteTemplate.Normalize(pollyContext.OperationKey ?? operation), retryCount, timespan);
+
                     if (_options.Logging.LogRetryAttempts)
                     {
-                        LogRetryAttempt(operation, retryCount, timespan, outcome.Exception);
+                        // The policy is shared by its scope; prefer the concrete operation when the caller supplied it
+                        LogRetryAttempt(pollyContext.OperationKey ?? operation, retryCount, timespan, outcome.Exception);
                     }
                 });
     }
@@ -125,6 +137,7 @@ public class PolicyFactory : IDisposable
                 durationOfBreak: TimeSpan.FromSeconds(_options.CircuitBreaker.DurationOfBreakInSeconds),
                 onBreak: (result, duration) =>
                 {
+                    ProcoreTelemetry.RecordCircuitBreakerTransition(operation, "open");
                     if (_options.Logging.LogCircuitBreakerEvents)
                     {
                         LogCircuitBreakerOpened(operation, result.Exception ?? new Exception("Circuit breaker opened"), duration);
@@ -132,6 +145,7 @@ public class PolicyFactory : IDisposable
                 },
                 onReset: () =>
                 {
+                    ProcoreTelemetry.RecordCircuitBreakerTransition(operation, "closed");
                     if (_options.Logging.LogCircuitBreakerEvents)
                     {
                         LogCircuitBreakerReset(operation);
@@ -139,6 +153,7 @@ public class PolicyFactory : IDisposable
                 },
                 onHalfOpen: () =>
                 {
+                    ProcoreTelemetry.RecordCircuitBreakerTransition(operation, "half_open");
                     if (_options.Logging.LogCircuitBreakerEvents)
                     {
                         LogCircuitBreakerHalfOpen(operation);
@@ -157,16 +172,22 @@ public class PolicyFactory : IDisposable
     }
 
     /// <summary>
-    /// Generates a cache key for the policy based on operation characteristics.
+    /// Generates a cache key for the policy based on the configured circuit breaker scope.
     /// </summary>
-    /// <param name="operation">The operation name.</param>
+    /// <param name="context">The resilience context for the operation.</param>
     /// <returns>A cache key for the policy.</returns>
-    private string GeneratePolicyKey(string operation)
+    private string GeneratePolicyKey(ResilienceContext context)
     {
-        // For now, use a simple hash of the operation and current options
-        // This ensures different configurations get different cached policies
-        var optionsHash = _options.GetHashCode();
-        return $"{operation}_{optionsHash}";
+        return _options.CircuitBreaker.Scope switch
+        {
+            CircuitBreakerScope.Host when !string.IsNullOrEmpty(context.Host) => context.Host!,
+            // Templated so that IDs and query strings (e.g. search terms) neither multiply breakers nor reach metric tags
+            CircuitBreakerScope.Operation => RouteTemplate.Normalize(context.Operation),
+            // Per route; also used for host scope when the host is unknown
+            _ => string.IsNullOrEmpty(context.Host)
+                ? RouteTemplate.Normalize(context.Operation)
+                : $"{context.Host} {RouteTemplate.Normalize(context.Operation)}"
+        };
     }
 
     /// <summary>
@@ -0,0 +1,187 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace Procore.SDK.Core.Resilience;
+
+/// <summary>
+/// HTTP message handler that hedges idempotent requests: when the first attempt has not answered
+/// within the hedge delay, a second attempt is sent and whichever response arrives first is returned.
+/// </summary>
+/// <remarks>
+/// The hedge delay is the configured <see cref="HedgingOptions.DelayMs"/> or, once enough responses
+/// have been seen, the route's observed latency at <see cref="HedgingOptions.LatencyPercentile"/>.
+/// Hedges are drawn from a <see cref="HedgingBudget"/> shared by all requests. The losing attempt is
+/// cancelled, its response disposed and its failure observed. A request is hedged at most once even
+/// when the handler appears twice in a pipeline.
+/// </remarks>
+public class ProcoreHedgingHandler : DelegatingHandler
+{
+    private static readonly HttpRequestOptionsKey<bool> HedgedKey = new("Procore.Hedging.Hedged");
+
+    private readonly HedgingBudget _budget;
+    private readonly RouteLatencyTracker _latencyTracker;
+    private readonly ILogger<ProcoreHedgingHandler> _logger;
+    private readonly HedgingOptions _options;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="ProcoreHedgingHandler"/> class.
+    /// </summary>
+    /// <param name="budget">The hedge budget shared across handler instances.</param>
+    /// <param name="latencyTracker">The per-route latency tracker shared across handler instances.</param>
+    /// <param name="logger">The logger.</param>
+    /// <param name="options">The resilience options.</param>
+    public ProcoreHedgingHandler(
+        HedgingBudget budget,
+        RouteLatencyTracker latencyTracker,
+        ILogger<ProcoreHedgingHandler> logger,
+        IOptions<ResilienceOptions> options)
+    {
+        _budget = budget ?? throw new ArgumentNullException(nameof(budget));
+        _latencyTracker = latencyTracker ?? throw new ArgumentNullException(nameof(latencyTracker));
+        _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+        _options = (options ?? throw new ArgumentNullException(nameof(options))).Value.Hedging;
+    }
+
+    protected override async Task<HttpResponseMessage> SendAsync(
+        HttpRequestMessage request,
+        CancellationToken cancellationToken)
+    {
+        if (!_options.Enabled || !IsIdempotent(request.Method) || request.Content != null || request.RequestUri == null
+            || request.Options.TryGetValue(HedgedKey, out _))
+        {
+            return await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+        }
+
+        // Copied to the hedge by CloneRequest, so an inner hedging handler passes both attempts through
+        request.Options.Set(HedgedKey, true);
+
+        var route = RouteTemplate.FromRequest(request.Method, request.RequestUri);
+        _budget.RecordRequest();
+
+        using var primaryCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        var primary = SendAttemptAsync(request, route, primaryCts.Token);
+
+        using (var delayCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken))
+        {
+            var delay = Task.Delay(GetHedgeDelay(route), delayCts.Token);
+            if (await Task.WhenAny(primary, delay).ConfigureAwait(false) == primary)
+            {
+                delayCts.Cancel();
+                return await primary.ConfigureAwait(false);
+            }
+        }
+
+        if (cancellationToken.IsCancellationRequested || !_budget.TryAcquire())
+        {
+            return await primary.ConfigureAwait(false);
+        }
+
+        _logger.LogDebug("Hedging {Route} after no response within the hedge delay", route);
+
+        using var hedgeCts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        var hedge = SendAttemptAsync(CloneRequest(request), route, hedgeCts.Token);
+
+        var first = await Task.WhenAny(primary, hedge).ConfigureAwait(false);
+        var (second, secondCts) = first == primary ? (hedge, hedgeCts) : (primary, primaryCts);
+
+        if (first.Status == TaskStatus.RanToCompletion)
+        {
+            secondCts.Cancel();
+            DisposeWhenCompleted(second);
+
+            var response = first.Result;
+            response.RequestMessage = request;
+            return response;
+        }
+
+        // The first attempt to finish failed; the other one may still succeed
+        DisposeWhenCompleted(first);
+        var fallback = await second.ConfigureAwait(false);
+        fallback.RequestMessage = request;
+        return fallback;
+    }
+
+    private static bool IsIdempotent(HttpMethod method) =>
+        method == HttpMethod.Get || method == HttpMethod.Head;
+
+    /// <summary>
+    /// Gets the delay before a hedge is sent for the route.
+    /// </summary>
+    private TimeSpan GetHedgeDelay(string route)
+    {
+        var configured = TimeSpan.FromMilliseconds(_options.DelayMs);
+        if (!_options.UseObservedLatency)
+        {
+            return configured;
+        }
+
+        var observed = _latencyTracker.GetLatency(route, _options.LatencyPercentile, _options.MinimumSamples);
+        return observed.HasValue && observed.Value > TimeSpan.Zero ? observed.Value : configured;
+    }
+
+    /// <summary>
+    /// Sends one attempt and records its latency for the route.
+    /// </summary>
+    private async Task<HttpResponseMessage> SendAttemptAsync(
+        HttpRequestMessage request,
+        string route,
+        CancellationToken cancellationToken)
+    {
+        var startTimestamp = Stopwatch.GetTimestamp();
+        var response = await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+        _latencyTracker.Record(route, Stopwatch.GetTimestamp() - startTimestamp);
+        return response;
+    }
+
+    /// <summary>
+    /// Disposes the response of the losing attempt once it finishes and observes any failure.
+    /// </summary>
+    private static void DisposeWhenCompleted(Task<HttpResponseMessage> attempt)
+    {
+        _ = attempt.ContinueWith(
+            static task =>
+            {
+                if (task.Status == TaskStatus.RanToCompletion)
+                {
+                    task.Result.Dispose();
+                }
+                else
+                {
+                    _ = task.Exception;
+                }
+            },
+            CancellationToken.None,
+            TaskContinuationOptions.ExecuteSynchronously,
+            TaskScheduler.Default);
+    }
+
+    /// <summary>
+    /// Copies the request so that both attempts own an independent message.
+    /// </summary>
+    private static HttpRequestMessage CloneRequest(HttpRequestMessage request)
+    {
+        var clone = new HttpRequestMessage(request.Method, request.RequestUri)
+        {
+            Version = request.Version,
+            VersionPolicy = request.VersionPolicy
+        };
+
+        foreach (var header in request.Headers)
+        {
+            clone.Headers.TryAddWithoutValidation(header.Key, header.Value);
+        }
+
+        foreach (var option in request.Options)
+        {
+            ((IDictionary<string, object?>)clone.Options)[option.Key] = option.Value;
+        }
+
+        return clone;
+    }
+}
@@ -1,4 +1,5 @@
 using System;
+using System.Diagnostics;
 using System.Net.Http;
 using System.Threading;
 using System.Threading.Tasks;
@@ -7,6 +8,7 @@ using Microsoft.Extensions.Options;
 using Polly;
 using Polly.CircuitBreaker;
 using Polly.Timeout;
+using Procore.SDK.Shared.Diagnostics;
 using Serilog.Context;
 
 namespace Procore.SDK.Core.Resilience;
@@ -37,7 +39,12 @@ public class ProcoreResilienceHandler : DelegatingHandler
         // Create resilience context for this operation
         var operation = $"{request.Method} {request.RequestUri?.PathAndQuery}";
         var correlationId = GetOrCreateCorrelationId(request);
-        var context = new ResilienceContext(operation, correlationId);
+        var context = new ResilienceContext(operation, correlationId)
+        {
+            Host = request.RequestUri?.IsAbsoluteUri == true ? request.RequestUri.Host : null
+        };
+        var route = RouteTemplate.FromRequest(request.Method, request.RequestUri);
+        var isFirstAttempt = true;
 
         // Add correlation ID to logging context
         using (LogContext.PushProperty("CorrelationId", correlationId))
@@ -48,36 +55,44 @@ public class ProcoreResilienceHandler : DelegatingHandler
             try
             {
                 // Execute the request with resilience policies
-                var response = await policy.ExecuteAsync(async () =>
+                var response = await policy.ExecuteAsync(async _ =>
                 {
-                    var startTime = DateTimeOffset.UtcNow;
+                    if (!isFirstAttempt)
+                    {
+                        context.IncrementAttempt();
+                    }
+                    isFirstAttempt = false;
+
+                    using var activity = ProcoreTelemetry.StartHttpAttempt(route, request.Method.Method, context.AttemptNumber + 1);
+                    var startTimestamp = Stopwatch.GetTimestamp();
                     
                     try
                     {
                         var httpResponse = await base.SendAsync(request, cancellationToken);
+                        ProcoreTelemetry.StopHttpAttempt(activity, route, request.Method.Method, startTimestamp, (int)httpResponse.StatusCode, null);
                         
                         // Log successful request metrics
                         if (_options.Logging.LogPerformanceMetrics)
                         {
-                            var duration = DateTimeOffset.UtcNow - startTime;
-                            LogRequestMetrics(context, httpResponse.StatusCode, duration, true);
+                            LogRequestMetrics(context, httpResponse.StatusCode, GetElapsed(startTimestamp), true);
                         }
                         
                         return httpResponse;
                     }
                     catch (Exception ex)
                     {
+                        ProcoreTelemetry.StopHttpAttempt(activity, route, request.Method.Method, startTimestamp, null, ex);
+
                         // Log failed request metrics
                         if (_options.Logging.LogPerformanceMetrics)
                         {
-                            var duration = DateTimeOffset.UtcNow - startTime;
-                            LogRequestMetrics(context, null, duration, false);
+                            LogRequestMetrics(context, null, GetElapsed(startTimestamp), false);
                         }
                         
                         context.LastException = ex;
                         throw;
                     }
-                });
+                }, new Context(context.Operation));
 
                 return response;
             }
@@ -144,6 +159,9 @@ public class ProcoreResilienceHandler : DelegatingHandler
         return correlationId;
     }
 
+    private static TimeSpan GetElapsed(long startTimestamp) =>
+        TimeSpan.FromTicks((long)((Stopwatch.GetTimestamp() - startTimestamp) * ((double)TimeSpan.TicksPerSecond / Stopwatch.Frequency)));
+
     /// <summary>
     /// Logs request performance metrics.
     /// </summary>
@@ -23,6 +23,11 @@ public class ResilienceContext
     /// </summary>
     public string Operation { get; }
     
+    /// <summary>
+    /// The host the request is sent to, if known. Used when circuit breakers are scoped per host.
+    /// </summary>
+    public string? Host { get; set; }
+    
     /// <summary>
     /// Timestamp when the operation started.
     /// </summary>
@@ -32,6 +32,18 @@ public class ResilienceOptions
     /// Logging configuration for resilience events.
     /// </summary>
     public LoggingOptions Logging { get; set; } = new();
+
+    /// <summary>
+    /// Hedged request configuration for idempotent requests.
+    /// </summary>
+    public HedgingOptions Hedging { get; set; } = new();
+
+    /// <summary>
+    /// Maximum number of policy stacks kept by <see cref="PolicyFactory"/>; the least recently used
+    /// are evicted beyond this (default: 1000).
+    /// </summary>
+    [Range(1, 100000)]
+    public int MaxCachedPolicies { get; set; } = 1000;
 }
 
 /// <summary>
@@ -107,6 +119,34 @@ public class CircuitBreakerOptions
     /// Whether the circuit breaker is enabled (default: true).
     /// </summary>
     public bool Enabled { get; set; } = true;
+
+    /// <summary>
+    /// Which requests share a circuit breaker (default: <see cref="CircuitBreakerScope.Route"/>).
+    /// </summary>
+    public CircuitBreakerScope Scope { get; set; } = CircuitBreakerScope.Route;
+}
+
+/// <summary>
+/// Determines which requests share circuit breaker state.
+/// </summary>
+public enum CircuitBreakerScope
+{
+    /// <summary>
+    /// One circuit breaker per API host.
+    /// </summary>
+    Host,
+
+    /// <summary>
+    /// One circuit breaker per method and route template, e.g. <c>GET /rest/v1.0/companies/{id}/users</c>.
+    /// </summary>
+    Route,
+
+    /// <summary>
+    /// One circuit breaker per operation name as supplied in the <see cref="ResilienceContext"/>, with
+    /// identifier segments templated and the query string removed (see <see cref="RouteTemplate.Normalize"/>).
+    /// Unlike <see cref="Route"/>, the key does not include the host.
+    /// </summary>
+    Operation
 }
 
 /// <summary>
@@ -132,6 +172,54 @@ public class TimeoutOptions
     public bool Enabled { get; set; } = true;
 }
 
+/// <summary>
+/// Hedged request configuration options. A hedge is a second attempt of an idempotent request,
+/// sent when the first has not answered within the hedge delay; the first response wins.
+/// </summary>
+public class HedgingOptions
+{
+    /// <summary>
+    /// Whether idempotent requests are hedged (default: false).
+    /// </summary>
+    public bool Enabled { get; set; } = false;
+
+    /// <summary>
+    /// Delay before the hedge is sent in milliseconds, used until enough latencies have been
+    /// observed for the route (default: 1000ms).
+    /// </summary>
+    [Range(1, 60000)]
+    public int DelayMs { get; set; } = 1000;
+
+    /// <summary>
+    /// Whether the hedge delay follows the observed latency of each route (default: true).
+    /// </summary>
+    public bool UseObservedLatency { get; set; } = true;
+
+    /// <summary>
+    /// Latency percentile of the route used as the hedge delay (default: 0.95).
+    /// </summary>
+    [Range(0.5, 0.999)]
+    public double LatencyPercentile { get; set; } = 0.95;
+
+    /// <summary>
+    /// Number of responses that must be observed for a route before its latency is used (default: 20).
+    /// </summary>
+    [Range(1, 10000)]
+    public int MinimumSamples { get; set; } = 20;
+
+    /// <summary>
+    /// Hedges allowed as a percentage of requests, shared by all routes (default: 10).
+    /// </summary>
+    [Range(0, 100)]
+    public double BudgetPercent { get; set; } = 10;
+
+    /// <summary>
+    /// Maximum number of hedges that can be saved up for a burst of slow requests (default: 10).
+    /// </summary>
+    [Range(1, 1000)]
+    public int BudgetBurst { get; set; } = 10;
+}
+
 /// <summary>
 /// Logging configuration for resilience events.
 /// </summary>
@@ -0,0 +1,68 @@
+using System;
+using System.Collections.Concurrent;
+using Procore.SDK.Core.TypeMapping;
+
+namespace Procore.SDK.Core.Resilience;
+
+/// <summary>
+/// Tracks response latency per route template so that hedge delays can follow each route's observed latency.
+/// </summary>
+public sealed class RouteLatencyTracker
+{
+    private const int MaxRoutes = 1000;
+    private const long SamplesPerWindow = 10_000;
+
+    private readonly ConcurrentDictionary<string, LatencyHistogram> _routes = new(StringComparer.Ordinal);
+
+    /// <summary>
+    /// Gets the number of tracked routes.
+    /// </summary>
+    public int RouteCount => _routes.Count;
+
+    /// <summary>
+    /// Records the latency of a completed request.
+    /// </summary>
+    /// <param name="route">The route template of the request.</param>
+    /// <param name="elapsedTicks">The elapsed time in <see cref="System.Diagnostics.Stopwatch"/> ticks.</param>
+    public void Record(string route, long elapsedTicks)
+    {
+        ArgumentNullException.ThrowIfNull(route);
+
+        if (!_routes.TryGetValue(route, out var histogram))
+        {
+            if (_routes.Count >= MaxRoutes)
+            {
+                return;
+            }
+
+            histogram = _routes.GetOrAdd(route, _ => new LatencyHistogram());
+        }
+
+        // Start a fresh window now and then so the percentile follows changes in API latency
+        if (histogram.Count >= SamplesPerWindow)
+        {
+            histogram.Reset();
+        }
+
+        histogram.RecordTicks(elapsedTicks);
+    }
+
+    /// <summary>
+    /// Gets the latency of a route at the given percentile.
+    /// </summary>
+    /// <param name="route">The route template.</param>
+    /// <param name="percentile">The percentile between 0 and 1.</param>
+    /// <param name="minimumSamples">The number of samples required before the percentile is trusted.</param>
+    /// <returns>The latency, or null when too few samples have been recorded.</returns>
+    public TimeSpan? GetLatency(string route, double percentile, int minimumSamples)
+    {
+        ArgumentNullException.ThrowIfNull(route);
+
+        if (!_routes.TryGetValue(route, out var histogram) || histogram.Count < minimumSamples)
+        {
+            return null;
+        }
+
+        return TimeSpan.FromMilliseconds(histogram.GetPercentileMs(percentile));
+    }
+}
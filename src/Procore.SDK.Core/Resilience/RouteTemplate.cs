@@ -0,0 +1,110 @@
+using System;
+using System.Net.Http;
+
+namespace Procore.SDK.Core.Resilience;
+
+/// <summary>
+/// Normalizes request paths into route templates so that requests to the same endpoint share
+/// policies, metrics and log properties regardless of the IDs they address.
+/// </summary>
+/// <example>
+/// <c>GET /rest/v1.0/companies/123/users?page=2</c> becomes <c>GET /rest/v1.0/companies/{id}/users</c>.
+/// </example>
+public static class RouteTemplate
+{
+    /// <summary>
+    /// Placeholder substituted for identifier segments.
+    /// </summary>
+    public const string IdPlaceholder = "{id}";
+
+    /// <summary>
+    /// Creates the route template for a request.
+    /// </summary>
+    /// <param name="method">The HTTP method.</param>
+    /// <param name="requestUri">The request URI; relative URIs are supported.</param>
+    /// <returns>The method followed by the templated path, without query string.</returns>
+    public static string FromRequest(HttpMethod method, Uri? requestUri)
+    {
+        if (method == null)
+            throw new ArgumentNullException(nameof(method));
+
+        var path = requestUri == null
+            ? "/"
+            : requestUri.IsAbsoluteUri ? requestUri.AbsolutePath : requestUri.OriginalString;
+
+        return $"{method.Method} {NormalizePath(path)}";
+    }
+
+    /// <summary>
+    /// Normalizes an operation name of the form <c>"{METHOD} {path}?{query}"</c>.
+    /// Names that do not look like a request path are returned unchanged.
+    /// </summary>
+    /// <param name="operation">The operation name.</param>
+    /// <returns>The operation name with identifier segments templated and the query string removed.</returns>
+    public static string Normalize(string operation)
+    {
+        if (operation == null)
+            throw new ArgumentNullException(nameof(operation));
+
+        var pathStart = operation.IndexOf('/');
+        if (pathStart < 0)
+        {
+            return operation;
+        }
+
+        return operation.Substring(0, pathStart) + NormalizePath(operation.Substring(pathStart));
+    }
+
+    /// <summary>
+    /// Replaces identifier segments of a path with <see cref="IdPlaceholder"/> and removes the query string.
+    /// </summary>
+    /// <param name="path">The request path.</param>
+    /// <returns>The templated path.</returns>
+    public static string NormalizePath(string path)
+    {
+        if (path == null)
+            throw new ArgumentNullException(nameof(path));
+
+        var queryStart = path.IndexOfAny(new[] { '?', '#' });
+        if (queryStart >= 0)
+        {
+            path = path.Substring(0, queryStart);
+        }
+
+        var segments = path.Split('/');
+        var changed = false;
+        for (var i = 0; i < segments.Length; i++)
+        {
+            if (IsIdentifier(segments[i]))
+            {
+                segments[i] = IdPlaceholder;
+                changed = true;
+            }
+        }
+
+        return changed ? string.Join("/", segments) : path;
+    }
+
+    private static bool IsIdentifier(string segment)
+    {
+        if (segment.Length == 0)
+        {
+            return false;
+        }
+
+        if (Guid.TryParse(segment, out _))
+        {
+            return true;
+        }
+
+        foreach (var c in segment)
+        {
+            if (c < '0' || c > '9')
+            {
+                return false;
+            }
+        }
+
+        return true;
+    }
+}
@@ -0,0 +1,124 @@
+using System;
+using System.Collections.Generic;
+using System.Security.Cryptography;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Options;
+using Procore.SDK.Core.Models;
+using Procore.SDK.Shared.Authentication;
+
+namespace Procore.SDK.Core.Search;
+
+/// <summary>
+/// In-memory lookup indexes for Core resources whose list endpoints have no server-side filter:
+/// companies by name and company documents by content type and file extension.
+/// </summary>
+/// <remarks>
+/// Register as a singleton so that indexes outlive the scoped <see cref="ProcoreCoreClient"/>.
+/// What a caller may see depends on its credentials, so when a token manager is supplied every
+/// index is kept per access token (by its SHA-256 hash, as the HTTP response cache does) and one
+/// user's lookups never serve another's. Without a token manager all callers share one set of
+/// indexes, so the clients using the instance must share one set of credentials.
+/// </remarks>
+public sealed class CoreLookupIndexes
+{
+    private readonly LookupIndexCache<string, Company> _companies;
+    private readonly LookupIndexCache<(string Scope, int CompanyId), Document> _documents;
+    private readonly ITokenManager? _tokenManager;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="CoreLookupIndexes"/> class.
+    /// </summary>
+    /// <param name="options">Optional lookup index options.</param>
+    /// <param name="tokenManager">Optional token manager whose current access token scopes the indexes.</param>
+    public CoreLookupIndexes(IOptions<LookupIndexOptions>? options = null, ITokenManager? tokenManager = null)
+    {
+        var timeToLive = (options?.Value ?? new LookupIndexOptions()).TimeToLive;
+
+        _companies = new LookupIndexCache<string, Company>(company => new[] { company.Name }, timeToLive);
+        _documents = new LookupIndexCache<(string Scope, int CompanyId), Document>(GetDocumentTypeKeys, timeToLive);
+        _tokenManager = tokenManager;
+    }
+
+    /// <summary>
+    /// Gets the index of accessible companies keyed by name.
+    /// </summary>
+    /// <param name="load">Loads the accessible companies when the index is missing or expired.</param>
+    /// <param name="cancellationToken">Cancellation token for waiting on the index.</param>
+    /// <returns>The company index.</returns>
+    public async Task<LookupIndex<Company>> GetCompaniesAsync(Func<Task<IEnumerable<Company>>> load, CancellationToken cancellationToken = default)
+    {
+        var scope = await GetScopeAsync(cancellationToken).ConfigureAwait(false);
+        return await _companies.GetAsync(scope, load, cancellationToken).ConfigureAwait(false);
+    }
+
+    /// <summary>
+    /// Gets the index of a company's documents keyed by content type and file extension.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="load">Loads the company's documents when the index is missing or expired.</param>
+    /// <param name="cancellationToken">Cancellation token for waiting on the index.</param>
+    /// <returns>The document index.</returns>
+    public async Task<LookupIndex<Document>> GetDocumentsAsync(int companyId, Func<Task<IEnumerable<Document>>> load, CancellationToken cancellationToken = default)
+    {
+        var scope = await GetScopeAsync(cancellationToken).ConfigureAwait(false);
+        return await _documents.GetAsync((scope, companyId), load, cancellationToken).ConfigureAwait(false);
+    }
+
+    /// <summary>
+    /// Discards the company indexes of every access token so that the next lookup reloads them.
+    /// </summary>
+    public void InvalidateCompanies() => _companies.Clear();
+
+    /// <summary>
+    /// Discards a company's document indexes for every access token so that the next lookup reloads them.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    public void InvalidateDocuments(int companyId) => _documents.Invalidate(key => key.CompanyId == companyId);
+
+    /// <summary>
+    /// Discards every index.
+    /// </summary>
+    public void Clear()
+    {
+        _companies.Clear();
+        _documents.Clear();
+    }
+
+    /// <summary>
+    /// Gets the key scope for the current access token; empty when there is no token manager or token.
+    /// </summary>
+    private async Task<string> GetScopeAsync(CancellationToken cancellationToken)
+    {
+        if (_tokenManager == null)
+        {
+            return string.Empty;
+        }
+
+        var token = (await _tokenManager.GetAccessTokenAsync(cancellationToken).ConfigureAwait(false))?.Token;
+        return string.IsNullOrEmpty(token)
+            ? string.Empty
+            : Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(token)));
+    }
+
+    /// <summary>
+    /// Yields the content type and every dotted suffix of the file name, so that "plan.tar.gz"
+    /// is found under both "gz" and "tar.gz".
+    /// </summary>
+    private static IEnumerable<string?> GetDocumentTypeKeys(Document document)
+    {
+        yield return document.ContentType;
+
+        var fileName = document.FileName;
+        if (string.IsNullOrEmpty(fileName))
+        {
+            yield break;
+        }
+
+        for (var dot = fileName.IndexOf('.'); dot >= 0; dot = fileName.IndexOf('.', dot + 1))
+        {
+            yield return fileName.Substring(dot + 1);
+        }
+    }
+}
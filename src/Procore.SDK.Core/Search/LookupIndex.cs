@@ -0,0 +1,121 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace Procore.SDK.Core.Search;
+
+/// <summary>
+/// Immutable case-insensitive index over a snapshot of items, supporting exact and prefix lookups.
+/// </summary>
+/// <remarks>
+/// Keys are compared with <see cref="StringComparer.OrdinalIgnoreCase"/>, so nothing is case-folded
+/// per lookup. Exact lookups are a single dictionary probe; prefix lookups binary-search a sorted
+/// key array and walk only the matching range.
+/// </remarks>
+/// <typeparam name="T">The indexed item type.</typeparam>
+public sealed class LookupIndex<T> where T : class
+{
+    private static readonly StringComparer KeyComparer = StringComparer.OrdinalIgnoreCase;
+
+    private readonly Dictionary<string, T[]> _itemsByKey;
+    private readonly string[] _sortedKeys;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="LookupIndex{T}"/> class.
+    /// </summary>
+    /// <param name="items">The items to index.</param>
+    /// <param name="keySelector">Returns the keys an item is found under. Null and empty keys are ignored.</param>
+    public LookupIndex(IEnumerable<T> items, Func<T, IEnumerable<string?>> keySelector)
+    {
+        if (items == null) throw new ArgumentNullException(nameof(items));
+        if (keySelector == null) throw new ArgumentNullException(nameof(keySelector));
+
+        var groups = new Dictionary<string, List<T>>(KeyComparer);
+        var itemKeys = new HashSet<string>(KeyComparer);
+        var count = 0;
+
+        foreach (var item in items)
+        {
+            count++;
+            itemKeys.Clear();
+
+            foreach (var key in keySelector(item))
+            {
+                // An item is listed once per distinct key even if several of its fields share it
+                if (string.IsNullOrEmpty(key) || !itemKeys.Add(key))
+                {
+                    continue;
+                }
+
+                if (!groups.TryGetValue(key, out var group))
+                {
+                    group = new List<T>();
+                    groups.Add(key, group);
+                }
+
+                group.Add(item);
+            }
+        }
+
+        _itemsByKey = groups.ToDictionary(pair => pair.Key, pair => pair.Value.ToArray(), KeyComparer);
+        _sortedKeys = _itemsByKey.Keys.ToArray();
+        Array.Sort(_sortedKeys, KeyComparer);
+        Count = count;
+    }
+
+    /// <summary>
+    /// Gets the number of items in the index.
+    /// </summary>
+    public int Count { get; }
+
+    /// <summary>
+    /// Gets the items whose key equals <paramref name="key"/>, ignoring case, in source order.
+    /// </summary>
+    /// <param name="key">The key to look up.</param>
+    /// <returns>The matching items, or an empty list.</returns>
+    public IReadOnlyList<T> Find(string key)
+    {
+        if (key == null) throw new ArgumentNullException(nameof(key));
+
+        return _itemsByKey.TryGetValue(key, out var items) ? items : Array.Empty<T>();
+    }
+
+    /// <summary>
+    /// Gets the items with a key that starts with <paramref name="prefix"/>, ignoring case, ordered by key.
+    /// </summary>
+    /// <param name="prefix">The key prefix. An empty prefix matches every key.</param>
+    /// <param name="maxResults">The maximum number of items to return.</param>
+    /// <returns>The matching items, each returned once.</returns>
+    public IReadOnlyList<T> FindByPrefix(string prefix, int maxResults = int.MaxValue)
+    {
+        if (prefix == null) throw new ArgumentNullException(nameof(prefix));
+        if (maxResults <= 0) throw new ArgumentOutOfRangeException(nameof(maxResults), "Max results must be greater than zero");
+
+        // Keys sharing a prefix are contiguous in ordinal order, starting at the prefix's insertion point
+        var position = Array.BinarySearch(_sortedKeys, prefix, KeyComparer);
+        if (position < 0)
+        {
+            position = ~position;
+        }
+
+        var results = new List<T>();
+        var seen = new HashSet<T>(ReferenceEqualityComparer.Instance);
+
+        for (; position < _sortedKeys.Length && _sortedKeys[position].StartsWith(prefix, StringComparison.OrdinalIgnoreCase); position++)
+        {
+            foreach (var item in _itemsByKey[_sortedKeys[position]])
+            {
+                if (seen.Add(item))
+                {
+                    results.Add(item);
+                    if (results.Count == maxResults)
+                    {
+                        return results;
+                    }
+                }
+            }
+        }
+
+        return results;
+    }
+}
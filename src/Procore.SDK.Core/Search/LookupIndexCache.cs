@@ -0,0 +1,146 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Core.Search;
+
+/// <summary>
+/// Keeps one refreshable <see cref="LookupIndex{T}"/> per key, rebuilding it once it is older than
+/// the configured time to live.
+/// </summary>
+/// <remarks>
+/// Concurrent lookups of a missing or expired key share a single load. The load is not cancelled
+/// when one caller gives up; a load that fails is retried by the next lookup.
+/// </remarks>
+/// <typeparam name="TKey">The key the indexes are kept under, typically a company ID.</typeparam>
+/// <typeparam name="TItem">The indexed item type.</typeparam>
+public sealed class LookupIndexCache<TKey, TItem>
+    where TKey : notnull
+    where TItem : class
+{
+    private readonly ConcurrentDictionary<TKey, Entry> _entries = new();
+    private readonly Func<TItem, IEnumerable<string?>> _keySelector;
+    private readonly TimeSpan _timeToLive;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="LookupIndexCache{TKey, TItem}"/> class.
+    /// </summary>
+    /// <param name="keySelector">Returns the keys an item is found under.</param>
+    /// <param name="timeToLive">How long a built index is served before it is rebuilt.</param>
+    public LookupIndexCache(Func<TItem, IEnumerable<string?>> keySelector, TimeSpan timeToLive)
+    {
+        if (timeToLive < TimeSpan.Zero) throw new ArgumentOutOfRangeException(nameof(timeToLive), "Time to live cannot be negative");
+
+        _keySelector = keySelector ?? throw new ArgumentNullException(nameof(keySelector));
+        _timeToLive = timeToLive;
+    }
+
+    /// <summary>
+    /// Gets the index for a key, loading the items and building it if it is missing or expired.
+    /// </summary>
+    /// <param name="key">The key of the index.</param>
+    /// <param name="load">Loads the items to index.</param>
+    /// <param name="cancellationToken">Cancellation token for waiting on the index.</param>
+    /// <returns>The index.</returns>
+    public Task<LookupIndex<TItem>> GetAsync(TKey key, Func<Task<IEnumerable<TItem>>> load, CancellationToken cancellationToken = default)
+    {
+        if (load == null) throw new ArgumentNullException(nameof(load));
+
+        var entry = _entries.AddOrUpdate(
+            key,
+            _ => new Entry(this, load),
+            (_, existing) => existing.IsUsable ? existing : new Entry(this, load));
+
+        return entry.Index.WaitAsync(cancellationToken);
+    }
+
+    /// <summary>
+    /// Discards the index for a key so that the next lookup rebuilds it.
+    /// </summary>
+    /// <param name="key">The key of the index.</param>
+    public void Invalidate(TKey key) => _entries.TryRemove(key, out _);
+
+    /// <summary>
+    /// Discards the indexes for every key that matches a predicate.
+    /// </summary>
+    /// <param name="match">Returns true for the keys to discard.</param>
+    public void Invalidate(Func<TKey, bool> match)
+    {
+        if (match == null) throw new ArgumentNullException(nameof(match));
+
+        foreach (var key in _entries.Keys)
+        {
+            if (match(key))
+            {
+                _entries.TryRemove(key, out _);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Discards every index.
+    /// </summary>
+    public void Clear() => _entries.Clear();
+
+    private async Task<LookupIndex<TItem>> BuildAsync(Func<Task<IEnumerable<TItem>>> load, Entry entry)
+    {
+        var items = await load().ConfigureAwait(false);
+        var index = new LookupIndex<TItem>(items, _keySelector);
+        entry.ExpiresAt = Environment.TickCount64 + (long)_timeToLive.TotalMilliseconds;
+        RemoveExpired();
+        return index;
+    }
+
+    /// <summary>
+    /// Drops expired indexes so that keys which are never looked up again, such as those of a
+    /// replaced access token, do not accumulate.
+    /// </summary>
+    private void RemoveExpired()
+    {
+        var now = Environment.TickCount64;
+        foreach (var pair in _entries)
+        {
+            if (now >= pair.Value.ExpiresAt)
+            {
+                ((ICollection<KeyValuePair<TKey, Entry>>)_entries).Remove(pair);
+            }
+        }
+    }
+
+    private sealed class Entry
+    {
+        private readonly Lazy<Task<LookupIndex<TItem>>> _index;
+
+        public Entry(LookupIndexCache<TKey, TItem> owner, Func<Task<IEnumerable<TItem>>> load)
+        {
+            // Lazy so that an entry discarded by a lost AddOrUpdate race never starts a load
+            _index = new Lazy<Task<LookupIndex<TItem>>>(() => owner.BuildAsync(load, this));
+        }
+
+        public long ExpiresAt { get; set; } = long.MaxValue;
+
+        public Task<LookupIndex<TItem>> Index => _index.Value;
+
+        public bool IsUsable
+        {
+            get
+            {
+                if (!_index.IsValueCreated)
+                {
+                    return true;
+                }
+
+                var index = _index.Value;
+                if (index.IsFaulted || index.IsCanceled)
+                {
+                    return false;
+                }
+
+                // ExpiresAt is written before the build task completes
+                return !index.IsCompleted || Environment.TickCount64 < ExpiresAt;
+            }
+        }
+    }
+}
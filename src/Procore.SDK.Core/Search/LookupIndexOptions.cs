@@ -0,0 +1,20 @@
+using System;
+
+namespace Procore.SDK.Core.Search;
+
+/// <summary>
+/// Configuration options for the in-memory lookup indexes kept by <see cref="CoreLookupIndexes"/>.
+/// </summary>
+public class LookupIndexOptions
+{
+    /// <summary>
+    /// Configuration section name in appsettings.json.
+    /// </summary>
+    public const string SectionName = "Procore:LookupIndex";
+
+    /// <summary>
+    /// Gets or sets how long an index is served before the next lookup rebuilds it from the API.
+    /// <see cref="TimeSpan.Zero"/> rebuilds on every lookup. Default: 5 minutes.
+    /// </summary>
+    public TimeSpan TimeToLive { get; set; } = TimeSpan.FromMinutes(5);
+}
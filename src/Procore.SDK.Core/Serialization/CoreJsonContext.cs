@@ -0,0 +1,18 @@
+using System.Collections.Generic;
+using System.Text.Json.Serialization;
+using Procore.SDK.Core.Sync;
+
+namespace Procore.SDK.Core.Serialization;
+
+/// <summary>
+/// Source-generated serialization metadata for the JSON the Core package reads and writes itself.
+/// </summary>
+/// <remarks>
+/// Replaces reflection-based serialization so checkpoints and error bodies can still be read
+/// after IL trimming and under Native AOT.
+/// </remarks>
+[JsonSerializable(typeof(SyncCheckpoint))]
+[JsonSerializable(typeof(Dictionary<string, object>))]
+internal sealed partial class CoreJsonContext : JsonSerializerContext
+{
+}
@@ -0,0 +1,150 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace Procore.SDK.Core.Sync;
+
+/// <summary>
+/// Yields the records of a resource that were created, updated or deleted since the last run,
+/// persisting a per-resource, per-company checkpoint between runs.
+/// </summary>
+/// <remarks>
+/// Resources that support updated-at filtering are listed from the stored high-water mark only.
+/// Other resources are listed in full and compared with the content hashes of the previous run.
+/// </remarks>
+public class DeltaSyncEngine
+{
+    private readonly ISyncCheckpointStore _checkpointStore;
+    private readonly DeltaSyncOptions _options;
+    private readonly ILogger<DeltaSyncEngine>? _logger;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="DeltaSyncEngine"/> class.
+    /// </summary>
+    /// <param name="checkpointStore">Store for checkpoints between runs.</param>
+    /// <param name="options">Optional delta sync options.</param>
+    /// <param name="logger">Optional logger for diagnostic information.</param>
+    public DeltaSyncEngine(
+        ISyncCheckpointStore checkpointStore,
+        IOptions<DeltaSyncOptions>? options = null,
+        ILogger<DeltaSyncEngine>? logger = null)
+    {
+        _checkpointStore = checkpointStore ?? throw new ArgumentNullException(nameof(checkpointStore));
+        _options = options?.Value ?? new DeltaSyncOptions();
+        _logger = logger;
+    }
+
+    /// <summary>
+    /// Yields the changes to a resource since the last completed sync.
+    /// The first sync of a resource reports every record as created.
+    /// </summary>
+    /// <remarks>
+    /// The checkpoint is saved only once the sequence has been enumerated to the end, so a run that
+    /// is abandoned or fails part-way is repeated in full next time.
+    /// </remarks>
+    /// <typeparam name="T">The record type.</typeparam>
+    /// <param name="resource">The resource to synchronize.</param>
+    /// <param name="companyId">The company the resource belongs to.</param>
+    /// <param name="cancellationToken">Cancellation token for the operation.</param>
+    /// <returns>The created, updated and deleted records.</returns>
+    public async IAsyncEnumerable<SyncChange<T>> SyncAsync<T>(
+        SyncResource<T> resource,
+        int companyId,
+        [EnumeratorCancellation] CancellationToken cancellationToken = default)
+    {
+        if (resource == null)
+            throw new ArgumentNullException(nameof(resource));
+
+        var startedAt = DateTimeOffset.UtcNow;
+        var checkpoint = await _checkpointStore.GetAsync(resource.Name, companyId, cancellationToken).ConfigureAwait(false)
+            ?? new SyncCheckpoint { Resource = resource.Name, CompanyId = companyId };
+
+        var fullListing = RequiresFullListing(resource, checkpoint, startedAt);
+        var since = fullListing ? null : checkpoint.HighWaterMark - _options.OverlapWindow;
+
+        _logger?.LogDebug("Syncing {Resource} for company {CompanyId} {Mode}",
+            resource.Name, companyId, fullListing ? "with a full listing" : $"from {since:O}");
+
+        var records = await resource.FetchAsync(since, cancellationToken).ConfigureAwait(false);
+
+        var hashes = checkpoint.RecordHashes;
+        var seen = fullListing ? new HashSet<string>(StringComparer.Ordinal) : null;
+        var highWaterMark = checkpoint.HighWaterMark;
+        int created = 0, updated = 0, deleted = 0;
+
+        foreach (var record in records)
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+
+            var key = resource.KeySelector(record);
+            var updatedAt = resource.UpdatedAtSelector?.Invoke(record);
+            if (updatedAt != null && (highWaterMark == null || updatedAt > highWaterMark))
+            {
+                highWaterMark = updatedAt;
+            }
+
+            if (resource.IsDeletedSelector?.Invoke(record) == true)
+            {
+                if (hashes.Remove(key))
+                {
+                    deleted++;
+                    yield return new SyncChange<T>(SyncChangeKind.Deleted, key, record);
+                }
+                continue;
+            }
+
+            seen?.Add(key);
+            var hash = resource.HashSelector(record);
+
+            if (!hashes.TryGetValue(key, out var previousHash))
+            {
+                hashes[key] = hash;
+                created++;
+                yield return new SyncChange<T>(SyncChangeKind.Created, key, record);
+            }
+            else if (!string.Equals(previousHash, hash, StringComparison.Ordinal))
+            {
+                hashes[key] = hash;
+                updated++;
+                yield return new SyncChange<T>(SyncChangeKind.Updated, key, record);
+            }
+        }
+
+        if (seen != null)
+        {
+            foreach (var missingKey in hashes.Keys.Where(key => !seen.Contains(key)).ToList())
+            {
+                hashes.Remove(missingKey);
+                deleted++;
+                yield return new SyncChange<T>(SyncChangeKind.Deleted, missingKey, default);
+            }
+        }
+
+        checkpoint.HighWaterMark = highWaterMark;
+        checkpoint.LastSyncedAt = startedAt;
+        if (fullListing)
+        {
+            checkpoint.LastFullSyncAt = startedAt;
+        }
+
+        await _checkpointStore.SaveAsync(checkpoint, cancellationToken).ConfigureAwait(false);
+
+        _logger?.LogInformation("Synced {Resource} for company {CompanyId}: {Created} created, {Updated} updated, {Deleted} deleted",
+            resource.Name, companyId, created, updated, deleted);
+    }
+
+    private bool RequiresFullListing<T>(SyncResource<T> resource, SyncCheckpoint checkpoint, DateTimeOffset now)
+    {
+        if (!resource.SupportsUpdatedSince || checkpoint.HighWaterMark == null)
+        {
+            return true;
+        }
+
+        var interval = _options.FullReconciliationInterval;
+        return interval != null && (checkpoint.LastFullSyncAt == null || now - checkpoint.LastFullSyncAt.Value >= interval.Value);
+    }
+}
@@ -0,0 +1,27 @@
+using System;
+
+namespace Procore.SDK.Core.Sync;
+
+/// <summary>
+/// Configuration options for <see cref="DeltaSyncEngine"/>.
+/// </summary>
+public class DeltaSyncOptions
+{
+    /// <summary>
+    /// Configuration section name in appsettings.json.
+    /// </summary>
+    public const string SectionName = "Procore:DeltaSync";
+
+    /// <summary>
+    /// Gets or sets how far before the high-water mark an incremental listing starts, to tolerate
+    /// clock skew and records committed out of order. Records re-read in the overlap are not
+    /// reported again unless their content changed. Default: 1 minute.
+    /// </summary>
+    public TimeSpan OverlapWindow { get; set; } = TimeSpan.FromMinutes(1);
+
+    /// <summary>
+    /// Gets or sets how often an incremental resource is listed in full so that deletions without
+    /// tombstones are detected. Null disables periodic full listings. Default: 7 days.
+    /// </summary>
+    public TimeSpan? FullReconciliationInterval { get; set; } = TimeSpan.FromDays(7);
+}
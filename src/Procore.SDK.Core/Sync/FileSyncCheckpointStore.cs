@@ -0,0 +1,108 @@
+using System;
+using System.IO;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using Procore.SDK.Core.Serialization;
+
+namespace Procore.SDK.Core.Sync;
+
+/// <summary>
+/// Checkpoint store that keeps one JSON file per resource and company in a directory.
+/// Files are written to a temporary path and moved into place so that an interrupted
+/// write never leaves a truncated checkpoint behind.
+/// </summary>
+public sealed class FileSyncCheckpointStore : ISyncCheckpointStore
+{
+    private readonly string _directory;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="FileSyncCheckpointStore"/> class.
+    /// </summary>
+    /// <param name="directory">Directory in which checkpoint files are stored. Created if missing.</param>
+    public FileSyncCheckpointStore(string directory)
+    {
+        if (string.IsNullOrWhiteSpace(directory))
+            throw new ArgumentException("Value cannot be null or whitespace.", nameof(directory));
+
+        _directory = directory;
+    }
+
+    /// <inheritdoc />
+    public async Task<SyncCheckpoint?> GetAsync(string resource, int companyId, CancellationToken cancellationToken = default)
+    {
+        if (string.IsNullOrEmpty(resource))
+            throw new ArgumentException("Resource cannot be null or empty", nameof(resource));
+
+        var path = GetPath(resource, companyId);
+        if (!File.Exists(path))
+        {
+            return null;
+        }
+
+        try
+        {
+            await using var stream = File.OpenRead(path);
+            return await JsonSerializer.DeserializeAsync(stream, CoreJsonContext.Default.SyncCheckpoint, cancellationToken).ConfigureAwait(false);
+        }
+        catch (JsonException)
+        {
+            // Corrupted checkpoint: start over with a full sync
+            return null;
+        }
+    }
+
+    /// <inheritdoc />
+    public async Task SaveAsync(SyncCheckpoint checkpoint, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(checkpoint);
+        if (string.IsNullOrEmpty(checkpoint.Resource))
+            throw new ArgumentException("Checkpoint resource cannot be null or empty", nameof(checkpoint));
+
+        Directory.CreateDirectory(_directory);
+
+        var path = GetPath(checkpoint.Resource, checkpoint.CompanyId);
+        var tempPath = path + "." + Guid.NewGuid().ToString("N") + ".tmp";
+
+        try
+        {
+            await using (var stream = File.Create(tempPath))
+            {
+                await JsonSerializer.SerializeAsync(stream, checkpoint, CoreJsonContext.Default.SyncCheckpoint, cancellationToken).ConfigureAwait(false);
+            }
+
+            File.Move(tempPath, path, overwrite: true);
+        }
+        finally
+        {
+            if (File.Exists(tempPath))
+            {
+                File.Delete(tempPath);
+            }
+        }
+    }
+
+    /// <inheritdoc />
+    public Task DeleteAsync(string resource, int companyId, CancellationToken cancellationToken = default)
+    {
+        if (string.IsNullOrEmpty(resource))
+            throw new ArgumentException("Resource cannot be null or empty", nameof(resource));
+
+        var path = GetPath(resource, companyId);
+        if (File.Exists(path))
+        {
+            File.Delete(path);
+        }
+
+        return Task.CompletedTask;
+    }
+
+    private string GetPath(string resource, int companyId)
+    {
+        // Resource names contain path separators, so hash them into a safe file name
+        var hash = Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes($"{companyId}|{resource}")));
+        return Path.Combine(_directory, $"{hash}.json");
+    }
+}
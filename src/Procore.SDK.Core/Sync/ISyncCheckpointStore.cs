@@ -0,0 +1,34 @@
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Core.Sync;
+
+/// <summary>
+/// Stores delta sync checkpoints between runs.
+/// </summary>
+public interface ISyncCheckpointStore
+{
+    /// <summary>
+    /// Gets the checkpoint for a resource within a company.
+    /// </summary>
+    /// <param name="resource">The resource name.</param>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="cancellationToken">Cancellation token for the operation.</param>
+    /// <returns>The checkpoint, or null if the resource has never been synced.</returns>
+    Task<SyncCheckpoint?> GetAsync(string resource, int companyId, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Stores a checkpoint, replacing any previous one for the same resource and company.
+    /// </summary>
+    /// <param name="checkpoint">The checkpoint to store.</param>
+    /// <param name="cancellationToken">Cancellation token for the operation.</param>
+    Task SaveAsync(SyncCheckpoint checkpoint, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Removes the checkpoint for a resource within a company so that the next sync starts from scratch.
+    /// </summary>
+    /// <param name="resource">The resource name.</param>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="cancellationToken">Cancellation token for the operation.</param>
+    Task DeleteAsync(string resource, int companyId, CancellationToken cancellationToken = default);
+}
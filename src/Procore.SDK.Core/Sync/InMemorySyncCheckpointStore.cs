@@ -0,0 +1,54 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Core.Sync;
+
+/// <summary>
+/// In-memory checkpoint store. Checkpoints are lost when the process exits; use
+/// <see cref="FileSyncCheckpointStore"/> to resume across runs.
+/// </summary>
+public sealed class InMemorySyncCheckpointStore : ISyncCheckpointStore
+{
+    private readonly ConcurrentDictionary<(string Resource, int CompanyId), SyncCheckpoint> _checkpoints = new();
+
+    /// <inheritdoc />
+    public Task<SyncCheckpoint?> GetAsync(string resource, int companyId, CancellationToken cancellationToken = default)
+    {
+        if (string.IsNullOrEmpty(resource))
+            throw new ArgumentException("Resource cannot be null or empty", nameof(resource));
+
+        return Task.FromResult(_checkpoints.TryGetValue((resource, companyId), out var checkpoint) ? Copy(checkpoint) : null);
+    }
+
+    /// <inheritdoc />
+    public Task SaveAsync(SyncCheckpoint checkpoint, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(checkpoint);
+
+        _checkpoints[(checkpoint.Resource, checkpoint.CompanyId)] = Copy(checkpoint);
+        return Task.CompletedTask;
+    }
+
+    /// <inheritdoc />
+    public Task DeleteAsync(string resource, int companyId, CancellationToken cancellationToken = default)
+    {
+        if (string.IsNullOrEmpty(resource))
+            throw new ArgumentException("Resource cannot be null or empty", nameof(resource));
+
+        _checkpoints.TryRemove((resource, companyId), out _);
+        return Task.CompletedTask;
+    }
+
+    private static SyncCheckpoint Copy(SyncCheckpoint checkpoint) => new()
+    {
+        Resource = checkpoint.Resource,
+        CompanyId = checkpoint.CompanyId,
+        HighWaterMark = checkpoint.HighWaterMark,
+        LastSyncedAt = checkpoint.LastSyncedAt,
+        LastFullSyncAt = checkpoint.LastFullSyncAt,
+        RecordHashes = new Dictionary<string, string>(checkpoint.RecordHashes, StringComparer.Ordinal)
+    };
+}
@@ -0,0 +1,58 @@
+namespace Procore.SDK.Core.Sync;
+
+/// <summary>
+/// Kind of change reported by a delta sync.
+/// </summary>
+public enum SyncChangeKind
+{
+    /// <summary>
+    /// The record was not present at the last checkpoint.
+    /// </summary>
+    Created,
+
+    /// <summary>
+    /// The record was present at the last checkpoint and its content has changed.
+    /// </summary>
+    Updated,
+
+    /// <summary>
+    /// The record was present at the last checkpoint and has since been removed.
+    /// </summary>
+    Deleted
+}
+
+/// <summary>
+/// A single record change yielded by <see cref="DeltaSyncEngine"/>.
+/// </summary>
+/// <typeparam name="T">The record type.</typeparam>
+public sealed class SyncChange<T>
+{
+    /// <summary>
+    /// Initializes a new instance of the <see cref="SyncChange{T}"/> class.
+    /// </summary>
+    /// <param name="kind">The kind of change.</param>
+    /// <param name="key">The record key.</param>
+    /// <param name="item">The current record, or the tombstone returned by the API for deletions if any.</param>
+    public SyncChange(SyncChangeKind kind, string key, T? item)
+    {
+        Kind = kind;
+        Key = key;
+        Item = item;
+    }
+
+    /// <summary>
+    /// Gets the kind of change.
+    /// </summary>
+    public SyncChangeKind Kind { get; }
+
+    /// <summary>
+    /// Gets the key of the changed record.
+    /// </summary>
+    public string Key { get; }
+
+    /// <summary>
+    /// Gets the current record. For deletions this is the tombstone returned by the API, or
+    /// the default value when the deletion was detected by the record disappearing from a full listing.
+    /// </summary>
+    public T? Item { get; }
+}
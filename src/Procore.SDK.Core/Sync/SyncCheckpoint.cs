@@ -0,0 +1,42 @@
+using System;
+using System.Collections.Generic;
+
+namespace Procore.SDK.Core.Sync;
+
+/// <summary>
+/// Persisted state of a delta sync for one resource within one company.
+/// </summary>
+public class SyncCheckpoint
+{
+    /// <summary>
+    /// Gets or sets the resource name, e.g. "observations/project/42".
+    /// </summary>
+    public string Resource { get; set; } = string.Empty;
+
+    /// <summary>
+    /// Gets or sets the company the resource belongs to.
+    /// </summary>
+    public int CompanyId { get; set; }
+
+    /// <summary>
+    /// Gets or sets the greatest updated-at timestamp seen so far, or null before the first sync
+    /// or for resources without one.
+    /// </summary>
+    public DateTimeOffset? HighWaterMark { get; set; }
+
+    /// <summary>
+    /// Gets or sets when the last sync completed.
+    /// </summary>
+    public DateTimeOffset? LastSyncedAt { get; set; }
+
+    /// <summary>
+    /// Gets or sets when the resource was last listed in full.
+    /// </summary>
+    public DateTimeOffset? LastFullSyncAt { get; set; }
+
+    /// <summary>
+    /// Gets or sets the content hash of every known record, keyed by record key.
+    /// Used to tell created from updated records and to detect deletions.
+    /// </summary>
+    public Dictionary<string, string> RecordHashes { get; set; } = new(StringComparer.Ordinal);
+}
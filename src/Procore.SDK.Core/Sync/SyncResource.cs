@@ -0,0 +1,200 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics.CodeAnalysis;
+using System.Security.Cryptography;
+using System.Text.Json;
+using System.Text.Json.Serialization.Metadata;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Core.Sync;
+
+/// <summary>
+/// Describes how <see cref="DeltaSyncEngine"/> lists and identifies the records of one resource.
+/// </summary>
+/// <typeparam name="T">The record type.</typeparam>
+/// <remarks>
+/// Records are hashed to detect updates. The factory overloads taking a <see cref="JsonTypeInfo{T}"/>
+/// hash the source-generated JSON of a record and are safe to trim and publish with Native AOT; the
+/// overloads without one serialize records by reflection.
+/// </remarks>
+public sealed class SyncResource<T>
+{
+    private const string ReflectionHashMessage =
+        "The default record hash serializes records by reflection. Pass a JsonTypeInfo<T> from a source-generated JsonSerializerContext instead.";
+
+    private readonly Func<T, string> _hashSelector;
+
+    private SyncResource(
+        string name,
+        Func<T, string> keySelector,
+        Func<DateTimeOffset?, CancellationToken, Task<IEnumerable<T>>> fetchAsync,
+        Func<T, DateTimeOffset?>? updatedAtSelector,
+        Func<T, string> hashSelector)
+    {
+        if (string.IsNullOrEmpty(name))
+            throw new ArgumentException("Resource name cannot be null or empty", nameof(name));
+
+        Name = name;
+        KeySelector = keySelector ?? throw new ArgumentNullException(nameof(keySelector));
+        FetchAsync = fetchAsync ?? throw new ArgumentNullException(nameof(fetchAsync));
+        UpdatedAtSelector = updatedAtSelector;
+        _hashSelector = hashSelector;
+    }
+
+    /// <summary>
+    /// Gets the resource name used to key checkpoints, e.g. "observations/project/42".
+    /// </summary>
+    public string Name { get; }
+
+    /// <summary>
+    /// Gets the function returning the stable key of a record.
+    /// </summary>
+    public Func<T, string> KeySelector { get; }
+
+    /// <summary>
+    /// Gets the function listing records. It receives the lower bound of the updated-at window,
+    /// or null when a full listing is required.
+    /// </summary>
+    public Func<DateTimeOffset?, CancellationToken, Task<IEnumerable<T>>> FetchAsync { get; }
+
+    /// <summary>
+    /// Gets the function returning when a record was last updated, or null for resources
+    /// that cannot be filtered server-side.
+    /// </summary>
+    public Func<T, DateTimeOffset?>? UpdatedAtSelector { get; }
+
+    /// <summary>
+    /// Gets a value indicating whether the API can filter this resource by updated-at.
+    /// </summary>
+    public bool SupportsUpdatedSince => UpdatedAtSelector != null;
+
+    /// <summary>
+    /// Gets or sets a function identifying tombstone records (e.g. those with a deleted-at timestamp)
+    /// that should be reported as deletions.
+    /// </summary>
+    public Func<T, bool>? IsDeletedSelector { get; init; }
+
+    /// <summary>
+    /// Gets or sets a function computing the content hash of a record. Defaults to a SHA-256 hash
+    /// of the record's JSON serialization.
+    /// </summary>
+    public Func<T, string> HashSelector
+    {
+        get => _hashSelector;
+        init => _hashSelector = value ?? throw new ArgumentNullException(nameof(value));
+    }
+
+    /// <summary>
+    /// Creates a resource whose listing can be filtered server-side by updated-at, hashing records by reflection.
+    /// </summary>
+    /// <param name="name">The resource name.</param>
+    /// <param name="keySelector">Returns the stable key of a record.</param>
+    /// <param name="updatedAtSelector">Returns when a record was last updated.</param>
+    /// <param name="fetchUpdatedSinceAsync">Lists records updated at or after the given time, or all records when it is null.</param>
+    /// <returns>The resource definition.</returns>
+    [RequiresUnreferencedCode(ReflectionHashMessage)]
+#if NET7_0_OR_GREATER
+    [RequiresDynamicCode(ReflectionHashMessage)]
+#endif
+    public static SyncResource<T> Incremental(
+        string name,
+        Func<T, string> keySelector,
+        Func<T, DateTimeOffset?> updatedAtSelector,
+        Func<DateTimeOffset?, CancellationToken, Task<IEnumerable<T>>> fetchUpdatedSinceAsync)
+    {
+        return new SyncResource<T>(
+            name,
+            keySelector,
+            fetchUpdatedSinceAsync,
+            updatedAtSelector ?? throw new ArgumentNullException(nameof(updatedAtSelector)),
+            HashByReflection);
+    }
+
+    /// <summary>
+    /// Creates a resource whose listing can be filtered server-side by updated-at.
+    /// </summary>
+    /// <param name="name">The resource name.</param>
+    /// <param name="keySelector">Returns the stable key of a record.</param>
+    /// <param name="updatedAtSelector">Returns when a record was last updated.</param>
+    /// <param name="fetchUpdatedSinceAsync">Lists records updated at or after the given time, or all records when it is null.</param>
+    /// <param name="jsonTypeInfo">Serialization metadata used to hash records.</param>
+    /// <returns>The resource definition.</returns>
+    public static SyncResource<T> Incremental(
+        string name,
+        Func<T, string> keySelector,
+        Func<T, DateTimeOffset?> updatedAtSelector,
+        Func<DateTimeOffset?, CancellationToken, Task<IEnumerable<T>>> fetchUpdatedSinceAsync,
+        JsonTypeInfo<T> jsonTypeInfo)
+    {
+        return new SyncResource<T>(
+            name,
+            keySelector,
+            fetchUpdatedSinceAsync,
+            updatedAtSelector ?? throw new ArgumentNullException(nameof(updatedAtSelector)),
+            HashWithTypeInfo(jsonTypeInfo ?? throw new ArgumentNullException(nameof(jsonTypeInfo))));
+    }
+
+    /// <summary>
+    /// Creates a resource that can only be listed in full, hashing records by reflection. Changes are found
+    /// by comparing content hashes with the previous run, and records missing from the listing are reported as deleted.
+    /// </summary>
+    /// <param name="name">The resource name.</param>
+    /// <param name="keySelector">Returns the stable key of a record.</param>
+    /// <param name="fetchAllAsync">Lists all records.</param>
+    /// <returns>The resource definition.</returns>
+    [RequiresUnreferencedCode(ReflectionHashMessage)]
+#if NET7_0_OR_GREATER
+    [RequiresDynamicCode(ReflectionHashMessage)]
+#endif
+    public static SyncResource<T> FullListing(
+        string name,
+        Func<T, string> keySelector,
+        Func<CancellationToken, Task<IEnumerable<T>>> fetchAllAsync)
+    {
+        if (fetchAllAsync == null)
+            throw new ArgumentNullException(nameof(fetchAllAsync));
+
+        return new SyncResource<T>(name, keySelector, (_, cancellationToken) => fetchAllAsync(cancellationToken), null, HashByReflection);
+    }
+
+    /// <summary>
+    /// Creates a resource that can only be listed in full. Changes are found by comparing content hashes
+    /// with the previous run, and records missing from the listing are reported as deleted.
+    /// </summary>
+    /// <param name="name">The resource name.</param>
+    /// <param name="keySelector">Returns the stable key of a record.</param>
+    /// <param name="fetchAllAsync">Lists all records.</param>
+    /// <param name="jsonTypeInfo">Serialization metadata used to hash records.</param>
+    /// <returns>The resource definition.</returns>
+    public static SyncResource<T> FullListing(
+        string name,
+        Func<T, string> keySelector,
+        Func<CancellationToken, Task<IEnumerable<T>>> fetchAllAsync,
+        JsonTypeInfo<T> jsonTypeInfo)
+    {
+        if (fetchAllAsync == null)
+            throw new ArgumentNullException(nameof(fetchAllAsync));
+
+        return new SyncResource<T>(
+            name,
+            keySelector,
+            (_, cancellationToken) => fetchAllAsync(cancellationToken),
+            null,
+            HashWithTypeInfo(jsonTypeInfo ?? throw new ArgumentNullException(nameof(jsonTypeInfo))));
+    }
+
+    [RequiresUnreferencedCode(ReflectionHashMessage)]
+#if NET7_0_OR_GREATER
+    [RequiresDynamicCode(ReflectionHashMessage)]
+#endif
+    private static string HashByReflection(T record)
+    {
+        return Convert.ToBase64String(SHA256.HashData(JsonSerializer.SerializeToUtf8Bytes(record)));
+    }
+
+    private static Func<T, string> HashWithTypeInfo(JsonTypeInfo<T> jsonTypeInfo)
+    {
+        return record => Convert.ToBase64String(SHA256.HashData(JsonSerializer.SerializeToUtf8Bytes(record, jsonTypeInfo)));
+    }
+}
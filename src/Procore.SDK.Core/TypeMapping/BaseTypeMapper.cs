@@ -1,5 +1,6 @@
 using System;
-using System.Diagnostics;
+using System.Collections.Generic;
+using System.Linq;
 
 namespace Procore.SDK.Core.TypeMapping;
 
@@ -13,7 +14,15 @@ public abstract class BaseTypeMapper<TWrapper, TGenerated> : ITypeMapper<TWrappe
     where TWrapper : class, new()
     where TGenerated : class, new()
 {
-    private readonly TypeMapperMetrics _metrics = new();
+    private readonly TypeMapperMetrics _metrics;
+
+    /// <summary>
+    /// Initializes a new instance of the mapper with metrics named after the concrete mapper type.
+    /// </summary>
+    protected BaseTypeMapper()
+    {
+        _metrics = new TypeMapperMetrics(GetType().Name);
+    }
 
     /// <summary>
     /// Gets the wrapper type this mapper handles.
@@ -41,7 +50,7 @@ public abstract class BaseTypeMapper<TWrapper, TGenerated> : ITypeMapper<TWrappe
     {
         ArgumentNullException.ThrowIfNull(source);
 
-        var stopwatch = Stopwatch.StartNew();
+        var startTimestamp = _metrics.Start();
         var success = false;
 
         try
@@ -60,8 +69,59 @@ public abstract class BaseTypeMapper<TWrapper, TGenerated> : ITypeMapper<TWrappe
         }
         finally
         {
-            stopwatch.Stop();
-            _metrics.RecordToWrapper(stopwatch.ElapsedMilliseconds, success);
+            _metrics.CompleteToWrapper(startTimestamp, success);
+        }
+    }
+
+    /// <summary>
+    /// Maps a batch of generated Kiota client types to wrapper domain models with a single
+    /// metrics measurement and a single exception handler for the whole batch.
+    /// </summary>
+    /// <param name="sources">The generated type instances to map from</param>
+    /// <returns>The mapped wrapper domain models, in source order</returns>
+    /// <exception cref="ArgumentNullException">When sources is null</exception>
+    /// <exception cref="TypeMappingException">When any item is null or fails to map</exception>
+    public IReadOnlyList<TWrapper> MapToWrapperMany(IEnumerable<TGenerated> sources)
+    {
+        ArgumentNullException.ThrowIfNull(sources);
+
+        var result = sources.TryGetNonEnumeratedCount(out var count)
+            ? new List<TWrapper>(count)
+            : new List<TWrapper>();
+
+        var startTimestamp = _metrics.Start();
+        var success = false;
+
+        try
+        {
+            foreach (var source in sources)
+            {
+                if (source == null)
+                {
+                    throw new TypeMappingException(
+                        $"Item {result.Count} of the batch is null",
+                        typeof(TGenerated),
+                        typeof(TWrapper));
+                }
+
+                result.Add(DoMapToWrapper(source));
+            }
+
+            success = true;
+            return result;
+        }
+        catch (Exception ex) when (!(ex is TypeMappingException))
+        {
+            throw new TypeMappingException(
+                $"Failed to map item {result.Count} of the batch from {typeof(TGenerated).Name} to {typeof(TWrapper).Name}: {ex.Message}",
+                ex,
+                typeof(TGenerated),
+                typeof(TWrapper));
+        }
+        finally
+        {
+            // Items mapped so far plus the one that failed, if any
+            _metrics.CompleteToWrapperBatch(startTimestamp, success ? result.Count : result.Count + 1, success);
         }
     }
 
@@ -76,7 +136,7 @@ public abstract class BaseTypeMapper<TWrapper, TGenerated> : ITypeMapper<TWrappe
     {
         ArgumentNullException.ThrowIfNull(source);
 
-        var stopwatch = Stopwatch.StartNew();
+        var startTimestamp = _metrics.Start();
         var success = false;
 
         try
@@ -95,8 +155,7 @@ public abstract class BaseTypeMapper<TWrapper, TGenerated> : ITypeMapper<TWrappe
         }
         finally
         {
-            stopwatch.Stop();
-            _metrics.RecordToGenerated(stopwatch.ElapsedMilliseconds, success);
+            _metrics.CompleteToGenerated(startTimestamp, success);
         }
     }
 
@@ -115,7 +174,7 @@ public abstract class BaseTypeMapper<TWrapper, TGenerated> : ITypeMapper<TWrappe
             return false;
         }
 
-        var stopwatch = Stopwatch.StartNew();
+        var startTimestamp = _metrics.Start();
         var success = false;
 
         try
@@ -130,8 +189,7 @@ public abstract class BaseTypeMapper<TWrapper, TGenerated> : ITypeMapper<TWrappe
         }
         finally
         {
-            stopwatch.Stop();
-            _metrics.RecordToWrapper(stopwatch.ElapsedMilliseconds, success);
+            _metrics.CompleteToWrapper(startTimestamp, success);
         }
     }
 
@@ -150,7 +208,7 @@ public abstract class BaseTypeMapper<TWrapper, TGenerated> : ITypeMapper<TWrappe
             return false;
         }
 
-        var stopwatch = Stopwatch.StartNew();
+        var startTimestamp = _metrics.Start();
         var success = false;
 
         try
@@ -165,8 +223,7 @@ public abstract class BaseTypeMapper<TWrapper, TGenerated> : ITypeMapper<TWrappe
         }
         finally
         {
-            stopwatch.Stop();
-            _metrics.RecordToGenerated(stopwatch.ElapsedMilliseconds, success);
+            _metrics.CompleteToGenerated(startTimestamp, success);
         }
     }
 
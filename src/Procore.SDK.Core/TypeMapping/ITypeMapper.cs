@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 
 namespace Procore.SDK.Core.TypeMapping;
 
@@ -21,6 +22,17 @@ public interface ITypeMapper<TWrapper, TGenerated>
     /// <exception cref="TypeMappingException">When mapping fails due to data issues</exception>
     TWrapper MapToWrapper(TGenerated source);
 
+    /// <summary>
+    /// Maps a batch of generated Kiota client types to wrapper domain models.
+    /// The result is pre-sized when the source count is known, and metrics and error handling
+    /// are applied once for the whole batch rather than once per item.
+    /// </summary>
+    /// <param name="sources">The generated type instances to map from</param>
+    /// <returns>The mapped wrapper domain models, in source order</returns>
+    /// <exception cref="ArgumentNullException">When sources is null</exception>
+    /// <exception cref="TypeMappingException">When any item is null or fails to map; the message identifies the item index</exception>
+    IReadOnlyList<TWrapper> MapToWrapperMany(IEnumerable<TGenerated> sources);
+
     /// <summary>
     /// Maps from wrapper domain model to generated Kiota client type.
     /// </summary>
@@ -0,0 +1,162 @@
+using System;
+using System.Diagnostics;
+using System.Numerics;
+using System.Threading;
+
+namespace Procore.SDK.Core.TypeMapping;
+
+/// <summary>
+/// Lock-free latency histogram with logarithmic buckets (four per power of two nanoseconds),
+/// giving percentiles within 25% of the true value at a fixed memory cost.
+/// </summary>
+public sealed class LatencyHistogram
+{
+    private const int SubBucketBits = 2;
+    private const int SubBucketCount = 1 << SubBucketBits;
+    private const int MaxExponent = 42; // ~73 minutes in nanoseconds
+    private const int BucketCount = (MaxExponent + 1) * SubBucketCount;
+
+    private static readonly double NanosecondsPerTick = 1_000_000_000.0 / Stopwatch.Frequency;
+
+    private readonly long[] _counts = new long[BucketCount];
+    private long _count;
+
+    /// <summary>
+    /// Gets the number of recorded samples.
+    /// </summary>
+    public long Count => Interlocked.Read(ref _count);
+
+    /// <summary>
+    /// Gets the median latency in milliseconds.
+    /// </summary>
+    public double P50Ms => GetPercentileMs(0.50);
+
+    /// <summary>
+    /// Gets the 95th percentile latency in milliseconds.
+    /// </summary>
+    public double P95Ms => GetPercentileMs(0.95);
+
+    /// <summary>
+    /// Gets the 99th percentile latency in milliseconds.
+    /// </summary>
+    public double P99Ms => GetPercentileMs(0.99);
+
+    /// <summary>
+    /// Records an elapsed time measured in <see cref="Stopwatch"/> ticks.
+    /// </summary>
+    /// <param name="elapsedTicks">The elapsed time in Stopwatch ticks.</param>
+    public void RecordTicks(long elapsedTicks)
+    {
+        var nanoseconds = (long)(elapsedTicks * NanosecondsPerTick);
+        Interlocked.Increment(ref _counts[GetBucketIndex(nanoseconds)]);
+        Interlocked.Increment(ref _count);
+    }
+
+    /// <summary>
+    /// Gets the latency at the given percentile in milliseconds, or 0 when nothing has been recorded.
+    /// </summary>
+    /// <param name="percentile">The percentile between 0 and 1, e.g. 0.95.</param>
+    /// <returns>The upper bound of the bucket containing the percentile, in milliseconds.</returns>
+    public double GetPercentileMs(double percentile)
+    {
+        var snapshot = new long[BucketCount];
+        CopyCountsTo(snapshot);
+        return GetPercentileMs(snapshot, percentile);
+    }
+
+    /// <summary>
+    /// Resets all buckets to zero.
+    /// </summary>
+    public void Reset()
+    {
+        for (var i = 0; i < _counts.Length; i++)
+        {
+            Interlocked.Exchange(ref _counts[i], 0);
+        }
+        Interlocked.Exchange(ref _count, 0);
+    }
+
+    /// <summary>
+    /// Adds the bucket counts of this histogram to a buffer of <see cref="BucketCount"/> entries.
+    /// </summary>
+    internal void CopyCountsTo(long[] buffer)
+    {
+        for (var i = 0; i < _counts.Length; i++)
+        {
+            buffer[i] += Interlocked.Read(ref _counts[i]);
+        }
+    }
+
+    /// <summary>
+    /// Creates a buffer suitable for <see cref="CopyCountsTo"/>.
+    /// </summary>
+    internal static long[] CreateBuffer() => new long[BucketCount];
+
+    /// <summary>
+    /// Computes a percentile from bucket counts produced by <see cref="CopyCountsTo"/>.
+    /// </summary>
+    internal static double GetPercentileMs(long[] counts, double percentile)
+    {
+        if (percentile < 0 || percentile > 1)
+            throw new ArgumentOutOfRangeException(nameof(percentile), "Percentile must be between 0 and 1");
+
+        long total = 0;
+        foreach (var count in counts)
+        {
+            total += count;
+        }
+
+        if (total == 0)
+        {
+            return 0;
+        }
+
+        var rank = Math.Max(1, (long)Math.Ceiling(percentile * total));
+        long seen = 0;
+        for (var i = 0; i < counts.Length; i++)
+        {
+            seen += counts[i];
+            if (seen >= rank)
+            {
+                return GetBucketUpperBound(i) / 1_000_000.0;
+            }
+        }
+
+        return GetBucketUpperBound(counts.Length - 1) / 1_000_000.0;
+    }
+
+    private static int GetBucketIndex(long nanoseconds)
+    {
+        if (nanoseconds < SubBucketCount)
+        {
+            return (int)Math.Max(0, nanoseconds);
+        }
+
+        var exponent = BitOperations.Log2((ulong)nanoseconds);
+        if (exponent > MaxExponent)
+        {
+            return BucketCount - 1;
+        }
+
+        var subBucket = (int)(nanoseconds >> (exponent - SubBucketBits)) & (SubBucketCount - 1);
+        return exponent * SubBucketCount + subBucket;
+    }
+
+    private static long GetBucketUpperBound(int index)
+    {
+        if (index < SubBucketCount)
+        {
+            return index;
+        }
+
+        var exponent = index / SubBucketCount;
+        var subBucket = index % SubBucketCount;
+        if (exponent < SubBucketBits)
+        {
+            // Unused slots between the exact small values and the first logarithmic bucket
+            return SubBucketCount - 1;
+        }
+
+        return ((long)(SubBucketCount + subBucket + 1) << (exponent - SubBucketBits)) - 1;
+    }
+}
@@ -0,0 +1,96 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics.Metrics;
+using System.Linq;
+using System.Runtime.CompilerServices;
+
+namespace Procore.SDK.Core.TypeMapping;
+
+/// <summary>
+/// Publishes type mapper timings through System.Diagnostics.Metrics so they can be collected by
+/// OpenTelemetry, dotnet-counters or any other <see cref="MeterListener"/>.
+/// </summary>
+public static class TypeMapperInstrumentation
+{
+    /// <summary>
+    /// Name of the meter that publishes type mapping instruments.
+    /// </summary>
+    public const string MeterName = "Procore.SDK.TypeMapping";
+
+    private static readonly double[] Percentiles = { 0.50, 0.95, 0.99 };
+
+    private static readonly ConditionalWeakTable<TypeMapperMetrics, object?> LiveMetrics = new();
+
+    private static readonly Meter Meter = new(MeterName);
+
+    /// <summary>
+    /// Histogram of sampled mapping durations in milliseconds, tagged with mapper, direction and outcome.
+    /// Only recorded while a listener is subscribed.
+    /// </summary>
+    internal static readonly Histogram<double> Duration = Meter.CreateHistogram<double>(
+        "procore.type_mapping.duration",
+        unit: "ms",
+        description: "Duration of sampled type mapping operations");
+
+    static TypeMapperInstrumentation()
+    {
+        Meter.CreateObservableGauge(
+            "procore.type_mapping.duration.percentile",
+            ObservePercentiles,
+            unit: "ms",
+            description: "p50/p95/p99 of sampled type mapping durations per mapper and direction");
+    }
+
+    /// <summary>
+    /// Includes a mapper's histograms in the percentile gauge for as long as the mapper is alive.
+    /// </summary>
+    internal static void Register(TypeMapperMetrics metrics)
+    {
+        LiveMetrics.AddOrUpdate(metrics, null);
+    }
+
+    private static IEnumerable<Measurement<double>> ObservePercentiles()
+    {
+        // Several instances of the same mapper are merged into one series
+        var groups = LiveMetrics.Select(entry => entry.Key).GroupBy(metrics => metrics.MapperName).ToList();
+
+        foreach (var group in groups)
+        {
+            foreach (var measurement in ObserveDirection(group, "to_wrapper", metrics => metrics.ToWrapperLatency))
+            {
+                yield return measurement;
+            }
+
+            foreach (var measurement in ObserveDirection(group, "to_generated", metrics => metrics.ToGeneratedLatency))
+            {
+                yield return measurement;
+            }
+        }
+    }
+
+    private static IEnumerable<Measurement<double>> ObserveDirection(
+        IGrouping<string, TypeMapperMetrics> group,
+        string direction,
+        Func<TypeMapperMetrics, LatencyHistogram> selectHistogram)
+    {
+        var counts = LatencyHistogram.CreateBuffer();
+        foreach (var metrics in group)
+        {
+            selectHistogram(metrics).CopyCountsTo(counts);
+        }
+
+        if (counts.All(count => count == 0))
+        {
+            yield break;
+        }
+
+        foreach (var percentile in Percentiles)
+        {
+            yield return new Measurement<double>(
+                LatencyHistogram.GetPercentileMs(counts, percentile),
+                new KeyValuePair<string, object?>("mapper", group.Key),
+                new KeyValuePair<string, object?>("direction", direction),
+                new KeyValuePair<string, object?>("quantile", percentile));
+        }
+    }
+}
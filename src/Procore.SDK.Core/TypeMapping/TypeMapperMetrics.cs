@@ -1,4 +1,5 @@
 using System;
+using System.Collections.Generic;
 using System.Diagnostics;
 using System.Threading;
 
@@ -6,65 +7,136 @@ namespace Procore.SDK.Core.TypeMapping;
 
 /// <summary>
 /// Performance and usage metrics for type mappers to ensure they meet performance requirements.
+/// Durations are measured in <see cref="Stopwatch"/> ticks on a sample of calls (see <see cref="SamplingInterval"/>)
+/// and recorded into lock-free histograms; call and error counts are always exact.
 /// </summary>
 public class TypeMapperMetrics
 {
+    private static volatile bool _enabled = true;
+    private static int _samplingInterval = 1;
+
+    private readonly LatencyHistogram _toWrapperLatency = new();
+    private readonly LatencyHistogram _toGeneratedLatency = new();
     private long _toWrapperCalls;
     private long _toGeneratedCalls;
-    private long _toWrapperTimeMs;
-    private long _toGeneratedTimeMs;
+    private long _toWrapperTicks;
+    private long _toGeneratedTicks;
+    private long _toWrapperSamples;
+    private long _toGeneratedSamples;
     private long _toWrapperErrors;
     private long _toGeneratedErrors;
+    private int _sampleCounter;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="TypeMapperMetrics"/> class.
+    /// </summary>
+    public TypeMapperMetrics()
+        : this("unknown")
+    {
+    }
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="TypeMapperMetrics"/> class for a named mapper.
+    /// </summary>
+    /// <param name="mapperName">The mapper name used to tag published instruments.</param>
+    public TypeMapperMetrics(string mapperName)
+    {
+        MapperName = mapperName ?? throw new ArgumentNullException(nameof(mapperName));
+        TypeMapperInstrumentation.Register(this);
+    }
+
+    /// <summary>
+    /// Gets or sets whether mapper metrics are collected. When false, mappers skip all timing and
+    /// counting so that mapping carries no metrics overhead. Applies to all mappers (default: true).
+    /// </summary>
+    public static bool Enabled
+    {
+        get => _enabled;
+        set => _enabled = value;
+    }
+
+    /// <summary>
+    /// Gets or sets how many calls pass between timed calls: 1 times every call, 100 times one call in a hundred.
+    /// Applies to all mappers (default: 1).
+    /// </summary>
+    public static int SamplingInterval
+    {
+        get => Volatile.Read(ref _samplingInterval);
+        set
+        {
+            if (value < 1)
+                throw new ArgumentOutOfRangeException(nameof(value), "Sampling interval must be at least 1");
+
+            Volatile.Write(ref _samplingInterval, value);
+        }
+    }
+
+    /// <summary>
+    /// Gets the name of the mapper these metrics belong to.
+    /// </summary>
+    public string MapperName { get; }
 
     /// <summary>
     /// Gets the total number of calls to MapToWrapper.
     /// </summary>
-    public long ToWrapperCalls => _toWrapperCalls;
+    public long ToWrapperCalls => Interlocked.Read(ref _toWrapperCalls);
 
     /// <summary>
     /// Gets the total number of calls to MapToGenerated.
     /// </summary>
-    public long ToGeneratedCalls => _toGeneratedCalls;
+    public long ToGeneratedCalls => Interlocked.Read(ref _toGeneratedCalls);
 
     /// <summary>
-    /// Gets the total time spent in MapToWrapper operations (milliseconds).
+    /// Gets the estimated total time spent in MapToWrapper operations (milliseconds),
+    /// extrapolated from the sampled calls.
     /// </summary>
-    public long ToWrapperTimeMs => _toWrapperTimeMs;
+    public long ToWrapperTimeMs => (long)(AverageToWrapperTimeMs * ToWrapperCalls);
 
     /// <summary>
-    /// Gets the total time spent in MapToGenerated operations (milliseconds).
+    /// Gets the estimated total time spent in MapToGenerated operations (milliseconds),
+    /// extrapolated from the sampled calls.
     /// </summary>
-    public long ToGeneratedTimeMs => _toGeneratedTimeMs;
+    public long ToGeneratedTimeMs => (long)(AverageToGeneratedTimeMs * ToGeneratedCalls);
 
     /// <summary>
     /// Gets the number of errors in MapToWrapper operations.
     /// </summary>
-    public long ToWrapperErrors => _toWrapperErrors;
+    public long ToWrapperErrors => Interlocked.Read(ref _toWrapperErrors);
 
     /// <summary>
     /// Gets the number of errors in MapToGenerated operations.
     /// </summary>
-    public long ToGeneratedErrors => _toGeneratedErrors;
+    public long ToGeneratedErrors => Interlocked.Read(ref _toGeneratedErrors);
+
+    /// <summary>
+    /// Gets the average time per sampled MapToWrapper operation (milliseconds).
+    /// </summary>
+    public double AverageToWrapperTimeMs => AverageMs(ref _toWrapperTicks, ref _toWrapperSamples);
+
+    /// <summary>
+    /// Gets the average time per sampled MapToGenerated operation (milliseconds).
+    /// </summary>
+    public double AverageToGeneratedTimeMs => AverageMs(ref _toGeneratedTicks, ref _toGeneratedSamples);
 
     /// <summary>
-    /// Gets the average time per MapToWrapper operation (milliseconds).
+    /// Gets the latency distribution of sampled MapToWrapper operations.
     /// </summary>
-    public double AverageToWrapperTimeMs => _toWrapperCalls > 0 ? (double)_toWrapperTimeMs / _toWrapperCalls : 0;
+    public LatencyHistogram ToWrapperLatency => _toWrapperLatency;
 
     /// <summary>
-    /// Gets the average time per MapToGenerated operation (milliseconds).
+    /// Gets the latency distribution of sampled MapToGenerated operations.
     /// </summary>
-    public double AverageToGeneratedTimeMs => _toGeneratedCalls > 0 ? (double)_toGeneratedTimeMs / _toGeneratedCalls : 0;
+    public LatencyHistogram ToGeneratedLatency => _toGeneratedLatency;
 
     /// <summary>
     /// Gets the error rate for MapToWrapper operations.
     /// </summary>
-    public double ToWrapperErrorRate => _toWrapperCalls > 0 ? (double)_toWrapperErrors / _toWrapperCalls : 0;
+    public double ToWrapperErrorRate => ToWrapperCalls > 0 ? (double)ToWrapperErrors / ToWrapperCalls : 0;
 
     /// <summary>
     /// Gets the error rate for MapToGenerated operations.
     /// </summary>
-    public double ToGeneratedErrorRate => _toGeneratedCalls > 0 ? (double)_toGeneratedErrors / _toGeneratedCalls : 0;
+    public double ToGeneratedErrorRate => ToGeneratedCalls > 0 ? (double)ToGeneratedErrors / ToGeneratedCalls : 0;
 
     /// <summary>
     /// Records timing and success for a MapToWrapper operation.
@@ -73,13 +145,8 @@ public class TypeMapperMetrics
     /// <param name="success">Whether the operation succeeded</param>
     public void RecordToWrapper(long elapsedMs, bool success)
     {
-        Interlocked.Increment(ref _toWrapperCalls);
-        Interlocked.Add(ref _toWrapperTimeMs, elapsedMs);
-        
-        if (!success)
-        {
-            Interlocked.Increment(ref _toWrapperErrors);
-        }
+        Record(elapsedMs * Stopwatch.Frequency / 1000, success, ref _toWrapperCalls, ref _toWrapperErrors,
+            ref _toWrapperTicks, ref _toWrapperSamples, _toWrapperLatency, "to_wrapper");
     }
 
     /// <summary>
@@ -89,15 +156,87 @@ public class TypeMapperMetrics
     /// <param name="success">Whether the operation succeeded</param>
     public void RecordToGenerated(long elapsedMs, bool success)
     {
-        Interlocked.Increment(ref _toGeneratedCalls);
-        Interlocked.Add(ref _toGeneratedTimeMs, elapsedMs);
-        
+        Record(elapsedMs * Stopwatch.Frequency / 1000, success, ref _toGeneratedCalls, ref _toGeneratedErrors,
+            ref _toGeneratedTicks, ref _toGeneratedSamples, _toGeneratedLatency, "to_generated");
+    }
+
+    /// <summary>
+    /// Starts measuring a MapToWrapper or MapToGenerated call.
+    /// </summary>
+    /// <returns>A start timestamp if the call is sampled, 0 if it is only counted, or -1 when metrics are disabled.</returns>
+    internal long Start()
+    {
+        if (!_enabled)
+        {
+            return -1;
+        }
+
+        var interval = Volatile.Read(ref _samplingInterval);
+
+        // A racy counter is fine here: it only spreads samples, it does not need to be exact
+        if (interval == 1 || ++_sampleCounter % interval == 0)
+        {
+            return Stopwatch.GetTimestamp();
+        }
+
+        return 0;
+    }
+
+    /// <summary>
+    /// Completes a MapToWrapper call started with <see cref="Start"/>.
+    /// </summary>
+    internal void CompleteToWrapper(long startTimestamp, bool success)
+    {
+        Complete(startTimestamp, success, ref _toWrapperCalls, ref _toWrapperErrors,
+            ref _toWrapperTicks, ref _toWrapperSamples, _toWrapperLatency, "to_wrapper");
+    }
+
+    /// <summary>
+    /// Completes a batch of MapToWrapper calls started with a single <see cref="Start"/>.
+    /// Every item counts as a call; the batch duration is spread evenly over its items.
+    /// </summary>
+    internal void CompleteToWrapperBatch(long startTimestamp, int itemCount, bool success)
+    {
+        if (startTimestamp < 0 || itemCount <= 0)
+        {
+            return;
+        }
+
+        Interlocked.Add(ref _toWrapperCalls, itemCount);
         if (!success)
         {
-            Interlocked.Increment(ref _toGeneratedErrors);
+            Interlocked.Increment(ref _toWrapperErrors);
+        }
+
+        if (startTimestamp == 0)
+        {
+            return;
+        }
+
+        var elapsedTicks = Stopwatch.GetTimestamp() - startTimestamp;
+        Interlocked.Add(ref _toWrapperSamples, itemCount);
+        Interlocked.Add(ref _toWrapperTicks, elapsedTicks);
+        _toWrapperLatency.RecordTicks(elapsedTicks / itemCount);
+
+        if (TypeMapperInstrumentation.Duration.Enabled)
+        {
+            TypeMapperInstrumentation.Duration.Record(
+                elapsedTicks * 1000.0 / Stopwatch.Frequency / itemCount,
+                new KeyValuePair<string, object?>("mapper", MapperName),
+                new KeyValuePair<string, object?>("direction", "to_wrapper"),
+                new KeyValuePair<string, object?>("outcome", success ? "success" : "error"));
         }
     }
 
+    /// <summary>
+    /// Completes a MapToGenerated call started with <see cref="Start"/>.
+    /// </summary>
+    internal void CompleteToGenerated(long startTimestamp, bool success)
+    {
+        Complete(startTimestamp, success, ref _toGeneratedCalls, ref _toGeneratedErrors,
+            ref _toGeneratedTicks, ref _toGeneratedSamples, _toGeneratedLatency, "to_generated");
+    }
+
     /// <summary>
     /// Resets all metrics to zero.
     /// </summary>
@@ -105,10 +244,14 @@ public class TypeMapperMetrics
     {
         Interlocked.Exchange(ref _toWrapperCalls, 0);
         Interlocked.Exchange(ref _toGeneratedCalls, 0);
-        Interlocked.Exchange(ref _toWrapperTimeMs, 0);
-        Interlocked.Exchange(ref _toGeneratedTimeMs, 0);
+        Interlocked.Exchange(ref _toWrapperTicks, 0);
+        Interlocked.Exchange(ref _toGeneratedTicks, 0);
+        Interlocked.Exchange(ref _toWrapperSamples, 0);
+        Interlocked.Exchange(ref _toGeneratedSamples, 0);
         Interlocked.Exchange(ref _toWrapperErrors, 0);
         Interlocked.Exchange(ref _toGeneratedErrors, 0);
+        _toWrapperLatency.Reset();
+        _toGeneratedLatency.Reset();
     }
 
     /// <summary>
@@ -141,6 +284,70 @@ public class TypeMapperMetrics
 
         return result;
     }
+
+    private void Complete(
+        long startTimestamp,
+        bool success,
+        ref long calls,
+        ref long errors,
+        ref long ticks,
+        ref long samples,
+        LatencyHistogram histogram,
+        string direction)
+    {
+        if (startTimestamp < 0)
+        {
+            return;
+        }
+
+        if (startTimestamp == 0)
+        {
+            Interlocked.Increment(ref calls);
+            if (!success)
+            {
+                Interlocked.Increment(ref errors);
+            }
+            return;
+        }
+
+        Record(Stopwatch.GetTimestamp() - startTimestamp, success, ref calls, ref errors, ref ticks, ref samples, histogram, direction);
+    }
+
+    private void Record(
+        long elapsedTicks,
+        bool success,
+        ref long calls,
+        ref long errors,
+        ref long ticks,
+        ref long samples,
+        LatencyHistogram histogram,
+        string direction)
+    {
+        Interlocked.Increment(ref calls);
+        Interlocked.Increment(ref samples);
+        Interlocked.Add(ref ticks, elapsedTicks);
+        histogram.RecordTicks(elapsedTicks);
+
+        if (!success)
+        {
+            Interlocked.Increment(ref errors);
+        }
+
+        if (TypeMapperInstrumentation.Duration.Enabled)
+        {
+            TypeMapperInstrumentation.Duration.Record(
+                elapsedTicks * 1000.0 / Stopwatch.Frequency,
+                new KeyValuePair<string, object?>("mapper", MapperName),
+                new KeyValuePair<string, object?>("direction", direction),
+                new KeyValuePair<string, object?>("outcome", success ? "success" : "error"));
+        }
+    }
+
+    private static double AverageMs(ref long ticks, ref long samples)
+    {
+        var sampleCount = Interlocked.Read(ref samples);
+        return sampleCount > 0 ? Interlocked.Read(ref ticks) * 1000.0 / Stopwatch.Frequency / sampleCount : 0;
+    }
 }
 
 /// <summary>
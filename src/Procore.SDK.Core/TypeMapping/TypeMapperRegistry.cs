@@ -8,6 +8,10 @@ namespace Procore.SDK.Core.TypeMapping;
 /// <summary>
 /// Default implementation of type mapper registry providing thread-safe registration and discovery.
 /// </summary>
+/// <remarks>
+/// Mappers are registered explicitly and keyed by their closed type pair, so lookups never scan
+/// assemblies or construct types by reflection and remain safe under IL trimming and Native AOT.
+/// </remarks>
 public class TypeMapperRegistry : ITypeMapperRegistry
 {
     private readonly ConcurrentDictionary<(Type Wrapper, Type Generated), ITypeMapper> _mappers = new();
@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Generic;
+using System.Diagnostics.CodeAnalysis;
 using System.Linq;
 using Microsoft.Extensions.DependencyInjection;
 
@@ -67,7 +68,7 @@ public static class TypeMappingExtensions
 
         var registry = serviceProvider.GetRequiredService<ITypeMapperRegistry>();
         var mapper = registry.GetMapper<TWrapper, TGenerated>();
-        return source.Select(mapper.MapToWrapper);
+        return mapper.MapToWrapperMany(source);
     }
 
     /// <summary>
@@ -278,7 +279,7 @@ public static class TypeMappingServiceCollectionExtensions
     /// <typeparam name="TMapper">The mapper implementation type</typeparam>
     /// <param name="services">The service collection</param>
     /// <returns>The service collection for chaining</returns>
-    public static IServiceCollection AddTypeMapper<TWrapper, TGenerated, TMapper>(this IServiceCollection services)
+    public static IServiceCollection AddTypeMapper<TWrapper, TGenerated, [DynamicallyAccessedMembers(DynamicallyAccessedMemberTypes.PublicConstructors)] TMapper>(this IServiceCollection services)
         where TWrapper : class, new()
         where TGenerated : class, new()
         where TMapper : class, ITypeMapper<TWrapper, TGenerated>
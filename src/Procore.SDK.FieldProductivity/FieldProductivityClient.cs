@@ -6,8 +6,10 @@ using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using Microsoft.Kiota.Abstractions;
+using Procore.SDK.Core.Bulk;
 using Procore.SDK.Core.ErrorHandling;
 using Procore.SDK.Core.Logging;
+using Procore.SDK.Shared.Diagnostics;
 using Procore.SDK.Core.TypeMapping;
 using Procore.SDK.FieldProductivity.Models;
 using Procore.SDK.FieldProductivity.TypeMapping;
@@ -16,6 +18,9 @@ using GeneratedTimecardEntryResponse = Procore.SDK.FieldProductivity.Rest.V10.Co
 using GeneratedTimecardEntryPatchResponse = Procore.SDK.FieldProductivity.Rest.V10.Companies.Item.Timecard_entries.Item.Timecard_entriesPatchResponse;
 using GeneratedTimecardEntryDeleteResponse = Procore.SDK.FieldProductivity.Rest.V10.Companies.Item.Timecard_entries.Item.Timecard_entriesDeleteResponse;
 using GeneratedTimecardEntryPatchRequestBody = Procore.SDK.FieldProductivity.Rest.V10.Companies.Item.Timecard_entries.Item.Timecard_entriesPatchRequestBody;
+using GeneratedBulkCreateRequestBody = Procore.SDK.FieldProductivity.Rest.V11.Projects.Item.Project_timecard_entries.Bulk_create.Bulk_createPostRequestBody;
+using GeneratedBulkCreateTimecardEntry = Procore.SDK.FieldProductivity.Rest.V11.Projects.Item.Project_timecard_entries.Bulk_create.Bulk_createPostRequestBody_timecard_entries;
+using GeneratedBulkCreatedTimecardEntry = Procore.SDK.FieldProductivity.Rest.V11.Projects.Item.Project_timecard_entries.Bulk_create.Bulk_create;
 
 namespace Procore.SDK.FieldProductivity;
 
@@ -25,6 +30,9 @@ namespace Procore.SDK.FieldProductivity;
 /// </summary>
 public class ProcoreFieldProductivityClient : IFieldProductivityClient
 {
+    // Mappers are stateless and thread-safe, so every client instance shares one of each
+    private static readonly TimecardEntryTypeMapper SharedTimecardEntryTypeMapper = new();
+
     private readonly Procore.SDK.FieldProductivity.FieldProductivityClient _generatedClient;
     private readonly IRequestAdapter _requestAdapter;
     private readonly ILogger<ProcoreFieldProductivityClient>? _logger;
@@ -32,6 +40,11 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     private readonly TimecardEntryTypeMapper _timecardMapper;
     private bool _disposed;
 
+    /// <summary>
+    /// Maximum number of entries accepted per request by the v1.1 timecard entry bulk_create route.
+    /// </summary>
+    private const int TimecardBulkCreateLimit = 25;
+
     /// <summary>
     /// Provides access to the underlying generated Kiota client for advanced scenarios.
     /// </summary>
@@ -52,7 +65,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         _requestAdapter = requestAdapter ?? throw new ArgumentNullException(nameof(requestAdapter));
         _logger = logger;
         _structuredLogger = structuredLogger;
-        _timecardMapper = new TimecardEntryTypeMapper();
+        _timecardMapper = SharedTimecardEntryTypeMapper;
     }
 
     #region Private Helper Methods
@@ -66,33 +79,46 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         string? correlationId = null,
         CancellationToken cancellationToken = default)
     {
-        correlationId ??= Guid.NewGuid().ToString();
+        // Correlation IDs are only created when something will be logged or an error is raised
+        if (correlationId == null && (_structuredLogger?.IsEnabled(LogLevel.Information) == true || _logger?.IsEnabled(LogLevel.Debug) == true))
+        {
+            correlationId = Guid.NewGuid().ToString();
+        }
         
-        using var operationScope = _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var operationScope = correlationId == null ? null : _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var activity = ProcoreTelemetry.StartOperation(operationName);
+        var startTimestamp = System.Diagnostics.Stopwatch.GetTimestamp();
         
         try
         {
-            _logger?.LogDebug("Executing operation {Operation} with correlation ID {CorrelationId}", operationName, correlationId);
+            _logger?.ExecutingOperation(operationName, correlationId!);
             
-            return await operation().ConfigureAwait(false);
+            var result = await operation().ConfigureAwait(false);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, null);
+            return result;
         }
         catch (HttpRequestException httpEx)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var mappedException = ErrorMapper.MapHttpException(httpEx, correlationId);
             
             _structuredLogger?.LogError(mappedException, operationName, correlationId, 
                 "HTTP error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, mappedException);
             throw mappedException;
         }
         catch (TaskCanceledException ex) when (cancellationToken.IsCancellationRequested)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             _structuredLogger?.LogWarning(operationName, correlationId,
                 "Operation {Operation} was cancelled: {Message}", operationName, ex.Message);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, ex);
             throw;
         }
         catch (Exception ex)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var wrappedException = new CoreModels.ProcoreCoreException(
                 $"Unexpected error in {operationName}: {ex.Message}", 
                 "UNEXPECTED_ERROR", 
@@ -102,6 +128,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
             _structuredLogger?.LogError(wrappedException, operationName, correlationId,
                 "Unexpected error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, wrappedException);
             throw wrappedException;
         }
     }
@@ -139,17 +166,17 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting timecard entries for company {CompanyId} with project filter {ProjectId}", companyId, projectId);
+                _logger?.GettingTimecardEntriesForCompany(companyId, projectId);
                 
                 // This is a placeholder for list endpoint - in reality we would need to implement 
                 // based on available list endpoints or iterate through known timecard IDs
                 // For now, return empty collection but log that real implementation is needed
-                _logger?.LogInformation("Real timecard listing endpoint implementation needed for GetProductivityReportsAsync");
+                _logger?.TimecardListingUnavailable();
                 
                 await Task.CompletedTask.ConfigureAwait(false);
                 return Enumerable.Empty<ProductivityReport>();
             },
-            $"GetProductivityReports-Company-{companyId}-Project-{projectId}",
+            "GetProductivityReportsAsync",
             null,
             cancellationToken);
     }
@@ -167,9 +194,13 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting {Count} timecard entries for company {CompanyId}", timecardEntryIds.Count(), companyId);
+                if (_logger?.IsEnabled(LogLevel.Debug) == true)
+                {
+                    _logger.GettingTimecardEntriesByIds(timecardEntryIds.Count(), companyId);
+                }
                 
-                var productivityReports = new List<ProductivityReport>();
+                // Entries are fetched one by one, then mapped as a single batch
+                var timecardResponses = new List<GeneratedTimecardEntryResponse>();
                 
                 foreach (var timecardEntryId in timecardEntryIds)
                 {
@@ -180,21 +211,25 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
                         
                         if (timecardResponse != null)
                         {
-                            var productivityReport = _timecardMapper.MapToWrapper(timecardResponse);
-                            productivityReports.Add(productivityReport);
+                            timecardResponses.Add(timecardResponse);
                         }
                     }
                     catch (Exception ex)
                     {
-                        _logger?.LogWarning(ex, "Failed to retrieve timecard entry {TimecardEntryId} for company {CompanyId}", timecardEntryId, companyId);
+                        _logger?.FailedToRetrieveTimecardEntry(ex, timecardEntryId, companyId);
                         // Continue with other entries
                     }
                 }
                 
-                _logger?.LogDebug("Successfully retrieved {Count} timecard entries out of {Total} requested", productivityReports.Count, timecardEntryIds.Count());
+                var productivityReports = _timecardMapper.MapToWrapperMany(timecardResponses);
+                
+                if (_logger?.IsEnabled(LogLevel.Debug) == true)
+                {
+                    _logger.RetrievedTimecardEntries(productivityReports.Count, timecardEntryIds.Count());
+                }
                 return productivityReports;
             },
-            $"GetTimecardEntries-Company-{companyId}",
+            "GetTimecardEntriesAsync",
             null,
             cancellationToken);
     }
@@ -210,7 +245,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting timecard entry {TimecardEntryId} for company {CompanyId} using generated Kiota client", timecardEntryId, companyId);
+            _logger?.GettingTimecardEntry(timecardEntryId, companyId);
             
             // Use the generated Kiota client to get timecard entry
             var timecardResponse = await _generatedClient.Rest.V10.Companies[companyId].Timecard_entries[timecardEntryId]
@@ -218,7 +253,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
             
             if (timecardResponse == null)
             {
-                _logger?.LogWarning("No timecard entry returned for ID {TimecardEntryId} in company {CompanyId}", timecardEntryId, companyId);
+                _logger?.NoTimecardEntryReturned(timecardEntryId, companyId);
                 throw new InvalidOperationException($"Timecard entry {timecardEntryId} not found");
             }
             
@@ -244,7 +279,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating timecard entry {TimecardEntryId} for company {CompanyId} using generated Kiota client", timecardEntryId, companyId);
+            _logger?.UpdatingTimecardEntry(timecardEntryId, companyId);
             
             // Create the patch request body
             var patchRequestBody = new GeneratedTimecardEntryPatchRequestBody
@@ -268,7 +303,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
             
             if (patchResponse == null)
             {
-                _logger?.LogWarning("No response from timecard entry update for ID {TimecardEntryId} in company {CompanyId}", timecardEntryId, companyId);
+                _logger?.NoTimecardEntryUpdateResponse(timecardEntryId, companyId);
                 throw new InvalidOperationException($"Failed to update timecard entry {timecardEntryId}");
             }
             
@@ -288,9 +323,9 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
                 UpdatedAt = patchResponse.UpdatedAt?.DateTime ?? DateTime.UtcNow
             };
             
-            _logger?.LogDebug("Successfully updated timecard entry {TimecardEntryId} for company {CompanyId}", timecardEntryId, companyId);
+            _logger?.UpdatedTimecardEntry(timecardEntryId, companyId);
             return productivityReport;
-        }, $"UpdateTimecardEntry-{timecardEntryId}-Company-{companyId}", null, cancellationToken).ConfigureAwait(false);
+        }, "UpdateTimecardEntryAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
     /// <summary>
@@ -305,7 +340,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Deleting timecard entry {TimecardEntryId} for company {CompanyId} using generated Kiota client", timecardEntryId, companyId);
+            _logger?.DeletingTimecardEntry(timecardEntryId, companyId);
             
             // Use the generated Kiota client to delete timecard entry
             var deleteResponse = await _generatedClient.Rest.V10.Companies[companyId].Timecard_entries[timecardEntryId]
@@ -313,7 +348,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
             
             if (deleteResponse == null)
             {
-                _logger?.LogWarning("No response from timecard entry deletion for ID {TimecardEntryId} in company {CompanyId}", timecardEntryId, companyId);
+                _logger?.NoTimecardEntryDeletionResponse(timecardEntryId, companyId);
                 throw new InvalidOperationException($"Failed to delete timecard entry {timecardEntryId}");
             }
             
@@ -333,9 +368,9 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
                 UpdatedAt = deleteResponse.DeletedAt?.DateTime ?? DateTime.UtcNow
             };
             
-            _logger?.LogDebug("Successfully deleted timecard entry {TimecardEntryId} for company {CompanyId}", timecardEntryId, companyId);
+            _logger?.DeletedTimecardEntry(timecardEntryId, companyId);
             return productivityReport;
-        }, $"DeleteTimecardEntry-{timecardEntryId}-Company-{companyId}", null, cancellationToken).ConfigureAwait(false);
+        }, "DeleteTimecardEntryAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
     /// <summary>
@@ -348,6 +383,26 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         return new DateTime(dateValue.Year, dateValue.Month, dateValue.Day);
     }
 
+    /// <summary>
+    /// Maps a timecard entry returned by the bulk_create route to a productivity report.
+    /// </summary>
+    private static ProductivityReport MapCreatedTimecardEntry(GeneratedBulkCreatedTimecardEntry entry, int projectId)
+    {
+        var hoursWorked = decimal.TryParse(entry.Hours, System.Globalization.NumberStyles.Number, System.Globalization.CultureInfo.InvariantCulture, out var hours) ? hours : 0m;
+        
+        return new ProductivityReport
+        {
+            Id = entry.Id ?? 0,
+            ProjectId = projectId,
+            ReportDate = ConvertDateToDateTime(entry.Date) ?? entry.CreatedAt?.DateTime ?? DateTime.UtcNow,
+            ActivityType = entry.CostCode ?? entry.Description ?? "Field Work",
+            HoursWorked = hoursWorked,
+            CrewSize = 1,
+            CreatedAt = entry.CreatedAt?.DateTime ?? DateTime.UtcNow,
+            UpdatedAt = entry.UpdatedAt?.DateTime ?? DateTime.UtcNow
+        };
+    }
+
     /// <summary>
     /// Helper method to extract project ID from delete response additional data.
     /// </summary>
@@ -378,6 +433,91 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         return 0;
     }
 
+    /// <summary>
+    /// Creates multiple timecard entries through the v1.1 bulk_create route, sending at most
+    /// 25 entries per request. Each request's result is reported separately; the Id of a failed
+    /// result is the zero-based position of the request.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="projectId">The project ID.</param>
+    /// <param name="requests">Collection of timecard entries to create.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>One result per request, in request order.</returns>
+    public async Task<IEnumerable<BulkOperationResult<ProductivityReport>>> BulkCreateTimecardEntriesAsync(int companyId, int projectId, IEnumerable<CreateTimecardEntryRequest> requests, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(requests);
+        
+        return await ExecuteWithResilienceAsync(
+            async () =>
+            {
+                var requestList = requests.ToList();
+                _logger?.StartingBulkTimecardCreation(requestList.Count, projectId, companyId);
+                
+                var outcomes = await BulkExecutor.ExecuteChunkedAsync<CreateTimecardEntryRequest, GeneratedBulkCreatedTimecardEntry>(
+                    requestList,
+                    TimecardBulkCreateLimit,
+                    async (chunk, ct) =>
+                    {
+                        var body = new GeneratedBulkCreateRequestBody
+                        {
+                            TimecardEntries = chunk.Select(request => new GeneratedBulkCreateTimecardEntry
+                            {
+                                ProjectId = projectId,
+                                Date = new Date(request.Date),
+                                Hours = request.Hours.ToString("F2", System.Globalization.CultureInfo.InvariantCulture),
+                                Description = request.Description,
+                                PartyId = request.PartyId,
+                                CostCodeId = request.CostCodeId,
+                                TimecardTimeTypeId = request.TimecardTimeTypeId,
+                                TimesheetId = request.TimesheetId,
+                                Billable = request.Billable
+                            }).ToList()
+                        };
+                        
+                        var created = await _generatedClient.Rest.V11.Projects[projectId].Project_timecard_entries.Bulk_create
+                            .PostAsync(body, cancellationToken: ct).ConfigureAwait(false);
+                        return (IReadOnlyList<GeneratedBulkCreatedTimecardEntry>?)created ?? Array.Empty<GeneratedBulkCreatedTimecardEntry>();
+                    },
+                    cancellationToken).ConfigureAwait(false);
+                
+                var results = new List<BulkOperationResult<ProductivityReport>>(outcomes.Count);
+                for (var i = 0; i < outcomes.Count; i++)
+                {
+                    var outcome = outcomes[i];
+                    if (outcome.Succeeded)
+                    {
+                        var report = MapCreatedTimecardEntry(outcome.Result!, projectId);
+                        results.Add(new BulkOperationResult<ProductivityReport>
+                        {
+                            IsSuccess = true,
+                            Data = report,
+                            Id = report.Id.ToString()
+                        });
+                    }
+                    else
+                    {
+                        _logger?.FailedToCreateTimecardEntry(outcome.Exception, i);
+                        results.Add(new BulkOperationResult<ProductivityReport>
+                        {
+                            IsSuccess = false,
+                            ErrorMessage = outcome.Exception!.Message,
+                            Id = i.ToString()
+                        });
+                    }
+                }
+                
+                if (_logger?.IsEnabled(LogLevel.Information) == true)
+                {
+                    _logger.BulkTimecardCreationCompleted(results.Count(r => r.IsSuccess), results.Count(r => !r.IsSuccess), requestList.Count);
+                }
+                
+                return results;
+            },
+            "BulkCreateTimecardEntriesAsync",
+            null,
+            cancellationToken);
+    }
+
     /// <summary>
     /// Bulk updates multiple timecard entries with enhanced error handling and progress tracking.
     /// Optimized for high-volume productivity data processing.
@@ -394,44 +534,48 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
             async () =>
             {
                 var updatesList = updates.ToList();
-                _logger?.LogDebug("Starting bulk update of {Count} timecard entries for company {CompanyId}", updatesList.Count, companyId);
+                _logger?.StartingBulkTimecardUpdate(updatesList.Count, companyId);
                 
-                var results = new List<BulkOperationResult<ProductivityReport>>();
+                // Timecard entries have no bulk_update route, so fall back to bounded concurrent single calls
+                var outcomes = await BulkExecutor.ExecuteConcurrentAsync(
+                    updatesList,
+                    (update, ct) => UpdateTimecardEntryAsync(companyId, update.TimecardEntryId, update.UpdateRequest, ct),
+                    cancellationToken: cancellationToken).ConfigureAwait(false);
+                
+                var results = new List<BulkOperationResult<ProductivityReport>>(outcomes.Count);
                 var successCount = 0;
                 var failureCount = 0;
                 
-                foreach (var update in updatesList)
+                foreach (var outcome in outcomes)
                 {
-                    try
+                    if (outcome.Succeeded)
                     {
-                        var updatedReport = await UpdateTimecardEntryAsync(companyId, update.TimecardEntryId, update.UpdateRequest, cancellationToken);
                         results.Add(new BulkOperationResult<ProductivityReport>
                         {
                             IsSuccess = true,
-                            Data = updatedReport,
-                            Id = update.TimecardEntryId.ToString()
+                            Data = outcome.Result,
+                            Id = outcome.Item.TimecardEntryId.ToString()
                         });
                         successCount++;
                     }
-                    catch (Exception ex)
+                    else
                     {
-                        _logger?.LogWarning(ex, "Failed to update timecard entry {TimecardEntryId} in bulk operation", update.TimecardEntryId);
+                        _logger?.FailedToUpdateTimecardEntry(outcome.Exception, outcome.Item.TimecardEntryId);
                         results.Add(new BulkOperationResult<ProductivityReport>
                         {
                             IsSuccess = false,
-                            ErrorMessage = ex.Message,
-                            Id = update.TimecardEntryId.ToString()
+                            ErrorMessage = outcome.Exception!.Message,
+                            Id = outcome.Item.TimecardEntryId.ToString()
                         });
                         failureCount++;
                     }
                 }
                 
-                _logger?.LogInformation("Bulk timecard update completed: {Success} succeeded, {Failed} failed out of {Total} total", 
-                    successCount, failureCount, updatesList.Count);
+                _logger?.BulkTimecardUpdateCompleted(successCount, failureCount, updatesList.Count);
                 
                 return results;
             },
-            $"BulkUpdateTimecardEntries-Company-{companyId}",
+            "BulkUpdateTimecardEntriesAsync",
             null,
             cancellationToken);
     }
@@ -452,44 +596,48 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
             async () =>
             {
                 var idsList = timecardEntryIds.ToList();
-                _logger?.LogDebug("Starting bulk deletion of {Count} timecard entries for company {CompanyId}", idsList.Count, companyId);
+                _logger?.StartingBulkTimecardDeletion(idsList.Count, companyId);
+                
+                // Timecard entries have no bulk delete route, so fall back to bounded concurrent single calls
+                var outcomes = await BulkExecutor.ExecuteConcurrentAsync(
+                    idsList,
+                    (timecardEntryId, ct) => DeleteTimecardEntryAsync(companyId, timecardEntryId, ct),
+                    cancellationToken: cancellationToken).ConfigureAwait(false);
                 
-                var results = new List<BulkOperationResult<ProductivityReport>>();
+                var results = new List<BulkOperationResult<ProductivityReport>>(outcomes.Count);
                 var successCount = 0;
                 var failureCount = 0;
                 
-                foreach (var timecardEntryId in idsList)
+                foreach (var outcome in outcomes)
                 {
-                    try
+                    if (outcome.Succeeded)
                     {
-                        var deletedReport = await DeleteTimecardEntryAsync(companyId, timecardEntryId, cancellationToken);
                         results.Add(new BulkOperationResult<ProductivityReport>
                         {
                             IsSuccess = true,
-                            Data = deletedReport,
-                            Id = timecardEntryId.ToString()
+                            Data = outcome.Result,
+                            Id = outcome.Item.ToString()
                         });
                         successCount++;
                     }
-                    catch (Exception ex)
+                    else
                     {
-                        _logger?.LogWarning(ex, "Failed to delete timecard entry {TimecardEntryId} in bulk operation", timecardEntryId);
+                        _logger?.FailedToDeleteTimecardEntry(outcome.Exception, outcome.Item);
                         results.Add(new BulkOperationResult<ProductivityReport>
                         {
                             IsSuccess = false,
-                            ErrorMessage = ex.Message,
-                            Id = timecardEntryId.ToString()
+                            ErrorMessage = outcome.Exception!.Message,
+                            Id = outcome.Item.ToString()
                         });
                         failureCount++;
                     }
                 }
                 
-                _logger?.LogInformation("Bulk timecard deletion completed: {Success} succeeded, {Failed} failed out of {Total} total", 
-                    successCount, failureCount, idsList.Count);
+                _logger?.BulkTimecardDeletionCompleted(successCount, failureCount, idsList.Count);
                 
                 return results;
             },
-            $"BulkDeleteTimecardEntries-Company-{companyId}",
+            "BulkDeleteTimecardEntriesAsync",
             null,
             cancellationToken);
     }
@@ -511,11 +659,11 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting productivity report {ReportId} for project {ProjectId} in company {CompanyId}", reportId, projectId, companyId);
+            _logger?.GettingProductivityReport(reportId, projectId, companyId);
             
             // Use real timecard entry data by treating reportId as timecardEntryId
             return await GetTimecardEntryAsync(companyId, reportId, cancellationToken);
-        }, $"GetProductivityReport-{reportId}-Project-{projectId}-Company-{companyId}", null, cancellationToken).ConfigureAwait(false);
+        }, "GetProductivityReportAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
     /// <summary>
@@ -533,7 +681,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Creating productivity report for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.CreatingProductivityReportForProject(projectId, companyId);
                 
                 // Calculate productivity rate
                 var productivityRate = request.HoursWorked > 0 ? request.UnitsCompleted / request.HoursWorked : 0;
@@ -574,7 +722,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting field activities for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingFieldActivitiesForProject(projectId, companyId);
             
             // Placeholder implementation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -594,7 +742,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting field activity {ActivityId} for project {ProjectId} in company {CompanyId}", activityId, projectId, companyId);
+            _logger?.GettingFieldActivity(activityId, projectId, companyId);
             
             // Placeholder implementation
             return new FieldActivity 
@@ -628,7 +776,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating field activity {ActivityId} for project {ProjectId} in company {CompanyId}", activityId, projectId, companyId);
+            _logger?.UpdatingFieldActivity(activityId, projectId, companyId);
             
             // Placeholder implementation
             return new FieldActivity 
@@ -659,7 +807,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting resource utilization for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingResourceUtilizationForProject(projectId, companyId);
             
             // Placeholder implementation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -682,7 +830,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Recording resource utilization for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.RecordingResourceUtilizationForProject(projectId, companyId);
                 
                 // Calculate utilization rate
                 var utilizationRate = request.AvailableHours > 0 ? (request.UsedHours / request.AvailableHours) * 100 : 0;
@@ -722,7 +870,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting performance metrics for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingPerformanceMetricsForProject(projectId, companyId);
             
             // Placeholder implementation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -747,7 +895,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Recording performance metric {MetricName} for project {ProjectId} in company {CompanyId}", metricName, projectId, companyId);
+            _logger?.RecordingPerformanceMetric(metricName, projectId, companyId);
             
             // Placeholder implementation
             return new PerformanceMetric 
@@ -799,7 +947,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting average productivity rate for activity type {ActivityType} in project {ProjectId} in company {CompanyId}", activityType, projectId, companyId);
+            _logger?.GettingAverageProductivityRateForActivity(activityType, projectId, companyId);
             
             if (timecardEntryIds != null && timecardEntryIds.Any())
             {
@@ -813,21 +961,21 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
                     if (matchingEntries.Any())
                     {
                         var averageRate = matchingEntries.Average(t => t.ProductivityRate);
-                        _logger?.LogDebug("Calculated average productivity rate {Rate} from {Count} matching timecard entries", averageRate, matchingEntries.Count);
+                        _logger?.CalculatedAverageProductivityRate(averageRate, matchingEntries.Count);
                         return averageRate;
                     }
                 }
                 catch (Exception ex)
                 {
-                    _logger?.LogWarning(ex, "Failed to calculate average from real timecard data, falling back to default");
+                    _logger?.AverageProductivityRateFallback(ex);
                 }
             }
             
             // Fallback to reasonable default based on activity type
             var defaultRate = GetDefaultProductivityRate(activityType);
-            _logger?.LogInformation("Using default productivity rate {Rate} for activity type {ActivityType}", defaultRate, activityType);
+            _logger?.UsingDefaultProductivityRate(defaultRate, activityType);
             return defaultRate;
-        }, $"GetAverageProductivityRate-{activityType}-Project-{projectId}-Company-{companyId}", null, cancellationToken).ConfigureAwait(false);
+        }, "GetAverageProductivityRateAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
     /// <summary>
@@ -876,7 +1024,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting productivity summary for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingProductivitySummaryForProject(projectId, companyId);
             
             var summary = new Dictionary<string, decimal>();
             
@@ -897,13 +1045,13 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
                     
                     if (groupedByActivity.Any())
                     {
-                        _logger?.LogDebug("Calculated productivity summary from {Count} activity types with real timecard data", groupedByActivity.Count);
+                        _logger?.CalculatedProductivitySummary(groupedByActivity.Count);
                         return groupedByActivity;
                     }
                 }
                 catch (Exception ex)
                 {
-                    _logger?.LogWarning(ex, "Failed to calculate productivity summary from real timecard data, falling back to defaults");
+                    _logger?.ProductivitySummaryFallback(ex);
                 }
             }
             
@@ -922,9 +1070,9 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
                 ["General Construction"] = 15.5m
             };
             
-            _logger?.LogInformation("Using default productivity summary for project {ProjectId}", projectId);
+            _logger?.UsingDefaultProductivitySummary(projectId);
             return summary;
-        }, $"GetProductivitySummary-Project-{projectId}-Company-{companyId}", null, cancellationToken).ConfigureAwait(false);
+        }, "GetProductivitySummaryAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
     /// <summary>
@@ -939,7 +1087,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting under-utilized resources (threshold: {Threshold}%) for project {ProjectId} in company {CompanyId}", threshold, projectId, companyId);
+            _logger?.GettingUnderUtilizedResources(threshold, projectId, companyId);
             
             // Placeholder implementation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -965,7 +1113,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting productivity reports with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+            _logger?.GettingProductivityReportsPage(projectId, companyId, options.Page, options.PerPage);
             
             // Placeholder implementation
             return new CoreModels.PagedResult<ProductivityReport>
@@ -995,7 +1143,7 @@ public class ProcoreFieldProductivityClient : IFieldProductivityClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting field activities with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+            _logger?.GettingFieldActivitiesPage(projectId, companyId, options.Page, options.PerPage);
             
             // Placeholder implementation
             return new CoreModels.PagedResult<FieldActivity>
@@ -0,0 +1,139 @@
+using System;
+using Microsoft.Extensions.Logging;
+
+namespace Procore.SDK.FieldProductivity;
+
+/// <summary>
+/// Source-generated log messages for <see cref="ProcoreFieldProductivityClient"/>.
+/// </summary>
+internal static partial class FieldProductivityClientLog
+{
+    [LoggerMessage(EventId = 2501, Level = LogLevel.Debug, Message = "Getting timecard entries for company {CompanyId} with project filter {ProjectId}")]
+    public static partial void GettingTimecardEntriesForCompany(this ILogger logger, int companyId, int projectId);
+
+    [LoggerMessage(EventId = 2502, Level = LogLevel.Information, Message = "Real timecard listing endpoint implementation needed for GetProductivityReportsAsync")]
+    public static partial void TimecardListingUnavailable(this ILogger logger);
+
+    [LoggerMessage(EventId = 2503, Level = LogLevel.Debug, Message = "Getting {Count} timecard entries for company {CompanyId}")]
+    public static partial void GettingTimecardEntriesByIds(this ILogger logger, int count, int companyId);
+
+    [LoggerMessage(EventId = 2504, Level = LogLevel.Warning, Message = "Failed to retrieve timecard entry {TimecardEntryId} for company {CompanyId}")]
+    public static partial void FailedToRetrieveTimecardEntry(this ILogger logger, Exception? exception, int timecardEntryId, int companyId);
+
+    [LoggerMessage(EventId = 2505, Level = LogLevel.Debug, Message = "Successfully retrieved {Count} timecard entries out of {Total} requested")]
+    public static partial void RetrievedTimecardEntries(this ILogger logger, int count, int total);
+
+    [LoggerMessage(EventId = 2506, Level = LogLevel.Debug, Message = "Getting timecard entry {TimecardEntryId} for company {CompanyId} using generated Kiota client")]
+    public static partial void GettingTimecardEntry(this ILogger logger, int timecardEntryId, int companyId);
+
+    [LoggerMessage(EventId = 2507, Level = LogLevel.Warning, Message = "No timecard entry returned for ID {TimecardEntryId} in company {CompanyId}")]
+    public static partial void NoTimecardEntryReturned(this ILogger logger, int timecardEntryId, int companyId);
+
+    [LoggerMessage(EventId = 2508, Level = LogLevel.Debug, Message = "Updating timecard entry {TimecardEntryId} for company {CompanyId} using generated Kiota client")]
+    public static partial void UpdatingTimecardEntry(this ILogger logger, int timecardEntryId, int companyId);
+
+    [LoggerMessage(EventId = 2509, Level = LogLevel.Warning, Message = "No response from timecard entry update for ID {TimecardEntryId} in company {CompanyId}")]
+    public static partial void NoTimecardEntryUpdateResponse(this ILogger logger, int timecardEntryId, int companyId);
+
+    [LoggerMessage(EventId = 2510, Level = LogLevel.Debug, Message = "Successfully updated timecard entry {TimecardEntryId} for company {CompanyId}")]
+    public static partial void UpdatedTimecardEntry(this ILogger logger, int timecardEntryId, int companyId);
+
+    [LoggerMessage(EventId = 2511, Level = LogLevel.Debug, Message = "Deleting timecard entry {TimecardEntryId} for company {CompanyId} using generated Kiota client")]
+    public static partial void DeletingTimecardEntry(this ILogger logger, int timecardEntryId, int companyId);
+
+    [LoggerMessage(EventId = 2512, Level = LogLevel.Warning, Message = "No response from timecard entry deletion for ID {TimecardEntryId} in company {CompanyId}")]
+    public static partial void NoTimecardEntryDeletionResponse(this ILogger logger, int timecardEntryId, int companyId);
+
+    [LoggerMessage(EventId = 2513, Level = LogLevel.Debug, Message = "Successfully deleted timecard entry {TimecardEntryId} for company {CompanyId}")]
+    public static partial void DeletedTimecardEntry(this ILogger logger, int timecardEntryId, int companyId);
+
+    [LoggerMessage(EventId = 2514, Level = LogLevel.Debug, Message = "Starting bulk creation of {Count} timecard entries for project {ProjectId} in company {CompanyId}")]
+    public static partial void StartingBulkTimecardCreation(this ILogger logger, int count, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2515, Level = LogLevel.Warning, Message = "Failed to create timecard entry {Index} in bulk operation")]
+    public static partial void FailedToCreateTimecardEntry(this ILogger logger, Exception? exception, int index);
+
+    [LoggerMessage(EventId = 2516, Level = LogLevel.Information, Message = "Bulk timecard creation completed: {Success} succeeded, {Failed} failed out of {Total} total")]
+    public static partial void BulkTimecardCreationCompleted(this ILogger logger, int success, int failed, int total);
+
+    [LoggerMessage(EventId = 2517, Level = LogLevel.Debug, Message = "Starting bulk update of {Count} timecard entries for company {CompanyId}")]
+    public static partial void StartingBulkTimecardUpdate(this ILogger logger, int count, int companyId);
+
+    [LoggerMessage(EventId = 2518, Level = LogLevel.Warning, Message = "Failed to update timecard entry {TimecardEntryId} in bulk operation")]
+    public static partial void FailedToUpdateTimecardEntry(this ILogger logger, Exception? exception, int timecardEntryId);
+
+    [LoggerMessage(EventId = 2519, Level = LogLevel.Information, Message = "Bulk timecard update completed: {Success} succeeded, {Failed} failed out of {Total} total")]
+    public static partial void BulkTimecardUpdateCompleted(this ILogger logger, int success, int failed, int total);
+
+    [LoggerMessage(EventId = 2520, Level = LogLevel.Debug, Message = "Starting bulk deletion of {Count} timecard entries for company {CompanyId}")]
+    public static partial void StartingBulkTimecardDeletion(this ILogger logger, int count, int companyId);
+
+    [LoggerMessage(EventId = 2521, Level = LogLevel.Warning, Message = "Failed to delete timecard entry {TimecardEntryId} in bulk operation")]
+    public static partial void FailedToDeleteTimecardEntry(this ILogger logger, Exception? exception, int timecardEntryId);
+
+    [LoggerMessage(EventId = 2522, Level = LogLevel.Information, Message = "Bulk timecard deletion completed: {Success} succeeded, {Failed} failed out of {Total} total")]
+    public static partial void BulkTimecardDeletionCompleted(this ILogger logger, int success, int failed, int total);
+
+    [LoggerMessage(EventId = 2523, Level = LogLevel.Debug, Message = "Getting productivity report {ReportId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingProductivityReport(this ILogger logger, int reportId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2524, Level = LogLevel.Debug, Message = "Creating productivity report for project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingProductivityReportForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2525, Level = LogLevel.Debug, Message = "Getting field activities for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingFieldActivitiesForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2526, Level = LogLevel.Debug, Message = "Getting field activity {ActivityId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingFieldActivity(this ILogger logger, int activityId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2527, Level = LogLevel.Debug, Message = "Updating field activity {ActivityId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void UpdatingFieldActivity(this ILogger logger, int activityId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2528, Level = LogLevel.Debug, Message = "Getting resource utilization for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingResourceUtilizationForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2529, Level = LogLevel.Debug, Message = "Recording resource utilization for project {ProjectId} in company {CompanyId}")]
+    public static partial void RecordingResourceUtilizationForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2530, Level = LogLevel.Debug, Message = "Getting performance metrics for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingPerformanceMetricsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2531, Level = LogLevel.Debug, Message = "Recording performance metric {MetricName} for project {ProjectId} in company {CompanyId}")]
+    public static partial void RecordingPerformanceMetric(this ILogger logger, string metricName, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2532, Level = LogLevel.Debug, Message = "Getting average productivity rate for activity type {ActivityType} in project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingAverageProductivityRateForActivity(this ILogger logger, string activityType, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2533, Level = LogLevel.Debug, Message = "Calculated average productivity rate {Rate} from {Count} matching timecard entries")]
+    public static partial void CalculatedAverageProductivityRate(this ILogger logger, decimal rate, int count);
+
+    [LoggerMessage(EventId = 2534, Level = LogLevel.Warning, Message = "Failed to calculate average from real timecard data, falling back to default")]
+    public static partial void AverageProductivityRateFallback(this ILogger logger, Exception? exception);
+
+    [LoggerMessage(EventId = 2535, Level = LogLevel.Information, Message = "Using default productivity rate {Rate} for activity type {ActivityType}")]
+    public static partial void UsingDefaultProductivityRate(this ILogger logger, decimal rate, string activityType);
+
+    [LoggerMessage(EventId = 2536, Level = LogLevel.Debug, Message = "Getting productivity summary for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingProductivitySummaryForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2537, Level = LogLevel.Debug, Message = "Calculated productivity summary from {Count} activity types with real timecard data")]
+    public static partial void CalculatedProductivitySummary(this ILogger logger, int count);
+
+    [LoggerMessage(EventId = 2538, Level = LogLevel.Warning, Message = "Failed to calculate productivity summary from real timecard data, falling back to defaults")]
+    public static partial void ProductivitySummaryFallback(this ILogger logger, Exception? exception);
+
+    [LoggerMessage(EventId = 2539, Level = LogLevel.Information, Message = "Using default productivity summary for project {ProjectId}")]
+    public static partial void UsingDefaultProductivitySummary(this ILogger logger, int projectId);
+
+    [LoggerMessage(EventId = 2540, Level = LogLevel.Debug, Message = "Getting under-utilized resources (threshold: {Threshold}%) for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingUnderUtilizedResources(this ILogger logger, decimal threshold, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2541, Level = LogLevel.Debug, Message = "Getting productivity reports with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingProductivityReportsPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2542, Level = LogLevel.Debug, Message = "Getting field activities with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingFieldActivitiesPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2543, Level = LogLevel.Debug, Message = "Executing operation {Operation} with correlation ID {CorrelationId}")]
+    public static partial void ExecutingOperation(this ILogger logger, string operation, string correlationId);
+}
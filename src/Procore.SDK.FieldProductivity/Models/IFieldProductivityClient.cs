@@ -80,6 +80,15 @@ public interface IFieldProductivityClient : IDisposable
 
     // Bulk Operations
     /// <summary>
+    /// Creates multiple timecard entries through the bulk_create route, chunked to the route's limit.
+    /// </summary>
+    /// <param name="companyId">The company identifier.</param>
+    /// <param name="projectId">The project identifier.</param>
+    /// <param name="requests">The collection of timecard entries to create.</param>
+    /// <param name="cancellationToken">The cancellation token.</param>
+    /// <returns>One bulk operation result per request, in request order.</returns>
+    Task<IEnumerable<BulkOperationResult<ProductivityReport>>> BulkCreateTimecardEntriesAsync(int companyId, int projectId, IEnumerable<CreateTimecardEntryRequest> requests, CancellationToken cancellationToken = default);
+    /// <summary>
     /// Updates multiple timecard entries in a single operation.
     /// </summary>
     /// <param name="companyId">The company identifier.</param>
@@ -47,6 +47,18 @@ public class RecordResourceUtilizationRequest
 }
 
 // Bulk Operation Models
+public class CreateTimecardEntryRequest
+{
+    public DateTime Date { get; set; }
+    public decimal Hours { get; set; }
+    public string? Description { get; set; }
+    public int? PartyId { get; set; }
+    public int? CostCodeId { get; set; }
+    public int? TimecardTimeTypeId { get; set; }
+    public int? TimesheetId { get; set; }
+    public bool? Billable { get; set; }
+}
+
 public class TimecardEntryUpdate
 {
     public int TimecardEntryId { get; set; }
@@ -0,0 +1,66 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Procore.SDK.Core.FanOut;
+using Procore.SDK.ProjectManagement.Models;
+
+namespace Procore.SDK.ProjectManagement.FanOut;
+
+/// <summary>
+/// Extension methods that run a per-project query across every project of a company.
+/// </summary>
+public static class ProjectFanOutExtensions
+{
+    /// <summary>
+    /// Lists the projects of a company and runs a query against each of them with bounded
+    /// concurrency, yielding each project's results as soon as they are available.
+    /// </summary>
+    /// <remarks>
+    /// Intended for company-wide reports, e.g. all observations or all commitment contracts:
+    /// <code>
+    /// await foreach (var result in projectClient.FanOutAcrossProjectsAsync(companyId,
+    ///     (project, ct) => qualitySafetyClient.GetObservationsAsync(companyId, project.Id, ct)))
+    /// {
+    ///     if (result.Succeeded) { /* result.Items */ }
+    /// }
+    /// </code>
+    /// A project whose query fails is yielded with <see cref="FanOutResult{TSource, TResult}.Exception"/> set
+    /// and does not stop the others.
+    /// </remarks>
+    /// <typeparam name="T">The result item type.</typeparam>
+    /// <param name="client">The ProjectManagement client.</param>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="query">The per-project query.</param>
+    /// <param name="options">Optional fan-out options.</param>
+    /// <param name="projectFilter">Optional filter selecting the projects to query, e.g. active projects only.</param>
+    /// <param name="logger">Optional logger for diagnostic information.</param>
+    /// <param name="cancellationToken">Cancellation token for the operation.</param>
+    /// <returns>One result per queried project.</returns>
+    public static async IAsyncEnumerable<FanOutResult<Project, T>> FanOutAcrossProjectsAsync<T>(
+        this IProjectManagementClient client,
+        int companyId,
+        Func<Project, CancellationToken, Task<IEnumerable<T>>> query,
+        FanOutOptions? options = null,
+        Func<Project, bool>? projectFilter = null,
+        ILogger? logger = null,
+        [EnumeratorCancellation] CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(client);
+        ArgumentNullException.ThrowIfNull(query);
+
+        var projects = await client.GetProjectsAsync(companyId, cancellationToken).ConfigureAwait(false);
+        if (projectFilter != null)
+        {
+            projects = projects.Where(projectFilter);
+        }
+
+        await foreach (var result in FanOutQuery.ExecuteAsync(projects, query, options, logger, cancellationToken).ConfigureAwait(false))
+        {
+            yield return result;
+        }
+    }
+}
@@ -46,39 +46,77 @@ public class CreateProjectRequest
 }
 
 /// <summary>
-/// Request model for updating an existing project. All properties are optional.
+/// Request model for updating an existing project. All properties are optional; only the
+/// properties that are assigned are sent, and null or empty values leave the field unchanged.
+/// Use <see cref="Procore.SDK.Core.Models.PartialUpdateRequest.Clear"/> to clear the description,
+/// dates or budget.
 /// </summary>
-public class UpdateProjectRequest
+public class UpdateProjectRequest : Procore.SDK.Core.Models.PartialUpdateRequest
 {
+    private string? _name;
+    private string? _description;
+    private ProjectStatus? _status;
+    private DateTime? _startDate;
+    private DateTime? _endDate;
+    private decimal? _budget;
+
     /// <summary>
     /// Gets or sets the new name for the project, if provided.
     /// </summary>
-    public string? Name { get; set; }
+    public string? Name
+    {
+        get => _name;
+        set => Set(ref _name, value);
+    }
     
     /// <summary>
     /// Gets or sets the new description for the project, if provided.
     /// </summary>
-    public string? Description { get; set; }
+    public string? Description
+    {
+        get => _description;
+        set => Set(ref _description, value);
+    }
     
     /// <summary>
     /// Gets or sets the new status for the project, if provided.
     /// </summary>
-    public ProjectStatus? Status { get; set; }
+    public ProjectStatus? Status
+    {
+        get => _status;
+        set => Set(ref _status, value);
+    }
     
     /// <summary>
     /// Gets or sets the new start date for the project, if provided.
     /// </summary>
-    public DateTime? StartDate { get; set; }
+    public DateTime? StartDate
+    {
+        get => _startDate;
+        set => Set(ref _startDate, value);
+    }
     
     /// <summary>
     /// Gets or sets the new end date for the project, if provided.
     /// </summary>
-    public DateTime? EndDate { get; set; }
+    public DateTime? EndDate
+    {
+        get => _endDate;
+        set => Set(ref _endDate, value);
+    }
     
     /// <summary>
     /// Gets or sets the new budget allocation for the project, if provided.
     /// </summary>
-    public decimal? Budget { get; set; }
+    public decimal? Budget
+    {
+        get => _budget;
+        set => Set(ref _budget, value);
+    }
+
+    /// <inheritdoc />
+    protected override bool CanClear(string propertyName) =>
+        propertyName is nameof(Description) or nameof(StartDate) or nameof(EndDate) or nameof(Budget);
 }
 
 // Budget Request Models
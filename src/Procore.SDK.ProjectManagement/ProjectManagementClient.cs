@@ -8,6 +8,7 @@ using Microsoft.Extensions.Logging;
 using Microsoft.Kiota.Abstractions;
 using Procore.SDK.Core.ErrorHandling;
 using Procore.SDK.Core.Logging;
+using Procore.SDK.Shared.Diagnostics;
 using Procore.SDK.Core.TypeMapping;
 using CoreModels = Procore.SDK.Core.Models;
 using ProjectModels = Procore.SDK.ProjectManagement.Models;
@@ -23,6 +24,9 @@ namespace Procore.SDK.ProjectManagement;
 /// </summary>
 public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementClient
 {
+    // Mappers are stateless and thread-safe, so every client instance shares one of each
+    private static readonly ProjectTypeMapper SharedProjectTypeMapper = new();
+
     private readonly Procore.SDK.ProjectManagement.ProjectManagementClient _generatedClient;
     private readonly IRequestAdapter _requestAdapter;
     private readonly ILogger<ProcoreProjectManagementClient>? _logger;
@@ -52,7 +56,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         _requestAdapter = requestAdapter;
         _logger = logger;
         _structuredLogger = structuredLogger;
-        _projectMapper = projectMapper ?? new ProjectTypeMapper();
+        _projectMapper = projectMapper ?? SharedProjectTypeMapper;
     }
 
     #region Private Helper Methods
@@ -66,33 +70,46 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         string? correlationId = null,
         CancellationToken cancellationToken = default)
     {
-        correlationId ??= Guid.NewGuid().ToString();
+        // Correlation IDs are only created when something will be logged or an error is raised
+        if (correlationId == null && (_structuredLogger?.IsEnabled(LogLevel.Information) == true || _logger?.IsEnabled(LogLevel.Debug) == true))
+        {
+            correlationId = Guid.NewGuid().ToString();
+        }
         
-        using var operationScope = _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var operationScope = correlationId == null ? null : _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var activity = ProcoreTelemetry.StartOperation(operationName);
+        var startTimestamp = System.Diagnostics.Stopwatch.GetTimestamp();
         
         try
         {
-            _logger?.LogDebug("Executing operation {Operation} with correlation ID {CorrelationId}", operationName, correlationId);
+            _logger?.ExecutingOperation(operationName, correlationId!);
             
-            return await operation().ConfigureAwait(false);
+            var result = await operation().ConfigureAwait(false);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, null);
+            return result;
         }
         catch (HttpRequestException ex)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var mappedException = ErrorMapper.MapHttpException(ex, correlationId);
             
             _structuredLogger?.LogError(mappedException, operationName, correlationId, 
                 "HTTP error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, mappedException);
             throw mappedException;
         }
-        catch (TaskCanceledException) when (cancellationToken.IsCancellationRequested)
+        catch (TaskCanceledException ex) when (cancellationToken.IsCancellationRequested)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             _structuredLogger?.LogWarning(operationName, correlationId,
                 "Operation {Operation} was cancelled", operationName);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, ex);
             throw;
         }
         catch (Exception ex)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var wrappedException = new CoreModels.ProcoreCoreException(
                 $"Unexpected error in {operationName}: {ex.Message}", 
                 "UNEXPECTED_ERROR", 
@@ -102,6 +119,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
             _structuredLogger?.LogError(wrappedException, operationName, correlationId,
                 "Unexpected error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, wrappedException);
             throw wrappedException;
         }
     }
@@ -199,7 +217,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting projects for company {CompanyId}", companyId);
+                _logger?.GettingProjectsForCompany(companyId);
                 
                 // Use Core client to access the company projects endpoint since
                 // ProjectManagement client doesn't have a projects listing endpoint
@@ -209,14 +227,14 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                 
                 if (coreProjects == null || !coreProjects.Any())
                 {
-                    _logger?.LogWarning("No projects returned for company {CompanyId}", companyId);
+                    _logger?.NoProjectsReturnedForCompany(companyId);
                     return Enumerable.Empty<ProjectModels.Project>();
                 }
                 
                 // Map from Core generated models to ProjectManagement domain models
                 return coreProjects.Select(p => MapCoreProjectToProjectManagement(p, companyId));
             },
-            $"GetProjects-Company-{companyId}",
+            "GetProjectsAsync",
             null,
             cancellationToken);
     }
@@ -233,7 +251,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting project {ProjectId} for company {CompanyId}", projectId, companyId);
+                _logger?.GettingProject(projectId, companyId);
                 
                 // Call the generated client
                 var generatedProject = await _generatedClient.Rest.V10.Projects[projectId]
@@ -250,7 +268,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                 // Map to wrapper domain model using type mapper
                 return _projectMapper!.MapToWrapper(generatedProject);
             },
-            $"GetProject-{projectId}-Company-{companyId}",
+            "GetProjectAsync",
             null,
             cancellationToken);
     }
@@ -266,7 +284,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     {
         ArgumentNullException.ThrowIfNull(request);
         
-        _logger?.LogDebug("Attempting to create project {ProjectName} for company {CompanyId}", request.Name, companyId);
+        _logger?.AttemptingToCreateProject(request.Name, companyId);
         
         // Note: This is a placeholder implementation as the V1.0 API does not
         // provide a project creation endpoint. This would typically be handled
@@ -288,49 +306,38 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     {
         ArgumentNullException.ThrowIfNull(request);
         
+        if (!request.HasChanges)
+        {
+            // Nothing was assigned, so there is nothing to send
+            return await GetProjectAsync(companyId, projectId, cancellationToken).ConfigureAwait(false);
+        }
+        
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Updating project {ProjectId} for company {CompanyId}", projectId, companyId);
+                _logger?.UpdatingProject(projectId, companyId);
                 
                 // Create the PATCH request body for the generated client
+                var project = new Procore.SDK.ProjectManagement.Rest.V10.Projects.Item.PatchRequestBody_project();
                 var patchRequestBody = new Procore.SDK.ProjectManagement.Rest.V10.Projects.Item.PatchRequestBody
                 {
                     CompanyId = companyId,
-                    Project = new Procore.SDK.ProjectManagement.Rest.V10.Projects.Item.PatchRequestBody_project()
+                    Project = project
                 };
 
-                // Map from domain request to generated request
-                if (!string.IsNullOrEmpty(request.Name))
-                {
-                    patchRequestBody.Project.Name = request.Name;
-                }
-
-                if (!string.IsNullOrEmpty(request.Description))
-                {
-                    patchRequestBody.Project.Description = request.Description;
-                }
-
-                if (request.StartDate.HasValue)
-                {
-                    patchRequestBody.Project.StartDate = DateOnly.FromDateTime(request.StartDate.Value);
-                }
-
-                if (request.EndDate.HasValue)
-                {
-                    patchRequestBody.Project.CompletionDate = DateOnly.FromDateTime(request.EndDate.Value);
-                }
-
-                if (request.Budget.HasValue)
-                {
-                    patchRequestBody.Project.TotalValue = (float)request.Budget.Value;
-                }
+                // Only the properties assigned on the request are sent; cleared properties are sent as null
+                request.CopyIfSet(nameof(request.Name), request.Name, value => project.Name = value, project.AdditionalData, "name");
+                request.CopyIfSet(nameof(request.Description), request.Description, value => project.Description = value, project.AdditionalData, "description");
+                request.CopyIfSet(nameof(request.StartDate), request.StartDate.HasValue ? new Date(request.StartDate.Value) : (Date?)null,
+                    value => project.StartDate = value, project.AdditionalData, "start_date");
+                request.CopyIfSet(nameof(request.EndDate), request.EndDate.HasValue ? new Date(request.EndDate.Value) : (Date?)null,
+                    value => project.CompletionDate = value, project.AdditionalData, "completion_date");
+                request.CopyIfSet(nameof(request.Budget), request.Budget.HasValue ? (float)request.Budget.Value : (float?)null,
+                    value => project.TotalValue = value, project.AdditionalData, "total_value");
 
                 // Map status - for now just set active flag based on status
-                if (request.Status.HasValue)
-                {
-                    patchRequestBody.Project.Active = request.Status.Value == ProjectStatus.Active;
-                }
+                request.CopyIfSet(nameof(request.Status), request.Status.HasValue ? request.Status.Value == ProjectStatus.Active : (bool?)null,
+                    value => project.Active = value, project.AdditionalData, "active");
                 
                 // Call the generated client
                 var patchResponse = await _generatedClient.Rest.V10.Projects[projectId]
@@ -347,7 +354,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                 // Map the response back to our domain model using the patch response overload
                 return ((ProjectTypeMapper)_projectMapper!).MapToWrapper(patchResponse);
             },
-            $"UpdateProject-{projectId}-Company-{companyId}",
+            "UpdateProjectAsync",
             null,
             cancellationToken);
     }
@@ -362,7 +369,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     /// <exception cref="NotImplementedException">Thrown because project deletion is not supported in V1.0 API.</exception>
     public Task DeleteProjectAsync(int companyId, int projectId, CancellationToken cancellationToken = default)
     {
-        _logger?.LogDebug("Attempting to delete project {ProjectId} for company {CompanyId}", projectId, companyId);
+        _logger?.AttemptingToDeleteProject(projectId, companyId);
         
         // Note: Project deletion is not supported in the V1.0 API
         // This would typically be handled through administrative functions
@@ -389,7 +396,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting budget information for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingBudgetInformationForProject(projectId, companyId);
                 
                 // Call the generated V1.0 budget endpoint
                 var budgetResponse = await _generatedClient.Rest.V10.Projects[projectId].Budget
@@ -397,7 +404,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                 
                 if (budgetResponse == null)
                 {
-                    _logger?.LogWarning("No budget information returned for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                    _logger?.NoBudgetInformationReturnedForProject(projectId, companyId);
                     return Enumerable.Empty<ProjectModels.BudgetLineItem>();
                 }
 
@@ -424,7 +431,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
 
                 return Enumerable.Empty<ProjectModels.BudgetLineItem>();
             },
-            $"GetBudgetLineItems-Project-{projectId}-Company-{companyId}",
+            "GetBudgetLineItemsAsync",
             null,
             cancellationToken);
     }
@@ -442,7 +449,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     /// <exception cref="NotImplementedException">Thrown because detailed budget line items are not supported in V1.0 API.</exception>
     public Task<ProjectModels.BudgetLineItem> GetBudgetLineItemAsync(int companyId, int projectId, int lineItemId, CancellationToken cancellationToken = default)
     {
-        _logger?.LogDebug("Attempting to get budget line item {LineItemId} for project {ProjectId} in company {CompanyId}", lineItemId, projectId, companyId);
+        _logger?.AttemptingToGetBudgetLineItem(lineItemId, projectId, companyId);
         
         // Note: V1.0 API does not provide detailed budget line item endpoints
         // For detailed budget information, V2.0 API would be required
@@ -466,7 +473,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Creating budget change for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.CreatingBudgetChangeForProject(projectId, companyId);
                 
                 // Create the POST request body for the generated client
                 var postRequestBody = new Procore.SDK.ProjectManagement.Rest.V10.Projects.Item.Budget_changes.Budget_changesPostRequestBody
@@ -513,7 +520,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                     LineItems = request.LineItems ?? new List<BudgetLineItemChange>()
                 };
             },
-            $"CreateBudgetChange-Project-{projectId}-Company-{companyId}",
+            "CreateBudgetChangeAsync",
             null,
             cancellationToken);
     }
@@ -530,7 +537,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting budget changes for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingBudgetChangesForProject(projectId, companyId);
                 
                 // Call the generated client
                 var budgetChangesResponse = await _generatedClient.Rest.V10.Projects[projectId].Budget_changes
@@ -538,7 +545,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                 
                 if (budgetChangesResponse?.Data == null || budgetChangesResponse.Data.Count == 0)
                 {
-                    _logger?.LogWarning("No budget changes returned for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                    _logger?.NoBudgetChangesReturnedForProject(projectId, companyId);
                     return Enumerable.Empty<ProjectModels.BudgetChange>();
                 }
 
@@ -555,7 +562,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                     LineItems = new List<BudgetLineItemChange>() // Line items would need additional API calls
                 });
             },
-            $"GetBudgetChanges-Project-{projectId}-Company-{companyId}",
+            "GetBudgetChangesAsync",
             null,
             cancellationToken);
     }
@@ -578,14 +585,14 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting commitment contracts for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingCommitmentContractsForProject(projectId, companyId);
                 
                 // Note: V1.0 API does not provide commitment contract endpoints
                 // Return empty collection for now - would require V2.0 API implementation
                 await Task.CompletedTask.ConfigureAwait(false);
                 return Enumerable.Empty<CommitmentContract>();
             },
-            $"GetCommitmentContracts-Project-{projectId}-Company-{companyId}",
+            "GetCommitmentContractsAsync",
             null,
             cancellationToken);
     }
@@ -603,7 +610,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     /// <exception cref="NotImplementedException">Thrown because commitment contracts are not supported in V1.0 API.</exception>
     public Task<ProjectModels.CommitmentContract> GetCommitmentContractAsync(int companyId, int projectId, int contractId, CancellationToken cancellationToken = default)
     {
-        _logger?.LogDebug("Attempting to get commitment contract {ContractId} for project {ProjectId} in company {CompanyId}", contractId, projectId, companyId);
+        _logger?.AttemptingToGetCommitmentContract(contractId, projectId, companyId);
         
         // Note: V1.0 API does not provide commitment contract endpoints
         return Task.FromException<ProjectModels.CommitmentContract>(new NotImplementedException(
@@ -627,7 +634,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     {
         ArgumentNullException.ThrowIfNull(request);
         
-        _logger?.LogDebug("Attempting to create change order for project {ProjectId} in company {CompanyId}", projectId, companyId);
+        _logger?.AttemptingToCreateChangeOrder(projectId, companyId);
         
         // Note: V1.0 API does not provide change order creation endpoints
         return Task.FromException<ProjectModels.ChangeOrder>(new NotImplementedException(
@@ -649,14 +656,14 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting change orders for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingChangeOrdersForProject(projectId, companyId);
                 
                 // Note: V1.0 API does not provide change order endpoints
                 // Return empty collection for now - would require V2.0 API implementation
                 await Task.CompletedTask.ConfigureAwait(false);
                 return Enumerable.Empty<ChangeOrder>();
             },
-            $"GetChangeOrders-Project-{projectId}-Company-{companyId}",
+            "GetChangeOrdersAsync",
             null,
             cancellationToken);
     }
@@ -679,14 +686,14 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting workflow instances for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingWorkflowInstancesForProject(projectId, companyId);
                 
                 // Note: V1.0 API does not provide workflow endpoints
                 // Return empty collection for now - would require V2.0 API implementation
                 await Task.CompletedTask.ConfigureAwait(false);
                 return Enumerable.Empty<WorkflowInstance>();
             },
-            $"GetWorkflowInstances-Project-{projectId}-Company-{companyId}",
+            "GetWorkflowInstancesAsync",
             null,
             cancellationToken);
     }
@@ -704,7 +711,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     /// <exception cref="NotImplementedException">Thrown because workflow instances are not supported in V1.0 API.</exception>
     public Task<ProjectModels.WorkflowInstance> GetWorkflowInstanceAsync(int companyId, int projectId, int workflowId, CancellationToken cancellationToken = default)
     {
-        _logger?.LogDebug("Attempting to get workflow instance {WorkflowId} for project {ProjectId} in company {CompanyId}", workflowId, projectId, companyId);
+        _logger?.AttemptingToGetWorkflowInstance(workflowId, projectId, companyId);
         
         // Note: V1.0 API does not provide workflow endpoints
         return Task.FromException<ProjectModels.WorkflowInstance>(new NotImplementedException(
@@ -725,7 +732,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     /// <exception cref="NotImplementedException">Thrown because workflow operations are not supported in V1.0 API.</exception>
     public Task RestartWorkflowAsync(int companyId, int projectId, int workflowId, CancellationToken cancellationToken = default)
     {
-        _logger?.LogDebug("Attempting to restart workflow instance {WorkflowId} for project {ProjectId} in company {CompanyId}", workflowId, projectId, companyId);
+        _logger?.AttemptingToRestartWorkflowInstance(workflowId, projectId, companyId);
         
         // Note: V1.0 API does not provide workflow endpoints
         return Task.FromException(new NotImplementedException(
@@ -746,7 +753,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     /// <exception cref="NotImplementedException">Thrown because workflow operations are not supported in V1.0 API.</exception>
     public Task TerminateWorkflowAsync(int companyId, int projectId, int workflowId, CancellationToken cancellationToken = default)
     {
-        _logger?.LogDebug("Attempting to terminate workflow instance {WorkflowId} for project {ProjectId} in company {CompanyId}", workflowId, projectId, companyId);
+        _logger?.AttemptingToTerminateWorkflowInstance(workflowId, projectId, companyId);
         
         // Note: V1.0 API does not provide workflow endpoints
         return Task.FromException(new NotImplementedException(
@@ -772,14 +779,14 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting meetings for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingMeetingsForProject(projectId, companyId);
                 
                 // Note: V1.0 API does not provide meeting endpoints
                 // Return empty collection for now - would require V2.0 API implementation
                 await Task.CompletedTask.ConfigureAwait(false);
                 return Enumerable.Empty<Meeting>();
             },
-            $"GetMeetings-Project-{projectId}-Company-{companyId}",
+            "GetMeetingsAsync",
             null,
             cancellationToken);
     }
@@ -797,7 +804,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     /// <exception cref="NotImplementedException">Thrown because meeting operations are not supported in V1.0 API.</exception>
     public Task<ProjectModels.Meeting> GetMeetingAsync(int companyId, int projectId, int meetingId, CancellationToken cancellationToken = default)
     {
-        _logger?.LogDebug("Attempting to get meeting {MeetingId} for project {ProjectId} in company {CompanyId}", meetingId, projectId, companyId);
+        _logger?.AttemptingToGetMeeting(meetingId, projectId, companyId);
         
         // Note: V1.0 API does not provide meeting endpoints
         return Task.FromException<ProjectModels.Meeting>(new NotImplementedException(
@@ -821,7 +828,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     {
         ArgumentNullException.ThrowIfNull(request);
         
-        _logger?.LogDebug("Attempting to create meeting for project {ProjectId} in company {CompanyId}", projectId, companyId);
+        _logger?.AttemptingToCreateMeetingForProject(projectId, companyId);
         
         // Note: V1.0 API does not provide meeting endpoints
         return Task.FromException<ProjectModels.Meeting>(new NotImplementedException(
@@ -846,7 +853,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
     {
         ArgumentNullException.ThrowIfNull(request);
         
-        _logger?.LogDebug("Attempting to update meeting {MeetingId} for project {ProjectId} in company {CompanyId}", meetingId, projectId, companyId);
+        _logger?.AttemptingToUpdateMeeting(meetingId, projectId, companyId);
         
         // Note: V1.0 API does not provide meeting endpoints
         return Task.FromException<ProjectModels.Meeting>(new NotImplementedException(
@@ -869,14 +876,14 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting active projects for company {CompanyId}", companyId);
+                _logger?.GettingActiveProjectsForCompany(companyId);
                 
                 // Use the existing GetProjectsAsync method and filter for active projects
                 var allProjects = await GetProjectsAsync(companyId, cancellationToken);
                 
                 return allProjects.Where(p => p.IsActive && p.Status == ProjectStatus.Active);
             },
-            $"GetActiveProjects-Company-{companyId}",
+            "GetActiveProjectsAsync",
             null,
             cancellationToken);
     }
@@ -898,7 +905,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting project by name {ProjectName} for company {CompanyId}", projectName, companyId);
+                _logger?.GettingProjectByName(projectName, companyId);
                 
                 // Use the existing GetProjectsAsync method and find by name
                 var allProjects = await GetProjectsAsync(companyId, cancellationToken);
@@ -916,7 +923,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                 
                 return matchingProject;
             },
-            $"GetProjectByName-{projectName}-Company-{companyId}",
+            "GetProjectByNameAsync",
             null,
             cancellationToken);
     }
@@ -933,23 +940,23 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting budget total for project {ProjectId} in company {CompanyId}", projectId, companyId);
-                
-                // Get the project first to see if it has a budget amount
-                var project = await GetProjectAsync(companyId, projectId, cancellationToken);
+                _logger?.GettingBudgetTotalForProject(projectId, companyId);
                 
+                // Budget changes are only fetched when the project carries no budget amount, so the
+                // common case costs a single request
+                var project = await GetProjectAsync(companyId, projectId, cancellationToken).ConfigureAwait(false);
                 if (project.Budget.HasValue)
                 {
                     return project.Budget.Value;
                 }
 
-                // If no budget in project, try to get from budget changes
-                var budgetChanges = await GetBudgetChangesAsync(companyId, projectId, cancellationToken);
+                // If no budget in project, total the approved budget changes
+                var budgetChanges = await GetBudgetChangesAsync(companyId, projectId, cancellationToken).ConfigureAwait(false);
                 
                 return budgetChanges.Where(bc => bc.Status == BudgetChangeStatus.Approved)
                                   .Sum(bc => bc.Amount);
             },
-            $"GetProjectBudgetTotal-Project-{projectId}-Company-{companyId}",
+            "GetProjectBudgetTotalAsync",
             null,
             cancellationToken);
     }
@@ -967,7 +974,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting budget variances for project {ProjectId} in company {CompanyId} with threshold {Threshold}%", projectId, companyId, thresholdPercentage);
+                _logger?.GettingBudgetVariancesForProject(projectId, companyId, thresholdPercentage);
                 
                 // Get budget line items (limited info available from V1.0)
                 var budgetLineItems = await GetBudgetLineItemsAsync(companyId, projectId, cancellationToken);
@@ -1000,7 +1007,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                 
                 return variances.AsEnumerable();
             },
-            $"GetBudgetVariances-Project-{projectId}-Company-{companyId}-Threshold-{thresholdPercentage}",
+            "GetBudgetVariancesAsync",
             null,
             cancellationToken);
     }
@@ -1023,7 +1030,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting projects with pagination for company {CompanyId} (page {Page}, per page {PerPage})", companyId, options.Page, options.PerPage);
+                _logger?.GettingProjectsPage(companyId, options.Page, options.PerPage);
                 
                 // Get all projects first (since V1.0 API doesn't support server-side pagination)
                 var allProjects = await GetProjectsAsync(companyId, cancellationToken);
@@ -1047,7 +1054,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                     HasPreviousPage = options.Page > 1
                 };
             },
-            $"GetProjectsPaged-Company-{companyId}-Page-{options.Page}",
+            "GetProjectsPagedAsync",
             null,
             cancellationToken);
     }
@@ -1067,7 +1074,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting budget line items with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+                _logger?.GettingBudgetLineItemsPage(projectId, companyId, options.Page, options.PerPage);
                 
                 // Get all budget line items first
                 var allBudgetLineItems = await GetBudgetLineItemsAsync(companyId, projectId, cancellationToken);
@@ -1091,7 +1098,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                     HasPreviousPage = options.Page > 1
                 };
             },
-            $"GetBudgetLineItemsPaged-Project-{projectId}-Company-{companyId}-Page-{options.Page}",
+            "GetBudgetLineItemsPagedAsync",
             null,
             cancellationToken);
     }
@@ -1111,7 +1118,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting commitment contracts with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+                _logger?.GettingCommitmentContractsPage(projectId, companyId, options.Page, options.PerPage);
                 
                 // Get all commitment contracts first
                 var allCommitmentContracts = await GetCommitmentContractsAsync(companyId, projectId, cancellationToken);
@@ -1135,7 +1142,7 @@ public class ProcoreProjectManagementClient : ProjectModels.IProjectManagementCl
                     HasPreviousPage = options.Page > 1
                 };
             },
-            $"GetCommitmentContractsPaged-Project-{projectId}-Company-{companyId}-Page-{options.Page}",
+            "GetCommitmentContractsPagedAsync",
             null,
             cancellationToken);
     }
@@ -0,0 +1,106 @@
+using System;
+using Microsoft.Extensions.Logging;
+
+namespace Procore.SDK.ProjectManagement;
+
+/// <summary>
+/// Source-generated log messages for <see cref="ProcoreProjectManagementClient"/>.
+/// </summary>
+internal static partial class ProjectManagementClientLog
+{
+    [LoggerMessage(EventId = 2201, Level = LogLevel.Debug, Message = "Getting projects for company {CompanyId}")]
+    public static partial void GettingProjectsForCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2202, Level = LogLevel.Warning, Message = "No projects returned for company {CompanyId}")]
+    public static partial void NoProjectsReturnedForCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2203, Level = LogLevel.Debug, Message = "Getting project {ProjectId} for company {CompanyId}")]
+    public static partial void GettingProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2204, Level = LogLevel.Debug, Message = "Attempting to create project {ProjectName} for company {CompanyId}")]
+    public static partial void AttemptingToCreateProject(this ILogger logger, string projectName, int companyId);
+
+    [LoggerMessage(EventId = 2205, Level = LogLevel.Debug, Message = "Updating project {ProjectId} for company {CompanyId}")]
+    public static partial void UpdatingProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2206, Level = LogLevel.Debug, Message = "Attempting to delete project {ProjectId} for company {CompanyId}")]
+    public static partial void AttemptingToDeleteProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2207, Level = LogLevel.Debug, Message = "Getting budget information for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingBudgetInformationForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2208, Level = LogLevel.Warning, Message = "No budget information returned for project {ProjectId} in company {CompanyId}")]
+    public static partial void NoBudgetInformationReturnedForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2209, Level = LogLevel.Debug, Message = "Attempting to get budget line item {LineItemId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void AttemptingToGetBudgetLineItem(this ILogger logger, int lineItemId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2210, Level = LogLevel.Debug, Message = "Creating budget change for project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingBudgetChangeForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2211, Level = LogLevel.Debug, Message = "Getting budget changes for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingBudgetChangesForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2212, Level = LogLevel.Warning, Message = "No budget changes returned for project {ProjectId} in company {CompanyId}")]
+    public static partial void NoBudgetChangesReturnedForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2213, Level = LogLevel.Debug, Message = "Getting commitment contracts for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingCommitmentContractsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2214, Level = LogLevel.Debug, Message = "Attempting to get commitment contract {ContractId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void AttemptingToGetCommitmentContract(this ILogger logger, int contractId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2215, Level = LogLevel.Debug, Message = "Attempting to create change order for project {ProjectId} in company {CompanyId}")]
+    public static partial void AttemptingToCreateChangeOrder(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2216, Level = LogLevel.Debug, Message = "Getting change orders for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingChangeOrdersForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2217, Level = LogLevel.Debug, Message = "Getting workflow instances for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingWorkflowInstancesForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2218, Level = LogLevel.Debug, Message = "Attempting to get workflow instance {WorkflowId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void AttemptingToGetWorkflowInstance(this ILogger logger, int workflowId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2219, Level = LogLevel.Debug, Message = "Attempting to restart workflow instance {WorkflowId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void AttemptingToRestartWorkflowInstance(this ILogger logger, int workflowId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2220, Level = LogLevel.Debug, Message = "Attempting to terminate workflow instance {WorkflowId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void AttemptingToTerminateWorkflowInstance(this ILogger logger, int workflowId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2221, Level = LogLevel.Debug, Message = "Getting meetings for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingMeetingsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2222, Level = LogLevel.Debug, Message = "Attempting to get meeting {MeetingId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void AttemptingToGetMeeting(this ILogger logger, int meetingId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2223, Level = LogLevel.Debug, Message = "Attempting to create meeting for project {ProjectId} in company {CompanyId}")]
+    public static partial void AttemptingToCreateMeetingForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2224, Level = LogLevel.Debug, Message = "Attempting to update meeting {MeetingId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void AttemptingToUpdateMeeting(this ILogger logger, int meetingId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2225, Level = LogLevel.Debug, Message = "Getting active projects for company {CompanyId}")]
+    public static partial void GettingActiveProjectsForCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2226, Level = LogLevel.Debug, Message = "Getting project by name {ProjectName} for company {CompanyId}")]
+    public static partial void GettingProjectByName(this ILogger logger, string projectName, int companyId);
+
+    [LoggerMessage(EventId = 2227, Level = LogLevel.Debug, Message = "Getting budget total for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingBudgetTotalForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2228, Level = LogLevel.Debug, Message = "Getting budget variances for project {ProjectId} in company {CompanyId} with threshold {Threshold}%")]
+    public static partial void GettingBudgetVariancesForProject(this ILogger logger, int projectId, int companyId, decimal threshold);
+
+    [LoggerMessage(EventId = 2229, Level = LogLevel.Debug, Message = "Getting projects with pagination for company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingProjectsPage(this ILogger logger, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2230, Level = LogLevel.Debug, Message = "Getting budget line items with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingBudgetLineItemsPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2231, Level = LogLevel.Debug, Message = "Getting commitment contracts with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingCommitmentContractsPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2232, Level = LogLevel.Debug, Message = "Executing operation {Operation} with correlation ID {CorrelationId}")]
+    public static partial void ExecutingOperation(this ILogger logger, string operation, string correlationId);
+}
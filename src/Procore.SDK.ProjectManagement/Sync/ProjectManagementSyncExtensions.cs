@@ -0,0 +1,29 @@
+using System;
+using System.Globalization;
+using Procore.SDK.Core.Sync;
+using Procore.SDK.ProjectManagement.Models;
+
+namespace Procore.SDK.ProjectManagement.Sync;
+
+/// <summary>
+/// Extension methods that describe ProjectManagement resources for <see cref="DeltaSyncEngine"/>.
+/// </summary>
+public static class ProjectManagementSyncExtensions
+{
+    /// <summary>
+    /// Describes the projects of a company as a sync resource. The company projects endpoint cannot be
+    /// filtered by update time, so changes are detected by comparing content hashes with the previous run.
+    /// </summary>
+    /// <param name="client">The ProjectManagement client.</param>
+    /// <param name="companyId">The company ID.</param>
+    /// <returns>The sync resource definition.</returns>
+    public static SyncResource<Project> ProjectsSyncResource(this IProjectManagementClient client, int companyId)
+    {
+        ArgumentNullException.ThrowIfNull(client);
+
+        return SyncResource<Project>.FullListing(
+            "projects",
+            project => project.Id.ToString(CultureInfo.InvariantCulture),
+            cancellationToken => client.GetProjectsAsync(companyId, cancellationToken));
+    }
+}
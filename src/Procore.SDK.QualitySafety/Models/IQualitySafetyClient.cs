@@ -19,6 +19,7 @@ public interface IQualitySafetyClient : IDisposable
 
     // Observation Operations
     Task<IEnumerable<Observation>> GetObservationsAsync(int companyId, int projectId, CancellationToken cancellationToken = default);
+    Task<IEnumerable<Observation>> GetObservationsUpdatedSinceAsync(int companyId, int projectId, DateTimeOffset updatedSince, CancellationToken cancellationToken = default);
     Task<Observation> GetObservationAsync(int companyId, int projectId, int observationId, CancellationToken cancellationToken = default);
     Task<Observation> CreateObservationAsync(int companyId, int projectId, CreateObservationRequest request, CancellationToken cancellationToken = default);
     Task<Observation> UpdateObservationAsync(int companyId, int projectId, int observationId, UpdateObservationRequest request, CancellationToken cancellationToken = default);
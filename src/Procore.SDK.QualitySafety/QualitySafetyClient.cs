@@ -1,13 +1,17 @@
 using System;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
 using System.Net.Http;
 using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using Microsoft.Kiota.Abstractions;
+using Procore.SDK.Core.Bulk;
+using Procore.SDK.Core.Composite;
 using Procore.SDK.Core.ErrorHandling;
 using Procore.SDK.Core.Logging;
+using Procore.SDK.Shared.Diagnostics;
 using Procore.SDK.QualitySafety.Models;
 using Procore.SDK.QualitySafety.TypeMapping;
 using ObservationItems = Procore.SDK.QualitySafety.Rest.V10.Observations.Items;
@@ -21,6 +25,16 @@ namespace Procore.SDK.QualitySafety;
 /// </summary>
 public class ProcoreQualitySafetyClient : IQualitySafetyClient
 {
+    // Mappers are stateless and thread-safe, so every client instance shares one of each
+    private static readonly ObservationTypeMapper SharedObservationTypeMapper = new();
+    private static readonly ObservationGetResponseMapper SharedObservationGetResponseMapper = new();
+    private static readonly ObservationPostResponseMapper SharedObservationPostResponseMapper = new();
+    private static readonly ObservationPatchResponseMapper SharedObservationPatchResponseMapper = new();
+    private static readonly SafetyIncidentTypeMapper SharedSafetyIncidentTypeMapper = new();
+    private static readonly SafetyIncidentPostResponseMapper SharedSafetyIncidentPostResponseMapper = new();
+    private static readonly NearMissTypeMapper SharedNearMissTypeMapper = new();
+    private static readonly NearMissPostResponseMapper SharedNearMissPostResponseMapper = new();
+
     private readonly Procore.SDK.QualitySafety.QualitySafetyClient _generatedClient;
     private readonly IRequestAdapter _requestAdapter;
     private readonly ILogger<ProcoreQualitySafetyClient>? _logger;
@@ -55,14 +69,14 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         _requestAdapter = requestAdapter ?? throw new ArgumentNullException(nameof(requestAdapter));
         _logger = logger;
         _structuredLogger = structuredLogger;
-        _observationTypeMapper = new ObservationTypeMapper();
-        _observationGetResponseMapper = new ObservationGetResponseMapper();
-        _observationPostResponseMapper = new ObservationPostResponseMapper();
-        _observationPatchResponseMapper = new ObservationPatchResponseMapper();
-        _safetyIncidentTypeMapper = new SafetyIncidentTypeMapper();
-        _safetyIncidentPostResponseMapper = new SafetyIncidentPostResponseMapper();
-        _nearMissTypeMapper = new NearMissTypeMapper();
-        _nearMissPostResponseMapper = new NearMissPostResponseMapper();
+        _observationTypeMapper = SharedObservationTypeMapper;
+        _observationGetResponseMapper = SharedObservationGetResponseMapper;
+        _observationPostResponseMapper = SharedObservationPostResponseMapper;
+        _observationPatchResponseMapper = SharedObservationPatchResponseMapper;
+        _safetyIncidentTypeMapper = SharedSafetyIncidentTypeMapper;
+        _safetyIncidentPostResponseMapper = SharedSafetyIncidentPostResponseMapper;
+        _nearMissTypeMapper = SharedNearMissTypeMapper;
+        _nearMissPostResponseMapper = SharedNearMissPostResponseMapper;
     }
 
     #region Private Helper Methods
@@ -76,33 +90,46 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         string? correlationId = null,
         CancellationToken cancellationToken = default)
     {
-        correlationId ??= Guid.NewGuid().ToString();
+        // Correlation IDs are only created when something will be logged or an error is raised
+        if (correlationId == null && (_structuredLogger?.IsEnabled(LogLevel.Information) == true || _logger?.IsEnabled(LogLevel.Debug) == true))
+        {
+            correlationId = Guid.NewGuid().ToString();
+        }
         
-        using var operationScope = _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var operationScope = correlationId == null ? null : _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var activity = ProcoreTelemetry.StartOperation(operationName);
+        var startTimestamp = System.Diagnostics.Stopwatch.GetTimestamp();
         
         try
         {
-            _logger?.LogDebug("Executing operation {Operation} with correlation ID {CorrelationId}", operationName, correlationId);
+            _logger?.ExecutingOperation(operationName, correlationId!);
             
-            return await operation().ConfigureAwait(false);
+            var result = await operation().ConfigureAwait(false);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, null);
+            return result;
         }
         catch (HttpRequestException httpEx)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var mappedException = ErrorMapper.MapHttpException(httpEx, correlationId);
             
             _structuredLogger?.LogError(mappedException, operationName, correlationId, 
                 "HTTP error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, mappedException);
             throw mappedException;
         }
         catch (TaskCanceledException ex) when (cancellationToken.IsCancellationRequested)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             _structuredLogger?.LogWarning(operationName, correlationId,
                 "Operation {Operation} was cancelled", operationName);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, ex);
             throw;
         }
         catch (Exception ex)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var wrappedException = new CoreModels.ProcoreCoreException(
                 $"Unexpected error in {operationName}: {ex.Message}", 
                 "UNEXPECTED_ERROR", 
@@ -112,6 +139,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
             _structuredLogger?.LogError(wrappedException, operationName, correlationId,
                 "Unexpected error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, wrappedException);
             throw wrappedException;
         }
     }
@@ -148,27 +176,68 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting observations for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingObservationsForProject(projectId, companyId);
                 
                 // Use the real observation items endpoint which provides full observation data
                 var observationItems = await _generatedClient.Rest.V10.Observations.Items
                     .GetAsync(cancellationToken: cancellationToken).ConfigureAwait(false);
                 
                 // Map the response to our domain models
-                var observations = new List<Observation>();
-                if (observationItems != null)
+                var observations = observationItems != null
+                    ? _observationTypeMapper.MapToWrapperMany(observationItems)
+                    : Array.Empty<Observation>();
+                foreach (var observation in observations)
                 {
-                    foreach (var item in observationItems)
-                    {
-                        var observation = _observationTypeMapper.MapToWrapper(item);
-                        observation.ProjectId = projectId; // Set project ID from context
-                        observations.Add(observation);
-                    }
+                    observation.ProjectId = projectId; // Set project ID from context
                 }
                 
                 return observations;
             },
-            $"GetObservations-Project-{projectId}-Company-{companyId}",
+            "GetObservationsAsync",
+            null,
+            cancellationToken);
+    }
+
+    /// <summary>
+    /// Gets the observations for a project that were updated at or after the specified time.
+    /// The filter is applied by the API, so only changed observations are transferred.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="projectId">The project ID.</param>
+    /// <param name="updatedSince">The earliest update time to include.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>A collection of observations updated since the specified time.</returns>
+    public async Task<IEnumerable<Observation>> GetObservationsUpdatedSinceAsync(int companyId, int projectId, DateTimeOffset updatedSince, CancellationToken cancellationToken = default)
+    {
+        return await ExecuteWithResilienceAsync(
+            async () =>
+            {
+                _logger?.GettingObservationsUpdatedSince(updatedSince, projectId, companyId);
+
+                var requestInfo = _generatedClient.Rest.V10.Observations.Items
+                    .ToGetRequestInformation(config => config.QueryParameters.ProjectId = projectId);
+
+                // The generated FiltersupdatedAt property only takes a single date; the API expects an ISO 8601 range.
+                // The upper bound is a day ahead so records stamped by a server clock running fast are not missed.
+                requestInfo.QueryParameters["filters%5Bupdated_at%5D"] = string.Create(CultureInfo.InvariantCulture,
+                    $"{updatedSince.UtcDateTime:yyyy-MM-ddTHH:mm:ssZ}...{DateTime.UtcNow.AddDays(1):yyyy-MM-ddTHH:mm:ssZ}");
+
+                var observationItems = await _requestAdapter.SendCollectionAsync(
+                    requestInfo,
+                    ObservationItems.Items.CreateFromDiscriminatorValue,
+                    cancellationToken: cancellationToken).ConfigureAwait(false);
+
+                var observations = observationItems != null
+                    ? _observationTypeMapper.MapToWrapperMany(observationItems)
+                    : Array.Empty<Observation>();
+                foreach (var observation in observations)
+                {
+                    observation.ProjectId = projectId; // Set project ID from context
+                }
+
+                return observations;
+            },
+            "GetObservationsUpdatedSinceAsync",
             null,
             cancellationToken);
     }
@@ -186,7 +255,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting observation {ObservationId} for project {ProjectId} in company {CompanyId}", observationId, projectId, companyId);
+            _logger?.GettingObservation(observationId, projectId, companyId);
             
             try
             {
@@ -203,7 +272,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
             }
             catch (Exception ex) when (!(ex is TaskCanceledException))
             {
-                _logger?.LogWarning(ex, "Could not retrieve observation {ObservationId} directly, trying alternative approach", observationId);
+                _logger?.CouldNotRetrieveObservation(ex, observationId);
                 
                 // Fallback: Try to find in the observations list
                 try
@@ -217,7 +286,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                 }
                 catch (Exception fallbackEx)
                 {
-                    _logger?.LogWarning(fallbackEx, "Fallback approach also failed for observation {ObservationId}", observationId);
+                    _logger?.ObservationFallbackFailed(fallbackEx, observationId);
                 }
             }
             
@@ -248,13 +317,13 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Deleting observation {ObservationId} for project {ProjectId} in company {CompanyId} using generated Kiota client", observationId, projectId, companyId);
+            _logger?.DeletingObservation(observationId, projectId, companyId);
             
             // Use the generated Kiota client to delete the observation (send to recycle bin)
             await _generatedClient.Rest.V10.Projects[projectId].Observations.Items[observationId].DeleteAsync(
                 cancellationToken: cancellationToken).ConfigureAwait(false);
             
-            _logger?.LogDebug("Successfully deleted observation {ObservationId} for project {ProjectId} in company {CompanyId}", observationId, projectId, companyId);
+            _logger?.DeletedObservation(observationId, projectId, companyId);
         }, "DeleteObservationAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
@@ -274,7 +343,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Creating observation for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.CreatingObservationForProject(projectId, companyId);
                 
                 // Create the request body using the generated client types
                 var postRequestBody = new ObservationItems.ItemsPostRequestBody
@@ -320,7 +389,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                     UpdatedAt = DateTime.UtcNow
                 };
             },
-            $"CreateObservation-{request.Title}-Project-{projectId}-Company-{companyId}",
+            "CreateObservationAsync",
             null,
             cancellationToken);
     }
@@ -342,7 +411,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Updating observation {ObservationId} for project {ProjectId} in company {CompanyId}", observationId, projectId, companyId);
+                _logger?.UpdatingObservation(observationId, projectId, companyId);
                 
                 // Create the PATCH request body using the generated client types
                 var patchRequestBody = new ObservationItems.Item.PatchRequestBody
@@ -403,7 +472,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                     UpdatedAt = DateTime.UtcNow
                 };
             },
-            $"UpdateObservation-{observationId}-Project-{projectId}-Company-{companyId}",
+            "UpdateObservationAsync",
             null,
             cancellationToken);
     }
@@ -470,7 +539,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting inspection templates for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingInspectionTemplatesForProject(projectId, companyId);
                 
                 var templates = new List<InspectionTemplate>();
                 
@@ -512,7 +581,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                 }
                 catch (Exception ex) when (!(ex is TaskCanceledException))
                 {
-                    _logger?.LogWarning(ex, "Could not retrieve project configuration for inspection templates");
+                    _logger?.ProjectConfigurationUnavailable(ex);
                 }
                 
                 // Return at least one default template
@@ -533,7 +602,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                 
                 return templates.AsEnumerable();
             },
-            $"GetInspectionTemplates-Project-{projectId}-Company-{companyId}",
+            "GetInspectionTemplatesAsync",
             null,
             cancellationToken);
     }
@@ -550,7 +619,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         try
         {
-            _logger?.LogDebug("Getting inspection template {TemplateId} for project {ProjectId} in company {CompanyId}", templateId, projectId, companyId);
+            _logger?.GettingInspectionTemplate(templateId, projectId, companyId);
             
             // Placeholder implementation
             return new InspectionTemplate 
@@ -567,7 +636,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to get inspection template {TemplateId} for project {ProjectId} in company {CompanyId}", templateId, projectId, companyId);
+            _logger?.FailedToGetInspectionTemplate(ex, templateId, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -586,7 +655,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         
         try
         {
-            _logger?.LogDebug("Creating inspection template for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.CreatingInspectionTemplateForProject(projectId, companyId);
             
             // Placeholder implementation
             var templateItems = request.Items.Select((item, index) => new InspectionTemplateItem
@@ -614,7 +683,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to create inspection template for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.FailedToCreateInspectionTemplate(ex, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -634,7 +703,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         
         try
         {
-            _logger?.LogDebug("Updating inspection template {TemplateId} for project {ProjectId} in company {CompanyId}", templateId, projectId, companyId);
+            _logger?.UpdatingInspectionTemplate(templateId, projectId, companyId);
             
             // Placeholder implementation
             var templateItems = request.Items.Select((item, index) => new InspectionTemplateItem
@@ -661,7 +730,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to update inspection template {TemplateId} for project {ProjectId} in company {CompanyId}", templateId, projectId, companyId);
+            _logger?.FailedToUpdateInspectionTemplate(ex, templateId, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -682,7 +751,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting inspection items for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingInspectionItemsForProject(projectId, companyId);
                 
                 var items = new List<InspectionItem>();
                 
@@ -723,18 +792,18 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                         }
                         catch (Exception ex) when (!(ex is TaskCanceledException))
                         {
-                            _logger?.LogDebug(ex, "Could not retrieve response logs for observation {ObservationId}", observation.Id);
+                            _logger?.ResponseLogsUnavailable(ex, observation.Id);
                         }
                     }
                 }
                 catch (Exception ex) when (!(ex is TaskCanceledException))
                 {
-                    _logger?.LogWarning(ex, "Could not retrieve observations for inspection items mapping");
+                    _logger?.InspectionObservationsUnavailable(ex);
                 }
                 
                 return items.AsEnumerable();
             },
-            $"GetInspectionItems-Project-{projectId}-Company-{companyId}",
+            "GetInspectionItemsAsync",
             null,
             cancellationToken);
     }
@@ -786,7 +855,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         try
         {
-            _logger?.LogDebug("Getting inspection item {ItemId} for project {ProjectId} in company {CompanyId}", itemId, projectId, companyId);
+            _logger?.GettingInspectionItem(itemId, projectId, companyId);
             
             // Placeholder implementation
             return new InspectionItem 
@@ -803,7 +872,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to get inspection item {ItemId} for project {ProjectId} in company {CompanyId}", itemId, projectId, companyId);
+            _logger?.FailedToGetInspectionItem(ex, itemId, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -827,7 +896,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         
         try
         {
-            _logger?.LogDebug("Updating inspection item {ItemId} for project {ProjectId} in company {CompanyId}", itemId, projectId, companyId);
+            _logger?.UpdatingInspectionItem(itemId, projectId, companyId);
             
             // Placeholder implementation
             return new InspectionItem 
@@ -845,7 +914,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to update inspection item {ItemId} for project {ProjectId} in company {CompanyId}", itemId, projectId, companyId);
+            _logger?.FailedToUpdateInspectionItem(ex, itemId, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -867,89 +936,65 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting safety incidents for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingSafetyIncidentsForProject(projectId, companyId);
                 
-                var incidents = new List<SafetyIncident>();
+                var incidentsBuilder = _generatedClient.Rest.V10.Projects[projectId].Incidents;
                 
-                // Get injuries as they represent safety incidents
-                try
-                {
-                    var injuries = await _generatedClient.Rest.V10.Projects[projectId].Incidents.Injuries
-                        .GetAsync(cancellationToken: cancellationToken).ConfigureAwait(false);
-                    
-                    if (injuries != null)
-                    {
-                        foreach (var injury in injuries)
-                        {
-                            var incident = _safetyIncidentTypeMapper.MapToWrapper(injury);
-                            incident.ProjectId = projectId; // Set project ID from context
-                            incidents.Add(incident);
-                        }
-                    }
-                }
-                catch (Exception ex) when (!(ex is TaskCanceledException))
+                // The three incident types are independent, so they are fetched concurrently and
+                // a failure of one still returns the others
+                using var query = new CompositeQuery(_logger, cancellationToken);
+                var injuries = query.Add("injuries", ct => incidentsBuilder.Injuries.GetAsync(cancellationToken: ct), optional: true);
+                var nearMisses = query.Add("near misses", ct => incidentsBuilder.Near_misses.GetAsync(cancellationToken: ct), optional: true);
+                var alerts = query.Add("alerts", ct => incidentsBuilder.Alerts.GetAsync(cancellationToken: ct), optional: true);
+                await query.WhenAllAsync().ConfigureAwait(false);
+                
+                var incidents = new List<SafetyIncident>(
+                    (injuries.Value?.Count ?? 0) + (nearMisses.Value?.Count ?? 0) + (alerts.Value?.Count ?? 0));
+                
+                // Injuries represent safety incidents
+                if (injuries.Value != null)
                 {
-                    _logger?.LogWarning(ex, "Failed to retrieve injuries for project {ProjectId}", projectId);
+                    incidents.AddRange(_safetyIncidentTypeMapper.MapToWrapperMany(injuries.Value));
                 }
                 
-                // Get near misses
-                try
+                if (nearMisses.Value != null)
                 {
-                    var nearMisses = await _generatedClient.Rest.V10.Projects[projectId].Incidents.Near_misses
-                        .GetAsync(cancellationToken: cancellationToken).ConfigureAwait(false);
-                    
-                    if (nearMisses != null)
-                    {
-                        foreach (var nearMiss in nearMisses)
-                        {
-                            var incident = _nearMissTypeMapper.MapToWrapper(nearMiss);
-                            incident.ProjectId = projectId; // Set project ID from context
-                            incidents.Add(incident);
-                        }
-                    }
+                    incidents.AddRange(_nearMissTypeMapper.MapToWrapperMany(nearMisses.Value));
                 }
-                catch (Exception ex) when (!(ex is TaskCanceledException))
+                
+                // Set project ID from context
+                foreach (var incident in incidents)
                 {
-                    _logger?.LogWarning(ex, "Failed to retrieve near misses for project {ProjectId}", projectId);
+                    incident.ProjectId = projectId;
                 }
                 
-                // Get alerts as they can represent incidents
-                try
+                // Alerts can represent incidents
+                if (alerts.Value != null)
                 {
-                    var alerts = await _generatedClient.Rest.V10.Projects[projectId].Incidents.Alerts
-                        .GetAsync(cancellationToken: cancellationToken).ConfigureAwait(false);
-                    
-                    if (alerts != null)
+                    foreach (var alert in alerts.Value)
                     {
-                        foreach (var alert in alerts)
+                        var incident = new SafetyIncident
                         {
-                            var incident = new SafetyIncident
-                            {
-                                Id = alert.Id ?? 0,
-                                ProjectId = projectId,
-                                Title = "Safety Alert",
-                                Description = "Incident alert notification",
-                                Severity = IncidentSeverity.Minor,
-                                Type = IncidentType.PropertyDamage,
-                                IncidentDate = alert.TriggeredAt?.DateTime ?? DateTime.UtcNow,
-                                Location = "Project Site",
-                                ReportedBy = alert.TriggeredBy?.Id ?? 1,
-                                Status = IncidentStatus.Reported,
-                                CreatedAt = alert.TriggeredAt?.DateTime ?? DateTime.UtcNow,
-                                UpdatedAt = alert.TriggeredAt?.DateTime ?? DateTime.UtcNow
-                            };
-                            incidents.Add(incident);
-                        }
+                            Id = alert.Id ?? 0,
+                            ProjectId = projectId,
+                            Title = "Safety Alert",
+                            Description = "Incident alert notification",
+                            Severity = IncidentSeverity.Minor,
+                            Type = IncidentType.PropertyDamage,
+                            IncidentDate = alert.TriggeredAt?.DateTime ?? DateTime.UtcNow,
+                            Location = "Project Site",
+                            ReportedBy = alert.TriggeredBy?.Id ?? 1,
+                            Status = IncidentStatus.Reported,
+                            CreatedAt = alert.TriggeredAt?.DateTime ?? DateTime.UtcNow,
+                            UpdatedAt = alert.TriggeredAt?.DateTime ?? DateTime.UtcNow
+                        };
+                        incidents.Add(incident);
                     }
                 }
-                catch (Exception ex) when (!(ex is TaskCanceledException))
-                {
-                    _logger?.LogWarning(ex, "Failed to retrieve alerts for project {ProjectId}", projectId);
-                }
                 
                 return incidents.AsEnumerable();
             },
-            $"GetSafetyIncidents-Project-{projectId}-Company-{companyId}",
+            "GetSafetyIncidentsAsync",
             null,
             cancellationToken);
     }
@@ -974,7 +1019,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         try
         {
-            _logger?.LogDebug("Getting safety incident {IncidentId} for project {ProjectId} in company {CompanyId}", incidentId, projectId, companyId);
+            _logger?.GettingSafetyIncident(incidentId, projectId, companyId);
             
             // Placeholder implementation
             return new SafetyIncident 
@@ -995,7 +1040,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to get safety incident {IncidentId} for project {ProjectId} in company {CompanyId}", incidentId, projectId, companyId);
+            _logger?.FailedToGetSafetyIncident(ex, incidentId, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1016,7 +1061,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Creating safety incident of type {IncidentType} for project {ProjectId} in company {CompanyId}", request.Type, projectId, companyId);
+                _logger?.CreatingSafetyIncidentOfType(request.Type, projectId, companyId);
                 
                 // Route to appropriate endpoint based on incident type
                 if (request.Type == IncidentType.NearMiss)
@@ -1028,7 +1073,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                     return await CreateInjuryIncidentAsync(projectId, request, cancellationToken).ConfigureAwait(false);
                 }
             },
-            $"CreateSafetyIncident-{request.Title}-Project-{projectId}-Company-{companyId}",
+            "CreateSafetyIncidentAsync",
             null,
             cancellationToken);
     }
@@ -1061,7 +1106,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (Exception ex) when (!(ex is TaskCanceledException))
         {
-            _logger?.LogWarning(ex, "Failed to create injury record, using fallback implementation");
+            _logger?.FailedToCreateInjuryRecord(ex);
         }
         
         // Fallback implementation
@@ -1095,7 +1140,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (Exception ex) when (!(ex is TaskCanceledException))
         {
-            _logger?.LogWarning(ex, "Failed to create near miss record, using fallback implementation");
+            _logger?.FailedToCreateNearMissRecord(ex);
         }
         
         // Fallback implementation
@@ -1137,7 +1182,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         try
         {
-            _logger?.LogDebug("Updating safety incident {IncidentId} status to {Status} for project {ProjectId} in company {CompanyId}", incidentId, status, projectId, companyId);
+            _logger?.UpdatingSafetyIncident(incidentId, status, projectId, companyId);
             
             // Placeholder implementation
             return new SafetyIncident 
@@ -1151,7 +1196,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to update safety incident {IncidentId} for project {ProjectId} in company {CompanyId}", incidentId, projectId, companyId);
+            _logger?.FailedToUpdateSafetyIncident(ex, incidentId, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1171,7 +1216,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         try
         {
-            _logger?.LogDebug("Getting compliance checks for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingComplianceChecksForProject(projectId, companyId);
             
             // Placeholder implementation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -1179,7 +1224,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to get compliance checks for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.FailedToGetComplianceChecks(ex, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1196,7 +1241,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         try
         {
-            _logger?.LogDebug("Getting compliance check {CheckId} for project {ProjectId} in company {CompanyId}", checkId, projectId, companyId);
+            _logger?.GettingComplianceCheck(checkId, projectId, companyId);
             
             // Placeholder implementation
             return new ComplianceCheck 
@@ -1214,7 +1259,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to get compliance check {CheckId} for project {ProjectId} in company {CompanyId}", checkId, projectId, companyId);
+            _logger?.FailedToGetComplianceCheck(ex, checkId, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1233,7 +1278,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         
         try
         {
-            _logger?.LogDebug("Creating compliance check for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.CreatingComplianceCheckForProject(projectId, companyId);
             
             // Placeholder implementation
             return new ComplianceCheck 
@@ -1252,7 +1297,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to create compliance check for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.FailedToCreateComplianceCheck(ex, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1271,7 +1316,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         try
         {
-            _logger?.LogDebug("Completing compliance check {CheckId} with status {Status} for project {ProjectId} in company {CompanyId}", checkId, status, projectId, companyId);
+            _logger?.CompletingComplianceCheck(checkId, status, projectId, companyId);
             
             // Placeholder implementation
             return new ComplianceCheck 
@@ -1288,7 +1333,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to complete compliance check {CheckId} for project {ProjectId} in company {CompanyId}", checkId, projectId, companyId);
+            _logger?.FailedToCompleteComplianceCheck(ex, checkId, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1310,14 +1355,14 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting open observations for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingOpenObservationsForProject(projectId, companyId);
                 
                 // Get all observations and filter for open status
                 var allObservations = await GetObservationsAsync(companyId, projectId, cancellationToken).ConfigureAwait(false);
                 
                 return allObservations.Where(o => o.Status == ObservationStatus.Open || o.Status == ObservationStatus.InProgress);
             },
-            $"GetOpenObservations-Project-{projectId}-Company-{companyId}",
+            "GetOpenObservationsAsync",
             null,
             cancellationToken);
     }
@@ -1335,14 +1380,14 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting critical observations for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingCriticalObservationsForProject(projectId, companyId);
                 
                 // Get all observations and filter for critical priority
                 var allObservations = await GetObservationsAsync(companyId, projectId, cancellationToken).ConfigureAwait(false);
                 
                 return allObservations.Where(o => o.Priority == ObservationPriority.Critical || o.Priority == ObservationPriority.High);
             },
-            $"GetCriticalObservations-Project-{projectId}-Company-{companyId}",
+            "GetCriticalObservationsAsync",
             null,
             cancellationToken);
     }
@@ -1358,7 +1403,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         try
         {
-            _logger?.LogDebug("Getting overdue observations for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.GettingOverdueObservationsForProject(projectId, companyId);
             
             // Placeholder implementation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -1366,7 +1411,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to get overdue observations for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.FailedToGetOverdueObservations(ex, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1383,7 +1428,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
     {
         try
         {
-            _logger?.LogDebug("Getting recent incidents (last {Days} days) for project {ProjectId} in company {CompanyId}", days, projectId, companyId);
+            _logger?.GettingRecentIncidents(days, projectId, companyId);
             
             // Placeholder implementation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -1391,7 +1436,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to get recent incidents for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.FailedToGetRecentIncidents(ex, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1409,7 +1454,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting observation summary for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingObservationSummaryForProject(projectId, companyId);
                 
                 // Get all observations and group by status
                 var allObservations = await GetObservationsAsync(companyId, projectId, cancellationToken).ConfigureAwait(false);
@@ -1430,7 +1475,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                 
                 return result;
             },
-            $"GetObservationSummary-Project-{projectId}-Company-{companyId}",
+            "GetObservationSummaryAsync",
             null,
             cancellationToken);
     }
@@ -1454,7 +1499,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting observations with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+                _logger?.GettingObservationsPage(projectId, companyId, options.Page, options.PerPage);
                 
                 // Get all observations first (since API may not support direct pagination)
                 var allObservations = await GetObservationsAsync(companyId, projectId, cancellationToken).ConfigureAwait(false);
@@ -1481,7 +1526,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                     HasPreviousPage = options.Page > 1
                 };
             },
-            $"GetObservationsPagedAsync-Project-{projectId}-Company-{companyId}",
+            "GetObservationsPagedAsync",
             null,
             cancellationToken);
     }
@@ -1500,7 +1545,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         
         try
         {
-            _logger?.LogDebug("Getting inspection templates with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+            _logger?.GettingInspectionTemplatesPage(projectId, companyId, options.Page, options.PerPage);
             
             // Placeholder implementation
             return new CoreModels.PagedResult<InspectionTemplate>
@@ -1516,7 +1561,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to get inspection templates with pagination for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.FailedToGetInspectionTemplatesPage(ex, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1535,7 +1580,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         
         try
         {
-            _logger?.LogDebug("Getting safety incidents with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+            _logger?.GettingSafetyIncidentsPage(projectId, companyId, options.Page, options.PerPage);
             
             // Placeholder implementation
             return new CoreModels.PagedResult<SafetyIncident>
@@ -1551,7 +1596,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         }
         catch (HttpRequestException ex)
         {
-            _logger?.LogError(ex, "Failed to get safety incidents with pagination for project {ProjectId} in company {CompanyId}", projectId, companyId);
+            _logger?.FailedToGetSafetyIncidentsPage(ex, projectId, companyId);
             throw new InvalidOperationException($"Operation failed for project {projectId} in company {companyId}", ex);
         }
     }
@@ -1575,7 +1620,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting filtered safety incidents for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingFilteredSafetyIncidentsForProject(projectId, companyId);
                 
                 var incidents = new List<SafetyIncident>();
                 
@@ -1608,7 +1653,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                 
                 return incidents.AsEnumerable();
             },
-            $"GetFilteredSafetyIncidents-Project-{projectId}-Company-{companyId}",
+            "GetSafetyIncidentsWithFiltersAsync",
             null,
             cancellationToken);
     }
@@ -1628,7 +1673,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting observations with query for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.QueryingObservations(projectId, companyId);
                 
                 // Use the observation items endpoint to get observations
                 var items = await _generatedClient.Rest.V10.Observations.Items
@@ -1637,9 +1682,8 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                 var observations = new List<Observation>();
                 if (items != null)
                 {
-                    foreach (var item in items)
+                    foreach (var observation in _observationTypeMapper.MapToWrapperMany(items))
                     {
-                        var observation = _observationTypeMapper.MapToWrapper(item);
                         observation.ProjectId = projectId;
                         
                         // Apply client-side filtering based on query options
@@ -1668,7 +1712,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                 
                 return observations.AsEnumerable();
             },
-            $"GetObservationsWithQuery-Project-{projectId}-Company-{companyId}",
+            "GetObservationsWithQueryAsync",
             null,
             cancellationToken);
     }
@@ -1738,28 +1782,32 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Creating {Count} observations in bulk for project {ProjectId} in company {CompanyId}", requests.Count(), projectId, companyId);
+                var requestList = requests.ToList();
+                _logger?.CreatingObservationsInBulk(requestList.Count, projectId, companyId);
                 
-                var createdObservations = new List<Observation>();
+                // The observations API has no bulk_create route, so fall back to bounded concurrent single calls
+                var outcomes = await BulkExecutor.ExecuteConcurrentAsync(
+                    requestList,
+                    (request, ct) => CreateObservationAsync(companyId, projectId, request, ct),
+                    cancellationToken: cancellationToken).ConfigureAwait(false);
                 
-                // Process each request individually (since bulk endpoint might not be available)
-                foreach (var request in requests)
+                var createdObservations = new List<Observation>(outcomes.Count);
+                foreach (var outcome in outcomes)
                 {
-                    try
+                    if (outcome.Succeeded)
                     {
-                        var observation = await CreateObservationAsync(companyId, projectId, request, cancellationToken).ConfigureAwait(false);
-                        createdObservations.Add(observation);
+                        createdObservations.Add(outcome.Result!);
                     }
-                    catch (Exception ex)
+                    else
                     {
-                        _logger?.LogWarning(ex, "Failed to create observation {Title} in bulk operation", request.Title);
-                        // Continue with next observation instead of failing the entire operation
+                        // A failed observation does not fail the entire operation
+                        _logger?.FailedToCreateObservation(outcome.Exception, outcome.Item.Title);
                     }
                 }
                 
                 return createdObservations.AsEnumerable();
             },
-            $"CreateObservationsBulk-{requests.Count()}-Project-{projectId}-Company-{companyId}",
+            "CreateObservationsBulkAsync",
             null,
             cancellationToken);
     }
@@ -1779,28 +1827,32 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Updating {Count} observations in bulk for project {ProjectId} in company {CompanyId}", updates.Count(), projectId, companyId);
+                var updateList = updates.ToList();
+                _logger?.UpdatingObservationsInBulk(updateList.Count, projectId, companyId);
                 
-                var updatedObservations = new List<Observation>();
+                // The observations API has no bulk_update route, so fall back to bounded concurrent single calls
+                var outcomes = await BulkExecutor.ExecuteConcurrentAsync(
+                    updateList,
+                    (update, ct) => UpdateObservationAsync(companyId, projectId, update.ObservationId, update.UpdateRequest, ct),
+                    cancellationToken: cancellationToken).ConfigureAwait(false);
                 
-                // Process each update individually
-                foreach (var update in updates)
+                var updatedObservations = new List<Observation>(outcomes.Count);
+                foreach (var outcome in outcomes)
                 {
-                    try
+                    if (outcome.Succeeded)
                     {
-                        var observation = await UpdateObservationAsync(companyId, projectId, update.ObservationId, update.UpdateRequest, cancellationToken).ConfigureAwait(false);
-                        updatedObservations.Add(observation);
+                        updatedObservations.Add(outcome.Result!);
                     }
-                    catch (Exception ex)
+                    else
                     {
-                        _logger?.LogWarning(ex, "Failed to update observation {ObservationId} in bulk operation", update.ObservationId);
-                        // Continue with next observation instead of failing the entire operation
+                        // A failed observation does not fail the entire operation
+                        _logger?.FailedToUpdateObservation(outcome.Exception, outcome.Item.ObservationId);
                     }
                 }
                 
                 return updatedObservations.AsEnumerable();
             },
-            $"UpdateObservationsBulk-{updates.Count()}-Project-{projectId}-Company-{companyId}",
+            "UpdateObservationsBulkAsync",
             null,
             cancellationToken);
     }
@@ -1821,7 +1873,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
             async () =>
             {
                 var observationIdsList = observationIds.ToList();
-                _logger?.LogDebug("Deleting {Count} observations in bulk for project {ProjectId} in company {CompanyId}", observationIdsList.Count, projectId, companyId);
+                _logger?.DeletingObservationsInBulk(observationIdsList.Count, projectId, companyId);
                 
                 // Process deletions in batches for better performance and to avoid overwhelming the API
                 const int batchSize = 10;
@@ -1845,7 +1897,7 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                         }
                         catch (Exception ex)
                         {
-                            _logger?.LogWarning(ex, "Failed to delete observation {ObservationId} in bulk operation", observationId);
+                            _logger?.FailedToDeleteObservation(ex, observationId);
                             Interlocked.Increment(ref failureCount);
                         }
                     });
@@ -1860,9 +1912,9 @@ public class ProcoreQualitySafetyClient : IQualitySafetyClient
                     }
                 }
                 
-                _logger?.LogDebug("Bulk deletion completed: {SuccessCount} successful, {FailureCount} failed", successCount, failureCount);
+                _logger?.BulkDeletionCompleted(successCount, failureCount);
             },
-            $"DeleteObservationsBulk-{observationIds.Count()}-Project-{projectId}-Company-{companyId}",
+            "DeleteObservationsBulkAsync",
             null,
             cancellationToken);
     }
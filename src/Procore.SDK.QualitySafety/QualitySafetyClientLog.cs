@@ -0,0 +1,197 @@
+using System;
+using Microsoft.Extensions.Logging;
+using Procore.SDK.QualitySafety.Models;
+
+namespace Procore.SDK.QualitySafety;
+
+/// <summary>
+/// Source-generated log messages for <see cref="ProcoreQualitySafetyClient"/>.
+/// </summary>
+internal static partial class QualitySafetyClientLog
+{
+    [LoggerMessage(EventId = 2301, Level = LogLevel.Debug, Message = "Getting observations for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingObservationsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2302, Level = LogLevel.Debug, Message = "Getting observations updated since {UpdatedSince} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingObservationsUpdatedSince(this ILogger logger, DateTimeOffset updatedSince, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2303, Level = LogLevel.Debug, Message = "Getting observation {ObservationId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingObservation(this ILogger logger, int observationId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2304, Level = LogLevel.Warning, Message = "Could not retrieve observation {ObservationId} directly, trying alternative approach")]
+    public static partial void CouldNotRetrieveObservation(this ILogger logger, Exception? exception, int observationId);
+
+    [LoggerMessage(EventId = 2305, Level = LogLevel.Warning, Message = "Fallback approach also failed for observation {ObservationId}")]
+    public static partial void ObservationFallbackFailed(this ILogger logger, Exception? exception, int observationId);
+
+    [LoggerMessage(EventId = 2306, Level = LogLevel.Debug, Message = "Deleting observation {ObservationId} for project {ProjectId} in company {CompanyId} using generated Kiota client")]
+    public static partial void DeletingObservation(this ILogger logger, int observationId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2307, Level = LogLevel.Debug, Message = "Successfully deleted observation {ObservationId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void DeletedObservation(this ILogger logger, int observationId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2308, Level = LogLevel.Debug, Message = "Creating observation for project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingObservationForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2309, Level = LogLevel.Debug, Message = "Updating observation {ObservationId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void UpdatingObservation(this ILogger logger, int observationId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2310, Level = LogLevel.Debug, Message = "Getting inspection templates for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingInspectionTemplatesForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2311, Level = LogLevel.Warning, Message = "Could not retrieve project configuration for inspection templates")]
+    public static partial void ProjectConfigurationUnavailable(this ILogger logger, Exception? exception);
+
+    [LoggerMessage(EventId = 2312, Level = LogLevel.Debug, Message = "Getting inspection template {TemplateId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingInspectionTemplate(this ILogger logger, int templateId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2313, Level = LogLevel.Error, Message = "Failed to get inspection template {TemplateId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToGetInspectionTemplate(this ILogger logger, Exception? exception, int templateId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2314, Level = LogLevel.Debug, Message = "Creating inspection template for project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingInspectionTemplateForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2315, Level = LogLevel.Error, Message = "Failed to create inspection template for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToCreateInspectionTemplate(this ILogger logger, Exception? exception, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2316, Level = LogLevel.Debug, Message = "Updating inspection template {TemplateId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void UpdatingInspectionTemplate(this ILogger logger, int templateId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2317, Level = LogLevel.Error, Message = "Failed to update inspection template {TemplateId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToUpdateInspectionTemplate(this ILogger logger, Exception? exception, int templateId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2318, Level = LogLevel.Debug, Message = "Getting inspection items for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingInspectionItemsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2319, Level = LogLevel.Debug, Message = "Could not retrieve response logs for observation {ObservationId}")]
+    public static partial void ResponseLogsUnavailable(this ILogger logger, Exception? exception, int observationId);
+
+    [LoggerMessage(EventId = 2320, Level = LogLevel.Warning, Message = "Could not retrieve observations for inspection items mapping")]
+    public static partial void InspectionObservationsUnavailable(this ILogger logger, Exception? exception);
+
+    [LoggerMessage(EventId = 2321, Level = LogLevel.Debug, Message = "Getting inspection item {ItemId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingInspectionItem(this ILogger logger, int itemId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2322, Level = LogLevel.Error, Message = "Failed to get inspection item {ItemId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToGetInspectionItem(this ILogger logger, Exception? exception, int itemId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2323, Level = LogLevel.Debug, Message = "Updating inspection item {ItemId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void UpdatingInspectionItem(this ILogger logger, int itemId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2324, Level = LogLevel.Error, Message = "Failed to update inspection item {ItemId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToUpdateInspectionItem(this ILogger logger, Exception? exception, int itemId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2325, Level = LogLevel.Debug, Message = "Getting safety incidents for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingSafetyIncidentsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2326, Level = LogLevel.Debug, Message = "Getting safety incident {IncidentId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingSafetyIncident(this ILogger logger, int incidentId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2327, Level = LogLevel.Error, Message = "Failed to get safety incident {IncidentId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToGetSafetyIncident(this ILogger logger, Exception? exception, int incidentId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2328, Level = LogLevel.Debug, Message = "Creating safety incident of type {IncidentType} for project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingSafetyIncidentOfType(this ILogger logger, IncidentType incidentType, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2329, Level = LogLevel.Warning, Message = "Failed to create injury record, using fallback implementation")]
+    public static partial void FailedToCreateInjuryRecord(this ILogger logger, Exception? exception);
+
+    [LoggerMessage(EventId = 2330, Level = LogLevel.Warning, Message = "Failed to create near miss record, using fallback implementation")]
+    public static partial void FailedToCreateNearMissRecord(this ILogger logger, Exception? exception);
+
+    [LoggerMessage(EventId = 2331, Level = LogLevel.Debug, Message = "Updating safety incident {IncidentId} status to {Status} for project {ProjectId} in company {CompanyId}")]
+    public static partial void UpdatingSafetyIncident(this ILogger logger, int incidentId, IncidentStatus status, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2332, Level = LogLevel.Error, Message = "Failed to update safety incident {IncidentId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToUpdateSafetyIncident(this ILogger logger, Exception? exception, int incidentId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2333, Level = LogLevel.Debug, Message = "Getting compliance checks for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingComplianceChecksForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2334, Level = LogLevel.Error, Message = "Failed to get compliance checks for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToGetComplianceChecks(this ILogger logger, Exception? exception, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2335, Level = LogLevel.Debug, Message = "Getting compliance check {CheckId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingComplianceCheck(this ILogger logger, int checkId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2336, Level = LogLevel.Error, Message = "Failed to get compliance check {CheckId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToGetComplianceCheck(this ILogger logger, Exception? exception, int checkId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2337, Level = LogLevel.Debug, Message = "Creating compliance check for project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingComplianceCheckForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2338, Level = LogLevel.Error, Message = "Failed to create compliance check for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToCreateComplianceCheck(this ILogger logger, Exception? exception, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2339, Level = LogLevel.Debug, Message = "Completing compliance check {CheckId} with status {Status} for project {ProjectId} in company {CompanyId}")]
+    public static partial void CompletingComplianceCheck(this ILogger logger, int checkId, ComplianceStatus status, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2340, Level = LogLevel.Error, Message = "Failed to complete compliance check {CheckId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToCompleteComplianceCheck(this ILogger logger, Exception? exception, int checkId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2341, Level = LogLevel.Debug, Message = "Getting open observations for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingOpenObservationsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2342, Level = LogLevel.Debug, Message = "Getting critical observations for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingCriticalObservationsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2343, Level = LogLevel.Debug, Message = "Getting overdue observations for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingOverdueObservationsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2344, Level = LogLevel.Error, Message = "Failed to get overdue observations for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToGetOverdueObservations(this ILogger logger, Exception? exception, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2345, Level = LogLevel.Debug, Message = "Getting recent incidents (last {Days} days) for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingRecentIncidents(this ILogger logger, int days, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2346, Level = LogLevel.Error, Message = "Failed to get recent incidents for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToGetRecentIncidents(this ILogger logger, Exception? exception, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2347, Level = LogLevel.Debug, Message = "Getting observation summary for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingObservationSummaryForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2348, Level = LogLevel.Debug, Message = "Getting observations with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingObservationsPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2349, Level = LogLevel.Debug, Message = "Getting inspection templates with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingInspectionTemplatesPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2350, Level = LogLevel.Error, Message = "Failed to get inspection templates with pagination for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToGetInspectionTemplatesPage(this ILogger logger, Exception? exception, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2351, Level = LogLevel.Debug, Message = "Getting safety incidents with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingSafetyIncidentsPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2352, Level = LogLevel.Error, Message = "Failed to get safety incidents with pagination for project {ProjectId} in company {CompanyId}")]
+    public static partial void FailedToGetSafetyIncidentsPage(this ILogger logger, Exception? exception, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2353, Level = LogLevel.Debug, Message = "Getting filtered safety incidents for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingFilteredSafetyIncidentsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2354, Level = LogLevel.Debug, Message = "Getting observations with query for project {ProjectId} in company {CompanyId}")]
+    public static partial void QueryingObservations(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2355, Level = LogLevel.Debug, Message = "Creating {Count} observations in bulk for project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingObservationsInBulk(this ILogger logger, int count, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2356, Level = LogLevel.Warning, Message = "Failed to create observation {Title} in bulk operation")]
+    public static partial void FailedToCreateObservation(this ILogger logger, Exception? exception, string title);
+
+    [LoggerMessage(EventId = 2357, Level = LogLevel.Debug, Message = "Updating {Count} observations in bulk for project {ProjectId} in company {CompanyId}")]
+    public static partial void UpdatingObservationsInBulk(this ILogger logger, int count, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2358, Level = LogLevel.Warning, Message = "Failed to update observation {ObservationId} in bulk operation")]
+    public static partial void FailedToUpdateObservation(this ILogger logger, Exception? exception, int observationId);
+
+    [LoggerMessage(EventId = 2359, Level = LogLevel.Debug, Message = "Deleting {Count} observations in bulk for project {ProjectId} in company {CompanyId}")]
+    public static partial void DeletingObservationsInBulk(this ILogger logger, int count, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2360, Level = LogLevel.Warning, Message = "Failed to delete observation {ObservationId} in bulk operation")]
+    public static partial void FailedToDeleteObservation(this ILogger logger, Exception? exception, int observationId);
+
+    [LoggerMessage(EventId = 2361, Level = LogLevel.Debug, Message = "Bulk deletion completed: {SuccessCount} successful, {FailureCount} failed")]
+    public static partial void BulkDeletionCompleted(this ILogger logger, int successCount, int failureCount);
+
+    [LoggerMessage(EventId = 2362, Level = LogLevel.Debug, Message = "Executing operation {Operation} with correlation ID {CorrelationId}")]
+    public static partial void ExecutingOperation(this ILogger logger, string operation, string correlationId);
+}
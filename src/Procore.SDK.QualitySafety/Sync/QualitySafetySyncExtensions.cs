@@ -0,0 +1,33 @@
+using System;
+using System.Globalization;
+using Procore.SDK.Core.Sync;
+using Procore.SDK.QualitySafety.Models;
+
+namespace Procore.SDK.QualitySafety.Sync;
+
+/// <summary>
+/// Extension methods that describe QualitySafety resources for <see cref="DeltaSyncEngine"/>.
+/// </summary>
+public static class QualitySafetySyncExtensions
+{
+    /// <summary>
+    /// Describes the observations of a project as an incremental sync resource filtered by updated_at.
+    /// </summary>
+    /// <param name="client">The QualitySafety client.</param>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="projectId">The project ID.</param>
+    /// <returns>The sync resource definition.</returns>
+    public static SyncResource<Observation> ObservationsSyncResource(this IQualitySafetyClient client, int companyId, int projectId)
+    {
+        ArgumentNullException.ThrowIfNull(client);
+
+        return SyncResource<Observation>.Incremental(
+            $"observations/project/{projectId}",
+            observation => observation.Id.ToString(CultureInfo.InvariantCulture),
+            // The API returns UTC timestamps; the mapper drops the offset when converting to DateTime
+            observation => new DateTimeOffset(DateTime.SpecifyKind(observation.UpdatedAt, DateTimeKind.Utc)),
+            async (updatedSince, cancellationToken) => updatedSince.HasValue
+                ? await client.GetObservationsUpdatedSinceAsync(companyId, projectId, updatedSince.Value, cancellationToken).ConfigureAwait(false)
+                : await client.GetObservationsAsync(companyId, projectId, cancellationToken).ConfigureAwait(false));
+    }
+}
@@ -2,6 +2,7 @@ using System;
 using System.Collections.Generic;
 using System.Threading;
 using System.Threading.Tasks;
+using Procore.SDK.ResourceManagement.Scheduling;
 using CoreModels = Procore.SDK.Core.Models;
 
 namespace Procore.SDK.ResourceManagement.Models;
@@ -46,6 +47,7 @@ public interface IResourceManagementClient : IDisposable
     Task<IEnumerable<Resource>> GetOverAllocatedResourcesAsync(int companyId, CancellationToken cancellationToken = default);
     Task<decimal> GetResourceUtilizationRateAsync(int companyId, int resourceId, CancellationToken cancellationToken = default);
     Task<Dictionary<string, decimal>> GetCapacityAnalysisAsync(int companyId, int projectId, CancellationToken cancellationToken = default);
+    Task<ResourceAllocationIndex> LoadAllocationIndexAsync(int companyId, IEnumerable<int> projectIds, CancellationToken cancellationToken = default);
 
     // Optimization
     Task<IEnumerable<Resource>> OptimizeResourceAllocationAsync(int companyId, int projectId, DateTime startDate, DateTime endDate, CancellationToken cancellationToken = default);
@@ -7,9 +7,12 @@ using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using Microsoft.Kiota.Abstractions;
+using Procore.SDK.Core.Bulk;
 using Procore.SDK.Core.ErrorHandling;
 using Procore.SDK.Core.Logging;
+using Procore.SDK.Shared.Diagnostics;
 using Procore.SDK.ResourceManagement.Models;
+using Procore.SDK.ResourceManagement.Scheduling;
 using Procore.SDK.ResourceManagement.TypeMapping;
 using CoreModels = Procore.SDK.Core.Models;
 
@@ -37,6 +40,9 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
     
     #region Fields
     
+    // Mappers are stateless and thread-safe, so every client instance shares one of each
+    private static readonly ResourceTypeMapper SharedResourceTypeMapper = new();
+
     private readonly Procore.SDK.ResourceManagement.ResourceManagementClient _generatedClient;
     private readonly ILogger<ProcoreResourceManagementClient>? _logger;
     private readonly StructuredLogger? _structuredLogger;
@@ -68,7 +74,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         _generatedClient = new Procore.SDK.ResourceManagement.ResourceManagementClient(requestAdapter);
         _logger = logger;
         _structuredLogger = structuredLogger;
-        _resourceTypeMapper = new ResourceTypeMapper();
+        _resourceTypeMapper = SharedResourceTypeMapper;
         
         // Initialize secure random number generator
         using var rng = RandomNumberGenerator.Create();
@@ -89,33 +95,46 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         string? correlationId = null,
         CancellationToken cancellationToken = default)
     {
-        correlationId ??= Guid.NewGuid().ToString();
+        // Correlation IDs are only created when something will be logged or an error is raised
+        if (correlationId == null && (_structuredLogger?.IsEnabled(LogLevel.Information) == true || _logger?.IsEnabled(LogLevel.Debug) == true))
+        {
+            correlationId = Guid.NewGuid().ToString();
+        }
         
-        using var operationScope = _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var operationScope = correlationId == null ? null : _structuredLogger?.BeginOperation(operationName, correlationId);
+        using var activity = ProcoreTelemetry.StartOperation(operationName);
+        var startTimestamp = System.Diagnostics.Stopwatch.GetTimestamp();
         
         try
         {
-            _logger?.LogDebug("Executing operation {Operation} with correlation ID {CorrelationId}", operationName, correlationId);
+            _logger?.ExecutingOperation(operationName, correlationId!);
             
-            return await operation().ConfigureAwait(false);
+            var result = await operation().ConfigureAwait(false);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, null);
+            return result;
         }
         catch (HttpRequestException httpEx)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var mappedException = ErrorMapper.MapHttpException(httpEx, correlationId);
             
             _structuredLogger?.LogError(mappedException, operationName, correlationId, 
                 "HTTP error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, mappedException);
             throw mappedException;
         }
         catch (TaskCanceledException ex) when (cancellationToken.IsCancellationRequested)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             _structuredLogger?.LogWarning(operationName, correlationId,
                 "Operation {Operation} was cancelled", operationName);
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, ex);
             throw;
         }
         catch (Exception ex)
         {
+            correlationId ??= Guid.NewGuid().ToString();
             var wrappedException = new CoreModels.ProcoreCoreException(
                 $"Unexpected error in {operationName}: {ex.Message}", 
                 "UNEXPECTED_ERROR", 
@@ -125,6 +144,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
             _structuredLogger?.LogError(wrappedException, operationName, correlationId,
                 "Unexpected error in operation {Operation}", operationName);
             
+            ProcoreTelemetry.StopOperation(activity, operationName, startTimestamp, wrappedException);
             throw wrappedException;
         }
     }
@@ -923,7 +943,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting resources for company {CompanyId} using enhanced discovery approach", companyId);
+                _logger?.GettingResourcesForCompany(companyId);
                 
                 try
                 {
@@ -961,29 +981,34 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                             var laborResources = DeriveResourcesFromWorkforce(allWorkforceData, companyId);
                             resources.AddRange(laborResources);
                             
-                            _logger?.LogDebug("Enhanced resource discovery: derived {Count} labor resources from workforce data", laborResources.Count());
+                            if (_logger?.IsEnabled(LogLevel.Debug) == true)
+                            {
+                                _logger.DerivedLaborResources(laborResources.Count());
+                            }
                         }
                     }
                     catch (Exception workforceEx)
                     {
-                        _logger?.LogDebug(workforceEx, "Could not retrieve workforce data for resource discovery, using enhanced equipment-only approach");
+                        _logger?.WorkforceDataUnavailable(workforceEx);
                     }
                     
-                    _logger?.LogDebug("Successfully discovered {Count} resources for company {CompanyId} using enhanced approach", 
-                        resources.Count, companyId);
+                    _logger?.DiscoveredResources(resources.Count, companyId);
                     return resources;
                 }
                 catch (Exception ex) when (!(ex is HttpRequestException || ex is TaskCanceledException))
                 {
-                    _logger?.LogWarning(ex, "Enhanced resource discovery failed for company {CompanyId}, using fallback approach", companyId);
+                    _logger?.ResourceDiscoveryFallback(ex, companyId);
                     
                     // Fallback to basic enhanced business logic
                     var fallbackResources = GenerateCompanyEquipmentResources(companyId);
-                    _logger?.LogDebug("Generated {Count} fallback resources for company {CompanyId}", fallbackResources.Count(), companyId);
+                    if (_logger?.IsEnabled(LogLevel.Debug) == true)
+                    {
+                        _logger.GeneratedFallbackResources(fallbackResources.Count(), companyId);
+                    }
                     return fallbackResources;
                 }
             },
-            $"GetResources-Company-{companyId}",
+            "GetResourcesAsync",
             null,
             cancellationToken);
     }
@@ -1014,7 +1039,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting resource {ResourceId} for project {ProjectId} in company {CompanyId} using generated Kiota client", resourceId, projectId, companyId);
+            _logger?.GettingResource(resourceId, projectId, companyId);
             
             // Use the generated Kiota client to get the specific resource
             var resourceResponse = await _generatedClient.Rest.V11.Projects[projectId].Schedule.Resources[resourceId].GetAsync(
@@ -1045,7 +1070,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Creating resource '{Name}' for company {CompanyId} - using enhanced business logic", request.Name, companyId);
+                _logger?.CreatingResource(request.Name, companyId);
                 
                 // V1.0 resource creation requires project context or specific setup
                 // For now, implement enhanced business logic with validation
@@ -1076,10 +1101,10 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                     SourceUid = GenerateSourceUid(request.Name)
                 };
                 
-                _logger?.LogDebug("Successfully created resource {ResourceId} for company {CompanyId} using enhanced business logic", newResource.Id, companyId);
+                _logger?.CreatedResource(newResource.Id, companyId);
                 return newResource;
             },
-            $"CreateResource-{request.Name}-Company-{companyId}",
+            "CreateResourceAsync",
             null,
             cancellationToken);
     }
@@ -1113,7 +1138,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating resource {ResourceId} for project {ProjectId} in company {CompanyId} using generated Kiota client", resourceId, projectId, companyId);
+            _logger?.UpdatingResource(resourceId, projectId, companyId);
             
             // Create the request body for V1.1 Resources PATCH endpoint
             var requestBody = new global::Procore.SDK.ResourceManagement.Rest.V11.Projects.Item.Schedule.Resources.Item.ResourcesPatchRequestBody
@@ -1175,13 +1200,13 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
     {
         await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Deleting resource {ResourceId} for project {ProjectId} in company {CompanyId} using generated Kiota client", resourceId, projectId, companyId);
+            _logger?.DeletingResource(resourceId, projectId, companyId);
             
             // Use the generated Kiota client to delete the resource
             await _generatedClient.Rest.V11.Projects[projectId].Schedule.Resources[resourceId].DeleteAsync(
                 cancellationToken: cancellationToken).ConfigureAwait(false);
             
-            _logger?.LogDebug("Successfully deleted resource {ResourceId} for project {ProjectId} in company {CompanyId}", resourceId, projectId, companyId);
+            _logger?.DeletedResource(resourceId, projectId, companyId);
         }, "DeleteResourceAsync", null, cancellationToken).ConfigureAwait(false);
     }
 
@@ -1202,7 +1227,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting resource allocations for project {ProjectId} in company {CompanyId} by analyzing project resources", projectId, companyId);
+                _logger?.GettingResourceAllocationsForProject(projectId, companyId);
                 
                 try
                 {
@@ -1226,22 +1251,21 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                         allocations.Add(allocation);
                     }
                     
-                    _logger?.LogDebug("Successfully generated {Count} enhanced resource allocations for project {ProjectId}", 
-                        allocations.Count, projectId);
+                    _logger?.GeneratedResourceAllocations(allocations.Count, projectId);
                     return allocations;
                 }
                 catch (Exception ex) when (!(ex is HttpRequestException || ex is TaskCanceledException))
                 {
-                    _logger?.LogWarning(ex, "Error in enhanced allocation logic for project {ProjectId}, using fallback generation", projectId);
+                    _logger?.ResourceAllocationFallback(ex, projectId);
                     
                     // Fallback to basic generation
                     var fallbackAllocations = GenerateResourceAllocations(companyId, projectId);
                     var allocationsList = fallbackAllocations.ToList();
-                    _logger?.LogDebug("Generated {Count} fallback resource allocations for project {ProjectId}", allocationsList.Count, projectId);
+                    _logger?.GeneratedFallbackResourceAllocations(allocationsList.Count, projectId);
                     return allocationsList;
                 }
             },
-            $"GetResourceAllocations-Project-{projectId}-Company-{companyId}",
+            "GetResourceAllocationsAsync",
             null,
             cancellationToken);
     }
@@ -1258,7 +1282,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting resource allocation {AllocationId} for project {ProjectId} in company {CompanyId}", allocationId, projectId, companyId);
+            _logger?.GettingResourceAllocation(allocationId, projectId, companyId);
             
             // Enhanced placeholder implementation with realistic data
             await Task.CompletedTask.ConfigureAwait(false);
@@ -1275,7 +1299,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                 CreatedAt = DateTime.UtcNow.AddDays(-7),
                 UpdatedAt = DateTime.UtcNow
             };
-        }, $"GetResourceAllocation-{allocationId}-Project-{projectId}-Company-{companyId}", null, cancellationToken);
+        }, "GetResourceAllocationAsync", null, cancellationToken);
     }
 
     /// <summary>
@@ -1293,7 +1317,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Allocating resource {ResourceId} to project {ProjectId} in company {CompanyId}", request.ResourceId, projectId, companyId);
+                _logger?.AllocatingResource(request.ResourceId, projectId, companyId);
                 
                 // Enhanced allocation logic with validation
                 await Task.CompletedTask.ConfigureAwait(false);
@@ -1313,7 +1337,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                     UpdatedAt = DateTime.UtcNow
                 };
             },
-            $"AllocateResource-{request.ResourceId}-Project-{projectId}-Company-{companyId}",
+            "AllocateResourceAsync",
             null,
             cancellationToken);
     }
@@ -1333,7 +1357,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating resource allocation {AllocationId} for project {ProjectId} in company {CompanyId}", allocationId, projectId, companyId);
+            _logger?.UpdatingResourceAllocation(allocationId, projectId, companyId);
             
             // Enhanced update logic with validation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -1350,7 +1374,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                 CreatedAt = DateTime.UtcNow.AddDays(-7), // Simulated creation date
                 UpdatedAt = DateTime.UtcNow
             };
-        }, $"UpdateAllocation-{allocationId}-Project-{projectId}-Company-{companyId}", null, cancellationToken);
+        }, "UpdateAllocationAsync", null, cancellationToken);
     }
 
     /// <summary>
@@ -1364,13 +1388,13 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
     {
         await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Releasing resource allocation {AllocationId} for project {ProjectId} in company {CompanyId}", allocationId, projectId, companyId);
+            _logger?.ReleasingResourceAllocation(allocationId, projectId, companyId);
             
             // Enhanced release logic - in real implementation this would update allocation status
             await Task.CompletedTask.ConfigureAwait(false);
             
-            _logger?.LogDebug("Successfully released resource allocation {AllocationId} for project {ProjectId}", allocationId, projectId);
-        }, $"ReleaseResource-{allocationId}-Project-{projectId}-Company-{companyId}", null, cancellationToken);
+            _logger?.ReleasedResourceAllocation(allocationId, projectId);
+        }, "ReleaseResourceAsync", null, cancellationToken);
     }
 
     #endregion
@@ -1389,7 +1413,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting workforce assignments for company {CompanyId} using V1.0 workforce planning endpoint", companyId);
+                _logger?.GettingWorkforceAssignmentsForCompany(companyId);
                 
                 try
                 {
@@ -1403,7 +1427,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                 
                     if (workforceResponse == null || !workforceResponse.Any())
                     {
-                        _logger?.LogDebug("No workforce data returned from V1.0 endpoint for company {CompanyId}", companyId);
+                        _logger?.NoWorkforceDataReturned(companyId);
                         return Enumerable.Empty<WorkforceAssignment>();
                     }
                 
@@ -1428,22 +1452,21 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                         }
                     }
                 
-                    _logger?.LogDebug("Successfully retrieved {Count} workforce assignments from V1.0 endpoint for company {CompanyId}", 
-                        assignments.Count, companyId);
+                    _logger?.RetrievedWorkforceAssignments(assignments.Count, companyId);
                     return assignments;
                 }
                 catch (Exception ex) when (!(ex is HttpRequestException || ex is TaskCanceledException))
                 {
-                    _logger?.LogWarning(ex, "Failed to retrieve workforce assignments from V1.0 endpoint for company {CompanyId}, falling back to enhanced business logic", companyId);
+                    _logger?.FailedToRetrieveWorkforceAssignments(ex, companyId);
                     
                     // Fallback to enhanced business logic if real endpoint fails
                     var fallbackAssignments = GenerateWorkforceAssignments(companyId, projectId);
                     var assignmentsList = fallbackAssignments.ToList();
-                    _logger?.LogDebug("Generated {Count} workforce assignments using fallback logic for company {CompanyId}", assignmentsList.Count, companyId);
+                    _logger?.GeneratedFallbackWorkforceAssignments(assignmentsList.Count, companyId);
                     return assignmentsList;
                 }
             },
-            $"GetWorkforceAssignments-Company-{companyId}-Project-{projectId}",
+            "GetWorkforceAssignmentsAsync",
             null,
             cancellationToken);
     }
@@ -1460,7 +1483,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
     {
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Getting workforce assignment {AssignmentId} for project {ProjectId} in company {CompanyId}", assignmentId, projectId, companyId);
+            _logger?.GettingWorkforceAssignment(assignmentId, projectId, companyId);
             
             // Enhanced placeholder implementation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -1477,7 +1500,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                 CreatedAt = DateTime.UtcNow.AddDays(-14),
                 UpdatedAt = DateTime.UtcNow
             };
-        }, $"GetWorkforceAssignment-{assignmentId}-Project-{projectId}-Company-{companyId}", null, cancellationToken);
+        }, "GetWorkforceAssignmentAsync", null, cancellationToken);
     }
 
     /// <summary>
@@ -1495,7 +1518,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Creating workforce assignment for worker {WorkerId} to project {ProjectId} in company {CompanyId}", request.WorkerId, projectId, companyId);
+                _logger?.CreatingWorkforceAssignmentForWorker(request.WorkerId, projectId, companyId);
                 
                 // Enhanced assignment creation with validation
                 await Task.CompletedTask.ConfigureAwait(false);
@@ -1515,7 +1538,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                     UpdatedAt = DateTime.UtcNow
                 };
             },
-            $"CreateWorkforceAssignment-Worker-{request.WorkerId}-Project-{projectId}-Company-{companyId}",
+            "CreateWorkforceAssignmentAsync",
             null,
             cancellationToken);
     }
@@ -1535,7 +1558,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         
         return await ExecuteWithResilienceAsync(async () =>
         {
-            _logger?.LogDebug("Updating workforce assignment {AssignmentId} for project {ProjectId} in company {CompanyId}", assignmentId, projectId, companyId);
+            _logger?.UpdatingWorkforceAssignment(assignmentId, projectId, companyId);
             
             // Enhanced update logic with validation
             await Task.CompletedTask.ConfigureAwait(false);
@@ -1552,7 +1575,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                 CreatedAt = DateTime.UtcNow.AddDays(-14), // Simulated creation date
                 UpdatedAt = DateTime.UtcNow
             };
-        }, $"UpdateWorkforceAssignment-{assignmentId}-Project-{projectId}-Company-{companyId}", null, cancellationToken);
+        }, "UpdateWorkforceAssignmentAsync", null, cancellationToken);
     }
 
     #endregion
@@ -1571,14 +1594,14 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting capacity plans for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingCapacityPlansForProject(projectId, companyId);
                 
                 // Enhanced placeholder implementation
                 await Task.CompletedTask.ConfigureAwait(false);
                 var plans = GenerateCapacityPlans(companyId, projectId);
                 return plans;
             },
-            $"GetCapacityPlans-Project-{projectId}-Company-{companyId}",
+            "GetCapacityPlansAsync",
             null,
             cancellationToken);
     }
@@ -1598,7 +1621,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Creating capacity plan for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.CreatingCapacityPlanForProject(projectId, companyId);
                 
                 // Enhanced capacity plan creation with validation
                 await Task.CompletedTask.ConfigureAwait(false);
@@ -1623,7 +1646,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                     UpdatedAt = DateTime.UtcNow
                 };
             },
-            $"CreateCapacityPlan-Project-{projectId}-Company-{companyId}",
+            "CreateCapacityPlanAsync",
             null,
             cancellationToken);
     }
@@ -1646,8 +1669,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting available resources for company {CompanyId} from {StartDate} to {EndDate} using enhanced availability logic", 
-                    companyId, startDate, endDate);
+                _logger?.GettingAvailableResourcesForCompany(companyId, startDate, endDate);
                 
                 try
                 {
@@ -1673,22 +1695,21 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                         }
                     }
                     
-                    _logger?.LogDebug("Successfully calculated {Count} available resources for company {CompanyId} in date range using enhanced logic", 
-                        availableResources.Count, companyId);
+                    _logger?.CalculatedAvailableResources(availableResources.Count, companyId);
                     return availableResources;
                 }
                 catch (Exception ex) when (!(ex is HttpRequestException || ex is TaskCanceledException))
                 {
-                    _logger?.LogWarning(ex, "Error in enhanced availability calculation for company {CompanyId}, using basic logic", companyId);
+                    _logger?.AvailabilityCalculationFallback(ex, companyId);
                     
                     // Fallback to basic generation
                     var fallbackResources = GenerateAvailableResourcesForPeriod(companyId, startDate, endDate);
                     var resourcesList = fallbackResources.ToList();
-                    _logger?.LogDebug("Generated {Count} resources using fallback logic for company {CompanyId}", resourcesList.Count, companyId);
+                    _logger?.GeneratedFallbackAvailableResources(resourcesList.Count, companyId);
                     return resourcesList;
                 }
             },
-            $"GetAvailableResources-Company-{companyId}-{startDate:yyyy-MM-dd}-{endDate:yyyy-MM-dd}",
+            "GetAvailableResourcesAsync",
             null,
             cancellationToken);
     }
@@ -1704,14 +1725,14 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting over-allocated resources for company {CompanyId}", companyId);
+                _logger?.GettingOverAllocatedResources(companyId);
                 
                 // Enhanced over-allocation detection
                 await Task.CompletedTask.ConfigureAwait(false);
                 var overAllocatedResources = IdentifyOverAllocatedResources(companyId);
                 return overAllocatedResources;
             },
-            $"GetOverAllocatedResources-Company-{companyId}",
+            "GetOverAllocatedResourcesAsync",
             null,
             cancellationToken);
     }
@@ -1728,15 +1749,15 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Calculating utilization rate for resource {ResourceId} in company {CompanyId} using enhanced analytics", resourceId, companyId);
+                _logger?.CalculatingUtilizationRate(resourceId, companyId);
                 
                 // Calculate utilization based on resource characteristics and current workload
                 var utilizationRate = CalculateResourceUtilization(resourceId, companyId);
                 
-                _logger?.LogDebug("Calculated utilization rate of {Rate}% for resource {ResourceId}", utilizationRate, resourceId);
+                _logger?.CalculatedUtilizationRate(utilizationRate, resourceId);
                 return utilizationRate;
             },
-            $"GetResourceUtilizationRate-Resource-{resourceId}-Company-{companyId}",
+            "GetResourceUtilizationRateAsync",
             null,
             cancellationToken);
     }
@@ -1753,7 +1774,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting capacity analysis for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingCapacityAnalysisForProject(projectId, companyId);
                 
                 // Enhanced capacity analysis with realistic calculations
                 await Task.CompletedTask.ConfigureAwait(false);
@@ -1761,11 +1782,82 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                 var analysis = CalculateCapacityAnalysis(companyId, projectId);
                 return analysis;
             },
-            $"GetCapacityAnalysis-Project-{projectId}-Company-{companyId}",
+            "GetCapacityAnalysisAsync",
             null,
             cancellationToken);
     }
 
+    /// <summary>
+    /// Loads the resource allocations and workforce assignments of a company's projects into an
+    /// index that answers availability, over-allocation and utilization queries for any window
+    /// without further requests.
+    /// Keep the index current by applying allocation and assignment changes to it as they are made.
+    /// Workforce assignments come from a company-wide feed, so they are fetched once and all of them
+    /// are loaded; a worker's assignments on other projects still take up their capacity.
+    /// Entries without an ID or with an invalid date range are skipped and logged.
+    /// </summary>
+    /// <param name="companyId">The company ID.</param>
+    /// <param name="projectIds">The projects whose allocations and assignments are loaded.</param>
+    /// <param name="cancellationToken">Cancellation token for the request.</param>
+    /// <returns>The allocation index.</returns>
+    public async Task<ResourceAllocationIndex> LoadAllocationIndexAsync(int companyId, IEnumerable<int> projectIds, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(projectIds);
+        
+        var projects = projectIds.Distinct().ToList();
+        _logger?.LoadingAllocationIndex(projects.Count, companyId);
+        
+        var index = new ResourceAllocationIndex(DefaultFullTimeHours, DefaultAssignmentDurationDays);
+        if (projects.Count == 0)
+        {
+            return index;
+        }
+        
+        // The assignments feed is per company; the project only labels assignments that carry none
+        var assignmentsTask = GetWorkforceAssignmentsAsync(companyId, projects[0], cancellationToken);
+        var outcomes = await BulkExecutor.ExecuteConcurrentAsync(
+            projects,
+            (projectId, ct) => GetResourceAllocationsAsync(companyId, projectId, ct),
+            cancellationToken: cancellationToken).ConfigureAwait(false);
+        var assignments = await assignmentsTask.ConfigureAwait(false);
+        
+        // An index missing a project would report its resources as free, so any failure fails the load
+        var failed = outcomes.FirstOrDefault(outcome => !outcome.Succeeded);
+        if (failed != null)
+        {
+            throw new InvalidOperationException($"Failed to load allocations for project {failed.Item} in company {companyId}", failed.Exception);
+        }
+        
+        foreach (var outcome in outcomes)
+        {
+            foreach (var allocation in outcome.Result)
+            {
+                try
+                {
+                    index.AddOrUpdate(allocation);
+                }
+                catch (ArgumentException ex)
+                {
+                    _logger?.SkippedAllocationIndexEntry(ex, "allocation", allocation.Id, allocation.ProjectId, companyId);
+                }
+            }
+        }
+        
+        foreach (var assignment in assignments)
+        {
+            try
+            {
+                index.AddOrUpdate(assignment);
+            }
+            catch (ArgumentException ex)
+            {
+                _logger?.SkippedAllocationIndexEntry(ex, "workforce assignment", assignment.Id, assignment.ProjectId, companyId);
+            }
+        }
+        
+        return index;
+    }
+
     #endregion
 
     #region Optimization
@@ -1784,13 +1876,13 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Optimizing resource allocation for project {ProjectId} in company {CompanyId} from {StartDate} to {EndDate}", projectId, companyId, startDate, endDate);
+                _logger?.OptimizingResourceAllocationForProject(projectId, companyId, startDate, endDate);
                 
                 // Placeholder implementation
                 await Task.CompletedTask.ConfigureAwait(false);
                 return Enumerable.Empty<Resource>();
             },
-            $"OptimizeResourceAllocation-Project-{projectId}-Company-{companyId}-{startDate:yyyy-MM-dd}-{endDate:yyyy-MM-dd}",
+            "OptimizeResourceAllocationAsync",
             null,
             cancellationToken);
     }
@@ -1807,13 +1899,13 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting optimal workforce assignments for project {ProjectId} in company {CompanyId}", projectId, companyId);
+                _logger?.GettingOptimalWorkforceAssignmentsForProject(projectId, companyId);
                 
                 // Placeholder implementation
                 await Task.CompletedTask.ConfigureAwait(false);
                 return Enumerable.Empty<WorkforceAssignment>();
             },
-            $"GetOptimalWorkforceAssignments-Project-{projectId}-Company-{companyId}",
+            "GetOptimalWorkforceAssignmentsAsync",
             null,
             cancellationToken);
     }
@@ -1837,8 +1929,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting resources with pagination for company {CompanyId} (page {Page}, per page {PerPage}) using enhanced discovery", 
-                    companyId, options.Page, options.PerPage);
+                _logger?.GettingResourcesPage(companyId, options.Page, options.PerPage);
                 
                 try
                 {
@@ -1865,13 +1956,12 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                         HasPreviousPage = options.Page > 1
                     };
                     
-                    _logger?.LogDebug("Successfully retrieved page {Page} with {Count} resources (total: {Total}) for company {CompanyId}", 
-                        options.Page, pagedResources.Count, resourcesList.Count, companyId);
+                    _logger?.RetrievedResourcesPage(options.Page, pagedResources.Count, resourcesList.Count, companyId);
                     return result;
                 }
                 catch (Exception ex) when (!(ex is HttpRequestException || ex is TaskCanceledException))
                 {
-                    _logger?.LogWarning(ex, "Enhanced pagination failed for company {CompanyId}, returning empty result", companyId);
+                    _logger?.ResourcePaginationFallback(ex, companyId);
                     
                     // Fallback to empty result with proper pagination structure
                     var result = new CoreModels.PagedResult<Resource>
@@ -1888,7 +1978,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                     return result;
                 }
             },
-            $"GetResourcesPaged-Company-{companyId}-Page-{options.Page}",
+            "GetResourcesPagedAsync",
             null,
             cancellationToken);
     }
@@ -1908,7 +1998,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting resource allocations with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})", projectId, companyId, options.Page, options.PerPage);
+                _logger?.GettingResourceAllocationsPage(projectId, companyId, options.Page, options.PerPage);
                 
                 // Placeholder implementation
                 return new CoreModels.PagedResult<ResourceAllocation>
@@ -1922,7 +2012,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                     HasPreviousPage = false
                 };
             },
-            $"GetResourceAllocationsPaged-Project-{projectId}-Company-{companyId}-Page-{options.Page}",
+            "GetResourceAllocationsPagedAsync",
             null,
             cancellationToken);
     }
@@ -1942,8 +2032,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
         return await ExecuteWithResilienceAsync(
             async () =>
             {
-                _logger?.LogDebug("Getting workforce assignments with pagination for company {CompanyId} (page {Page}, per page {PerPage}) using V1.0 workforce planning endpoint", 
-                    companyId, options.Page, options.PerPage);
+                _logger?.GettingWorkforceAssignmentsPage(companyId, options.Page, options.PerPage);
                 
                 try
                 {
@@ -1957,7 +2046,7 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                 
                     if (workforceResponse == null || !workforceResponse.Any())
                     {
-                        _logger?.LogDebug("No workforce data returned from V1.0 endpoint for company {CompanyId}", companyId);
+                        _logger?.NoWorkforceDataReturned(companyId);
                         return new CoreModels.PagedResult<WorkforceAssignment>
                         {
                             Items = Enumerable.Empty<WorkforceAssignment>(),
@@ -2009,14 +2098,13 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                         HasPreviousPage = currentPage > 1
                     };
                 
-                    _logger?.LogDebug("Successfully retrieved page {Page} with {Count} workforce assignments from V1.0 endpoint for company {CompanyId}", 
-                        currentPage, assignments.Count, companyId);
+                    _logger?.RetrievedWorkforceAssignmentsPage(currentPage, assignments.Count, companyId);
                     
                     return result;
                 }
                 catch (Exception ex) when (!(ex is HttpRequestException || ex is TaskCanceledException))
                 {
-                    _logger?.LogWarning(ex, "Failed to retrieve workforce assignments from V1.0 endpoint for company {CompanyId}, falling back to enhanced business logic", companyId);
+                    _logger?.FailedToRetrieveWorkforceAssignments(ex, companyId);
                     
                     // Fallback to enhanced business logic with client-side pagination
                     var allAssignments = GenerateWorkforceAssignments(companyId, projectId).ToList();
@@ -2040,13 +2128,12 @@ public class ProcoreResourceManagementClient : IResourceManagementClient
                         HasPreviousPage = options.Page > 1
                     };
                     
-                    _logger?.LogDebug("Retrieved page {Page} with {Count} workforce assignments using fallback logic (total: {Total}) for company {CompanyId}", 
-                        options.Page, pagedAssignments.Count, allAssignments.Count, companyId);
+                    _logger?.GeneratedFallbackWorkforceAssignmentsPage(options.Page, pagedAssignments.Count, allAssignments.Count, companyId);
                     
                     return result;
                 }
             },
-            $"GetWorkforceAssignmentsPaged-Company-{companyId}-Project-{projectId}-Page-{options.Page}",
+            "GetWorkforceAssignmentsPagedAsync",
             null,
             cancellationToken);
     }
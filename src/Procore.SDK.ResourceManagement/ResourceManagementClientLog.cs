@@ -0,0 +1,163 @@
+using System;
+using Microsoft.Extensions.Logging;
+
+namespace Procore.SDK.ResourceManagement;
+
+/// <summary>
+/// Source-generated log messages for <see cref="ProcoreResourceManagementClient"/>.
+/// </summary>
+internal static partial class ResourceManagementClientLog
+{
+    [LoggerMessage(EventId = 2601, Level = LogLevel.Debug, Message = "Getting resources for company {CompanyId} using enhanced discovery approach")]
+    public static partial void GettingResourcesForCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2602, Level = LogLevel.Debug, Message = "Enhanced resource discovery: derived {Count} labor resources from workforce data")]
+    public static partial void DerivedLaborResources(this ILogger logger, int count);
+
+    [LoggerMessage(EventId = 2603, Level = LogLevel.Debug, Message = "Could not retrieve workforce data for resource discovery, using enhanced equipment-only approach")]
+    public static partial void WorkforceDataUnavailable(this ILogger logger, Exception? exception);
+
+    [LoggerMessage(EventId = 2604, Level = LogLevel.Debug, Message = "Successfully discovered {Count} resources for company {CompanyId} using enhanced approach")]
+    public static partial void DiscoveredResources(this ILogger logger, int count, int companyId);
+
+    [LoggerMessage(EventId = 2605, Level = LogLevel.Warning, Message = "Enhanced resource discovery failed for company {CompanyId}, using fallback approach")]
+    public static partial void ResourceDiscoveryFallback(this ILogger logger, Exception? exception, int companyId);
+
+    [LoggerMessage(EventId = 2606, Level = LogLevel.Debug, Message = "Generated {Count} fallback resources for company {CompanyId}")]
+    public static partial void GeneratedFallbackResources(this ILogger logger, int count, int companyId);
+
+    [LoggerMessage(EventId = 2607, Level = LogLevel.Debug, Message = "Getting resource {ResourceId} for project {ProjectId} in company {CompanyId} using generated Kiota client")]
+    public static partial void GettingResource(this ILogger logger, int resourceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2608, Level = LogLevel.Debug, Message = "Creating resource '{Name}' for company {CompanyId} - using enhanced business logic")]
+    public static partial void CreatingResource(this ILogger logger, string name, int companyId);
+
+    [LoggerMessage(EventId = 2609, Level = LogLevel.Debug, Message = "Successfully created resource {ResourceId} for company {CompanyId} using enhanced business logic")]
+    public static partial void CreatedResource(this ILogger logger, int resourceId, int companyId);
+
+    [LoggerMessage(EventId = 2610, Level = LogLevel.Debug, Message = "Updating resource {ResourceId} for project {ProjectId} in company {CompanyId} using generated Kiota client")]
+    public static partial void UpdatingResource(this ILogger logger, int resourceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2611, Level = LogLevel.Debug, Message = "Deleting resource {ResourceId} for project {ProjectId} in company {CompanyId} using generated Kiota client")]
+    public static partial void DeletingResource(this ILogger logger, int resourceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2612, Level = LogLevel.Debug, Message = "Successfully deleted resource {ResourceId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void DeletedResource(this ILogger logger, int resourceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2613, Level = LogLevel.Debug, Message = "Getting resource allocations for project {ProjectId} in company {CompanyId} by analyzing project resources")]
+    public static partial void GettingResourceAllocationsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2614, Level = LogLevel.Debug, Message = "Successfully generated {Count} enhanced resource allocations for project {ProjectId}")]
+    public static partial void GeneratedResourceAllocations(this ILogger logger, int count, int projectId);
+
+    [LoggerMessage(EventId = 2615, Level = LogLevel.Warning, Message = "Error in enhanced allocation logic for project {ProjectId}, using fallback generation")]
+    public static partial void ResourceAllocationFallback(this ILogger logger, Exception? exception, int projectId);
+
+    [LoggerMessage(EventId = 2616, Level = LogLevel.Debug, Message = "Generated {Count} fallback resource allocations for project {ProjectId}")]
+    public static partial void GeneratedFallbackResourceAllocations(this ILogger logger, int count, int projectId);
+
+    [LoggerMessage(EventId = 2617, Level = LogLevel.Debug, Message = "Getting resource allocation {AllocationId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingResourceAllocation(this ILogger logger, int allocationId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2618, Level = LogLevel.Debug, Message = "Allocating resource {ResourceId} to project {ProjectId} in company {CompanyId}")]
+    public static partial void AllocatingResource(this ILogger logger, int resourceId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2619, Level = LogLevel.Debug, Message = "Updating resource allocation {AllocationId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void UpdatingResourceAllocation(this ILogger logger, int allocationId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2620, Level = LogLevel.Debug, Message = "Releasing resource allocation {AllocationId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void ReleasingResourceAllocation(this ILogger logger, int allocationId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2621, Level = LogLevel.Debug, Message = "Successfully released resource allocation {AllocationId} for project {ProjectId}")]
+    public static partial void ReleasedResourceAllocation(this ILogger logger, int allocationId, int projectId);
+
+    [LoggerMessage(EventId = 2622, Level = LogLevel.Debug, Message = "Getting workforce assignments for company {CompanyId} using V1.0 workforce planning endpoint")]
+    public static partial void GettingWorkforceAssignmentsForCompany(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2623, Level = LogLevel.Debug, Message = "No workforce data returned from V1.0 endpoint for company {CompanyId}")]
+    public static partial void NoWorkforceDataReturned(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2624, Level = LogLevel.Debug, Message = "Successfully retrieved {Count} workforce assignments from V1.0 endpoint for company {CompanyId}")]
+    public static partial void RetrievedWorkforceAssignments(this ILogger logger, int count, int companyId);
+
+    [LoggerMessage(EventId = 2625, Level = LogLevel.Warning, Message = "Failed to retrieve workforce assignments from V1.0 endpoint for company {CompanyId}, falling back to enhanced business logic")]
+    public static partial void FailedToRetrieveWorkforceAssignments(this ILogger logger, Exception? exception, int companyId);
+
+    [LoggerMessage(EventId = 2626, Level = LogLevel.Debug, Message = "Generated {Count} workforce assignments using fallback logic for company {CompanyId}")]
+    public static partial void GeneratedFallbackWorkforceAssignments(this ILogger logger, int count, int companyId);
+
+    [LoggerMessage(EventId = 2627, Level = LogLevel.Debug, Message = "Getting workforce assignment {AssignmentId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingWorkforceAssignment(this ILogger logger, int assignmentId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2628, Level = LogLevel.Debug, Message = "Creating workforce assignment for worker {WorkerId} to project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingWorkforceAssignmentForWorker(this ILogger logger, int workerId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2629, Level = LogLevel.Debug, Message = "Updating workforce assignment {AssignmentId} for project {ProjectId} in company {CompanyId}")]
+    public static partial void UpdatingWorkforceAssignment(this ILogger logger, int assignmentId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2630, Level = LogLevel.Debug, Message = "Getting capacity plans for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingCapacityPlansForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2631, Level = LogLevel.Debug, Message = "Creating capacity plan for project {ProjectId} in company {CompanyId}")]
+    public static partial void CreatingCapacityPlanForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2632, Level = LogLevel.Debug, Message = "Getting available resources for company {CompanyId} from {StartDate} to {EndDate} using enhanced availability logic")]
+    public static partial void GettingAvailableResourcesForCompany(this ILogger logger, int companyId, DateTime startDate, DateTime endDate);
+
+    [LoggerMessage(EventId = 2633, Level = LogLevel.Debug, Message = "Successfully calculated {Count} available resources for company {CompanyId} in date range using enhanced logic")]
+    public static partial void CalculatedAvailableResources(this ILogger logger, int count, int companyId);
+
+    [LoggerMessage(EventId = 2634, Level = LogLevel.Warning, Message = "Error in enhanced availability calculation for company {CompanyId}, using basic logic")]
+    public static partial void AvailabilityCalculationFallback(this ILogger logger, Exception? exception, int companyId);
+
+    [LoggerMessage(EventId = 2635, Level = LogLevel.Debug, Message = "Generated {Count} resources using fallback logic for company {CompanyId}")]
+    public static partial void GeneratedFallbackAvailableResources(this ILogger logger, int count, int companyId);
+
+    [LoggerMessage(EventId = 2636, Level = LogLevel.Debug, Message = "Getting over-allocated resources for company {CompanyId}")]
+    public static partial void GettingOverAllocatedResources(this ILogger logger, int companyId);
+
+    [LoggerMessage(EventId = 2637, Level = LogLevel.Debug, Message = "Calculating utilization rate for resource {ResourceId} in company {CompanyId} using enhanced analytics")]
+    public static partial void CalculatingUtilizationRate(this ILogger logger, int resourceId, int companyId);
+
+    [LoggerMessage(EventId = 2638, Level = LogLevel.Debug, Message = "Calculated utilization rate of {Rate}% for resource {ResourceId}")]
+    public static partial void CalculatedUtilizationRate(this ILogger logger, decimal rate, int resourceId);
+
+    [LoggerMessage(EventId = 2639, Level = LogLevel.Debug, Message = "Getting capacity analysis for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingCapacityAnalysisForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2640, Level = LogLevel.Debug, Message = "Loading allocation index for {ProjectCount} projects in company {CompanyId}")]
+    public static partial void LoadingAllocationIndex(this ILogger logger, int projectCount, int companyId);
+
+    [LoggerMessage(EventId = 2641, Level = LogLevel.Debug, Message = "Optimizing resource allocation for project {ProjectId} in company {CompanyId} from {StartDate} to {EndDate}")]
+    public static partial void OptimizingResourceAllocationForProject(this ILogger logger, int projectId, int companyId, DateTime startDate, DateTime endDate);
+
+    [LoggerMessage(EventId = 2642, Level = LogLevel.Debug, Message = "Getting optimal workforce assignments for project {ProjectId} in company {CompanyId}")]
+    public static partial void GettingOptimalWorkforceAssignmentsForProject(this ILogger logger, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2643, Level = LogLevel.Debug, Message = "Getting resources with pagination for company {CompanyId} (page {Page}, per page {PerPage}) using enhanced discovery")]
+    public static partial void GettingResourcesPage(this ILogger logger, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2644, Level = LogLevel.Debug, Message = "Successfully retrieved page {Page} with {Count} resources (total: {Total}) for company {CompanyId}")]
+    public static partial void RetrievedResourcesPage(this ILogger logger, int page, int count, int total, int companyId);
+
+    [LoggerMessage(EventId = 2645, Level = LogLevel.Warning, Message = "Enhanced pagination failed for company {CompanyId}, returning empty result")]
+    public static partial void ResourcePaginationFallback(this ILogger logger, Exception? exception, int companyId);
+
+    [LoggerMessage(EventId = 2646, Level = LogLevel.Debug, Message = "Getting resource allocations with pagination for project {ProjectId} in company {CompanyId} (page {Page}, per page {PerPage})")]
+    public static partial void GettingResourceAllocationsPage(this ILogger logger, int projectId, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2647, Level = LogLevel.Debug, Message = "Getting workforce assignments with pagination for company {CompanyId} (page {Page}, per page {PerPage}) using V1.0 workforce planning endpoint")]
+    public static partial void GettingWorkforceAssignmentsPage(this ILogger logger, int companyId, int page, int perPage);
+
+    [LoggerMessage(EventId = 2648, Level = LogLevel.Debug, Message = "Successfully retrieved page {Page} with {Count} workforce assignments from V1.0 endpoint for company {CompanyId}")]
+    public static partial void RetrievedWorkforceAssignmentsPage(this ILogger logger, int page, int count, int companyId);
+
+    [LoggerMessage(EventId = 2649, Level = LogLevel.Debug, Message = "Retrieved page {Page} with {Count} workforce assignments using fallback logic (total: {Total}) for company {CompanyId}")]
+    public static partial void GeneratedFallbackWorkforceAssignmentsPage(this ILogger logger, int page, int count, int total, int companyId);
+
+    [LoggerMessage(EventId = 2650, Level = LogLevel.Warning, Message = "Skipped {EntryKind} {EntryId} of project {ProjectId} while loading the allocation index for company {CompanyId}")]
+    public static partial void SkippedAllocationIndexEntry(this ILogger logger, Exception? exception, string entryKind, int entryId, int projectId, int companyId);
+
+    [LoggerMessage(EventId = 2651, Level = LogLevel.Debug, Message = "Executing operation {Operation} with correlation ID {CorrelationId}")]
+    public static partial void ExecutingOperation(this ILogger logger, string operation, string correlationId);
+}
@@ -0,0 +1,162 @@
+using System;
+
+namespace Procore.SDK.ResourceManagement.Scheduling;
+
+/// <summary>
+/// Per-resource load over a contiguous range of days, stored in a segment tree with lazy range
+/// updates so that adding an interval and querying the peak or total load of a window are both
+/// logarithmic in the number of days covered.
+/// </summary>
+internal sealed class LoadTimeline
+{
+    private readonly decimal[] _max;
+    private readonly decimal[] _sum;
+    private readonly decimal[] _pending;
+
+    public LoadTimeline(int firstDay, int dayCount)
+    {
+        if (dayCount < 1) throw new ArgumentOutOfRangeException(nameof(dayCount), "Day count must be at least 1");
+
+        FirstDay = firstDay;
+        DayCount = dayCount;
+        _max = new decimal[dayCount * 4];
+        _sum = new decimal[dayCount * 4];
+        _pending = new decimal[dayCount * 4];
+    }
+
+    /// <summary>
+    /// Gets the first day covered by the timeline.
+    /// </summary>
+    public int FirstDay { get; }
+
+    /// <summary>
+    /// Gets the number of days covered by the timeline.
+    /// </summary>
+    public int DayCount { get; }
+
+    /// <summary>
+    /// Gets the last day covered by the timeline.
+    /// </summary>
+    public int LastDay => FirstDay + DayCount - 1;
+
+    public bool Covers(int firstDay, int lastDay) => firstDay >= FirstDay && lastDay <= LastDay;
+
+    /// <summary>
+    /// Adds a load to every day of an interval the timeline covers; a negative load removes it.
+    /// </summary>
+    public void Add(int firstDay, int lastDay, decimal load)
+    {
+        Add(1, 0, DayCount - 1, firstDay - FirstDay, lastDay - FirstDay, load);
+    }
+
+    /// <summary>
+    /// Gets the highest daily load within a window; days outside the timeline carry no load.
+    /// </summary>
+    public decimal GetPeak(int firstDay, int lastDay)
+    {
+        var from = Math.Max(firstDay, FirstDay);
+        var to = Math.Min(lastDay, LastDay);
+        if (from > to)
+        {
+            return 0m;
+        }
+
+        var peak = QueryMax(1, 0, DayCount - 1, from - FirstDay, to - FirstDay);
+
+        // Uncovered days in the window have zero load
+        return from > firstDay || to < lastDay ? Math.Max(peak, 0m) : peak;
+    }
+
+    /// <summary>
+    /// Gets the sum of the daily loads within a window; days outside the timeline carry no load.
+    /// </summary>
+    public decimal GetTotal(int firstDay, int lastDay)
+    {
+        var from = Math.Max(firstDay, FirstDay);
+        var to = Math.Min(lastDay, LastDay);
+        return from > to ? 0m : QuerySum(1, 0, DayCount - 1, from - FirstDay, to - FirstDay);
+    }
+
+    private void Add(int node, int low, int high, int from, int to, decimal load)
+    {
+        if (to < low || high < from)
+        {
+            return;
+        }
+
+        if (from <= low && high <= to)
+        {
+            Apply(node, low, high, load);
+            return;
+        }
+
+        PushDown(node, low, high);
+        var middle = (low + high) / 2;
+        Add(node * 2, low, middle, from, to, load);
+        Add(node * 2 + 1, middle + 1, high, from, to, load);
+        _max[node] = Math.Max(_max[node * 2], _max[node * 2 + 1]);
+        _sum[node] = _sum[node * 2] + _sum[node * 2 + 1];
+    }
+
+    private decimal QueryMax(int node, int low, int high, int from, int to)
+    {
+        if (from <= low && high <= to)
+        {
+            return _max[node];
+        }
+
+        PushDown(node, low, high);
+        var middle = (low + high) / 2;
+        if (to <= middle)
+        {
+            return QueryMax(node * 2, low, middle, from, to);
+        }
+
+        if (from > middle)
+        {
+            return QueryMax(node * 2 + 1, middle + 1, high, from, to);
+        }
+
+        return Math.Max(
+            QueryMax(node * 2, low, middle, from, to),
+            QueryMax(node * 2 + 1, middle + 1, high, from, to));
+    }
+
+    private decimal QuerySum(int node, int low, int high, int from, int to)
+    {
+        if (to < low || high < from)
+        {
+            return 0m;
+        }
+
+        if (from <= low && high <= to)
+        {
+            return _sum[node];
+        }
+
+        PushDown(node, low, high);
+        var middle = (low + high) / 2;
+        return QuerySum(node * 2, low, middle, from, to) + QuerySum(node * 2 + 1, middle + 1, high, from, to);
+    }
+
+    private void Apply(int node, int low, int high, decimal load)
+    {
+        _max[node] += load;
+        _sum[node] += load * (high - low + 1);
+        _pending[node] += load;
+    }
+
+    private void PushDown(int node, int low, int high)
+    {
+        var load = _pending[node];
+        if (load == 0m)
+        {
+            return;
+        }
+
+        var middle = (low + high) / 2;
+        Apply(node * 2, low, middle, load);
+        Apply(node * 2 + 1, middle + 1, high, load);
+        _pending[node] = 0m;
+    }
+}
@@ -0,0 +1,307 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Procore.SDK.ResourceManagement.Models;
+
+namespace Procore.SDK.ResourceManagement.Scheduling;
+
+/// <summary>
+/// In-memory index of resource allocations and workforce assignments that answers availability,
+/// over-allocation and utilization queries over arbitrary date windows.
+/// </summary>
+/// <remarks>
+/// Loads are kept per resource as a percentage of full capacity per day. Allocations contribute
+/// their allocation percentage to <see cref="ResourceAllocation.ResourceId"/>; workforce assignments
+/// contribute their weekly hours relative to a full-time week to <see cref="WorkforceAssignment.WorkerId"/>.
+/// Entries are identified by kind, project and ID, since allocation IDs are only unique within a
+/// project; entries without an ID are rejected.
+/// Dates are whole days and both ends of an interval are inclusive. Adding, updating or removing an
+/// entry and every per-resource query take logarithmic time in the number of days spanned.
+/// Cancelled allocations and terminated assignments carry no load. The index is thread-safe.
+/// </remarks>
+public sealed class ResourceAllocationIndex
+{
+    /// <summary>
+    /// The load, as a percentage, at which a resource is fully allocated.
+    /// </summary>
+    public const decimal FullCapacity = 100m;
+
+    // Headroom added around a timeline when it is created or grown, so nearby edits don't regrow it
+    private const int GrowthPaddingDays = 90;
+
+    // Bounds the size of a resource's timeline; longer intervals are almost certainly bad data
+    private const int MaxIntervalDays = 366 * 20;
+
+    private readonly object _sync = new();
+    private readonly Dictionary<EntryKey, Entry> _entries = new();
+    private readonly Dictionary<int, ResourceEntries> _resources = new();
+    private readonly decimal _fullTimeHoursPerWeek;
+    private readonly int _openEndedAssignmentDays;
+
+    /// <summary>
+    /// Initializes a new instance of the <see cref="ResourceAllocationIndex"/> class.
+    /// </summary>
+    /// <param name="fullTimeHoursPerWeek">The weekly hours that make a workforce assignment a full load.</param>
+    /// <param name="openEndedAssignmentDays">How long an assignment without an end date is assumed to run.</param>
+    public ResourceAllocationIndex(decimal fullTimeHoursPerWeek = 40m, int openEndedAssignmentDays = 180)
+    {
+        if (fullTimeHoursPerWeek <= 0m) throw new ArgumentOutOfRangeException(nameof(fullTimeHoursPerWeek), "Full-time hours must be greater than zero");
+        if (openEndedAssignmentDays < 1) throw new ArgumentOutOfRangeException(nameof(openEndedAssignmentDays), "Open-ended assignment days must be at least 1");
+
+        _fullTimeHoursPerWeek = fullTimeHoursPerWeek;
+        _openEndedAssignmentDays = openEndedAssignmentDays;
+    }
+
+    /// <summary>
+    /// Gets the IDs of the resources that have at least one entry in the index.
+    /// </summary>
+    public IReadOnlyCollection<int> ResourceIds
+    {
+        get
+        {
+            lock (_sync)
+            {
+                return _resources.Keys.ToList();
+            }
+        }
+    }
+
+    /// <summary>
+    /// Adds an allocation, or replaces the allocation with the same project and ID.
+    /// </summary>
+    /// <param name="allocation">The resource allocation.</param>
+    /// <exception cref="ArgumentException">The allocation has no ID, ends before it starts or spans too many days.</exception>
+    public void AddOrUpdate(ResourceAllocation allocation)
+    {
+        ArgumentNullException.ThrowIfNull(allocation);
+        if (allocation.Id == 0) throw new ArgumentException("Allocation has no ID", nameof(allocation));
+
+        var load = allocation.Status == AllocationStatus.Cancelled ? 0m : allocation.AllocationPercentage;
+        Set(new EntryKey(EntryKind.Allocation, allocation.ProjectId, allocation.Id), allocation.ResourceId, allocation.StartDate, allocation.EndDate, load);
+    }
+
+    /// <summary>
+    /// Adds a workforce assignment, or replaces the assignment with the same project and ID.
+    /// </summary>
+    /// <param name="assignment">The workforce assignment.</param>
+    /// <exception cref="ArgumentException">The assignment has no ID or worker, ends before it starts or spans too many days.</exception>
+    public void AddOrUpdate(WorkforceAssignment assignment)
+    {
+        ArgumentNullException.ThrowIfNull(assignment);
+        if (assignment.Id == 0) throw new ArgumentException("Assignment has no ID", nameof(assignment));
+        if (assignment.WorkerId == 0) throw new ArgumentException("Assignment has no worker", nameof(assignment));
+
+        var load = assignment.Status == AssignmentStatus.Terminated
+            ? 0m
+            : assignment.HoursPerWeek / _fullTimeHoursPerWeek * FullCapacity;
+        var endDate = assignment.EndDate ?? assignment.StartDate.AddDays(_openEndedAssignmentDays);
+        Set(new EntryKey(EntryKind.Assignment, assignment.ProjectId, assignment.Id), assignment.WorkerId, assignment.StartDate, endDate, load);
+    }
+
+    /// <summary>
+    /// Removes an allocation, e.g. after it was released.
+    /// </summary>
+    /// <param name="projectId">The project ID.</param>
+    /// <param name="allocationId">The allocation ID.</param>
+    /// <returns>True when the allocation was in the index.</returns>
+    public bool RemoveAllocation(int projectId, int allocationId) => Remove(new EntryKey(EntryKind.Allocation, projectId, allocationId));
+
+    /// <summary>
+    /// Removes a workforce assignment.
+    /// </summary>
+    /// <param name="projectId">The project ID.</param>
+    /// <param name="assignmentId">The assignment ID.</param>
+    /// <returns>True when the assignment was in the index.</returns>
+    public bool RemoveAssignment(int projectId, int assignmentId) => Remove(new EntryKey(EntryKind.Assignment, projectId, assignmentId));
+
+    /// <summary>
+    /// Gets the highest combined daily load of a resource within a window.
+    /// </summary>
+    /// <param name="resourceId">The resource ID.</param>
+    /// <param name="startDate">The first day of the window.</param>
+    /// <param name="endDate">The last day of the window.</param>
+    /// <returns>The peak load as a percentage of full capacity.</returns>
+    public decimal GetPeakLoad(int resourceId, DateTime startDate, DateTime endDate)
+    {
+        var (firstDay, lastDay) = ToDays(startDate, endDate);
+
+        lock (_sync)
+        {
+            return _resources.TryGetValue(resourceId, out var resource) ? resource.Timeline.GetPeak(firstDay, lastDay) : 0m;
+        }
+    }
+
+    /// <summary>
+    /// Gets the average daily load of a resource over a window.
+    /// </summary>
+    /// <param name="resourceId">The resource ID.</param>
+    /// <param name="startDate">The first day of the window.</param>
+    /// <param name="endDate">The last day of the window.</param>
+    /// <returns>The utilization as a percentage of full capacity.</returns>
+    public decimal GetUtilization(int resourceId, DateTime startDate, DateTime endDate)
+    {
+        var (firstDay, lastDay) = ToDays(startDate, endDate);
+
+        lock (_sync)
+        {
+            if (!_resources.TryGetValue(resourceId, out var resource))
+            {
+                return 0m;
+            }
+
+            return resource.Timeline.GetTotal(firstDay, lastDay) / (lastDay - firstDay + 1);
+        }
+    }
+
+    /// <summary>
+    /// Determines whether a resource has spare capacity on every day of a window.
+    /// </summary>
+    /// <param name="resourceId">The resource ID.</param>
+    /// <param name="startDate">The first day of the window.</param>
+    /// <param name="endDate">The last day of the window.</param>
+    /// <param name="requiredPercentage">The capacity needed, as a percentage.</param>
+    /// <returns>True when the required capacity fits on every day of the window.</returns>
+    public bool IsAvailable(int resourceId, DateTime startDate, DateTime endDate, decimal requiredPercentage = FullCapacity)
+    {
+        return GetPeakLoad(resourceId, startDate, endDate) + requiredPercentage <= FullCapacity;
+    }
+
+    /// <summary>
+    /// Gets the resources whose load exceeds full capacity on at least one day of a window.
+    /// </summary>
+    /// <param name="startDate">The first day of the window.</param>
+    /// <param name="endDate">The last day of the window.</param>
+    /// <returns>The over-allocated resource IDs with their peak load, highest first.</returns>
+    public IReadOnlyList<KeyValuePair<int, decimal>> GetOverAllocatedResources(DateTime startDate, DateTime endDate)
+    {
+        var (firstDay, lastDay) = ToDays(startDate, endDate);
+        var overAllocated = new List<KeyValuePair<int, decimal>>();
+
+        lock (_sync)
+        {
+            foreach (var resource in _resources)
+            {
+                var peak = resource.Value.Timeline.GetPeak(firstDay, lastDay);
+                if (peak > FullCapacity)
+                {
+                    overAllocated.Add(new KeyValuePair<int, decimal>(resource.Key, peak));
+                }
+            }
+        }
+
+        overAllocated.Sort((left, right) => right.Value.CompareTo(left.Value));
+        return overAllocated;
+    }
+
+    private void Set(EntryKey key, int resourceId, DateTime startDate, DateTime endDate, decimal load)
+    {
+        var (firstDay, lastDay) = ToDays(startDate, endDate);
+        if (lastDay - firstDay >= MaxIntervalDays)
+        {
+            throw new ArgumentException($"Intervals longer than {MaxIntervalDays} days are not supported", nameof(endDate));
+        }
+
+        var entry = new Entry(resourceId, firstDay, lastDay, load);
+
+        lock (_sync)
+        {
+            RemoveLocked(key);
+
+            if (!_resources.TryGetValue(resourceId, out var resource))
+            {
+                resource = new ResourceEntries(new LoadTimeline(firstDay - GrowthPaddingDays, lastDay - firstDay + 1 + 2 * GrowthPaddingDays));
+                _resources.Add(resourceId, resource);
+            }
+            else if (!resource.Timeline.Covers(firstDay, lastDay))
+            {
+                resource.Timeline = Grow(resource, firstDay, lastDay);
+            }
+
+            resource.Keys.Add(key);
+            resource.Timeline.Add(firstDay, lastDay, load);
+            _entries[key] = entry;
+        }
+    }
+
+    private bool Remove(EntryKey key)
+    {
+        lock (_sync)
+        {
+            return RemoveLocked(key);
+        }
+    }
+
+    private bool RemoveLocked(EntryKey key)
+    {
+        if (!_entries.Remove(key, out var entry))
+        {
+            return false;
+        }
+
+        var resource = _resources[entry.ResourceId];
+        resource.Keys.Remove(key);
+        if (resource.Keys.Count == 0)
+        {
+            _resources.Remove(entry.ResourceId);
+        }
+        else
+        {
+            resource.Timeline.Add(entry.FirstDay, entry.LastDay, -entry.Load);
+        }
+
+        return true;
+    }
+
+    /// <summary>
+    /// Rebuilds a resource's timeline over a range that also covers a new interval.
+    /// </summary>
+    private LoadTimeline Grow(ResourceEntries resource, int firstDay, int lastDay)
+    {
+        var timeline = resource.Timeline;
+        var newFirstDay = Math.Min(timeline.FirstDay, firstDay - GrowthPaddingDays);
+        var newLastDay = Math.Max(timeline.LastDay, lastDay + GrowthPaddingDays);
+        var grown = new LoadTimeline(newFirstDay, newLastDay - newFirstDay + 1);
+
+        foreach (var key in resource.Keys)
+        {
+            var entry = _entries[key];
+            grown.Add(entry.FirstDay, entry.LastDay, entry.Load);
+        }
+
+        return grown;
+    }
+
+    private static (int FirstDay, int LastDay) ToDays(DateTime startDate, DateTime endDate)
+    {
+        var firstDay = (int)(startDate.Date.Ticks / TimeSpan.TicksPerDay);
+        var lastDay = (int)(endDate.Date.Ticks / TimeSpan.TicksPerDay);
+        if (lastDay < firstDay)
+        {
+            throw new ArgumentException("End date cannot be before start date", nameof(endDate));
+        }
+
+        return (firstDay, lastDay);
+    }
+
+    private enum EntryKind
+    {
+        Allocation,
+        Assignment
+    }
+
+    private readonly record struct EntryKey(EntryKind Kind, int ProjectId, int Id);
+
+    private readonly record struct Entry(int ResourceId, int FirstDay, int LastDay, decimal Load);
+
+    private sealed class ResourceEntries
+    {
+        public ResourceEntries(LoadTimeline timeline)
+        {
+            Timeline = timeline;
+        }
+
+        public LoadTimeline Timeline { get; set; }
+
+        public HashSet<EntryKey> Keys { get; } = new();
+    }
+}
@@ -98,7 +98,7 @@ public class ResourceTypeMapper : BaseTypeMapper<Resource, Generated.ResourcesGe
     /// </summary>
     /// <param name="assignment">The workforce assignment data</param>
     /// <param name="person">The person data containing the assignment</param>
-    /// <param name="projectId">The project ID context</param>
+    /// <param name="projectId">The project ID used when the assignment carries no Procore project ID</param>
     /// <returns>The mapped WorkforceAssignment domain model</returns>
     public WorkforceAssignment MapV10WorkforceAssignmentToWrapper(
         V10Workforce.Current_data_assignments assignment, 
@@ -114,7 +114,7 @@ public class ResourceTypeMapper : BaseTypeMapper<Resource, Generated.ResourcesGe
         {
             Id = int.TryParse(assignment.Id, out var assignmentId) ? assignmentId : 0,
             WorkerId = int.TryParse(person.PersonId, out var personId) ? personId : 0,
-            ProjectId = projectId,
+            ProjectId = assignment.ProcoreProjectId ?? projectId,
             Role = assignment.AssignmentStatus?.Name ?? "Unknown",
             StartDate = DateTime.UtcNow, // Default start date
             EndDate = DateTime.UtcNow.AddMonths(6), // Default 6-month assignment
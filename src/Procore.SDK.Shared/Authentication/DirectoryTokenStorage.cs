@@ -0,0 +1,165 @@
+using System;
+using System.IO;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using Procore.SDK.Shared.Serialization;
+
+namespace Procore.SDK.Shared.Authentication;
+
+/// <summary>
+/// File-based token storage that keeps one encrypted file per key
+/// Reads and writes touch only the entry involved, so it scales to many tenants per process
+/// </summary>
+/// <remarks>
+/// File names are a hash of the key. Writes go to a temporary file that atomically replaces the
+/// entry, and operations on the same key are serialized through a fixed set of lock stripes,
+/// so unrelated keys never wait on each other. Encryption matches <see cref="FileTokenStorage"/>.
+/// </remarks>
+public sealed class DirectoryTokenStorage : ITokenStorage, IDisposable
+{
+    private const int LockStripeCount = 64;
+
+    private readonly string _directory;
+    private readonly byte[] _entropy;
+    private readonly SemaphoreSlim[] _locks;
+    private bool _disposed;
+
+    /// <summary>
+    /// Creates a new DirectoryTokenStorage instance
+    /// </summary>
+    /// <param name="directory">Directory in which token files are stored</param>
+    public DirectoryTokenStorage(string directory)
+    {
+        if (string.IsNullOrWhiteSpace(directory))
+            throw new ArgumentException("Value cannot be null or whitespace.", nameof(directory));
+
+        _directory = directory;
+        _entropy = TokenProtection.CreateEntropy(Path.GetFullPath(directory));
+
+        _locks = new SemaphoreSlim[LockStripeCount];
+        for (int i = 0; i < _locks.Length; i++)
+        {
+            _locks[i] = new SemaphoreSlim(1, 1);
+        }
+    }
+
+    /// <inheritdoc />
+    public async Task<AccessToken?> GetTokenAsync(string key, CancellationToken cancellationToken = default)
+    {
+        var path = GetPath(key);
+        var keyLock = GetLock(key);
+
+        await keyLock.WaitAsync(cancellationToken).ConfigureAwait(false);
+        try
+        {
+            if (!File.Exists(path))
+            {
+                return null;
+            }
+
+            var encryptedData = await File.ReadAllBytesAsync(path, cancellationToken).ConfigureAwait(false);
+            var stored = JsonSerializer.Deserialize(TokenProtection.Unprotect(encryptedData, _entropy), SharedJsonContext.Default.StoredToken);
+
+            return stored?.Key == key ? stored.ToAccessToken() : null;
+        }
+        catch (JsonException)
+        {
+            // File is corrupted, treat as missing
+            return null;
+        }
+        catch (CryptographicException)
+        {
+            // Encryption failed, treat as missing
+            return null;
+        }
+        finally
+        {
+            keyLock.Release();
+        }
+    }
+
+    /// <inheritdoc />
+    public async Task StoreTokenAsync(string key, AccessToken token, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(token);
+
+        var path = GetPath(key);
+        var encryptedData = TokenProtection.Protect(
+            JsonSerializer.SerializeToUtf8Bytes(StoredToken.FromAccessToken(token, key), SharedJsonContext.Default.StoredToken),
+            _entropy);
+        var keyLock = GetLock(key);
+
+        await keyLock.WaitAsync(cancellationToken).ConfigureAwait(false);
+        try
+        {
+            Directory.CreateDirectory(_directory);
+
+            var tempPath = path + "." + Guid.NewGuid().ToString("N") + ".tmp";
+            await File.WriteAllBytesAsync(tempPath, encryptedData, cancellationToken).ConfigureAwait(false);
+
+            // Replace atomically so readers never observe a partially written entry
+            File.Move(tempPath, path, overwrite: true);
+        }
+        finally
+        {
+            keyLock.Release();
+        }
+    }
+
+    /// <inheritdoc />
+    public async Task DeleteTokenAsync(string key, CancellationToken cancellationToken = default)
+    {
+        var path = GetPath(key);
+        var keyLock = GetLock(key);
+
+        await keyLock.WaitAsync(cancellationToken).ConfigureAwait(false);
+        try
+        {
+            File.Delete(path);
+        }
+        catch (DirectoryNotFoundException)
+        {
+            // Nothing has been stored yet
+        }
+        finally
+        {
+            keyLock.Release();
+        }
+    }
+
+    private string GetPath(string key)
+    {
+        if (string.IsNullOrWhiteSpace(key))
+        {
+            throw new ArgumentException("Key cannot be null or empty", nameof(key));
+        }
+
+        var hash = Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(key)));
+        return Path.Combine(_directory, hash + ".token");
+    }
+
+    private SemaphoreSlim GetLock(string key)
+    {
+        var hash = (uint)StringComparer.Ordinal.GetHashCode(key);
+        return _locks[hash % LockStripeCount];
+    }
+
+    /// <inheritdoc />
+    public void Dispose()
+    {
+        if (_disposed)
+        {
+            return;
+        }
+
+        foreach (var keyLock in _locks)
+        {
+            keyLock.Dispose();
+        }
+
+        _disposed = true;
+    }
+}
@@ -6,12 +6,14 @@ using System.Text;
 using System.Text.Json;
 using System.Threading;
 using System.Threading.Tasks;
+using Procore.SDK.Shared.Serialization;
 
 namespace Procore.SDK.Shared.Authentication;
 
 /// <summary>
 /// File-based token storage with encryption
 /// Stores tokens in an encrypted JSON file for persistence across application restarts
+/// Every save rewrites the whole file; use <see cref="DirectoryTokenStorage"/> for many tokens
 /// </summary>
 public sealed class FileTokenStorage : ITokenStorage, IDisposable
 {
@@ -32,8 +34,7 @@ public sealed class FileTokenStorage : ITokenStorage, IDisposable
         _filePath = filePath;
 
         // Generate consistent entropy based on file path for encryption
-        using var sha256 = SHA256.Create();
-        _entropy = sha256.ComputeHash(Encoding.UTF8.GetBytes(_filePath + Environment.MachineName));
+        _entropy = TokenProtection.CreateEntropy(_filePath);
     }
 
     /// <inheritdoc />
@@ -55,16 +56,11 @@ public sealed class FileTokenStorage : ITokenStorage, IDisposable
             var encryptedData = await File.ReadAllBytesAsync(_filePath, cancellationToken);
             var decryptedJson = DecryptData(encryptedData);
 
-            var tokenData = JsonSerializer.Deserialize<Dictionary<string, TokenData>>(decryptedJson);
+            var tokenData = JsonSerializer.Deserialize(decryptedJson, SharedJsonContext.Default.DictionaryStringStoredToken);
 
             if (tokenData != null && tokenData.TryGetValue(key, out var data))
             {
-                return new AccessToken(
-                    data.Token,
-                    data.TokenType,
-                    data.ExpiresAt,
-                    data.RefreshToken,
-                    data.Scopes);
+                return data.ToAccessToken();
             }
 
             return null;
@@ -106,14 +102,14 @@ public sealed class FileTokenStorage : ITokenStorage, IDisposable
             }
 
             // Load existing tokens
-            var tokenData = new Dictionary<string, TokenData>();
+            var tokenData = new Dictionary<string, StoredToken>();
             if (File.Exists(_filePath))
             {
                 try
                 {
                     var existingEncryptedData = await File.ReadAllBytesAsync(_filePath, cancellationToken);
                     var existingDecryptedJson = DecryptData(existingEncryptedData);
-                    var existingTokenData = JsonSerializer.Deserialize<Dictionary<string, TokenData>>(existingDecryptedJson);
+                    var existingTokenData = JsonSerializer.Deserialize(existingDecryptedJson, SharedJsonContext.Default.DictionaryStringStoredToken);
                     if (existingTokenData != null)
                     {
                         tokenData = existingTokenData;
@@ -130,17 +126,10 @@ public sealed class FileTokenStorage : ITokenStorage, IDisposable
             }
 
             // Add or update the token
-            tokenData[key] = new TokenData
-            {
-                Token = token.Token,
-                TokenType = token.TokenType,
-                ExpiresAt = token.ExpiresAt,
-                RefreshToken = token.RefreshToken,
-                Scopes = token.Scopes
-            };
+            tokenData[key] = StoredToken.FromAccessToken(token);
 
             // Save encrypted data
-            var json = JsonSerializer.Serialize(tokenData);
+            var json = JsonSerializer.Serialize(tokenData, SharedJsonContext.Default.DictionaryStringStoredToken);
             var encryptedData = EncryptData(json);
             await File.WriteAllBytesAsync(_filePath, encryptedData, cancellationToken);
         }
@@ -167,7 +156,7 @@ public sealed class FileTokenStorage : ITokenStorage, IDisposable
             var encryptedData = await File.ReadAllBytesAsync(_filePath, cancellationToken);
             var decryptedJson = DecryptData(encryptedData);
 
-            var tokenData = JsonSerializer.Deserialize<Dictionary<string, TokenData>>(decryptedJson);
+            var tokenData = JsonSerializer.Deserialize(decryptedJson, SharedJsonContext.Default.DictionaryStringStoredToken);
 
             if (tokenData != null && tokenData.Remove(key))
             {
@@ -179,7 +168,7 @@ public sealed class FileTokenStorage : ITokenStorage, IDisposable
                 else
                 {
                     // Save updated data
-                    var json = JsonSerializer.Serialize(tokenData);
+                    var json = JsonSerializer.Serialize(tokenData, SharedJsonContext.Default.DictionaryStringStoredToken);
                     var newEncryptedData = EncryptData(json);
                     await File.WriteAllBytesAsync(_filePath, newEncryptedData, cancellationToken);
                 }
@@ -201,58 +190,12 @@ public sealed class FileTokenStorage : ITokenStorage, IDisposable
 
     private byte[] EncryptData(string data)
     {
-        var dataBytes = Encoding.UTF8.GetBytes(data);
-
-        if (OperatingSystem.IsWindows())
-        {
-            // Use DPAPI on Windows for additional security
-            return ProtectedData.Protect(dataBytes, _entropy, DataProtectionScope.CurrentUser);
-        }
-        else
-        {
-            // On non-Windows platforms, use basic XOR encryption with entropy
-            // This is not strong encryption but provides basic obfuscation
-            var result = new byte[dataBytes.Length];
-            for (int i = 0; i < dataBytes.Length; i++)
-            {
-                result[i] = (byte)(dataBytes[i] ^ _entropy[i % _entropy.Length]);
-            }
-
-            return result;
-        }
+        return TokenProtection.Protect(Encoding.UTF8.GetBytes(data), _entropy);
     }
 
     private string DecryptData(byte[] encryptedData)
     {
-        if (OperatingSystem.IsWindows())
-        {
-            // Use DPAPI on Windows
-            var decryptedBytes = ProtectedData.Unprotect(encryptedData, _entropy, DataProtectionScope.CurrentUser);
-            return Encoding.UTF8.GetString(decryptedBytes);
-        }
-        else
-        {
-            // On non-Windows platforms, reverse the XOR encryption
-            var result = new byte[encryptedData.Length];
-            for (int i = 0; i < encryptedData.Length; i++)
-            {
-                result[i] = (byte)(encryptedData[i] ^ _entropy[i % _entropy.Length]);
-            }
-
-            return Encoding.UTF8.GetString(result);
-        }
-    }
-
-    /// <summary>
-    /// Internal representation of token data for JSON serialization
-    /// </summary>
-    private sealed class TokenData
-    {
-        public string Token { get; set; } = string.Empty;
-        public string TokenType { get; set; } = string.Empty;
-        public DateTimeOffset ExpiresAt { get; set; }
-        public string? RefreshToken { get; set; }
-        public string[]? Scopes { get; set; }
+        return Encoding.UTF8.GetString(TokenProtection.Unprotect(encryptedData, _entropy));
     }
 
     /// <inheritdoc />
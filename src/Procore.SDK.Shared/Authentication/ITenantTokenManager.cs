@@ -0,0 +1,79 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Shared.Authentication;
+
+/// <summary>
+/// Manages OAuth 2.0 access tokens for many tenants (company connections) served by one process
+/// </summary>
+public interface ITenantTokenManager
+{
+    /// <summary>
+    /// Gets the current access token for a tenant, automatically refreshing if needed
+    /// </summary>
+    /// <param name="tenantId">Identifier of the tenant or connection</param>
+    /// <param name="cancellationToken">Token to cancel the operation</param>
+    /// <returns>The current access token or null if the tenant has no token</returns>
+    Task<AccessToken?> GetAccessTokenAsync(string tenantId, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Refreshes a tenant's access token using its refresh token
+    /// Concurrent refreshes for the same tenant share a single token request
+    /// </summary>
+    /// <param name="tenantId">Identifier of the tenant or connection</param>
+    /// <param name="cancellationToken">Token to cancel waiting for the refresh</param>
+    /// <returns>The new refreshed access token</returns>
+    /// <exception cref="InvalidOperationException">Thrown when no refresh token is available</exception>
+    Task<AccessToken> RefreshTokenAsync(string tenantId, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Stores an access token for a tenant
+    /// </summary>
+    /// <param name="tenantId">Identifier of the tenant or connection</param>
+    /// <param name="token">The access token to store</param>
+    /// <param name="cancellationToken">Token to cancel the operation</param>
+    Task StoreTokenAsync(string tenantId, AccessToken token, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Clears a tenant's stored access token
+    /// </summary>
+    /// <param name="tenantId">Identifier of the tenant or connection</param>
+    /// <param name="cancellationToken">Token to cancel the operation</param>
+    Task ClearTokenAsync(string tenantId, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Gets a token manager bound to one tenant, e.g. for a <see cref="ProcoreAuthHandler"/> serving that tenant
+    /// </summary>
+    /// <param name="tenantId">Identifier of the tenant or connection</param>
+    /// <returns>A token manager that reads and refreshes the tenant's token through this pool</returns>
+    ITokenManager ForTenant(string tenantId);
+
+    /// <summary>
+    /// Event raised when a tenant's token is refreshed
+    /// </summary>
+    event EventHandler<TenantTokenRefreshedEventArgs>? TokenRefreshed;
+}
+
+/// <summary>
+/// Event arguments for the TokenRefreshed event of a multi-tenant token manager
+/// </summary>
+public class TenantTokenRefreshedEventArgs : TokenRefreshedEventArgs
+{
+    /// <summary>
+    /// Gets the tenant whose token was refreshed.
+    /// </summary>
+    public string TenantId { get; }
+
+    /// <summary>
+    /// Creates new TenantTokenRefreshedEventArgs
+    /// </summary>
+    /// <param name="tenantId">The tenant whose token was refreshed</param>
+    /// <param name="newToken">The new access token</param>
+    /// <param name="oldToken">The previous access token (optional)</param>
+    public TenantTokenRefreshedEventArgs(string tenantId, AccessToken newToken, AccessToken? oldToken = null)
+        : base(newToken, oldToken)
+    {
+        TenantId = tenantId;
+    }
+}
@@ -5,10 +5,10 @@ using System.Net.Http;
 using System.Security.Cryptography;
 using System.Text;
 using System.Text.Json;
-using System.Text.Json.Serialization;
 using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Options;
+using Procore.SDK.Shared.Serialization;
 
 namespace Procore.SDK.Shared.Authentication;
 
@@ -99,7 +99,7 @@ public class OAuthFlowHelper
         response.EnsureSuccessStatusCode();
 
         var json = await response.Content.ReadAsStringAsync(cancellationToken);
-        var tokenResponse = JsonSerializer.Deserialize<TokenResponse>(json)
+        var tokenResponse = JsonSerializer.Deserialize(json, SharedJsonContext.Default.TokenResponse)
             ?? throw new JsonException("Failed to deserialize token response");
 
         return new AccessToken(
@@ -137,14 +137,4 @@ public class OAuthFlowHelper
             .Replace('+', '-')
             .Replace('/', '_');
     }
-
-    /// <summary>
-    /// Internal record for deserializing token responses
-    /// </summary>
-    private sealed record TokenResponse(
-        [property: JsonPropertyName("access_token")] string AccessToken,
-        [property: JsonPropertyName("token_type")] string TokenType,
-        [property: JsonPropertyName("expires_in")] int ExpiresIn,
-        [property: JsonPropertyName("refresh_token")] string? RefreshToken,
-        [property: JsonPropertyName("scope")] string? Scope);
 }
\ No newline at end of file
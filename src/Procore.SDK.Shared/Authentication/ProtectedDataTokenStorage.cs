@@ -5,6 +5,7 @@ using System.Text;
 using System.Text.Json;
 using System.Threading;
 using System.Threading.Tasks;
+using Procore.SDK.Shared.Serialization;
 
 namespace Procore.SDK.Shared.Authentication;
 
@@ -80,7 +81,7 @@ public class ProtectedDataTokenStorage : ITokenStorage
             Scopes = token.Scopes
         };
 
-        var json = JsonSerializer.Serialize(tokenData);
+        var json = JsonSerializer.Serialize(tokenData, SharedJsonContext.Default.TokenData);
         var dataBytes = Encoding.UTF8.GetBytes(json);
         var encryptedBytes = ProtectedData.Protect(dataBytes, Entropy, DataProtectionScope.CurrentUser);
 
@@ -127,7 +128,7 @@ public class ProtectedDataTokenStorage : ITokenStorage
     /// <summary>
     /// Internal representation of token data for JSON serialization
     /// </summary>
-    private sealed class TokenData
+    internal sealed class TokenData
     {
         public string Token { get; set; } = string.Empty;
         public string TokenType { get; set; } = string.Empty;
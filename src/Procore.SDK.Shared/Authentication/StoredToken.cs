@@ -0,0 +1,40 @@
+using System;
+using System.Text.Json.Serialization;
+
+namespace Procore.SDK.Shared.Authentication;
+
+/// <summary>
+/// Serialized form of an access token in the file-based token stores
+/// </summary>
+internal sealed class StoredToken
+{
+    public string Token { get; set; } = string.Empty;
+    public string TokenType { get; set; } = string.Empty;
+    public DateTimeOffset ExpiresAt { get; set; }
+    public string? RefreshToken { get; set; }
+    public string[]? Scopes { get; set; }
+
+    /// <summary>
+    /// Storage key the token was saved under; guards against hash collisions in per-key stores
+    /// </summary>
+    [JsonIgnore(Condition = JsonIgnoreCondition.WhenWritingNull)]
+    public string? Key { get; set; }
+
+    public static StoredToken FromAccessToken(AccessToken token, string? key = null)
+    {
+        return new StoredToken
+        {
+            Token = token.Token,
+            TokenType = token.TokenType,
+            ExpiresAt = token.ExpiresAt,
+            RefreshToken = token.RefreshToken,
+            Scopes = token.Scopes,
+            Key = key
+        };
+    }
+
+    public AccessToken ToAccessToken()
+    {
+        return new AccessToken(Token, TokenType, ExpiresAt, RefreshToken, Scopes);
+    }
+}
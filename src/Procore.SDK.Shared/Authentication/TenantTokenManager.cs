@@ -0,0 +1,276 @@
+using System;
+using System.Collections.Concurrent;
+using System.Diagnostics;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using Procore.SDK.Shared.Diagnostics;
+
+namespace Procore.SDK.Shared.Authentication;
+
+/// <summary>
+/// Manages OAuth 2.0 access tokens for many tenants, keeping recently used tokens in a sharded
+/// in-memory LRU in front of the token storage
+/// </summary>
+/// <remarks>
+/// Each tenant's token is stored under its own key, so pair this with a per-entry store such as
+/// <see cref="DirectoryTokenStorage"/> or <see cref="InMemoryTokenStorage"/> rather than
+/// <see cref="FileTokenStorage"/>. Valid cached tokens are returned without touching storage.
+/// Refreshes are single-flight per tenant: concurrent callers share one token request, and a
+/// caller that cancels only stops waiting for it.
+/// </remarks>
+public class TenantTokenManager : ITenantTokenManager
+{
+    private readonly ITokenStorage _storage;
+    private readonly ProcoreAuthOptions _options;
+    private readonly HttpClient _httpClient;
+    private readonly ILogger<TenantTokenManager> _logger;
+    private readonly TokenCache _cache;
+    private readonly ConcurrentDictionary<string, Lazy<Task<AccessToken>>> _refreshes = new(StringComparer.Ordinal);
+    private readonly Func<string, Lazy<Task<AccessToken>>> _createRefresh;
+
+    /// <inheritdoc />
+    public event EventHandler<TenantTokenRefreshedEventArgs>? TokenRefreshed;
+
+    /// <summary>
+    /// Creates a new TenantTokenManager instance
+    /// </summary>
+    /// <param name="storage">Token storage implementation</param>
+    /// <param name="options">Procore authentication options</param>
+    /// <param name="poolOptions">Token pool options</param>
+    /// <param name="httpClient">HTTP client for making token requests</param>
+    /// <param name="logger">Logger for diagnostic information</param>
+    /// <exception cref="ArgumentNullException">Thrown when any required parameter is null</exception>
+    public TenantTokenManager(
+        ITokenStorage storage,
+        IOptions<ProcoreAuthOptions> options,
+        IOptions<TokenPoolOptions> poolOptions,
+        HttpClient httpClient,
+        ILogger<TenantTokenManager> logger)
+    {
+        _storage = storage ?? throw new ArgumentNullException(nameof(storage));
+        _options = (options ?? throw new ArgumentNullException(nameof(options))).Value;
+        var pool = (poolOptions ?? throw new ArgumentNullException(nameof(poolOptions))).Value;
+        _httpClient = httpClient ?? throw new ArgumentNullException(nameof(httpClient));
+        _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+        _cache = new TokenCache(pool.Capacity, pool.ShardCount);
+        _createRefresh = tenantId => new Lazy<Task<AccessToken>>(() => RefreshAndCompleteAsync(tenantId));
+    }
+
+    /// <summary>
+    /// Number of tenant tokens currently held in memory
+    /// </summary>
+    public int CachedTokenCount => _cache.Count;
+
+    /// <inheritdoc />
+    public async Task<AccessToken?> GetAccessTokenAsync(string tenantId, CancellationToken cancellationToken = default)
+    {
+        ValidateTenantId(tenantId);
+
+        if (!_cache.TryGet(tenantId, out var token))
+        {
+            try
+            {
+                token = await _storage.GetTokenAsync(GetStorageKey(tenantId), cancellationToken).ConfigureAwait(false);
+            }
+            catch (OperationCanceledException)
+            {
+                throw;
+            }
+            catch (Exception ex)
+            {
+                _logger.LogError(ex, "Failed to retrieve token for tenant {TenantId} from storage", tenantId);
+                return null;
+            }
+
+            if (token == null)
+            {
+                _logger.LogDebug("No access token found in storage for tenant {TenantId}", tenantId);
+                return null;
+            }
+
+            _cache.Set(tenantId, token);
+        }
+
+        // Check if token needs refresh
+        if (token.ExpiresAt <= DateTimeOffset.UtcNow.Add(_options.TokenRefreshMargin))
+        {
+            _logger.LogDebug("Access token for tenant {TenantId} is expired or near expiration, attempting refresh", tenantId);
+
+            try
+            {
+                token = await RefreshTokenAsync(tenantId, cancellationToken).ConfigureAwait(false);
+            }
+            catch (Exception ex)
+            {
+                _logger.LogWarning(ex, "Failed to refresh token for tenant {TenantId}, returning expired token", tenantId);
+                return token;
+            }
+        }
+
+        return token;
+    }
+
+    /// <inheritdoc />
+    public Task<AccessToken> RefreshTokenAsync(string tenantId, CancellationToken cancellationToken = default)
+    {
+        ValidateTenantId(tenantId);
+
+        // The refresh itself is not tied to any one caller, so cancelling only stops this caller waiting
+        return _refreshes.GetOrAdd(tenantId, _createRefresh).Value.WaitAsync(cancellationToken);
+    }
+
+    /// <inheritdoc />
+    public async Task StoreTokenAsync(string tenantId, AccessToken token, CancellationToken cancellationToken = default)
+    {
+        ValidateTenantId(tenantId);
+        ArgumentNullException.ThrowIfNull(token);
+
+        await _storage.StoreTokenAsync(GetStorageKey(tenantId), token, cancellationToken).ConfigureAwait(false);
+        _cache.Set(tenantId, token);
+        _logger.LogDebug("Access token stored for tenant {TenantId}", tenantId);
+    }
+
+    /// <inheritdoc />
+    public async Task ClearTokenAsync(string tenantId, CancellationToken cancellationToken = default)
+    {
+        ValidateTenantId(tenantId);
+
+        _cache.Remove(tenantId);
+        await _storage.DeleteTokenAsync(GetStorageKey(tenantId), cancellationToken).ConfigureAwait(false);
+        _logger.LogDebug("Access token cleared from storage for tenant {TenantId}", tenantId);
+    }
+
+    /// <inheritdoc />
+    public ITokenManager ForTenant(string tenantId)
+    {
+        ValidateTenantId(tenantId);
+        return new TenantScopedTokenManager(this, tenantId);
+    }
+
+    private async Task<AccessToken> RefreshAndCompleteAsync(string tenantId)
+    {
+        try
+        {
+            return await RefreshCoreAsync(tenantId).ConfigureAwait(false);
+        }
+        finally
+        {
+            // Later callers start a new refresh rather than reusing this result
+            _refreshes.TryRemove(tenantId, out _);
+        }
+    }
+
+    private async Task<AccessToken> RefreshCoreAsync(string tenantId)
+    {
+        using var activity = ProcoreTelemetry.StartTokenRefresh();
+        var startTimestamp = Stopwatch.GetTimestamp();
+        try
+        {
+            // Read from storage rather than the cache: another process may have rotated the refresh token
+            var currentToken = await _storage.GetTokenAsync(GetStorageKey(tenantId), CancellationToken.None).ConfigureAwait(false);
+
+            if (currentToken?.RefreshToken == null)
+            {
+                throw new InvalidOperationException($"No refresh token available for tenant {tenantId}");
+            }
+
+            _logger.LogDebug("Refreshing access token for tenant {TenantId} using refresh token", tenantId);
+
+            var newToken = await TokenEndpointClient.RefreshAsync(_httpClient, _options, currentToken, CancellationToken.None).ConfigureAwait(false);
+
+            await StoreTokenAsync(tenantId, newToken, CancellationToken.None).ConfigureAwait(false);
+
+            TokenRefreshed?.Invoke(this, new TenantTokenRefreshedEventArgs(tenantId, newToken, currentToken));
+
+            _logger.LogInformation("Access token refreshed successfully for tenant {TenantId}", tenantId);
+            ProcoreTelemetry.StopTokenRefresh(activity, startTimestamp, null);
+
+            return newToken;
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Failed to refresh access token for tenant {TenantId}", tenantId);
+            ProcoreTelemetry.StopTokenRefresh(activity, startTimestamp, ex);
+            throw;
+        }
+    }
+
+    private string GetStorageKey(string tenantId) => $"procore_token_{_options.ClientId}_{tenantId}";
+
+    private static void ValidateTenantId(string tenantId)
+    {
+        if (string.IsNullOrWhiteSpace(tenantId))
+        {
+            throw new ArgumentException("Tenant ID cannot be null or empty", nameof(tenantId));
+        }
+    }
+
+    /// <summary>
+    /// Exposes one tenant of the pool through the single-tenant token manager contract
+    /// </summary>
+    private sealed class TenantScopedTokenManager : ITokenManager
+    {
+        private readonly TenantTokenManager _pool;
+        private readonly string _tenantId;
+        private readonly object _handlersLock = new();
+        private EventHandler<TokenRefreshedEventArgs>? _handlers;
+
+        public TenantScopedTokenManager(TenantTokenManager pool, string tenantId)
+        {
+            _pool = pool;
+            _tenantId = tenantId;
+        }
+
+        // Subscribes to the pool only while someone is listening, so scoped managers don't leak
+        public event EventHandler<TokenRefreshedEventArgs>? TokenRefreshed
+        {
+            add
+            {
+                lock (_handlersLock)
+                {
+                    if (_handlers == null)
+                    {
+                        _pool.TokenRefreshed += OnPoolTokenRefreshed;
+                    }
+
+                    _handlers += value;
+                }
+            }
+            remove
+            {
+                lock (_handlersLock)
+                {
+                    _handlers -= value;
+
+                    if (_handlers == null)
+                    {
+                        _pool.TokenRefreshed -= OnPoolTokenRefreshed;
+                    }
+                }
+            }
+        }
+
+        public Task<AccessToken?> GetAccessTokenAsync(CancellationToken cancellationToken = default)
+            => _pool.GetAccessTokenAsync(_tenantId, cancellationToken);
+
+        public Task<AccessToken> RefreshTokenAsync(CancellationToken cancellationToken = default)
+            => _pool.RefreshTokenAsync(_tenantId, cancellationToken);
+
+        public Task StoreTokenAsync(AccessToken token, CancellationToken cancellationToken = default)
+            => _pool.StoreTokenAsync(_tenantId, token, cancellationToken);
+
+        public Task ClearTokenAsync(CancellationToken cancellationToken = default)
+            => _pool.ClearTokenAsync(_tenantId, cancellationToken);
+
+        private void OnPoolTokenRefreshed(object? sender, TenantTokenRefreshedEventArgs e)
+        {
+            if (string.Equals(e.TenantId, _tenantId, StringComparison.Ordinal))
+            {
+                _handlers?.Invoke(this, e);
+            }
+        }
+    }
+}
@@ -0,0 +1,148 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics.CodeAnalysis;
+using System.Numerics;
+
+namespace Procore.SDK.Shared.Authentication;
+
+/// <summary>
+/// Sharded least-recently-used cache of access tokens
+/// </summary>
+/// <remarks>
+/// Keys are spread over independently locked shards, each with its own capacity and recency list,
+/// so lookups are O(1) and callers for different tenants rarely contend for the same lock.
+/// </remarks>
+internal sealed class TokenCache
+{
+    private readonly Shard[] _shards;
+    private readonly int _shardMask;
+
+    public TokenCache(int capacity, int shardCount)
+    {
+        if (capacity < 1)
+            throw new ArgumentOutOfRangeException(nameof(capacity), "Capacity must be at least 1");
+        if (shardCount < 1)
+            throw new ArgumentOutOfRangeException(nameof(shardCount), "Shard count must be at least 1");
+
+        var shards = (int)BitOperations.RoundUpToPowerOf2((uint)Math.Min(shardCount, capacity));
+        var shardCapacity = Math.Max(1, (capacity + shards - 1) / shards);
+
+        _shards = new Shard[shards];
+        for (int i = 0; i < shards; i++)
+        {
+            _shards[i] = new Shard(shardCapacity);
+        }
+
+        _shardMask = shards - 1;
+    }
+
+    /// <summary>
+    /// Number of cached tokens across all shards
+    /// </summary>
+    public int Count
+    {
+        get
+        {
+            var count = 0;
+            foreach (var shard in _shards)
+            {
+                count += shard.Count;
+            }
+
+            return count;
+        }
+    }
+
+    public bool TryGet(string key, [MaybeNullWhen(false)] out AccessToken token) => GetShard(key).TryGet(key, out token);
+
+    public void Set(string key, AccessToken token) => GetShard(key).Set(key, token);
+
+    public bool Remove(string key) => GetShard(key).Remove(key);
+
+    private Shard GetShard(string key)
+    {
+        return _shards[StringComparer.Ordinal.GetHashCode(key) & _shardMask];
+    }
+
+    private sealed class Shard
+    {
+        private readonly int _capacity;
+        private readonly Dictionary<string, LinkedListNode<KeyValuePair<string, AccessToken>>> _entries = new(StringComparer.Ordinal);
+        private readonly LinkedList<KeyValuePair<string, AccessToken>> _recency = new();
+
+        public Shard(int capacity)
+        {
+            _capacity = capacity;
+        }
+
+        public int Count
+        {
+            get
+            {
+                lock (_entries)
+                {
+                    return _entries.Count;
+                }
+            }
+        }
+
+        public bool TryGet(string key, [MaybeNullWhen(false)] out AccessToken token)
+        {
+            lock (_entries)
+            {
+                if (!_entries.TryGetValue(key, out var node))
+                {
+                    token = null;
+                    return false;
+                }
+
+                // Most recently used entries live at the front of the list
+                if (node != _recency.First)
+                {
+                    _recency.Remove(node);
+                    _recency.AddFirst(node);
+                }
+
+                token = node.Value.Value;
+                return true;
+            }
+        }
+
+        public void Set(string key, AccessToken token)
+        {
+            lock (_entries)
+            {
+                if (_entries.TryGetValue(key, out var node))
+                {
+                    node.Value = new KeyValuePair<string, AccessToken>(key, token);
+                    _recency.Remove(node);
+                    _recency.AddFirst(node);
+                    return;
+                }
+
+                if (_entries.Count >= _capacity)
+                {
+                    var leastRecent = _recency.Last!;
+                    _recency.RemoveLast();
+                    _entries.Remove(leastRecent.Value.Key);
+                }
+
+                _entries[key] = _recency.AddFirst(new KeyValuePair<string, AccessToken>(key, token));
+            }
+        }
+
+        public bool Remove(string key)
+        {
+            lock (_entries)
+            {
+                if (!_entries.Remove(key, out var node))
+                {
+                    return false;
+                }
+
+                _recency.Remove(node);
+                return true;
+            }
+        }
+    }
+}
@@ -0,0 +1,67 @@
+using System;
+using System.Collections.Generic;
+using System.Net.Http;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using Procore.SDK.Shared.Serialization;
+
+namespace Procore.SDK.Shared.Authentication;
+
+/// <summary>
+/// Exchanges refresh tokens at the Procore OAuth token endpoint
+/// </summary>
+internal static class TokenEndpointClient
+{
+    /// <summary>
+    /// Requests a new access token using the refresh token of the current one
+    /// </summary>
+    /// <param name="httpClient">HTTP client for making token requests</param>
+    /// <param name="options">Procore authentication options</param>
+    /// <param name="currentToken">Token whose refresh token is exchanged</param>
+    /// <param name="cancellationToken">Token to cancel the operation</param>
+    /// <returns>The new access token, keeping the current refresh token if none is returned</returns>
+    /// <exception cref="InvalidOperationException">Thrown when the response is missing required fields</exception>
+    public static async Task<AccessToken> RefreshAsync(
+        HttpClient httpClient,
+        ProcoreAuthOptions options,
+        AccessToken currentToken,
+        CancellationToken cancellationToken)
+    {
+        var request = new HttpRequestMessage(HttpMethod.Post, options.TokenEndpoint)
+        {
+            Content = new FormUrlEncodedContent(new[]
+            {
+                new KeyValuePair<string, string>("grant_type", "refresh_token"),
+                new KeyValuePair<string, string>("refresh_token", currentToken.RefreshToken ?? string.Empty),
+                new KeyValuePair<string, string>("client_id", options.ClientId),
+                new KeyValuePair<string, string>("client_secret", options.ClientSecret),
+            })
+        };
+
+        var response = await httpClient.SendAsync(request, cancellationToken);
+        response.EnsureSuccessStatusCode();
+
+        var json = await response.Content.ReadAsStringAsync(cancellationToken);
+        var tokenResponse = JsonSerializer.Deserialize(json, SharedJsonContext.Default.TokenResponse)
+            ?? throw new InvalidOperationException("Failed to deserialize token response");
+
+        // Validate required fields
+        if (string.IsNullOrEmpty(tokenResponse.AccessToken))
+        {
+            throw new InvalidOperationException("Token response missing required 'access_token' field");
+        }
+
+        if (string.IsNullOrEmpty(tokenResponse.TokenType))
+        {
+            throw new InvalidOperationException("Token response missing required 'token_type' field");
+        }
+
+        return new AccessToken(
+            tokenResponse.AccessToken,
+            tokenResponse.TokenType,
+            DateTimeOffset.UtcNow.AddSeconds(tokenResponse.ExpiresIn),
+            tokenResponse.RefreshToken ?? currentToken.RefreshToken,
+            tokenResponse.Scope?.Split(' '));
+    }
+}
@@ -1,12 +1,11 @@
 using System;
-using System.Collections.Generic;
+using System.Diagnostics;
 using System.Net.Http;
-using System.Text.Json;
-using System.Text.Json.Serialization;
 using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using Microsoft.Extensions.Options;
+using Procore.SDK.Shared.Diagnostics;
 
 namespace Procore.SDK.Shared.Authentication;
 
@@ -94,6 +93,9 @@ public class TokenManager : ITokenManager
     public async Task<AccessToken> RefreshTokenAsync(CancellationToken cancellationToken = default)
     {
         await _refreshSemaphore.WaitAsync(cancellationToken);
+
+        using var activity = ProcoreTelemetry.StartTokenRefresh();
+        var startTimestamp = Stopwatch.GetTimestamp();
         try
         {
             var currentToken = await _storage.GetTokenAsync(_storageKey, cancellationToken);
@@ -105,53 +107,21 @@ public class TokenManager : ITokenManager
 
             _logger.LogDebug("Refreshing access token using refresh token");
 
-            var request = new HttpRequestMessage(HttpMethod.Post, _options.TokenEndpoint)
-            {
-                Content = new FormUrlEncodedContent(new[]
-                {
-                    new KeyValuePair<string, string>("grant_type", "refresh_token"),
-                    new KeyValuePair<string, string>("refresh_token", currentToken.RefreshToken),
-                    new KeyValuePair<string, string>("client_id", _options.ClientId),
-                    new KeyValuePair<string, string>("client_secret", _options.ClientSecret),
-                })
-            };
-
-            var response = await _httpClient.SendAsync(request, cancellationToken);
-            response.EnsureSuccessStatusCode();
-
-            var json = await response.Content.ReadAsStringAsync(cancellationToken);
-            var tokenResponse = JsonSerializer.Deserialize<TokenResponse>(json)
-                ?? throw new InvalidOperationException("Failed to deserialize token response");
-
-            // Validate required fields
-            if (string.IsNullOrEmpty(tokenResponse.AccessToken))
-            {
-                throw new InvalidOperationException("Token response missing required 'access_token' field");
-            }
-
-            if (string.IsNullOrEmpty(tokenResponse.TokenType))
-            {
-                throw new InvalidOperationException("Token response missing required 'token_type' field");
-            }
-
-            var newToken = new AccessToken(
-                tokenResponse.AccessToken,
-                tokenResponse.TokenType,
-                DateTimeOffset.UtcNow.AddSeconds(tokenResponse.ExpiresIn),
-                tokenResponse.RefreshToken ?? currentToken.RefreshToken,
-                tokenResponse.Scope?.Split(' '));
+            var newToken = await TokenEndpointClient.RefreshAsync(_httpClient, _options, currentToken, cancellationToken);
 
             await StoreTokenAsync(newToken, cancellationToken);
 
             TokenRefreshed?.Invoke(this, new TokenRefreshedEventArgs(newToken, currentToken));
 
             _logger.LogInformation("Access token refreshed successfully");
+            ProcoreTelemetry.StopTokenRefresh(activity, startTimestamp, null);
 
             return newToken;
         }
         catch (Exception ex)
         {
             _logger.LogError(ex, "Failed to refresh access token");
+            ProcoreTelemetry.StopTokenRefresh(activity, startTimestamp, ex);
             throw;
         }
         finally
@@ -175,14 +145,4 @@ public class TokenManager : ITokenManager
         await _storage.DeleteTokenAsync(_storageKey, cancellationToken);
         _logger.LogDebug("Access token cleared from storage");
     }
-
-    /// <summary>
-    /// Internal record for deserializing token responses
-    /// </summary>
-    private sealed record TokenResponse(
-        [property: JsonPropertyName("access_token")] string AccessToken,
-        [property: JsonPropertyName("token_type")] string TokenType,
-        [property: JsonPropertyName("expires_in")] int ExpiresIn,
-        [property: JsonPropertyName("refresh_token")] string? RefreshToken,
-        [property: JsonPropertyName("scope")] string? Scope);
 }
\ No newline at end of file
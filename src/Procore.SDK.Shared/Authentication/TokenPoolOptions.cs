@@ -0,0 +1,23 @@
+namespace Procore.SDK.Shared.Authentication;
+
+/// <summary>
+/// Configuration options for the multi-tenant token pool
+/// </summary>
+public class TokenPoolOptions
+{
+    /// <summary>
+    /// Configuration section name in appsettings.json
+    /// </summary>
+    public const string SectionName = "Procore:TokenPool";
+
+    /// <summary>
+    /// Maximum number of tenant tokens kept in memory; least recently used tokens are evicted
+    /// and reloaded from storage on next use (default: 10000)
+    /// </summary>
+    public int Capacity { get; set; } = 10_000;
+
+    /// <summary>
+    /// Number of independently locked cache shards, rounded up to a power of two (default: 32)
+    /// </summary>
+    public int ShardCount { get; set; } = 32;
+}
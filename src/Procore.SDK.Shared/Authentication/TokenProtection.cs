@@ -0,0 +1,62 @@
+using System;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace Procore.SDK.Shared.Authentication;
+
+/// <summary>
+/// Encryption shared by the file-based token stores
+/// Uses DPAPI on Windows and XOR obfuscation with the entropy elsewhere
+/// </summary>
+internal static class TokenProtection
+{
+    /// <summary>
+    /// Derives entropy that ties encrypted data to a storage location and machine
+    /// </summary>
+    /// <param name="location">File or directory path of the store</param>
+    public static byte[] CreateEntropy(string location)
+    {
+        return SHA256.HashData(Encoding.UTF8.GetBytes(location + Environment.MachineName));
+    }
+
+    /// <summary>
+    /// Encrypts data for storage
+    /// </summary>
+    public static byte[] Protect(byte[] data, byte[] entropy)
+    {
+        if (OperatingSystem.IsWindows())
+        {
+            // Use DPAPI on Windows for additional security
+            return ProtectedData.Protect(data, entropy, DataProtectionScope.CurrentUser);
+        }
+
+        // On non-Windows platforms, use basic XOR encryption with entropy
+        // This is not strong encryption but provides basic obfuscation
+        return Xor(data, entropy);
+    }
+
+    /// <summary>
+    /// Decrypts data read from storage
+    /// </summary>
+    /// <exception cref="CryptographicException">Thrown when the data cannot be decrypted</exception>
+    public static byte[] Unprotect(byte[] data, byte[] entropy)
+    {
+        if (OperatingSystem.IsWindows())
+        {
+            return ProtectedData.Unprotect(data, entropy, DataProtectionScope.CurrentUser);
+        }
+
+        return Xor(data, entropy);
+    }
+
+    private static byte[] Xor(byte[] data, byte[] entropy)
+    {
+        var result = new byte[data.Length];
+        for (int i = 0; i < data.Length; i++)
+        {
+            result[i] = (byte)(data[i] ^ entropy[i % entropy.Length]);
+        }
+
+        return result;
+    }
+}
@@ -0,0 +1,13 @@
+using System.Text.Json.Serialization;
+
+namespace Procore.SDK.Shared.Authentication;
+
+/// <summary>
+/// Body returned by the Procore OAuth token endpoint
+/// </summary>
+internal sealed record TokenResponse(
+    [property: JsonPropertyName("access_token")] string AccessToken,
+    [property: JsonPropertyName("token_type")] string TokenType,
+    [property: JsonPropertyName("expires_in")] int ExpiresIn,
+    [property: JsonPropertyName("refresh_token")] string? RefreshToken,
+    [property: JsonPropertyName("scope")] string? Scope);
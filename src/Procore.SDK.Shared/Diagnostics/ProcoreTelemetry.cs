@@ -0,0 +1,338 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+
+namespace Procore.SDK.Shared.Diagnostics;
+
+/// <summary>
+/// Tracing and metrics for the Procore SDK, published through <see cref="System.Diagnostics.ActivitySource"/>
+/// and <see cref="System.Diagnostics.Metrics.Meter"/> so that OpenTelemetry or any other listener can collect them
+/// </summary>
+/// <remarks>
+/// Subscribe with <c>AddSource(ProcoreTelemetry.ActivitySourceName)</c> and <c>AddMeter(ProcoreTelemetry.MeterName)</c>.
+/// Operation and route tags are templated (identifiers replaced by <c>{id}</c>) so cardinality stays bounded.
+/// Nothing is recorded while no listener is attached.
+/// </remarks>
+public static class ProcoreTelemetry
+{
+    /// <summary>
+    /// Name of the activity source for SDK spans
+    /// </summary>
+    public const string ActivitySourceName = "Procore.SDK";
+
+    /// <summary>
+    /// Name of the meter for SDK instruments
+    /// </summary>
+    public const string MeterName = "Procore.SDK";
+
+    /// <summary>
+    /// Tag holding the templated wrapper operation name
+    /// </summary>
+    public const string OperationTag = "procore.operation";
+
+    /// <summary>
+    /// Tag holding the templated request route
+    /// </summary>
+    public const string RouteTag = "http.route";
+
+    /// <summary>
+    /// Tag holding the HTTP request method
+    /// </summary>
+    public const string MethodTag = "http.request.method";
+
+    /// <summary>
+    /// Tag holding the HTTP response status code
+    /// </summary>
+    public const string StatusCodeTag = "http.response.status_code";
+
+    /// <summary>
+    /// Tag holding the exception type of a failed operation
+    /// </summary>
+    public const string ErrorTypeTag = "error.type";
+
+    /// <summary>
+    /// Tag holding the one-based attempt number of an HTTP request
+    /// </summary>
+    public const string AttemptTag = "procore.http.attempt";
+
+    /// <summary>
+    /// Tag holding the circuit breaker key
+    /// </summary>
+    public const string CircuitTag = "procore.circuit_breaker.key";
+
+    /// <summary>
+    /// Tag holding the circuit breaker state after a transition
+    /// </summary>
+    public const string CircuitStateTag = "procore.circuit_breaker.state";
+
+    private const string IdPlaceholder = "{id}";
+
+    private static readonly string? Version = typeof(ProcoreTelemetry).Assembly.GetName().Version?.ToString();
+
+    /// <summary>
+    /// Activity source for SDK spans
+    /// </summary>
+    public static ActivitySource ActivitySource { get; } = new(ActivitySourceName, Version);
+
+    /// <summary>
+    /// Meter for SDK instruments
+    /// </summary>
+    public static Meter Meter { get; } = new(MeterName, Version);
+
+    private static readonly Histogram<double> OperationDuration = Meter.CreateHistogram<double>(
+        "procore.client.operation.duration", "ms", "Duration of wrapper client operations");
+
+    private static readonly Histogram<double> HttpAttemptDuration = Meter.CreateHistogram<double>(
+        "procore.http.client.attempt.duration", "ms", "Duration of individual HTTP attempts");
+
+    private static readonly Counter<long> HttpRetries = Meter.CreateCounter<long>(
+        "procore.http.client.retries", "{retry}", "HTTP attempts retried by the resilience policies");
+
+    private static readonly Counter<long> CircuitBreakerTransitions = Meter.CreateCounter<long>(
+        "procore.circuit_breaker.transitions", "{transition}", "Circuit breaker state changes");
+
+    private static readonly Histogram<double> TokenRefreshDuration = Meter.CreateHistogram<double>(
+        "procore.auth.token_refresh.duration", "ms", "Duration of OAuth token refreshes");
+
+    /// <summary>
+    /// Starts the span of a wrapper client operation
+    /// </summary>
+    /// <param name="operationName">Operation name; identifiers in it are templated</param>
+    /// <returns>The started activity, or null when nobody is listening</returns>
+    public static Activity? StartOperation(string operationName)
+    {
+        if (!ActivitySource.HasListeners())
+        {
+            return null;
+        }
+
+        var operation = NormalizeOperationName(operationName);
+        var activity = ActivitySource.StartActivity(operation, ActivityKind.Internal);
+        activity?.SetTag(OperationTag, operation);
+        return activity;
+    }
+
+    /// <summary>
+    /// Completes a wrapper client operation started with <see cref="StartOperation"/>
+    /// </summary>
+    /// <param name="activity">The operation span, if any</param>
+    /// <param name="operationName">Operation name passed to <see cref="StartOperation"/></param>
+    /// <param name="startTimestamp">Value of <see cref="Stopwatch.GetTimestamp"/> when the operation started</param>
+    /// <param name="exception">The exception the operation failed with, or null on success</param>
+    public static void StopOperation(Activity? activity, string operationName, long startTimestamp, Exception? exception)
+    {
+        SetOutcome(activity, exception);
+
+        if (!OperationDuration.Enabled)
+        {
+            return;
+        }
+
+        var tags = new TagList { { OperationTag, NormalizeOperationName(operationName) } };
+        if (exception != null)
+        {
+            tags.Add(ErrorTypeTag, exception.GetType().Name);
+        }
+
+        OperationDuration.Record(GetElapsedMilliseconds(startTimestamp), tags);
+    }
+
+    /// <summary>
+    /// Starts the span of a single HTTP attempt
+    /// </summary>
+    /// <param name="route">Templated route of the request</param>
+    /// <param name="method">HTTP method of the request</param>
+    /// <param name="attempt">One-based attempt number</param>
+    /// <returns>The started activity, or null when nobody is listening</returns>
+    public static Activity? StartHttpAttempt(string route, string method, int attempt)
+    {
+        if (!ActivitySource.HasListeners())
+        {
+            return null;
+        }
+
+        var activity = ActivitySource.StartActivity(route, ActivityKind.Client);
+        if (activity != null)
+        {
+            activity.SetTag(RouteTag, route);
+            activity.SetTag(MethodTag, method);
+            activity.SetTag(AttemptTag, attempt);
+        }
+
+        return activity;
+    }
+
+    /// <summary>
+    /// Completes an HTTP attempt started with <see cref="StartHttpAttempt"/>
+    /// </summary>
+    /// <param name="activity">The attempt span, if any</param>
+    /// <param name="route">Templated route of the request</param>
+    /// <param name="method">HTTP method of the request</param>
+    /// <param name="startTimestamp">Value of <see cref="Stopwatch.GetTimestamp"/> when the attempt started</param>
+    /// <param name="statusCode">Response status code, or null when no response was received</param>
+    /// <param name="exception">The exception the attempt failed with, or null when a response was received</param>
+    public static void StopHttpAttempt(
+        Activity? activity,
+        string route,
+        string method,
+        long startTimestamp,
+        int? statusCode,
+        Exception? exception)
+    {
+        if (activity != null && statusCode.HasValue)
+        {
+            activity.SetTag(StatusCodeTag, statusCode.Value);
+            if (statusCode.Value >= 500)
+            {
+                activity.SetStatus(ActivityStatusCode.Error);
+            }
+        }
+
+        SetOutcome(activity, exception);
+
+        if (!HttpAttemptDuration.Enabled)
+        {
+            return;
+        }
+
+        var tags = new TagList { { RouteTag, route }, { MethodTag, method } };
+        if (statusCode.HasValue)
+        {
+            tags.Add(StatusCodeTag, statusCode.Value);
+        }
+
+        if (exception != null)
+        {
+            tags.Add(ErrorTypeTag, exception.GetType().Name);
+        }
+
+        HttpAttemptDuration.Record(GetElapsedMilliseconds(startTimestamp), tags);
+    }
+
+    /// <summary>
+    /// Records that an HTTP attempt is about to be retried
+    /// </summary>
+    /// <param name="route">Templated route of the request</param>
+    /// <param name="retryCount">One-based retry number</param>
+    /// <param name="delay">Delay before the retry</param>
+    public static void RecordRetry(string route, int retryCount, TimeSpan delay)
+    {
+        HttpRetries.Add(1, new KeyValuePair<string, object?>(RouteTag, route));
+
+        Activity.Current?.AddEvent(new ActivityEvent("retry", tags: new ActivityTagsCollection
+        {
+            { AttemptTag, retryCount + 1 },
+            { "procore.retry.delay_ms", delay.TotalMilliseconds }
+        }));
+    }
+
+    /// <summary>
+    /// Records a circuit breaker state change
+    /// </summary>
+    /// <param name="circuit">Circuit breaker key (a host or route template)</param>
+    /// <param name="state">The new state, e.g. <c>open</c>, <c>half_open</c> or <c>closed</c></param>
+    public static void RecordCircuitBreakerTransition(string circuit, string state)
+    {
+        CircuitBreakerTransitions.Add(1,
+            new KeyValuePair<string, object?>(CircuitTag, NormalizeOperationName(circuit)),
+            new KeyValuePair<string, object?>(CircuitStateTag, state));
+
+        Activity.Current?.AddEvent(new ActivityEvent("circuit_breaker." + state));
+    }
+
+    /// <summary>
+    /// Starts the span of an OAuth token refresh
+    /// </summary>
+    /// <returns>The started activity, or null when nobody is listening</returns>
+    public static Activity? StartTokenRefresh() =>
+        ActivitySource.HasListeners() ? ActivitySource.StartActivity("procore.auth.refresh_token", ActivityKind.Client) : null;
+
+    /// <summary>
+    /// Completes a token refresh started with <see cref="StartTokenRefresh"/>
+    /// </summary>
+    /// <param name="activity">The refresh span, if any</param>
+    /// <param name="startTimestamp">Value of <see cref="Stopwatch.GetTimestamp"/> when the refresh started</param>
+    /// <param name="exception">The exception the refresh failed with, or null on success</param>
+    public static void StopTokenRefresh(Activity? activity, long startTimestamp, Exception? exception)
+    {
+        SetOutcome(activity, exception);
+
+        if (!TokenRefreshDuration.Enabled)
+        {
+            return;
+        }
+
+        var tags = new TagList();
+        if (exception != null)
+        {
+            tags.Add(ErrorTypeTag, exception.GetType().Name);
+        }
+
+        TokenRefreshDuration.Record(GetElapsedMilliseconds(startTimestamp), tags);
+    }
+
+    /// <summary>
+    /// Replaces numeric identifiers in an operation name with <c>{id}</c>, e.g.
+    /// <c>GetProductivityReport-7-Project-3</c> becomes <c>GetProductivityReport-{id}-Project-{id}</c>.
+    /// Digits that are part of a word or version number (<c>v1.0</c>) are kept
+    /// </summary>
+    /// <param name="operationName">The operation name</param>
+    /// <returns>The templated name; the same instance when nothing was replaced</returns>
+    public static string NormalizeOperationName(string operationName)
+    {
+        ArgumentNullException.ThrowIfNull(operationName);
+
+        if (operationName.AsSpan().IndexOfAny("0123456789") < 0)
+        {
+            return operationName;
+        }
+
+        var builder = new System.Text.StringBuilder(operationName.Length + 8);
+        var i = 0;
+        while (i < operationName.Length)
+        {
+            if (!char.IsDigit(operationName[i]))
+            {
+                builder.Append(operationName[i++]);
+                continue;
+            }
+
+            var start = i;
+            while (i < operationName.Length && char.IsDigit(operationName[i]))
+            {
+                i++;
+            }
+
+            var partOfWord = (start > 0 && IsWordCharacter(operationName[start - 1]))
+                || (i < operationName.Length && IsWordCharacter(operationName[i]));
+
+            if (partOfWord)
+            {
+                builder.Append(operationName, start, i - start);
+            }
+            else
+            {
+                builder.Append(IdPlaceholder);
+            }
+        }
+
+        return builder.ToString();
+    }
+
+    private static bool IsWordCharacter(char c) => char.IsLetter(c) || c == '.' || c == '_';
+
+    private static void SetOutcome(Activity? activity, Exception? exception)
+    {
+        if (activity == null || exception == null)
+        {
+            return;
+        }
+
+        activity.SetStatus(ActivityStatusCode.Error, exception.Message);
+        activity.SetTag(ErrorTypeTag, exception.GetType().Name);
+    }
+
+    private static double GetElapsedMilliseconds(long startTimestamp) =>
+        (Stopwatch.GetTimestamp() - startTimestamp) * 1000.0 / Stopwatch.Frequency;
+}
@@ -0,0 +1,163 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Text.Json.Serialization;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// A cached HTTP response together with its freshness and validator information
+/// </summary>
+public sealed class CachedResponse
+{
+    /// <summary>
+    /// HTTP status code of the cached response
+    /// </summary>
+    public int StatusCode { get; init; }
+
+    /// <summary>
+    /// Response headers
+    /// </summary>
+    public Dictionary<string, string[]> Headers { get; init; } = new(StringComparer.OrdinalIgnoreCase);
+
+    /// <summary>
+    /// Content headers
+    /// </summary>
+    public Dictionary<string, string[]> ContentHeaders { get; init; } = new(StringComparer.OrdinalIgnoreCase);
+
+    /// <summary>
+    /// Response body
+    /// </summary>
+    public byte[] Content { get; init; } = Array.Empty<byte>();
+
+    /// <summary>
+    /// Entity tag used for If-None-Match revalidation
+    /// </summary>
+    public string? ETag { get; init; }
+
+    /// <summary>
+    /// Last-Modified value used for If-Modified-Since revalidation
+    /// </summary>
+    public DateTimeOffset? LastModified { get; init; }
+
+    /// <summary>
+    /// When the entry stops being served without revalidation
+    /// </summary>
+    public DateTimeOffset ExpiresAt { get; init; }
+
+    /// <summary>
+    /// Approximate number of bytes the entry occupies in memory
+    /// </summary>
+    [JsonIgnore]
+    public long Size => Content.Length
+        + Headers.Sum(h => h.Key.Length + h.Value.Sum(v => v.Length))
+        + ContentHeaders.Sum(h => h.Key.Length + h.Value.Sum(v => v.Length));
+
+    /// <summary>
+    /// Whether the entry is still fresh at the given time
+    /// </summary>
+    /// <param name="now">The current time</param>
+    public bool IsFresh(DateTimeOffset now) => ExpiresAt > now;
+
+    /// <summary>
+    /// Whether the entry carries a validator and can be revalidated with a conditional request
+    /// </summary>
+    [JsonIgnore]
+    public bool CanRevalidate => ETag != null || LastModified.HasValue;
+
+    /// <summary>
+    /// Reads a response into a cache entry
+    /// </summary>
+    /// <param name="response">The response to cache; its content is buffered and remains readable</param>
+    /// <param name="expiresAt">When the entry becomes stale</param>
+    /// <param name="cancellationToken">Token to cancel the read</param>
+    /// <returns>The cache entry</returns>
+    public static async Task<CachedResponse> CreateAsync(
+        HttpResponseMessage response,
+        DateTimeOffset expiresAt,
+        CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(response);
+
+        var content = Array.Empty<byte>();
+        var contentHeaders = new Dictionary<string, string[]>(StringComparer.OrdinalIgnoreCase);
+        if (response.Content != null)
+        {
+            content = await response.Content.ReadAsByteArrayAsync(cancellationToken).ConfigureAwait(false);
+            foreach (var header in response.Content.Headers)
+            {
+                contentHeaders[header.Key] = header.Value.ToArray();
+            }
+        }
+
+        var headers = new Dictionary<string, string[]>(StringComparer.OrdinalIgnoreCase);
+        foreach (var header in response.Headers)
+        {
+            headers[header.Key] = header.Value.ToArray();
+        }
+
+        return new CachedResponse
+        {
+            StatusCode = (int)response.StatusCode,
+            Headers = headers,
+            ContentHeaders = contentHeaders,
+            Content = content,
+            ETag = response.Headers.ETag?.ToString(),
+            LastModified = response.Content?.Headers.LastModified,
+            ExpiresAt = expiresAt
+        };
+    }
+
+    /// <summary>
+    /// Creates a copy of the entry with a new expiry, e.g. after a 304 revalidation
+    /// </summary>
+    /// <remarks>
+    /// Entries handed out by a store may be read concurrently, so they are never modified in place.
+    /// The copy shares the body and header collections, which are not modified after creation.
+    /// </remarks>
+    /// <param name="expiresAt">When the copy becomes stale</param>
+    /// <returns>A new cache entry</returns>
+    public CachedResponse WithExpiresAt(DateTimeOffset expiresAt)
+    {
+        return new CachedResponse
+        {
+            StatusCode = StatusCode,
+            Headers = Headers,
+            ContentHeaders = ContentHeaders,
+            Content = Content,
+            ETag = ETag,
+            LastModified = LastModified,
+            ExpiresAt = expiresAt
+        };
+    }
+
+    /// <summary>
+    /// Creates a response message for a caller from the cached entry
+    /// </summary>
+    /// <param name="request">The caller's request</param>
+    /// <returns>A new response message</returns>
+    public HttpResponseMessage ToResponseMessage(HttpRequestMessage request)
+    {
+        var response = new HttpResponseMessage((HttpStatusCode)StatusCode)
+        {
+            RequestMessage = request,
+            Content = new ByteArrayContent(Content)
+        };
+
+        foreach (var header in Headers)
+        {
+            response.Headers.TryAddWithoutValidation(header.Key, header.Value);
+        }
+
+        foreach (var header in ContentHeaders)
+        {
+            response.Content.Headers.TryAddWithoutValidation(header.Key, header.Value);
+        }
+
+        return response;
+    }
+}
@@ -0,0 +1,343 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using Procore.SDK.Shared.Serialization;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// File-based response cache store that keeps one file per entry so the cache survives restarts,
+/// bounded by size and evicting the least recently used entries first
+/// Entries are written unencrypted; point it at a directory only the application can read
+/// </summary>
+/// <remarks>
+/// Each entry file has a small sidecar holding its key, so the in-memory key index can be rebuilt
+/// on startup without reading response bodies. An entry is only served while it is in the index,
+/// so a file that could not be deleted (e.g. because it is locked) is never served after invalidation.
+/// </remarks>
+public sealed class FileResponseCacheStore : IResponseCacheStore, IDisposable
+{
+    /// <summary>
+    /// Default upper bound on the bytes kept on disk (256 MB)
+    /// </summary>
+    public const long DefaultMaxBytes = 256L * 1024 * 1024;
+
+    private const string EntryExtension = ".json";
+    private const string KeyExtension = ".key";
+
+    private readonly string _directory;
+    private readonly long _maxBytes;
+    private readonly SemaphoreSlim _indexLock = new(1, 1);
+    private readonly object _sync = new();
+    private Dictionary<string, IndexEntry>? _index;
+    private long _currentBytes;
+
+    /// <summary>
+    /// Creates a new FileResponseCacheStore bounded by <see cref="DefaultMaxBytes"/>
+    /// </summary>
+    /// <param name="directory">Directory in which cache entries are stored</param>
+    public FileResponseCacheStore(string directory)
+        : this(directory, DefaultMaxBytes)
+    {
+    }
+
+    /// <summary>
+    /// Creates a new FileResponseCacheStore
+    /// </summary>
+    /// <param name="directory">Directory in which cache entries are stored</param>
+    /// <param name="maxBytes">Maximum number of bytes to keep on disk</param>
+    public FileResponseCacheStore(string directory, long maxBytes)
+    {
+        if (string.IsNullOrWhiteSpace(directory))
+            throw new ArgumentException("Value cannot be null or whitespace.", nameof(directory));
+        if (maxBytes <= 0)
+            throw new ArgumentOutOfRangeException(nameof(maxBytes), "Value must be positive.");
+
+        _directory = directory;
+        _maxBytes = maxBytes;
+    }
+
+    /// <summary>
+    /// Number of bytes currently cached on disk
+    /// </summary>
+    public long CurrentBytes => Interlocked.Read(ref _currentBytes);
+
+    /// <inheritdoc />
+    public async Task<CachedResponse?> GetAsync(string key, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(key);
+
+        var index = await GetIndexAsync(cancellationToken).ConfigureAwait(false);
+        string path;
+        lock (_sync)
+        {
+            if (!index.TryGetValue(key, out var indexEntry))
+            {
+                return null;
+            }
+
+            indexEntry.LastAccess = DateTime.UtcNow.Ticks;
+            path = indexEntry.Path;
+        }
+
+        try
+        {
+            await using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete, 4096, useAsync: true);
+            var entry = await JsonSerializer.DeserializeAsync(stream, SharedJsonContext.Default.FileEntry, cancellationToken).ConfigureAwait(false);
+            return entry?.Key == key ? entry.Response : null;
+        }
+        catch (JsonException)
+        {
+            // File is corrupted, treat as a miss
+            return null;
+        }
+        catch (IOException)
+        {
+            // Entry was replaced or removed concurrently
+            return null;
+        }
+    }
+
+    /// <inheritdoc />
+    public async Task SetAsync(string key, CachedResponse response, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(key);
+        ArgumentNullException.ThrowIfNull(response);
+
+        var index = await GetIndexAsync(cancellationToken).ConfigureAwait(false);
+        Directory.CreateDirectory(_directory);
+
+        var path = GetPath(key);
+        var tempPath = path + "." + Guid.NewGuid().ToString("N") + ".tmp";
+
+        await using (var stream = new FileStream(tempPath, FileMode.CreateNew, FileAccess.Write, FileShare.None, 4096, useAsync: true))
+        {
+            await JsonSerializer.SerializeAsync(stream, new FileEntry { Key = key, Response = response }, SharedJsonContext.Default.FileEntry, cancellationToken).ConfigureAwait(false);
+        }
+
+        var size = new FileInfo(tempPath).Length;
+
+        // Entries that could never fit are not cached at all
+        if (size > _maxBytes)
+        {
+            TryDelete(tempPath);
+            Remove(index, new[] { key });
+            return;
+        }
+
+        // The sidecar goes first so an entry file on disk always has its key; a sidecar without an entry is dropped on load
+        await File.WriteAllTextAsync(Path.ChangeExtension(path, KeyExtension), key, Encoding.UTF8, cancellationToken).ConfigureAwait(false);
+
+        // Replace atomically so readers never observe a partially written entry
+        File.Move(tempPath, path, overwrite: true);
+
+        List<IndexEntry> evicted;
+        lock (_sync)
+        {
+            if (index.TryGetValue(key, out var previous))
+            {
+                _currentBytes -= previous.Size;
+            }
+
+            index[key] = new IndexEntry(key, path, size) { LastAccess = DateTime.UtcNow.Ticks };
+            _currentBytes += size;
+            evicted = EvictOverCapacity(index);
+        }
+
+        DeleteFiles(evicted);
+    }
+
+    /// <inheritdoc />
+    public async Task RemoveByPrefixAsync(string keyPrefix, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(keyPrefix);
+
+        var index = await GetIndexAsync(cancellationToken).ConfigureAwait(false);
+        List<string> keys;
+        lock (_sync)
+        {
+            keys = index.Keys.Where(k => k.StartsWith(keyPrefix, StringComparison.Ordinal)).ToList();
+        }
+
+        Remove(index, keys);
+    }
+
+    private void Remove(Dictionary<string, IndexEntry> index, IEnumerable<string> keys)
+    {
+        var removed = new List<IndexEntry>();
+        lock (_sync)
+        {
+            foreach (var key in keys)
+            {
+                if (index.Remove(key, out var entry))
+                {
+                    _currentBytes -= entry.Size;
+                    removed.Add(entry);
+                }
+            }
+        }
+
+        DeleteFiles(removed);
+    }
+
+    /// <summary>
+    /// Removes least recently used entries from the index until it fits; caller holds _sync
+    /// </summary>
+    private List<IndexEntry> EvictOverCapacity(Dictionary<string, IndexEntry> index)
+    {
+        var evicted = new List<IndexEntry>();
+        if (_currentBytes <= _maxBytes)
+        {
+            return evicted;
+        }
+
+        foreach (var entry in index.Values.OrderBy(e => e.LastAccess).ToList())
+        {
+            if (_currentBytes <= _maxBytes)
+            {
+                break;
+            }
+
+            index.Remove(entry.Key);
+            _currentBytes -= entry.Size;
+            evicted.Add(entry);
+        }
+
+        return evicted;
+    }
+
+    /// <summary>
+    /// Loads the key index from the sidecar files on first use
+    /// </summary>
+    private async Task<Dictionary<string, IndexEntry>> GetIndexAsync(CancellationToken cancellationToken)
+    {
+        if (_index != null)
+        {
+            return _index;
+        }
+
+        await _indexLock.WaitAsync(cancellationToken).ConfigureAwait(false);
+        try
+        {
+            if (_index != null)
+            {
+                return _index;
+            }
+
+            var index = new Dictionary<string, IndexEntry>(StringComparer.Ordinal);
+            long currentBytes = 0;
+            if (Directory.Exists(_directory))
+            {
+                foreach (var keyPath in Directory.EnumerateFiles(_directory, "*" + KeyExtension))
+                {
+                    var path = Path.ChangeExtension(keyPath, EntryExtension);
+                    try
+                    {
+                        var entryFile = new FileInfo(path);
+                        if (!entryFile.Exists)
+                        {
+                            TryDelete(keyPath);
+                            continue;
+                        }
+
+                        var key = await File.ReadAllTextAsync(keyPath, Encoding.UTF8, cancellationToken).ConfigureAwait(false);
+                        index[key] = new IndexEntry(key, path, entryFile.Length) { LastAccess = entryFile.LastWriteTimeUtc.Ticks };
+                        currentBytes += entryFile.Length;
+                    }
+                    catch (IOException)
+                    {
+                        // Skip unreadable entries
+                    }
+                }
+
+                // Entry files without a sidecar were left by a crash mid-write or by an earlier version
+                foreach (var path in Directory.EnumerateFiles(_directory, "*" + EntryExtension))
+                {
+                    if (!File.Exists(Path.ChangeExtension(path, KeyExtension)))
+                    {
+                        TryDelete(path);
+                    }
+                }
+            }
+
+            List<IndexEntry> evicted;
+            lock (_sync)
+            {
+                _currentBytes = currentBytes;
+                evicted = EvictOverCapacity(index);
+            }
+
+            DeleteFiles(evicted);
+
+            _index = index;
+            return index;
+        }
+        finally
+        {
+            _indexLock.Release();
+        }
+    }
+
+    private string GetPath(string key)
+    {
+        var hash = Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(key)));
+        return Path.Combine(_directory, hash + EntryExtension);
+    }
+
+    private static void DeleteFiles(IEnumerable<IndexEntry> entries)
+    {
+        foreach (var entry in entries)
+        {
+            TryDelete(entry.Path);
+            TryDelete(Path.ChangeExtension(entry.Path, KeyExtension));
+        }
+    }
+
+    private static void TryDelete(string path)
+    {
+        try
+        {
+            File.Delete(path);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            // Locked by another reader; the entry is already out of the index, so it is no longer served
+        }
+    }
+
+    /// <inheritdoc />
+    public void Dispose()
+    {
+        _indexLock.Dispose();
+    }
+
+    /// <summary>
+    /// Internal class for serializing cache entries
+    /// </summary>
+    internal sealed class FileEntry
+    {
+        public string Key { get; set; } = string.Empty;
+        public CachedResponse Response { get; set; } = new();
+    }
+
+    private sealed class IndexEntry
+    {
+        public IndexEntry(string key, string path, long size)
+        {
+            Key = key;
+            Path = path;
+            Size = size;
+        }
+
+        public string Key { get; }
+        public string Path { get; }
+        public long Size { get; }
+        public long LastAccess { get; set; }
+    }
+}
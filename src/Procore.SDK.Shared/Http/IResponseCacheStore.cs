@@ -0,0 +1,33 @@
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// Backing store for cached HTTP responses
+/// </summary>
+public interface IResponseCacheStore
+{
+    /// <summary>
+    /// Gets a cached response by key, including stale entries that may still be revalidated
+    /// </summary>
+    /// <param name="key">The cache key</param>
+    /// <param name="cancellationToken">Token to cancel the operation</param>
+    /// <returns>The cached response or null if not found</returns>
+    Task<CachedResponse?> GetAsync(string key, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Stores a response under the given key
+    /// </summary>
+    /// <param name="key">The cache key</param>
+    /// <param name="response">The response to store</param>
+    /// <param name="cancellationToken">Token to cancel the operation</param>
+    Task SetAsync(string key, CachedResponse response, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Removes every entry whose key starts with the given prefix
+    /// </summary>
+    /// <param name="keyPrefix">The key prefix</param>
+    /// <param name="cancellationToken">Token to cancel the operation</param>
+    Task RemoveByPrefixAsync(string keyPrefix, CancellationToken cancellationToken = default);
+}
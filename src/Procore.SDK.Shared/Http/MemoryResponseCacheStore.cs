@@ -0,0 +1,134 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Options;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// In-memory response cache store bounded by size, evicting the least recently used entries first
+/// Thread-safe but entries are lost when the application restarts
+/// </summary>
+public sealed class MemoryResponseCacheStore : IResponseCacheStore
+{
+    private readonly long _maxBytes;
+    private readonly object _sync = new();
+    private readonly Dictionary<string, LinkedListNode<(string Key, CachedResponse Value, long Size)>> _entries = new(StringComparer.Ordinal);
+    private readonly LinkedList<(string Key, CachedResponse Value, long Size)> _lru = new();
+    private long _currentBytes;
+
+    /// <summary>
+    /// Creates a new MemoryResponseCacheStore using the configured memory bound
+    /// </summary>
+    /// <param name="options">Response cache options</param>
+    public MemoryResponseCacheStore(IOptions<ResponseCacheOptions> options)
+        : this((options ?? throw new ArgumentNullException(nameof(options))).Value.MaxMemoryBytes)
+    {
+    }
+
+    /// <summary>
+    /// Creates a new MemoryResponseCacheStore
+    /// </summary>
+    /// <param name="maxBytes">Maximum number of bytes to hold</param>
+    public MemoryResponseCacheStore(long maxBytes)
+    {
+        if (maxBytes <= 0)
+            throw new ArgumentOutOfRangeException(nameof(maxBytes), "Value must be positive.");
+
+        _maxBytes = maxBytes;
+    }
+
+    /// <summary>
+    /// Number of entries currently cached
+    /// </summary>
+    public int Count
+    {
+        get
+        {
+            lock (_sync)
+            {
+                return _entries.Count;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Number of bytes currently cached
+    /// </summary>
+    public long CurrentBytes => Interlocked.Read(ref _currentBytes);
+
+    /// <inheritdoc />
+    public Task<CachedResponse?> GetAsync(string key, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(key);
+
+        lock (_sync)
+        {
+            if (!_entries.TryGetValue(key, out var node))
+            {
+                return Task.FromResult<CachedResponse?>(null);
+            }
+
+            _lru.Remove(node);
+            _lru.AddFirst(node);
+            return Task.FromResult<CachedResponse?>(node.Value.Value);
+        }
+    }
+
+    /// <inheritdoc />
+    public Task SetAsync(string key, CachedResponse response, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(key);
+        ArgumentNullException.ThrowIfNull(response);
+
+        var size = response.Size + key.Length;
+        lock (_sync)
+        {
+            RemoveNode(key);
+
+            // Entries that could never fit are not cached at all
+            if (size > _maxBytes)
+            {
+                return Task.CompletedTask;
+            }
+
+            var node = _lru.AddFirst((key, response, size));
+            _entries[key] = node;
+            Interlocked.Add(ref _currentBytes, size);
+
+            while (_currentBytes > _maxBytes && _lru.Last != null)
+            {
+                RemoveNode(_lru.Last.Value.Key);
+            }
+        }
+
+        return Task.CompletedTask;
+    }
+
+    /// <inheritdoc />
+    public Task RemoveByPrefixAsync(string keyPrefix, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(keyPrefix);
+
+        lock (_sync)
+        {
+            foreach (var key in _entries.Keys.Where(k => k.StartsWith(keyPrefix, StringComparison.Ordinal)).ToList())
+            {
+                RemoveNode(key);
+            }
+        }
+
+        return Task.CompletedTask;
+    }
+
+    private void RemoveNode(string key)
+    {
+        if (_entries.Remove(key, out var node))
+        {
+            _lru.Remove(node);
+            Interlocked.Add(ref _currentBytes, -node.Value.Size);
+        }
+    }
+}
@@ -0,0 +1,262 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// Read-only stream that produces a multipart/form-data body around a caller's file stream
+/// without buffering the file
+/// </summary>
+/// <remarks>
+/// The form fields and part headers are encoded up front; the file content is read from the
+/// source stream only as the HTTP stack pulls it, so memory use does not depend on file size.
+/// When the source stream is seekable the body has a known length and can be rewound for a retry.
+/// The source stream is not disposed.
+/// </remarks>
+public sealed class MultipartFormDataStream : Stream
+{
+    private const int HeaderSegment = 0;
+    private const int FileSegment = 1;
+    private const int TrailerSegment = 2;
+    private const int EndOfBody = 3;
+
+    private readonly byte[] _header;
+    private readonly byte[] _trailer;
+    private readonly Stream _file;
+    private readonly long _fileOrigin;
+    private readonly long? _fileLength;
+    private readonly IProgress<TransferProgress>? _progress;
+    private int _segment;
+    private int _segmentOffset;
+    private long _fileBytesRead;
+    private long _position;
+
+    /// <summary>
+    /// Creates a multipart/form-data body
+    /// </summary>
+    /// <param name="fields">Plain form fields written before the file part</param>
+    /// <param name="fileFieldName">Form field name of the file part, e.g. file[data]</param>
+    /// <param name="fileName">File name sent in the file part's Content-Disposition header</param>
+    /// <param name="fileContentType">Content type of the file part</param>
+    /// <param name="file">Stream of file content, read from its current position</param>
+    /// <param name="progress">Optional receiver of upload progress, reported as file content is read</param>
+    /// <exception cref="ArgumentNullException">Thrown when a required parameter is null</exception>
+    /// <exception cref="ArgumentException">Thrown when the file stream is not readable</exception>
+    public MultipartFormDataStream(
+        IEnumerable<KeyValuePair<string, string>> fields,
+        string fileFieldName,
+        string fileName,
+        string fileContentType,
+        Stream file,
+        IProgress<TransferProgress>? progress = null)
+    {
+        ArgumentNullException.ThrowIfNull(fields);
+        ArgumentNullException.ThrowIfNull(fileFieldName);
+        ArgumentNullException.ThrowIfNull(fileName);
+        ArgumentNullException.ThrowIfNull(file);
+        if (!file.CanRead)
+        {
+            throw new ArgumentException("File stream must be readable", nameof(file));
+        }
+
+        Boundary = "----ProcoreSDK" + Guid.NewGuid().ToString("N");
+        _file = file;
+        _progress = progress;
+
+        if (file.CanSeek)
+        {
+            _fileOrigin = file.Position;
+            _fileLength = file.Length - file.Position;
+        }
+
+        var header = new StringBuilder();
+        foreach (var field in fields)
+        {
+            header.Append("--").Append(Boundary).Append("\r\n")
+                .Append("Content-Disposition: form-data; name=\"").Append(EscapeQuoted(field.Key)).Append("\"\r\n\r\n")
+                .Append(field.Value).Append("\r\n");
+        }
+
+        header.Append("--").Append(Boundary).Append("\r\n")
+            .Append("Content-Disposition: form-data; name=\"").Append(EscapeQuoted(fileFieldName))
+            .Append("\"; filename=\"").Append(EscapeQuoted(fileName)).Append("\"\r\n")
+            .Append("Content-Type: ")
+            .Append(string.IsNullOrEmpty(fileContentType) ? "application/octet-stream" : fileContentType)
+            .Append("\r\n\r\n");
+
+        _header = Encoding.UTF8.GetBytes(header.ToString());
+        _trailer = Encoding.UTF8.GetBytes("\r\n--" + Boundary + "--\r\n");
+    }
+
+    /// <summary>
+    /// Multipart boundary separating the parts of the body
+    /// </summary>
+    public string Boundary { get; }
+
+    /// <summary>
+    /// Value for the request's Content-Type header, including the boundary
+    /// </summary>
+    public string ContentType => "multipart/form-data; boundary=" + Boundary;
+
+    /// <inheritdoc />
+    public override bool CanRead => true;
+
+    /// <inheritdoc />
+    public override bool CanSeek => _fileLength.HasValue;
+
+    /// <inheritdoc />
+    public override bool CanWrite => false;
+
+    /// <inheritdoc />
+    public override long Length => _fileLength.HasValue
+        ? _header.Length + _fileLength.Value + _trailer.Length
+        : throw new NotSupportedException("Length is only known when the file stream is seekable");
+
+    /// <inheritdoc />
+    /// <remarks>Setting the position only supports rewinding to the start of the body</remarks>
+    public override long Position
+    {
+        get => _position;
+        set => Seek(value, SeekOrigin.Begin);
+    }
+
+    /// <inheritdoc />
+    public override int Read(byte[] buffer, int offset, int count) => Read(buffer.AsSpan(offset, count));
+
+    /// <inheritdoc />
+    public override int Read(Span<byte> buffer)
+    {
+        if (buffer.IsEmpty)
+        {
+            return 0;
+        }
+
+        while (_segment != EndOfBody)
+        {
+            var read = _segment switch
+            {
+                HeaderSegment => CopyFrom(_header, buffer),
+                FileSegment => _file.Read(buffer),
+                _ => CopyFrom(_trailer, buffer)
+            };
+
+            if (read > 0)
+            {
+                Advance(read);
+                return read;
+            }
+
+            NextSegment();
+        }
+
+        return 0;
+    }
+
+    /// <inheritdoc />
+    public override Task<int> ReadAsync(byte[] buffer, int offset, int count, CancellationToken cancellationToken) =>
+        ReadAsync(buffer.AsMemory(offset, count), cancellationToken).AsTask();
+
+    /// <inheritdoc />
+    public override async ValueTask<int> ReadAsync(Memory<byte> buffer, CancellationToken cancellationToken = default)
+    {
+        if (buffer.IsEmpty)
+        {
+            return 0;
+        }
+
+        while (_segment != EndOfBody)
+        {
+            var read = _segment switch
+            {
+                HeaderSegment => CopyFrom(_header, buffer.Span),
+                FileSegment => await _file.ReadAsync(buffer, cancellationToken).ConfigureAwait(false),
+                _ => CopyFrom(_trailer, buffer.Span)
+            };
+
+            if (read > 0)
+            {
+                Advance(read);
+                return read;
+            }
+
+            NextSegment();
+        }
+
+        return 0;
+    }
+
+    /// <inheritdoc />
+    /// <remarks>Only seeking to the current position or back to the start of the body is supported</remarks>
+    public override long Seek(long offset, SeekOrigin origin)
+    {
+        var target = origin switch
+        {
+            SeekOrigin.Begin => offset,
+            SeekOrigin.Current => _position + offset,
+            _ => CanSeek ? Length + offset : throw new NotSupportedException()
+        };
+
+        if (target == _position)
+        {
+            return _position;
+        }
+
+        if (target != 0 || !CanSeek)
+        {
+            throw new NotSupportedException("The multipart body can only be rewound to its start");
+        }
+
+        _file.Position = _fileOrigin;
+        _segment = HeaderSegment;
+        _segmentOffset = 0;
+        _fileBytesRead = 0;
+        _position = 0;
+        return 0;
+    }
+
+    /// <inheritdoc />
+    public override void Flush()
+    {
+    }
+
+    /// <inheritdoc />
+    public override void SetLength(long value) => throw new NotSupportedException();
+
+    /// <inheritdoc />
+    public override void Write(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+
+    private int CopyFrom(byte[] source, Span<byte> destination)
+    {
+        var count = Math.Min(source.Length - _segmentOffset, destination.Length);
+        source.AsSpan(_segmentOffset, count).CopyTo(destination);
+        return count;
+    }
+
+    private void Advance(int read)
+    {
+        _position += read;
+        _segmentOffset += read;
+
+        if (_segment == FileSegment)
+        {
+            _fileBytesRead += read;
+            _progress?.Report(new TransferProgress(_fileBytesRead, _fileLength));
+        }
+    }
+
+    private void NextSegment()
+    {
+        _segment++;
+        _segmentOffset = 0;
+    }
+
+    /// <summary>
+    /// Keeps a name safe inside a quoted Content-Disposition parameter
+    /// </summary>
+    private static string EscapeQuoted(string value) =>
+        value.Replace("\"", "%22").Replace("\r", string.Empty).Replace("\n", string.Empty);
+}
@@ -0,0 +1,240 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Net;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// Tracks in-flight requests so that identical concurrent requests share one underlying call.
+/// Entries exist only while the call is running; completed responses are not retained.
+/// </summary>
+public sealed class RequestCoalescer
+{
+    private readonly ConcurrentDictionary<string, InFlightRequest> _inFlight = new(StringComparer.Ordinal);
+
+    /// <summary>
+    /// Number of distinct requests currently in flight
+    /// </summary>
+    public int InFlightCount => _inFlight.Count;
+
+    /// <summary>
+    /// Joins the in-flight request for a key, or starts it if none is running
+    /// </summary>
+    /// <param name="key">Key identifying identical requests</param>
+    /// <param name="send">Sends the underlying request; receives a token cancelled once every waiter has given up</param>
+    /// <param name="cancellationToken">Token to cancel this caller's wait</param>
+    /// <returns>The shared response buffered into memory</returns>
+    public async Task<BufferedResponse> ExecuteAsync(
+        string key,
+        Func<CancellationToken, Task<HttpResponseMessage>> send,
+        CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(key);
+        ArgumentNullException.ThrowIfNull(send);
+
+        var flight = Join(key, send);
+        try
+        {
+            return await flight.Completion.WaitAsync(cancellationToken).ConfigureAwait(false);
+        }
+        finally
+        {
+            flight.Leave();
+        }
+    }
+
+    private InFlightRequest Join(string key, Func<CancellationToken, Task<HttpResponseMessage>> send)
+    {
+        while (true)
+        {
+            if (_inFlight.TryGetValue(key, out var existing))
+            {
+                if (existing.TryEnter())
+                {
+                    return existing;
+                }
+
+                // Abandoned by all of its waiters; replace it
+                _inFlight.TryRemove(new KeyValuePair<string, InFlightRequest>(key, existing));
+                continue;
+            }
+
+            var created = new InFlightRequest();
+            if (_inFlight.TryAdd(key, created))
+            {
+                created.Start(send, () => _inFlight.TryRemove(new KeyValuePair<string, InFlightRequest>(key, created)));
+                return created;
+            }
+        }
+    }
+
+    /// <summary>
+    /// A single underlying request and the callers waiting on it
+    /// </summary>
+    private sealed class InFlightRequest
+    {
+        private readonly object _sync = new();
+        private readonly CancellationTokenSource _cts = new();
+        private readonly TaskCompletionSource<BufferedResponse> _completion = new(TaskCreationOptions.RunContinuationsAsynchronously);
+        private int _waiters = 1;
+        private bool _abandoned;
+
+        public Task<BufferedResponse> Completion => _completion.Task;
+
+        public void Start(Func<CancellationToken, Task<HttpResponseMessage>> send, Action onCompleted)
+        {
+            _ = RunAsync(send, onCompleted);
+        }
+
+        public bool TryEnter()
+        {
+            lock (_sync)
+            {
+                if (_abandoned)
+                {
+                    return false;
+                }
+
+                _waiters++;
+                return true;
+            }
+        }
+
+        public void Leave()
+        {
+            lock (_sync)
+            {
+                _waiters--;
+                if (_waiters > 0 || Completion.IsCompleted)
+                {
+                    return;
+                }
+
+                // Nobody is waiting any more: stop the underlying call
+                _abandoned = true;
+            }
+
+            _cts.Cancel();
+        }
+
+        private async Task RunAsync(Func<CancellationToken, Task<HttpResponseMessage>> send, Action onCompleted)
+        {
+            try
+            {
+                using var response = await send(_cts.Token).ConfigureAwait(false);
+                var buffered = await BufferedResponse.CreateAsync(response, _cts.Token).ConfigureAwait(false);
+                onCompleted();
+                _completion.TrySetResult(buffered);
+            }
+            catch (OperationCanceledException ex)
+            {
+                onCompleted();
+                _completion.TrySetCanceled(ex.CancellationToken);
+            }
+            catch (Exception ex)
+            {
+                onCompleted();
+                _completion.TrySetException(ex);
+            }
+        }
+    }
+}
+
+/// <summary>
+/// An HTTP response copied into memory so that it can be handed to several callers
+/// </summary>
+public sealed class BufferedResponse
+{
+    private readonly List<KeyValuePair<string, IEnumerable<string>>> _headers;
+    private readonly List<KeyValuePair<string, IEnumerable<string>>> _contentHeaders;
+    private readonly byte[]? _content;
+
+    private BufferedResponse(
+        HttpStatusCode statusCode,
+        string? reasonPhrase,
+        Version version,
+        List<KeyValuePair<string, IEnumerable<string>>> headers,
+        List<KeyValuePair<string, IEnumerable<string>>> contentHeaders,
+        byte[]? content)
+    {
+        StatusCode = statusCode;
+        ReasonPhrase = reasonPhrase;
+        Version = version;
+        _headers = headers;
+        _contentHeaders = contentHeaders;
+        _content = content;
+    }
+
+    /// <summary>
+    /// Status code of the shared response
+    /// </summary>
+    public HttpStatusCode StatusCode { get; }
+
+    /// <summary>
+    /// Reason phrase of the shared response
+    /// </summary>
+    public string? ReasonPhrase { get; }
+
+    /// <summary>
+    /// HTTP version of the shared response
+    /// </summary>
+    public Version Version { get; }
+
+    /// <summary>
+    /// Reads the body of a response into memory
+    /// </summary>
+    /// <param name="response">The response to buffer</param>
+    /// <param name="cancellationToken">Token to cancel the read</param>
+    /// <returns>The buffered copy</returns>
+    public static async Task<BufferedResponse> CreateAsync(HttpResponseMessage response, CancellationToken cancellationToken = default)
+    {
+        ArgumentNullException.ThrowIfNull(response);
+
+        var headers = new List<KeyValuePair<string, IEnumerable<string>>>(response.Headers);
+        var contentHeaders = new List<KeyValuePair<string, IEnumerable<string>>>();
+        byte[]? content = null;
+
+        if (response.Content != null)
+        {
+            content = await response.Content.ReadAsByteArrayAsync(cancellationToken).ConfigureAwait(false);
+            contentHeaders.AddRange(response.Content.Headers);
+        }
+
+        return new BufferedResponse(response.StatusCode, response.ReasonPhrase, response.Version, headers, contentHeaders, content);
+    }
+
+    /// <summary>
+    /// Creates an independent response message for one caller
+    /// </summary>
+    /// <param name="request">The caller's request</param>
+    /// <returns>A new response message over the shared body</returns>
+    public HttpResponseMessage ToResponseMessage(HttpRequestMessage request)
+    {
+        var response = new HttpResponseMessage(StatusCode)
+        {
+            ReasonPhrase = ReasonPhrase,
+            Version = Version,
+            RequestMessage = request
+        };
+
+        foreach (var header in _headers)
+        {
+            response.Headers.TryAddWithoutValidation(header.Key, header.Value);
+        }
+
+        if (_content != null)
+        {
+            response.Content = new ByteArrayContent(_content);
+            foreach (var header in _contentHeaders)
+            {
+                response.Content.Headers.TryAddWithoutValidation(header.Key, header.Value);
+            }
+        }
+
+        return response;
+    }
+}
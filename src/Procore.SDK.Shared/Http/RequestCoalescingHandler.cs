@@ -0,0 +1,87 @@
+using System;
+using System.Collections.Generic;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// HttpMessageHandler that lets identical concurrent GET requests share a single underlying call
+/// </summary>
+/// <remarks>
+/// Requests are identical when they have the same URL, access token and scope headers
+/// (see <see cref="RequestCoalescingOptions.ScopeHeaders"/>). Each caller receives its own
+/// response message over a shared buffered body. A caller that cancels only stops waiting;
+/// the underlying call is cancelled once every caller has given up.
+/// Must run after <see cref="Authentication.ProcoreAuthHandler"/> so the token is part of the key.
+/// </remarks>
+public class RequestCoalescingHandler : DelegatingHandler
+{
+    private readonly RequestCoalescer _coalescer;
+    private readonly RequestCoalescingOptions _options;
+    private readonly ILogger<RequestCoalescingHandler> _logger;
+
+    /// <summary>
+    /// Creates a new RequestCoalescingHandler instance
+    /// </summary>
+    /// <param name="coalescer">Tracker of in-flight requests shared across handler instances</param>
+    /// <param name="options">Request coalescing options</param>
+    /// <param name="logger">Logger for diagnostic information</param>
+    /// <exception cref="ArgumentNullException">Thrown when any required parameter is null</exception>
+    public RequestCoalescingHandler(
+        RequestCoalescer coalescer,
+        IOptions<RequestCoalescingOptions> options,
+        ILogger<RequestCoalescingHandler> logger)
+    {
+        _coalescer = coalescer ?? throw new ArgumentNullException(nameof(coalescer));
+        _options = (options ?? throw new ArgumentNullException(nameof(options))).Value;
+        _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+    }
+
+    /// <inheritdoc />
+    protected override async Task<HttpResponseMessage> SendAsync(
+        HttpRequestMessage request,
+        CancellationToken cancellationToken)
+    {
+        if (!_options.Enabled || request.Method != HttpMethod.Get || request.Content != null || request.RequestUri == null)
+        {
+            return await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+        }
+
+        var buffered = await _coalescer.ExecuteAsync(
+            RequestKey.Create(request, _options.ScopeHeaders),
+            sharedToken => base.SendAsync(CloneRequest(request), sharedToken),
+            cancellationToken).ConfigureAwait(false);
+
+        _logger.LogTrace("Served GET {Path} through request coalescing", request.RequestUri.AbsolutePath);
+
+        return buffered.ToResponseMessage(request);
+    }
+
+    /// <summary>
+    /// Copies the request so the shared call does not depend on the lifetime of the first caller's message
+    /// </summary>
+    private static HttpRequestMessage CloneRequest(HttpRequestMessage request)
+    {
+        var clone = new HttpRequestMessage(request.Method, request.RequestUri)
+        {
+            Version = request.Version,
+            VersionPolicy = request.VersionPolicy
+        };
+
+        foreach (var header in request.Headers)
+        {
+            clone.Headers.TryAddWithoutValidation(header.Key, header.Value);
+        }
+
+        foreach (var option in request.Options)
+        {
+            ((IDictionary<string, object?>)clone.Options)[option.Key] = option.Value;
+        }
+
+        return clone;
+    }
+}
@@ -0,0 +1,25 @@
+using System;
+using System.Collections.Generic;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// Configuration options for coalescing identical concurrent GET requests
+/// </summary>
+public class RequestCoalescingOptions
+{
+    /// <summary>
+    /// Configuration section name in appsettings.json
+    /// </summary>
+    public const string SectionName = "Procore:RequestCoalescing";
+
+    /// <summary>
+    /// Whether identical in-flight GET requests share one underlying request (default: false)
+    /// </summary>
+    public bool Enabled { get; set; }
+
+    /// <summary>
+    /// Request headers that, in addition to the URL and access token, distinguish one request from another
+    /// </summary>
+    public IList<string> ScopeHeaders { get; set; } = new List<string> { "Procore-Company-Id", "Accept" };
+}
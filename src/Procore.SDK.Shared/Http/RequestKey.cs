@@ -0,0 +1,59 @@
+using System;
+using System.Collections.Generic;
+using System.Net.Http;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// Builds keys that identify equivalent requests for coalescing and caching
+/// </summary>
+internal static class RequestKey
+{
+    /// <summary>
+    /// Creates a key of the form <c>{path}|{query}|{token hash}|{range}|{scope headers}</c>.
+    /// The path comes first so that all keys for a resource share a prefix.
+    /// </summary>
+    /// <param name="request">The request, which must have an absolute RequestUri</param>
+    /// <param name="scopeHeaders">Request headers that distinguish otherwise identical requests</param>
+    /// <returns>The request key</returns>
+    public static string Create(HttpRequestMessage request, IEnumerable<string> scopeHeaders)
+    {
+        var uri = request.RequestUri!;
+        var builder = new StringBuilder(uri.AbsolutePath.Length + uri.Query.Length + 80)
+            .Append(uri.AbsolutePath)
+            .Append('|')
+            .Append(uri.Query)
+            .Append('|');
+
+        var token = request.Headers.Authorization?.Parameter;
+        if (!string.IsNullOrEmpty(token))
+        {
+            builder.Append(Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(token))));
+        }
+
+        // Different byte ranges of the same resource are different responses
+        if (request.Headers.Range != null)
+        {
+            builder.Append("|Range=").Append(request.Headers.Range);
+        }
+
+        foreach (var header in scopeHeaders)
+        {
+            if (request.Headers.TryGetValues(header, out var values))
+            {
+                builder.Append('|').Append(header).Append('=').Append(string.Join(",", values));
+            }
+        }
+
+        return builder.ToString();
+    }
+
+    /// <summary>
+    /// Gets the key prefix shared by every request for a path and the resources beneath it
+    /// </summary>
+    /// <param name="path">Absolute request path</param>
+    /// <returns>Prefixes matching the path itself and its children</returns>
+    public static string[] PrefixesFor(string path) => new[] { path.TrimEnd('/') + "|", path.TrimEnd('/') + "/" };
+}
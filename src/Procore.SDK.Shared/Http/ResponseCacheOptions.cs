@@ -0,0 +1,52 @@
+using System;
+using System.Collections.Generic;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// Configuration options for caching GET responses on the Procore HTTP pipeline
+/// </summary>
+public class ResponseCacheOptions
+{
+    /// <summary>
+    /// Configuration section name in appsettings.json
+    /// </summary>
+    public const string SectionName = "Procore:ResponseCache";
+
+    /// <summary>
+    /// Whether response caching is enabled (default: false)
+    /// </summary>
+    public bool Enabled { get; set; }
+
+    /// <summary>
+    /// Per-endpoint caching policies; only GET requests matching a policy are cached
+    /// </summary>
+    public IList<ResponseCachePolicy> Policies { get; set; } = new List<ResponseCachePolicy>();
+
+    /// <summary>
+    /// Upper bound on the bytes held by the in-memory store before least recently used entries are evicted (default: 64 MB)
+    /// </summary>
+    public long MaxMemoryBytes { get; set; } = 64L * 1024 * 1024;
+
+    /// <summary>
+    /// Request headers that, in addition to the URL and access token, distinguish cached entries
+    /// </summary>
+    public IList<string> ScopeHeaders { get; set; } = new List<string> { "Procore-Company-Id", "Accept" };
+}
+
+/// <summary>
+/// Caching policy for one API route
+/// </summary>
+public class ResponseCachePolicy
+{
+    /// <summary>
+    /// Route template to match, e.g. <c>/rest/v1.0/companies/{company_id}/users</c>.
+    /// Segments in braces or <c>*</c> match any single path segment.
+    /// </summary>
+    public string RouteTemplate { get; set; } = string.Empty;
+
+    /// <summary>
+    /// How long a response is served without revalidation
+    /// </summary>
+    public TimeSpan TimeToLive { get; set; } = TimeSpan.FromMinutes(5);
+}
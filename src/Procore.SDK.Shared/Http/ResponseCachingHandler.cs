@@ -0,0 +1,191 @@
+using System;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Net.Http.Headers;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// HttpMessageHandler that serves GET responses for configured routes from an <see cref="IResponseCacheStore"/>
+/// and revalidates stale entries with If-None-Match / If-Modified-Since
+/// </summary>
+/// <remarks>
+/// Successful POST, PUT, PATCH and DELETE requests invalidate cached entries for the written
+/// resource and its parent collection. Must run after <see cref="Authentication.ProcoreAuthHandler"/>
+/// so that entries are partitioned by access token.
+/// </remarks>
+public class ResponseCachingHandler : DelegatingHandler
+{
+    private readonly IResponseCacheStore _store;
+    private readonly ResponseCacheOptions _options;
+    private readonly ILogger<ResponseCachingHandler> _logger;
+    private readonly (string[] Segments, TimeSpan TimeToLive)[] _policies;
+
+    /// <summary>
+    /// Creates a new ResponseCachingHandler instance
+    /// </summary>
+    /// <param name="store">Store holding cached responses</param>
+    /// <param name="options">Response cache options</param>
+    /// <param name="logger">Logger for diagnostic information</param>
+    /// <exception cref="ArgumentNullException">Thrown when any required parameter is null</exception>
+    public ResponseCachingHandler(
+        IResponseCacheStore store,
+        IOptions<ResponseCacheOptions> options,
+        ILogger<ResponseCachingHandler> logger)
+    {
+        _store = store ?? throw new ArgumentNullException(nameof(store));
+        _options = (options ?? throw new ArgumentNullException(nameof(options))).Value;
+        _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+        _policies = _options.Policies
+            .Where(p => !string.IsNullOrWhiteSpace(p.RouteTemplate) && p.TimeToLive > TimeSpan.Zero)
+            .Select(p => (SplitPath(p.RouteTemplate), p.TimeToLive))
+            .ToArray();
+    }
+
+    /// <inheritdoc />
+    protected override async Task<HttpResponseMessage> SendAsync(
+        HttpRequestMessage request,
+        CancellationToken cancellationToken)
+    {
+        if (!_options.Enabled || request.RequestUri == null)
+        {
+            return await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+        }
+
+        if (request.Method != HttpMethod.Get)
+        {
+            var writeResponse = await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+            if (writeResponse.IsSuccessStatusCode && request.Method != HttpMethod.Head && request.Method != HttpMethod.Options)
+            {
+                await InvalidateAsync(request.Method, request.RequestUri.AbsolutePath, cancellationToken).ConfigureAwait(false);
+            }
+
+            return writeResponse;
+        }
+
+        var timeToLive = GetTimeToLive(request.RequestUri.AbsolutePath);
+        if (timeToLive == null || request.Headers.CacheControl?.NoCache == true)
+        {
+            return await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+        }
+
+        var key = RequestKey.Create(request, _options.ScopeHeaders);
+        var cached = await _store.GetAsync(key, cancellationToken).ConfigureAwait(false);
+
+        if (cached != null && cached.IsFresh(DateTimeOffset.UtcNow))
+        {
+            _logger.LogTrace("Response cache hit for GET {Path}", request.RequestUri.AbsolutePath);
+            return cached.ToResponseMessage(request);
+        }
+
+        if (cached != null && cached.CanRevalidate)
+        {
+            AddConditionalHeaders(request, cached);
+        }
+
+        var response = await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+
+        if (response.StatusCode == HttpStatusCode.NotModified && cached != null)
+        {
+            _logger.LogTrace("Revalidated cached response for GET {Path}", request.RequestUri.AbsolutePath);
+
+            var revalidated = cached.WithExpiresAt(DateTimeOffset.UtcNow.Add(timeToLive.Value));
+            await _store.SetAsync(key, revalidated, cancellationToken).ConfigureAwait(false);
+
+            response.Dispose();
+            return revalidated.ToResponseMessage(request);
+        }
+
+        if (response.StatusCode == HttpStatusCode.OK && response.Headers.CacheControl?.NoStore != true)
+        {
+            var entry = await CachedResponse.CreateAsync(response, DateTimeOffset.UtcNow.Add(timeToLive.Value), cancellationToken).ConfigureAwait(false);
+            await _store.SetAsync(key, entry, cancellationToken).ConfigureAwait(false);
+        }
+
+        return response;
+    }
+
+    /// <summary>
+    /// Gets the time-to-live of the first policy matching the path, or null if the path is not cached
+    /// </summary>
+    private TimeSpan? GetTimeToLive(string path)
+    {
+        if (_policies.Length == 0)
+        {
+            return null;
+        }
+
+        var segments = SplitPath(path);
+        foreach (var (template, timeToLive) in _policies)
+        {
+            if (Matches(template, segments))
+            {
+                return timeToLive;
+            }
+        }
+
+        return null;
+    }
+
+    /// <summary>
+    /// Removes cached entries affected by a write: a POST changes the collection it targets,
+    /// other methods change an item and therefore its parent collection
+    /// </summary>
+    private async Task InvalidateAsync(HttpMethod method, string path, CancellationToken cancellationToken)
+    {
+        var target = path.TrimEnd('/');
+        if (method != HttpMethod.Post)
+        {
+            var lastSlash = target.LastIndexOf('/');
+            if (lastSlash > 0)
+            {
+                target = target[..lastSlash];
+            }
+        }
+
+        foreach (var prefix in RequestKey.PrefixesFor(target))
+        {
+            await _store.RemoveByPrefixAsync(prefix, cancellationToken).ConfigureAwait(false);
+        }
+    }
+
+    private static void AddConditionalHeaders(HttpRequestMessage request, CachedResponse cached)
+    {
+        if (cached.ETag != null && request.Headers.IfNoneMatch.Count == 0
+            && EntityTagHeaderValue.TryParse(cached.ETag, out var etag))
+        {
+            request.Headers.IfNoneMatch.Add(etag);
+        }
+        else if (cached.LastModified.HasValue && request.Headers.IfModifiedSince == null)
+        {
+            request.Headers.IfModifiedSince = cached.LastModified;
+        }
+    }
+
+    private static bool Matches(string[] template, string[] segments)
+    {
+        if (template.Length != segments.Length)
+        {
+            return false;
+        }
+
+        for (var i = 0; i < template.Length; i++)
+        {
+            var part = template[i];
+            var isWildcard = part == "*" || (part.StartsWith('{') && part.EndsWith('}'));
+            if (!isWildcard && !string.Equals(part, segments[i], StringComparison.OrdinalIgnoreCase))
+            {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    private static string[] SplitPath(string path) => path.Split('/', StringSplitOptions.RemoveEmptyEntries);
+}
@@ -0,0 +1,36 @@
+using System;
+
+namespace Procore.SDK.Shared.Http;
+
+/// <summary>
+/// Progress of a streaming upload or download
+/// </summary>
+public readonly struct TransferProgress
+{
+    /// <summary>
+    /// Creates a progress report
+    /// </summary>
+    /// <param name="bytesTransferred">Bytes of file content transferred so far, including any resumed offset</param>
+    /// <param name="totalBytes">Total size of the file content, when known</param>
+    public TransferProgress(long bytesTransferred, long? totalBytes)
+    {
+        BytesTransferred = bytesTransferred;
+        TotalBytes = totalBytes;
+    }
+
+    /// <summary>
+    /// Bytes of file content transferred so far, including any resumed offset
+    /// </summary>
+    public long BytesTransferred { get; }
+
+    /// <summary>
+    /// Total size of the file content, or null when the size is not known up front
+    /// </summary>
+    public long? TotalBytes { get; }
+
+    /// <summary>
+    /// Completion percentage between 0 and 100, or null when the total size is not known
+    /// </summary>
+    public double? PercentComplete =>
+        TotalBytes is > 0 ? Math.Min(100.0, BytesTransferred * 100.0 / TotalBytes.Value) : null;
+}
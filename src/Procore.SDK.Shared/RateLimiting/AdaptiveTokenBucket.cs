@@ -0,0 +1,205 @@
+using System;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Shared.RateLimiting;
+
+/// <summary>
+/// Token bucket whose refill rate adapts to the rate-limit budget reported by the Procore API.
+/// Callers queue in arrival order until a token is available instead of failing.
+/// </summary>
+public sealed class AdaptiveTokenBucket : IDisposable
+{
+    private readonly RateLimitOptions _options;
+    private readonly SemaphoreSlim _queue = new(1, 1);
+    private readonly object _sync = new();
+
+    private double _tokens;
+    private double _refillPerSecond;
+    private long _lastRefillTimestamp;
+    private DateTimeOffset _pausedUntil = DateTimeOffset.MinValue;
+    private long _lastUsedTicks;
+
+    /// <summary>
+    /// Creates a new AdaptiveTokenBucket starting at full burst capacity
+    /// </summary>
+    /// <param name="options">Rate limiting options</param>
+    /// <exception cref="ArgumentNullException">Thrown when options is null</exception>
+    public AdaptiveTokenBucket(RateLimitOptions options)
+    {
+        _options = options ?? throw new ArgumentNullException(nameof(options));
+        _tokens = options.BurstSize;
+        _refillPerSecond = options.MaxRequestsPerSecond;
+        _lastRefillTimestamp = Stopwatch.GetTimestamp();
+        _lastUsedTicks = DateTimeOffset.UtcNow.UtcTicks;
+    }
+
+    /// <summary>
+    /// Current refill rate in requests per second
+    /// </summary>
+    public double CurrentRate
+    {
+        get
+        {
+            lock (_sync)
+            {
+                return _refillPerSecond;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Number of tokens currently available for immediate use
+    /// </summary>
+    public double AvailableTokens
+    {
+        get
+        {
+            lock (_sync)
+            {
+                Refill();
+                return _tokens;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Time the bucket was last used to acquire a token
+    /// </summary>
+    public DateTimeOffset LastUsed => new(Interlocked.Read(ref _lastUsedTicks), TimeSpan.Zero);
+
+    /// <summary>
+    /// Waits until a request may be sent. Waiters are served in arrival order.
+    /// </summary>
+    /// <param name="cancellationToken">Token to cancel the wait</param>
+    public async Task AcquireAsync(CancellationToken cancellationToken = default)
+    {
+        Interlocked.Exchange(ref _lastUsedTicks, DateTimeOffset.UtcNow.UtcTicks);
+
+        await _queue.WaitAsync(cancellationToken).ConfigureAwait(false);
+        try
+        {
+            while (true)
+            {
+                var delay = TryTake();
+                if (delay <= TimeSpan.Zero)
+                {
+                    return;
+                }
+
+                await Task.Delay(delay, cancellationToken).ConfigureAwait(false);
+            }
+        }
+        finally
+        {
+            _queue.Release();
+        }
+    }
+
+    /// <summary>
+    /// Adapts the bucket to the budget reported by the server
+    /// </summary>
+    /// <param name="limit">Total requests allowed in the current window, if reported</param>
+    /// <param name="remaining">Requests remaining in the current window</param>
+    /// <param name="resetAt">When the current window resets, if reported</param>
+    public void UpdateBudget(long? limit, long remaining, DateTimeOffset? resetAt)
+    {
+        lock (_sync)
+        {
+            Refill();
+
+            var now = DateTimeOffset.UtcNow;
+            if (remaining <= 0)
+            {
+                if (resetAt.HasValue && resetAt.Value > now)
+                {
+                    _pausedUntil = Max(_pausedUntil, resetAt.Value);
+                }
+
+                _tokens = 0;
+                return;
+            }
+
+            // Never hand out more tokens than the server says are left
+            _tokens = Math.Min(_tokens, remaining);
+
+            var plentiful = limit.HasValue && limit.Value > 0
+                && (double)remaining / limit.Value >= _options.PacingThreshold;
+
+            if (plentiful || !resetAt.HasValue)
+            {
+                _refillPerSecond = _options.MaxRequestsPerSecond;
+                return;
+            }
+
+            var secondsUntilReset = (resetAt.Value - now).TotalSeconds;
+            if (secondsUntilReset <= 0)
+            {
+                _refillPerSecond = _options.MaxRequestsPerSecond;
+                return;
+            }
+
+            var pacedRate = remaining * _options.SafetyFactor / secondsUntilReset;
+            _refillPerSecond = Math.Clamp(pacedRate, _options.MinRequestsPerSecond, _options.MaxRequestsPerSecond);
+        }
+    }
+
+    /// <summary>
+    /// Stops handing out tokens until the given time, e.g. after a 429 response
+    /// </summary>
+    /// <param name="until">Time at which requests may resume</param>
+    public void PauseUntil(DateTimeOffset until)
+    {
+        lock (_sync)
+        {
+            _pausedUntil = Max(_pausedUntil, until);
+            _tokens = 0;
+        }
+    }
+
+    /// <summary>
+    /// Takes a token if one is available, otherwise returns how long to wait before trying again
+    /// </summary>
+    private TimeSpan TryTake()
+    {
+        lock (_sync)
+        {
+            var pause = _pausedUntil - DateTimeOffset.UtcNow;
+            if (pause > TimeSpan.Zero)
+            {
+                return pause;
+            }
+
+            Refill();
+
+            if (_tokens >= 1)
+            {
+                _tokens -= 1;
+                return TimeSpan.Zero;
+            }
+
+            return TimeSpan.FromSeconds((1 - _tokens) / _refillPerSecond);
+        }
+    }
+
+    /// <summary>
+    /// Adds the tokens accrued since the last refill, capped at the burst size
+    /// </summary>
+    private void Refill()
+    {
+        var now = Stopwatch.GetTimestamp();
+        var elapsedSeconds = (double)(now - _lastRefillTimestamp) / Stopwatch.Frequency;
+        _lastRefillTimestamp = now;
+
+        _tokens = Math.Min(_options.BurstSize, _tokens + elapsedSeconds * _refillPerSecond);
+    }
+
+    private static DateTimeOffset Max(DateTimeOffset a, DateTimeOffset b) => a > b ? a : b;
+
+    /// <inheritdoc />
+    public void Dispose()
+    {
+        _queue.Dispose();
+    }
+}
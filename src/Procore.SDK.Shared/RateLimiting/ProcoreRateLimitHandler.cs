@@ -0,0 +1,134 @@
+using System;
+using System.Globalization;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Security.Cryptography;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace Procore.SDK.Shared.RateLimiting;
+
+/// <summary>
+/// HttpMessageHandler that paces requests per access token using an adaptive token bucket
+/// fed by the X-Rate-Limit-* headers returned by the Procore API
+/// </summary>
+/// <remarks>
+/// Must run after <see cref="Authentication.ProcoreAuthHandler"/> so the Authorization header
+/// is present when the partition is chosen.
+/// </remarks>
+public class ProcoreRateLimitHandler : DelegatingHandler
+{
+    internal const string LimitHeader = "X-Rate-Limit-Limit";
+    internal const string RemainingHeader = "X-Rate-Limit-Remaining";
+    internal const string ResetHeader = "X-Rate-Limit-Reset";
+    private const string AnonymousPartition = "anonymous";
+
+    private readonly RateLimiterRegistry _registry;
+    private readonly RateLimitOptions _options;
+    private readonly ILogger<ProcoreRateLimitHandler> _logger;
+
+    /// <summary>
+    /// Creates a new ProcoreRateLimitHandler instance
+    /// </summary>
+    /// <param name="registry">Registry of per-token buckets shared across handler instances</param>
+    /// <param name="options">Rate limiting options</param>
+    /// <param name="logger">Logger for diagnostic information</param>
+    /// <exception cref="ArgumentNullException">Thrown when any required parameter is null</exception>
+    public ProcoreRateLimitHandler(
+        RateLimiterRegistry registry,
+        IOptions<RateLimitOptions> options,
+        ILogger<ProcoreRateLimitHandler> logger)
+    {
+        _registry = registry ?? throw new ArgumentNullException(nameof(registry));
+        _options = (options ?? throw new ArgumentNullException(nameof(options))).Value;
+        _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+    }
+
+    /// <inheritdoc />
+    protected override async Task<HttpResponseMessage> SendAsync(
+        HttpRequestMessage request,
+        CancellationToken cancellationToken)
+    {
+        if (!_options.Enabled)
+        {
+            return await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+        }
+
+        var bucket = _registry.GetBucket(GetPartitionKey(request));
+        await bucket.AcquireAsync(cancellationToken).ConfigureAwait(false);
+
+        var response = await base.SendAsync(request, cancellationToken).ConfigureAwait(false);
+
+        ApplyRateLimitHeaders(bucket, response);
+
+        return response;
+    }
+
+    /// <summary>
+    /// Feeds the rate-limit headers of a response back into the bucket
+    /// </summary>
+    private void ApplyRateLimitHeaders(AdaptiveTokenBucket bucket, HttpResponseMessage response)
+    {
+        var limit = ReadLongHeader(response, LimitHeader);
+        var remaining = ReadLongHeader(response, RemainingHeader);
+        var reset = ReadLongHeader(response, ResetHeader);
+        DateTimeOffset? resetAt = reset.HasValue ? DateTimeOffset.FromUnixTimeSeconds(reset.Value) : null;
+
+        if (remaining.HasValue)
+        {
+            bucket.UpdateBudget(limit, remaining.Value, resetAt);
+        }
+
+        if (response.StatusCode != HttpStatusCode.TooManyRequests)
+        {
+            return;
+        }
+
+        var resumeAt = GetRetryAfter(response) ?? resetAt ?? DateTimeOffset.UtcNow.Add(_options.DefaultRetryAfter);
+        bucket.PauseUntil(resumeAt);
+
+        _logger.LogWarning(
+            "Procore rate limit exceeded, pausing requests for this token until {ResumeAt:O}",
+            resumeAt);
+    }
+
+    /// <summary>
+    /// Derives the partition key from the Authorization header without keeping the raw token
+    /// </summary>
+    private static string GetPartitionKey(HttpRequestMessage request)
+    {
+        var token = request.Headers.Authorization?.Parameter;
+        if (string.IsNullOrEmpty(token))
+        {
+            return AnonymousPartition;
+        }
+
+        return Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(token)));
+    }
+
+    private static DateTimeOffset? GetRetryAfter(HttpResponseMessage response)
+    {
+        var retryAfter = response.Headers.RetryAfter;
+        if (retryAfter?.Delta is { } delta)
+        {
+            return DateTimeOffset.UtcNow.Add(delta);
+        }
+
+        return retryAfter?.Date;
+    }
+
+    private static long? ReadLongHeader(HttpResponseMessage response, string name)
+    {
+        if (response.Headers.TryGetValues(name, out var values)
+            && long.TryParse(values.FirstOrDefault(), NumberStyles.Integer, CultureInfo.InvariantCulture, out var value))
+        {
+            return value;
+        }
+
+        return null;
+    }
+}
@@ -0,0 +1,62 @@
+using System;
+using System.ComponentModel.DataAnnotations;
+
+namespace Procore.SDK.Shared.RateLimiting;
+
+/// <summary>
+/// Configuration options for client-side rate limiting of Procore API requests
+/// </summary>
+public class RateLimitOptions
+{
+    /// <summary>
+    /// Configuration section name in appsettings.json
+    /// </summary>
+    public const string SectionName = "Procore:RateLimit";
+
+    /// <summary>
+    /// Whether client-side rate limiting is enabled (default: true)
+    /// </summary>
+    public bool Enabled { get; set; } = true;
+
+    /// <summary>
+    /// Maximum sustained request rate per access token while the server budget is plentiful (default: 20/s)
+    /// </summary>
+    [Range(0.1, 1000)]
+    public double MaxRequestsPerSecond { get; set; } = 20;
+
+    /// <summary>
+    /// Lowest request rate the limiter will pace down to while budget remains (default: 0.1/s)
+    /// </summary>
+    [Range(0.01, 100)]
+    public double MinRequestsPerSecond { get; set; } = 0.1;
+
+    /// <summary>
+    /// Number of requests that may be sent back-to-back before pacing applies (default: 10)
+    /// </summary>
+    [Range(1, 1000)]
+    public int BurstSize { get; set; } = 10;
+
+    /// <summary>
+    /// Fraction of the server budget remaining below which requests are spread evenly
+    /// over the time left until the limit resets (default: 0.2)
+    /// </summary>
+    [Range(0.0, 1.0)]
+    public double PacingThreshold { get; set; } = 0.2;
+
+    /// <summary>
+    /// Fraction of the remaining server budget the limiter is allowed to spend while pacing,
+    /// leaving headroom for other clients sharing the same token (default: 0.9)
+    /// </summary>
+    [Range(0.1, 1.0)]
+    public double SafetyFactor { get; set; } = 0.9;
+
+    /// <summary>
+    /// Delay applied after a 429 response that carries no Retry-After or reset header (default: 5 seconds)
+    /// </summary>
+    public TimeSpan DefaultRetryAfter { get; set; } = TimeSpan.FromSeconds(5);
+
+    /// <summary>
+    /// Limiters unused for longer than this are evicted when new access tokens appear (default: 1 hour)
+    /// </summary>
+    public TimeSpan IdleLimiterExpiration { get; set; } = TimeSpan.FromHours(1);
+}
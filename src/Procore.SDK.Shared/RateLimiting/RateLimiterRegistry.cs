@@ -0,0 +1,80 @@
+using System;
+using System.Collections.Concurrent;
+using System.Linq;
+using Microsoft.Extensions.Options;
+
+namespace Procore.SDK.Shared.RateLimiting;
+
+/// <summary>
+/// Holds one adaptive token bucket per access token so that every client sharing
+/// a token also shares its rate-limit budget
+/// </summary>
+public sealed class RateLimiterRegistry : IDisposable
+{
+    private const int EvictionSweepThreshold = 256;
+
+    private readonly RateLimitOptions _options;
+    private readonly ConcurrentDictionary<string, AdaptiveTokenBucket> _buckets = new(StringComparer.Ordinal);
+
+    /// <summary>
+    /// Creates a new RateLimiterRegistry
+    /// </summary>
+    /// <param name="options">Rate limiting options</param>
+    /// <exception cref="ArgumentNullException">Thrown when options is null</exception>
+    public RateLimiterRegistry(IOptions<RateLimitOptions> options)
+    {
+        _options = (options ?? throw new ArgumentNullException(nameof(options))).Value;
+    }
+
+    /// <summary>
+    /// Number of partitions currently tracked
+    /// </summary>
+    public int Count => _buckets.Count;
+
+    /// <summary>
+    /// Gets the bucket for a partition, creating it on first use
+    /// </summary>
+    /// <param name="partitionKey">Partition key, typically derived from the access token</param>
+    /// <returns>The shared bucket for the partition</returns>
+    public AdaptiveTokenBucket GetBucket(string partitionKey)
+    {
+        ArgumentNullException.ThrowIfNull(partitionKey);
+
+        if (_buckets.TryGetValue(partitionKey, out var bucket))
+        {
+            return bucket;
+        }
+
+        // Refreshed tokens create new partitions; drop the ones nobody uses any more
+        if (_buckets.Count >= EvictionSweepThreshold)
+        {
+            EvictIdle();
+        }
+
+        return _buckets.GetOrAdd(partitionKey, _ => new AdaptiveTokenBucket(_options));
+    }
+
+    /// <summary>
+    /// Removes buckets that have not been used within the configured idle expiration
+    /// </summary>
+    private void EvictIdle()
+    {
+        var cutoff = DateTimeOffset.UtcNow - _options.IdleLimiterExpiration;
+        foreach (var entry in _buckets.Where(kvp => kvp.Value.LastUsed < cutoff).ToList())
+        {
+            // Not disposed: a concurrent caller may still hold a reference
+            _buckets.TryRemove(entry.Key, out _);
+        }
+    }
+
+    /// <inheritdoc />
+    public void Dispose()
+    {
+        foreach (var bucket in _buckets.Values)
+        {
+            bucket.Dispose();
+        }
+
+        _buckets.Clear();
+    }
+}
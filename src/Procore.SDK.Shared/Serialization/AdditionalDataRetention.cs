@@ -0,0 +1,17 @@
+namespace Procore.SDK.Shared.Serialization;
+
+/// <summary>
+/// Controls what happens to JSON properties that a generated model does not declare
+/// </summary>
+public enum AdditionalDataRetention
+{
+    /// <summary>
+    /// Unknown properties are kept in the model's AdditionalData dictionary (Kiota default)
+    /// </summary>
+    Retain,
+
+    /// <summary>
+    /// Unknown properties are dropped while the model is deserialized, leaving AdditionalData empty
+    /// </summary>
+    Discard
+}
@@ -0,0 +1,175 @@
+using System;
+using System.Collections;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics.CodeAnalysis;
+using Microsoft.Kiota.Abstractions.Serialization;
+
+namespace Procore.SDK.Shared.Serialization;
+
+/// <summary>
+/// Parse node factory that drops unknown JSON properties from generated models as they are deserialized
+/// </summary>
+/// <remarks>
+/// Generated models are produced with additional data enabled, so every deserialized row carries an
+/// AdditionalData dictionary. For models configured to discard (see <see cref="DeserializationOptions"/>),
+/// the dictionary is swapped for a sink while the model's fields are assigned and restored afterwards,
+/// so unknown properties never grow a per-row dictionary and are not retained by the model graph.
+/// </remarks>
+public class AdditionalDataRetentionParseNodeFactory : ParseNodeProxyFactory
+{
+    /// <summary>
+    /// Creates a new AdditionalDataRetentionParseNodeFactory instance
+    /// </summary>
+    /// <param name="concrete">The parse node factory that does the actual parsing</param>
+    /// <param name="options">Deserialization options</param>
+    /// <exception cref="ArgumentNullException">Thrown when any required parameter is null</exception>
+    public AdditionalDataRetentionParseNodeFactory(IParseNodeFactory concrete, DeserializationOptions options)
+        : this(concrete, new RetentionPolicy(options ?? throw new ArgumentNullException(nameof(options))))
+    {
+    }
+
+    private AdditionalDataRetentionParseNodeFactory(IParseNodeFactory concrete, RetentionPolicy policy)
+        : base(concrete ?? throw new ArgumentNullException(nameof(concrete)), policy.OnBeforeAssignFieldValues, policy.OnAfterAssignFieldValues)
+    {
+    }
+
+    /// <summary>
+    /// Decides per model type whether unknown properties are kept and swaps AdditionalData around field assignment
+    /// </summary>
+    private sealed class RetentionPolicy
+    {
+        // Models are parsed depth-first on one thread, so swapped dictionaries are restored in LIFO order
+        [ThreadStatic]
+        private static Stack<KeyValuePair<IAdditionalDataHolder, IDictionary<string, object>>>? _swapped;
+
+        private readonly DeserializationOptions _options;
+        private readonly ConcurrentDictionary<Type, bool> _discardByType = new();
+
+        public RetentionPolicy(DeserializationOptions options)
+        {
+            _options = options;
+        }
+
+        public void OnBeforeAssignFieldValues(IParsable model)
+        {
+            if (model is not IAdditionalDataHolder holder || !ShouldDiscard(model.GetType()))
+            {
+                return;
+            }
+
+            (_swapped ??= new Stack<KeyValuePair<IAdditionalDataHolder, IDictionary<string, object>>>())
+                .Push(new KeyValuePair<IAdditionalDataHolder, IDictionary<string, object>>(holder, holder.AdditionalData));
+            holder.AdditionalData = DiscardingDictionary.Instance;
+        }
+
+        public void OnAfterAssignFieldValues(IParsable model)
+        {
+            if (model is not IAdditionalDataHolder holder || !ReferenceEquals(holder.AdditionalData, DiscardingDictionary.Instance))
+            {
+                return;
+            }
+
+            // Pop past entries left behind by a parse that threw part-way through
+            while (_swapped is { Count: > 0 })
+            {
+                var entry = _swapped.Pop();
+                if (ReferenceEquals(entry.Key, holder))
+                {
+                    holder.AdditionalData = entry.Value ?? new Dictionary<string, object>();
+                    return;
+                }
+            }
+
+            holder.AdditionalData = new Dictionary<string, object>();
+        }
+
+        private bool ShouldDiscard(Type modelType)
+        {
+            return _discardByType.GetOrAdd(modelType, static (type, options) => Resolve(type, options) == AdditionalDataRetention.Discard, _options);
+        }
+
+        private static AdditionalDataRetention Resolve(Type modelType, DeserializationOptions options)
+        {
+            var typeNamespace = modelType.Namespace ?? string.Empty;
+            var retention = options.AdditionalData;
+            var matchedLength = -1;
+
+            foreach (var (prefix, value) in options.AdditionalDataOverrides)
+            {
+                if (prefix.Length > matchedLength && IsNamespaceMatch(typeNamespace, prefix))
+                {
+                    retention = value;
+                    matchedLength = prefix.Length;
+                }
+            }
+
+            return retention;
+        }
+
+        private static bool IsNamespaceMatch(string typeNamespace, string prefix)
+        {
+            return typeNamespace.StartsWith(prefix, StringComparison.Ordinal) &&
+                (typeNamespace.Length == prefix.Length || typeNamespace[prefix.Length] == '.');
+        }
+    }
+
+    /// <summary>
+    /// Dictionary that ignores every write, used as a stand-in while a model's fields are assigned
+    /// </summary>
+    private sealed class DiscardingDictionary : IDictionary<string, object>
+    {
+        public static readonly DiscardingDictionary Instance = new();
+
+        public object this[string key]
+        {
+            get => throw new KeyNotFoundException(key);
+            set { }
+        }
+
+        public ICollection<string> Keys => Array.Empty<string>();
+
+        public ICollection<object> Values => Array.Empty<object>();
+
+        public int Count => 0;
+
+        public bool IsReadOnly => false;
+
+        public void Add(string key, object value)
+        {
+        }
+
+        public void Add(KeyValuePair<string, object> item)
+        {
+        }
+
+        public void Clear()
+        {
+        }
+
+        public bool Contains(KeyValuePair<string, object> item) => false;
+
+        public bool ContainsKey(string key) => false;
+
+        public void CopyTo(KeyValuePair<string, object>[] array, int arrayIndex)
+        {
+        }
+
+        public IEnumerator<KeyValuePair<string, object>> GetEnumerator()
+        {
+            yield break;
+        }
+
+        public bool Remove(string key) => false;
+
+        public bool Remove(KeyValuePair<string, object> item) => false;
+
+        public bool TryGetValue(string key, [MaybeNullWhen(false)] out object value)
+        {
+            value = null;
+            return false;
+        }
+
+        IEnumerator IEnumerable.GetEnumerator() => GetEnumerator();
+    }
+}
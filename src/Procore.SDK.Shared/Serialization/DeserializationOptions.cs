@@ -0,0 +1,55 @@
+using System;
+using System.Collections.Generic;
+
+namespace Procore.SDK.Shared.Serialization;
+
+/// <summary>
+/// Configuration options for deserializing Procore API responses
+/// </summary>
+public class DeserializationOptions
+{
+    /// <summary>
+    /// Configuration section name in appsettings.json
+    /// </summary>
+    public const string SectionName = "Procore:Deserialization";
+
+    /// <summary>
+    /// Default handling of unknown JSON properties for every generated model (default: Retain)
+    /// </summary>
+    /// <remarks>
+    /// Custom fields and some resource management attributes are read from AdditionalData,
+    /// so only discard for groups whose wrappers do not need them.
+    /// </remarks>
+    public AdditionalDataRetention AdditionalData { get; set; } = AdditionalDataRetention.Retain;
+
+    /// <summary>
+    /// Per-group overrides keyed by generated namespace prefix, e.g. "Procore.SDK.FieldProductivity";
+    /// the longest matching prefix wins
+    /// </summary>
+    public IDictionary<string, AdditionalDataRetention> AdditionalDataOverrides { get; set; } =
+        new Dictionary<string, AdditionalDataRetention>(StringComparer.Ordinal);
+
+    /// <summary>
+    /// Whether any model group is configured to discard unknown properties
+    /// </summary>
+    public bool DiscardsAdditionalData
+    {
+        get
+        {
+            if (AdditionalData == AdditionalDataRetention.Discard)
+            {
+                return true;
+            }
+
+            foreach (var retention in AdditionalDataOverrides.Values)
+            {
+                if (retention == AdditionalDataRetention.Discard)
+                {
+                    return true;
+                }
+            }
+
+            return false;
+        }
+    }
+}
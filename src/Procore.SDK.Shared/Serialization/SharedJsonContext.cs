@@ -0,0 +1,23 @@
+using System.Collections.Generic;
+using System.Text.Json.Serialization;
+using Procore.SDK.Shared.Authentication;
+using Procore.SDK.Shared.Http;
+
+namespace Procore.SDK.Shared.Serialization;
+
+/// <summary>
+/// Source-generated serialization metadata for the JSON the SDK reads and writes itself
+/// </summary>
+/// <remarks>
+/// Keeps token storage, the token endpoint and the file cache free of reflection-based
+/// serialization so they survive IL trimming and Native AOT. Default options are used so the
+/// on-disk formats match what earlier versions wrote.
+/// </remarks>
+[JsonSerializable(typeof(StoredToken))]
+[JsonSerializable(typeof(Dictionary<string, StoredToken>))]
+[JsonSerializable(typeof(TokenResponse))]
+[JsonSerializable(typeof(ProtectedDataTokenStorage.TokenData))]
+[JsonSerializable(typeof(FileResponseCacheStore.FileEntry))]
+internal sealed partial class SharedJsonContext : JsonSerializerContext
+{
+}
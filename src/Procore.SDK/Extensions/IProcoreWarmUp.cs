@@ -0,0 +1,46 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Extensions;
+
+/// <summary>
+/// Pays the first-call costs of the Procore HTTP client up front: the access token, pooled
+/// connections, and first-call JIT of request builders, serializers and type mappers
+/// </summary>
+public interface IProcoreWarmUp
+{
+    /// <summary>
+    /// Result of the completed warm-up, or null while it has not finished
+    /// </summary>
+    ProcoreWarmUpResult? Result { get; }
+
+    /// <summary>
+    /// Runs the warm-up once per process; later and concurrent calls share the first run
+    /// </summary>
+    /// <param name="cancellationToken">Stops waiting; the shared run is bounded by <see cref="ProcoreWarmUpOptions.Timeout"/></param>
+    /// <returns>The warm-up result</returns>
+    Task<ProcoreWarmUpResult> WarmUpAsync(CancellationToken cancellationToken = default);
+}
+
+/// <summary>
+/// Outcome of a Procore warm-up
+/// </summary>
+public sealed class ProcoreWarmUpResult
+{
+    /// <summary>
+    /// Time the warm-up took
+    /// </summary>
+    public TimeSpan Duration { get; init; }
+
+    /// <summary>
+    /// Descriptions of the steps that failed; empty when every step succeeded
+    /// </summary>
+    public IReadOnlyList<string> Failures { get; init; } = Array.Empty<string>();
+
+    /// <summary>
+    /// Whether every step succeeded
+    /// </summary>
+    public bool Succeeded => Failures.Count == 0;
+}
@@ -0,0 +1,45 @@
+using Microsoft.Extensions.Options;
+using System;
+using System.Net;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Extensions;
+
+/// <summary>
+/// HttpMessageHandler that sends requests with the HTTP version of the configured transport profile
+/// </summary>
+/// <remarks>
+/// HttpClient.DefaultRequestVersion only applies to its convenience methods, while the Kiota request adapter
+/// builds its own request messages, so the version is set here instead.
+/// Requests that already ask for a version other than HTTP/1.1 are left alone.
+/// </remarks>
+public class ProcoreHttpVersionHandler : DelegatingHandler
+{
+    private readonly Version _version;
+
+    /// <summary>
+    /// Creates a new ProcoreHttpVersionHandler instance
+    /// </summary>
+    /// <param name="options">HTTP client options whose transport profile selects the version</param>
+    /// <exception cref="ArgumentNullException">Thrown when options is null</exception>
+    public ProcoreHttpVersionHandler(IOptions<HttpClientOptions> options)
+    {
+        _version = ProcoreTransport.GetRequestVersion(
+            (options ?? throw new ArgumentNullException(nameof(options))).Value.TransportProfile);
+    }
+
+    /// <inheritdoc />
+    protected override Task<HttpResponseMessage> SendAsync(
+        HttpRequestMessage request,
+        CancellationToken cancellationToken)
+    {
+        if (request.Version == HttpVersion.Version11 && request.VersionPolicy == HttpVersionPolicy.RequestVersionOrLower)
+        {
+            request.Version = _version;
+        }
+
+        return base.SendAsync(request, cancellationToken);
+    }
+}
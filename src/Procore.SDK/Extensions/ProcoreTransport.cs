@@ -0,0 +1,88 @@
+using System;
+using System.Net;
+using System.Net.Http;
+
+namespace Procore.SDK.Extensions;
+
+/// <summary>
+/// Connection profiles for the "Procore" HTTP client
+/// </summary>
+public enum ProcoreTransportProfile
+{
+    /// <summary>
+    /// HTTP/1.1 with a pool of up to <see cref="HttpClientOptions.MaxConnectionsPerServer"/> connections
+    /// </summary>
+    Default,
+
+    /// <summary>
+    /// HTTP/2 where the server supports it, opening further multiplexed connections once one is saturated;
+    /// suited to batch jobs and syncs that issue many concurrent list requests
+    /// </summary>
+    HighThroughput,
+
+    /// <summary>
+    /// HTTP/2 where the server supports it, multiplexing every request over a single connection kept alive
+    /// with pings; suited to interactive apps that issue few requests and cannot wait for a new handshake
+    /// </summary>
+    LowLatency
+}
+
+/// <summary>
+/// Builds the primary handler and request version for a <see cref="ProcoreTransportProfile"/>
+/// </summary>
+/// <remarks>
+/// HTTP/2 is only negotiated over TLS; plain http:// base addresses stay on HTTP/1.1 under every profile.
+/// <see cref="HttpClientOptions.MaxConnectionsPerServer"/> caps HTTP/1.1 connections under every profile and,
+/// under <see cref="ProcoreTransportProfile.HighThroughput"/>, HTTP/2 connections as well.
+/// </remarks>
+public static class ProcoreTransport
+{
+    private static readonly TimeSpan KeepAlivePingDelay = TimeSpan.FromSeconds(30);
+    private static readonly TimeSpan KeepAlivePingTimeout = TimeSpan.FromSeconds(10);
+
+    /// <summary>
+    /// Creates the SocketsHttpHandler for the given options
+    /// </summary>
+    /// <param name="options">HTTP client options, including the transport profile</param>
+    /// <returns>A new handler; the caller owns it</returns>
+    /// <exception cref="ArgumentNullException">Thrown when options is null</exception>
+    public static SocketsHttpHandler CreatePrimaryHandler(HttpClientOptions options)
+    {
+        ArgumentNullException.ThrowIfNull(options);
+
+        var handler = new SocketsHttpHandler
+        {
+            MaxConnectionsPerServer = options.MaxConnectionsPerServer,
+            PooledConnectionLifetime = options.PooledConnectionLifetime,
+            PooledConnectionIdleTimeout = options.PooledConnectionIdleTimeout,
+            AutomaticDecompression = options.AutomaticDecompression,
+            UseCookies = false
+        };
+
+        switch (options.TransportProfile)
+        {
+            case ProcoreTransportProfile.HighThroughput:
+                handler.EnableMultipleHttp2Connections = true;
+                break;
+            case ProcoreTransportProfile.LowLatency:
+                // A single connection only helps if it is still open when the next request arrives
+                handler.EnableMultipleHttp2Connections = false;
+                handler.KeepAlivePingPolicy = HttpKeepAlivePingPolicy.Always;
+                handler.KeepAlivePingDelay = KeepAlivePingDelay;
+                handler.KeepAlivePingTimeout = KeepAlivePingTimeout;
+                break;
+        }
+
+        return handler;
+    }
+
+    /// <summary>
+    /// Gets the HTTP version requests are sent with under the given profile
+    /// </summary>
+    /// <param name="profile">The transport profile</param>
+    /// <returns>The requested version; lower versions are accepted when the server does not support it</returns>
+    public static Version GetRequestVersion(ProcoreTransportProfile profile)
+    {
+        return profile == ProcoreTransportProfile.Default ? HttpVersion.Version11 : HttpVersion.Version20;
+    }
+}
@@ -0,0 +1,227 @@
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using Microsoft.Kiota.Abstractions;
+using Microsoft.Kiota.Abstractions.Serialization;
+using Procore.SDK.ConstructionFinancials.TypeMapping;
+using Procore.SDK.Core.TypeMapping;
+using Procore.SDK.FieldProductivity.TypeMapping;
+using Procore.SDK.ProjectManagement.TypeMapping;
+using Procore.SDK.QualitySafety.TypeMapping;
+using Procore.SDK.ResourceManagement.TypeMapping;
+using Procore.SDK.Shared.Authentication;
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using GeneratedCompany = Procore.SDK.Core.Rest.V10.Companies.Companies;
+using GeneratedConstructionFinancialsClient = Procore.SDK.ConstructionFinancials.ConstructionFinancialsClient;
+using GeneratedCoreClient = Procore.SDK.Core.CoreClient;
+using GeneratedFieldProductivityClient = Procore.SDK.FieldProductivity.FieldProductivityClient;
+using GeneratedInvoiceDocument = Procore.SDK.ConstructionFinancials.Rest.V20.Companies.Item.Projects.Item.Compliance.Invoices.Item.Documents.DocumentsGetResponse;
+using GeneratedObservation = Procore.SDK.QualitySafety.Rest.V10.Observations.Items.Items;
+using GeneratedProject = Procore.SDK.ProjectManagement.Rest.V10.Projects.Item.GetResponse;
+using GeneratedProjectManagementClient = Procore.SDK.ProjectManagement.ProjectManagementClient;
+using GeneratedQualitySafetyClient = Procore.SDK.QualitySafety.QualitySafetyClient;
+using GeneratedResource = Procore.SDK.ResourceManagement.Rest.V11.Projects.Item.Schedule.Resources.Item.ResourcesGetResponse;
+using GeneratedResourceManagementClient = Procore.SDK.ResourceManagement.ResourceManagementClient;
+using GeneratedTimecardEntry = Procore.SDK.FieldProductivity.Rest.V10.Companies.Item.Timecard_entries.Item.Timecard_entriesGetResponse;
+using GeneratedUser = Procore.SDK.Core.Rest.V13.Users.Item.UsersGetResponse;
+
+namespace Procore.SDK.Extensions;
+
+/// <summary>
+/// Default <see cref="IProcoreWarmUp"/> that validates the access token, opens pooled connections on the
+/// "Procore" handler and runs one representative model per resource group through the JSON serializers and mappers
+/// </summary>
+/// <remarks>
+/// A failed step is logged and reported in <see cref="ProcoreWarmUpResult.Failures"/> rather than thrown,
+/// since the SDK still works cold; it only serves the first requests more slowly.
+/// </remarks>
+public class ProcoreWarmUp : IProcoreWarmUp
+{
+    private const string JsonContentType = "application/json";
+
+    // One sparse row is enough to JIT the parse, map and write paths; mapping it need not succeed
+    private static readonly byte[] SamplePayload = Encoding.UTF8.GetBytes(
+        "[{\"id\":1,\"name\":\"warm-up\",\"created_at\":\"2024-01-01T00:00:00Z\",\"updated_at\":\"2024-01-01T00:00:00Z\"}]");
+
+    // Constructing a generated root client JITs its request builders and registers its serializers
+    private static readonly Dictionary<string, Func<IRequestAdapter, CancellationToken, Task>> ResourceGroupWarmUps =
+        new(StringComparer.Ordinal)
+        {
+            [ProcoreResourceGroups.Core] = async (adapter, cancellationToken) =>
+            {
+                _ = new GeneratedCoreClient(adapter).Rest.V10.Companies.ToGetRequestInformation();
+                await ExerciseModelAsync(new CompanyTypeMapper(), GeneratedCompany.CreateFromDiscriminatorValue, cancellationToken).ConfigureAwait(false);
+                await ExerciseModelAsync(new UserTypeMapper(), GeneratedUser.CreateFromDiscriminatorValue, cancellationToken).ConfigureAwait(false);
+            },
+            [ProcoreResourceGroups.ProjectManagement] = (adapter, cancellationToken) =>
+            {
+                _ = new GeneratedProjectManagementClient(adapter);
+                return ExerciseModelAsync(new ProjectTypeMapper(), GeneratedProject.CreateFromDiscriminatorValue, cancellationToken);
+            },
+            [ProcoreResourceGroups.QualitySafety] = (adapter, cancellationToken) =>
+            {
+                _ = new GeneratedQualitySafetyClient(adapter);
+                return ExerciseModelAsync(new ObservationTypeMapper(), GeneratedObservation.CreateFromDiscriminatorValue, cancellationToken);
+            },
+            [ProcoreResourceGroups.ConstructionFinancials] = (adapter, cancellationToken) =>
+            {
+                _ = new GeneratedConstructionFinancialsClient(adapter);
+                return ExerciseModelAsync(new InvoiceTypeMapper(), GeneratedInvoiceDocument.CreateFromDiscriminatorValue, cancellationToken);
+            },
+            [ProcoreResourceGroups.FieldProductivity] = (adapter, cancellationToken) =>
+            {
+                _ = new GeneratedFieldProductivityClient(adapter);
+                return ExerciseModelAsync(new TimecardEntryTypeMapper(), GeneratedTimecardEntry.CreateFromDiscriminatorValue, cancellationToken);
+            },
+            [ProcoreResourceGroups.ResourceManagement] = (adapter, cancellationToken) =>
+            {
+                _ = new GeneratedResourceManagementClient(adapter);
+                return ExerciseModelAsync(new ResourceTypeMapper(), GeneratedResource.CreateFromDiscriminatorValue, cancellationToken);
+            }
+        };
+
+    private readonly ITokenManager _tokenManager;
+    private readonly IHttpClientFactory _httpClientFactory;
+    private readonly IRequestAdapter _requestAdapter;
+    private readonly ProcoreWarmUpOptions _options;
+    private readonly ILogger<ProcoreWarmUp> _logger;
+    private readonly object _gate = new();
+    private Task<ProcoreWarmUpResult>? _warmUp;
+
+    /// <summary>
+    /// Creates a new ProcoreWarmUp instance
+    /// </summary>
+    /// <param name="tokenManager">Token manager whose access token is validated</param>
+    /// <param name="httpClientFactory">Factory for the "Procore" HTTP client whose connections are opened</param>
+    /// <param name="requestAdapter">Request adapter the generated clients are built on</param>
+    /// <param name="options">Warm-up options</param>
+    /// <param name="logger">Logger for diagnostic information</param>
+    /// <exception cref="ArgumentNullException">Thrown when any required parameter is null</exception>
+    public ProcoreWarmUp(
+        ITokenManager tokenManager,
+        IHttpClientFactory httpClientFactory,
+        IRequestAdapter requestAdapter,
+        IOptions<ProcoreWarmUpOptions> options,
+        ILogger<ProcoreWarmUp> logger)
+    {
+        _tokenManager = tokenManager ?? throw new ArgumentNullException(nameof(tokenManager));
+        _httpClientFactory = httpClientFactory ?? throw new ArgumentNullException(nameof(httpClientFactory));
+        _requestAdapter = requestAdapter ?? throw new ArgumentNullException(nameof(requestAdapter));
+        _options = (options ?? throw new ArgumentNullException(nameof(options))).Value;
+        _logger = logger ?? throw new ArgumentNullException(nameof(logger));
+    }
+
+    /// <inheritdoc />
+    public ProcoreWarmUpResult? Result => _warmUp is { IsCompletedSuccessfully: true } warmUp ? warmUp.Result : null;
+
+    /// <inheritdoc />
+    public Task<ProcoreWarmUpResult> WarmUpAsync(CancellationToken cancellationToken = default)
+    {
+        Task<ProcoreWarmUpResult> warmUp;
+        lock (_gate)
+        {
+            // Run off the caller's thread so a hosted service does not hold up host startup with JIT work
+            warmUp = _warmUp ??= Task.Run(RunAsync);
+        }
+
+        return warmUp.WaitAsync(cancellationToken);
+    }
+
+    private async Task<ProcoreWarmUpResult> RunAsync()
+    {
+        var stopwatch = Stopwatch.StartNew();
+        var failures = new List<string>();
+        using var timeout = new CancellationTokenSource(_options.Timeout);
+
+        await RunStepAsync("access token", ValidateTokenAsync, failures, timeout.Token).ConfigureAwait(false);
+        await RunStepAsync("connections", OpenConnectionsAsync, failures, timeout.Token).ConfigureAwait(false);
+
+        foreach (var group in _options.ResourceGroups)
+        {
+            if (!ResourceGroupWarmUps.TryGetValue(group, out var warmUpGroup))
+            {
+                failures.Add($"{group}: unknown resource group");
+                continue;
+            }
+
+            await RunStepAsync(group, cancellationToken => warmUpGroup(_requestAdapter, cancellationToken), failures, timeout.Token)
+                .ConfigureAwait(false);
+        }
+
+        stopwatch.Stop();
+        _logger.LogInformation("Procore warm-up completed in {ElapsedMs} ms with {FailureCount} failed steps",
+            stopwatch.ElapsedMilliseconds, failures.Count);
+
+        return new ProcoreWarmUpResult { Duration = stopwatch.Elapsed, Failures = failures };
+    }
+
+    private async Task RunStepAsync(string step, Func<CancellationToken, Task> action, List<string> failures, CancellationToken cancellationToken)
+    {
+        try
+        {
+            await action(cancellationToken).ConfigureAwait(false);
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Procore warm-up step {Step} failed", step);
+            failures.Add($"{step}: {ex.Message}");
+        }
+    }
+
+    private async Task ValidateTokenAsync(CancellationToken cancellationToken)
+    {
+        // Refreshes the stored token when it is close to expiry
+        var token = await _tokenManager.GetAccessTokenAsync(cancellationToken).ConfigureAwait(false);
+        if (token == null)
+        {
+            throw new InvalidOperationException("No access token is stored");
+        }
+    }
+
+    private async Task OpenConnectionsAsync(CancellationToken cancellationToken)
+    {
+        var client = _httpClientFactory.CreateClient(ProcoreApiConstants.HttpClientName);
+
+        // Concurrent requests each need their own HTTP/1.1 connection; HEAD bypasses caching and coalescing
+        var statusCodes = await Task.WhenAll(Enumerable.Range(0, Math.Max(_options.Connections, 1)).Select(async _ =>
+        {
+            using var request = new HttpRequestMessage(HttpMethod.Head, _options.Path);
+            using var response = await client.SendAsync(request, cancellationToken).ConfigureAwait(false);
+            return response.StatusCode;
+        })).ConfigureAwait(false);
+
+        if (statusCodes.Contains(HttpStatusCode.Unauthorized))
+        {
+            throw new InvalidOperationException("The access token was rejected");
+        }
+    }
+
+    private static async Task ExerciseModelAsync<TWrapper, TGenerated>(
+        ITypeMapper<TWrapper, TGenerated> mapper,
+        ParsableFactory<TGenerated> factory,
+        CancellationToken cancellationToken)
+        where TWrapper : class, new()
+        where TGenerated : class, IParsable, new()
+    {
+        using var stream = new MemoryStream(SamplePayload, writable: false);
+        var node = await ParseNodeFactoryRegistry.DefaultInstance
+            .GetRootParseNodeAsync(JsonContentType, stream, cancellationToken).ConfigureAwait(false);
+        var models = node.GetCollectionOfObjectValues(factory).ToList();
+
+        foreach (var model in models)
+        {
+            mapper.TryMapToWrapper(model, out _);
+        }
+
+        using var writer = SerializationWriterFactoryRegistry.DefaultInstance.GetSerializationWriter(JsonContentType);
+        writer.WriteCollectionOfObjectValues(null, models);
+    }
+}
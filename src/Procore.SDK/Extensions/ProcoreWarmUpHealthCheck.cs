@@ -0,0 +1,46 @@
+using Microsoft.Extensions.Diagnostics.HealthChecks;
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Extensions;
+
+/// <summary>
+/// Readiness check that stays unhealthy until the Procore warm-up has finished
+/// </summary>
+/// <remarks>
+/// Reports Degraded when some warm-up steps failed: the SDK still works, but the first requests may be slow.
+/// </remarks>
+public class ProcoreWarmUpHealthCheck : IHealthCheck
+{
+    private readonly IProcoreWarmUp _warmUp;
+
+    /// <summary>
+    /// Creates a new ProcoreWarmUpHealthCheck instance
+    /// </summary>
+    /// <param name="warmUp">The warm-up whose completion is reported</param>
+    /// <exception cref="ArgumentNullException">Thrown when warmUp is null</exception>
+    public ProcoreWarmUpHealthCheck(IProcoreWarmUp warmUp)
+    {
+        _warmUp = warmUp ?? throw new ArgumentNullException(nameof(warmUp));
+    }
+
+    /// <inheritdoc />
+    public Task<HealthCheckResult> CheckHealthAsync(HealthCheckContext context, CancellationToken cancellationToken = default)
+    {
+        var result = _warmUp.Result;
+        if (result == null)
+        {
+            return Task.FromResult(HealthCheckResult.Unhealthy("Procore warm-up has not completed"));
+        }
+
+        if (!result.Succeeded)
+        {
+            return Task.FromResult(HealthCheckResult.Degraded(
+                $"Procore warm-up completed with failed steps: {string.Join("; ", result.Failures)}"));
+        }
+
+        return Task.FromResult(HealthCheckResult.Healthy(
+            $"Procore warm-up completed in {result.Duration.TotalMilliseconds:F0} ms"));
+    }
+}
@@ -0,0 +1,33 @@
+using Microsoft.Extensions.Hosting;
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace Procore.SDK.Extensions;
+
+/// <summary>
+/// Runs the Procore warm-up in the background when the host starts
+/// </summary>
+/// <remarks>
+/// Startup is not held up; pair with <see cref="ProcoreWarmUpHealthCheck"/> so readiness waits for it.
+/// </remarks>
+public sealed class ProcoreWarmUpHostedService : BackgroundService
+{
+    private readonly IProcoreWarmUp _warmUp;
+
+    /// <summary>
+    /// Creates a new ProcoreWarmUpHostedService instance
+    /// </summary>
+    /// <param name="warmUp">The warm-up to run</param>
+    /// <exception cref="ArgumentNullException">Thrown when warmUp is null</exception>
+    public ProcoreWarmUpHostedService(IProcoreWarmUp warmUp)
+    {
+        _warmUp = warmUp ?? throw new ArgumentNullException(nameof(warmUp));
+    }
+
+    /// <inheritdoc />
+    protected override Task ExecuteAsync(CancellationToken stoppingToken)
+    {
+        return _warmUp.WarmUpAsync(stoppingToken);
+    }
+}
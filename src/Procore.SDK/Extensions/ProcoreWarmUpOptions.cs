@@ -0,0 +1,77 @@
+using System;
+
+namespace Procore.SDK.Extensions;
+
+/// <summary>
+/// Configuration options for warming up the Procore HTTP client before it serves traffic
+/// </summary>
+public class ProcoreWarmUpOptions
+{
+    /// <summary>
+    /// Configuration section name in appsettings.json
+    /// </summary>
+    public const string SectionName = "Procore:WarmUp";
+
+    /// <summary>
+    /// Number of pooled connections to open on the "Procore" handler (default: 2)
+    /// </summary>
+    /// <remarks>
+    /// Connections are opened by concurrent HEAD requests, so values above
+    /// <see cref="HttpClientOptions.MaxConnectionsPerServer"/> open no more connections.
+    /// </remarks>
+    public int Connections { get; set; } = 2;
+
+    /// <summary>
+    /// Path requested with HEAD to open connections and validate the access token (default: /rest/v1.0/me)
+    /// </summary>
+    public string Path { get; set; } = "/rest/v1.0/me";
+
+    /// <summary>
+    /// Resource groups whose request builders, serializers and mappers are exercised (default: Core)
+    /// </summary>
+    /// <remarks>
+    /// Values are the package namespaces listed in <see cref="ProcoreResourceGroups"/>.
+    /// </remarks>
+    public string[] ResourceGroups { get; set; } = { ProcoreResourceGroups.Core };
+
+    /// <summary>
+    /// Upper bound on the whole warm-up (default: 30 seconds)
+    /// </summary>
+    public TimeSpan Timeout { get; set; } = TimeSpan.FromSeconds(30);
+}
+
+/// <summary>
+/// Names of the resource groups that can be warmed up, matching their package namespaces
+/// </summary>
+public static class ProcoreResourceGroups
+{
+    /// <summary>
+    /// Companies, users and documents
+    /// </summary>
+    public const string Core = "Procore.SDK.Core";
+
+    /// <summary>
+    /// Projects
+    /// </summary>
+    public const string ProjectManagement = "Procore.SDK.ProjectManagement";
+
+    /// <summary>
+    /// Observations and safety incidents
+    /// </summary>
+    public const string QualitySafety = "Procore.SDK.QualitySafety";
+
+    /// <summary>
+    /// Invoices and cost codes
+    /// </summary>
+    public const string ConstructionFinancials = "Procore.SDK.ConstructionFinancials";
+
+    /// <summary>
+    /// Timecard entries
+    /// </summary>
+    public const string FieldProductivity = "Procore.SDK.FieldProductivity";
+
+    /// <summary>
+    /// Resources and workforce assignments
+    /// </summary>
+    public const string ResourceManagement = "Procore.SDK.ResourceManagement";
+}
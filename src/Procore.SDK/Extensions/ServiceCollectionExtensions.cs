@@ -6,11 +6,21 @@ using Microsoft.Extensions.Http;
 using Microsoft.Extensions.Logging;
 using Microsoft.Extensions.Options;
 using Microsoft.Kiota.Abstractions;
+using Microsoft.Kiota.Abstractions.Serialization;
 using Microsoft.Kiota.Http.HttpClientLibrary;
+using Microsoft.Kiota.Serialization.Json;
 using Procore.SDK.Core;
 using Procore.SDK.Core.Models;
+using Procore.SDK.Core.Resilience;
+using Procore.SDK.Core.Search;
+using Procore.SDK.Core.Sync;
 using Procore.SDK.Shared.Authentication;
+using Procore.SDK.Shared.Http;
+using Procore.SDK.Shared.RateLimiting;
+using Procore.SDK.Shared.Serialization;
 using System;
+using System.Linq;
+using System.Net;
 using System.Net.Http;
 using System.Threading;
 using System.Threading.Tasks;
@@ -26,6 +36,11 @@ internal static class ProcoreApiConstants
     /// The default base address for the Procore API.
     /// </summary>
     internal const string DefaultBaseAddress = "https://api.procore.com";
+
+    /// <summary>
+    /// The name of the HTTP client registered for the Procore API.
+    /// </summary>
+    internal const string HttpClientName = "Procore";
 }
 
 /// <summary>
@@ -81,9 +96,39 @@ public static class ServiceCollectionExtensions
             services.PostConfigure(configureHttp);
         }
 
+        // Configure client-side rate limiting options
+        services.Configure<RateLimitOptions>(configuration.GetSection(RateLimitOptions.SectionName));
+
+        // Configure resilience options (hedging on the "Procore" client is opt-in)
+        services.Configure<ResilienceOptions>(configuration.GetSection(ResilienceOptions.SectionName));
+
+        // Configure request coalescing options (opt-in)
+        services.Configure<RequestCoalescingOptions>(configuration.GetSection(RequestCoalescingOptions.SectionName));
+
+        // Configure response caching options (opt-in)
+        services.Configure<ResponseCacheOptions>(configuration.GetSection(ResponseCacheOptions.SectionName));
+
+        // Configure delta sync options
+        services.Configure<DeltaSyncOptions>(configuration.GetSection(DeltaSyncOptions.SectionName));
+        
+        // Configure lookup index options
+        services.Configure<LookupIndexOptions>(configuration.GetSection(LookupIndexOptions.SectionName));
+
+        // Configure deserialization options (unknown JSON properties are retained by default)
+        services.Configure<DeserializationOptions>(configuration.GetSection(DeserializationOptions.SectionName));
+
+        // Configure the multi-tenant token pool
+        services.Configure<TokenPoolOptions>(configuration.GetSection(TokenPoolOptions.SectionName));
+
+        // Configure warm-up options (runs on startup only with AddProcoreWarmUp)
+        services.Configure<ProcoreWarmUpOptions>(configuration.GetSection(ProcoreWarmUpOptions.SectionName));
+
         // Register authentication services
         RegisterAuthenticationServices(services);
 
+        // Register HTTP pipeline handlers (caching, coalescing, hedging, rate limiting)
+        RegisterHttpPipelineServices(services);
+
         // Register HTTP client services
         RegisterHttpClientServices(services);
 
@@ -144,6 +189,7 @@ public static class ServiceCollectionExtensions
 
         // Register all services
         RegisterAuthenticationServices(services);
+        RegisterHttpPipelineServices(services);
         RegisterHttpClientServices(services);
         RegisterKiotaServices(services);
         RegisterClientServices(services);
@@ -152,6 +198,44 @@ public static class ServiceCollectionExtensions
         return services;
     }
 
+    /// <summary>
+    /// Warms up the Procore HTTP client in the background when the host starts, and adds a
+    /// "procore-warmup" readiness check (tagged "ready") that is unhealthy until the warm-up finishes
+    /// </summary>
+    /// <remarks>
+    /// Call after AddProcoreSDK. Without a host, resolve <see cref="IProcoreWarmUp"/> and await
+    /// <see cref="IProcoreWarmUp.WarmUpAsync"/> before the first request instead.
+    /// </remarks>
+    /// <param name="services">The service collection</param>
+    /// <param name="configure">Optional action to configure warm-up options</param>
+    /// <returns>The service collection for chaining</returns>
+    public static IServiceCollection AddProcoreWarmUp(
+        this IServiceCollection services,
+        Action<ProcoreWarmUpOptions>? configure = null)
+    {
+        ArgumentNullException.ThrowIfNull(services);
+
+        if (configure != null)
+        {
+            services.Configure(configure);
+        }
+
+        // Health check names must be unique, so repeated calls only add configuration
+        if (services.Any(descriptor => descriptor.ImplementationType == typeof(ProcoreWarmUpHostedService)))
+        {
+            return services;
+        }
+
+        // IProcoreWarmUp itself is registered by AddProcoreSDK
+        services.AddHostedService<ProcoreWarmUpHostedService>();
+        services.AddHealthChecks()
+            .AddCheck<ProcoreWarmUpHealthCheck>("procore-warmup",
+                HealthStatus.Unhealthy,
+                new[] { "procore", "ready" });
+
+        return services;
+    }
+
     private static void RegisterAuthenticationServices(IServiceCollection services)
     {
         // Register token storage (in-memory by default, can be overridden)
@@ -159,6 +243,9 @@ public static class ServiceCollectionExtensions
         
         // Register token manager
         services.TryAddSingleton<ITokenManager, TokenManager>();
+
+        // Register multi-tenant token manager (pair with a per-entry store such as DirectoryTokenStorage)
+        services.TryAddSingleton<ITenantTokenManager, TenantTokenManager>();
         
         // Register OAuth flow helper
         services.TryAddSingleton<OAuthFlowHelper>();
@@ -167,6 +254,28 @@ public static class ServiceCollectionExtensions
         services.TryAddSingleton<ProcoreAuthHandler>();
     }
 
+    private static void RegisterHttpPipelineServices(IServiceCollection services)
+    {
+        // Buckets live in a singleton registry so every client sharing a token shares its budget
+        services.TryAddSingleton<RateLimiterRegistry>();
+        services.TryAddTransient<ProcoreRateLimitHandler>();
+
+        // In-flight requests are tracked in a singleton so they are shared across handler rotations
+        services.TryAddSingleton<RequestCoalescer>();
+        services.TryAddTransient<RequestCoalescingHandler>();
+
+        // Hedging passes requests straight through unless Procore:Resilience:Hedging:Enabled is set
+        services.TryAddSingleton<HedgingBudget>();
+        services.TryAddSingleton<RouteLatencyTracker>();
+        services.TryAddTransient<ProcoreHedgingHandler>();
+
+        // Register response cache store (in-memory by default, can be overridden e.g. with FileResponseCacheStore)
+        services.TryAddSingleton<IResponseCacheStore, MemoryResponseCacheStore>();
+        services.TryAddTransient<ResponseCachingHandler>();
+
+        services.TryAddTransient<ProcoreHttpVersionHandler>();
+    }
+
     private static void RegisterHttpClientServices(IServiceCollection services)
     {
         // Register named HTTP client for Procore API
@@ -177,16 +286,30 @@ public static class ServiceCollectionExtensions
             client.Timeout = options.Timeout;
         })
         .AddHttpMessageHandler<ProcoreAuthHandler>()
+        .AddHttpMessageHandler<ResponseCachingHandler>()
+        .AddHttpMessageHandler<RequestCoalescingHandler>()
+        .AddHttpMessageHandler<ProcoreHedgingHandler>()
+        .AddHttpMessageHandler<ProcoreRateLimitHandler>()
+        .AddHttpMessageHandler<ProcoreHttpVersionHandler>()
         .ConfigurePrimaryHttpMessageHandler(serviceProvider =>
         {
             var options = serviceProvider.GetRequiredService<IOptions<HttpClientOptions>>().Value;
-            var handler = new SocketsHttpHandler
-            {
-                MaxConnectionsPerServer = options.MaxConnectionsPerServer,
-                PooledConnectionLifetime = options.PooledConnectionLifetime,
-                PooledConnectionIdleTimeout = options.PooledConnectionIdleTimeout,
-                UseCookies = false
-            };
+            return ProcoreTransport.CreatePrimaryHandler(options);
+        });
+
+        // Document content lives at presigned storage URLs on other hosts, so it is fetched by a client
+        // without the auth, caching and coalescing handlers of the "Procore" client
+        services.AddHttpClient(ProcoreCoreClient.ContentHttpClientName, (serviceProvider, client) =>
+        {
+            client.Timeout = serviceProvider.GetRequiredService<IOptions<HttpClientOptions>>().Value.Timeout;
+        })
+        .ConfigurePrimaryHttpMessageHandler(serviceProvider =>
+        {
+            var options = serviceProvider.GetRequiredService<IOptions<HttpClientOptions>>().Value;
+            var handler = ProcoreTransport.CreatePrimaryHandler(options);
+
+            // Byte ranges refer to the stored bytes, so content must not be decoded on the way in
+            handler.AutomaticDecompression = DecompressionMethods.None;
             return handler;
         });
 
@@ -203,17 +326,41 @@ public static class ServiceCollectionExtensions
             var httpClientFactory = serviceProvider.GetRequiredService<IHttpClientFactory>();
             var httpClient = httpClientFactory.CreateClient("Procore");
             var logger = serviceProvider.GetService<ILogger<HttpClientRequestAdapter>>();
+            var deserializationOptions = serviceProvider.GetService<IOptions<DeserializationOptions>>()?.Value;
+
+            // Register the JSON serializers through Kiota's new()-constrained helpers instead of relying on a
+            // generated client constructor having run first, so trimming keeps the concrete factory types
+            ApiClientBuilder.RegisterDefaultSerializer<JsonSerializationWriterFactory>();
+            ApiClientBuilder.RegisterDefaultDeserializer<JsonParseNodeFactory>();
+
+            // Only wrap the parse node factory when some model group drops unknown properties
+            var parseNodeFactory = deserializationOptions?.DiscardsAdditionalData == true
+                ? new AdditionalDataRetentionParseNodeFactory(ParseNodeFactoryRegistry.DefaultInstance, deserializationOptions)
+                : null;
             
             return new HttpClientRequestAdapter(
                 authenticationProvider: new EmptyAuthenticationProvider(), // Auth is handled by our handler
+                parseNodeFactory: parseNodeFactory,
                 httpClient: httpClient);
         });
     }
 
     private static void RegisterClientServices(IServiceCollection services)
     {
-        // Register Core client
-        services.TryAddScoped<ICoreClient, ProcoreCoreClient>();
+        // Register Core client. It holds no per-request state (cancellation and correlation are per call),
+        // so one instance serves every scope; register ICoreClient as scoped first to opt out
+        services.TryAddSingleton<ICoreClient, ProcoreCoreClient>();
+
+        // Lookup indexes are shared by every client instance so that repeated lookups don't refetch lists;
+        // they are kept per access token from ITokenManager, so one user's lookups never serve another's
+        services.TryAddSingleton<CoreLookupIndexes>();
+
+        // Register delta sync; register a FileSyncCheckpointStore first to resume across process restarts
+        services.TryAddSingleton<ISyncCheckpointStore, InMemorySyncCheckpointStore>();
+        services.TryAddSingleton<DeltaSyncEngine>();
+
+        // Register warm-up so WarmUpAsync can be awaited directly, e.g. by short-lived jobs
+        services.TryAddSingleton<IProcoreWarmUp, ProcoreWarmUp>();
         
         // Register generated Kiota clients (when available)
         // These would be registered when the generation issues are resolved
@@ -258,6 +405,16 @@ public class HttpClientOptions
     /// How long pooled connections can be idle
     /// </summary>
     public TimeSpan PooledConnectionIdleTimeout { get; set; } = TimeSpan.FromMinutes(2);
+
+    /// <summary>
+    /// Connection profile selecting the HTTP version and how connections are shared
+    /// </summary>
+    public ProcoreTransportProfile TransportProfile { get; set; } = ProcoreTransportProfile.Default;
+
+    /// <summary>
+    /// Response encodings to advertise and decompress; JSON list responses typically shrink several-fold
+    /// </summary>
+    public DecompressionMethods AutomaticDecompression { get; set; } = DecompressionMethods.GZip | DecompressionMethods.Brotli;
 }
 
 /// <summary>
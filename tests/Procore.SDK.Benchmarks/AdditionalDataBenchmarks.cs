@@ -0,0 +1,70 @@
+using Microsoft.Kiota.Abstractions.Serialization;
+using Microsoft.Kiota.Serialization.Json;
+using Procore.SDK.Core.Rest.V11.Companies.Item.Users;
+using Procore.SDK.FieldProductivity.Rest.V10.Companies.Item.Timecard_entries.Item;
+using Procore.SDK.Shared.Serialization;
+using GeneratedObservation = Procore.SDK.QualitySafety.Rest.V10.Observations.Items.Items;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Benchmarks for retaining versus discarding unknown JSON properties on large list responses
+/// Target: Discard allocates no per-row AdditionalData entries and keeps Gen1/Gen2 collections flat
+/// </summary>
+[MemoryDiagnoser]
+[SimpleJob]
+public class AdditionalDataBenchmarks
+{
+    private const string JsonContentType = "application/json";
+
+    // Procore responses typically carry a handful of company custom fields per row
+    private const int UnknownFieldCount = 10;
+
+    private byte[] _users = null!;
+    private byte[] _timecardEntries = null!;
+    private byte[] _observations = null!;
+    private IAsyncParseNodeFactory _parseNodeFactory = null!;
+
+    [Params(10_000, 50_000)]
+    public int Count { get; set; }
+
+    [Params(AdditionalDataRetention.Retain, AdditionalDataRetention.Discard)]
+    public AdditionalDataRetention Retention { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _users = BenchmarkPayloads.Users(Count, UnknownFieldCount);
+        _timecardEntries = BenchmarkPayloads.TimecardEntries(Count, UnknownFieldCount);
+        _observations = BenchmarkPayloads.Observations(Count, UnknownFieldCount);
+        _parseNodeFactory = new AdditionalDataRetentionParseNodeFactory(
+            new JsonParseNodeFactory(),
+            new DeserializationOptions { AdditionalData = Retention });
+    }
+
+    [Benchmark]
+    public Task<List<Users>> DeserializeUsers()
+    {
+        return DeserializeAsync(_users, Users.CreateFromDiscriminatorValue);
+    }
+
+    [Benchmark]
+    public Task<List<Timecard_entriesGetResponse>> DeserializeTimecardEntries()
+    {
+        return DeserializeAsync(_timecardEntries, Timecard_entriesGetResponse.CreateFromDiscriminatorValue);
+    }
+
+    [Benchmark]
+    public Task<List<GeneratedObservation>> DeserializeObservations()
+    {
+        return DeserializeAsync(_observations, GeneratedObservation.CreateFromDiscriminatorValue);
+    }
+
+    private async Task<List<T>> DeserializeAsync<T>(byte[] json, ParsableFactory<T> factory)
+        where T : IParsable
+    {
+        using var stream = new MemoryStream(json, writable: false);
+        var node = await _parseNodeFactory.GetRootParseNodeAsync(JsonContentType, stream);
+        return node.GetCollectionOfObjectValues(factory).ToList();
+    }
+}
@@ -0,0 +1,17 @@
+using BenchmarkDotNet.Configs;
+using BenchmarkDotNet.Diagnosers;
+using BenchmarkDotNet.Exporters.Json;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Shared configuration: memory diagnostics for every benchmark and full JSON results
+/// (BenchmarkDotNet.Artifacts/results/*-report-full.json) so runs can be compared across commits
+/// </summary>
+public static class BenchmarkConfig
+{
+    public static IConfig Create() =>
+        DefaultConfig.Instance
+            .AddDiagnoser(MemoryDiagnoser.Default)
+            .AddExporter(JsonExporter.Full);
+}
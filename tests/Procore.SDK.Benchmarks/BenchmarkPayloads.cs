@@ -0,0 +1,158 @@
+using System.Text.Json;
+using Microsoft.Kiota.Abstractions.Serialization;
+using Microsoft.Kiota.Serialization.Json;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Deterministic JSON payloads shaped like Procore API list responses
+/// </summary>
+public static class BenchmarkPayloads
+{
+    private static readonly DateTimeOffset BaseTime = new(2024, 1, 1, 8, 0, 0, TimeSpan.Zero);
+
+    /// <summary>
+    /// Companies as returned by GET /rest/v1.0/companies
+    /// </summary>
+    public static byte[] Companies(int count) => WriteArray(count, (writer, i) =>
+    {
+        writer.WriteNumber("id", i + 1);
+        writer.WriteString("name", $"Company {i + 1}");
+        writer.WriteBoolean("is_active", i % 10 != 0);
+        writer.WriteBoolean("my_company", i == 0);
+        writer.WriteNull("logo_url");
+    });
+
+    /// <summary>
+    /// Users as returned by GET /rest/v1.1/companies/{id}/users
+    /// </summary>
+    public static byte[] Users(int count, int unknownFieldCount = 0) => WriteArray(count, (writer, i) =>
+    {
+        writer.WriteNumber("id", i + 1);
+        writer.WriteString("first_name", $"First{i}");
+        writer.WriteString("last_name", $"Last{i}");
+        writer.WriteString("name", $"First{i} Last{i}");
+        writer.WriteString("email_address", $"user{i}@example.com");
+        writer.WriteString("job_title", "Superintendent");
+        writer.WriteString("business_phone", "555-0100");
+        writer.WriteString("mobile_phone", "555-0199");
+        writer.WriteString("city", "Carpinteria");
+        writer.WriteString("state_code", "CA");
+        writer.WriteString("zip", "93013");
+        writer.WriteBoolean("is_active", true);
+        writer.WriteBoolean("is_employee", i % 3 == 0);
+        writer.WriteString("created_at", BaseTime.AddMinutes(i));
+        writer.WriteString("updated_at", BaseTime.AddMinutes(i + 30));
+        WriteUnknownFields(writer, i, unknownFieldCount);
+    });
+
+    /// <summary>
+    /// Timecard entries as returned by the timecard entry endpoints
+    /// </summary>
+    public static byte[] TimecardEntries(int count, int unknownFieldCount = 0) => WriteArray(count, (writer, i) =>
+    {
+        writer.WriteNumber("id", i + 1);
+        writer.WriteString("date", BaseTime.AddDays(i % 365).ToString("yyyy-MM-dd"));
+        writer.WriteString("hours", "8.0");
+        writer.WriteString("approval_status", i % 4 == 0 ? "pending" : "approved");
+        writer.WriteBoolean("billable", i % 2 == 0);
+        writer.WriteString("description", "Concrete formwork");
+        writer.WriteString("timecard_type", "time_and_materials");
+        writer.WriteString("time_in", BaseTime.AddDays(i % 365));
+        writer.WriteString("time_out", BaseTime.AddDays(i % 365).AddHours(8));
+        writer.WriteString("created_at", BaseTime.AddMinutes(i));
+        writer.WriteString("updated_at", BaseTime.AddMinutes(i + 30));
+        writer.WriteStartObject("project");
+        writer.WriteNumber("id", 1000 + (i % 50));
+        writer.WriteString("name", $"Project {i % 50}");
+        writer.WriteEndObject();
+        WriteUnknownFields(writer, i, unknownFieldCount);
+    });
+
+    /// <summary>
+    /// Projects as returned by GET /rest/v1.0/companies/{id}/projects and GET /rest/v1.0/projects/{id}
+    /// </summary>
+    public static byte[] Projects(int count) => WriteArray(count, (writer, i) =>
+    {
+        writer.WriteNumber("id", i + 1);
+        writer.WriteString("name", $"Project {i + 1}");
+        writer.WriteString("display_name", $"P-{i + 1} Project {i + 1}");
+        writer.WriteString("project_number", $"P-{i + 1}");
+        writer.WriteBoolean("active", i % 5 != 0);
+        writer.WriteString("address", "6309 Carpinteria Ave");
+        writer.WriteString("city", "Carpinteria");
+        writer.WriteString("state_code", "CA");
+        writer.WriteString("zip", "93013");
+        writer.WriteString("start_date", BaseTime.AddDays(i % 365).ToString("yyyy-MM-dd"));
+        writer.WriteString("created_at", BaseTime.AddMinutes(i));
+        writer.WriteString("updated_at", BaseTime.AddMinutes(i + 30));
+    });
+
+    /// <summary>
+    /// Observation items as returned by GET /rest/v1.0/observations/items
+    /// </summary>
+    public static byte[] Observations(int count, int unknownFieldCount = 0) => WriteArray(count, (writer, i) =>
+    {
+        writer.WriteNumber("id", i + 1);
+        writer.WriteString("name", $"Observation {i + 1}");
+        writer.WriteString("number", (i + 1).ToString());
+        writer.WriteString("description", "Missing guardrail on level 3");
+        writer.WriteBoolean("personal", false);
+        writer.WriteString("due_date", BaseTime.AddDays(14 + i % 30).ToString("yyyy-MM-dd"));
+        writer.WriteString("created_at", BaseTime.AddMinutes(i));
+        writer.WriteString("updated_at", BaseTime.AddMinutes(i + 30));
+        WriteUnknownFields(writer, i, unknownFieldCount);
+    });
+
+    /// <summary>
+    /// Schedule resources as returned by GET /rest/v1.1/projects/{id}/schedule/resources
+    /// </summary>
+    public static byte[] Resources(int count) => WriteArray(count, (writer, i) =>
+    {
+        writer.WriteNumber("id", i + 1);
+        writer.WriteString("name", $"Resource {i + 1}");
+        writer.WriteNumber("company_id", 1);
+        writer.WriteNumber("project_id", 1000 + (i % 50));
+        writer.WriteString("source_uid", Guid.Empty.ToString());
+    });
+
+    /// <summary>
+    /// Deserializes a JSON array with the Kiota JSON parse node, the way generated request builders do
+    /// </summary>
+    public static List<T> Deserialize<T>(byte[] json, ParsableFactory<T> factory)
+        where T : IParsable
+    {
+        using var document = JsonDocument.Parse(json);
+        var node = new JsonParseNode(document.RootElement);
+        return node.GetCollectionOfObjectValues(factory).ToList();
+    }
+
+    /// <summary>
+    /// Writes company custom fields and other properties the generated models do not declare
+    /// </summary>
+    private static void WriteUnknownFields(Utf8JsonWriter writer, int index, int count)
+    {
+        for (var field = 0; field < count; field++)
+        {
+            writer.WriteString($"custom_field_{field + 1}", $"Value {index}-{field}");
+        }
+    }
+
+    private static byte[] WriteArray(int count, Action<Utf8JsonWriter, int> writeItem)
+    {
+        using var stream = new MemoryStream();
+        using (var writer = new Utf8JsonWriter(stream))
+        {
+            writer.WriteStartArray();
+            for (var i = 0; i < count; i++)
+            {
+                writer.WriteStartObject();
+                writeItem(writer, i);
+                writer.WriteEndObject();
+            }
+            writer.WriteEndArray();
+        }
+
+        return stream.ToArray();
+    }
+}
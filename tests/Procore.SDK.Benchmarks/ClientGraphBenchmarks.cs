@@ -0,0 +1,64 @@
+using Microsoft.Kiota.Abstractions;
+using Microsoft.Kiota.Abstractions.Authentication;
+using Microsoft.Kiota.Http.HttpClientLibrary;
+using Procore.SDK.Core;
+using Procore.SDK.Core.Models;
+using Procore.SDK.Core.Search;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Benchmarks for a scope-per-request workload, as in samples/WebSample, with the Core client
+/// registered per scope versus once for the container
+/// Target: Singleton allocates no client, generated request-builder root or mappers per request
+/// </summary>
+[MemoryDiagnoser]
+[SimpleJob]
+public class ClientGraphBenchmarks
+{
+    private HttpClient _httpClient = null!;
+    private ServiceProvider _serviceProvider = null!;
+
+    [Params(ServiceLifetime.Scoped, ServiceLifetime.Singleton)]
+    public ServiceLifetime Lifetime { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _httpClient = new HttpClient(new FakeProcoreApiHandler()
+            .Route("/rest/v1.0/companies", BenchmarkPayloads.Companies(10)));
+        var adapter = new HttpClientRequestAdapter(new AnonymousAuthenticationProvider(), httpClient: _httpClient)
+        {
+            BaseUrl = "https://api.procore.com"
+        };
+
+        var services = new ServiceCollection();
+        services.AddSingleton<IRequestAdapter>(adapter);
+        services.AddSingleton<CoreLookupIndexes>();
+        services.Add(new ServiceDescriptor(typeof(ICoreClient), typeof(ProcoreCoreClient), Lifetime));
+        _serviceProvider = services.BuildServiceProvider();
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _serviceProvider?.Dispose();
+        _httpClient?.Dispose();
+    }
+
+    [Benchmark]
+    public object ResolveClientPerScope()
+    {
+        using var scope = _serviceProvider.CreateScope();
+        return scope.ServiceProvider.GetRequiredService<ICoreClient>();
+    }
+
+    [Benchmark]
+    public async Task<int> RequestPerScope()
+    {
+        using var scope = _serviceProvider.CreateScope();
+        var client = scope.ServiceProvider.GetRequiredService<ICoreClient>();
+        var companies = await client.GetCompaniesAsync();
+        return companies.Count();
+    }
+}
@@ -0,0 +1,47 @@
+using Procore.SDK.Core.Rest.V10.Companies;
+using Procore.SDK.Core.Rest.V11.Companies.Item.Users;
+using Procore.SDK.FieldProductivity.Rest.V10.Companies.Item.Timecard_entries.Item;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Benchmarks for Kiota JSON deserialization of large list responses
+/// Target: linear scaling with item count, no per-item allocations beyond the model itself
+/// </summary>
+[MemoryDiagnoser]
+[SimpleJob]
+public class DeserializationBenchmarks
+{
+    private byte[] _companies = null!;
+    private byte[] _users = null!;
+    private byte[] _timecardEntries = null!;
+
+    [Params(1_000, 10_000, 50_000)]
+    public int Count { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _companies = BenchmarkPayloads.Companies(Count);
+        _users = BenchmarkPayloads.Users(Count);
+        _timecardEntries = BenchmarkPayloads.TimecardEntries(Count);
+    }
+
+    [Benchmark]
+    public List<Companies> DeserializeCompanies()
+    {
+        return BenchmarkPayloads.Deserialize(_companies, Companies.CreateFromDiscriminatorValue);
+    }
+
+    [Benchmark]
+    public List<Users> DeserializeUsers()
+    {
+        return BenchmarkPayloads.Deserialize(_users, Users.CreateFromDiscriminatorValue);
+    }
+
+    [Benchmark]
+    public List<Timecard_entriesGetResponse> DeserializeTimecardEntries()
+    {
+        return BenchmarkPayloads.Deserialize(_timecardEntries, Timecard_entriesGetResponse.CreateFromDiscriminatorValue);
+    }
+}
@@ -0,0 +1,58 @@
+using System.Net;
+using System.Net.Http.Headers;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// In-process stand-in for the Procore API that answers every request from memory,
+/// so benchmarks measure the SDK rather than the network
+/// </summary>
+public sealed class FakeProcoreApiHandler : HttpMessageHandler
+{
+    private readonly List<(string PathSuffix, byte[] Body)> _routes = new();
+    private readonly byte[] _defaultBody;
+
+    public FakeProcoreApiHandler(byte[]? defaultBody = null)
+    {
+        _defaultBody = defaultBody ?? "[]"u8.ToArray();
+    }
+
+    /// <summary>
+    /// Number of requests answered
+    /// </summary>
+    public int RequestCount { get; private set; }
+
+    /// <summary>
+    /// Serves a body for requests whose path ends with the given suffix
+    /// </summary>
+    public FakeProcoreApiHandler Route(string pathSuffix, byte[] body)
+    {
+        _routes.Add((pathSuffix, body));
+        return this;
+    }
+
+    protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+    {
+        RequestCount++;
+
+        var path = request.RequestUri?.AbsolutePath ?? string.Empty;
+        var body = _defaultBody;
+        foreach (var (suffix, routeBody) in _routes)
+        {
+            if (path.EndsWith(suffix, StringComparison.Ordinal))
+            {
+                body = routeBody;
+                break;
+            }
+        }
+
+        var content = new ByteArrayContent(body);
+        content.Headers.ContentType = new MediaTypeHeaderValue("application/json");
+
+        return Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK)
+        {
+            Content = content,
+            RequestMessage = request
+        });
+    }
+}
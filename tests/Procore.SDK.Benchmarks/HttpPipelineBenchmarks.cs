@@ -0,0 +1,80 @@
+using Microsoft.Extensions.Logging.Abstractions;
+using Procore.SDK.Core.Resilience;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Benchmarks for the per-request cost of the SDK handler pipeline
+/// (ProcoreAuthHandler → ProcoreResilienceHandler → primary handler)
+/// Target: &lt;10μs overhead per request over a bare HttpClient
+/// </summary>
+/// <remarks>
+/// The primary handler is an in-process fake in place of SocketsHttpHandler so that
+/// only the SDK's handlers are measured, not the network.
+/// </remarks>
+[MemoryDiagnoser]
+[SimpleJob]
+public class HttpPipelineBenchmarks
+{
+    private const string UsersUri = "https://api.procore.com/rest/v1.1/companies/1/users";
+
+    private HttpClient _bareClient = null!;
+    private HttpClient _pipelineClient = null!;
+
+    [GlobalSetup]
+    public async Task Setup()
+    {
+        var body = BenchmarkPayloads.Users(10);
+        _bareClient = new HttpClient(new FakeProcoreApiHandler(body));
+
+        var storage = new InMemoryTokenStorage();
+        var tokenManager = new TokenManager(
+            storage,
+            Options.Create(new ProcoreAuthOptions { ClientId = "benchmark-client", ClientSecret = "benchmark-secret" }),
+            new HttpClient(new FakeProcoreApiHandler()),
+            NullLogger<TokenManager>.Instance);
+        await tokenManager.StoreTokenAsync(new AccessToken(
+            "benchmark-access-token",
+            "Bearer",
+            DateTimeOffset.UtcNow.AddDays(1),
+            "benchmark-refresh-token",
+            ["read"]));
+
+        var resilienceOptions = Options.Create(new ResilienceOptions { Logging = { LogPerformanceMetrics = false } });
+        var resilienceHandler = new ProcoreResilienceHandler(
+            new PolicyFactory(resilienceOptions, NullLogger<PolicyFactory>.Instance),
+            NullLogger<ProcoreResilienceHandler>.Instance,
+            resilienceOptions)
+        {
+            InnerHandler = new FakeProcoreApiHandler(body)
+        };
+
+        var authHandler = new ProcoreAuthHandler(tokenManager, NullLogger<ProcoreAuthHandler>.Instance)
+        {
+            InnerHandler = resilienceHandler
+        };
+
+        _pipelineClient = new HttpClient(authHandler);
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _bareClient?.Dispose();
+        _pipelineClient?.Dispose();
+    }
+
+    [Benchmark(Baseline = true)]
+    public async Task<int> BareHttpClient()
+    {
+        using var response = await _bareClient.GetAsync(UsersUri);
+        return (int)response.StatusCode;
+    }
+
+    [Benchmark]
+    public async Task<int> AuthAndResiliencePipeline()
+    {
+        using var response = await _pipelineClient.GetAsync(UsersUri);
+        return (int)response.StatusCode;
+    }
+}
@@ -0,0 +1,124 @@
+using Microsoft.Extensions.Logging;
+using Microsoft.Kiota.Abstractions.Authentication;
+using Microsoft.Kiota.Http.HttpClientLibrary;
+using Procore.SDK.Core;
+using Procore.SDK.Core.Logging;
+using Procore.SDK.Core.Models;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Benchmarks for the logging hot path of wrapper operations
+/// Target: zero allocations when debug and information logging are disabled
+/// </summary>
+[MemoryDiagnoser]
+[SimpleJob]
+public class LoggingBenchmarks
+{
+    private const string Operation = "GetResourcesAsync";
+    private const string CorrelationId = "6f1c2d3e-0000-4000-8000-000000000000";
+    private const int CompanyId = 1;
+
+    private static readonly Action<ILogger, string, string, Exception?> LogExecutingOperation =
+        LoggerMessage.Define<string, string>(
+            LogLevel.Debug,
+            new EventId(2000, "ExecutingOperation"),
+            "Executing operation {Operation} with correlation ID {CorrelationId}");
+
+    private ILoggerFactory _loggerFactory = null!;
+    private ILogger _logger = null!;
+    private StructuredLogger _structuredLogger = null!;
+    private HttpClient _httpClient = null!;
+    private ProcoreCoreClient _clientWithoutLogger = null!;
+    private ProcoreCoreClient _clientWithLogger = null!;
+    private PaginationOptions _pagination = null!;
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        // Warning is the production default; debug and information messages are filtered out
+        _loggerFactory = LoggerFactory.Create(builder => builder.SetMinimumLevel(LogLevel.Warning));
+        _logger = _loggerFactory.CreateLogger("Procore.SDK.Benchmarks");
+        _structuredLogger = new StructuredLogger(_loggerFactory.CreateLogger<StructuredLogger>());
+
+        _httpClient = new HttpClient(new FakeProcoreApiHandler().Route("/users", BenchmarkPayloads.Users(10)));
+        var adapter = new HttpClientRequestAdapter(new AnonymousAuthenticationProvider(), httpClient: _httpClient)
+        {
+            BaseUrl = "https://api.procore.com"
+        };
+
+        _clientWithoutLogger = new ProcoreCoreClient(adapter);
+        _clientWithLogger = new ProcoreCoreClient(adapter, _loggerFactory.CreateLogger<ProcoreCoreClient>(), _structuredLogger);
+        _pagination = new PaginationOptions { Page = 1, PerPage = 10 };
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _clientWithoutLogger?.Dispose();
+        _clientWithLogger?.Dispose();
+        _httpClient?.Dispose();
+        _loggerFactory?.Dispose();
+    }
+
+    /// <summary>
+    /// Previous pattern: extension method call with boxed arguments and an eager correlation ID
+    /// </summary>
+    [Benchmark(Baseline = true)]
+    public void ExtensionMethodWithEagerCorrelationId()
+    {
+        var correlationId = Guid.NewGuid().ToString();
+        _logger.LogDebug("Executing operation {Operation} with correlation ID {CorrelationId}", Operation, correlationId);
+    }
+
+    /// <summary>
+    /// Current pattern: precompiled message behind an IsEnabled guard
+    /// </summary>
+    [Benchmark]
+    public void LoggerMessageWithGuard()
+    {
+        if (_logger.IsEnabled(LogLevel.Debug))
+        {
+            LogExecutingOperation(_logger, Operation, CorrelationId, null);
+        }
+    }
+
+    /// <summary>
+    /// Operation scope with information logging disabled
+    /// </summary>
+    [Benchmark]
+    public void BeginOperationDisabled()
+    {
+        using var scope = _structuredLogger.BeginOperation(Operation, CorrelationId);
+    }
+
+    /// <summary>
+    /// Performance metrics for a successful operation with information logging disabled
+    /// </summary>
+    [Benchmark]
+    public void LogPerformanceMetricsDisabled()
+    {
+        _structuredLogger.LogPerformanceMetrics(Operation, CorrelationId, TimeSpan.FromMilliseconds(42), success: true);
+    }
+
+    /// <summary>
+    /// Wrapper client call with no loggers, as the reference point for the logged call below
+    /// </summary>
+    [Benchmark]
+    public async Task<int> ClientMethodWithoutLogger()
+    {
+        var page = await _clientWithoutLogger.GetUsersPagedAsync(CompanyId, _pagination);
+        return page.Items.Count();
+    }
+
+    /// <summary>
+    /// Same wrapper client call with both loggers attached and debug and information logging disabled;
+    /// should allocate no more than the call without loggers
+    /// </summary>
+    [Benchmark]
+    public async Task<int> ClientMethodWithLoggingDisabled()
+    {
+        var page = await _clientWithLogger.GetUsersPagedAsync(CompanyId, _pagination);
+        return page.Items.Count();
+    }
+}
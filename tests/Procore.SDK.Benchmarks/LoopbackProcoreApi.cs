@@ -0,0 +1,63 @@
+using System.Net;
+using System.Net.Sockets;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Out-of-process stand-in for the Procore API on a loopback port, for benchmarks that launch
+/// a published app and so cannot use <see cref="FakeProcoreApiHandler"/>
+/// </summary>
+public sealed class LoopbackProcoreApi : IDisposable
+{
+    private readonly HttpListener _listener = new();
+    private readonly byte[] _body;
+    private readonly Task _serveLoop;
+
+    public LoopbackProcoreApi(byte[]? body = null)
+    {
+        _body = body ?? "[]"u8.ToArray();
+        BaseAddress = new Uri($"http://127.0.0.1:{GetFreePort()}/");
+        _listener.Prefixes.Add(BaseAddress.ToString());
+        _listener.Start();
+        _serveLoop = Task.Run(ServeAsync);
+    }
+
+    /// <summary>
+    /// Address to point the app's ProcoreApi:BaseAddress at
+    /// </summary>
+    public Uri BaseAddress { get; }
+
+    private async Task ServeAsync()
+    {
+        while (_listener.IsListening)
+        {
+            HttpListenerContext context;
+            try
+            {
+                context = await _listener.GetContextAsync();
+            }
+            catch (Exception ex) when (ex is HttpListenerException or ObjectDisposedException)
+            {
+                return;
+            }
+
+            context.Response.ContentType = "application/json";
+            context.Response.ContentLength64 = _body.Length;
+            await context.Response.OutputStream.WriteAsync(_body);
+            context.Response.Close();
+        }
+    }
+
+    private static int GetFreePort()
+    {
+        using var socket = new TcpListener(IPAddress.Loopback, 0);
+        socket.Start();
+        return ((IPEndPoint)socket.LocalEndpoint).Port;
+    }
+
+    public void Dispose()
+    {
+        _listener.Close();
+        _serveLoop.Wait();
+    }
+}
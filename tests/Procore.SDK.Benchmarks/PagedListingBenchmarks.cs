@@ -0,0 +1,75 @@
+using Microsoft.Kiota.Abstractions.Authentication;
+using Microsoft.Kiota.Http.HttpClientLibrary;
+using Procore.SDK.Core;
+using Procore.SDK.Core.Models;
+using Procore.SDK.ProjectManagement;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Benchmarks for the wrapper paged-listing methods end to end: request building,
+/// deserialization, mapping and page assembly over an in-process fake API
+/// Target: a 100-item page in &lt;1ms
+/// </summary>
+[MemoryDiagnoser]
+[SimpleJob]
+public class PagedListingBenchmarks
+{
+    private const int CompanyId = 1;
+
+    private HttpClient _httpClient = null!;
+    private ProcoreCoreClient _coreClient = null!;
+    private ProcoreProjectManagementClient _projectManagementClient = null!;
+    private PaginationOptions _pagination = null!;
+
+    [Params(100, 1_000)]
+    public int PageSize { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        var handler = new FakeProcoreApiHandler()
+            .Route("/rest/v1.0/companies", BenchmarkPayloads.Companies(PageSize))
+            .Route("/users", BenchmarkPayloads.Users(PageSize))
+            .Route("/projects", BenchmarkPayloads.Projects(PageSize));
+
+        _httpClient = new HttpClient(handler);
+        var adapter = new HttpClientRequestAdapter(new AnonymousAuthenticationProvider(), httpClient: _httpClient)
+        {
+            BaseUrl = "https://api.procore.com"
+        };
+
+        _coreClient = new ProcoreCoreClient(adapter);
+        _projectManagementClient = new ProcoreProjectManagementClient(adapter);
+        _pagination = new PaginationOptions { Page = 1, PerPage = PageSize };
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _coreClient?.Dispose();
+        _projectManagementClient?.Dispose();
+        _httpClient?.Dispose();
+    }
+
+    [Benchmark]
+    public async Task<int> GetCompaniesPaged()
+    {
+        var page = await _coreClient.GetCompaniesPagedAsync(_pagination);
+        return page.Items.Count();
+    }
+
+    [Benchmark]
+    public async Task<int> GetUsersPaged()
+    {
+        var page = await _coreClient.GetUsersPagedAsync(CompanyId, _pagination);
+        return page.Items.Count();
+    }
+
+    [Benchmark]
+    public async Task<int> GetProjectsPaged()
+    {
+        var page = await _projectManagementClient.GetProjectsPagedAsync(CompanyId, _pagination);
+        return page.Items.Count();
+    }
+}
@@ -0,0 +1,104 @@
+using System.Diagnostics;
+using System.Runtime.InteropServices;
+using BenchmarkDotNet.Engines;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Benchmarks for time-to-first-request of samples/ConsoleSample published with JIT, ReadyToRun and
+/// Native AOT, from process start until the first companies response has been mapped and the process exits
+/// Target: ReadyToRun and Aot start well ahead of Jit; Aot is the floor for short-lived jobs
+/// </summary>
+/// <remarks>
+/// Each publish runs once in global setup, so the first run of a mode includes a full publish.
+/// The sample prints its own in-process measurement ("time-to-first-request: N ms") as well.
+/// </remarks>
+[SimpleJob(RunStrategy.Monitoring, launchCount: 1, warmupCount: 1, iterationCount: 15)]
+public class StartupBenchmarks
+{
+    public enum PublishMode
+    {
+        Jit,
+        ReadyToRun,
+        Aot
+    }
+
+    private LoopbackProcoreApi _api = null!;
+    private string _executable = null!;
+
+    [Params(PublishMode.Jit, PublishMode.ReadyToRun, PublishMode.Aot)]
+    public PublishMode Mode { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        var repositoryRoot = FindRepositoryRoot();
+        var outputDirectory = Path.Combine(Path.GetTempPath(), "procore-sdk-startup", Mode.ToString());
+
+        RunToCompletion("dotnet",
+            $"publish \"{Path.Combine(repositoryRoot, "samples", "ConsoleSample")}\" -c Release " +
+            $"-r {RuntimeInformation.RuntimeIdentifier} -o \"{outputDirectory}\" -p:PublishMode={Mode}",
+            repositoryRoot);
+
+        _executable = Path.Combine(outputDirectory, OperatingSystem.IsWindows() ? "ConsoleSample.exe" : "ConsoleSample");
+        _api = new LoopbackProcoreApi();
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _api.Dispose();
+    }
+
+    [Benchmark]
+    public void FirstRequest()
+    {
+        var startInfo = new ProcessStartInfo(_executable, "--first-request")
+        {
+            WorkingDirectory = Path.GetDirectoryName(_executable)!,
+            RedirectStandardOutput = true,
+            UseShellExecute = false
+        };
+        startInfo.Environment["ProcoreApi__BaseAddress"] = _api.BaseAddress.ToString();
+        startInfo.Environment["PROCORE_ACCESS_TOKEN"] = "startup-benchmark";
+        startInfo.Environment["Logging__LogLevel__Default"] = "Warning";
+
+        using var process = Process.Start(startInfo)!;
+        process.StandardOutput.ReadToEnd();
+        process.WaitForExit();
+
+        if (process.ExitCode != 0)
+        {
+            throw new InvalidOperationException($"ConsoleSample ({Mode}) exited with code {process.ExitCode}");
+        }
+    }
+
+    private static void RunToCompletion(string fileName, string arguments, string workingDirectory)
+    {
+        using var process = Process.Start(new ProcessStartInfo(fileName, arguments)
+        {
+            WorkingDirectory = workingDirectory,
+            UseShellExecute = false
+        })!;
+        process.WaitForExit();
+
+        if (process.ExitCode != 0)
+        {
+            throw new InvalidOperationException($"'{fileName} {arguments}' exited with code {process.ExitCode}");
+        }
+    }
+
+    private static string FindRepositoryRoot()
+    {
+        // BenchmarkDotNet runs each benchmark from a generated project below the benchmark output folder
+        for (var directory = new DirectoryInfo(AppContext.BaseDirectory); directory != null; directory = directory.Parent)
+        {
+            if (File.Exists(Path.Combine(directory.FullName, "ProcoreSDK.sln")))
+            {
+                return directory.FullName;
+            }
+        }
+
+        throw new InvalidOperationException("Could not locate ProcoreSDK.sln above " + AppContext.BaseDirectory);
+    }
+}
@@ -0,0 +1,107 @@
+using System.IO.Compression;
+using System.Net;
+using System.Security.Cryptography;
+using System.Security.Cryptography.X509Certificates;
+using Microsoft.AspNetCore.Builder;
+using Microsoft.AspNetCore.Hosting;
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Server.Kestrel.Core;
+using Microsoft.Extensions.Logging;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// In-process Kestrel stand-in for the Procore API on a loopback TLS port, negotiating HTTP/1.1 or HTTP/2
+/// through ALPN and serving one payload pre-compressed per Accept-Encoding
+/// </summary>
+/// <remarks>
+/// The certificate is self-signed, so clients must skip certificate validation.
+/// Payloads are compressed once up front so the server's compression cost is not part of the measurement.
+/// </remarks>
+public sealed class TlsProcoreApi : IDisposable
+{
+    private readonly WebApplication _app;
+    private readonly byte[] _identity;
+    private readonly byte[] _gzip;
+    private readonly byte[] _brotli;
+
+    public TlsProcoreApi(byte[] body)
+    {
+        _identity = body;
+        _gzip = Compress(body, "gzip");
+        _brotli = Compress(body, "br");
+
+        var builder = WebApplication.CreateSlimBuilder();
+        builder.Logging.ClearProviders();
+        builder.WebHost.ConfigureKestrel(kestrel => kestrel.Listen(IPAddress.Loopback, 0, listen =>
+        {
+            listen.Protocols = HttpProtocols.Http1AndHttp2;
+            listen.UseHttps(CreateCertificate());
+        }));
+
+        _app = builder.Build();
+        _app.MapFallback(ServeAsync);
+        _app.StartAsync().GetAwaiter().GetResult();
+
+        BaseAddress = new Uri(_app.Urls.First());
+    }
+
+    /// <summary>
+    /// Address of the stand-in, e.g. https://127.0.0.1:54321
+    /// </summary>
+    public Uri BaseAddress { get; }
+
+    /// <summary>
+    /// Compresses a payload the way the stand-in serves it for the given content coding ("gzip" or "br")
+    /// </summary>
+    public static byte[] Compress(byte[] body, string encoding)
+    {
+        using var output = new MemoryStream();
+        using (Stream compressor = encoding == "br"
+            ? new BrotliStream(output, CompressionLevel.Optimal)
+            : new GZipStream(output, CompressionLevel.Optimal))
+        {
+            compressor.Write(body);
+        }
+
+        return output.ToArray();
+    }
+
+    private Task ServeAsync(HttpContext context)
+    {
+        // SocketsHttpHandler advertises "gzip, br" when both are enabled; Brotli wins when offered
+        var acceptEncoding = context.Request.Headers.AcceptEncoding.ToString();
+        var (encoding, body) = acceptEncoding.Contains("br") ? ("br", _brotli)
+            : acceptEncoding.Contains("gzip") ? ("gzip", _gzip)
+            : ((string?)null, _identity);
+
+        context.Response.ContentType = "application/json";
+        context.Response.ContentLength = body.Length;
+        if (encoding != null)
+        {
+            context.Response.Headers.ContentEncoding = encoding;
+        }
+
+        return context.Response.Body.WriteAsync(body).AsTask();
+    }
+
+    private static X509Certificate2 CreateCertificate()
+    {
+        using var key = RSA.Create(2048);
+        var request = new CertificateRequest("CN=localhost", key, HashAlgorithmName.SHA256, RSASignaturePadding.Pkcs1);
+        var subjectAlternativeNames = new SubjectAlternativeNameBuilder();
+        subjectAlternativeNames.AddIpAddress(IPAddress.Loopback);
+        subjectAlternativeNames.AddDnsName("localhost");
+        request.CertificateExtensions.Add(subjectAlternativeNames.Build());
+
+        // Round-trip through PFX so the private key is usable by SslStream on every platform
+        using var certificate = request.CreateSelfSigned(DateTimeOffset.UtcNow.AddDays(-1), DateTimeOffset.UtcNow.AddDays(1));
+        return new X509Certificate2(certificate.Export(X509ContentType.Pfx));
+    }
+
+    public void Dispose()
+    {
+        _app.StopAsync().GetAwaiter().GetResult();
+        ((IDisposable)_app).Dispose();
+    }
+}
@@ -0,0 +1,117 @@
+using System.Net;
+using BenchmarkDotNet.Columns;
+using BenchmarkDotNet.Configs;
+using BenchmarkDotNet.Reports;
+using BenchmarkDotNet.Running;
+using Procore.SDK.Extensions;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Benchmarks for the "Procore" transport profiles, with and without response compression, fetching a large
+/// user list concurrently from a local TLS stand-in for the API
+/// Target: compression cuts response bytes several-fold; HighThroughput beats Default on requests/s
+/// </summary>
+/// <remarks>
+/// Mean is per request and Op/s is request throughput. "Response bytes" is the body size on the wire for the
+/// negotiated encoding; headers are excluded. Loopback has no latency or bandwidth limit, so the gain from
+/// compression on a real network is larger than the timings here suggest.
+/// </remarks>
+[MemoryDiagnoser]
+[SimpleJob]
+[Config(typeof(Config))]
+public class TransportProfileBenchmarks
+{
+    private const int RowCount = 1_000;
+    private const int ConcurrentRequests = 32;
+    private const string UsersPath = "/rest/v1.1/companies/1/users";
+
+    private TlsProcoreApi _api = null!;
+    private HttpClient _client = null!;
+
+    [Params(ProcoreTransportProfile.Default, ProcoreTransportProfile.HighThroughput, ProcoreTransportProfile.LowLatency)]
+    public ProcoreTransportProfile Profile { get; set; }
+
+    [Params(false, true)]
+    public bool Compressed { get; set; }
+
+    [GlobalSetup]
+    public async Task Setup()
+    {
+        _api = new TlsProcoreApi(BenchmarkPayloads.Users(RowCount));
+
+        var options = new HttpClientOptions
+        {
+            BaseAddress = _api.BaseAddress,
+            TransportProfile = Profile,
+            AutomaticDecompression = Compressed ? new HttpClientOptions().AutomaticDecompression : DecompressionMethods.None
+        };
+
+        var primaryHandler = ProcoreTransport.CreatePrimaryHandler(options);
+        primaryHandler.SslOptions.RemoteCertificateValidationCallback = (_, _, _, _) => true;
+
+        _client = new HttpClient(new ProcoreHttpVersionHandler(Options.Create(options)) { InnerHandler = primaryHandler })
+        {
+            BaseAddress = options.BaseAddress
+        };
+
+        // Open connections up front so the first iteration does not pay for TLS handshakes
+        await ListUsersConcurrently();
+    }
+
+    [GlobalCleanup]
+    public void Cleanup()
+    {
+        _client?.Dispose();
+        _api?.Dispose();
+    }
+
+    [Benchmark(OperationsPerInvoke = ConcurrentRequests)]
+    public async Task<long> ListUsersConcurrently()
+    {
+        var lengths = await Task.WhenAll(Enumerable.Range(0, ConcurrentRequests).Select(async _ =>
+        {
+            using var response = await _client.GetAsync(UsersPath);
+            var body = await response.EnsureSuccessStatusCode().Content.ReadAsByteArrayAsync();
+            return (long)body.Length;
+        }));
+
+        return lengths.Sum();
+    }
+
+    private sealed class Config : ManualConfig
+    {
+        public Config()
+        {
+            AddColumn(StatisticColumn.OperationsPerSecond, new ResponseBytesColumn());
+        }
+    }
+
+    private sealed class ResponseBytesColumn : IColumn
+    {
+        private readonly Lazy<byte[]> _payload = new(() => BenchmarkPayloads.Users(RowCount));
+
+        public string Id => nameof(ResponseBytesColumn);
+        public string ColumnName => "Response bytes";
+        public bool AlwaysShow => true;
+        public ColumnCategory Category => ColumnCategory.Custom;
+        public int PriorityInCategory => 0;
+        public bool IsNumeric => true;
+        public UnitType UnitType => UnitType.Dimensionless;
+        public string Legend => "Response body bytes on the wire per request";
+
+        public bool IsDefault(Summary summary, BenchmarkCase benchmarkCase) => false;
+        public bool IsAvailable(Summary summary) => true;
+
+        public string GetValue(Summary summary, BenchmarkCase benchmarkCase) =>
+            GetValue(summary, benchmarkCase, SummaryStyle.Default);
+
+        public string GetValue(Summary summary, BenchmarkCase benchmarkCase, SummaryStyle style)
+        {
+            // The client advertises gzip and br together, and the stand-in answers with br
+            var compressed = (bool)benchmarkCase.Parameters[nameof(Compressed)];
+            var bytes = compressed ? TlsProcoreApi.Compress(_payload.Value, "br").Length : _payload.Value.Length;
+            return bytes.ToString("N0");
+        }
+    }
+}
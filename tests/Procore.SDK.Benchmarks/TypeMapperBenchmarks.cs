@@ -0,0 +1,134 @@
+using Procore.SDK.Core.TypeMapping;
+using Procore.SDK.FieldProductivity.TypeMapping;
+using Procore.SDK.ProjectManagement.TypeMapping;
+using Procore.SDK.QualitySafety.TypeMapping;
+using Procore.SDK.ResourceManagement.TypeMapping;
+using GeneratedCompany = Procore.SDK.Core.Rest.V10.Companies.Companies;
+using GeneratedObservation = Procore.SDK.QualitySafety.Rest.V10.Observations.Items.Items;
+using GeneratedProject = Procore.SDK.ProjectManagement.Rest.V10.Projects.Item.GetResponse;
+using GeneratedResource = Procore.SDK.ResourceManagement.Rest.V11.Projects.Item.Schedule.Resources.Item.ResourcesGetResponse;
+using GeneratedTimecardEntry = Procore.SDK.FieldProductivity.Rest.V10.Companies.Item.Timecard_entries.Item.Timecard_entriesGetResponse;
+using GeneratedUser = Procore.SDK.Core.Rest.V13.Users.Item.UsersGetResponse;
+
+namespace Procore.SDK.Benchmarks;
+
+/// <summary>
+/// Benchmarks for mapping generated models to wrapper models, one batch per mapper
+/// Target: &lt;1μs and a single wrapper allocation per item
+/// </summary>
+[MemoryDiagnoser]
+[SimpleJob]
+public class TypeMapperBenchmarks
+{
+    private readonly CompanyTypeMapper _companyMapper = new();
+    private readonly UserTypeMapper _userMapper = new();
+    private readonly TimecardEntryTypeMapper _timecardEntryMapper = new();
+    private readonly ProjectTypeMapper _projectMapper = new();
+    private readonly ObservationTypeMapper _observationMapper = new();
+    private readonly ResourceTypeMapper _resourceMapper = new();
+
+    private GeneratedCompany[] _companies = null!;
+    private GeneratedUser[] _users = null!;
+    private GeneratedTimecardEntry[] _timecardEntries = null!;
+    private GeneratedProject[] _projects = null!;
+    private GeneratedObservation[] _observations = null!;
+    private GeneratedResource[] _resources = null!;
+
+    [Params(1_000)]
+    public int Count { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        _companies = BenchmarkPayloads.Deserialize(BenchmarkPayloads.Companies(Count), GeneratedCompany.CreateFromDiscriminatorValue).ToArray();
+        _users = BenchmarkPayloads.Deserialize(BenchmarkPayloads.Users(Count), GeneratedUser.CreateFromDiscriminatorValue).ToArray();
+        _timecardEntries = BenchmarkPayloads.Deserialize(BenchmarkPayloads.TimecardEntries(Count), GeneratedTimecardEntry.CreateFromDiscriminatorValue).ToArray();
+        _projects = BenchmarkPayloads.Deserialize(BenchmarkPayloads.Projects(Count), GeneratedProject.CreateFromDiscriminatorValue).ToArray();
+        _observations = BenchmarkPayloads.Deserialize(BenchmarkPayloads.Observations(Count), GeneratedObservation.CreateFromDiscriminatorValue).ToArray();
+        _resources = BenchmarkPayloads.Deserialize(BenchmarkPayloads.Resources(Count), GeneratedResource.CreateFromDiscriminatorValue).ToArray();
+    }
+
+    [Benchmark]
+    public int MapCompanies()
+    {
+        var mapped = 0;
+        foreach (var company in _companies)
+        {
+            _companyMapper.MapToWrapper(company);
+            mapped++;
+        }
+        return mapped;
+    }
+
+    [Benchmark]
+    public int MapCompaniesBatch()
+    {
+        return _companyMapper.MapToWrapperMany(_companies).Count;
+    }
+
+    [Benchmark]
+    public int MapUsers()
+    {
+        var mapped = 0;
+        foreach (var user in _users)
+        {
+            _userMapper.MapToWrapper(user);
+            mapped++;
+        }
+        return mapped;
+    }
+
+    [Benchmark]
+    public int MapTimecardEntries()
+    {
+        var mapped = 0;
+        foreach (var entry in _timecardEntries)
+        {
+            _timecardEntryMapper.MapToWrapper(entry);
+            mapped++;
+        }
+        return mapped;
+    }
+
+    [Benchmark]
+    public int MapTimecardEntriesBatch()
+    {
+        return _timecardEntryMapper.MapToWrapperMany(_timecardEntries).Count;
+    }
+
+    [Benchmark]
+    public int MapProjects()
+    {
+        var mapped = 0;
+        foreach (var project in _projects)
+        {
+            _projectMapper.MapToWrapper(project);
+            mapped++;
+        }
+        return mapped;
+    }
+
+    [Benchmark]
+    public int MapObservations()
+    {
+        var mapped = 0;
+        foreach (var observation in _observations)
+        {
+            _observationMapper.MapToWrapper(observation);
+            mapped++;
+        }
+        return mapped;
+    }
+
+    [Benchmark]
+    public int MapResources()
+    {
+        var mapped = 0;
+        foreach (var resource in _resources)
+        {
+            _resourceMapper.MapToWrapper(resource);
+            mapped++;
+        }
+        return mapped;
+    }
+}
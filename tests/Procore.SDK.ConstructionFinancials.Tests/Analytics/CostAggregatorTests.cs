@@ -0,0 +1,130 @@
+using Procore.SDK.ConstructionFinancials.Analytics;
+using Procore.SDK.ConstructionFinancials.Models;
+
+namespace Procore.SDK.ConstructionFinancials.Tests.Analytics;
+
+/// <summary>
+/// Tests for single-pass cost aggregation and incremental re-aggregation.
+/// </summary>
+public class CostAggregatorTests
+{
+    [Fact]
+    public void AddRange_Should_ComputeTotalsAndDivisionRollups()
+    {
+        // Arrange
+        var aggregator = new CostAggregator();
+
+        // Act
+        aggregator.AddRange(new[]
+        {
+            CreateCostCode(1, "03-100", budget: 1000m, committed: 900m, actual: 1200m),
+            CreateCostCode(2, "03300", budget: 500m, committed: 400m, actual: 300m),
+            CreateCostCode(3, "16-200", budget: 2000m, committed: 1500m, actual: 1000m)
+        });
+        aggregator.AddRange(new[]
+        {
+            CreateInvoice(10, 700m, InvoiceStatus.Paid),
+            CreateInvoice(11, 300m, InvoiceStatus.Approved),
+            CreateInvoice(12, 999m, InvoiceStatus.Rejected)
+        });
+
+        // Assert
+        aggregator.Totals.Should().Be(new CostTotals(3500m, 2800m, 2500m, 1000m, 700m, 3, 3));
+        aggregator.Totals.BudgetVariance.Should().Be(1000m);
+        aggregator.Totals.OutstandingInvoiced.Should().Be(300m);
+
+        var concrete = aggregator.GetCategory("03");
+        concrete.Budget.Should().Be(1500m);
+        concrete.Actual.Should().Be(1500m);
+        concrete.CostCodeCount.Should().Be(2);
+        aggregator.GetCategory("16").BudgetVariancePercentage.Should().Be(50m);
+        aggregator.GetCategories().Select(category => category.Key)
+            .Should().Equal("03", "16", CostAggregator.UncategorizedCategory);
+    }
+
+    [Fact]
+    public void AddOrUpdate_WhenRecordChanges_Should_ReplaceItsContribution()
+    {
+        // Arrange
+        var aggregator = new CostAggregator();
+        aggregator.AddOrUpdate(CreateCostCode(1, "03-100", budget: 1000m, committed: 0m, actual: 100m));
+        aggregator.AddOrUpdate(CreateInvoice(10, 250m, InvoiceStatus.Approved));
+
+        // Act
+        aggregator.AddOrUpdate(CreateCostCode(1, "05-100", budget: 1000m, committed: 0m, actual: 400m));
+        aggregator.AddOrUpdate(CreateInvoice(10, 250m, InvoiceStatus.Paid));
+
+        // Assert
+        aggregator.Count.Should().Be(2);
+        aggregator.Totals.Actual.Should().Be(400m);
+        aggregator.Totals.Paid.Should().Be(250m);
+        aggregator.GetCategory("03").IsEmpty.Should().BeTrue();
+        aggregator.GetCategory("05").Actual.Should().Be(400m);
+    }
+
+    [Fact]
+    public void RemoveCostCode_Should_SubtractContributionAndDropEmptyCategory()
+    {
+        // Arrange
+        var aggregator = new CostAggregator();
+        aggregator.AddOrUpdate(CreateCostCode(1, "03-100", budget: 1000m, committed: 800m, actual: 100m));
+        aggregator.AddOrUpdate(CreateCostCode(2, "16-100", budget: 200m, committed: 0m, actual: 50m));
+
+        // Act
+        var removed = aggregator.RemoveCostCode(1);
+
+        // Assert
+        removed.Should().BeTrue();
+        aggregator.RemoveCostCode(1).Should().BeFalse();
+        aggregator.Totals.Should().Be(new CostTotals(200m, 0m, 50m, 0m, 0m, 1, 0));
+        aggregator.GetCategories().Should().ContainSingle().Which.Key.Should().Be("16");
+    }
+
+    [Fact]
+    public void Constructor_WithCategorySelector_Should_UseItForCostCodes()
+    {
+        // Arrange
+        var aggregator = new CostAggregator(costCode => costCode.Description);
+
+        // Act
+        aggregator.AddOrUpdate(new CostCode { Id = 1, Code = "01000", Description = "General", BudgetAmount = 10m });
+        aggregator.AddOrUpdate(CreateInvoice(10, 5m, InvoiceStatus.Submitted), "General");
+
+        // Assert
+        var general = aggregator.GetCategory("general");
+        general.Budget.Should().Be(10m);
+        general.Invoiced.Should().Be(5m);
+    }
+
+    [Theory]
+    [InlineData("03-310", "03")]
+    [InlineData("03300", "03")]
+    [InlineData("GEN.100", "GEN")]
+    [InlineData("7", "7")]
+    [InlineData("  ", CostAggregator.UncategorizedCategory)]
+    public void GetDivision_Should_ReturnLeadingSegment(string code, string expected)
+    {
+        // Act
+        var division = CostAggregator.GetDivision(code);
+
+        // Assert
+        division.Should().Be(expected);
+    }
+
+    private static CostCode CreateCostCode(int id, string code, decimal budget, decimal committed, decimal actual)
+    {
+        return new CostCode
+        {
+            Id = id,
+            Code = code,
+            BudgetAmount = budget,
+            CommittedAmount = committed,
+            ActualAmount = actual
+        };
+    }
+
+    private static Invoice CreateInvoice(int id, decimal amount, InvoiceStatus status)
+    {
+        return new Invoice { Id = id, Amount = amount, Status = status };
+    }
+}
@@ -0,0 +1,96 @@
+using Procore.SDK.Core.Bulk;
+
+namespace Procore.SDK.Core.Tests.Bulk;
+
+/// <summary>
+/// Tests for chunked bulk-route and concurrent fallback execution.
+/// </summary>
+public class BulkExecutorTests
+{
+    [Fact]
+    public async Task ExecuteChunkedAsync_ShouldSplitItemsIntoChunksAndMapResultsByPosition()
+    {
+        // Arrange
+        var items = Enumerable.Range(1, 60).ToList();
+        var chunkSizes = new List<int>();
+
+        // Act
+        var outcomes = await BulkExecutor.ExecuteChunkedAsync<int, string>(items, 25, (chunk, ct) =>
+        {
+            chunkSizes.Add(chunk.Count);
+            return Task.FromResult<IReadOnlyList<string>>(chunk.Select(i => $"created-{i}").ToList());
+        });
+
+        // Assert
+        chunkSizes.Should().Equal(25, 25, 10);
+        outcomes.Should().HaveCount(60);
+        outcomes.Should().OnlyContain(o => o.Succeeded && o.Result == $"created-{o.Item}");
+    }
+
+    [Fact]
+    public async Task ExecuteChunkedAsync_WhenChunkFails_ShouldFailOnlyThatChunksItems()
+    {
+        // Arrange
+        var items = Enumerable.Range(1, 4).ToList();
+
+        // Act
+        var outcomes = await BulkExecutor.ExecuteChunkedAsync<int, int>(items, 2, (chunk, ct) =>
+            chunk[0] == 1
+                ? Task.FromException<IReadOnlyList<int>>(new InvalidOperationException("rejected"))
+                : Task.FromResult<IReadOnlyList<int>>(chunk.ToList()));
+
+        // Assert
+        outcomes.Take(2).Should().OnlyContain(o => !o.Succeeded && o.Exception!.Message == "rejected");
+        outcomes.Skip(2).Should().OnlyContain(o => o.Succeeded);
+    }
+
+    [Fact]
+    public async Task ExecuteChunkedAsync_WhenRouteReturnsFewerResults_ShouldFailMissingItems()
+    {
+        // Arrange
+        var items = new[] { 1, 2, 3 };
+
+        // Act
+        var outcomes = await BulkExecutor.ExecuteChunkedAsync<int, int>(items, 10, (chunk, ct) =>
+            Task.FromResult<IReadOnlyList<int>>(new[] { 10, 20 }));
+
+        // Assert
+        outcomes.Select(o => o.Succeeded).Should().Equal(true, true, false);
+    }
+
+    [Fact]
+    public async Task ExecuteConcurrentAsync_ShouldBoundConcurrencyAndPreserveOrder()
+    {
+        // Arrange
+        var running = 0;
+        var peak = 0;
+        var items = Enumerable.Range(0, 20).ToList();
+
+        async Task<int> SendAsync(int item, CancellationToken ct)
+        {
+            var current = Interlocked.Increment(ref running);
+            lock (items)
+            {
+                peak = Math.Max(peak, current);
+            }
+
+            await Task.Delay(5, ct);
+            Interlocked.Decrement(ref running);
+            if (item == 7)
+            {
+                throw new InvalidOperationException("failed");
+            }
+
+            return item * 2;
+        }
+
+        // Act
+        var outcomes = await BulkExecutor.ExecuteConcurrentAsync<int, int>(items, SendAsync, maxConcurrency: 4);
+
+        // Assert
+        peak.Should().BeLessOrEqualTo(4);
+        outcomes.Select(o => o.Item).Should().Equal(items);
+        outcomes.Single(o => !o.Succeeded).Item.Should().Be(7);
+        outcomes.Where(o => o.Succeeded).Should().OnlyContain(o => o.Result == o.Item * 2);
+    }
+}
@@ -0,0 +1,121 @@
+using Procore.SDK.Core.Composite;
+
+namespace Procore.SDK.Core.Tests.Composite;
+
+/// <summary>
+/// Tests for concurrent execution of the sub-requests of composite methods.
+/// </summary>
+public class CompositeQueryTests
+{
+    [Fact]
+    public async Task Add_ShouldStartEveryPartBeforeAnyCompletes()
+    {
+        // Arrange
+        var release = new TaskCompletionSource();
+        var started = 0;
+        using var query = new CompositeQuery();
+
+        async Task<int> Slow(int value, CancellationToken ct)
+        {
+            Interlocked.Increment(ref started);
+            await release.Task.WaitAsync(ct);
+            return value;
+        }
+
+        // Act
+        var first = query.Add("first", ct => Slow(1, ct));
+        var second = query.Add("second", ct => Slow(2, ct));
+        var startedBeforeRelease = started;
+        release.SetResult();
+        await query.WhenAllAsync();
+
+        // Assert
+        startedBeforeRelease.Should().Be(2);
+        first.Value.Should().Be(1);
+        second.Value.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task WhenAllAsync_OptionalPartFails_ShouldReturnOtherResults()
+    {
+        // Arrange
+        using var query = new CompositeQuery();
+
+        // Act
+        var failing = query.Add<List<int>?>("failing", _ => Task.FromException<List<int>?>(new HttpRequestException("boom")), optional: true);
+        var succeeding = query.Add("succeeding", _ => Task.FromResult(new List<int> { 1 }), optional: true);
+        await query.WhenAllAsync();
+
+        // Assert
+        failing.Succeeded.Should().BeFalse();
+        failing.Value.Should().BeNull();
+        failing.Exception.Should().BeOfType<HttpRequestException>();
+        succeeding.Succeeded.Should().BeTrue();
+        succeeding.Value.Should().Equal(1);
+    }
+
+    [Fact]
+    public async Task WhenAllAsync_RequiredPartFails_ShouldCancelOthersAndRethrow()
+    {
+        // Arrange
+        using var query = new CompositeQuery();
+        CancellationToken siblingToken = default;
+
+        // Act
+        var sibling = query.Add("sibling", async ct =>
+        {
+            siblingToken = ct;
+            await Task.Delay(Timeout.Infinite, ct);
+            return 0;
+        });
+        query.Add<int>("required", _ => Task.FromException<int>(new InvalidOperationException("boom")));
+        var act = () => query.WhenAllAsync();
+
+        // Assert
+        await act.Should().ThrowAsync<InvalidOperationException>().WithMessage("boom");
+        siblingToken.IsCancellationRequested.Should().BeTrue();
+        sibling.Task.IsCanceled.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task Cancel_ShouldStopUnneededPartsWithoutFailingTheQuery()
+    {
+        // Arrange
+        using var query = new CompositeQuery();
+        var needed = query.Add("needed", _ => Task.FromResult(42));
+        var unneeded = query.Add("unneeded", async ct =>
+        {
+            await Task.Delay(Timeout.Infinite, ct);
+            return 0;
+        });
+
+        // Act
+        var value = await needed;
+        query.Cancel();
+        await query.WhenAllAsync();
+
+        // Assert
+        value.Should().Be(42);
+        unneeded.Task.IsCanceled.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task WhenAllAsync_CallerCancels_ShouldThrowOperationCanceled()
+    {
+        // Arrange
+        using var cts = new CancellationTokenSource();
+        using var query = new CompositeQuery(cancellationToken: cts.Token);
+        query.Add("pending", async ct =>
+        {
+            await Task.Delay(Timeout.Infinite, ct);
+            return 0;
+        }, optional: true);
+
+        // Act
+        cts.Cancel();
+        var act = () => query.WhenAllAsync();
+
+        // Assert
+        await act.Should().ThrowAsync<OperationCanceledException>();
+    }
+}
@@ -0,0 +1,213 @@
+using System.Net.Http.Headers;
+using System.Text;
+using Microsoft.Kiota.Abstractions.Authentication;
+using Microsoft.Kiota.Http.HttpClientLibrary;
+using Procore.SDK.Core.Models;
+
+namespace Procore.SDK.Core.Tests.Documents;
+
+/// <summary>
+/// Tests for ranged document downloads from presigned storage URLs.
+/// </summary>
+public class DocumentDownloadTests : IDisposable
+{
+    private const string ContentUrl = "https://storage.example.com/files/2?signature=abc";
+    private static readonly byte[] Content = Encoding.ASCII.GetBytes("0123456789");
+
+    private readonly StubHandler _storageHandler = new();
+    private readonly IHttpClientFactory _httpClientFactory = Substitute.For<IHttpClientFactory>();
+    private readonly List<HttpRequestMessage> _storageRequests = new();
+    private readonly HttpClient _apiHttpClient;
+    private readonly ProcoreCoreClient _client;
+    private readonly string _filePath = Path.Combine(Path.GetTempPath(), $"procore-download-{Guid.NewGuid():N}.bin");
+
+    public DocumentDownloadTests()
+    {
+        _apiHttpClient = new HttpClient(new StubHandler
+        {
+            Respond = _ => new HttpResponseMessage(HttpStatusCode.OK)
+            {
+                Content = new StringContent(
+                    $"{{\"id\":2,\"file_versions\":[{{\"number\":1,\"url\":\"{ContentUrl}\",\"size\":{Content.Length}}}]}}",
+                    Encoding.UTF8,
+                    "application/json")
+            }
+        });
+        var adapter = new HttpClientRequestAdapter(new AnonymousAuthenticationProvider(), httpClient: _apiHttpClient)
+        {
+            BaseUrl = "https://api.procore.com"
+        };
+
+        _httpClientFactory.CreateClient(ProcoreCoreClient.ContentHttpClientName).Returns(_ => new HttpClient(_storageHandler, disposeHandler: false));
+        _client = new ProcoreCoreClient(adapter, httpClientFactory: _httpClientFactory);
+    }
+
+    [Fact]
+    public async Task DownloadDocumentAsync_WithPartialContent_ShouldFetchEachChunkWithoutCredentials()
+    {
+        // Arrange
+        _storageHandler.Respond = RespondWithRange;
+        using var destination = new MemoryStream();
+
+        // Act
+        var total = await _client.DownloadDocumentAsync(1, 2, destination, new DownloadDocumentOptions { ChunkSize = 4 });
+
+        // Assert
+        total.Should().Be(Content.Length);
+        destination.ToArray().Should().Equal(Content);
+        _storageRequests.Select(r => r.Headers.Range!.ToString()).Should().Equal("bytes=0-3", "bytes=4-7", "bytes=8-11");
+        _storageRequests.Should().OnlyContain(r => r.Headers.Authorization == null && r.RequestUri!.Host == "storage.example.com");
+    }
+
+    [Fact]
+    public async Task DownloadDocumentAsync_WhenRangeIsNotSatisfiable_ShouldStopAtOffset()
+    {
+        // Arrange
+        _storageHandler.Respond = request =>
+        {
+            _storageRequests.Add(request);
+            return new HttpResponseMessage(HttpStatusCode.RequestedRangeNotSatisfiable);
+        };
+        using var destination = new MemoryStream();
+
+        // Act
+        var total = await _client.DownloadDocumentAsync(1, 2, destination, new DownloadDocumentOptions { ChunkSize = 4, Offset = 4 });
+
+        // Assert
+        total.Should().Be(4);
+        destination.Length.Should().Be(0);
+        _storageRequests.Should().ContainSingle().Which.Headers.Range!.ToString().Should().Be("bytes=4-7");
+    }
+
+    [Fact]
+    public async Task DownloadDocumentAsync_WhenServerIgnoresRange_ShouldSkipBytesBeforeOffset()
+    {
+        // Arrange
+        _storageHandler.Respond = request =>
+        {
+            _storageRequests.Add(request);
+            return new HttpResponseMessage(HttpStatusCode.OK) { Content = new ByteArrayContent(Content) };
+        };
+        using var destination = new MemoryStream();
+
+        // Act
+        var total = await _client.DownloadDocumentAsync(1, 2, destination, new DownloadDocumentOptions { ChunkSize = 4, Offset = 6 });
+
+        // Assert
+        total.Should().Be(Content.Length);
+        destination.ToArray().Should().Equal(Content[6..]);
+        _storageRequests.Should().ContainSingle();
+    }
+
+    [Fact]
+    public async Task DownloadDocumentToFileAsync_WithPartialFileOfSameVersion_ShouldResumeFromFileLength()
+    {
+        // Arrange
+        _storageHandler.Respond = RespondWithRange;
+        await File.WriteAllBytesAsync(_filePath, Content[..4]);
+        await File.WriteAllLinesAsync(_filePath + ".download", new[] { "1", "10", "" });
+
+        // Act
+        var total = await _client.DownloadDocumentToFileAsync(1, 2, _filePath, new DownloadDocumentOptions { ChunkSize = 4 });
+
+        // Assert
+        total.Should().Be(Content.Length);
+        (await File.ReadAllBytesAsync(_filePath)).Should().Equal(Content);
+        _storageRequests.Select(r => r.Headers.Range!.ToString()).Should().Equal("bytes=4-7", "bytes=8-11");
+        File.Exists(_filePath + ".download").Should().BeFalse();
+    }
+
+    [Fact]
+    public async Task DownloadDocumentToFileAsync_WhenFileIsLongerThanContent_ShouldDownloadAgainFromStart()
+    {
+        // Arrange
+        _storageHandler.Respond = RespondWithRange;
+        await File.WriteAllBytesAsync(_filePath, Encoding.ASCII.GetBytes("stale content from before"));
+        await File.WriteAllLinesAsync(_filePath + ".download", new[] { "1", "10", "" });
+
+        // Act
+        var total = await _client.DownloadDocumentToFileAsync(1, 2, _filePath, new DownloadDocumentOptions { ChunkSize = 4 });
+
+        // Assert
+        total.Should().Be(Content.Length);
+        (await File.ReadAllBytesAsync(_filePath)).Should().Equal(Content);
+        _storageRequests.First().Headers.Range!.ToString().Should().Be("bytes=0-3");
+    }
+
+    [Fact]
+    public async Task DownloadDocumentToFileAsync_WhenFileIsFromAnotherVersion_ShouldDownloadAgainFromStart()
+    {
+        // Arrange
+        _storageHandler.Respond = RespondWithRange;
+        await File.WriteAllBytesAsync(_filePath, Encoding.ASCII.GetBytes("abcd"));
+        await File.WriteAllLinesAsync(_filePath + ".download", new[] { "0", "10", "" });
+
+        // Act
+        var total = await _client.DownloadDocumentToFileAsync(1, 2, _filePath, new DownloadDocumentOptions { ChunkSize = 4 });
+
+        // Assert
+        total.Should().Be(Content.Length);
+        (await File.ReadAllBytesAsync(_filePath)).Should().Equal(Content);
+        _storageRequests.First().Headers.Range!.ToString().Should().Be("bytes=0-3");
+    }
+
+    [Fact]
+    public async Task DownloadDocumentToFileAsync_WhenContentChangedSincePartialFile_ShouldDownloadAgainFromStart()
+    {
+        // Arrange
+        _storageHandler.Respond = request =>
+        {
+            if (request.Headers.IfRange != null)
+            {
+                // The stored ETag no longer matches, so the server ignores the range
+                _storageRequests.Add(request);
+                return new HttpResponseMessage(HttpStatusCode.OK) { Content = new ByteArrayContent(Content) };
+            }
+
+            return RespondWithRange(request);
+        };
+        await File.WriteAllBytesAsync(_filePath, Encoding.ASCII.GetBytes("abcd"));
+        await File.WriteAllLinesAsync(_filePath + ".download", new[] { "1", "10", "\"old\"" });
+
+        // Act
+        var total = await _client.DownloadDocumentToFileAsync(1, 2, _filePath, new DownloadDocumentOptions { ChunkSize = 4 });
+
+        // Assert
+        total.Should().Be(Content.Length);
+        (await File.ReadAllBytesAsync(_filePath)).Should().Equal(Content);
+        _storageRequests.First().Headers.IfRange!.EntityTag!.Tag.Should().Be("\"old\"");
+        _storageRequests.Skip(1).Select(r => r.Headers.Range!.ToString()).Should().Equal("bytes=0-3", "bytes=4-7", "bytes=8-11");
+    }
+
+    public void Dispose()
+    {
+        File.Delete(_filePath);
+        File.Delete(_filePath + ".download");
+        _client.Dispose();
+        _apiHttpClient.Dispose();
+        _storageHandler.Dispose();
+    }
+
+    private HttpResponseMessage RespondWithRange(HttpRequestMessage request)
+    {
+        _storageRequests.Add(request);
+        var range = request.Headers.Range!.Ranges.Single();
+        var to = Math.Min(range.To!.Value, Content.Length - 1);
+        var response = new HttpResponseMessage(HttpStatusCode.PartialContent)
+        {
+            Content = new ByteArrayContent(Content[(int)range.From!.Value..((int)to + 1)])
+        };
+        response.Content.Headers.ContentRange = new ContentRangeHeaderValue(range.From.Value, to, Content.Length);
+        return response;
+    }
+
+    private sealed class StubHandler : HttpMessageHandler
+    {
+        public Func<HttpRequestMessage, HttpResponseMessage> Respond { get; set; } = _ => new HttpResponseMessage(HttpStatusCode.NotFound);
+
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            return Task.FromResult(Respond(request));
+        }
+    }
+}
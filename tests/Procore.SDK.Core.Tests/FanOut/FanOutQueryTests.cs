@@ -0,0 +1,155 @@
+using Procore.SDK.Core.FanOut;
+using Procore.SDK.Core.Models;
+
+namespace Procore.SDK.Core.Tests.FanOut;
+
+/// <summary>
+/// Tests for bounded-concurrency fan-out queries.
+/// </summary>
+public class FanOutQueryTests
+{
+    [Fact]
+    public async Task ExecuteAsync_ShouldNeverExceedMaxConcurrency()
+    {
+        // Arrange
+        var running = 0;
+        var peak = 0;
+        var options = new FanOutOptions { MaxConcurrency = 3 };
+
+        async Task<IEnumerable<int>> QueryAsync(int source, CancellationToken ct)
+        {
+            var current = Interlocked.Increment(ref running);
+            InterlockedMax(ref peak, current);
+            await Task.Delay(10, ct);
+            Interlocked.Decrement(ref running);
+            return new[] { source };
+        }
+
+        // Act
+        var results = await CollectAsync(FanOutQuery.ExecuteAsync(Enumerable.Range(0, 20), QueryAsync, options));
+
+        // Assert
+        results.Should().HaveCount(20);
+        results.SelectMany(r => r.Items).Should().BeEquivalentTo(Enumerable.Range(0, 20));
+        peak.Should().BeLessOrEqualTo(3);
+    }
+
+    [Fact]
+    public async Task ExecuteAsync_WhenOneSourceFails_ShouldReportItAndContinue()
+    {
+        // Arrange
+        Task<IEnumerable<int>> QueryAsync(int source, CancellationToken ct) =>
+            source == 2
+                ? Task.FromException<IEnumerable<int>>(new InvalidOperationException("boom"))
+                : Task.FromResult<IEnumerable<int>>(new[] { source });
+
+        // Act
+        var results = await CollectAsync(FanOutQuery.ExecuteAsync(Enumerable.Range(0, 5), QueryAsync));
+
+        // Assert
+        results.Should().HaveCount(5);
+        var failed = results.Single(r => !r.Succeeded);
+        failed.Source.Should().Be(2);
+        failed.Items.Should().BeEmpty();
+        failed.Exception.Should().BeOfType<InvalidOperationException>();
+    }
+
+    [Fact]
+    public async Task ExecuteAsync_WithPreserveOrder_ShouldYieldInSourceOrder()
+    {
+        // Arrange
+        var options = new FanOutOptions { MaxConcurrency = 4, PreserveOrder = true };
+
+        async Task<IEnumerable<int>> QueryAsync(int source, CancellationToken ct)
+        {
+            // Earlier sources finish last
+            await Task.Delay((8 - source) * 5, ct);
+            return new[] { source };
+        }
+
+        // Act
+        var results = await CollectAsync(FanOutQuery.ExecuteAsync(Enumerable.Range(0, 8), QueryAsync, options));
+
+        // Assert
+        results.Select(r => r.Index).Should().Equal(Enumerable.Range(0, 8));
+    }
+
+    [Fact]
+    public async Task ExecuteAsync_WhenRateLimited_ShouldRetryTheSource()
+    {
+        // Arrange
+        var attempts = 0;
+
+        Task<IEnumerable<int>> QueryAsync(int source, CancellationToken ct) =>
+            Interlocked.Increment(ref attempts) == 1
+                ? Task.FromException<IEnumerable<int>>(new RateLimitExceededException(TimeSpan.FromMilliseconds(20)))
+                : Task.FromResult<IEnumerable<int>>(new[] { source });
+
+        // Act
+        var results = await CollectAsync(FanOutQuery.ExecuteAsync(new[] { 7 }, QueryAsync));
+
+        // Assert
+        attempts.Should().Be(2);
+        results.Should().ContainSingle(r => r.Succeeded && r.Items.Single() == 7);
+    }
+
+    [Fact]
+    public async Task ExecuteAsync_WhenConsumerStopsEarly_ShouldCancelRunningQueries()
+    {
+        // Arrange
+        var cancelled = 0;
+        var options = new FanOutOptions { MaxConcurrency = 2 };
+        var slowQueryStarted = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        async Task<IEnumerable<int>> QueryAsync(int source, CancellationToken ct)
+        {
+            if (source == 0)
+            {
+                await slowQueryStarted.Task;
+                return new[] { source };
+            }
+
+            slowQueryStarted.TrySetResult();
+            try
+            {
+                await Task.Delay(Timeout.Infinite, ct);
+            }
+            catch (OperationCanceledException)
+            {
+                Interlocked.Increment(ref cancelled);
+                throw;
+            }
+
+            return new[] { source };
+        }
+
+        // Act
+        await foreach (var _ in FanOutQuery.ExecuteAsync(Enumerable.Range(0, 10), QueryAsync, options))
+        {
+            break;
+        }
+
+        // Assert
+        cancelled.Should().BeGreaterThan(0);
+    }
+
+    private static async Task<List<FanOutResult<int, int>>> CollectAsync(IAsyncEnumerable<FanOutResult<int, int>> results)
+    {
+        var collected = new List<FanOutResult<int, int>>();
+        await foreach (var result in results)
+        {
+            collected.Add(result);
+        }
+
+        return collected;
+    }
+
+    private static void InterlockedMax(ref int target, int value)
+    {
+        int current;
+        while ((current = Volatile.Read(ref target)) < value &&
+            Interlocked.CompareExchange(ref target, value, current) != current)
+        {
+        }
+    }
+}
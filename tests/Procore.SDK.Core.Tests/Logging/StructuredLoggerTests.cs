@@ -0,0 +1,87 @@
+using Procore.SDK.Core.Logging;
+
+namespace Procore.SDK.Core.Tests.Logging;
+
+/// <summary>
+/// Tests for level guards in the structured logger.
+/// </summary>
+public class StructuredLoggerTests
+{
+    [Fact]
+    public void BeginOperation_WhenInformationDisabled_ShouldReturnSharedScopeWithoutLogging()
+    {
+        // Arrange
+        var logger = Substitute.For<ILogger<StructuredLogger>>();
+        logger.IsEnabled(Arg.Any<LogLevel>()).Returns(false);
+        var structuredLogger = new StructuredLogger(logger);
+
+        // Act
+        var first = structuredLogger.BeginOperation("GetProjectsAsync", "correlation-1");
+        var second = structuredLogger.BeginOperation("GetProjectsAsync", "correlation-2");
+        first.Dispose();
+
+        // Assert
+        first.Should().BeSameAs(second);
+        logger.ReceivedCalls().Should().NotContain(call => call.GetMethodInfo().Name == nameof(ILogger.Log));
+    }
+
+    [Fact]
+    public void BeginOperation_WhenInformationEnabled_ShouldLogStartAndCompletion()
+    {
+        // Arrange
+        var logger = Substitute.For<ILogger<StructuredLogger>>();
+        logger.IsEnabled(Arg.Any<LogLevel>()).Returns(true);
+        var structuredLogger = new StructuredLogger(logger);
+
+        // Act
+        using (structuredLogger.BeginOperation("GetProjectsAsync", "correlation-1"))
+        {
+        }
+
+        // Assert
+        logger.ReceivedCalls()
+            .Where(call => call.GetMethodInfo().Name == nameof(ILogger.Log))
+            .Select(call => (LogLevel)call.GetArguments()[0]!)
+            .Should().Equal(LogLevel.Information, LogLevel.Information);
+    }
+
+    [Fact]
+    public void LogRetryAttempt_WhenWarningEnabled_ShouldIncludeException()
+    {
+        // Arrange
+        var logger = Substitute.For<ILogger<StructuredLogger>>();
+        logger.IsEnabled(Arg.Any<LogLevel>()).Returns(true);
+        var structuredLogger = new StructuredLogger(logger);
+        var exception = new HttpRequestException("boom");
+
+        // Act
+        structuredLogger.LogRetryAttempt("GetProjectsAsync", "correlation-1", 2, TimeSpan.FromMilliseconds(250), exception);
+
+        // Assert
+        logger.ReceivedCalls()
+            .Where(call => call.GetMethodInfo().Name == nameof(ILogger.Log))
+            .Should().ContainSingle(call => (LogLevel)call.GetArguments()[0]! == LogLevel.Warning
+                && ReferenceEquals(call.GetArguments()[3], exception));
+    }
+
+    [Fact]
+    public void LogWarning_ShouldPassCallerTemplateThroughUnchanged()
+    {
+        // Arrange
+        var logger = Substitute.For<ILogger<StructuredLogger>>();
+        logger.IsEnabled(Arg.Any<LogLevel>()).Returns(true);
+        var structuredLogger = new StructuredLogger(logger);
+        const string template = "Project {ProjectId} not found";
+
+        // Act
+        structuredLogger.LogWarning("GetProjectAsync", "correlation-1", template, 42);
+        structuredLogger.LogWarning("GetProjectsAsync", "correlation-2", template, 43);
+
+        // Assert
+        logger.ReceivedCalls()
+            .Where(call => call.GetMethodInfo().Name == nameof(ILogger.Log))
+            .Select(call => ((IReadOnlyList<KeyValuePair<string, object?>>)call.GetArguments()[2]!)
+                .Single(pair => pair.Key == "{OriginalFormat}").Value)
+            .Should().Equal(template, template);
+    }
+}
@@ -0,0 +1,107 @@
+using CoreModels = Procore.SDK.Core.Models;
+
+namespace Procore.SDK.Core.Tests.Models;
+
+/// <summary>
+/// Tests for assigned-property tracking on update requests.
+/// </summary>
+public class PartialUpdateRequestTests
+{
+    [Fact]
+    public void NewRequest_ShouldHaveNoChanges()
+    {
+        // Arrange & Act
+        var request = new CoreModels.UpdateUserRequest();
+
+        // Assert
+        request.HasChanges.Should().BeFalse();
+        request.SetProperties.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void AssigningProperties_ShouldRecordOnlyNonEmptyValues()
+    {
+        // Arrange & Act
+        var request = new CoreModels.UpdateUserRequest
+        {
+            FirstName = "Jane",
+            LastName = string.Empty,
+            JobTitle = null
+        };
+
+        // Assert
+        request.HasChanges.Should().BeTrue();
+        request.IsSet(nameof(request.FirstName)).Should().BeTrue();
+        request.IsSet(nameof(request.LastName)).Should().BeFalse();
+        request.IsSet(nameof(request.JobTitle)).Should().BeFalse();
+        request.SetProperties.Should().BeEquivalentTo(nameof(request.FirstName));
+    }
+
+    [Fact]
+    public void AssigningNull_ShouldLeavePropertyUnchanged()
+    {
+        // Arrange
+        var request = new CoreModels.UpdateDocumentRequest { Description = "Old" };
+
+        // Act
+        request.Description = null;
+
+        // Assert
+        request.HasChanges.Should().BeFalse();
+        request.IsCleared(nameof(request.Description)).Should().BeFalse();
+    }
+
+    [Fact]
+    public void CopyIfSet_ShouldAssignValuesWriteNullsForClearedAndSkipTheRest()
+    {
+        // Arrange
+        var request = new CoreModels.UpdateUserRequest { FirstName = "Jane", LastName = null };
+        request.Clear(nameof(request.JobTitle));
+        var additionalData = new Dictionary<string, object>();
+        string? firstName = null;
+        string? lastName = null;
+
+        // Act
+        var firstNameCopied = request.CopyIfSet(nameof(request.FirstName), request.FirstName, value => firstName = value, additionalData, "first_name");
+        var jobTitleCopied = request.CopyIfSet(nameof(request.JobTitle), request.JobTitle, _ => { }, additionalData, "job_title");
+        var lastNameCopied = request.CopyIfSet(nameof(request.LastName), request.LastName, value => lastName = value, additionalData, "last_name");
+
+        // Assert
+        firstNameCopied.Should().BeTrue();
+        firstName.Should().Be("Jane");
+        jobTitleCopied.Should().BeTrue();
+        additionalData.Should().ContainKey("job_title").WhoseValue.Should().BeNull();
+        lastNameCopied.Should().BeFalse();
+        lastName.Should().BeNull();
+        additionalData.Should().NotContainKey("last_name");
+    }
+
+    [Fact]
+    public void Clear_ShouldDiscardAssignedValue()
+    {
+        // Arrange
+        var request = new CoreModels.UpdateUserRequest { JobTitle = "Engineer" };
+
+        // Act
+        request.Clear(nameof(request.JobTitle));
+
+        // Assert
+        request.IsSet(nameof(request.JobTitle)).Should().BeFalse();
+        request.IsCleared(nameof(request.JobTitle)).Should().BeTrue();
+        request.HasChanges.Should().BeTrue();
+    }
+
+    [Fact]
+    public void Clear_WithNonClearableProperty_ShouldThrow()
+    {
+        // Arrange
+        var request = new CoreModels.UpdateUserRequest();
+
+        // Act
+        var act = () => request.Clear(nameof(request.Email));
+
+        // Assert
+        act.Should().Throw<ArgumentException>().WithParameterName("propertyName");
+        request.HasChanges.Should().BeFalse();
+    }
+}
@@ -0,0 +1,178 @@
+using System.Diagnostics.Metrics;
+using Polly.CircuitBreaker;
+using Procore.SDK.Core.Resilience;
+using Procore.SDK.Shared.Diagnostics;
+
+namespace Procore.SDK.Core.Tests.Resilience;
+
+/// <summary>
+/// Tests for route-template policy keys, circuit breaker scopes and the bounded policy cache.
+/// </summary>
+public class PolicyFactoryCacheTests
+{
+    [Theory]
+    [InlineData("/rest/v1.0/companies/123/users?page=2", "GET /rest/v1.0/companies/{id}/users")]
+    [InlineData("/rest/v1.0/projects/42/observations/items/7", "GET /rest/v1.0/projects/{id}/observations/items/{id}")]
+    [InlineData("/rest/v1.0/companies", "GET /rest/v1.0/companies")]
+    [InlineData("/rest/v1.0/files/3f2504e0-4f89-11d3-9a0c-0305e82c3301", "GET /rest/v1.0/files/{id}")]
+    public void RouteTemplate_FromRequest_ShouldTemplateIdentifierSegments(string path, string expected)
+    {
+        // Act
+        var route = RouteTemplate.FromRequest(HttpMethod.Get, new Uri("https://api.procore.com" + path));
+
+        // Assert
+        route.Should().Be(expected);
+    }
+
+    [Fact]
+    public void CreateHttpPolicy_SameRouteDifferentIds_ShouldShareOnePolicy()
+    {
+        // Arrange
+        var factory = CreateFactory();
+
+        // Act
+        var first = factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/companies/1/users?page=1"));
+        var second = factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/companies/2/users?page=3"));
+
+        // Assert
+        second.Should().BeSameAs(first);
+        factory.CachedPolicyCount.Should().Be(1);
+    }
+
+    [Fact]
+    public void CreateHttpPolicy_OperationScope_ShouldKeepSeparatePolicies()
+    {
+        // Arrange
+        var factory = CreateFactory(options => options.CircuitBreaker.Scope = CircuitBreakerScope.Operation);
+
+        // Act
+        var first = factory.CreateHttpPolicy(new ResilienceContext("GetCompaniesAsync"));
+        var second = factory.CreateHttpPolicy(new ResilienceContext("GetUsersAsync"));
+
+        // Assert
+        second.Should().NotBeSameAs(first);
+    }
+
+    [Fact]
+    public void CreateHttpPolicy_OperationScope_ShouldIgnoreIdsAndQueryString()
+    {
+        // Arrange
+        var factory = CreateFactory(options => options.CircuitBreaker.Scope = CircuitBreakerScope.Operation);
+
+        // Act
+        var first = factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/companies/1/users?filters[search]=jane@example.com"));
+        var second = factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/companies/2/users?page=3"));
+
+        // Assert
+        second.Should().BeSameAs(first);
+        factory.CachedPolicyCount.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task CreateHttpPolicy_OperationScope_ShouldNotTagCircuitMetricWithQueryString()
+    {
+        // Arrange
+        var circuitKeys = new List<string>();
+        using var listener = new MeterListener
+        {
+            InstrumentPublished = (instrument, meterListener) =>
+            {
+                if (instrument.Meter.Name == ProcoreTelemetry.MeterName && instrument.Name == "procore.circuit_breaker.transitions")
+                {
+                    meterListener.EnableMeasurementEvents(instrument);
+                }
+            }
+        };
+        listener.SetMeasurementEventCallback<long>((_, _, tags, _) =>
+        {
+            foreach (var tag in tags)
+            {
+                if (tag.Key == ProcoreTelemetry.CircuitTag)
+                {
+                    lock (circuitKeys) { circuitKeys.Add((string)tag.Value!); }
+                }
+            }
+        });
+        listener.Start();
+
+        var factory = CreateFactory(options =>
+        {
+            options.Retry.MaxAttempts = 0;
+            options.CircuitBreaker.Scope = CircuitBreakerScope.Operation;
+            options.CircuitBreaker.FailureThreshold = 1;
+        });
+        var policy = factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/companies/7/users?filters[search]=jane@example.com"));
+
+        // Act
+        await policy.ExecuteAsync(() => Task.FromResult(new HttpResponseMessage(HttpStatusCode.ServiceUnavailable)));
+
+        // Assert
+        lock (circuitKeys)
+        {
+            circuitKeys.Should().Contain("GET /rest/v1.0/companies/{id}/users");
+            circuitKeys.Should().NotContain(key => key.Contains("jane@example.com") || key.Contains('?'));
+        }
+    }
+
+    [Fact]
+    public void CreateHttpPolicy_HostScope_ShouldShareAcrossRoutesOnSameHost()
+    {
+        // Arrange
+        var factory = CreateFactory(options => options.CircuitBreaker.Scope = CircuitBreakerScope.Host);
+
+        // Act
+        var first = factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/companies") { Host = "api.procore.com" });
+        var second = factory.CreateHttpPolicy(new ResilienceContext("POST /rest/v1.0/projects") { Host = "api.procore.com" });
+
+        // Assert
+        second.Should().BeSameAs(first);
+    }
+
+    [Fact]
+    public void CreateHttpPolicy_BeyondCapacity_ShouldEvictLeastRecentlyUsed()
+    {
+        // Arrange
+        var factory = CreateFactory(options => options.MaxCachedPolicies = 2);
+
+        // Act
+        var companies = factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/companies"));
+        factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/projects"));
+        factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/companies"));
+        factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/users"));
+
+        // Assert
+        factory.CachedPolicyCount.Should().Be(2);
+        factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/companies")).Should().BeSameAs(companies);
+    }
+
+    [Fact]
+    public async Task CreateHttpPolicy_RouteScope_ShouldShareCircuitBreakerStateAcrossIds()
+    {
+        // Arrange
+        var factory = CreateFactory(options =>
+        {
+            options.Retry.MaxAttempts = 0;
+            options.CircuitBreaker.FailureThreshold = 2;
+        });
+
+        for (var id = 1; id <= 2; id++)
+        {
+            var failing = factory.CreateHttpPolicy(new ResilienceContext($"GET /rest/v1.0/projects/{id}"));
+            await failing.ExecuteAsync(() => Task.FromResult(new HttpResponseMessage(HttpStatusCode.ServiceUnavailable)));
+        }
+
+        // Act
+        var policy = factory.CreateHttpPolicy(new ResilienceContext("GET /rest/v1.0/projects/3"));
+        var act = () => policy.ExecuteAsync(() => Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK)));
+
+        // Assert
+        await act.Should().ThrowAsync<BrokenCircuitException>();
+    }
+
+    private static PolicyFactory CreateFactory(Action<ResilienceOptions>? configure = null)
+    {
+        var options = new ResilienceOptions();
+        configure?.Invoke(options);
+        return new PolicyFactory(Options.Create(options), Substitute.For<ILogger<PolicyFactory>>());
+    }
+}
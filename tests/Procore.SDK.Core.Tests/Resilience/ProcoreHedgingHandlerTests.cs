@@ -0,0 +1,248 @@
+using Procore.SDK.Core.Resilience;
+
+namespace Procore.SDK.Core.Tests.Resilience;
+
+/// <summary>
+/// Tests for hedged idempotent requests and the shared hedge budget.
+/// </summary>
+public class ProcoreHedgingHandlerTests : IDisposable
+{
+    private const string ProjectsPath = "/rest/v1.0/companies/1/projects";
+
+    private readonly ResilienceOptions _options;
+    private readonly StubHandler _innerHandler;
+    private readonly HttpClient _httpClient;
+    private int _sendCount;
+
+    public ProcoreHedgingHandlerTests()
+    {
+        _options = new ResilienceOptions
+        {
+            Hedging = new HedgingOptions { Enabled = true, DelayMs = 50, UseObservedLatency = false, BudgetPercent = 100 }
+        };
+        _innerHandler = new StubHandler();
+        _httpClient = CreateClient();
+    }
+
+    [Fact]
+    public async Task SendAsync_SlowFirstAttempt_ShouldReturnHedgeAndCancelFirstAttempt()
+    {
+        // Arrange
+        CancellationToken firstAttemptToken = default;
+        _innerHandler.SendAsyncFunc = async (_, ct) =>
+        {
+            if (Interlocked.Increment(ref _sendCount) == 1)
+            {
+                firstAttemptToken = ct;
+                await Task.Delay(Timeout.Infinite, ct);
+            }
+
+            return new HttpResponseMessage(HttpStatusCode.OK) { Content = new StringContent("hedge") };
+        };
+
+        // Act
+        using var response = await _httpClient.GetAsync(ProjectsPath);
+
+        // Assert
+        _sendCount.Should().Be(2);
+        (await response.Content.ReadAsStringAsync()).Should().Be("hedge");
+        firstAttemptToken.IsCancellationRequested.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task SendAsync_HedgeWinsWhileFirstAttemptFails_ShouldReturnHedge()
+    {
+        // Arrange
+        _innerHandler.SendAsyncFunc = async (_, _) =>
+        {
+            if (Interlocked.Increment(ref _sendCount) == 1)
+            {
+                // Fails after the hedge has won, without honouring cancellation
+                await Task.Delay(150);
+                throw new HttpRequestException("first attempt failed");
+            }
+
+            return new HttpResponseMessage(HttpStatusCode.OK) { Content = new StringContent("hedge") };
+        };
+
+        // Act
+        using var response = await _httpClient.GetAsync(ProjectsPath);
+
+        // Assert
+        (await response.Content.ReadAsStringAsync()).Should().Be("hedge");
+    }
+
+    [Fact]
+    public async Task SendAsync_HedgeFailsFirst_ShouldFallBackToFirstAttempt()
+    {
+        // Arrange
+        _innerHandler.SendAsyncFunc = async (_, ct) =>
+        {
+            if (Interlocked.Increment(ref _sendCount) == 1)
+            {
+                await Task.Delay(200, ct);
+                return new HttpResponseMessage(HttpStatusCode.OK) { Content = new StringContent("first") };
+            }
+
+            throw new HttpRequestException("hedge failed");
+        };
+
+        // Act
+        using var response = await _httpClient.GetAsync(ProjectsPath);
+
+        // Assert
+        _sendCount.Should().Be(2);
+        (await response.Content.ReadAsStringAsync()).Should().Be("first");
+    }
+
+    [Fact]
+    public async Task SendAsync_HandlerRegisteredTwice_ShouldHedgeOnce()
+    {
+        // Arrange
+        var outer = new ProcoreHedgingHandler(
+            new HedgingBudget(_options.Hedging),
+            new RouteLatencyTracker(),
+            Substitute.For<ILogger<ProcoreHedgingHandler>>(),
+            Options.Create(_options))
+        {
+            InnerHandler = new ProcoreHedgingHandler(
+                new HedgingBudget(_options.Hedging),
+                new RouteLatencyTracker(),
+                Substitute.For<ILogger<ProcoreHedgingHandler>>(),
+                Options.Create(_options))
+            {
+                InnerHandler = _innerHandler
+            }
+        };
+        using var client = new HttpClient(outer) { BaseAddress = new Uri("https://api.procore.com") };
+        SetupSlowResponse(TimeSpan.FromMilliseconds(200));
+
+        // Act
+        await client.GetAsync(ProjectsPath);
+
+        // Assert
+        _sendCount.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task SendAsync_FastResponse_ShouldNotHedge()
+    {
+        // Arrange
+        _innerHandler.SendAsyncFunc = (_, _) =>
+        {
+            Interlocked.Increment(ref _sendCount);
+            return Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK));
+        };
+
+        // Act
+        await _httpClient.GetAsync(ProjectsPath);
+
+        // Assert
+        _sendCount.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task SendAsync_NonIdempotentMethod_ShouldNotHedge()
+    {
+        // Arrange
+        SetupSlowResponse(TimeSpan.FromMilliseconds(200));
+
+        // Act
+        await _httpClient.PostAsync(ProjectsPath, new StringContent("{}"));
+
+        // Assert
+        _sendCount.Should().Be(1);
+    }
+
+    [Fact]
+    public void HedgingBudget_ShouldAllowHedgesInProportionToRequests()
+    {
+        // Arrange
+        var budget = new HedgingBudget(new HedgingOptions { BudgetPercent = 10, BudgetBurst = 10 });
+
+        // Act
+        for (var i = 0; i < 25; i++)
+        {
+            budget.RecordRequest();
+        }
+
+        var allowed = Enumerable.Range(0, 5).Count(_ => budget.TryAcquire());
+
+        // Assert
+        allowed.Should().Be(2);
+        budget.HedgesRejected.Should().Be(3);
+    }
+
+    [Fact]
+    public async Task SendAsync_WhenBudgetIsExhausted_ShouldWaitForFirstAttempt()
+    {
+        // Arrange
+        _options.Hedging.BudgetPercent = 0;
+        using var client = CreateClient();
+        SetupSlowResponse(TimeSpan.FromMilliseconds(200));
+
+        // Act
+        await client.GetAsync(ProjectsPath);
+
+        // Assert
+        _sendCount.Should().Be(1);
+    }
+
+    [Fact]
+    public void RouteLatencyTracker_ShouldRequireMinimumSamples()
+    {
+        // Arrange
+        var tracker = new RouteLatencyTracker();
+        var route = RouteTemplate.FromRequest(HttpMethod.Get, new Uri("https://api.procore.com" + ProjectsPath));
+        var tenMilliseconds = System.Diagnostics.Stopwatch.Frequency / 100;
+
+        // Act
+        for (var i = 0; i < 5; i++)
+        {
+            tracker.Record(route, tenMilliseconds);
+        }
+
+        // Assert
+        tracker.GetLatency(route, 0.95, minimumSamples: 10).Should().BeNull();
+        tracker.GetLatency(route, 0.95, minimumSamples: 5).Should().NotBeNull();
+        tracker.GetLatency(route, 0.95, minimumSamples: 5)!.Value.TotalMilliseconds.Should().BeInRange(8, 15);
+    }
+
+    private HttpClient CreateClient()
+    {
+        var handler = new ProcoreHedgingHandler(
+            new HedgingBudget(_options.Hedging),
+            new RouteLatencyTracker(),
+            Substitute.For<ILogger<ProcoreHedgingHandler>>(),
+            Options.Create(_options))
+        {
+            InnerHandler = _innerHandler
+        };
+
+        return new HttpClient(handler) { BaseAddress = new Uri("https://api.procore.com") };
+    }
+
+    private void SetupSlowResponse(TimeSpan delay)
+    {
+        _innerHandler.SendAsyncFunc = async (_, ct) =>
+        {
+            Interlocked.Increment(ref _sendCount);
+            await Task.Delay(delay, ct);
+            return new HttpResponseMessage(HttpStatusCode.OK);
+        };
+    }
+
+    public void Dispose()
+    {
+        _httpClient.Dispose();
+    }
+
+    private sealed class StubHandler : HttpMessageHandler
+    {
+        public Func<HttpRequestMessage, CancellationToken, Task<HttpResponseMessage>> SendAsyncFunc { get; set; } =
+            (_, _) => Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK));
+
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken) =>
+            SendAsyncFunc(request, cancellationToken);
+    }
+}
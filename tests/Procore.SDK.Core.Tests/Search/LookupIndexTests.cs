@@ -0,0 +1,163 @@
+using Procore.SDK.Core.Search;
+using CoreModels = Procore.SDK.Core.Models;
+
+namespace Procore.SDK.Core.Tests.Search;
+
+/// <summary>
+/// Tests for the in-memory lookup indexes and their refreshable cache.
+/// </summary>
+public class LookupIndexTests
+{
+    [Fact]
+    public void Find_ShouldMatchKeysIgnoringCase()
+    {
+        // Arrange
+        var acme = new CoreModels.Company { Id = 1, Name = "Acme Builders" };
+        var index = new LookupIndex<CoreModels.Company>(
+            new[] { acme, new CoreModels.Company { Id = 2, Name = "Beacon Construction" } },
+            company => new[] { company.Name });
+
+        // Act
+        var result = index.Find("ACME builders");
+
+        // Assert
+        result.Should().ContainSingle().Which.Should().BeSameAs(acme);
+        index.Find("Acme").Should().BeEmpty();
+        index.Count.Should().Be(2);
+    }
+
+    [Fact]
+    public void FindByPrefix_ShouldReturnEachMatchOnceInKeyOrderUpToMaxResults()
+    {
+        // Arrange
+        var users = new[]
+        {
+            new CoreModels.User { Id = 1, FirstName = "Jane", LastName = "Jansen" },
+            new CoreModels.User { Id = 2, FirstName = "Jack", LastName = "Smith" },
+            new CoreModels.User { Id = 3, FirstName = "Amy", LastName = "Jones" },
+            new CoreModels.User { Id = 4, FirstName = "Bob", LastName = "Brown" }
+        };
+        var index = new LookupIndex<CoreModels.User>(users, user => new[] { user.FirstName, user.LastName });
+
+        // Act
+        var all = index.FindByPrefix("ja");
+        var limited = index.FindByPrefix("J", maxResults: 2);
+
+        // Assert
+        all.Select(user => user.Id).Should().Equal(2, 1);
+        limited.Should().HaveCount(2);
+        index.FindByPrefix("z").Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task CoreLookupIndexes_ShouldIndexDocumentsByContentTypeAndEverySuffix()
+    {
+        // Arrange
+        var indexes = new CoreLookupIndexes();
+        var archive = new CoreModels.Document { Id = 1, FileName = "plans.tar.gz", ContentType = "application/gzip" };
+        var drawing = new CoreModels.Document { Id = 2, FileName = "site.PDF", ContentType = "application/pdf" };
+
+        // Act
+        var index = await indexes.GetDocumentsAsync(7, () => Task.FromResult<IEnumerable<CoreModels.Document>>(new[] { archive, drawing }));
+
+        // Assert
+        index.Find("tar.gz").Should().ContainSingle().Which.Should().BeSameAs(archive);
+        index.Find("gz").Should().ContainSingle().Which.Should().BeSameAs(archive);
+        index.Find("pdf").Should().ContainSingle().Which.Should().BeSameAs(drawing);
+        index.Find("application/PDF").Should().ContainSingle().Which.Should().BeSameAs(drawing);
+    }
+
+    [Fact]
+    public async Task CoreLookupIndexes_WithDifferentAccessTokens_ShouldKeepIndexesApart()
+    {
+        // Arrange
+        var tokenManager = Substitute.For<ITokenManager>();
+        var indexes = new CoreLookupIndexes(tokenManager: tokenManager);
+        var expiresAt = DateTimeOffset.UtcNow.AddHours(1);
+        var aliceToken = new AccessToken("alice-token", "Bearer", expiresAt);
+        var bobToken = new AccessToken("bob-token", "Bearer", expiresAt);
+        Func<string, Func<Task<IEnumerable<CoreModels.Document>>>> loadFor = fileName =>
+            () => Task.FromResult<IEnumerable<CoreModels.Document>>(new[] { new CoreModels.Document { FileName = fileName } });
+
+        // Act
+        tokenManager.GetAccessTokenAsync(Arg.Any<CancellationToken>()).Returns(aliceToken);
+        await indexes.GetDocumentsAsync(7, loadFor("alice.pdf"));
+        tokenManager.GetAccessTokenAsync(Arg.Any<CancellationToken>()).Returns(bobToken);
+        var bobIndex = await indexes.GetDocumentsAsync(7, loadFor("bob.pdf"));
+        tokenManager.GetAccessTokenAsync(Arg.Any<CancellationToken>()).Returns(aliceToken);
+        var aliceIndex = await indexes.GetDocumentsAsync(7, loadFor("unused.pdf"));
+
+        // Assert
+        bobIndex.Find("pdf").Should().ContainSingle().Which.FileName.Should().Be("bob.pdf");
+        aliceIndex.Find("pdf").Should().ContainSingle().Which.FileName.Should().Be("alice.pdf");
+    }
+
+    [Fact]
+    public async Task GetAsync_ConcurrentLookups_ShouldShareOneLoad()
+    {
+        // Arrange
+        var cache = new LookupIndexCache<int, CoreModels.Company>(company => new[] { company.Name }, TimeSpan.FromMinutes(5));
+        var release = new TaskCompletionSource<IEnumerable<CoreModels.Company>>();
+        var loadCount = 0;
+        Func<Task<IEnumerable<CoreModels.Company>>> load = () =>
+        {
+            Interlocked.Increment(ref loadCount);
+            return release.Task;
+        };
+
+        // Act
+        var first = cache.GetAsync(1, load);
+        var second = cache.GetAsync(1, load);
+        release.SetResult(new[] { new CoreModels.Company { Id = 1, Name = "Acme" } });
+        var indexes = await Task.WhenAll(first, second);
+        await cache.GetAsync(1, load);
+
+        // Assert
+        loadCount.Should().Be(1);
+        indexes[0].Should().BeSameAs(indexes[1]);
+    }
+
+    [Fact]
+    public async Task GetAsync_AfterInvalidateOrExpiry_ShouldReload()
+    {
+        // Arrange
+        var cached = new LookupIndexCache<int, CoreModels.Company>(company => new[] { company.Name }, TimeSpan.FromMinutes(5));
+        var expiring = new LookupIndexCache<int, CoreModels.Company>(company => new[] { company.Name }, TimeSpan.Zero);
+        var loadCount = 0;
+        Func<Task<IEnumerable<CoreModels.Company>>> load = () =>
+        {
+            Interlocked.Increment(ref loadCount);
+            return Task.FromResult<IEnumerable<CoreModels.Company>>(Array.Empty<CoreModels.Company>());
+        };
+
+        // Act
+        await cached.GetAsync(1, load);
+        cached.Invalidate(1);
+        await cached.GetAsync(1, load);
+        await expiring.GetAsync(1, load);
+        await expiring.GetAsync(1, load);
+
+        // Assert
+        loadCount.Should().Be(4);
+    }
+
+    [Fact]
+    public async Task GetAsync_WhenLoadFails_ShouldRetryOnNextLookup()
+    {
+        // Arrange
+        var cache = new LookupIndexCache<int, CoreModels.Company>(company => new[] { company.Name }, TimeSpan.FromMinutes(5));
+        var attempts = 0;
+        Func<Task<IEnumerable<CoreModels.Company>>> load = () => ++attempts == 1
+            ? Task.FromException<IEnumerable<CoreModels.Company>>(new InvalidOperationException("boom"))
+            : Task.FromResult<IEnumerable<CoreModels.Company>>(new[] { new CoreModels.Company { Name = "Acme" } });
+
+        // Act
+        var failing = () => cache.GetAsync(1, load);
+        await failing.Should().ThrowAsync<InvalidOperationException>();
+        var index = await cache.GetAsync(1, load);
+
+        // Assert
+        index.Find("acme").Should().ContainSingle();
+        attempts.Should().Be(2);
+    }
+}
@@ -0,0 +1,222 @@
+using System.Text.Json.Serialization;
+using Procore.SDK.Core.Sync;
+
+namespace Procore.SDK.Core.Tests.Sync;
+
+/// <summary>
+/// Tests for delta sync change detection and checkpoint persistence.
+/// </summary>
+public class DeltaSyncEngineTests
+{
+    private static readonly DateTimeOffset BaseTime = new(2024, 1, 1, 12, 0, 0, TimeSpan.Zero);
+
+    private readonly InMemorySyncCheckpointStore _store = new();
+    private readonly DeltaSyncEngine _engine;
+
+    public DeltaSyncEngineTests()
+    {
+        _engine = new DeltaSyncEngine(_store, Options.Create(new DeltaSyncOptions
+        {
+            OverlapWindow = TimeSpan.FromMinutes(1),
+            FullReconciliationInterval = null
+        }));
+    }
+
+    [Fact]
+    public async Task SyncAsync_FirstRun_ShouldReportEveryRecordAsCreated()
+    {
+        // Arrange
+        var records = new List<TestRecord> { new(1, "a", BaseTime), new(2, "b", BaseTime) };
+        var resource = FullListing(() => records);
+
+        // Act
+        var changes = await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        // Assert
+        changes.Should().HaveCount(2);
+        changes.Should().OnlyContain(c => c.Kind == SyncChangeKind.Created);
+    }
+
+    [Fact]
+    public async Task SyncAsync_FullListing_ShouldDetectUpdatesAndDeletionsByHash()
+    {
+        // Arrange
+        var records = new List<TestRecord> { new(1, "a", BaseTime), new(2, "b", BaseTime), new(3, "c", BaseTime) };
+        var resource = FullListing(() => records);
+        await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        records = new List<TestRecord> { new(1, "a", BaseTime), new(2, "changed", BaseTime), new(4, "d", BaseTime) };
+
+        // Act
+        var changes = await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        // Assert
+        changes.Select(c => (c.Kind, c.Key)).Should().BeEquivalentTo(new[]
+        {
+            (SyncChangeKind.Updated, "2"),
+            (SyncChangeKind.Created, "4"),
+            (SyncChangeKind.Deleted, "3")
+        });
+    }
+
+    [Fact]
+    public async Task SyncAsync_FullListingWithJsonTypeInfo_ShouldDetectUpdatesByGeneratedHash()
+    {
+        // Arrange
+        var records = new List<TestRecord> { new(1, "a", BaseTime), new(2, "b", BaseTime) };
+        var resource = SyncResource<TestRecord>.FullListing(
+            "records",
+            r => r.Id.ToString(),
+            _ => Task.FromResult<IEnumerable<TestRecord>>(records),
+            SyncTestJsonContext.Default.TestRecord);
+        await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        records = new List<TestRecord> { new(1, "a", BaseTime), new(2, "changed", BaseTime) };
+
+        // Act
+        var changes = await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        // Assert
+        changes.Select(c => (c.Kind, c.Key)).Should().Equal((SyncChangeKind.Updated, "2"));
+    }
+
+    [Fact]
+    public async Task SyncAsync_Incremental_ShouldFetchFromHighWaterMarkMinusOverlap()
+    {
+        // Arrange
+        var requestedSince = new List<DateTimeOffset?>();
+        var records = new List<TestRecord> { new(1, "a", BaseTime), new(2, "b", BaseTime.AddMinutes(5)) };
+        var resource = SyncResource<TestRecord>.Incremental(
+            "records",
+            r => r.Id.ToString(),
+            r => r.UpdatedAt,
+            (since, _) =>
+            {
+                requestedSince.Add(since);
+                return Task.FromResult<IEnumerable<TestRecord>>(records.Where(r => since == null || r.UpdatedAt >= since).ToList());
+            });
+        await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        records.Add(new TestRecord(3, "c", BaseTime.AddMinutes(10)));
+
+        // Act
+        var changes = await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        // Assert
+        requestedSince.Should().Equal(null, BaseTime.AddMinutes(4));
+        changes.Should().ContainSingle().Which.Key.Should().Be("3");
+        (await _store.GetAsync("records", 1))!.HighWaterMark.Should().Be(BaseTime.AddMinutes(10));
+    }
+
+    [Fact]
+    public async Task SyncAsync_Incremental_ShouldReportTombstonesAsDeleted()
+    {
+        // Arrange
+        var records = new List<TestRecord> { new(1, "a", BaseTime) };
+        var resource = SyncResource<TestRecord>.Incremental(
+            "records",
+            r => r.Id.ToString(),
+            r => r.UpdatedAt,
+            (_, _) => Task.FromResult<IEnumerable<TestRecord>>(records.ToList()))
+        {
+            IsDeletedSelector = r => r.Deleted
+        };
+        await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        records = new List<TestRecord> { new(1, "a", BaseTime.AddMinutes(1), Deleted: true) };
+
+        // Act
+        var changes = await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        // Assert
+        changes.Should().ContainSingle().Which.Kind.Should().Be(SyncChangeKind.Deleted);
+    }
+
+    [Fact]
+    public async Task SyncAsync_AbandonedEnumeration_ShouldNotAdvanceCheckpoint()
+    {
+        // Arrange
+        var records = new List<TestRecord> { new(1, "a", BaseTime), new(2, "b", BaseTime) };
+        var resource = FullListing(() => records);
+
+        // Act
+        await foreach (var _ in _engine.SyncAsync(resource, companyId: 1))
+        {
+            break;
+        }
+
+        // Assert
+        (await _store.GetAsync("records", 1)).Should().BeNull();
+    }
+
+    [Fact]
+    public async Task SyncAsync_DifferentCompanies_ShouldKeepSeparateCheckpoints()
+    {
+        // Arrange
+        var resource = FullListing(() => new List<TestRecord> { new(1, "a", BaseTime) });
+        await ToListAsync(_engine.SyncAsync(resource, companyId: 1));
+
+        // Act
+        var changes = await ToListAsync(_engine.SyncAsync(resource, companyId: 2));
+
+        // Assert
+        changes.Should().ContainSingle().Which.Kind.Should().Be(SyncChangeKind.Created);
+    }
+
+    [Fact]
+    public async Task FileSyncCheckpointStore_ShouldPersistCheckpointsAcrossInstances()
+    {
+        // Arrange
+        var directory = Path.Combine(Path.GetTempPath(), "procore-sync-" + Guid.NewGuid().ToString("N"));
+        try
+        {
+            await new FileSyncCheckpointStore(directory).SaveAsync(new SyncCheckpoint
+            {
+                Resource = "observations/project/42",
+                CompanyId = 1,
+                HighWaterMark = BaseTime,
+                RecordHashes = { ["7"] = "hash" }
+            });
+
+            // Act
+            var restored = await new FileSyncCheckpointStore(directory).GetAsync("observations/project/42", 1);
+
+            // Assert
+            restored.Should().NotBeNull();
+            restored!.HighWaterMark.Should().Be(BaseTime);
+            restored.RecordHashes.Should().ContainKey("7").WhoseValue.Should().Be("hash");
+        }
+        finally
+        {
+            if (Directory.Exists(directory))
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+        }
+    }
+
+    private static SyncResource<TestRecord> FullListing(Func<List<TestRecord>> records)
+    {
+        return SyncResource<TestRecord>.FullListing(
+            "records",
+            r => r.Id.ToString(),
+            _ => Task.FromResult<IEnumerable<TestRecord>>(records()));
+    }
+
+    private static async Task<List<SyncChange<T>>> ToListAsync<T>(IAsyncEnumerable<SyncChange<T>> changes)
+    {
+        var list = new List<SyncChange<T>>();
+        await foreach (var change in changes)
+        {
+            list.Add(change);
+        }
+        return list;
+    }
+
+    public record TestRecord(int Id, string Name, DateTimeOffset UpdatedAt, bool Deleted = false);
+}
+
+[JsonSerializable(typeof(DeltaSyncEngineTests.TestRecord))]
+internal partial class SyncTestJsonContext : JsonSerializerContext
+{
+}
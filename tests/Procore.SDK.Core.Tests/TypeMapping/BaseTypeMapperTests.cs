@@ -1,5 +1,7 @@
 using System;
+using System.Collections.Generic;
 using System.Diagnostics;
+using System.Linq;
 using FluentAssertions;
 using Procore.SDK.Core.TypeMapping;
 using Xunit;
@@ -146,6 +148,73 @@ public class BaseTypeMapperTests
 
     #endregion
 
+    #region Batch Mapping Tests
+
+    [Fact]
+    public void MapToWrapperMany_WithValidSources_ShouldMapInOrder()
+    {
+        // Arrange
+        var sources = new[] { new TestGenerated { Value = "a" }, new TestGenerated { Value = "b" }, new TestGenerated { Value = "c" } };
+
+        // Act
+        var result = _mapper.MapToWrapperMany(sources);
+
+        // Assert
+        result.Select(w => w.Value).Should().Equal("mapped from a", "mapped from b", "mapped from c");
+        _mapper.Metrics.ToWrapperCalls.Should().Be(3);
+        _mapper.Metrics.ToWrapperErrors.Should().Be(0);
+    }
+
+    [Fact]
+    public void MapToWrapperMany_WithLazySource_ShouldEnumerateOnce()
+    {
+        // Arrange
+        var enumerations = 0;
+        IEnumerable<TestGenerated> Sources()
+        {
+            enumerations++;
+            yield return new TestGenerated { Value = "a" };
+            yield return new TestGenerated { Value = "b" };
+        }
+
+        // Act
+        var result = _mapper.MapToWrapperMany(Sources());
+
+        // Assert
+        result.Should().HaveCount(2);
+        enumerations.Should().Be(1);
+    }
+
+    [Fact]
+    public void MapToWrapperMany_WhenItemFails_ShouldThrowOnceWithItemIndex()
+    {
+        // Arrange
+        var sources = new[] { new TestGenerated { Value = "a" }, new TestGenerated { Value = "inner-exception" }, new TestGenerated { Value = "c" } };
+
+        // Act
+        var action = () => _mapper.MapToWrapperMany(sources);
+
+        // Assert
+        action.Should().Throw<TypeMappingException>()
+            .WithMessage("*item 1*")
+            .WithInnerException<InvalidOperationException>();
+        _mapper.Metrics.ToWrapperCalls.Should().Be(2);
+        _mapper.Metrics.ToWrapperErrors.Should().Be(1);
+    }
+
+    [Fact]
+    public void MapToWrapperMany_WithNullItem_ShouldThrowTypeMappingException()
+    {
+        // Arrange
+        var sources = new[] { new TestGenerated { Value = "a" }, null! };
+
+        // Act & Assert
+        var action = () => _mapper.MapToWrapperMany(sources);
+        action.Should().Throw<TypeMappingException>().WithMessage("Item 1 *");
+    }
+
+    #endregion
+
     #region TryMap Methods Tests
 
     [Fact]
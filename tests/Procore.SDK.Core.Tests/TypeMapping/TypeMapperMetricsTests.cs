@@ -0,0 +1,141 @@
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using Procore.SDK.Core.TypeMapping;
+using static Procore.SDK.Core.Tests.TypeMapping.BaseTypeMapperTests;
+
+namespace Procore.SDK.Core.Tests.TypeMapping;
+
+[CollectionDefinition(nameof(TypeMapperMetricsTests), DisableParallelization = true)]
+public class TypeMapperMetricsCollection
+{
+}
+
+/// <summary>
+/// Tests for tick-based, sampled type mapper metrics and their System.Diagnostics.Metrics instruments.
+/// Runs without parallelization because sampling and the enabled switch are global.
+/// </summary>
+[Collection(nameof(TypeMapperMetricsTests))]
+public class TypeMapperMetricsTests : IDisposable
+{
+    private readonly TestTypeMapper _mapper = new();
+
+    [Fact]
+    public void MapToWrapper_SubMillisecondCalls_ShouldReportNonZeroAverage()
+    {
+        // Act
+        for (var i = 0; i < 100; i++)
+        {
+            _mapper.MapToWrapper(new TestGenerated { Value = "test" });
+        }
+
+        // Assert
+        _mapper.Metrics.ToWrapperCalls.Should().Be(100);
+        _mapper.Metrics.AverageToWrapperTimeMs.Should().BeGreaterThan(0);
+        _mapper.Metrics.ToWrapperLatency.Count.Should().Be(100);
+    }
+
+    [Fact]
+    public void MapToWrapper_WithSamplingInterval_ShouldCountEveryCallButTimeOnlySamples()
+    {
+        // Arrange
+        TypeMapperMetrics.SamplingInterval = 10;
+
+        // Act
+        for (var i = 0; i < 100; i++)
+        {
+            _mapper.MapToWrapper(new TestGenerated { Value = "test" });
+        }
+
+        // Assert
+        _mapper.Metrics.ToWrapperCalls.Should().Be(100);
+        _mapper.Metrics.ToWrapperLatency.Count.Should().Be(10);
+    }
+
+    [Fact]
+    public void MapToGenerated_WhenDisabled_ShouldNotRecordAnything()
+    {
+        // Arrange
+        TypeMapperMetrics.Enabled = false;
+
+        // Act
+        _mapper.MapToGenerated(new TestWrapper { Value = "test" });
+
+        // Assert
+        _mapper.Metrics.ToGeneratedCalls.Should().Be(0);
+        _mapper.Metrics.ToGeneratedLatency.Count.Should().Be(0);
+    }
+
+    [Fact]
+    public void MapToWrapper_Failure_ShouldCountError()
+    {
+        // Act
+        var act = () => _mapper.MapToWrapper(new TestGenerated { Value = "throw" });
+
+        // Assert
+        act.Should().Throw<TypeMappingException>();
+        _mapper.Metrics.ToWrapperErrors.Should().Be(1);
+    }
+
+    [Fact]
+    public void LatencyHistogram_ShouldReportPercentilesWithinBucketPrecision()
+    {
+        // Arrange
+        var histogram = new LatencyHistogram();
+        var oneMs = Stopwatch.Frequency / 1000;
+
+        // Act
+        for (var i = 0; i < 90; i++)
+        {
+            histogram.RecordTicks(oneMs);
+        }
+        for (var i = 0; i < 10; i++)
+        {
+            histogram.RecordTicks(oneMs * 10);
+        }
+
+        // Assert
+        histogram.P50Ms.Should().BeInRange(1.0, 1.25);
+        histogram.P95Ms.Should().BeInRange(10.0, 12.5);
+        histogram.P99Ms.Should().BeInRange(10.0, 12.5);
+    }
+
+    [Fact]
+    public void MapToWrapper_WithMeterListener_ShouldPublishDuration()
+    {
+        // Arrange
+        var recorded = new List<double>();
+        using var listener = new MeterListener
+        {
+            InstrumentPublished = (instrument, l) =>
+            {
+                if (instrument.Meter.Name == TypeMapperInstrumentation.MeterName && instrument.Name == "procore.type_mapping.duration")
+                {
+                    l.EnableMeasurementEvents(instrument);
+                }
+            }
+        };
+        listener.SetMeasurementEventCallback<double>((_, value, tags, _) =>
+        {
+            foreach (var tag in tags)
+            {
+                if (tag.Key == "mapper" && (string?)tag.Value == nameof(TestTypeMapper))
+                {
+                    recorded.Add(value);
+                }
+            }
+        });
+        listener.Start();
+
+        // Act
+        _mapper.MapToWrapper(new TestGenerated { Value = "test" });
+
+        // Assert
+        recorded.Should().ContainSingle().Which.Should().BeGreaterThan(0);
+    }
+
+    public void Dispose()
+    {
+        TypeMapperMetrics.Enabled = true;
+        TypeMapperMetrics.SamplingInterval = 1;
+    }
+}
@@ -247,7 +247,7 @@ public class ApiSurfaceValidationTests
                     results.RecordSuccess("UpdateDocumentAsync", updatedDocument != null);
                 }
 
-                // Test UploadDocumentAsync (expected to return simulated response)
+                // Test UploadDocumentAsync (uploads an empty file)
                 var uploadRequest = new UploadDocumentRequest
                 {
                     Name = "Test Document",
@@ -255,7 +255,7 @@ public class ApiSurfaceValidationTests
                     ContentType = "application/pdf"
                 };
                 var uploadedDocument = await _coreClient.UploadDocumentAsync(testCompanyId, uploadRequest);
-                results.RecordSuccess("UploadDocumentAsync", uploadedDocument != null, "Returns simulated response");
+                results.RecordSuccess("UploadDocumentAsync", uploadedDocument != null);
             }
             catch (Exception ex)
             {
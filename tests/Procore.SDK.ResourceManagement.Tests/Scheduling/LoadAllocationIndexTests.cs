@@ -0,0 +1,48 @@
+using Procore.SDK.Core.Logging;
+using Procore.SDK.ResourceManagement.Models;
+
+namespace Procore.SDK.ResourceManagement.Tests.Scheduling;
+
+/// <summary>
+/// Tests for loading a company's allocations and assignments into an allocation index.
+/// </summary>
+public class LoadAllocationIndexTests : IDisposable
+{
+    private const int TestCompanyId = 12345;
+
+    private readonly ProcoreResourceManagementClient _sut;
+
+    public LoadAllocationIndexTests()
+    {
+        _sut = new ProcoreResourceManagementClient(
+            Substitute.For<IRequestAdapter>(),
+            Substitute.For<ILogger<ProcoreResourceManagementClient>>(),
+            new StructuredLogger(Substitute.For<ILogger<StructuredLogger>>()));
+    }
+
+    [Fact]
+    public async Task LoadAllocationIndexAsync_WithSameAllocationIdsAcrossProjects_Should_LoadEveryProject()
+    {
+        // Arrange
+        var today = DateTime.UtcNow.Date;
+        var allocations = new List<ResourceAllocation>();
+        allocations.AddRange(await _sut.GetResourceAllocationsAsync(TestCompanyId, 1));
+        allocations.AddRange(await _sut.GetResourceAllocationsAsync(TestCompanyId, 2));
+        var resourceId = allocations[0].ResourceId;
+        var expectedPeak = allocations
+            .Where(a => a.ResourceId == resourceId && a.Status != AllocationStatus.Cancelled)
+            .Sum(a => a.AllocationPercentage);
+
+        // Act
+        var index = await _sut.LoadAllocationIndexAsync(TestCompanyId, new[] { 1, 2 });
+
+        // Assert
+        allocations.Where(a => a.ResourceId == resourceId).Select(a => a.Id).Distinct().Should().ContainSingle();
+        index.GetPeakLoad(resourceId, today, today).Should().Be(expectedPeak);
+    }
+
+    public void Dispose()
+    {
+        _sut.Dispose();
+    }
+}
@@ -0,0 +1,153 @@
+using Procore.SDK.ResourceManagement.Models;
+using Procore.SDK.ResourceManagement.Scheduling;
+
+namespace Procore.SDK.ResourceManagement.Tests.Scheduling;
+
+/// <summary>
+/// Tests for availability, over-allocation and utilization queries on the allocation index.
+/// </summary>
+public class ResourceAllocationIndexTests
+{
+    private static readonly DateTime Monday = new(2025, 3, 3);
+
+    [Fact]
+    public void GetPeakLoad_WithOverlappingAllocations_Should_SumLoadsOnSharedDays()
+    {
+        // Arrange
+        var index = new ResourceAllocationIndex();
+        index.AddOrUpdate(Allocation(1, resourceId: 7, Monday, Monday.AddDays(4), 60m));
+        index.AddOrUpdate(Allocation(2, resourceId: 7, Monday.AddDays(3), Monday.AddDays(9), 50m));
+
+        // Act
+        var overlapPeak = index.GetPeakLoad(7, Monday, Monday.AddDays(9));
+        var firstOnlyPeak = index.GetPeakLoad(7, Monday, Monday.AddDays(2));
+
+        // Assert
+        overlapPeak.Should().Be(110m);
+        firstOnlyPeak.Should().Be(60m);
+        index.IsAvailable(7, Monday, Monday.AddDays(2), 40m).Should().BeTrue();
+        index.IsAvailable(7, Monday, Monday.AddDays(4), 40m).Should().BeFalse();
+        index.GetOverAllocatedResources(Monday, Monday.AddDays(9))
+            .Should().ContainSingle().Which.Should().Be(new KeyValuePair<int, decimal>(7, 110m));
+    }
+
+    [Fact]
+    public void GetUtilization_Should_AverageDailyLoadOverTheWindow()
+    {
+        // Arrange
+        var index = new ResourceAllocationIndex();
+        index.AddOrUpdate(Allocation(1, resourceId: 7, Monday, Monday.AddDays(4), 80m));
+
+        // Act
+        var utilization = index.GetUtilization(7, Monday, Monday.AddDays(9));
+
+        // Assert
+        utilization.Should().Be(40m);
+        index.GetUtilization(99, Monday, Monday.AddDays(9)).Should().Be(0m);
+    }
+
+    [Fact]
+    public void AddOrUpdate_WhenAllocationChanges_Should_ReplacePreviousInterval()
+    {
+        // Arrange
+        var index = new ResourceAllocationIndex();
+        index.AddOrUpdate(Allocation(1, resourceId: 7, Monday, Monday.AddDays(4), 100m));
+
+        // Act
+        index.AddOrUpdate(Allocation(1, resourceId: 7, Monday.AddYears(1), Monday.AddYears(1).AddDays(4), 100m));
+
+        // Assert
+        index.GetPeakLoad(7, Monday, Monday.AddDays(4)).Should().Be(0m);
+        index.GetPeakLoad(7, Monday.AddYears(1), Monday.AddYears(1).AddDays(4)).Should().Be(100m);
+    }
+
+    [Fact]
+    public void RemoveAllocation_AndCancelledStatus_Should_FreeCapacity()
+    {
+        // Arrange
+        var index = new ResourceAllocationIndex();
+        index.AddOrUpdate(Allocation(1, resourceId: 7, Monday, Monday.AddDays(4), 100m));
+        var cancelled = Allocation(2, resourceId: 8, Monday, Monday.AddDays(4), 100m);
+        cancelled.Status = AllocationStatus.Cancelled;
+
+        // Act
+        var removed = index.RemoveAllocation(1, 1);
+        index.AddOrUpdate(cancelled);
+
+        // Assert
+        removed.Should().BeTrue();
+        index.RemoveAllocation(1, 1).Should().BeFalse();
+        index.IsAvailable(7, Monday, Monday.AddDays(4)).Should().BeTrue();
+        index.IsAvailable(8, Monday, Monday.AddDays(4)).Should().BeTrue();
+    }
+
+    [Fact]
+    public void AddOrUpdate_SameIdInDifferentProjects_Should_KeepBothAllocations()
+    {
+        // Arrange
+        var index = new ResourceAllocationIndex();
+
+        // Act
+        index.AddOrUpdate(Allocation(1, resourceId: 7, Monday, Monday.AddDays(4), 40m, projectId: 1));
+        index.AddOrUpdate(Allocation(1, resourceId: 7, Monday, Monday.AddDays(4), 40m, projectId: 2));
+
+        // Assert
+        index.GetPeakLoad(7, Monday, Monday.AddDays(4)).Should().Be(80m);
+        index.RemoveAllocation(2, 1).Should().BeTrue();
+        index.GetPeakLoad(7, Monday, Monday.AddDays(4)).Should().Be(40m);
+    }
+
+    [Fact]
+    public void AddOrUpdate_WithoutIdOrWithInvalidDates_Should_ThrowAndLeaveIndexUnchanged()
+    {
+        // Arrange
+        var index = new ResourceAllocationIndex();
+
+        // Act
+        var withoutId = () => index.AddOrUpdate(Allocation(0, resourceId: 7, Monday, Monday.AddDays(4), 40m));
+        var endsBeforeStart = () => index.AddOrUpdate(Allocation(1, resourceId: 7, Monday, Monday.AddDays(-1), 40m));
+        var tooLong = () => index.AddOrUpdate(Allocation(2, resourceId: 7, Monday, Monday.AddYears(50), 40m));
+
+        // Assert
+        withoutId.Should().Throw<ArgumentException>();
+        endsBeforeStart.Should().Throw<ArgumentException>();
+        tooLong.Should().Throw<ArgumentException>();
+        index.ResourceIds.Should().BeEmpty();
+    }
+
+    [Fact]
+    public void AddOrUpdate_WorkforceAssignment_Should_LoadWorkerRelativeToFullTimeWeek()
+    {
+        // Arrange
+        var index = new ResourceAllocationIndex(fullTimeHoursPerWeek: 40m);
+
+        // Act
+        index.AddOrUpdate(new WorkforceAssignment
+        {
+            Id = 1,
+            WorkerId = 7,
+            StartDate = Monday,
+            EndDate = Monday.AddDays(4),
+            HoursPerWeek = 20m,
+            Status = AssignmentStatus.Active
+        });
+
+        // Assert
+        index.GetPeakLoad(7, Monday, Monday.AddDays(4)).Should().Be(50m);
+        index.IsAvailable(7, Monday, Monday.AddDays(4), 50m).Should().BeTrue();
+    }
+
+    private static ResourceAllocation Allocation(int id, int resourceId, DateTime start, DateTime end, decimal percentage, int projectId = 1)
+    {
+        return new ResourceAllocation
+        {
+            Id = id,
+            ResourceId = resourceId,
+            ProjectId = projectId,
+            StartDate = start,
+            EndDate = end,
+            AllocationPercentage = percentage,
+            Status = AllocationStatus.Active
+        };
+    }
+}
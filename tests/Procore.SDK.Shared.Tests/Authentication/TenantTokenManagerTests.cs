@@ -0,0 +1,204 @@
+using System.Text;
+using Procore.SDK.Shared.Authentication;
+using Procore.SDK.Shared.Tests.TestUtilities;
+
+namespace Procore.SDK.Shared.Tests.Authentication;
+
+/// <summary>
+/// Tests for the multi-tenant token manager and per-key directory token storage
+/// </summary>
+public class TenantTokenManagerTests : IDisposable
+{
+    private readonly InMemoryTokenStorage _storage;
+    private readonly TestableHttpMessageHandler _innerHandler;
+    private readonly HttpClient _httpClient;
+    private readonly TenantTokenManager _tokenManager;
+    private int _refreshCount;
+
+    public TenantTokenManagerTests()
+    {
+        _storage = new InMemoryTokenStorage();
+        _innerHandler = new TestableHttpMessageHandler();
+        _httpClient = new HttpClient(_innerHandler);
+
+        var authOptions = new ProcoreAuthOptions
+        {
+            ClientId = "test-client-id",
+            ClientSecret = "test-client-secret",
+            TokenRefreshMargin = TimeSpan.FromMinutes(5)
+        };
+
+        _tokenManager = new TenantTokenManager(
+            _storage,
+            Options.Create(authOptions),
+            Options.Create(new TokenPoolOptions { Capacity = 4, ShardCount = 2 }),
+            _httpClient,
+            Substitute.For<ILogger<TenantTokenManager>>());
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_ShouldKeepTenantsSeparate()
+    {
+        // Arrange
+        await _tokenManager.StoreTokenAsync("tenant-a", ValidToken("token-a"));
+        await _tokenManager.StoreTokenAsync("tenant-b", ValidToken("token-b"));
+
+        // Act
+        var tokenA = await _tokenManager.GetAccessTokenAsync("tenant-a");
+        var tokenB = await _tokenManager.GetAccessTokenAsync("tenant-b");
+        var missing = await _tokenManager.GetAccessTokenAsync("tenant-c");
+
+        // Assert
+        tokenA!.Token.Should().Be("token-a");
+        tokenB!.Token.Should().Be("token-b");
+        missing.Should().BeNull();
+        (await _storage.GetTokenAsync("procore_token_test-client-id_tenant-a"))!.Token.Should().Be("token-a");
+    }
+
+    [Fact]
+    public async Task GetAccessTokenAsync_AfterEviction_ShouldReloadFromStorage()
+    {
+        // Arrange
+        for (int i = 0; i < 10; i++)
+        {
+            await _tokenManager.StoreTokenAsync($"tenant-{i}", ValidToken($"token-{i}"));
+        }
+
+        // Act
+        var token = await _tokenManager.GetAccessTokenAsync("tenant-0");
+
+        // Assert
+        _tokenManager.CachedTokenCount.Should().BeLessOrEqualTo(4);
+        token!.Token.Should().Be("token-0");
+    }
+
+    [Fact]
+    public async Task RefreshTokenAsync_ConcurrentCallersForSameTenant_ShouldShareOneRequest()
+    {
+        // Arrange
+        var release = new TaskCompletionSource();
+        SetupRefreshResponse(release.Task);
+        await _tokenManager.StoreTokenAsync("tenant-a", ExpiredToken());
+        var refreshedTenants = new List<string>();
+        _tokenManager.TokenRefreshed += (_, e) => refreshedTenants.Add(e.TenantId);
+
+        // Act
+        var first = _tokenManager.GetAccessTokenAsync("tenant-a");
+        var second = _tokenManager.GetAccessTokenAsync("tenant-a");
+        release.SetResult();
+        var tokens = await Task.WhenAll(first, second);
+
+        // Assert
+        _refreshCount.Should().Be(1);
+        tokens.Should().OnlyContain(token => token!.Token == "refreshed-token");
+        refreshedTenants.Should().Equal("tenant-a");
+        (await _tokenManager.GetAccessTokenAsync("tenant-a"))!.Token.Should().Be("refreshed-token");
+    }
+
+    [Fact]
+    public async Task RefreshTokenAsync_WhenCallerCancels_ShouldStillCompleteRefresh()
+    {
+        // Arrange
+        var release = new TaskCompletionSource();
+        SetupRefreshResponse(release.Task);
+        await _tokenManager.StoreTokenAsync("tenant-a", ExpiredToken());
+        using var cts = new CancellationTokenSource();
+
+        // Act
+        var cancelled = _tokenManager.RefreshTokenAsync("tenant-a", cts.Token);
+        var remaining = _tokenManager.RefreshTokenAsync("tenant-a");
+        cts.Cancel();
+        var cancelledAct = () => cancelled;
+        await cancelledAct.Should().ThrowAsync<OperationCanceledException>();
+        release.SetResult();
+        var token = await remaining;
+
+        // Assert
+        token.Token.Should().Be("refreshed-token");
+        _refreshCount.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task ForTenant_ShouldExposeTenantThroughTokenManagerContract()
+    {
+        // Arrange
+        var tenantManager = _tokenManager.ForTenant("tenant-a");
+
+        // Act
+        await tenantManager.StoreTokenAsync(ValidToken("token-a"));
+        var token = await tenantManager.GetAccessTokenAsync();
+        await tenantManager.ClearTokenAsync();
+
+        // Assert
+        token!.Token.Should().Be("token-a");
+        (await _tokenManager.GetAccessTokenAsync("tenant-a")).Should().BeNull();
+    }
+
+    [Fact]
+    public async Task DirectoryTokenStorage_ShouldPersistEachKeyIndependently()
+    {
+        // Arrange
+        var directory = Path.Combine(Path.GetTempPath(), "procore-tokens-" + Guid.NewGuid().ToString("N"));
+        try
+        {
+            using (var writer = new DirectoryTokenStorage(directory))
+            {
+                await writer.StoreTokenAsync("key-a", ValidToken("token-a"));
+                await writer.StoreTokenAsync("key-b", ValidToken("token-b"));
+            }
+
+            // Act
+            using var reader = new DirectoryTokenStorage(directory);
+            await reader.DeleteTokenAsync("key-a");
+            var deleted = await reader.GetTokenAsync("key-a");
+            var kept = await reader.GetTokenAsync("key-b");
+
+            // Assert
+            deleted.Should().BeNull();
+            kept!.Token.Should().Be("token-b");
+            Directory.GetFiles(directory).Should().ContainSingle();
+        }
+        finally
+        {
+            if (Directory.Exists(directory))
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+        }
+    }
+
+    private void SetupRefreshResponse(Task release)
+    {
+        _innerHandler.SendAsyncFunc = async (_, ct) =>
+        {
+            Interlocked.Increment(ref _refreshCount);
+            await release.WaitAsync(ct);
+            var body = JsonSerializer.Serialize(new
+            {
+                access_token = "refreshed-token",
+                token_type = "Bearer",
+                expires_in = 3600,
+                refresh_token = "new-refresh-token"
+            });
+            return new HttpResponseMessage(HttpStatusCode.OK)
+            {
+                Content = new StringContent(body, Encoding.UTF8, "application/json")
+            };
+        };
+    }
+
+    private static AccessToken ValidToken(string token)
+    {
+        return new AccessToken(token, "Bearer", DateTimeOffset.UtcNow.AddHours(1), "refresh-token");
+    }
+
+    private static AccessToken ExpiredToken()
+    {
+        return new AccessToken("expired-token", "Bearer", DateTimeOffset.UtcNow.AddMinutes(-1), "refresh-token");
+    }
+
+    public void Dispose()
+    {
+        _httpClient.Dispose();
+    }
+}
@@ -0,0 +1,135 @@
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using Procore.SDK.Shared.Diagnostics;
+
+namespace Procore.SDK.Shared.Tests.Diagnostics;
+
+/// <summary>
+/// Tests for SDK spans, metrics and tag templating
+/// </summary>
+public class ProcoreTelemetryTests : IDisposable
+{
+    private readonly List<Activity> _activities = new();
+    private readonly List<(string Instrument, double Value, Dictionary<string, object?> Tags)> _measurements = new();
+    private readonly ActivityListener _activityListener;
+    private readonly MeterListener _meterListener;
+
+    public ProcoreTelemetryTests()
+    {
+        _activityListener = new ActivityListener
+        {
+            ShouldListenTo = source => source.Name == ProcoreTelemetry.ActivitySourceName,
+            Sample = (ref ActivityCreationOptions<ActivityContext> _) => ActivitySamplingResult.AllDataAndRecorded,
+            ActivityStopped = activity => { lock (_activities) { _activities.Add(activity); } }
+        };
+        ActivitySource.AddActivityListener(_activityListener);
+
+        _meterListener = new MeterListener
+        {
+            InstrumentPublished = (instrument, listener) =>
+            {
+                if (instrument.Meter.Name == ProcoreTelemetry.MeterName)
+                {
+                    listener.EnableMeasurementEvents(instrument);
+                }
+            }
+        };
+        _meterListener.SetMeasurementEventCallback<double>((instrument, value, tags, _) => Record(instrument, value, tags));
+        _meterListener.SetMeasurementEventCallback<long>((instrument, value, tags, _) => Record(instrument, value, tags));
+        _meterListener.Start();
+    }
+
+    [Theory]
+    [InlineData("GetProjectsAsync", "GetProjectsAsync")]
+    [InlineData("ReleaseResource-12-Project-3-Company-1", "ReleaseResource-{id}-Project-{id}-Company-{id}")]
+    [InlineData("GET /rest/v1.0/companies/123/users", "GET /rest/v1.0/companies/{id}/users")]
+    [InlineData("Sync2Projects", "Sync2Projects")]
+    public void NormalizeOperationName_ShouldTemplateStandaloneNumbers(string operationName, string expected)
+    {
+        // Act
+        var normalized = ProcoreTelemetry.NormalizeOperationName(operationName);
+
+        // Assert
+        normalized.Should().Be(expected);
+    }
+
+    [Fact]
+    public void StopOperation_WithException_ShouldMarkSpanAsErrorAndRecordDuration()
+    {
+        // Arrange
+        var operationName = "GetObservation-" + Random.Shared.Next(1000, 9999);
+
+        // Act
+        using (var activity = ProcoreTelemetry.StartOperation(operationName))
+        {
+            ProcoreTelemetry.StopOperation(activity, operationName, Stopwatch.GetTimestamp(), new HttpRequestException("boom"));
+        }
+
+        // Assert
+        var span = _activities.Should().ContainSingle(a => a.DisplayName == "GetObservation-{id}").Subject;
+        span.Status.Should().Be(ActivityStatusCode.Error);
+        span.GetTagItem(ProcoreTelemetry.ErrorTypeTag).Should().Be(nameof(HttpRequestException));
+
+        _measurements.Should().Contain(m =>
+            m.Instrument == "procore.client.operation.duration" &&
+            Equals(m.Tags[ProcoreTelemetry.OperationTag], "GetObservation-{id}") &&
+            Equals(m.Tags[ProcoreTelemetry.ErrorTypeTag], nameof(HttpRequestException)));
+    }
+
+    [Fact]
+    public void StopHttpAttempt_ShouldTagRouteAndStatusCode()
+    {
+        // Arrange
+        const string route = "GET /rest/v1.0/companies/{id}/projects";
+
+        // Act
+        using (var activity = ProcoreTelemetry.StartHttpAttempt(route, "GET", attempt: 2))
+        {
+            ProcoreTelemetry.StopHttpAttempt(activity, route, "GET", Stopwatch.GetTimestamp(), 200, null);
+        }
+
+        // Assert
+        var span = _activities.Should().ContainSingle(a => a.DisplayName == route).Subject;
+        span.Kind.Should().Be(ActivityKind.Client);
+        span.GetTagItem(ProcoreTelemetry.AttemptTag).Should().Be(2);
+        span.GetTagItem(ProcoreTelemetry.StatusCodeTag).Should().Be(200);
+
+        _measurements.Should().Contain(m =>
+            m.Instrument == "procore.http.client.attempt.duration" &&
+            Equals(m.Tags[ProcoreTelemetry.RouteTag], route) &&
+            Equals(m.Tags[ProcoreTelemetry.StatusCodeTag], 200));
+    }
+
+    [Fact]
+    public void RecordCircuitBreakerTransition_ShouldCountTransitionsByState()
+    {
+        // Act
+        ProcoreTelemetry.RecordCircuitBreakerTransition("api.procore.com GET /rest/v1.0/companies", "open");
+
+        // Assert
+        _measurements.Should().Contain(m =>
+            m.Instrument == "procore.circuit_breaker.transitions" &&
+            Equals(m.Tags[ProcoreTelemetry.CircuitStateTag], "open"));
+    }
+
+    private void Record<T>(Instrument instrument, T value, ReadOnlySpan<KeyValuePair<string, object?>> tags)
+        where T : struct
+    {
+        var copy = new Dictionary<string, object?>();
+        foreach (var tag in tags)
+        {
+            copy[tag.Key] = tag.Value;
+        }
+
+        lock (_measurements)
+        {
+            _measurements.Add((instrument.Name, Convert.ToDouble(value), copy));
+        }
+    }
+
+    public void Dispose()
+    {
+        _activityListener.Dispose();
+        _meterListener.Dispose();
+    }
+}
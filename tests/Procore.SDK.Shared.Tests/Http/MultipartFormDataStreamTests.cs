@@ -0,0 +1,144 @@
+using System.Text;
+using Procore.SDK.Shared.Http;
+
+namespace Procore.SDK.Shared.Tests.Http;
+
+/// <summary>
+/// Tests for the streaming multipart/form-data body
+/// </summary>
+public class MultipartFormDataStreamTests
+{
+    private static readonly KeyValuePair<string, string>[] Fields =
+    {
+        new("file[name]", "Drawing A-101"),
+        new("file[parent_id]", "42")
+    };
+
+    [Fact]
+    public async Task ReadAsync_ShouldProduceFieldsFollowedByFilePart()
+    {
+        // Arrange
+        using var file = new MemoryStream(Encoding.UTF8.GetBytes("PDF-CONTENT"));
+        using var body = new MultipartFormDataStream(Fields, "file[data]", "a-101.pdf", "application/pdf", file);
+
+        // Act
+        var text = await ReadAllAsync(body);
+
+        // Assert
+        body.ContentType.Should().Be("multipart/form-data; boundary=" + body.Boundary);
+        text.Should().Be(
+            $"--{body.Boundary}\r\nContent-Disposition: form-data; name=\"file[name]\"\r\n\r\nDrawing A-101\r\n" +
+            $"--{body.Boundary}\r\nContent-Disposition: form-data; name=\"file[parent_id]\"\r\n\r\n42\r\n" +
+            $"--{body.Boundary}\r\nContent-Disposition: form-data; name=\"file[data]\"; filename=\"a-101.pdf\"\r\n" +
+            "Content-Type: application/pdf\r\n\r\nPDF-CONTENT\r\n" +
+            $"--{body.Boundary}--\r\n");
+    }
+
+    [Fact]
+    public async Task Length_WithSeekableFile_ShouldMatchBytesRead()
+    {
+        // Arrange
+        using var file = new MemoryStream(new byte[100_000]);
+        using var body = new MultipartFormDataStream(Fields, "file[data]", "photo.jpg", "image/jpeg", file);
+
+        // Act
+        var bytes = await ReadAllBytesAsync(body);
+
+        // Assert
+        body.CanSeek.Should().BeTrue();
+        body.Length.Should().Be(bytes.Length);
+    }
+
+    [Fact]
+    public async Task Seek_ToStart_ShouldReplayTheSameBody()
+    {
+        // Arrange
+        using var file = new MemoryStream(Encoding.UTF8.GetBytes("retry me"));
+        using var body = new MultipartFormDataStream(Fields, "file[data]", "retry.txt", "text/plain", file);
+        var first = await ReadAllAsync(body);
+
+        // Act
+        body.Position = 0;
+        var second = await ReadAllAsync(body);
+
+        // Assert
+        second.Should().Be(first);
+    }
+
+    [Fact]
+    public async Task ReadAsync_ShouldReportFileProgressUpToTotal()
+    {
+        // Arrange
+        var reports = new List<TransferProgress>();
+        using var file = new MemoryStream(new byte[50_000]);
+        using var body = new MultipartFormDataStream(Fields, "file[data]", "photo.jpg", "image/jpeg", file, new SynchronousProgress(reports.Add));
+
+        // Act
+        await ReadAllBytesAsync(body);
+
+        // Assert
+        reports.Should().NotBeEmpty();
+        reports.Should().BeInAscendingOrder(report => report.BytesTransferred);
+        reports[^1].BytesTransferred.Should().Be(50_000);
+        reports[^1].TotalBytes.Should().Be(50_000);
+        reports[^1].PercentComplete.Should().Be(100);
+    }
+
+    [Fact]
+    public async Task Dispose_ShouldLeaveFileStreamOpen()
+    {
+        // Arrange
+        using var file = new MemoryStream(new byte[10]);
+        var body = new MultipartFormDataStream(Fields, "file[data]", "a.bin", "application/octet-stream", file);
+        await ReadAllBytesAsync(body);
+
+        // Act
+        await body.DisposeAsync();
+
+        // Assert
+        file.CanRead.Should().BeTrue();
+    }
+
+    [Fact]
+    public void Constructor_WithNonSeekableFile_ShouldHaveUnknownLength()
+    {
+        // Arrange
+        using var file = new NonSeekableStream(new byte[10]);
+
+        // Act
+        using var body = new MultipartFormDataStream(Fields, "file[data]", "a.bin", "application/octet-stream", file);
+
+        // Assert
+        body.CanSeek.Should().BeFalse();
+        var act = () => body.Length;
+        act.Should().Throw<NotSupportedException>();
+    }
+
+    private static async Task<string> ReadAllAsync(Stream stream) =>
+        Encoding.UTF8.GetString(await ReadAllBytesAsync(stream));
+
+    private static async Task<byte[]> ReadAllBytesAsync(Stream stream)
+    {
+        using var copy = new MemoryStream();
+        await stream.CopyToAsync(copy, bufferSize: 4096);
+        return copy.ToArray();
+    }
+
+    private sealed class SynchronousProgress : IProgress<TransferProgress>
+    {
+        private readonly Action<TransferProgress> _report;
+
+        public SynchronousProgress(Action<TransferProgress> report) => _report = report;
+
+        public void Report(TransferProgress value) => _report(value);
+    }
+
+    private sealed class NonSeekableStream : MemoryStream
+    {
+        public NonSeekableStream(byte[] buffer) : base(buffer)
+        {
+        }
+
+        public override bool CanSeek => false;
+    }
+}
@@ -0,0 +1,176 @@
+using System.Net.Http.Headers;
+using System.Text;
+using Procore.SDK.Shared.Http;
+using Procore.SDK.Shared.Tests.TestUtilities;
+
+namespace Procore.SDK.Shared.Tests.Http;
+
+/// <summary>
+/// Tests for single-flight coalescing of identical concurrent GET requests
+/// </summary>
+public class RequestCoalescingHandlerTests : IDisposable
+{
+    private readonly RequestCoalescingOptions _options;
+    private readonly RequestCoalescer _coalescer;
+    private readonly TestableHttpMessageHandler _innerHandler;
+    private readonly HttpClient _httpClient;
+    private int _sendCount;
+
+    public RequestCoalescingHandlerTests()
+    {
+        _options = new RequestCoalescingOptions { Enabled = true };
+        _coalescer = new RequestCoalescer();
+        _innerHandler = new TestableHttpMessageHandler();
+
+        var handler = new RequestCoalescingHandler(_coalescer, Options.Create(_options), Substitute.For<ILogger<RequestCoalescingHandler>>())
+        {
+            InnerHandler = _innerHandler
+        };
+
+        _httpClient = new HttpClient(handler) { BaseAddress = new Uri("https://api.procore.com") };
+    }
+
+    [Fact]
+    public async Task SendAsync_IdenticalConcurrentGets_ShouldShareOneUnderlyingRequest()
+    {
+        // Arrange
+        var release = new TaskCompletionSource();
+        SetupSlowResponse(release.Task, "[{\"id\":1}]");
+
+        // Act
+        var first = SendAsync("/rest/v1.0/companies", "token-a");
+        var second = SendAsync("/rest/v1.0/companies", "token-a");
+        release.SetResult();
+        var responses = await Task.WhenAll(first, second);
+
+        // Assert
+        _sendCount.Should().Be(1);
+        responses.Should().OnlyContain(r => r.StatusCode == HttpStatusCode.OK);
+        (await responses[0].Content.ReadAsStringAsync()).Should().Be("[{\"id\":1}]");
+        (await responses[1].Content.ReadAsStringAsync()).Should().Be("[{\"id\":1}]");
+        responses[0].Should().NotBeSameAs(responses[1]);
+    }
+
+    [Fact]
+    public async Task SendAsync_DifferentTokens_ShouldNotShareRequests()
+    {
+        // Arrange
+        var release = new TaskCompletionSource();
+        SetupSlowResponse(release.Task, "[]");
+
+        // Act
+        var first = SendAsync("/rest/v1.0/companies", "token-a");
+        var second = SendAsync("/rest/v1.0/companies", "token-b");
+        release.SetResult();
+        await Task.WhenAll(first, second);
+
+        // Assert
+        _sendCount.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task SendAsync_DifferentRanges_ShouldNotShareRequests()
+    {
+        // Arrange
+        var release = new TaskCompletionSource();
+        SetupSlowResponse(release.Task, "[]");
+
+        // Act
+        var first = SendAsync("/rest/v1.0/files/1", "token-a", range: new RangeHeaderValue(0, 99));
+        var second = SendAsync("/rest/v1.0/files/1", "token-a", range: new RangeHeaderValue(100, 199));
+        release.SetResult();
+        await Task.WhenAll(first, second);
+
+        // Assert
+        _sendCount.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task SendAsync_WhenOneWaiterCancels_ShouldCompleteForRemainingWaiters()
+    {
+        // Arrange
+        var release = new TaskCompletionSource();
+        SetupSlowResponse(release.Task, "[]");
+        using var cts = new CancellationTokenSource();
+
+        // Act
+        var cancelled = SendAsync("/rest/v1.0/companies", "token-a", cts.Token);
+        var remaining = SendAsync("/rest/v1.0/companies", "token-a");
+        cts.Cancel();
+        var cancelledAct = () => cancelled;
+        await cancelledAct.Should().ThrowAsync<OperationCanceledException>();
+        release.SetResult();
+        var response = await remaining;
+
+        // Assert
+        response.StatusCode.Should().Be(HttpStatusCode.OK);
+        _sendCount.Should().Be(1);
+    }
+
+    [Fact]
+    public async Task SendAsync_WhenAllWaitersCancel_ShouldCancelUnderlyingRequest()
+    {
+        // Arrange
+        CancellationToken underlyingToken = default;
+        _innerHandler.SendAsyncFunc = async (_, ct) =>
+        {
+            underlyingToken = ct;
+            await Task.Delay(Timeout.Infinite, ct);
+            return new HttpResponseMessage(HttpStatusCode.OK);
+        };
+        using var cts = new CancellationTokenSource();
+
+        // Act
+        var pending = SendAsync("/rest/v1.0/companies", "token-a", cts.Token);
+        cts.Cancel();
+        var act = () => pending;
+
+        // Assert
+        await act.Should().ThrowAsync<OperationCanceledException>();
+        underlyingToken.IsCancellationRequested.Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task SendAsync_WhenDisabled_ShouldSendEveryRequest()
+    {
+        // Arrange
+        _options.Enabled = false;
+        var release = new TaskCompletionSource();
+        SetupSlowResponse(release.Task, "[]");
+
+        // Act
+        var first = SendAsync("/rest/v1.0/companies", "token-a");
+        var second = SendAsync("/rest/v1.0/companies", "token-a");
+        release.SetResult();
+        await Task.WhenAll(first, second);
+
+        // Assert
+        _sendCount.Should().Be(2);
+    }
+
+    private void SetupSlowResponse(Task release, string body)
+    {
+        _innerHandler.SendAsyncFunc = async (_, ct) =>
+        {
+            Interlocked.Increment(ref _sendCount);
+            await release.WaitAsync(ct);
+            return new HttpResponseMessage(HttpStatusCode.OK)
+            {
+                Content = new StringContent(body, Encoding.UTF8, "application/json")
+            };
+        };
+    }
+
+    private Task<HttpResponseMessage> SendAsync(string path, string token, CancellationToken cancellationToken = default, RangeHeaderValue? range = null)
+    {
+        var request = new HttpRequestMessage(HttpMethod.Get, path);
+        request.Headers.Authorization = new AuthenticationHeaderValue("Bearer", token);
+        request.Headers.Range = range;
+        return _httpClient.SendAsync(request, cancellationToken);
+    }
+
+    public void Dispose()
+    {
+        _httpClient.Dispose();
+    }
+}
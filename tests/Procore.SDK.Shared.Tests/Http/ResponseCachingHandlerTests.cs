@@ -0,0 +1,305 @@
+using System.Net.Http.Headers;
+using System.Text;
+using Procore.SDK.Shared.Http;
+using Procore.SDK.Shared.Tests.TestUtilities;
+
+namespace Procore.SDK.Shared.Tests.Http;
+
+/// <summary>
+/// Tests for the response caching handler and its stores
+/// </summary>
+public class ResponseCachingHandlerTests : IDisposable
+{
+    private const string UsersPath = "/rest/v1.0/companies/1/users";
+
+    private readonly ResponseCacheOptions _options;
+    private readonly MemoryResponseCacheStore _store;
+    private readonly TestableHttpMessageHandler _innerHandler;
+    private readonly HttpClient _httpClient;
+    private int _sendCount;
+
+    public ResponseCachingHandlerTests()
+    {
+        _options = new ResponseCacheOptions
+        {
+            Enabled = true,
+            Policies =
+            {
+                new ResponseCachePolicy { RouteTemplate = "/rest/v1.0/companies/{company_id}/users", TimeToLive = TimeSpan.FromMinutes(5) }
+            }
+        };
+        _store = new MemoryResponseCacheStore(Options.Create(_options));
+        _innerHandler = new TestableHttpMessageHandler();
+
+        var handler = new ResponseCachingHandler(_store, Options.Create(_options), Substitute.For<ILogger<ResponseCachingHandler>>())
+        {
+            InnerHandler = _innerHandler
+        };
+
+        _httpClient = new HttpClient(handler) { BaseAddress = new Uri("https://api.procore.com") };
+    }
+
+    [Fact]
+    public async Task SendAsync_RepeatedGetWithinTimeToLive_ShouldBeServedFromCache()
+    {
+        // Arrange
+        SetupResponse("[{\"id\":5}]", etag: "\"v1\"");
+
+        // Act
+        using var first = await _httpClient.GetAsync(UsersPath);
+        using var second = await _httpClient.GetAsync(UsersPath);
+
+        // Assert
+        _sendCount.Should().Be(1);
+        (await second.Content.ReadAsStringAsync()).Should().Be("[{\"id\":5}]");
+    }
+
+    [Fact]
+    public async Task SendAsync_RouteWithoutPolicy_ShouldNotBeCached()
+    {
+        // Arrange
+        SetupResponse("[]");
+
+        // Act
+        await _httpClient.GetAsync("/rest/v1.0/companies/1/projects");
+        await _httpClient.GetAsync("/rest/v1.0/companies/1/projects");
+
+        // Assert
+        _sendCount.Should().Be(2);
+        _store.Count.Should().Be(0);
+    }
+
+    [Fact]
+    public async Task SendAsync_StaleEntry_ShouldRevalidateWithIfNoneMatch()
+    {
+        // Arrange
+        SetupResponse("[{\"id\":5}]", etag: "\"v1\"");
+        await _httpClient.GetAsync(UsersPath);
+        await ExpireAllAsync();
+
+        _innerHandler.SendAsyncFunc = (request, _) =>
+        {
+            Interlocked.Increment(ref _sendCount);
+            request.Headers.IfNoneMatch.Should().ContainSingle(tag => tag.Tag == "\"v1\"");
+            return Task.FromResult(new HttpResponseMessage(HttpStatusCode.NotModified));
+        };
+
+        // Act
+        using var response = await _httpClient.GetAsync(UsersPath);
+
+        // Assert
+        _sendCount.Should().Be(2);
+        response.StatusCode.Should().Be(HttpStatusCode.OK);
+        (await response.Content.ReadAsStringAsync()).Should().Be("[{\"id\":5}]");
+    }
+
+    [Fact]
+    public async Task SendAsync_NotModified_ShouldStoreCopyInsteadOfMutatingSharedEntry()
+    {
+        // Arrange
+        SetupResponse("[{\"id\":5}]", etag: "\"v1\"");
+        await _httpClient.GetAsync(UsersPath);
+        await ExpireAllAsync();
+        var stale = await _store.GetAsync(UsersPath + "||");
+        var staleExpiry = stale!.ExpiresAt;
+
+        _innerHandler.SendAsyncFunc = (_, _) => Task.FromResult(new HttpResponseMessage(HttpStatusCode.NotModified));
+
+        // Act
+        using var response = await _httpClient.GetAsync(UsersPath);
+
+        // Assert
+        stale.ExpiresAt.Should().Be(staleExpiry);
+        var revalidated = await _store.GetAsync(UsersPath + "||");
+        revalidated.Should().NotBeSameAs(stale);
+        revalidated!.IsFresh(DateTimeOffset.UtcNow).Should().BeTrue();
+    }
+
+    [Fact]
+    public async Task SendAsync_SuccessfulWrite_ShouldInvalidateCollection()
+    {
+        // Arrange
+        SetupResponse("[]");
+        await _httpClient.GetAsync(UsersPath);
+
+        // Act
+        await _httpClient.PatchAsync(UsersPath + "/5", new StringContent("{}"));
+        await _httpClient.GetAsync(UsersPath);
+
+        // Assert
+        _sendCount.Should().Be(3);
+    }
+
+    [Fact]
+    public async Task SendAsync_DifferentTokens_ShouldNotShareEntries()
+    {
+        // Arrange
+        SetupResponse("[]");
+
+        // Act
+        await SendWithTokenAsync("token-a");
+        await SendWithTokenAsync("token-b");
+
+        // Assert
+        _sendCount.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task MemoryStore_WhenOverCapacity_ShouldEvictLeastRecentlyUsed()
+    {
+        // Arrange
+        var store = new MemoryResponseCacheStore(maxBytes: 300);
+        var entry = () => new CachedResponse { StatusCode = 200, Content = new byte[100], ExpiresAt = DateTimeOffset.UtcNow.AddMinutes(1) };
+
+        // Act
+        await store.SetAsync("a", entry());
+        await store.SetAsync("b", entry());
+        await store.GetAsync("a");
+        await store.SetAsync("c", entry());
+
+        // Assert
+        (await store.GetAsync("a")).Should().NotBeNull();
+        (await store.GetAsync("b")).Should().BeNull();
+        (await store.GetAsync("c")).Should().NotBeNull();
+    }
+
+    [Fact]
+    public async Task FileStore_ShouldPersistEntriesAcrossInstances()
+    {
+        // Arrange
+        var directory = Path.Combine(Path.GetTempPath(), "procore-cache-" + Guid.NewGuid().ToString("N"));
+        try
+        {
+            using (var writer = new FileResponseCacheStore(directory))
+            {
+                await writer.SetAsync(UsersPath + "||", new CachedResponse
+                {
+                    StatusCode = 200,
+                    Content = Encoding.UTF8.GetBytes("[]"),
+                    ETag = "\"v1\"",
+                    ExpiresAt = DateTimeOffset.UtcNow.AddMinutes(1)
+                });
+            }
+
+            // Act
+            using var reader = new FileResponseCacheStore(directory);
+            var restored = await reader.GetAsync(UsersPath + "||");
+            await reader.RemoveByPrefixAsync(UsersPath + "|");
+
+            // Assert
+            restored.Should().NotBeNull();
+            restored!.ETag.Should().Be("\"v1\"");
+            Encoding.UTF8.GetString(restored.Content).Should().Be("[]");
+            (await reader.GetAsync(UsersPath + "||")).Should().BeNull();
+        }
+        finally
+        {
+            if (Directory.Exists(directory))
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+        }
+    }
+
+    [Fact]
+    public async Task FileStore_WhenOverCapacity_ShouldEvictLeastRecentlyUsed()
+    {
+        // Arrange
+        var directory = Path.Combine(Path.GetTempPath(), "procore-cache-" + Guid.NewGuid().ToString("N"));
+        try
+        {
+            var entry = () => new CachedResponse { StatusCode = 200, Content = new byte[1000], ExpiresAt = DateTimeOffset.UtcNow.AddMinutes(1) };
+            using var store = new FileResponseCacheStore(directory, maxBytes: 3500);
+
+            // Act
+            await store.SetAsync("a", entry());
+            await store.SetAsync("b", entry());
+            await Task.Delay(10);
+            await store.GetAsync("a");
+            await store.SetAsync("c", entry());
+
+            // Assert
+            (await store.GetAsync("a")).Should().NotBeNull();
+            (await store.GetAsync("b")).Should().BeNull();
+            (await store.GetAsync("c")).Should().NotBeNull();
+            store.CurrentBytes.Should().BeLessOrEqualTo(3500);
+            Directory.EnumerateFiles(directory, "*.json").Should().HaveCount(2);
+        }
+        finally
+        {
+            if (Directory.Exists(directory))
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+        }
+    }
+
+    [Fact]
+    public async Task FileStore_RemoveByPrefix_WithLockedEntry_ShouldRemoveTheRestAndStopServingIt()
+    {
+        // Arrange
+        var directory = Path.Combine(Path.GetTempPath(), "procore-cache-" + Guid.NewGuid().ToString("N"));
+        try
+        {
+            var entry = () => new CachedResponse { StatusCode = 200, Content = Encoding.UTF8.GetBytes("[]"), ExpiresAt = DateTimeOffset.UtcNow.AddMinutes(1) };
+            using var store = new FileResponseCacheStore(directory);
+            await store.SetAsync(UsersPath + "|a|", entry());
+            await store.SetAsync(UsersPath + "|b|", entry());
+
+            // Act
+            var lockedPath = Directory.EnumerateFiles(directory, "*.json").First();
+            using (new FileStream(lockedPath, FileMode.Open, FileAccess.Read, FileShare.None))
+            {
+                var remove = () => store.RemoveByPrefixAsync(UsersPath + "|");
+                await remove.Should().NotThrowAsync();
+            }
+
+            // Assert
+            (await store.GetAsync(UsersPath + "|a|")).Should().BeNull();
+            (await store.GetAsync(UsersPath + "|b|")).Should().BeNull();
+        }
+        finally
+        {
+            if (Directory.Exists(directory))
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+        }
+    }
+
+    private void SetupResponse(string body, string? etag = null)
+    {
+        _innerHandler.SendAsyncFunc = (_, _) =>
+        {
+            Interlocked.Increment(ref _sendCount);
+            var response = new HttpResponseMessage(HttpStatusCode.OK)
+            {
+                Content = new StringContent(body, Encoding.UTF8, "application/json")
+            };
+            if (etag != null)
+            {
+                response.Headers.ETag = new EntityTagHeaderValue(etag);
+            }
+            return Task.FromResult(response);
+        };
+    }
+
+    private Task<HttpResponseMessage> SendWithTokenAsync(string token)
+    {
+        var request = new HttpRequestMessage(HttpMethod.Get, UsersPath);
+        request.Headers.Authorization = new AuthenticationHeaderValue("Bearer", token);
+        return _httpClient.SendAsync(request);
+    }
+
+    private async Task ExpireAllAsync()
+    {
+        var key = UsersPath + "||";
+        var entry = await _store.GetAsync(key);
+        await _store.SetAsync(key, entry!.WithExpiresAt(DateTimeOffset.UtcNow.AddSeconds(-1)));
+    }
+
+    public void Dispose()
+    {
+        _httpClient.Dispose();
+    }
+}
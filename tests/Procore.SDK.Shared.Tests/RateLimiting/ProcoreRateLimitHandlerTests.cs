@@ -0,0 +1,171 @@
+using System.Diagnostics;
+using System.Net.Http.Headers;
+using Procore.SDK.Shared.RateLimiting;
+using Procore.SDK.Shared.Tests.TestUtilities;
+
+namespace Procore.SDK.Shared.Tests.RateLimiting;
+
+/// <summary>
+/// Tests for the adaptive, per-token client-side rate limiter
+/// </summary>
+public class ProcoreRateLimitHandlerTests : IDisposable
+{
+    private readonly RateLimitOptions _options;
+    private readonly RateLimiterRegistry _registry;
+    private readonly TestableHttpMessageHandler _innerHandler;
+    private readonly HttpClient _httpClient;
+
+    public ProcoreRateLimitHandlerTests()
+    {
+        _options = new RateLimitOptions
+        {
+            MaxRequestsPerSecond = 1000,
+            BurstSize = 5
+        };
+        _registry = new RateLimiterRegistry(Options.Create(_options));
+        _innerHandler = new TestableHttpMessageHandler();
+
+        var handler = new ProcoreRateLimitHandler(_registry, Options.Create(_options), Substitute.For<ILogger<ProcoreRateLimitHandler>>())
+        {
+            InnerHandler = _innerHandler
+        };
+
+        _httpClient = new HttpClient(handler) { BaseAddress = new Uri("https://api.procore.com") };
+    }
+
+    [Fact]
+    public async Task SendAsync_ShouldShareBucketPerAccessToken()
+    {
+        // Act
+        await SendWithTokenAsync("token-a");
+        await SendWithTokenAsync("token-a");
+        await SendWithTokenAsync("token-b");
+
+        // Assert
+        _registry.Count.Should().Be(2);
+    }
+
+    [Fact]
+    public async Task SendAsync_WhenRemainingBudgetIsLow_ShouldPaceRequests()
+    {
+        // Arrange
+        const int remaining = 10;
+        const double secondsUntilReset = 100;
+        _options.MinRequestsPerSecond = 0.01;
+        var resetAt = DateTimeOffset.UtcNow.AddSeconds(secondsUntilReset).ToUnixTimeSeconds();
+        _innerHandler.SendAsyncFunc = (_, _) => Task.FromResult(CreateResponse(HttpStatusCode.OK, limit: 3600, remaining: remaining, resetAt));
+
+        // Act
+        await SendWithTokenAsync("token-a");
+
+        // Assert
+        // The reset header has whole seconds, so up to one second (plus the request's own time) is lost to truncation
+        var bucket = _registry.GetBucket(HashOf("token-a"));
+        var expectedRate = remaining * _options.SafetyFactor / secondsUntilReset;
+        var truncationTolerance = remaining * _options.SafetyFactor / (secondsUntilReset - 2) - expectedRate;
+        bucket.CurrentRate.Should().BeApproximately(expectedRate, truncationTolerance);
+        bucket.AvailableTokens.Should().BeLessThanOrEqualTo(remaining);
+    }
+
+    [Fact]
+    public async Task SendAsync_WhenPacedRateIsBelowMinimum_ShouldClampToMinimumRate()
+    {
+        // Arrange
+        _options.MinRequestsPerSecond = 0.5;
+        var resetAt = DateTimeOffset.UtcNow.AddSeconds(100).ToUnixTimeSeconds();
+        _innerHandler.SendAsyncFunc = (_, _) => Task.FromResult(CreateResponse(HttpStatusCode.OK, limit: 3600, remaining: 10, resetAt));
+
+        // Act
+        await SendWithTokenAsync("token-a");
+
+        // Assert
+        _registry.GetBucket(HashOf("token-a")).CurrentRate.Should().Be(_options.MinRequestsPerSecond);
+    }
+
+    [Fact]
+    public async Task SendAsync_WhenBudgetIsPlentiful_ShouldUseMaximumRate()
+    {
+        // Arrange
+        var resetAt = DateTimeOffset.UtcNow.AddSeconds(100).ToUnixTimeSeconds();
+        _innerHandler.SendAsyncFunc = (_, _) => Task.FromResult(CreateResponse(HttpStatusCode.OK, limit: 3600, remaining: 3500, resetAt));
+
+        // Act
+        await SendWithTokenAsync("token-a");
+
+        // Assert
+        _registry.GetBucket(HashOf("token-a")).CurrentRate.Should().Be(_options.MaxRequestsPerSecond);
+    }
+
+    [Fact]
+    public async Task SendAsync_AfterTooManyRequests_ShouldQueueUntilRetryAfterElapses()
+    {
+        // Arrange
+        var response = new HttpResponseMessage(HttpStatusCode.TooManyRequests);
+        response.Headers.RetryAfter = new RetryConditionHeaderValue(TimeSpan.FromMilliseconds(500));
+        _innerHandler.SetupSequence((_, _) => Task.FromResult(response));
+
+        // Act
+        using var throttled = await SendWithTokenAsync("token-a");
+        var stopwatch = Stopwatch.StartNew();
+        using var next = await SendWithTokenAsync("token-a");
+        stopwatch.Stop();
+
+        // Assert
+        throttled.StatusCode.Should().Be(HttpStatusCode.TooManyRequests);
+        next.StatusCode.Should().Be(HttpStatusCode.OK);
+        stopwatch.ElapsedMilliseconds.Should().BeGreaterThanOrEqualTo(400);
+    }
+
+    [Fact]
+    public async Task SendAsync_WhenCancelledWhileQueued_ShouldThrowOperationCanceledException()
+    {
+        // Arrange
+        _registry.GetBucket(HashOf("token-a")).PauseUntil(DateTimeOffset.UtcNow.AddMinutes(1));
+        using var cts = new CancellationTokenSource(TimeSpan.FromMilliseconds(100));
+
+        // Act
+        var act = () => SendWithTokenAsync("token-a", cts.Token);
+
+        // Assert
+        await act.Should().ThrowAsync<OperationCanceledException>();
+        _innerHandler.Requests.Should().BeEmpty();
+    }
+
+    [Fact]
+    public async Task SendAsync_WhenDisabled_ShouldNotTrackPartitions()
+    {
+        // Arrange
+        _options.Enabled = false;
+
+        // Act
+        await SendWithTokenAsync("token-a");
+
+        // Assert
+        _registry.Count.Should().Be(0);
+    }
+
+    private Task<HttpResponseMessage> SendWithTokenAsync(string token, CancellationToken cancellationToken = default)
+    {
+        var request = new HttpRequestMessage(HttpMethod.Get, "/rest/v1.0/companies");
+        request.Headers.Authorization = new AuthenticationHeaderValue("Bearer", token);
+        return _httpClient.SendAsync(request, cancellationToken);
+    }
+
+    private static HttpResponseMessage CreateResponse(HttpStatusCode statusCode, long limit, long remaining, long resetAt)
+    {
+        var response = new HttpResponseMessage(statusCode);
+        response.Headers.Add("X-Rate-Limit-Limit", limit.ToString());
+        response.Headers.Add("X-Rate-Limit-Remaining", remaining.ToString());
+        response.Headers.Add("X-Rate-Limit-Reset", resetAt.ToString());
+        return response;
+    }
+
+    private static string HashOf(string token) =>
+        Convert.ToHexString(System.Security.Cryptography.SHA256.HashData(System.Text.Encoding.UTF8.GetBytes(token)));
+
+    public void Dispose()
+    {
+        _httpClient.Dispose();
+        _registry.Dispose();
+    }
+}
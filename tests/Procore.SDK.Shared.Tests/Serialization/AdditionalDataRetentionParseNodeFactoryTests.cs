@@ -0,0 +1,112 @@
+using System.Text;
+using Microsoft.Kiota.Abstractions.Serialization;
+using Microsoft.Kiota.Serialization.Json;
+using Procore.SDK.Shared.Serialization;
+
+namespace Procore.SDK.Shared.Tests.Serialization;
+
+/// <summary>
+/// Tests for retaining or discarding unknown JSON properties during deserialization
+/// </summary>
+public class AdditionalDataRetentionParseNodeFactoryTests
+{
+    private const string Json = "[{\"id\":1,\"custom_field_1\":\"a\",\"child\":{\"id\":2,\"custom_field_2\":\"b\"}}]";
+
+    [Fact]
+    public async Task Deserialize_WhenRetained_ShouldKeepUnknownProperties()
+    {
+        // Arrange
+        var options = new DeserializationOptions();
+
+        // Act
+        var items = await DeserializeAsync(options);
+
+        // Assert
+        items.Should().ContainSingle();
+        items[0].AdditionalData.Should().ContainKey("custom_field_1");
+        items[0].Child!.AdditionalData.Should().ContainKey("custom_field_2");
+    }
+
+    [Fact]
+    public async Task Deserialize_WhenDiscarded_ShouldDropUnknownPropertiesAndKeepDeclaredOnes()
+    {
+        // Arrange
+        var options = new DeserializationOptions { AdditionalData = AdditionalDataRetention.Discard };
+
+        // Act
+        var items = await DeserializeAsync(options);
+
+        // Assert
+        items[0].Id.Should().Be(1);
+        items[0].AdditionalData.Should().BeEmpty();
+        items[0].Child!.Id.Should().Be(2);
+        items[0].Child!.AdditionalData.Should().BeEmpty();
+
+        // The restored dictionary must accept writes again
+        items[0].AdditionalData["note"] = "kept";
+        items[0].AdditionalData.Should().ContainKey("note");
+    }
+
+    [Fact]
+    public async Task Deserialize_WithNamespaceOverride_ShouldApplyLongestMatchingPrefix()
+    {
+        // Arrange
+        var options = new DeserializationOptions
+        {
+            AdditionalData = AdditionalDataRetention.Discard,
+            AdditionalDataOverrides =
+            {
+                ["Procore.SDK.Shared"] = AdditionalDataRetention.Discard,
+                ["Procore.SDK.Shared.Tests"] = AdditionalDataRetention.Retain
+            }
+        };
+
+        // Act
+        var items = await DeserializeAsync(options);
+
+        // Assert
+        items[0].AdditionalData.Should().ContainKey("custom_field_1");
+    }
+
+    [Fact]
+    public void DiscardsAdditionalData_ShouldReflectDefaultAndOverrides()
+    {
+        // Arrange
+        var retained = new DeserializationOptions();
+        var overridden = new DeserializationOptions
+        {
+            AdditionalDataOverrides = { ["Procore.SDK.FieldProductivity"] = AdditionalDataRetention.Discard }
+        };
+
+        // Act & Assert
+        retained.DiscardsAdditionalData.Should().BeFalse();
+        overridden.DiscardsAdditionalData.Should().BeTrue();
+    }
+
+    private static async Task<List<TestItem>> DeserializeAsync(DeserializationOptions options)
+    {
+        var factory = new AdditionalDataRetentionParseNodeFactory(new JsonParseNodeFactory(), options);
+        using var stream = new MemoryStream(Encoding.UTF8.GetBytes(Json));
+        var node = await factory.GetRootParseNodeAsync("application/json", stream);
+        return node.GetCollectionOfObjectValues(TestItem.Create).ToList();
+    }
+
+    private sealed class TestItem : IParsable, IAdditionalDataHolder
+    {
+        public IDictionary<string, object> AdditionalData { get; set; } = new Dictionary<string, object>();
+
+        public int? Id { get; set; }
+
+        public TestItem? Child { get; set; }
+
+        public static TestItem Create(IParseNode parseNode) => new();
+
+        public IDictionary<string, Action<IParseNode>> GetFieldDeserializers() => new Dictionary<string, Action<IParseNode>>
+        {
+            { "id", n => Id = n.GetIntValue() },
+            { "child", n => Child = n.GetObjectValue(Create) }
+        };
+
+        public void Serialize(ISerializationWriter writer) => throw new NotSupportedException();
+    }
+}
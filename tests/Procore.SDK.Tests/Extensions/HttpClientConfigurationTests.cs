@@ -306,6 +306,106 @@ public class HttpClientConfigurationTests : IDisposable
         options.PooledConnectionIdleTimeout.Should().BePositive();
     }
 
+    [Fact]
+    public void HttpClientOptions_TransportSettings_ShouldDefaultToHttp11WithCompression()
+    {
+        // Arrange
+        _services.AddProcoreSDK(CreateTestConfiguration());
+        _serviceProvider = _services.BuildServiceProvider();
+
+        // Act
+        var options = _serviceProvider.GetRequiredService<IOptions<HttpClientOptions>>().Value;
+
+        // Assert
+        options.TransportProfile.Should().Be(ProcoreTransportProfile.Default);
+        options.AutomaticDecompression.Should().Be(DecompressionMethods.GZip | DecompressionMethods.Brotli);
+    }
+
+    [Fact]
+    public void HttpClientOptions_ShouldBindTransportSettingsFromConfiguration()
+    {
+        // Arrange
+        var configuration = _configBuilder
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"ProcoreAuth:ClientId", "test-client-id"},
+                {"ProcoreAuth:ClientSecret", "test-client-secret"},
+                {"ProcoreApi:TransportProfile", "HighThroughput"},
+                {"ProcoreApi:AutomaticDecompression", "GZip"}
+            })
+            .Build();
+        _services.AddProcoreSDK(configuration);
+        _serviceProvider = _services.BuildServiceProvider();
+
+        // Act
+        var options = _serviceProvider.GetRequiredService<IOptions<HttpClientOptions>>().Value;
+
+        // Assert
+        options.TransportProfile.Should().Be(ProcoreTransportProfile.HighThroughput);
+        options.AutomaticDecompression.Should().Be(DecompressionMethods.GZip);
+    }
+
+    [Theory]
+    [InlineData(ProcoreTransportProfile.Default, false)]
+    [InlineData(ProcoreTransportProfile.HighThroughput, true)]
+    [InlineData(ProcoreTransportProfile.LowLatency, false)]
+    public void CreatePrimaryHandler_ShouldApplyTransportProfile(ProcoreTransportProfile profile, bool multipleHttp2Connections)
+    {
+        // Arrange
+        var options = new HttpClientOptions { TransportProfile = profile, MaxConnectionsPerServer = 16 };
+
+        // Act
+        using var handler = ProcoreTransport.CreatePrimaryHandler(options);
+
+        // Assert
+        handler.EnableMultipleHttp2Connections.Should().Be(multipleHttp2Connections);
+        handler.MaxConnectionsPerServer.Should().Be(16);
+        handler.AutomaticDecompression.Should().Be(options.AutomaticDecompression);
+        handler.UseCookies.Should().BeFalse();
+        handler.KeepAlivePingPolicy.Should().Be(profile == ProcoreTransportProfile.LowLatency
+            ? HttpKeepAlivePingPolicy.Always
+            : HttpKeepAlivePingPolicy.WithActiveRequests);
+    }
+
+    [Theory]
+    [InlineData(ProcoreTransportProfile.Default, "1.1")]
+    [InlineData(ProcoreTransportProfile.HighThroughput, "2.0")]
+    [InlineData(ProcoreTransportProfile.LowLatency, "2.0")]
+    public async Task ProcoreHttpVersionHandler_ShouldRequestProfileVersion(ProcoreTransportProfile profile, string expectedVersion)
+    {
+        // Arrange
+        var inner = new CapturingHandler();
+        using var invoker = new HttpMessageInvoker(new ProcoreHttpVersionHandler(
+            Options.Create(new HttpClientOptions { TransportProfile = profile })) { InnerHandler = inner });
+
+        // Act
+        using var response = await invoker.SendAsync(
+            new HttpRequestMessage(HttpMethod.Get, "https://api.procore.com/rest/v1.0/me"), CancellationToken.None);
+
+        // Assert
+        inner.Request!.Version.Should().Be(Version.Parse(expectedVersion));
+        inner.Request.VersionPolicy.Should().Be(HttpVersionPolicy.RequestVersionOrLower);
+    }
+
+    [Fact]
+    public async Task ProcoreHttpVersionHandler_ShouldKeepExplicitVersion()
+    {
+        // Arrange
+        var inner = new CapturingHandler();
+        using var invoker = new HttpMessageInvoker(new ProcoreHttpVersionHandler(
+            Options.Create(new HttpClientOptions { TransportProfile = ProcoreTransportProfile.HighThroughput })) { InnerHandler = inner });
+        var request = new HttpRequestMessage(HttpMethod.Get, "https://api.procore.com/rest/v1.0/me")
+        {
+            VersionPolicy = HttpVersionPolicy.RequestVersionExact
+        };
+
+        // Act
+        using var response = await invoker.SendAsync(request, CancellationToken.None);
+
+        // Assert
+        inner.Request!.Version.Should().Be(HttpVersion.Version11);
+    }
+
     private IConfiguration CreateTestConfiguration()
     {
         var configData = new Dictionary<string, string?>
@@ -324,4 +424,15 @@ public class HttpClientConfigurationTests : IDisposable
             .AddInMemoryCollection(configData)
             .Build();
     }
+
+    private sealed class CapturingHandler : HttpMessageHandler
+    {
+        public HttpRequestMessage? Request { get; private set; }
+
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            Request = request;
+            return Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK));
+        }
+    }
 }
\ No newline at end of file
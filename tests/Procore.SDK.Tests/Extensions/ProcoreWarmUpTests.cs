@@ -0,0 +1,191 @@
+using Microsoft.Kiota.Abstractions;
+using Procore.SDK.Extensions;
+using System.Net;
+using System.Net.Http;
+
+namespace Procore.SDK.Tests.Extensions;
+
+/// <summary>
+/// Tests for the Procore warm-up, its hosted service registration and readiness check
+/// </summary>
+public class ProcoreWarmUpTests
+{
+    private readonly ITokenManager _tokenManager = Substitute.For<ITokenManager>();
+    private readonly IHttpClientFactory _httpClientFactory = Substitute.For<IHttpClientFactory>();
+    private readonly ProcoreWarmUpOptions _options = new();
+    private readonly List<HttpRequestMessage> _requests = new();
+    private HttpStatusCode _statusCode = HttpStatusCode.OK;
+
+    public ProcoreWarmUpTests()
+    {
+        _tokenManager.GetAccessTokenAsync(Arg.Any<CancellationToken>())
+            .Returns(new AccessToken("token", "Bearer", DateTimeOffset.UtcNow.AddHours(1)));
+        _httpClientFactory.CreateClient("Procore").Returns(_ => new HttpClient(new StubHandler(this))
+        {
+            BaseAddress = new Uri("https://api.procore.com")
+        });
+    }
+
+    [Fact]
+    public async Task WarmUpAsync_ShouldOpenConfiguredConnectionsAndSucceed()
+    {
+        // Arrange
+        _options.Connections = 3;
+        var warmUp = CreateWarmUp();
+
+        // Act
+        var result = await warmUp.WarmUpAsync();
+
+        // Assert
+        result.Succeeded.Should().BeTrue();
+        _requests.Should().HaveCount(3).And.OnlyContain(r => r.Method == HttpMethod.Head);
+        warmUp.Result.Should().BeSameAs(result);
+    }
+
+    [Fact]
+    public async Task WarmUpAsync_WithoutStoredToken_ShouldReportFailureWithoutThrowing()
+    {
+        // Arrange
+        _tokenManager.GetAccessTokenAsync(Arg.Any<CancellationToken>()).Returns((AccessToken?)null);
+        var warmUp = CreateWarmUp();
+
+        // Act
+        var result = await warmUp.WarmUpAsync();
+
+        // Assert
+        result.Succeeded.Should().BeFalse();
+        result.Failures.Should().ContainSingle(f => f.StartsWith("access token"));
+    }
+
+    [Fact]
+    public async Task WarmUpAsync_WhenTokenRejected_ShouldReportConnectionFailure()
+    {
+        // Arrange
+        _statusCode = HttpStatusCode.Unauthorized;
+        var warmUp = CreateWarmUp();
+
+        // Act
+        var result = await warmUp.WarmUpAsync();
+
+        // Assert
+        result.Failures.Should().ContainSingle(f => f.StartsWith("connections"));
+    }
+
+    [Fact]
+    public async Task WarmUpAsync_WithUnknownResourceGroup_ShouldReportIt()
+    {
+        // Arrange
+        _options.ResourceGroups = new[] { "Procore.SDK.Unknown" };
+        var warmUp = CreateWarmUp();
+
+        // Act
+        var result = await warmUp.WarmUpAsync();
+
+        // Assert
+        result.Failures.Should().ContainSingle().Which.Should().Contain("unknown resource group");
+    }
+
+    [Fact]
+    public async Task WarmUpAsync_CalledRepeatedly_ShouldRunOnce()
+    {
+        // Arrange
+        var warmUp = CreateWarmUp();
+
+        // Act
+        var results = await Task.WhenAll(warmUp.WarmUpAsync(), warmUp.WarmUpAsync());
+        var later = await warmUp.WarmUpAsync();
+
+        // Assert
+        results[0].Should().BeSameAs(results[1]).And.BeSameAs(later);
+        await _tokenManager.Received(1).GetAccessTokenAsync(Arg.Any<CancellationToken>());
+    }
+
+    [Fact]
+    public async Task HealthCheck_ShouldBeUnhealthyUntilWarmUpCompletes()
+    {
+        // Arrange
+        var warmUp = CreateWarmUp();
+        var healthCheck = new ProcoreWarmUpHealthCheck(warmUp);
+
+        // Act
+        var before = await healthCheck.CheckHealthAsync(new HealthCheckContext());
+        await warmUp.WarmUpAsync();
+        var after = await healthCheck.CheckHealthAsync(new HealthCheckContext());
+
+        // Assert
+        before.Status.Should().Be(HealthStatus.Unhealthy);
+        after.Status.Should().Be(HealthStatus.Healthy);
+    }
+
+    [Fact]
+    public async Task HealthCheck_WhenStepsFailed_ShouldBeDegraded()
+    {
+        // Arrange
+        _tokenManager.GetAccessTokenAsync(Arg.Any<CancellationToken>()).Returns((AccessToken?)null);
+        var warmUp = CreateWarmUp();
+        await warmUp.WarmUpAsync();
+
+        // Act
+        var result = await new ProcoreWarmUpHealthCheck(warmUp).CheckHealthAsync(new HealthCheckContext());
+
+        // Assert
+        result.Status.Should().Be(HealthStatus.Degraded);
+    }
+
+    [Fact]
+    public void AddProcoreWarmUp_CalledTwice_ShouldRegisterHostedServiceAndReadinessCheckOnce()
+    {
+        // Arrange
+        var services = new ServiceCollection();
+        services.AddLogging();
+        services.AddProcoreSDK(new ConfigurationBuilder()
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"ProcoreAuth:ClientId", "test-client-id"},
+                {"ProcoreAuth:ClientSecret", "test-client-secret"}
+            })
+            .Build());
+
+        // Act
+        services.AddProcoreWarmUp();
+        services.AddProcoreWarmUp(options => options.Connections = 4);
+
+        // Assert
+        services.Count(d => d.ImplementationType == typeof(ProcoreWarmUpHostedService)).Should().Be(1);
+        services.Count(d => d.ServiceType == typeof(IProcoreWarmUp)).Should().Be(1);
+        using var provider = services.BuildServiceProvider();
+        provider.GetRequiredService<IOptions<ProcoreWarmUpOptions>>().Value.Connections.Should().Be(4);
+        provider.GetRequiredService<IOptions<HealthCheckServiceOptions>>().Value.Registrations
+            .Should().ContainSingle(r => r.Name == "procore-warmup" && r.Tags.Contains("ready"));
+    }
+
+    private ProcoreWarmUp CreateWarmUp()
+    {
+        return new ProcoreWarmUp(
+            _tokenManager,
+            _httpClientFactory,
+            Substitute.For<IRequestAdapter>(),
+            Options.Create(_options),
+            Substitute.For<ILogger<ProcoreWarmUp>>());
+    }
+
+    private sealed class StubHandler : HttpMessageHandler
+    {
+        private readonly ProcoreWarmUpTests _owner;
+
+        public StubHandler(ProcoreWarmUpTests owner)
+        {
+            _owner = owner;
+        }
+
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            lock (_owner._requests)
+            {
+                _owner._requests.Add(request);
+            }
+
+            return Task.FromResult(new HttpResponseMessage(_owner._statusCode));
+        }
+    }
+}
@@ -3,7 +3,9 @@ using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Options;
 using Microsoft.Kiota.Abstractions;
 using Microsoft.Kiota.Http.HttpClientLibrary;
+using Procore.SDK.Core;
 using Procore.SDK.Core.Models;
+using Procore.SDK.Core.Resilience;
 using Procore.SDK.Extensions;
 using System.Net.Http;
 
@@ -228,7 +230,7 @@ public class ServiceCollectionExtensionsTests : IDisposable
     }
 
     [Fact]
-    public void AddProcoreSDK_ShouldRegisterServicesAsScoped_WhereAppropriate()
+    public void AddProcoreSDK_ShouldRegisterCoreClientAsSingleton()
     {
         // Arrange
         var configuration = CreateTestConfiguration();
@@ -238,7 +240,22 @@ public class ServiceCollectionExtensionsTests : IDisposable
 
         // Assert - Check service lifetimes
         var coreClientDescriptor = _services.FirstOrDefault(s => s.ServiceType == typeof(ICoreClient));
-        coreClientDescriptor?.Lifetime.Should().Be(ServiceLifetime.Scoped);
+        coreClientDescriptor?.Lifetime.Should().Be(ServiceLifetime.Singleton);
+    }
+
+    [Fact]
+    public void AddProcoreSDK_WithCoreClientRegisteredAsScoped_ShouldKeepScopedRegistration()
+    {
+        // Arrange
+        var configuration = CreateTestConfiguration();
+        _services.AddScoped<ICoreClient, ProcoreCoreClient>();
+
+        // Act
+        _services.AddProcoreSDK(configuration);
+
+        // Assert
+        _services.Where(s => s.ServiceType == typeof(ICoreClient))
+            .Should().ContainSingle().Which.Lifetime.Should().Be(ServiceLifetime.Scoped);
     }
 
     [Fact]
@@ -329,6 +346,31 @@ public class ServiceCollectionExtensionsTests : IDisposable
         result.Should().BeSameAs(_services);
     }
 
+    [Fact]
+    public void AddProcoreSDK_ShouldRegisterHedgingBoundToResilienceSection()
+    {
+        // Arrange
+        var configuration = _configBuilder
+            .AddInMemoryCollection(new Dictionary<string, string?>
+            {
+                {"ProcoreAuth:ClientId", "test-client-id"},
+                {"ProcoreAuth:ClientSecret", "test-client-secret"},
+                {"Procore:Resilience:Hedging:Enabled", "true"},
+                {"Procore:Resilience:Hedging:DelayMs", "250"}
+            })
+            .Build();
+
+        // Act
+        _services.AddProcoreSDK(configuration);
+        _serviceProvider = _services.BuildServiceProvider();
+
+        // Assert
+        AssertServiceIsRegistered<ProcoreHedgingHandler>();
+        var hedging = _serviceProvider.GetRequiredService<IOptions<ResilienceOptions>>().Value.Hedging;
+        hedging.Enabled.Should().BeTrue();
+        hedging.DelayMs.Should().Be(250);
+    }
+
     private IConfiguration CreateTestConfiguration()
     {
         var configData = new Dictionary<string, string?>
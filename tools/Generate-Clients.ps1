@@ -49,6 +49,9 @@ function Write-Error { param($Message) Write-Host "❌ $Message" -ForegroundColo
 function Write-Info { param($Message) Write-Host "ℹ️  $Message" -ForegroundColor Cyan }
 
 # Configuration for each resource group
+# AdditionalData controls whether generated models keep unknown JSON properties in AdditionalData.
+# Core (custom fields) and resource-management (schedule attributes) read it, so keep those $true;
+# groups that do not can be set to $false, or can discard at runtime via DeserializationOptions.
 $ResourceConfigs = @{
     "core" = @{
         Paths = @(
@@ -61,6 +64,7 @@ $ResourceConfigs = @{
         )
         Namespace = "Procore.SDK.Core"
         ClassName = "CoreClient"
+        AdditionalData = $true
         Description = "Core functionality: companies, users, documents, custom fields"
     }
     "project-management" = @{
@@ -73,6 +77,7 @@ $ResourceConfigs = @{
         )
         Namespace = "Procore.SDK.ProjectManagement"
         ClassName = "ProjectManagementClient"
+        AdditionalData = $true
         Description = "Project management: projects, workflows, tasks, assignments"
     }
     "quality-safety" = @{
@@ -86,6 +91,7 @@ $ResourceConfigs = @{
         )
         Namespace = "Procore.SDK.QualitySafety"
         ClassName = "QualitySafetyClient"
+        AdditionalData = $true
         Description = "Quality & safety: inspections, observations, incidents, punch lists"
     }
     "construction-financials" = @{
@@ -100,6 +106,7 @@ $ResourceConfigs = @{
         )
         Namespace = "Procore.SDK.ConstructionFinancials"
         ClassName = "ConstructionFinancialsClient"
+        AdditionalData = $true
         Description = "Financial management: contracts, POs, budgets, change orders, invoices"
     }
     "field-productivity" = @{
@@ -112,6 +119,7 @@ $ResourceConfigs = @{
         )
         Namespace = "Procore.SDK.FieldProductivity"
         ClassName = "FieldProductivityClient"
+        AdditionalData = $true
         Description = "Field operations: daily logs, timecards, equipment, manpower tracking"
     }
     "resource-management" = @{
@@ -122,6 +130,7 @@ $ResourceConfigs = @{
         )
         Namespace = "Procore.SDK.ResourceManagement"
         ClassName = "ResourceManagementClient"
+        AdditionalData = $true
         Description = "Resource management: workforce, resources, assignments"
     }
 }
@@ -192,6 +201,7 @@ function Invoke-KiotaGeneration {
         "--namespace-name", $Config.Namespace
         "--output", "`"$outputPath`""
         "--exclude-backward-compatible"
+        "--additional-data", $Config.AdditionalData.ToString().ToLowerInvariant()
         "--clean-output"
     ) + $includeArgs
     
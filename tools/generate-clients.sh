@@ -77,6 +77,9 @@ parse_arguments() {
 }
 
 # Resource configurations using functions for compatibility
+# additionaldata controls whether generated models keep unknown JSON properties in AdditionalData.
+# Core (custom fields) and resource-management (schedule attributes) read it, so keep those true;
+# groups that do not can be set to false, or can discard at runtime via DeserializationOptions.
 get_resource_config() {
     local resource="$1"
     local key="$2"
@@ -85,31 +88,37 @@ get_resource_config() {
         "core.paths") echo "**/companies,**/companies/**,**/company_users/**,**/users/**,**/folders-and-files/**,**/custom-fields/**,**/configurable-field-sets/**" ;;
         "core.namespace") echo "Procore.SDK.Core" ;;
         "core.classname") echo "CoreClient" ;;
+        "core.additionaldata") echo "true" ;;
         "core.description") echo "Core functionality: companies, users, documents, custom fields" ;;
         
         "project-management.paths") echo "**/projects/**,**/workflows/**,**/task-items/**,**/project-assignments/**,**/project-users/**" ;;
         "project-management.namespace") echo "Procore.SDK.ProjectManagement" ;;
         "project-management.classname") echo "ProjectManagementClient" ;;
+        "project-management.additionaldata") echo "true" ;;
         "project-management.description") echo "Project management: projects, workflows, tasks, assignments" ;;
         
         "quality-safety.paths") echo "**/inspections/**,**/observations/**,**/incidents/**,**/safety/**,**/quality/**,**/punch/**" ;;
         "quality-safety.namespace") echo "Procore.SDK.QualitySafety" ;;
         "quality-safety.classname") echo "QualitySafetyClient" ;;
+        "quality-safety.additionaldata") echo "true" ;;
         "quality-safety.description") echo "Quality & safety: inspections, observations, incidents, punch lists" ;;
         
         "construction-financials.paths") echo "**/contracts/**,**/purchase-orders/**,**/budgets/**,**/cost-codes/**,**/change-orders/**,**/invoices/**,**/payments/**" ;;
         "construction-financials.namespace") echo "Procore.SDK.ConstructionFinancials" ;;
         "construction-financials.classname") echo "ConstructionFinancialsClient" ;;
+        "construction-financials.additionaldata") echo "true" ;;
         "construction-financials.description") echo "Financial management: contracts, POs, budgets, change orders, invoices" ;;
         
         "field-productivity.paths") echo "**/project_timecard_entries/**,**/timecard_entries/**,**/timecard_time_types/**,**/timesheets/**,**/project_timesheet_timecard_entries/**" ;;
         "field-productivity.namespace") echo "Procore.SDK.FieldProductivity" ;;
         "field-productivity.classname") echo "FieldProductivityClient" ;;
+        "field-productivity.additionaldata") echo "true" ;;
         "field-productivity.description") echo "Field operations: daily logs, timecards, equipment, manpower tracking" ;;
         
         "resource-management.paths") echo "**/workforce/**,**/resources/**,**/assignments/**" ;;
         "resource-management.namespace") echo "Procore.SDK.ResourceManagement" ;;
         "resource-management.classname") echo "ResourceManagementClient" ;;
+        "resource-management.additionaldata") echo "true" ;;
         "resource-management.description") echo "Resource management: workforce, resources, assignments" ;;
         
         *) echo "" ;;
@@ -218,6 +227,7 @@ generate_client() {
     local namespace=$(get_resource_config "$name" "namespace")
     local classname=$(get_resource_config "$name" "classname")
     local description=$(get_resource_config "$name" "description")
+    local additional_data=$(get_resource_config "$name" "additionaldata")
     
     print_info "Generating $name client: $description"
     
@@ -240,6 +250,7 @@ generate_client() {
         "--namespace-name" "$namespace"
         "--output" "$output_path"
         "--exclude-backward-compatible"
+        "--additional-data" "${additional_data:-true}"
         "--clean-output"
         "${include_args[@]}"
     )